@@ -0,0 +1,124 @@
+// 行情字典转换的微基准测试：对比逐笔创建键字符串与预先驻留键、预分配字典的单笔耗时
+//
+// 编译运行（Linux，在项目根目录下）：
+//   g++ -O2 -std=c++17 benchmark/bench_dict_keys.cpp -o bench_dict_keys \
+//       -Ipyctp_api/api/include -Ipyctp_api/api/vnctp $(python3 -m pybind11 --includes) \
+//       $(python3-config --ldflags --embed)
+//   ./bench_dict_keys [次数]
+//
+// 原始转换方式需要调用toUtf，运行环境需安装zh_CN.GB18030 locale（与扩展模块相同）
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+
+#include "pybind11/embed.h"
+#include "vnctp.h"
+#include "ctp/ThostFtdcUserApiStruct.h"
+
+
+//深度行情结构体中的字段
+#define STRING_FIELDS(X) \
+    X(TradingDay) X(reserve1) X(ExchangeID) X(reserve2) X(UpdateTime) \
+    X(ActionDay) X(InstrumentID) X(ExchangeInstID)
+
+#define NUMBER_FIELDS(X) \
+    X(LastPrice) X(PreSettlementPrice) X(PreClosePrice) X(PreOpenInterest) X(OpenPrice) \
+    X(HighestPrice) X(LowestPrice) X(Volume) X(Turnover) X(OpenInterest) X(ClosePrice) \
+    X(SettlementPrice) X(UpperLimitPrice) X(LowerLimitPrice) X(PreDelta) X(CurrDelta) \
+    X(UpdateMillisec) \
+    X(BidPrice1) X(BidVolume1) X(AskPrice1) X(AskVolume1) \
+    X(BidPrice2) X(BidVolume2) X(AskPrice2) X(AskVolume2) \
+    X(BidPrice3) X(BidVolume3) X(AskPrice3) X(AskVolume3) \
+    X(BidPrice4) X(BidVolume4) X(AskPrice4) X(AskVolume4) \
+    X(BidPrice5) X(BidVolume5) X(AskPrice5) X(AskVolume5) \
+    X(AveragePrice) X(BandingUpperPrice) X(BandingLowerPrice)
+
+#define COUNT_FIELD(name) + 1
+#define DECLARE_KEY(name) static PyObject *KEY_##name;
+#define INIT_KEY(name) KEY_##name = PyUnicode_InternFromString(#name);
+
+STRING_FIELDS(DECLARE_KEY)
+NUMBER_FIELDS(DECLARE_KEY)
+
+
+//原始方式：逐笔创建键字符串，字符串字段全部经过GBK转码
+static dict convertLegacy(const CThostFtdcDepthMarketDataField *tick)
+{
+    dict data;
+#define LEGACY_STRING(name) data[#name] = toUtf(tick->name);
+#define LEGACY_NUMBER(name) data[#name] = tick->name;
+    STRING_FIELDS(LEGACY_STRING)
+    NUMBER_FIELDS(LEGACY_NUMBER)
+    return data;
+}
+
+
+//仅跳过ASCII字段的GBK转码
+static dict convertAscii(const CThostFtdcDepthMarketDataField *tick)
+{
+    dict data;
+#define ASCII_STRING(name) data[#name] = fromAscii(tick->name);
+    STRING_FIELDS(ASCII_STRING)
+    NUMBER_FIELDS(LEGACY_NUMBER)
+    return data;
+}
+
+
+//当前生成代码的方式：预分配字典，使用预先驻留的键
+static dict convertInterned(const CThostFtdcDepthMarketDataField *tick)
+{
+    dict data = newDict(0 STRING_FIELDS(COUNT_FIELD) NUMBER_FIELDS(COUNT_FIELD));
+#define INTERNED_STRING(name) setItem(data, KEY_##name, fromAscii(tick->name));
+#define INTERNED_NUMBER(name) setItem(data, KEY_##name, tick->name);
+    STRING_FIELDS(INTERNED_STRING)
+    NUMBER_FIELDS(INTERNED_NUMBER)
+    return data;
+}
+
+
+template <typename F>
+static void run(const char *name, F convert, const CThostFtdcDepthMarketDataField *tick, int count)
+{
+    //预热
+    for (int i = 0; i < count / 10; i++)
+        convert(tick);
+
+    auto start = chrono::steady_clock::now();
+    for (int i = 0; i < count; i++)
+        convert(tick);
+    auto end = chrono::steady_clock::now();
+
+    double ns = chrono::duration<double, nano>(end - start).count() / count;
+    printf("%-12s %8.1f ns/tick\n", name, ns);
+}
+
+
+int main(int argc, char *argv[])
+{
+    int count = argc > 1 ? atoi(argv[1]) : 1000000;
+
+    scoped_interpreter guard;
+
+    STRING_FIELDS(INIT_KEY)
+    NUMBER_FIELDS(INIT_KEY)
+
+    CThostFtdcDepthMarketDataField tick = {};
+    strcpy(tick.TradingDay, "20250102");
+    strcpy(tick.ExchangeID, "SHFE");
+    strcpy(tick.InstrumentID, "rb2505");
+    strcpy(tick.UpdateTime, "09:30:01");
+    strcpy(tick.ActionDay, "20250102");
+    tick.LastPrice = 3321;
+    tick.Volume = 123456;
+    tick.BidPrice1 = 3320;
+    tick.AskPrice1 = 3321;
+    tick.BidVolume1 = 12;
+    tick.AskVolume1 = 34;
+
+    printf("fields: %d, count: %d\n", 0 STRING_FIELDS(COUNT_FIELD) NUMBER_FIELDS(COUNT_FIELD), count);
+    run("legacy", convertLegacy, &tick, count);
+    run("ascii", convertAscii, &tick, count);
+    run("interned", convertInterned, &tick, count);
+    return 0;
+}
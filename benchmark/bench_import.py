@@ -0,0 +1,68 @@
+"""
+导入耗时基准测试：每种导入方式在新的解释器进程中运行多次，输出耗时中位数，
+并检查只使用行情接口时没有加载交易扩展模块和常量模块，检查失败时返回非零退出码。
+
+运行（需要已安装pyctp_api或已将编译好的包加入PYTHONPATH）：
+    python benchmark/bench_import.py [次数]
+"""
+import statistics
+import subprocess
+import sys
+
+
+# 导入方式：名称、导入语句、不允许加载的模块
+CASES: list[tuple[str, str, list[str]]] = [
+    ("python", "pass", []),
+    ("pyctp_api", "import pyctp_api", ["pyctp_api.api.vnctpmd", "pyctp_api.api.vnctptd", "pyctp_api.api.ctp_constant"]),
+    ("MdApi", "from pyctp_api import MdApi", ["pyctp_api.api.vnctptd", "pyctp_api.api.ctp_constant"]),
+    ("TdApi", "from pyctp_api import TdApi", ["pyctp_api.api.ctp_constant"]),
+    ("constants", "from pyctp_api.api import THOST_FTDC_D_Buy", ["pyctp_api.api.vnctpmd", "pyctp_api.api.vnctptd"]),
+    ("all", "from pyctp_api.api import *", []),
+]
+
+# 子进程中执行导入并输出耗时（毫秒）和已加载的模块
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+end = time.perf_counter()
+print((end - start) * 1000)
+print(" ".join(sys.modules))
+"""
+
+
+def run(statement: str) -> tuple[float, set[str]]:
+    """在新进程中执行一次导入"""
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout.splitlines()
+    return float(output[0]), set(output[1].split())
+
+
+def main() -> int:
+    """运行全部导入方式"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    failed = False
+
+    print(f"count: {count}")
+    for name, statement, forbidden in CASES:
+        times = []
+        for _ in range(count):
+            ms, modules = run(statement)
+            times.append(ms)
+
+        loaded = [module for module in forbidden if module in modules]
+        if loaded:
+            failed = True
+
+        status = f"  loaded {', '.join(loaded)}" if loaded else ""
+        print(f"{name:<12} {statistics.median(times):8.2f} ms{status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+// 结构体转换的微基准测试：对比逐字段展开的转换代码与按字段描述表循环转换的单笔耗时
+//
+// 编译运行（Linux，在项目根目录下）：
+//   g++ -O3 -std=c++17 benchmark/bench_struct_table.cpp -o bench_struct_table \
+//       -Ipyctp_api/api/include -Ipyctp_api/api/vnctp $(python3 -m pybind11 --includes) \
+//       $(python3-config --ldflags --embed)
+//   ./bench_struct_table [每轮次数] [轮数]
+//
+// 各实现按轮交替运行，分别输出每轮单笔耗时的最小值和平均值，减少CPU频率变化和缓存状态对比较的影响
+
+#include <chrono>
+#include <cstddef>
+#include <cstdio>
+#include <cstdlib>
+
+#include "pybind11/embed.h"
+#include "vnctp.h"
+#include "ctp/ThostFtdcUserApiStruct.h"
+
+
+//深度行情结构体中的全部字段（与生成的字段描述表相同，按结构体中的顺序排列）
+#define TICK_FIELDS(X) \
+    X(TradingDay, ASCII) X(reserve1, ASCII) X(ExchangeID, ASCII) X(reserve2, ASCII) \
+    X(LastPrice, DOUBLE) X(PreSettlementPrice, DOUBLE) X(PreClosePrice, DOUBLE) X(PreOpenInterest, DOUBLE) \
+    X(OpenPrice, DOUBLE) X(HighestPrice, DOUBLE) X(LowestPrice, DOUBLE) X(Volume, INT) \
+    X(Turnover, DOUBLE) X(OpenInterest, DOUBLE) X(ClosePrice, DOUBLE) X(SettlementPrice, DOUBLE) \
+    X(UpperLimitPrice, DOUBLE) X(LowerLimitPrice, DOUBLE) X(PreDelta, DOUBLE) X(CurrDelta, DOUBLE) \
+    X(UpdateTime, ASCII) X(UpdateMillisec, INT) \
+    X(BidPrice1, DOUBLE) X(BidVolume1, INT) X(AskPrice1, DOUBLE) X(AskVolume1, INT) \
+    X(BidPrice2, DOUBLE) X(BidVolume2, INT) X(AskPrice2, DOUBLE) X(AskVolume2, INT) \
+    X(BidPrice3, DOUBLE) X(BidVolume3, INT) X(AskPrice3, DOUBLE) X(AskVolume3, INT) \
+    X(BidPrice4, DOUBLE) X(BidVolume4, INT) X(AskPrice4, DOUBLE) X(AskVolume4, INT) \
+    X(BidPrice5, DOUBLE) X(BidVolume5, INT) X(AskPrice5, DOUBLE) X(AskVolume5, INT) \
+    X(AveragePrice, DOUBLE) X(ActionDay, ASCII) X(InstrumentID, ASCII) X(ExchangeInstID, ASCII) \
+    X(BandingUpperPrice, DOUBLE) X(BandingLowerPrice, DOUBLE)
+
+//报单录入结构体中的全部字段（与深度行情同名的字段写在深度行情中）
+#define ORDER_ONLY_FIELDS(X) \
+    X(BrokerID, ASCII) X(InvestorID, ASCII) X(OrderRef, ASCII) X(UserID, ASCII) \
+    X(OrderPriceType, CHAR) X(Direction, CHAR) X(CombOffsetFlag, ASCII) X(CombHedgeFlag, ASCII) \
+    X(LimitPrice, DOUBLE) X(VolumeTotalOriginal, INT) X(TimeCondition, CHAR) X(GTDDate, ASCII) \
+    X(VolumeCondition, CHAR) X(MinVolume, INT) X(ContingentCondition, CHAR) X(StopPrice, DOUBLE) \
+    X(ForceCloseReason, CHAR) X(IsAutoSuspend, INT) X(BusinessUnit, GBK) X(RequestID, INT) \
+    X(UserForceClose, INT) X(IsSwapOrder, INT) X(InvestUnitID, ASCII) X(AccountID, ASCII) \
+    X(CurrencyID, ASCII) X(ClientID, ASCII) X(MacAddress, ASCII) X(IPAddress, ASCII) \
+    X(OrderMemo, GBK) X(SessionReqSeq, INT)
+
+#define ORDER_FIELDS(X) \
+    X(BrokerID, ASCII) X(InvestorID, ASCII) X(reserve1, ASCII) X(OrderRef, ASCII) X(UserID, ASCII) \
+    X(OrderPriceType, CHAR) X(Direction, CHAR) X(CombOffsetFlag, ASCII) X(CombHedgeFlag, ASCII) \
+    X(LimitPrice, DOUBLE) X(VolumeTotalOriginal, INT) X(TimeCondition, CHAR) X(GTDDate, ASCII) \
+    X(VolumeCondition, CHAR) X(MinVolume, INT) X(ContingentCondition, CHAR) X(StopPrice, DOUBLE) \
+    X(ForceCloseReason, CHAR) X(IsAutoSuspend, INT) X(BusinessUnit, GBK) X(RequestID, INT) \
+    X(UserForceClose, INT) X(IsSwapOrder, INT) X(ExchangeID, ASCII) X(InvestUnitID, ASCII) \
+    X(AccountID, ASCII) X(CurrencyID, ASCII) X(ClientID, ASCII) X(reserve2, ASCII) \
+    X(MacAddress, ASCII) X(InstrumentID, ASCII) X(IPAddress, ASCII) X(OrderMemo, GBK) \
+    X(SessionReqSeq, INT)
+
+#define COUNT_FIELD(name, type) + 1
+#define DECLARE_KEY(name, type) static PyObject *KEY_##name;
+#define INIT_KEY(name, type) KEY_##name = PyUnicode_InternFromString(#name);
+
+TICK_FIELDS(DECLARE_KEY)
+ORDER_ONLY_FIELDS(DECLARE_KEY)
+
+
+//与生成代码相同格式的字段描述表
+#define TICK_DESC(name, type) \
+    {#name, &KEY_##name, offsetof(CThostFtdcDepthMarketDataField, name), \
+     sizeof(CThostFtdcDepthMarketDataField::name), FIELD_##type},
+
+static const FieldDesc DepthMarketDataFields[] = {
+    TICK_FIELDS(TICK_DESC)
+};
+
+#define ORDER_DESC(name, type) \
+    {#name, &KEY_##name, offsetof(CThostFtdcInputOrderField, name), \
+     sizeof(CThostFtdcInputOrderField::name), FIELD_##type},
+
+static const FieldDesc InputOrderFields[] = {
+    ORDER_FIELDS(ORDER_DESC)
+};
+
+
+static CThostFtdcDepthMarketDataField tick = {};
+static CThostFtdcInputOrderField order = {};
+static const dict *order_request;
+
+//原有生成代码的方式：逐字段展开
+#define UNROLLED_SET_ASCII(name) setItem(data, KEY_##name, fromAscii(tick.name));
+#define UNROLLED_SET_INT(name) setItem(data, KEY_##name, tick.name);
+#define UNROLLED_SET_DOUBLE(name) setItem(data, KEY_##name, tick.name);
+#define UNROLLED_SET(name, type) UNROLLED_SET_##type(name)
+
+static void tickUnrolled()
+{
+    dict data = newDict(0 TICK_FIELDS(COUNT_FIELD));
+    TICK_FIELDS(UNROLLED_SET)
+}
+
+
+//当前生成代码的方式：按字段描述表循环
+static void tickTable()
+{
+    structToDict(DepthMarketDataFields, &tick);
+}
+
+
+//原有生成代码的方式：逐字段展开
+#define UNROLLED_GET_ASCII(name) getString(d, KEY_##name, order.name);
+#define UNROLLED_GET_GBK(name) getString(d, KEY_##name, order.name);
+#define UNROLLED_GET_INT(name) getInt(d, KEY_##name, &order.name);
+#define UNROLLED_GET_DOUBLE(name) getDouble(d, KEY_##name, &order.name);
+#define UNROLLED_GET_CHAR(name) getChar(d, KEY_##name, &order.name);
+#define UNROLLED_GET(name, type) UNROLLED_GET_##type(name)
+
+static void orderUnrolled()
+{
+    const dict &d = *order_request;
+    ORDER_FIELDS(UNROLLED_GET)
+}
+
+
+//当前生成代码的方式：按字段描述表循环
+static void orderTable()
+{
+    dictToStruct(*order_request, InputOrderFields, &order);
+}
+
+
+struct Case
+{
+    const char *name;
+    void (*convert)();
+    double min;
+    double sum;
+};
+
+
+//每轮依次运行全部实现，记录每轮单笔耗时
+static void run(Case *cases, size_t size, int count, int rounds)
+{
+    //预热
+    for (size_t k = 0; k < size; k++)
+    {
+        for (int i = 0; i < count; i++)
+            cases[k].convert();
+    }
+
+    for (int r = 0; r < rounds; r++)
+    {
+        for (size_t k = 0; k < size; k++)
+        {
+            auto start = chrono::steady_clock::now();
+            for (int i = 0; i < count; i++)
+                cases[k].convert();
+            auto end = chrono::steady_clock::now();
+
+            double ns = chrono::duration<double, nano>(end - start).count() / count;
+            cases[k].min = r ? min(cases[k].min, ns) : ns;
+            cases[k].sum += ns;
+        }
+    }
+
+    for (size_t k = 0; k < size; k++)
+        printf("%-18s min %8.1f  mean %8.1f ns/call\n", cases[k].name, cases[k].min, cases[k].sum / rounds);
+}
+
+
+int main(int argc, char *argv[])
+{
+    int count = argc > 1 ? atoi(argv[1]) : 100000;
+    int rounds = argc > 2 ? atoi(argv[2]) : 20;
+
+    scoped_interpreter guard;
+
+    TICK_FIELDS(INIT_KEY)
+    ORDER_ONLY_FIELDS(INIT_KEY)
+
+    strcpy(tick.TradingDay, "20250102");
+    strcpy(tick.ExchangeID, "SHFE");
+    strcpy(tick.InstrumentID, "rb2505");
+    strcpy(tick.UpdateTime, "09:30:01");
+    strcpy(tick.ActionDay, "20250102");
+    tick.LastPrice = 3321;
+    tick.Volume = 123456;
+    tick.BidPrice1 = 3320;
+    tick.AskPrice1 = 3321;
+    tick.BidVolume1 = 12;
+    tick.AskVolume1 = 34;
+
+    dict req;
+    req["BrokerID"] = "9999";
+    req["InvestorID"] = "000001";
+    req["OrderRef"] = "17";
+    req["UserID"] = "000001";
+    req["CombOffsetFlag"] = "0";
+    req["CombHedgeFlag"] = "1";
+    req["ExchangeID"] = "SHFE";
+    req["InstrumentID"] = "rb2505";
+    req["VolumeTotalOriginal"] = 1;
+    req["MinVolume"] = 1;
+    req["LimitPrice"] = 3321.0;
+    req["OrderPriceType"] = "2";
+    req["Direction"] = "0";
+    req["TimeCondition"] = "3";
+    req["VolumeCondition"] = "1";
+    req["ContingentCondition"] = "1";
+    req["ForceCloseReason"] = "0";
+    order_request = &req;
+
+    printf("count: %d x %d rounds\n", count, rounds);
+
+    Case ticks[] = {
+        {"tick unrolled", tickUnrolled, 0, 0},
+        {"tick table", tickTable, 0, 0},
+    };
+    run(ticks, std::size(ticks), count, rounds);
+
+    Case orders[] = {
+        {"order unrolled", orderUnrolled, 0, 0},
+        {"order table", orderTable, 0, 0},
+    };
+    run(orders, std::size(orders), count, rounds);
+    return 0;
+}
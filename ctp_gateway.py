@@ -12,7 +12,7 @@ from typing import Dict, List, Optional, Callable, Any
 from threading import Event, Lock
 from collections import defaultdict
 
-from pyctp_api import MdApi, TdApi
+from pyctp_api import MdApi, TdApi, OrderTemplate
 from pyctp_api.api import (
     THOST_FTDC_D_Buy,
     THOST_FTDC_D_Sell,
@@ -61,6 +61,7 @@ class CtpGateway:
         self.orders = {}       # 订单数据
         self.trades = {}       # 成交数据
         self.instruments = {}  # 合约信息
+        self.order_templates: Dict[tuple, OrderTemplate] = {}  # 报单模板（按合约缓存）
         
         # 事件回调
         self.callbacks = defaultdict(list)
@@ -210,29 +211,33 @@ class CtpGateway:
                     error_msg = error.get('ErrorMsg', '未知错误') if error else '无数据'
                     print(f"❌ 账户查询失败: {error_msg}")
 
-            def onRspQryInvestorPosition(self, data: dict, error: dict, reqid: int, last: bool):
-                print(f"📥 收到持仓查询响应, ReqID: {reqid}, 数据: {bool(data)}, 错误: {error}")
-                if (not error or error.get("ErrorID", 0) == 0) and data:
+            def onRspQryInvestorPositionAll(self, rows: list, error: dict, reqid: int):
+                # 分页返回的持仓在收到最后一条后一次性推送
+                print(f"📥 收到持仓查询响应, ReqID: {reqid}, 数据: {len(rows)}条, 错误: {error}")
+                if error and error.get("ErrorID", 0) != 0:
+                    print(f"❌ 持仓查询失败: {error.get('ErrorMsg', '未知错误')}")
+                    return
+
+                for data in rows:
                     symbol = data.get('InstrumentID', '')
                     if symbol:
                         self.gateway.positions[symbol] = data
                         self.gateway._trigger_callback('position_data', data)
-                        print(f"📦 持仓信息更新: {symbol} 持仓={data.get('Position', 0)}")
-                else:
-                    error_msg = error.get('ErrorMsg', '未知错误') if error else '无数据'
-                    print(f"❌ 持仓查询失败: {error_msg}")
+                print(f"📦 持仓信息更新: {len(self.gateway.positions)}个合约")
 
-            def onRspQryInstrument(self, data: dict, error: dict, reqid: int, last: bool):
-                print(f"📥 收到合约查询响应, ReqID: {reqid}, 数据: {bool(data)}, 错误: {error}")
-                if (not error or error.get("ErrorID", 0) == 0) and data:
+            def onRspQryInstrumentAll(self, rows: list, error: dict, reqid: int):
+                # 分页返回的合约在收到最后一条后一次性推送
+                print(f"📥 收到合约查询响应, ReqID: {reqid}, 数据: {len(rows)}条, 错误: {error}")
+                if error and error.get("ErrorID", 0) != 0:
+                    print(f"❌ 合约查询失败: {error.get('ErrorMsg', '未知错误')}")
+                    return
+
+                for data in rows:
                     symbol = data.get('InstrumentID', '')
                     if symbol:
                         self.gateway.instruments[symbol] = data
                         self.gateway._trigger_callback('instrument_data', data)
-                        print(f"🔍 合约信息更新: {symbol}")
-                else:
-                    error_msg = error.get('ErrorMsg', '未知错误') if error else '无数据'
-                    print(f"❌ 合约查询失败: {error_msg}")
+                print(f"🔍 合约信息更新: {len(self.gateway.instruments)}个合约")
 
             def onRtnOrder(self, data: dict):
                 order_sys_id = data.get('OrderSysID', '')
@@ -273,6 +278,28 @@ class CtpGateway:
             self._order_ref += 1
             return str(self._order_ref)
 
+    def _get_order_template(self, symbol: str, exchange: str) -> OrderTemplate:
+        """获取合约的报单模板，首次使用时创建"""
+        key = (symbol, exchange)
+        template = self.order_templates.get(key)
+        if template is None:
+            template = OrderTemplate({
+                "BrokerID": self.config.get('经纪商代码', ''),
+                "InvestorID": self.config.get('用户名', ''),
+                "InstrumentID": symbol,
+                "ExchangeID": exchange,
+                "CombHedgeFlag": THOST_FTDC_HF_Speculation,
+                "TimeCondition": THOST_FTDC_TC_GFD,
+                "VolumeCondition": THOST_FTDC_VC_AV,
+                "OrderPriceType": THOST_FTDC_OPT_LimitPrice,
+                "ContingentCondition": THOST_FTDC_CC_Immediately,
+                "ForceCloseReason": THOST_FTDC_FCC_NotForceClose,
+                "IsAutoSuspend": 0,
+                "UserForceClose": 0
+            })
+            self.order_templates[key] = template
+        return template
+
     def _trigger_callback(self, event: str, data: Any = None):
         """触发事件回调"""
         for callback in self.callbacks[event]:
@@ -406,9 +433,8 @@ class CtpGateway:
             return False
         
         print(f"📊 订阅行情: {symbols}")
-        # subscribeMarketData需要逐个订阅
-        for symbol in symbols:
-            self.md_api.subscribeMarketData(symbol)
+        # 传入列表时按批次一次性订阅
+        self.md_api.subscribeMarketData(list(symbols))
         return True
 
     def unsubscribe_market_data(self, symbols: List[str]) -> bool:
@@ -418,9 +444,8 @@ class CtpGateway:
             return False
         
         print(f"📊 取消订阅行情: {symbols}")
-        # unSubscribeMarketData需要逐个取消订阅
-        for symbol in symbols:
-            self.md_api.unSubscribeMarketData(symbol)
+        # 传入列表时按批次一次性取消订阅
+        self.md_api.unSubscribeMarketData(list(symbols))
         return True
 
     def query_account(self) -> bool:
@@ -490,31 +515,22 @@ class CtpGateway:
         
         order_ref = self._get_next_order_ref()
         
-        req = {
-            "BrokerID": self.config.get('经纪商代码', ''),
-            "InvestorID": self.config.get('用户名', ''),
-            "InstrumentID": symbol,
-            "ExchangeID": exchange,
-            "OrderRef": order_ref,
-            "Direction": direction_map.get(direction, THOST_FTDC_D_Buy),
-            "CombOffsetFlag": offset_map.get(offset, THOST_FTDC_OF_Open),
-            "CombHedgeFlag": THOST_FTDC_HF_Speculation,
-            "LimitPrice": price,
-            "VolumeTotalOriginal": volume,
-            "TimeCondition": THOST_FTDC_TC_GFD,
-            "VolumeCondition": THOST_FTDC_VC_AV,
-            "OrderPriceType": THOST_FTDC_OPT_LimitPrice,
-            "ContingentCondition": THOST_FTDC_CC_Immediately,
-            "ForceCloseReason": THOST_FTDC_FCC_NotForceClose,
-            "IsAutoSuspend": 0,
-            "UserForceClose": 0
-        }
+        # 固定字段已预先填入报单模板，发送时只修改价格、数量、方向、开平和报单引用
+        template = self._get_order_template(symbol, exchange)
         
         req_id = self._get_next_req_id('td')
         print(f"📋 发送订单: {symbol} {direction} {offset} "
               f"价格={price} 数量={volume} ReqID={req_id}")
         
-        result = self.td_api.reqOrderInsert(req, req_id)
+        result = self.td_api.sendOrderFast(
+            template,
+            price,
+            volume,
+            direction_map.get(direction, THOST_FTDC_D_Buy),
+            offset_map.get(offset, THOST_FTDC_OF_Open),
+            order_ref,
+            req_id
+        )
         if result == 0:
             return order_ref
         else:
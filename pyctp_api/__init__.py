@@ -3,16 +3,45 @@
 #
 # This package provides direct access to CTP's trading and market data APIs
 # without any additional framework dependencies.
+#
+# MdApi, TdApi, OrderTemplate and the CTP constants are imported on first
+# access, so market-data-only processes never load the trader extension.
+
+from __future__ import annotations
+
+# typing is not imported at runtime to keep the package import cheap
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+    from .api import MdApi, TdApi, OrderTemplate      # noqa
+    from .api.ctp_constant import *     # noqa
+
+__all__ = ["MdApi", "TdApi", "OrderTemplate"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import APIs, constants and the package version on first access"""
+    if name == "__version__":
+        from importlib import metadata
+
+        try:
+            value = metadata.version("pyctp-api")
+        except metadata.PackageNotFoundError:
+            value = "1.0.0"
+    elif name in __all__ or name.startswith("THOST_"):
+        from . import api
 
-from importlib import metadata
+        try:
+            value = getattr(api, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Import CTP APIs
-from .api import MdApi, TdApi
-from .api.ctp_constant import *
+    globals()[name] = value
+    return value
 
-__all__ = ["MdApi", "TdApi"]
 
-try:
-    __version__ = metadata.version("pyctp-api")
-except metadata.PackageNotFoundError:
-    __version__ = "1.0.0"
+def __dir__() -> list[str]:
+    """Include the lazily imported names"""
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
@@ -0,0 +1,276 @@
+"""
+asyncio集成
+
+AsyncMdApi/AsyncTdApi以poll模式初始化，将任务队列的文件描述符注册到当前事件循环，
+可读时在事件循环线程中批量推送回调，不再需要推送线程和call_soon_threadsafe。
+
+请求通过request返回可等待对象，按请求编号收集onRsp*回调中的数据，直到bIsLast；
+行情、委托和成交推送通过异步迭代器读取：
+
+    async for tick in md.ticks():
+        ...
+"""
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+
+# 只在类型检查时声明混入类用到的MdApi/TdApi方法，运行时由具体的接口类提供
+if TYPE_CHECKING:
+    class ApiBase:
+        """AsyncApi依赖的接口方法"""
+
+        def init(self, dispatch: str = "thread") -> None: ...
+
+        def exit(self) -> int: ...
+
+        def poll(self, max_events: int = 1024, timeout_us: int = 0) -> int: ...
+
+        def fileno(self) -> int: ...
+
+        def registerFront(self, address: str) -> None: ...
+
+        def create_api(self, flow_path: str) -> None:
+            """创建CTP接口对象（由AsyncMdApi/AsyncTdApi实现）"""
+else:
+    ApiBase = object
+
+
+class RequestError(Exception):
+    """请求发送失败或CTP返回错误"""
+
+    def __init__(self, error_id: int, error_msg: str) -> None:
+        """Constructor"""
+        super().__init__(f"[{error_id}] {error_msg}")
+        self.error_id: int = error_id
+        self.error_msg: str = error_msg
+
+
+class AsyncApi(ApiBase):
+    """事件循环中推送回调的公共实现，与MdApi/TdApi组合使用"""
+
+    # 每次可读时最多推送的任务数量
+    max_events: int = 1024
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Constructor"""
+        super().__init__(*args, **kwargs)
+
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.fd: int = -1
+        self.reqid: int = 0
+
+        # 请求编号对应的等待对象和已收到的数据
+        self.pending: dict[int, tuple[asyncio.Future, list]] = {}
+        self.connected: asyncio.Event = asyncio.Event()
+
+    def init(self, dispatch: str = "poll") -> None:
+        """以poll模式初始化，需要在事件循环中调用"""
+        if dispatch != "poll":
+            raise ValueError("async api only supports poll dispatch")
+
+        self.loop = asyncio.get_running_loop()
+        super().init(dispatch="poll")
+
+        self.fd = self.fileno()
+        self.loop.add_reader(self.fd, self.process_events)
+
+    def exit(self) -> int:
+        """移除事件循环中的读取回调后关闭接口"""
+        if self.loop and self.fd >= 0:
+            self.loop.remove_reader(self.fd)
+            self.fd = -1
+
+        self.fail_pending(ConnectionError("api exited"))
+        return super().exit()
+
+    def process_events(self) -> None:
+        """文件描述符可读时批量推送回调（仍有任务时事件循环会再次调用）"""
+        self.poll(self.max_events)
+
+    def request(self, name: str, req: dict | None = None) -> asyncio.Future:
+        """
+        调用req*函数，返回收到全部响应数据后完成的可等待对象
+
+        结果为onRsp*回调中的数据列表（不包含空数据），CTP返回错误时抛出RequestError
+        """
+        if not self.loop:
+            raise RuntimeError("api is not initialized")
+
+        self.reqid += 1
+        reqid: int = self.reqid
+
+        future: asyncio.Future = self.loop.create_future()
+        self.pending[reqid] = (future, [])
+        future.add_done_callback(lambda _: self.pending.pop(reqid, None))
+
+        # 请求函数不存在或请求字典无法转换时，移除已登记的等待对象
+        try:
+            n: int = getattr(self, name)(req or {}, reqid)
+        except Exception:
+            self.pending.pop(reqid, None)
+            future.cancel()
+            raise
+
+        if n != 0:
+            future.set_exception(RequestError(n, f"{name} failed"))
+
+        return future
+
+    def fail_pending(self, exc: Exception) -> None:
+        """所有未完成的请求以异常结束"""
+        for future, _ in list(self.pending.values()):
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+    def on_response(self, data: dict, error: dict, reqid: int, last: bool) -> None:
+        """请求响应回调（所有onRsp*回调都转到这里）"""
+        item = self.pending.get(reqid)
+        if not item:
+            return
+
+        future, rows = item
+        if future.done():
+            return
+
+        if error and error.get("ErrorID", 0):
+            future.set_exception(RequestError(error["ErrorID"], error.get("ErrorMsg", "")))
+            return
+
+        if data:
+            rows.append(data)
+
+        if last:
+            future.set_result(rows)
+
+    def onRspError(self, error: dict, reqid: int, last: bool) -> None:
+        """请求报错回报"""
+        self.on_response({}, error, reqid, True)
+
+    def onFrontConnected(self) -> None:
+        """服务器连接成功回报"""
+        self.connected.set()
+
+    def onFrontDisconnected(self, reason: int) -> None:
+        """服务器连接断开回报，未完成的请求不会再收到响应"""
+        self.connected.clear()
+        self.fail_pending(ConnectionError(f"front disconnected: {reason}"))
+
+    async def connect(self, address: str, flow_path: str = "") -> None:
+        """创建接口、注册前置地址并等待连接成功"""
+        self.create_api(flow_path)
+        self.registerFront(address)
+        self.init()
+        await self.connected.wait()
+
+    @staticmethod
+    async def subscribe(channels: list[asyncio.Queue], maxsize: int) -> AsyncIterator:
+        """向推送列表中添加一个队列，并逐个读取其中的数据"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        channels.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            channels.remove(queue)
+
+    @staticmethod
+    def publish(channels: list[asyncio.Queue], data: object) -> None:
+        """将数据写入推送列表中的全部队列，队列已满时丢弃最早的数据"""
+        for queue in channels:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data)
+
+
+def route_responses(cls: type, api_class: type) -> None:
+    """将接口类中的onRsp*回调（onRspError除外）全部转到on_response"""
+    for name in dir(api_class):
+        if name.startswith("onRsp") and name != "onRspError" and name not in vars(cls):
+            setattr(cls, name, AsyncApi.on_response)
+
+
+def create_md_class() -> type:
+    """创建asyncio行情接口类（导入行情扩展模块）"""
+    from .api.vnctpmd import MdApi
+
+    class AsyncMdApi(AsyncApi, MdApi):
+        """asyncio行情接口"""
+
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            """Constructor"""
+            super().__init__(*args, **kwargs)
+
+            self.tick_channels: list[asyncio.Queue] = []
+
+        def create_api(self, flow_path: str) -> None:
+            """创建CTP接口对象"""
+            self.createFtdcMdApi(flow_path)
+
+        def ticks(self, maxsize: int = 0) -> AsyncIterator:
+            """行情推送的异步迭代器，maxsize大于0时队列已满会丢弃最早的行情"""
+            return self.subscribe(self.tick_channels, maxsize)
+
+        def onRtnDepthMarketDataBatch(self, data: list) -> None:
+            """同一批次的连续行情推送"""
+            for tick in data:
+                self.publish(self.tick_channels, tick)
+
+    route_responses(AsyncMdApi, MdApi)
+    return AsyncMdApi
+
+
+def create_td_class() -> type:
+    """创建asyncio交易接口类（导入交易扩展模块）"""
+    from .api.vnctptd import TdApi
+
+    class AsyncTdApi(AsyncApi, TdApi):
+        """asyncio交易接口"""
+
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            """Constructor"""
+            super().__init__(*args, **kwargs)
+
+            self.order_channels: list[asyncio.Queue] = []
+            self.trade_channels: list[asyncio.Queue] = []
+
+        def create_api(self, flow_path: str) -> None:
+            """创建CTP接口对象"""
+            self.createFtdcTraderApi(flow_path)
+
+        def orders(self, maxsize: int = 0) -> AsyncIterator:
+            """委托回报的异步迭代器"""
+            return self.subscribe(self.order_channels, maxsize)
+
+        def trades(self, maxsize: int = 0) -> AsyncIterator:
+            """成交回报的异步迭代器"""
+            return self.subscribe(self.trade_channels, maxsize)
+
+        def onRtnOrder(self, data: dict) -> None:
+            """委托回报"""
+            self.publish(self.order_channels, data)
+
+        def onRtnTrade(self, data: dict) -> None:
+            """成交回报"""
+            self.publish(self.trade_channels, data)
+
+    route_responses(AsyncTdApi, TdApi)
+    return AsyncTdApi
+
+
+# 延迟创建的接口类，只使用行情接口的进程不会加载交易扩展模块
+LAZY_CLASSES = {
+    "AsyncMdApi": create_md_class,
+    "AsyncTdApi": create_td_class,
+}
+
+
+def __getattr__(name: str) -> type:
+    """首次访问时创建对应的接口类，并缓存到模块字典中"""
+    if name not in LAZY_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = LAZY_CLASSES[name]()
+    globals()[name] = value
+    return value
@@ -1,3 +1,61 @@
-from .vnctpmd import MdApi      # noqa
-from .vnctptd import TdApi      # noqa
-from .ctp_constant import *     # noqa
+"""
+CTP接口的扩展模块和常量
+
+MdApi、TdApi、OrderTemplate、QueryColumns和CTP常量在首次访问时才导入对应的模块，
+只使用行情接口的进程不会加载交易扩展模块及其依赖的动态库。
+"""
+from __future__ import annotations
+
+import importlib
+
+# 不在运行时导入typing，减少导入耗时
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+    from .vnctpmd import MdApi      # noqa
+    from .vnctptd import TdApi, OrderTemplate, QueryColumns, QueryColumn      # noqa
+    from .ctp_constant import *     # noqa
+
+
+# 延迟导入的名称及其所在的模块
+LAZY_MODULES: dict[str, str] = {
+    "MdApi": "vnctpmd",
+    "TdApi": "vnctptd",
+    "OrderTemplate": "vnctptd",
+    "QueryColumns": "vnctptd",
+    "QueryColumn": "vnctptd",
+}
+
+# CTP常量所在的模块
+CONSTANT_MODULE: str = "ctp_constant"
+
+
+def __getattr__(name: str) -> Any:
+    """首次访问时导入对应的模块，并缓存到模块字典中"""
+    if name in LAZY_MODULES:
+        module = importlib.import_module(f".{LAZY_MODULES[name]}", __name__)
+        value = getattr(module, name)
+    elif name == "__all__":
+        value = list(LAZY_MODULES) + constant_names()
+    elif name.startswith("THOST_"):
+        module = importlib.import_module(f".{CONSTANT_MODULE}", __name__)
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """包含延迟导入的名称"""
+    return sorted(set(globals()) | set(LAZY_MODULES) | set(constant_names()))
+
+
+def constant_names() -> list[str]:
+    """全部CTP常量名称（导入常量模块）"""
+    module = importlib.import_module(f".{CONSTANT_MODULE}", __name__)
+    return [name for name in vars(module) if not name.startswith("_")]
@@ -11,3 +11,4 @@
 #define ONRSPUNSUBFORQUOTERSP 10
 #define ONRTNDEPTHMARKETDATA 11
 #define ONRTNFORQUOTERSP 12
+#define CALLBACK_COUNT 13
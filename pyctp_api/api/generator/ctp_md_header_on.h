@@ -1,26 +1,6 @@
-virtual void onFrontConnected() {};
+virtual void onRtnDepthMarketData(const object &data) {};
 
-virtual void onFrontDisconnected(int reqid) {};
+virtual void onRtnDepthMarketDataBatch(const list &data) {};
 
-virtual void onHeartBeatWarning(int reqid) {};
-
-virtual void onRspUserLogin(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRspUserLogout(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRspQryMulticastInstrument(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRspError(const dict &error, int reqid, bool last) {};
-
-virtual void onRspSubMarketData(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRspUnSubMarketData(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRspSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRspUnSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) {};
-
-virtual void onRtnDepthMarketData(const dict &data) {};
-
-virtual void onRtnForQuoteRsp(const dict &data) {};
+virtual void onQueueWatermark(int size) {};
 
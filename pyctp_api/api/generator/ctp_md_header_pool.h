@@ -0,0 +1,24 @@
+TaskPool<CThostFtdcRspUserLoginField> pool_RspUserLogin;
+TaskPool<CThostFtdcRspInfoField> pool_RspInfo;
+TaskPool<CThostFtdcUserLogoutField> pool_UserLogout;
+TaskPool<CThostFtdcMulticastInstrumentField> pool_MulticastInstrument;
+TaskPool<CThostFtdcSpecificInstrumentField> pool_SpecificInstrument;
+TaskPool<CThostFtdcDepthMarketDataField> pool_DepthMarketData;
+TaskPool<CThostFtdcForQuoteRspField> pool_ForQuoteRsp;
+
+//各回调数据结构体对应的内存池（没有数据参数的回调为空）
+TaskPoolBase *data_pools[CALLBACK_COUNT] = {
+	nullptr,
+	nullptr,
+	nullptr,
+	&pool_RspUserLogin,
+	&pool_UserLogout,
+	&pool_MulticastInstrument,
+	nullptr,
+	&pool_SpecificInstrument,
+	&pool_SpecificInstrument,
+	&pool_SpecificInstrument,
+	&pool_SpecificInstrument,
+	&pool_DepthMarketData,
+	&pool_ForQuoteRsp,
+};
@@ -2,19 +2,11 @@ int MdApi::reqUserLogin(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginField myreq = CThostFtdcReqUserLoginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "Password", myreq.Password);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "InterfaceProductInfo", myreq.InterfaceProductInfo);
-	getString(req, "ProtocolInfo", myreq.ProtocolInfo);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "OneTimePassword", myreq.OneTimePassword);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "LoginRemark", myreq.LoginRemark);
-	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
-	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserLoginFields, &myreq);
+	else
+		dictToStruct(req, ReqUserLoginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogin(&myreq, reqid);
 	return i;
 };
@@ -23,8 +15,11 @@ int MdApi::reqUserLogout(const dict &req, int reqid)
 {
 	CThostFtdcUserLogoutField myreq = CThostFtdcUserLogoutField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, UserLogoutFields, &myreq);
+	else
+		dictToStruct(req, UserLogoutFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogout(&myreq, reqid);
 	return i;
 };
@@ -33,10 +28,18 @@ int MdApi::reqQryMulticastInstrument(const dict &req, int reqid)
 {
 	CThostFtdcQryMulticastInstrumentField myreq = CThostFtdcQryMulticastInstrumentField();
 	memset(&myreq, 0, sizeof(myreq));
-	getInt(req, "TopicID", &myreq.TopicID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryMulticastInstrumentFields, &myreq);
+	else
+		dictToStruct(req, QryMulticastInstrumentFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMulticastInstrument(&myreq, reqid);
 	return i;
 };
 
+static const pair<const char*, int (MdApi::*)(const dict&, int)> REQUEST_FUNCTIONS[] = {
+	{"reqUserLogin", &MdApi::reqUserLogin},
+	{"reqUserLogout", &MdApi::reqUserLogout},
+	{"reqQryMulticastInstrument", &MdApi::reqQryMulticastInstrument},
+};
+
@@ -0,0 +1,323 @@
+static PyObject *KEY_TradingDay;
+static PyObject *KEY_LoginTime;
+static PyObject *KEY_BrokerID;
+static PyObject *KEY_UserID;
+static PyObject *KEY_SystemName;
+static PyObject *KEY_FrontID;
+static PyObject *KEY_SessionID;
+static PyObject *KEY_MaxOrderRef;
+static PyObject *KEY_SHFETime;
+static PyObject *KEY_DCETime;
+static PyObject *KEY_CZCETime;
+static PyObject *KEY_FFEXTime;
+static PyObject *KEY_INETime;
+static PyObject *KEY_SysVersion;
+static PyObject *KEY_GFEXTime;
+static PyObject *KEY_ErrorID;
+static PyObject *KEY_ErrorMsg;
+static PyObject *KEY_TopicID;
+static PyObject *KEY_reserve1;
+static PyObject *KEY_InstrumentNo;
+static PyObject *KEY_CodePrice;
+static PyObject *KEY_VolumeMultiple;
+static PyObject *KEY_PriceTick;
+static PyObject *KEY_InstrumentID;
+static PyObject *KEY_ExchangeID;
+static PyObject *KEY_reserve2;
+static PyObject *KEY_LastPrice;
+static PyObject *KEY_PreSettlementPrice;
+static PyObject *KEY_PreClosePrice;
+static PyObject *KEY_PreOpenInterest;
+static PyObject *KEY_OpenPrice;
+static PyObject *KEY_HighestPrice;
+static PyObject *KEY_LowestPrice;
+static PyObject *KEY_Volume;
+static PyObject *KEY_Turnover;
+static PyObject *KEY_OpenInterest;
+static PyObject *KEY_ClosePrice;
+static PyObject *KEY_SettlementPrice;
+static PyObject *KEY_UpperLimitPrice;
+static PyObject *KEY_LowerLimitPrice;
+static PyObject *KEY_PreDelta;
+static PyObject *KEY_CurrDelta;
+static PyObject *KEY_UpdateTime;
+static PyObject *KEY_UpdateMillisec;
+static PyObject *KEY_BidPrice1;
+static PyObject *KEY_BidVolume1;
+static PyObject *KEY_AskPrice1;
+static PyObject *KEY_AskVolume1;
+static PyObject *KEY_BidPrice2;
+static PyObject *KEY_BidVolume2;
+static PyObject *KEY_AskPrice2;
+static PyObject *KEY_AskVolume2;
+static PyObject *KEY_BidPrice3;
+static PyObject *KEY_BidVolume3;
+static PyObject *KEY_AskPrice3;
+static PyObject *KEY_AskVolume3;
+static PyObject *KEY_BidPrice4;
+static PyObject *KEY_BidVolume4;
+static PyObject *KEY_AskPrice4;
+static PyObject *KEY_AskVolume4;
+static PyObject *KEY_BidPrice5;
+static PyObject *KEY_BidVolume5;
+static PyObject *KEY_AskPrice5;
+static PyObject *KEY_AskVolume5;
+static PyObject *KEY_AveragePrice;
+static PyObject *KEY_ActionDay;
+static PyObject *KEY_ExchangeInstID;
+static PyObject *KEY_BandingUpperPrice;
+static PyObject *KEY_BandingLowerPrice;
+static PyObject *KEY_ForQuoteSysID;
+static PyObject *KEY_ForQuoteTime;
+static PyObject *KEY_Password;
+static PyObject *KEY_UserProductInfo;
+static PyObject *KEY_InterfaceProductInfo;
+static PyObject *KEY_ProtocolInfo;
+static PyObject *KEY_MacAddress;
+static PyObject *KEY_OneTimePassword;
+static PyObject *KEY_LoginRemark;
+static PyObject *KEY_ClientIPPort;
+static PyObject *KEY_ClientIPAddress;
+
+static void initKeys()
+{
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_BrokerID = PyUnicode_InternFromString("BrokerID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_SystemName = PyUnicode_InternFromString("SystemName");
+	KEY_FrontID = PyUnicode_InternFromString("FrontID");
+	KEY_SessionID = PyUnicode_InternFromString("SessionID");
+	KEY_MaxOrderRef = PyUnicode_InternFromString("MaxOrderRef");
+	KEY_SHFETime = PyUnicode_InternFromString("SHFETime");
+	KEY_DCETime = PyUnicode_InternFromString("DCETime");
+	KEY_CZCETime = PyUnicode_InternFromString("CZCETime");
+	KEY_FFEXTime = PyUnicode_InternFromString("FFEXTime");
+	KEY_INETime = PyUnicode_InternFromString("INETime");
+	KEY_SysVersion = PyUnicode_InternFromString("SysVersion");
+	KEY_GFEXTime = PyUnicode_InternFromString("GFEXTime");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TopicID = PyUnicode_InternFromString("TopicID");
+	KEY_reserve1 = PyUnicode_InternFromString("reserve1");
+	KEY_InstrumentNo = PyUnicode_InternFromString("InstrumentNo");
+	KEY_CodePrice = PyUnicode_InternFromString("CodePrice");
+	KEY_VolumeMultiple = PyUnicode_InternFromString("VolumeMultiple");
+	KEY_PriceTick = PyUnicode_InternFromString("PriceTick");
+	KEY_InstrumentID = PyUnicode_InternFromString("InstrumentID");
+	KEY_ExchangeID = PyUnicode_InternFromString("ExchangeID");
+	KEY_reserve2 = PyUnicode_InternFromString("reserve2");
+	KEY_LastPrice = PyUnicode_InternFromString("LastPrice");
+	KEY_PreSettlementPrice = PyUnicode_InternFromString("PreSettlementPrice");
+	KEY_PreClosePrice = PyUnicode_InternFromString("PreClosePrice");
+	KEY_PreOpenInterest = PyUnicode_InternFromString("PreOpenInterest");
+	KEY_OpenPrice = PyUnicode_InternFromString("OpenPrice");
+	KEY_HighestPrice = PyUnicode_InternFromString("HighestPrice");
+	KEY_LowestPrice = PyUnicode_InternFromString("LowestPrice");
+	KEY_Volume = PyUnicode_InternFromString("Volume");
+	KEY_Turnover = PyUnicode_InternFromString("Turnover");
+	KEY_OpenInterest = PyUnicode_InternFromString("OpenInterest");
+	KEY_ClosePrice = PyUnicode_InternFromString("ClosePrice");
+	KEY_SettlementPrice = PyUnicode_InternFromString("SettlementPrice");
+	KEY_UpperLimitPrice = PyUnicode_InternFromString("UpperLimitPrice");
+	KEY_LowerLimitPrice = PyUnicode_InternFromString("LowerLimitPrice");
+	KEY_PreDelta = PyUnicode_InternFromString("PreDelta");
+	KEY_CurrDelta = PyUnicode_InternFromString("CurrDelta");
+	KEY_UpdateTime = PyUnicode_InternFromString("UpdateTime");
+	KEY_UpdateMillisec = PyUnicode_InternFromString("UpdateMillisec");
+	KEY_BidPrice1 = PyUnicode_InternFromString("BidPrice1");
+	KEY_BidVolume1 = PyUnicode_InternFromString("BidVolume1");
+	KEY_AskPrice1 = PyUnicode_InternFromString("AskPrice1");
+	KEY_AskVolume1 = PyUnicode_InternFromString("AskVolume1");
+	KEY_BidPrice2 = PyUnicode_InternFromString("BidPrice2");
+	KEY_BidVolume2 = PyUnicode_InternFromString("BidVolume2");
+	KEY_AskPrice2 = PyUnicode_InternFromString("AskPrice2");
+	KEY_AskVolume2 = PyUnicode_InternFromString("AskVolume2");
+	KEY_BidPrice3 = PyUnicode_InternFromString("BidPrice3");
+	KEY_BidVolume3 = PyUnicode_InternFromString("BidVolume3");
+	KEY_AskPrice3 = PyUnicode_InternFromString("AskPrice3");
+	KEY_AskVolume3 = PyUnicode_InternFromString("AskVolume3");
+	KEY_BidPrice4 = PyUnicode_InternFromString("BidPrice4");
+	KEY_BidVolume4 = PyUnicode_InternFromString("BidVolume4");
+	KEY_AskPrice4 = PyUnicode_InternFromString("AskPrice4");
+	KEY_AskVolume4 = PyUnicode_InternFromString("AskVolume4");
+	KEY_BidPrice5 = PyUnicode_InternFromString("BidPrice5");
+	KEY_BidVolume5 = PyUnicode_InternFromString("BidVolume5");
+	KEY_AskPrice5 = PyUnicode_InternFromString("AskPrice5");
+	KEY_AskVolume5 = PyUnicode_InternFromString("AskVolume5");
+	KEY_AveragePrice = PyUnicode_InternFromString("AveragePrice");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_ExchangeInstID = PyUnicode_InternFromString("ExchangeInstID");
+	KEY_BandingUpperPrice = PyUnicode_InternFromString("BandingUpperPrice");
+	KEY_BandingLowerPrice = PyUnicode_InternFromString("BandingLowerPrice");
+	KEY_ForQuoteSysID = PyUnicode_InternFromString("ForQuoteSysID");
+	KEY_ForQuoteTime = PyUnicode_InternFromString("ForQuoteTime");
+	KEY_Password = PyUnicode_InternFromString("Password");
+	KEY_UserProductInfo = PyUnicode_InternFromString("UserProductInfo");
+	KEY_InterfaceProductInfo = PyUnicode_InternFromString("InterfaceProductInfo");
+	KEY_ProtocolInfo = PyUnicode_InternFromString("ProtocolInfo");
+	KEY_MacAddress = PyUnicode_InternFromString("MacAddress");
+	KEY_OneTimePassword = PyUnicode_InternFromString("OneTimePassword");
+	KEY_LoginRemark = PyUnicode_InternFromString("LoginRemark");
+	KEY_ClientIPPort = PyUnicode_InternFromString("ClientIPPort");
+	KEY_ClientIPAddress = PyUnicode_InternFromString("ClientIPAddress");
+};
+
+static const FieldDesc RspUserLoginFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRspUserLoginField, TradingDay), sizeof(CThostFtdcRspUserLoginField::TradingDay), FIELD_ASCII},
+	{"LoginTime", &KEY_LoginTime, offsetof(CThostFtdcRspUserLoginField, LoginTime), sizeof(CThostFtdcRspUserLoginField::LoginTime), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspUserLoginField, BrokerID), sizeof(CThostFtdcRspUserLoginField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspUserLoginField, UserID), sizeof(CThostFtdcRspUserLoginField::UserID), FIELD_ASCII},
+	{"SystemName", &KEY_SystemName, offsetof(CThostFtdcRspUserLoginField, SystemName), sizeof(CThostFtdcRspUserLoginField::SystemName), FIELD_GBK},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcRspUserLoginField, FrontID), sizeof(CThostFtdcRspUserLoginField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcRspUserLoginField, SessionID), sizeof(CThostFtdcRspUserLoginField::SessionID), FIELD_INT},
+	{"MaxOrderRef", &KEY_MaxOrderRef, offsetof(CThostFtdcRspUserLoginField, MaxOrderRef), sizeof(CThostFtdcRspUserLoginField::MaxOrderRef), FIELD_ASCII},
+	{"SHFETime", &KEY_SHFETime, offsetof(CThostFtdcRspUserLoginField, SHFETime), sizeof(CThostFtdcRspUserLoginField::SHFETime), FIELD_ASCII},
+	{"DCETime", &KEY_DCETime, offsetof(CThostFtdcRspUserLoginField, DCETime), sizeof(CThostFtdcRspUserLoginField::DCETime), FIELD_ASCII},
+	{"CZCETime", &KEY_CZCETime, offsetof(CThostFtdcRspUserLoginField, CZCETime), sizeof(CThostFtdcRspUserLoginField::CZCETime), FIELD_ASCII},
+	{"FFEXTime", &KEY_FFEXTime, offsetof(CThostFtdcRspUserLoginField, FFEXTime), sizeof(CThostFtdcRspUserLoginField::FFEXTime), FIELD_ASCII},
+	{"INETime", &KEY_INETime, offsetof(CThostFtdcRspUserLoginField, INETime), sizeof(CThostFtdcRspUserLoginField::INETime), FIELD_ASCII},
+	{"SysVersion", &KEY_SysVersion, offsetof(CThostFtdcRspUserLoginField, SysVersion), sizeof(CThostFtdcRspUserLoginField::SysVersion), FIELD_GBK},
+	{"GFEXTime", &KEY_GFEXTime, offsetof(CThostFtdcRspUserLoginField, GFEXTime), sizeof(CThostFtdcRspUserLoginField::GFEXTime), FIELD_ASCII},
+};
+
+static const FieldDesc RspInfoFields[] = {
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcRspInfoField, ErrorID), sizeof(CThostFtdcRspInfoField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcRspInfoField, ErrorMsg), sizeof(CThostFtdcRspInfoField::ErrorMsg), FIELD_GBK},
+};
+
+static const FieldDesc UserLogoutFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcUserLogoutField, BrokerID), sizeof(CThostFtdcUserLogoutField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcUserLogoutField, UserID), sizeof(CThostFtdcUserLogoutField::UserID), FIELD_ASCII},
+};
+
+static const FieldDesc MulticastInstrumentFields[] = {
+	{"TopicID", &KEY_TopicID, offsetof(CThostFtdcMulticastInstrumentField, TopicID), sizeof(CThostFtdcMulticastInstrumentField::TopicID), FIELD_INT},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcMulticastInstrumentField, reserve1), sizeof(CThostFtdcMulticastInstrumentField::reserve1), FIELD_ASCII},
+	{"InstrumentNo", &KEY_InstrumentNo, offsetof(CThostFtdcMulticastInstrumentField, InstrumentNo), sizeof(CThostFtdcMulticastInstrumentField::InstrumentNo), FIELD_INT},
+	{"CodePrice", &KEY_CodePrice, offsetof(CThostFtdcMulticastInstrumentField, CodePrice), sizeof(CThostFtdcMulticastInstrumentField::CodePrice), FIELD_DOUBLE},
+	{"VolumeMultiple", &KEY_VolumeMultiple, offsetof(CThostFtdcMulticastInstrumentField, VolumeMultiple), sizeof(CThostFtdcMulticastInstrumentField::VolumeMultiple), FIELD_INT},
+	{"PriceTick", &KEY_PriceTick, offsetof(CThostFtdcMulticastInstrumentField, PriceTick), sizeof(CThostFtdcMulticastInstrumentField::PriceTick), FIELD_DOUBLE},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcMulticastInstrumentField, InstrumentID), sizeof(CThostFtdcMulticastInstrumentField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc SpecificInstrumentFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcSpecificInstrumentField, reserve1), sizeof(CThostFtdcSpecificInstrumentField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcSpecificInstrumentField, InstrumentID), sizeof(CThostFtdcSpecificInstrumentField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc DepthMarketDataFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcDepthMarketDataField, TradingDay), sizeof(CThostFtdcDepthMarketDataField::TradingDay), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcDepthMarketDataField, reserve1), sizeof(CThostFtdcDepthMarketDataField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcDepthMarketDataField, ExchangeID), sizeof(CThostFtdcDepthMarketDataField::ExchangeID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcDepthMarketDataField, reserve2), sizeof(CThostFtdcDepthMarketDataField::reserve2), FIELD_ASCII},
+	{"LastPrice", &KEY_LastPrice, offsetof(CThostFtdcDepthMarketDataField, LastPrice), sizeof(CThostFtdcDepthMarketDataField::LastPrice), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcDepthMarketDataField, PreSettlementPrice), sizeof(CThostFtdcDepthMarketDataField::PreSettlementPrice), FIELD_DOUBLE},
+	{"PreClosePrice", &KEY_PreClosePrice, offsetof(CThostFtdcDepthMarketDataField, PreClosePrice), sizeof(CThostFtdcDepthMarketDataField::PreClosePrice), FIELD_DOUBLE},
+	{"PreOpenInterest", &KEY_PreOpenInterest, offsetof(CThostFtdcDepthMarketDataField, PreOpenInterest), sizeof(CThostFtdcDepthMarketDataField::PreOpenInterest), FIELD_DOUBLE},
+	{"OpenPrice", &KEY_OpenPrice, offsetof(CThostFtdcDepthMarketDataField, OpenPrice), sizeof(CThostFtdcDepthMarketDataField::OpenPrice), FIELD_DOUBLE},
+	{"HighestPrice", &KEY_HighestPrice, offsetof(CThostFtdcDepthMarketDataField, HighestPrice), sizeof(CThostFtdcDepthMarketDataField::HighestPrice), FIELD_DOUBLE},
+	{"LowestPrice", &KEY_LowestPrice, offsetof(CThostFtdcDepthMarketDataField, LowestPrice), sizeof(CThostFtdcDepthMarketDataField::LowestPrice), FIELD_DOUBLE},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcDepthMarketDataField, Volume), sizeof(CThostFtdcDepthMarketDataField::Volume), FIELD_INT},
+	{"Turnover", &KEY_Turnover, offsetof(CThostFtdcDepthMarketDataField, Turnover), sizeof(CThostFtdcDepthMarketDataField::Turnover), FIELD_DOUBLE},
+	{"OpenInterest", &KEY_OpenInterest, offsetof(CThostFtdcDepthMarketDataField, OpenInterest), sizeof(CThostFtdcDepthMarketDataField::OpenInterest), FIELD_DOUBLE},
+	{"ClosePrice", &KEY_ClosePrice, offsetof(CThostFtdcDepthMarketDataField, ClosePrice), sizeof(CThostFtdcDepthMarketDataField::ClosePrice), FIELD_DOUBLE},
+	{"SettlementPrice", &KEY_SettlementPrice, offsetof(CThostFtdcDepthMarketDataField, SettlementPrice), sizeof(CThostFtdcDepthMarketDataField::SettlementPrice), FIELD_DOUBLE},
+	{"UpperLimitPrice", &KEY_UpperLimitPrice, offsetof(CThostFtdcDepthMarketDataField, UpperLimitPrice), sizeof(CThostFtdcDepthMarketDataField::UpperLimitPrice), FIELD_DOUBLE},
+	{"LowerLimitPrice", &KEY_LowerLimitPrice, offsetof(CThostFtdcDepthMarketDataField, LowerLimitPrice), sizeof(CThostFtdcDepthMarketDataField::LowerLimitPrice), FIELD_DOUBLE},
+	{"PreDelta", &KEY_PreDelta, offsetof(CThostFtdcDepthMarketDataField, PreDelta), sizeof(CThostFtdcDepthMarketDataField::PreDelta), FIELD_DOUBLE},
+	{"CurrDelta", &KEY_CurrDelta, offsetof(CThostFtdcDepthMarketDataField, CurrDelta), sizeof(CThostFtdcDepthMarketDataField::CurrDelta), FIELD_DOUBLE},
+	{"UpdateTime", &KEY_UpdateTime, offsetof(CThostFtdcDepthMarketDataField, UpdateTime), sizeof(CThostFtdcDepthMarketDataField::UpdateTime), FIELD_ASCII},
+	{"UpdateMillisec", &KEY_UpdateMillisec, offsetof(CThostFtdcDepthMarketDataField, UpdateMillisec), sizeof(CThostFtdcDepthMarketDataField::UpdateMillisec), FIELD_INT},
+	{"BidPrice1", &KEY_BidPrice1, offsetof(CThostFtdcDepthMarketDataField, BidPrice1), sizeof(CThostFtdcDepthMarketDataField::BidPrice1), FIELD_DOUBLE},
+	{"BidVolume1", &KEY_BidVolume1, offsetof(CThostFtdcDepthMarketDataField, BidVolume1), sizeof(CThostFtdcDepthMarketDataField::BidVolume1), FIELD_INT},
+	{"AskPrice1", &KEY_AskPrice1, offsetof(CThostFtdcDepthMarketDataField, AskPrice1), sizeof(CThostFtdcDepthMarketDataField::AskPrice1), FIELD_DOUBLE},
+	{"AskVolume1", &KEY_AskVolume1, offsetof(CThostFtdcDepthMarketDataField, AskVolume1), sizeof(CThostFtdcDepthMarketDataField::AskVolume1), FIELD_INT},
+	{"BidPrice2", &KEY_BidPrice2, offsetof(CThostFtdcDepthMarketDataField, BidPrice2), sizeof(CThostFtdcDepthMarketDataField::BidPrice2), FIELD_DOUBLE},
+	{"BidVolume2", &KEY_BidVolume2, offsetof(CThostFtdcDepthMarketDataField, BidVolume2), sizeof(CThostFtdcDepthMarketDataField::BidVolume2), FIELD_INT},
+	{"AskPrice2", &KEY_AskPrice2, offsetof(CThostFtdcDepthMarketDataField, AskPrice2), sizeof(CThostFtdcDepthMarketDataField::AskPrice2), FIELD_DOUBLE},
+	{"AskVolume2", &KEY_AskVolume2, offsetof(CThostFtdcDepthMarketDataField, AskVolume2), sizeof(CThostFtdcDepthMarketDataField::AskVolume2), FIELD_INT},
+	{"BidPrice3", &KEY_BidPrice3, offsetof(CThostFtdcDepthMarketDataField, BidPrice3), sizeof(CThostFtdcDepthMarketDataField::BidPrice3), FIELD_DOUBLE},
+	{"BidVolume3", &KEY_BidVolume3, offsetof(CThostFtdcDepthMarketDataField, BidVolume3), sizeof(CThostFtdcDepthMarketDataField::BidVolume3), FIELD_INT},
+	{"AskPrice3", &KEY_AskPrice3, offsetof(CThostFtdcDepthMarketDataField, AskPrice3), sizeof(CThostFtdcDepthMarketDataField::AskPrice3), FIELD_DOUBLE},
+	{"AskVolume3", &KEY_AskVolume3, offsetof(CThostFtdcDepthMarketDataField, AskVolume3), sizeof(CThostFtdcDepthMarketDataField::AskVolume3), FIELD_INT},
+	{"BidPrice4", &KEY_BidPrice4, offsetof(CThostFtdcDepthMarketDataField, BidPrice4), sizeof(CThostFtdcDepthMarketDataField::BidPrice4), FIELD_DOUBLE},
+	{"BidVolume4", &KEY_BidVolume4, offsetof(CThostFtdcDepthMarketDataField, BidVolume4), sizeof(CThostFtdcDepthMarketDataField::BidVolume4), FIELD_INT},
+	{"AskPrice4", &KEY_AskPrice4, offsetof(CThostFtdcDepthMarketDataField, AskPrice4), sizeof(CThostFtdcDepthMarketDataField::AskPrice4), FIELD_DOUBLE},
+	{"AskVolume4", &KEY_AskVolume4, offsetof(CThostFtdcDepthMarketDataField, AskVolume4), sizeof(CThostFtdcDepthMarketDataField::AskVolume4), FIELD_INT},
+	{"BidPrice5", &KEY_BidPrice5, offsetof(CThostFtdcDepthMarketDataField, BidPrice5), sizeof(CThostFtdcDepthMarketDataField::BidPrice5), FIELD_DOUBLE},
+	{"BidVolume5", &KEY_BidVolume5, offsetof(CThostFtdcDepthMarketDataField, BidVolume5), sizeof(CThostFtdcDepthMarketDataField::BidVolume5), FIELD_INT},
+	{"AskPrice5", &KEY_AskPrice5, offsetof(CThostFtdcDepthMarketDataField, AskPrice5), sizeof(CThostFtdcDepthMarketDataField::AskPrice5), FIELD_DOUBLE},
+	{"AskVolume5", &KEY_AskVolume5, offsetof(CThostFtdcDepthMarketDataField, AskVolume5), sizeof(CThostFtdcDepthMarketDataField::AskVolume5), FIELD_INT},
+	{"AveragePrice", &KEY_AveragePrice, offsetof(CThostFtdcDepthMarketDataField, AveragePrice), sizeof(CThostFtdcDepthMarketDataField::AveragePrice), FIELD_DOUBLE},
+	{"ActionDay", &KEY_ActionDay, offsetof(CThostFtdcDepthMarketDataField, ActionDay), sizeof(CThostFtdcDepthMarketDataField::ActionDay), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcDepthMarketDataField, InstrumentID), sizeof(CThostFtdcDepthMarketDataField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcDepthMarketDataField, ExchangeInstID), sizeof(CThostFtdcDepthMarketDataField::ExchangeInstID), FIELD_ASCII},
+	{"BandingUpperPrice", &KEY_BandingUpperPrice, offsetof(CThostFtdcDepthMarketDataField, BandingUpperPrice), sizeof(CThostFtdcDepthMarketDataField::BandingUpperPrice), FIELD_DOUBLE},
+	{"BandingLowerPrice", &KEY_BandingLowerPrice, offsetof(CThostFtdcDepthMarketDataField, BandingLowerPrice), sizeof(CThostFtdcDepthMarketDataField::BandingLowerPrice), FIELD_DOUBLE},
+};
+
+static const FieldDesc ForQuoteRspFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcForQuoteRspField, TradingDay), sizeof(CThostFtdcForQuoteRspField::TradingDay), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcForQuoteRspField, reserve1), sizeof(CThostFtdcForQuoteRspField::reserve1), FIELD_ASCII},
+	{"ForQuoteSysID", &KEY_ForQuoteSysID, offsetof(CThostFtdcForQuoteRspField, ForQuoteSysID), sizeof(CThostFtdcForQuoteRspField::ForQuoteSysID), FIELD_ASCII},
+	{"ForQuoteTime", &KEY_ForQuoteTime, offsetof(CThostFtdcForQuoteRspField, ForQuoteTime), sizeof(CThostFtdcForQuoteRspField::ForQuoteTime), FIELD_ASCII},
+	{"ActionDay", &KEY_ActionDay, offsetof(CThostFtdcForQuoteRspField, ActionDay), sizeof(CThostFtdcForQuoteRspField::ActionDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcForQuoteRspField, ExchangeID), sizeof(CThostFtdcForQuoteRspField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcForQuoteRspField, InstrumentID), sizeof(CThostFtdcForQuoteRspField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc ReqUserLoginFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserLoginField, TradingDay), sizeof(CThostFtdcReqUserLoginField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserLoginField, BrokerID), sizeof(CThostFtdcReqUserLoginField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserLoginField, UserID), sizeof(CThostFtdcReqUserLoginField::UserID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqUserLoginField, Password), sizeof(CThostFtdcReqUserLoginField::Password), FIELD_GBK},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqUserLoginField, UserProductInfo), sizeof(CThostFtdcReqUserLoginField::UserProductInfo), FIELD_GBK},
+	{"InterfaceProductInfo", &KEY_InterfaceProductInfo, offsetof(CThostFtdcReqUserLoginField, InterfaceProductInfo), sizeof(CThostFtdcReqUserLoginField::InterfaceProductInfo), FIELD_GBK},
+	{"ProtocolInfo", &KEY_ProtocolInfo, offsetof(CThostFtdcReqUserLoginField, ProtocolInfo), sizeof(CThostFtdcReqUserLoginField::ProtocolInfo), FIELD_GBK},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcReqUserLoginField, MacAddress), sizeof(CThostFtdcReqUserLoginField::MacAddress), FIELD_ASCII},
+	{"OneTimePassword", &KEY_OneTimePassword, offsetof(CThostFtdcReqUserLoginField, OneTimePassword), sizeof(CThostFtdcReqUserLoginField::OneTimePassword), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcReqUserLoginField, reserve1), sizeof(CThostFtdcReqUserLoginField::reserve1), FIELD_ASCII},
+	{"LoginRemark", &KEY_LoginRemark, offsetof(CThostFtdcReqUserLoginField, LoginRemark), sizeof(CThostFtdcReqUserLoginField::LoginRemark), FIELD_GBK},
+	{"ClientIPPort", &KEY_ClientIPPort, offsetof(CThostFtdcReqUserLoginField, ClientIPPort), sizeof(CThostFtdcReqUserLoginField::ClientIPPort), FIELD_INT},
+	{"ClientIPAddress", &KEY_ClientIPAddress, offsetof(CThostFtdcReqUserLoginField, ClientIPAddress), sizeof(CThostFtdcReqUserLoginField::ClientIPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc QryMulticastInstrumentFields[] = {
+	{"TopicID", &KEY_TopicID, offsetof(CThostFtdcQryMulticastInstrumentField, TopicID), sizeof(CThostFtdcQryMulticastInstrumentField::TopicID), FIELD_INT},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryMulticastInstrumentField, reserve1), sizeof(CThostFtdcQryMulticastInstrumentField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryMulticastInstrumentField, InstrumentID), sizeof(CThostFtdcQryMulticastInstrumentField::InstrumentID), FIELD_ASCII},
+};
+
+static const char *CALLBACK_NAMES[CALLBACK_COUNT] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspQryMulticastInstrument",
+	"onRspError",
+	"onRspSubMarketData",
+	"onRspUnSubMarketData",
+	"onRspSubForQuoteRsp",
+	"onRspUnSubForQuoteRsp",
+	"onRtnDepthMarketData",
+	"onRtnForQuoteRsp",
+};
+
+static const CallbackDesc CALLBACKS[CALLBACK_COUNT] = {
+	{0, nullptr, 0, 0},
+	{CALLBACK_ARG_ID, nullptr, 0, 0},
+	{CALLBACK_ARG_ID, nullptr, 0, 0},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspUserLoginFields, std::size(RspUserLoginFields), sizeof(CThostFtdcRspUserLoginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, UserLogoutFields, std::size(UserLogoutFields), sizeof(CThostFtdcUserLogoutField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, MulticastInstrumentFields, std::size(MulticastInstrumentFields), sizeof(CThostFtdcMulticastInstrumentField)},
+	{CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, nullptr, 0, 0},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA, DepthMarketDataFields, std::size(DepthMarketDataFields), sizeof(CThostFtdcDepthMarketDataField)},
+	{CALLBACK_ARG_DATA, ForQuoteRspFields, std::size(ForQuoteRspFields), sizeof(CThostFtdcForQuoteRspField)},
+};
+
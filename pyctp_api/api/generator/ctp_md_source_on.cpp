@@ -1,128 +1,8 @@
-void onFrontConnected() override
+void onRtnDepthMarketData(const object &data) override
 {
 	try
 	{
-		PYBIND11_OVERLOAD(void, MdApi, onFrontConnected);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onFrontDisconnected(int reqid) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onFrontDisconnected, reqid);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onHeartBeatWarning(int reqid) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onHeartBeatWarning, reqid);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspUserLogin(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspUserLogin, data, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspUserLogout(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspUserLogout, data, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspQryMulticastInstrument(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspQryMulticastInstrument, data, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspError(const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspError, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspSubMarketData(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspSubMarketData, data, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspUnSubMarketData(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspUnSubMarketData, data, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspSubForQuoteRsp, data, error, reqid, last);
-	}
-	catch (const error_already_set &e)
-	{
-		cout << e.what() << endl;
-	}
-};
-
-void onRspUnSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) override
-{
-	try
-	{
-		PYBIND11_OVERLOAD(void, MdApi, onRspUnSubForQuoteRsp, data, error, reqid, last);
+		PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketData, data);
 	}
 	catch (const error_already_set &e)
 	{
@@ -130,11 +10,11 @@ void onRspUnSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool
 	}
 };
 
-void onRtnDepthMarketData(const dict &data) override
+void onRtnDepthMarketDataBatch(const list &data) override
 {
 	try
 	{
-		PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketData, data);
+		PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketDataBatch, data);
 	}
 	catch (const error_already_set &e)
 	{
@@ -142,11 +22,11 @@ void onRtnDepthMarketData(const dict &data) override
 	}
 };
 
-void onRtnForQuoteRsp(const dict &data) override
+void onQueueWatermark(int size) override
 {
 	try
 	{
-		PYBIND11_OVERLOAD(void, MdApi, onRtnForQuoteRsp, data);
+		PYBIND11_OVERLOAD(void, MdApi, onQueueWatermark, size);
 	}
 	catch (const error_already_set &e)
 	{
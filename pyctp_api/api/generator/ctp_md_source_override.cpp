@@ -0,0 +1,17 @@
+void MdApi::checkOverrides()
+{
+	this->overrides[ONFRONTCONNECTED] = bool(get_overload(this, "onFrontConnected"));
+	this->overrides[ONFRONTDISCONNECTED] = bool(get_overload(this, "onFrontDisconnected"));
+	this->overrides[ONHEARTBEATWARNING] = bool(get_overload(this, "onHeartBeatWarning"));
+	this->overrides[ONRSPUSERLOGIN] = bool(get_overload(this, "onRspUserLogin"));
+	this->overrides[ONRSPUSERLOGOUT] = bool(get_overload(this, "onRspUserLogout"));
+	this->overrides[ONRSPQRYMULTICASTINSTRUMENT] = bool(get_overload(this, "onRspQryMulticastInstrument"));
+	this->overrides[ONRSPERROR] = bool(get_overload(this, "onRspError"));
+	this->overrides[ONRSPSUBMARKETDATA] = bool(get_overload(this, "onRspSubMarketData"));
+	this->overrides[ONRSPUNSUBMARKETDATA] = bool(get_overload(this, "onRspUnSubMarketData"));
+	this->overrides[ONRSPSUBFORQUOTERSP] = bool(get_overload(this, "onRspSubForQuoteRsp"));
+	this->overrides[ONRSPUNSUBFORQUOTERSP] = bool(get_overload(this, "onRspUnSubForQuoteRsp"));
+	this->overrides[ONRTNDEPTHMARKETDATA] = bool(get_overload(this, "onRtnDepthMarketData")) || bool(get_overload(this, "onRtnDepthMarketDataBatch"));
+	this->overrides[ONRTNFORQUOTERSP] = bool(get_overload(this, "onRtnForQuoteRsp"));
+};
+
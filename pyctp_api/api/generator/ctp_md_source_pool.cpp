@@ -0,0 +1,13 @@
+dict MdApi::getPoolStats()
+{
+	dict d;
+	this->pool_RspUserLogin.report(d, "RspUserLogin");
+	this->pool_RspInfo.report(d, "RspInfo");
+	this->pool_UserLogout.report(d, "UserLogout");
+	this->pool_MulticastInstrument.report(d, "MulticastInstrument");
+	this->pool_SpecificInstrument.report(d, "SpecificInstrument");
+	this->pool_DepthMarketData.report(d, "DepthMarketData");
+	this->pool_ForQuoteRsp.report(d, "ForQuoteRsp");
+	return d;
+};
+
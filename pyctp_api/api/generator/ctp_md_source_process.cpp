@@ -1,283 +1,51 @@
-void MdApi::processFrontConnected(Task *task)
+object MdApi::convertRtnDepthMarketData(Task *task)
 {
-	gil_scoped_acquire acquire;
-	this->onFrontConnected();
-};
-
-void MdApi::processFrontDisconnected(Task *task)
-{
-	gil_scoped_acquire acquire;
-	this->onFrontDisconnected(task->task_id);
-};
-
-void MdApi::processHeartBeatWarning(Task *task)
-{
-	gil_scoped_acquire acquire;
-	this->onHeartBeatWarning(task->task_id);
-};
-
-void MdApi::processRspUserLogin(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcRspUserLoginField *task_data = (CThostFtdcRspUserLoginField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["LoginTime"] = toUtf(task_data->LoginTime);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["SystemName"] = toUtf(task_data->SystemName);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["MaxOrderRef"] = toUtf(task_data->MaxOrderRef);
-		data["SHFETime"] = toUtf(task_data->SHFETime);
-		data["DCETime"] = toUtf(task_data->DCETime);
-		data["CZCETime"] = toUtf(task_data->CZCETime);
-		data["FFEXTime"] = toUtf(task_data->FFEXTime);
-		data["INETime"] = toUtf(task_data->INETime);
-		data["SysVersion"] = toUtf(task_data->SysVersion);
-		data["GFEXTime"] = toUtf(task_data->GFEXTime);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
+	if (this->data_mode == DATA_MODE_RAW)
 	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		object data = none();
+		if (task->task_data)
+		{
+			CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
+			data = bytes((const char*)task_data, sizeof(CThostFtdcDepthMarketDataField));
+			this->pool_DepthMarketData.free(task_data);
+		}
+		return data;
 	}
-	this->onRspUserLogin(data, error, task->task_id, task->task_last);
-};
 
-void MdApi::processRspUserLogout(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
+	if (this->data_mode == DATA_MODE_OBJECT)
 	{
-		CThostFtdcUserLogoutField *task_data = (CThostFtdcUserLogoutField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
+		object data = none();
+		if (task->task_data)
+		{
+			CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
+			data = cast(*task_data);
+			this->pool_DepthMarketData.free(task_data);
+		}
+		return data;
 	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspUserLogout(data, error, task->task_id, task->task_last);
-};
 
-void MdApi::processRspQryMulticastInstrument(Task *task)
-{
-	gil_scoped_acquire acquire;
 	dict data;
 	if (task->task_data)
 	{
-		CThostFtdcMulticastInstrumentField *task_data = (CThostFtdcMulticastInstrumentField*)task->task_data;
-		data["TopicID"] = task_data->TopicID;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentNo"] = task_data->InstrumentNo;
-		data["CodePrice"] = task_data->CodePrice;
-		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspQryMulticastInstrument(data, error, task->task_id, task->task_last);
-};
-
-void MdApi::processRspError(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspError(error, task->task_id, task->task_last);
-};
-
-void MdApi::processRspSubMarketData(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspSubMarketData(data, error, task->task_id, task->task_last);
-};
-
-void MdApi::processRspUnSubMarketData(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspUnSubMarketData(data, error, task->task_id, task->task_last);
-};
-
-void MdApi::processRspSubForQuoteRsp(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspSubForQuoteRsp(data, error, task->task_id, task->task_last);
-};
-
-void MdApi::processRspUnSubForQuoteRsp(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
+		if (!this->tick_fields.empty())
+		{
+			data = newDict(this->tick_fields.size());
+			for (const FieldDesc *field : this->tick_fields)
+				setField(data, *field, task_data);
+		}
+		else
+		{
+			data = structToDict(DepthMarketDataFields, task_data);
+		}
+		this->pool_DepthMarketData.free(task_data);
 	}
-	this->onRspUnSubForQuoteRsp(data, error, task->task_id, task->task_last);
+	return data;
 };
 
 void MdApi::processRtnDepthMarketData(Task *task)
 {
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["LastPrice"] = task_data->LastPrice;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["PreClosePrice"] = task_data->PreClosePrice;
-		data["PreOpenInterest"] = task_data->PreOpenInterest;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["HighestPrice"] = task_data->HighestPrice;
-		data["LowestPrice"] = task_data->LowestPrice;
-		data["Volume"] = task_data->Volume;
-		data["Turnover"] = task_data->Turnover;
-		data["OpenInterest"] = task_data->OpenInterest;
-		data["ClosePrice"] = task_data->ClosePrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["UpperLimitPrice"] = task_data->UpperLimitPrice;
-		data["LowerLimitPrice"] = task_data->LowerLimitPrice;
-		data["PreDelta"] = task_data->PreDelta;
-		data["CurrDelta"] = task_data->CurrDelta;
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["UpdateMillisec"] = task_data->UpdateMillisec;
-		data["BidPrice1"] = task_data->BidPrice1;
-		data["BidVolume1"] = task_data->BidVolume1;
-		data["AskPrice1"] = task_data->AskPrice1;
-		data["AskVolume1"] = task_data->AskVolume1;
-		data["BidPrice2"] = task_data->BidPrice2;
-		data["BidVolume2"] = task_data->BidVolume2;
-		data["AskPrice2"] = task_data->AskPrice2;
-		data["AskVolume2"] = task_data->AskVolume2;
-		data["BidPrice3"] = task_data->BidPrice3;
-		data["BidVolume3"] = task_data->BidVolume3;
-		data["AskPrice3"] = task_data->AskPrice3;
-		data["AskVolume3"] = task_data->AskVolume3;
-		data["BidPrice4"] = task_data->BidPrice4;
-		data["BidVolume4"] = task_data->BidVolume4;
-		data["AskPrice4"] = task_data->AskPrice4;
-		data["AskVolume4"] = task_data->AskVolume4;
-		data["BidPrice5"] = task_data->BidPrice5;
-		data["BidVolume5"] = task_data->BidVolume5;
-		data["AskPrice5"] = task_data->AskPrice5;
-		data["AskVolume5"] = task_data->AskVolume5;
-		data["AveragePrice"] = task_data->AveragePrice;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["BandingUpperPrice"] = task_data->BandingUpperPrice;
-		data["BandingLowerPrice"] = task_data->BandingLowerPrice;
-		delete task_data;
-	}
+	object data = this->convertRtnDepthMarketData(task);
 	this->onRtnDepthMarketData(data);
 };
 
-void MdApi::processRtnForQuoteRsp(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcForQuoteRspField *task_data = (CThostFtdcForQuoteRspField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ForQuoteTime"] = toUtf(task_data->ForQuoteTime);
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	this->onRtnForQuoteRsp(data);
-};
-
@@ -0,0 +1,51 @@
+class_<CThostFtdcDepthMarketDataField>(m, "DepthMarketData", module_local())
+	.def_property_readonly("TradingDay", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.TradingDay); })
+	.def_property_readonly("reserve1", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.reserve1); })
+	.def_property_readonly("ExchangeID", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.ExchangeID); })
+	.def_property_readonly("reserve2", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.reserve2); })
+	.def_readonly("LastPrice", &CThostFtdcDepthMarketDataField::LastPrice)
+	.def_readonly("PreSettlementPrice", &CThostFtdcDepthMarketDataField::PreSettlementPrice)
+	.def_readonly("PreClosePrice", &CThostFtdcDepthMarketDataField::PreClosePrice)
+	.def_readonly("PreOpenInterest", &CThostFtdcDepthMarketDataField::PreOpenInterest)
+	.def_readonly("OpenPrice", &CThostFtdcDepthMarketDataField::OpenPrice)
+	.def_readonly("HighestPrice", &CThostFtdcDepthMarketDataField::HighestPrice)
+	.def_readonly("LowestPrice", &CThostFtdcDepthMarketDataField::LowestPrice)
+	.def_readonly("Volume", &CThostFtdcDepthMarketDataField::Volume)
+	.def_readonly("Turnover", &CThostFtdcDepthMarketDataField::Turnover)
+	.def_readonly("OpenInterest", &CThostFtdcDepthMarketDataField::OpenInterest)
+	.def_readonly("ClosePrice", &CThostFtdcDepthMarketDataField::ClosePrice)
+	.def_readonly("SettlementPrice", &CThostFtdcDepthMarketDataField::SettlementPrice)
+	.def_readonly("UpperLimitPrice", &CThostFtdcDepthMarketDataField::UpperLimitPrice)
+	.def_readonly("LowerLimitPrice", &CThostFtdcDepthMarketDataField::LowerLimitPrice)
+	.def_readonly("PreDelta", &CThostFtdcDepthMarketDataField::PreDelta)
+	.def_readonly("CurrDelta", &CThostFtdcDepthMarketDataField::CurrDelta)
+	.def_property_readonly("UpdateTime", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.UpdateTime); })
+	.def_readonly("UpdateMillisec", &CThostFtdcDepthMarketDataField::UpdateMillisec)
+	.def_readonly("BidPrice1", &CThostFtdcDepthMarketDataField::BidPrice1)
+	.def_readonly("BidVolume1", &CThostFtdcDepthMarketDataField::BidVolume1)
+	.def_readonly("AskPrice1", &CThostFtdcDepthMarketDataField::AskPrice1)
+	.def_readonly("AskVolume1", &CThostFtdcDepthMarketDataField::AskVolume1)
+	.def_readonly("BidPrice2", &CThostFtdcDepthMarketDataField::BidPrice2)
+	.def_readonly("BidVolume2", &CThostFtdcDepthMarketDataField::BidVolume2)
+	.def_readonly("AskPrice2", &CThostFtdcDepthMarketDataField::AskPrice2)
+	.def_readonly("AskVolume2", &CThostFtdcDepthMarketDataField::AskVolume2)
+	.def_readonly("BidPrice3", &CThostFtdcDepthMarketDataField::BidPrice3)
+	.def_readonly("BidVolume3", &CThostFtdcDepthMarketDataField::BidVolume3)
+	.def_readonly("AskPrice3", &CThostFtdcDepthMarketDataField::AskPrice3)
+	.def_readonly("AskVolume3", &CThostFtdcDepthMarketDataField::AskVolume3)
+	.def_readonly("BidPrice4", &CThostFtdcDepthMarketDataField::BidPrice4)
+	.def_readonly("BidVolume4", &CThostFtdcDepthMarketDataField::BidVolume4)
+	.def_readonly("AskPrice4", &CThostFtdcDepthMarketDataField::AskPrice4)
+	.def_readonly("AskVolume4", &CThostFtdcDepthMarketDataField::AskVolume4)
+	.def_readonly("BidPrice5", &CThostFtdcDepthMarketDataField::BidPrice5)
+	.def_readonly("BidVolume5", &CThostFtdcDepthMarketDataField::BidVolume5)
+	.def_readonly("AskPrice5", &CThostFtdcDepthMarketDataField::AskPrice5)
+	.def_readonly("AskVolume5", &CThostFtdcDepthMarketDataField::AskVolume5)
+	.def_readonly("AveragePrice", &CThostFtdcDepthMarketDataField::AveragePrice)
+	.def_property_readonly("ActionDay", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.ActionDay); })
+	.def_property_readonly("InstrumentID", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.InstrumentID); })
+	.def_property_readonly("ExchangeInstID", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.ExchangeInstID); })
+	.def_readonly("BandingUpperPrice", &CThostFtdcDepthMarketDataField::BandingUpperPrice)
+	.def_readonly("BandingLowerPrice", &CThostFtdcDepthMarketDataField::BandingLowerPrice)
+	;
+
@@ -1,211 +1,93 @@
 void MdApi::OnFrontConnected()
 {
-	Task task = Task();
-	task.task_name = ONFRONTCONNECTED;
-	this->task_queue.push(task);
+	this->pushTask(ONFRONTCONNECTED, nullptr, nullptr, 0, false);
 };
 
 void MdApi::OnFrontDisconnected(int nReason)
 {
-	Task task = Task();
-	task.task_name = ONFRONTDISCONNECTED;
-	task.task_id = nReason;
-	this->task_queue.push(task);
+	this->pushTask(ONFRONTDISCONNECTED, nullptr, nullptr, nReason, false);
 };
 
 void MdApi::OnHeartBeatWarning(int nTimeLapse)
 {
-	Task task = Task();
-	task.task_name = ONHEARTBEATWARNING;
-	task.task_id = nTimeLapse;
-	this->task_queue.push(task);
+	this->pushTask(ONHEARTBEATWARNING, nullptr, nullptr, nTimeLapse, false);
 };
 
 void MdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERLOGIN;
-	if (pRspUserLogin)
-	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
-		*task_data = *pRspUserLogin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERLOGIN, pRspUserLogin, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERLOGOUT;
-	if (pUserLogout)
-	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
-		*task_data = *pUserLogout;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERLOGOUT, pUserLogout, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspQryMulticastInstrument(CThostFtdcMulticastInstrumentField *pMulticastInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYMULTICASTINSTRUMENT;
-	if (pMulticastInstrument)
-	{
-		CThostFtdcMulticastInstrumentField *task_data = new CThostFtdcMulticastInstrumentField();
-		*task_data = *pMulticastInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYMULTICASTINSTRUMENT, pMulticastInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPERROR;
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPERROR, nullptr, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPSUBMARKETDATA;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPSUBMARKETDATA, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspUnSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUNSUBMARKETDATA;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUNSUBMARKETDATA, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPSUBFORQUOTERSP;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPSUBFORQUOTERSP, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspUnSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUNSUBFORQUOTERSP;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUNSUBFORQUOTERSP, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData) 
 {
+	if (this->tick_bus.active() && pDepthMarketData)
+		this->tick_bus.publish(*pDepthMarketData);
+
+	if (this->tick_recorder.active() && pDepthMarketData)
+		this->tick_recorder.publish(*pDepthMarketData);
+
+	this->native_hook.callSpi(ONRTNDEPTHMARKETDATA, pDepthMarketData, nullptr, 0, false);
+
+	if (!this->overrides[ONRTNDEPTHMARKETDATA] && !this->native_hook.dispatches(ONRTNDEPTHMARKETDATA))
+		return;
+
+	if ((this->conflate || this->task_queue.overloaded()) && pDepthMarketData)
+	{
+		if (this->conflate_table.update(pDepthMarketData->InstrumentID, *pDepthMarketData, this->pool_DepthMarketData))
+		{
+			Task task = Task();
+			task.task_name = TASK_CONFLATED;
+			this->task_queue.push(task);
+		}
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRTNDEPTHMARKETDATA;
 	if (pDepthMarketData)
 	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
-		*task_data = *pDepthMarketData;
-		task.task_data = task_data;
+		task.task_data = this->pool_DepthMarketData.alloc(*pDepthMarketData);
 	}
 	this->task_queue.push(task);
 };
 
 void MdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp) 
 {
-	Task task = Task();
-	task.task_name = ONRTNFORQUOTERSP;
-	if (pForQuoteRsp)
-	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
-		*task_data = *pForQuoteRsp;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFORQUOTERSP, pForQuoteRsp, nullptr, 0, false);
 };
 
@@ -4,99 +4,99 @@ CThostFtdcDisseminationField = {
 }
 
 CThostFtdcReqUserLoginField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "Password": "string",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
-    "MacAddress": "string",
+    "MacAddress": "ascii",
     "OneTimePassword": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "LoginRemark": "string",
     "ClientIPPort": "int",
-    "ClientIPAddress": "string",
+    "ClientIPAddress": "ascii",
 }
 
 CThostFtdcRspUserLoginField = {
-    "TradingDay": "string",
-    "LoginTime": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "LoginTime": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "SystemName": "string",
     "FrontID": "int",
     "SessionID": "int",
-    "MaxOrderRef": "string",
-    "SHFETime": "string",
-    "DCETime": "string",
-    "CZCETime": "string",
-    "FFEXTime": "string",
-    "INETime": "string",
+    "MaxOrderRef": "ascii",
+    "SHFETime": "ascii",
+    "DCETime": "ascii",
+    "CZCETime": "ascii",
+    "FFEXTime": "ascii",
+    "INETime": "ascii",
     "SysVersion": "string",
-    "GFEXTime": "string",
+    "GFEXTime": "ascii",
 }
 
 CThostFtdcUserLogoutField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcForceUserLogoutField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcReqAuthenticateField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserProductInfo": "string",
     "AuthCode": "string",
     "AppID": "string",
 }
 
 CThostFtdcRspAuthenticateField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserProductInfo": "string",
     "AppID": "string",
     "AppType": "char",
 }
 
 CThostFtdcAuthenticationInfoField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserProductInfo": "string",
     "AuthInfo": "string",
     "IsResult": "int",
     "AppID": "string",
     "AppType": "char",
-    "reserve1": "string",
-    "ClientIPAddress": "string",
+    "reserve1": "ascii",
+    "ClientIPAddress": "ascii",
 }
 
 CThostFtdcRspUserLogin2Field = {
-    "TradingDay": "string",
-    "LoginTime": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "LoginTime": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "SystemName": "string",
     "FrontID": "int",
     "SessionID": "int",
-    "MaxOrderRef": "string",
-    "SHFETime": "string",
-    "DCETime": "string",
-    "CZCETime": "string",
-    "FFEXTime": "string",
-    "INETime": "string",
+    "MaxOrderRef": "ascii",
+    "SHFETime": "ascii",
+    "DCETime": "ascii",
+    "CZCETime": "ascii",
+    "FFEXTime": "ascii",
+    "INETime": "ascii",
     "RandomString": "string",
 }
 
 CThostFtdcTransferHeaderField = {
     "Version": "string",
     "TradeCode": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "TradeSerial": "string",
     "FutureID": "string",
     "BankID": "string",
@@ -109,7 +109,7 @@ CThostFtdcTransferHeaderField = {
 }
 
 CThostFtdcTransferBankToFutureReqField = {
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
     "FuturePwdFlag": "char",
     "FutureAccPwd": "string",
     "TradeAmt": "double",
@@ -120,14 +120,14 @@ CThostFtdcTransferBankToFutureReqField = {
 CThostFtdcTransferBankToFutureRspField = {
     "RetCode": "string",
     "RetInfo": "string",
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
     "TradeAmt": "double",
     "CustFee": "double",
     "CurrencyCode": "string",
 }
 
 CThostFtdcTransferFutureToBankReqField = {
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
     "FuturePwdFlag": "char",
     "FutureAccPwd": "string",
     "TradeAmt": "double",
@@ -138,14 +138,14 @@ CThostFtdcTransferFutureToBankReqField = {
 CThostFtdcTransferFutureToBankRspField = {
     "RetCode": "string",
     "RetInfo": "string",
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
     "TradeAmt": "double",
     "CustFee": "double",
     "CurrencyCode": "string",
 }
 
 CThostFtdcTransferQryBankReqField = {
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
     "FuturePwdFlag": "char",
     "FutureAccPwd": "string",
     "CurrencyCode": "string",
@@ -154,7 +154,7 @@ CThostFtdcTransferQryBankReqField = {
 CThostFtdcTransferQryBankRspField = {
     "RetCode": "string",
     "RetInfo": "string",
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
     "TradeAmt": "double",
     "UseAmt": "double",
     "FetchAmt": "double",
@@ -162,12 +162,12 @@ CThostFtdcTransferQryBankRspField = {
 }
 
 CThostFtdcTransferQryDetailReqField = {
-    "FutureAccount": "string",
+    "FutureAccount": "ascii",
 }
 
 CThostFtdcTransferQryDetailRspField = {
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "TradeCode": "string",
     "FutureSerial": "int",
     "FutureID": "string",
@@ -188,15 +188,15 @@ CThostFtdcRspInfoField = {
 }
 
 CThostFtdcExchangeField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "ExchangeName": "string",
     "ExchangeProperty": "char",
 }
 
 CThostFtdcProductField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "ProductName": "string",
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "ProductClass": "char",
     "VolumeMultiple": "int",
     "PriceTick": "double",
@@ -207,22 +207,22 @@ CThostFtdcProductField = {
     "PositionType": "char",
     "PositionDateType": "char",
     "CloseDealType": "char",
-    "TradeCurrencyID": "string",
+    "TradeCurrencyID": "ascii",
     "MortgageFundUseRange": "char",
-    "reserve2": "string",
+    "reserve2": "ascii",
     "UnderlyingMultiple": "double",
-    "ProductID": "string",
-    "ExchangeProductID": "string",
+    "ProductID": "ascii",
+    "ExchangeProductID": "ascii",
     "OpenLimitControlLevel": "char",
     "OrderFreqControlLevel": "char",
 }
 
 CThostFtdcInstrumentField = {
-    "reserve1": "string",
-    "ExchangeID": "string",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
     "InstrumentName": "string",
-    "reserve2": "string",
-    "reserve3": "string",
+    "reserve2": "ascii",
+    "reserve3": "ascii",
     "ProductClass": "char",
     "DeliveryYear": "int",
     "DeliveryMonth": "int",
@@ -232,11 +232,11 @@ CThostFtdcInstrumentField = {
     "MinLimitOrderVolume": "int",
     "VolumeMultiple": "int",
     "PriceTick": "double",
-    "CreateDate": "string",
-    "OpenDate": "string",
-    "ExpireDate": "string",
-    "StartDelivDate": "string",
-    "EndDelivDate": "string",
+    "CreateDate": "ascii",
+    "OpenDate": "ascii",
+    "ExpireDate": "ascii",
+    "StartDelivDate": "ascii",
+    "EndDelivDate": "ascii",
     "InstLifePhase": "char",
     "IsTrading": "int",
     "PositionType": "char",
@@ -244,94 +244,94 @@ CThostFtdcInstrumentField = {
     "LongMarginRatio": "double",
     "ShortMarginRatio": "double",
     "MaxMarginSideAlgorithm": "char",
-    "reserve4": "string",
+    "reserve4": "ascii",
     "StrikePrice": "double",
     "OptionsType": "char",
     "UnderlyingMultiple": "double",
     "CombinationType": "char",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "ProductID": "string",
-    "UnderlyingInstrID": "string",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "ProductID": "ascii",
+    "UnderlyingInstrID": "ascii",
 }
 
 CThostFtdcBrokerField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerAbbr": "string",
     "BrokerName": "string",
     "IsActive": "int",
 }
 
 CThostFtdcTraderField = {
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ParticipantID": "string",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ParticipantID": "ascii",
     "Password": "string",
     "InstallCount": "int",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "OrderCancelAlg": "char",
     "TradeInstallCount": "int",
     "MDInstallCount": "int",
 }
 
 CThostFtdcInvestorField = {
-    "InvestorID": "string",
-    "BrokerID": "string",
-    "InvestorGroupID": "string",
+    "InvestorID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorGroupID": "ascii",
     "InvestorName": "string",
     "IdentifiedCardType": "char",
     "IdentifiedCardNo": "string",
     "IsActive": "int",
     "Telephone": "string",
     "Address": "string",
-    "OpenDate": "string",
+    "OpenDate": "ascii",
     "Mobile": "string",
-    "CommModelID": "string",
-    "MarginModelID": "string",
+    "CommModelID": "ascii",
+    "MarginModelID": "ascii",
     "IsOrderFreq": "char",
     "IsOpenVolLimit": "char",
 }
 
 CThostFtdcTradingCodeField = {
-    "InvestorID": "string",
-    "BrokerID": "string",
-    "ExchangeID": "string",
-    "ClientID": "string",
+    "InvestorID": "ascii",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
+    "ClientID": "ascii",
     "IsActive": "int",
     "ClientIDType": "char",
     "BranchID": "string",
     "BizType": "char",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcPartBrokerField = {
-    "BrokerID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
     "IsActive": "int",
 }
 
 CThostFtdcSuperUserField = {
-    "UserID": "string",
+    "UserID": "ascii",
     "UserName": "string",
     "Password": "string",
     "IsActive": "int",
 }
 
 CThostFtdcSuperUserFunctionField = {
-    "UserID": "string",
+    "UserID": "ascii",
     "FunctionCode": "char",
 }
 
 CThostFtdcInvestorGroupField = {
-    "BrokerID": "string",
-    "InvestorGroupID": "string",
+    "BrokerID": "ascii",
+    "InvestorGroupID": "ascii",
     "InvestorGroupName": "string",
 }
 
 CThostFtdcTradingAccountField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "PreMortgage": "double",
     "PreCredit": "double",
     "PreDeposit": "double",
@@ -353,7 +353,7 @@ CThostFtdcTradingAccountField = {
     "Available": "double",
     "WithdrawQuota": "double",
     "Reserve": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "Credit": "double",
     "Mortgage": "double",
@@ -361,7 +361,7 @@ CThostFtdcTradingAccountField = {
     "DeliveryMargin": "double",
     "ExchangeDeliveryMargin": "double",
     "ReserveBalance": "double",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "PreFundMortgageIn": "double",
     "PreFundMortgageOut": "double",
     "FundMortgageIn": "double",
@@ -382,9 +382,9 @@ CThostFtdcTradingAccountField = {
 }
 
 CThostFtdcInvestorPositionField = {
-    "reserve1": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "reserve1": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "PosiDirection": "char",
     "HedgeFlag": "char",
     "PositionDate": "char",
@@ -410,7 +410,7 @@ CThostFtdcInvestorPositionField = {
     "PositionProfit": "double",
     "PreSettlementPrice": "double",
     "SettlementPrice": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "OpenCost": "double",
     "ExchangeMargin": "double",
@@ -425,53 +425,53 @@ CThostFtdcInvestorPositionField = {
     "StrikeFrozen": "int",
     "StrikeFrozenAmount": "double",
     "AbandonFrozen": "int",
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "YdStrikeFrozen": "int",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
     "PositionCostOffset": "double",
     "TasPosition": "int",
     "TasPositionCost": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInstrumentMarginRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
     "ShortMarginRatioByMoney": "double",
     "ShortMarginRatioByVolume": "double",
     "IsRelative": "int",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInstrumentCommissionRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
     "CloseRatioByVolume": "double",
     "CloseTodayRatioByMoney": "double",
     "CloseTodayRatioByVolume": "double",
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "BizType": "char",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcDepthMarketDataField = {
-    "TradingDay": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "reserve2": "string",
+    "TradingDay": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "reserve2": "ascii",
     "LastPrice": "double",
     "PreSettlementPrice": "double",
     "PreClosePrice": "double",
@@ -488,7 +488,7 @@ CThostFtdcDepthMarketDataField = {
     "LowerLimitPrice": "double",
     "PreDelta": "double",
     "CurrDelta": "double",
-    "UpdateTime": "string",
+    "UpdateTime": "ascii",
     "UpdateMillisec": "int",
     "BidPrice1": "double",
     "BidVolume1": "int",
@@ -511,25 +511,25 @@ CThostFtdcDepthMarketDataField = {
     "AskPrice5": "double",
     "AskVolume5": "int",
     "AveragePrice": "double",
-    "ActionDay": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
+    "ActionDay": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
     "BandingUpperPrice": "double",
     "BandingLowerPrice": "double",
 }
 
 CThostFtdcInstrumentTradingRightField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "TradingRight": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcBrokerUserField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserName": "string",
     "UserType": "char",
     "IsActive": "int",
@@ -538,84 +538,84 @@ CThostFtdcBrokerUserField = {
 }
 
 CThostFtdcBrokerUserPasswordField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "Password": "string",
-    "LastUpdateTime": "string",
-    "LastLoginTime": "string",
-    "ExpireDate": "string",
-    "WeakExpireDate": "string",
+    "LastUpdateTime": "ascii",
+    "LastLoginTime": "ascii",
+    "ExpireDate": "ascii",
+    "WeakExpireDate": "ascii",
 }
 
 CThostFtdcBrokerUserFunctionField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "BrokerFunctionCode": "char",
 }
 
 CThostFtdcTraderOfferField = {
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ParticipantID": "string",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ParticipantID": "ascii",
     "Password": "string",
     "InstallID": "int",
-    "OrderLocalID": "string",
+    "OrderLocalID": "ascii",
     "TraderConnectStatus": "char",
-    "ConnectRequestDate": "string",
-    "ConnectRequestTime": "string",
-    "LastReportDate": "string",
-    "LastReportTime": "string",
-    "ConnectDate": "string",
-    "ConnectTime": "string",
-    "StartDate": "string",
-    "StartTime": "string",
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "MaxTradeID": "string",
+    "ConnectRequestDate": "ascii",
+    "ConnectRequestTime": "ascii",
+    "LastReportDate": "ascii",
+    "LastReportTime": "ascii",
+    "ConnectDate": "ascii",
+    "ConnectTime": "ascii",
+    "StartDate": "ascii",
+    "StartTime": "ascii",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "MaxTradeID": "ascii",
     "MaxOrderMessageReference": "string",
     "OrderCancelAlg": "char",
 }
 
 CThostFtdcSettlementInfoField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "SequenceNo": "int",
     "Content": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcInstrumentMarginRateAdjustField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
     "ShortMarginRatioByMoney": "double",
     "ShortMarginRatioByVolume": "double",
     "IsRelative": "int",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeMarginRateField = {
-    "BrokerID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
     "ShortMarginRatioByMoney": "double",
     "ShortMarginRatioByVolume": "double",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeMarginRateAdjustField = {
-    "BrokerID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
@@ -629,31 +629,31 @@ CThostFtdcExchangeMarginRateAdjustField = {
     "NoLongMarginRatioByVolume": "double",
     "NoShortMarginRatioByMoney": "double",
     "NoShortMarginRatioByVolume": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeRateField = {
-    "BrokerID": "string",
-    "FromCurrencyID": "string",
+    "BrokerID": "ascii",
+    "FromCurrencyID": "ascii",
     "FromCurrencyUnit": "double",
-    "ToCurrencyID": "string",
+    "ToCurrencyID": "ascii",
     "ExchangeRate": "double",
 }
 
 CThostFtdcSettlementRefField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
 }
 
 CThostFtdcCurrentTimeField = {
-    "CurrDate": "string",
-    "CurrTime": "string",
+    "CurrDate": "ascii",
+    "CurrTime": "ascii",
     "CurrMillisec": "int",
-    "ActionDay": "string",
+    "ActionDay": "ascii",
 }
 
 CThostFtdcCommPhaseField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "CommPhaseNo": "int",
     "SystemID": "string",
 }
@@ -661,28 +661,28 @@ CThostFtdcCommPhaseField = {
 CThostFtdcLoginInfoField = {
     "FrontID": "int",
     "SessionID": "int",
-    "BrokerID": "string",
-    "UserID": "string",
-    "LoginDate": "string",
-    "LoginTime": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
+    "LoginDate": "ascii",
+    "LoginTime": "ascii",
+    "reserve1": "ascii",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
     "SystemName": "string",
     "PasswordDeprecated": "string",
-    "MaxOrderRef": "string",
-    "SHFETime": "string",
-    "DCETime": "string",
-    "CZCETime": "string",
-    "FFEXTime": "string",
-    "MacAddress": "string",
+    "MaxOrderRef": "ascii",
+    "SHFETime": "ascii",
+    "DCETime": "ascii",
+    "CZCETime": "ascii",
+    "FFEXTime": "ascii",
+    "MacAddress": "ascii",
     "OneTimePassword": "string",
-    "INETime": "string",
+    "INETime": "ascii",
     "IsQryControl": "int",
     "LoginRemark": "string",
     "Password": "string",
-    "IPAddress": "string",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcLogoutAllField = {
@@ -693,32 +693,32 @@ CThostFtdcLogoutAllField = {
 
 CThostFtdcFrontStatusField = {
     "FrontID": "int",
-    "LastReportDate": "string",
-    "LastReportTime": "string",
+    "LastReportDate": "ascii",
+    "LastReportTime": "ascii",
     "IsActive": "int",
 }
 
 CThostFtdcUserPasswordUpdateField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "OldPassword": "string",
     "NewPassword": "string",
 }
 
 CThostFtdcInputOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OrderRef": "ascii",
+    "UserID": "ascii",
     "OrderPriceType": "char",
     "Direction": "char",
-    "CombOffsetFlag": "string",
-    "CombHedgeFlag": "string",
+    "CombOffsetFlag": "ascii",
+    "CombHedgeFlag": "ascii",
     "LimitPrice": "double",
     "VolumeTotalOriginal": "int",
     "TimeCondition": "char",
-    "GTDDate": "string",
+    "GTDDate": "ascii",
     "VolumeCondition": "char",
     "MinVolume": "int",
     "ContingentCondition": "char",
@@ -729,33 +729,33 @@ CThostFtdcInputOrderField = {
     "RequestID": "int",
     "UserForceClose": "int",
     "IsSwapOrder": "int",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OrderRef": "ascii",
+    "UserID": "ascii",
     "OrderPriceType": "char",
     "Direction": "char",
-    "CombOffsetFlag": "string",
-    "CombHedgeFlag": "string",
+    "CombOffsetFlag": "ascii",
+    "CombHedgeFlag": "ascii",
     "LimitPrice": "double",
     "VolumeTotalOriginal": "int",
     "TimeCondition": "char",
-    "GTDDate": "string",
+    "GTDDate": "ascii",
     "VolumeCondition": "char",
     "MinVolume": "int",
     "ContingentCondition": "char",
@@ -764,51 +764,51 @@ CThostFtdcOrderField = {
     "IsAutoSuspend": "int",
     "BusinessUnit": "string",
     "RequestID": "int",
-    "OrderLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "OrderLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "OrderSysID": "string",
+    "OrderSysID": "ascii",
     "OrderSource": "char",
     "OrderStatus": "char",
     "OrderType": "char",
     "VolumeTraded": "int",
     "VolumeTotal": "int",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "ActiveTime": "string",
-    "SuspendTime": "string",
-    "UpdateTime": "string",
-    "CancelTime": "string",
-    "ActiveTraderID": "string",
-    "ClearingPartID": "string",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "ActiveTime": "ascii",
+    "SuspendTime": "ascii",
+    "UpdateTime": "ascii",
+    "CancelTime": "ascii",
+    "ActiveTraderID": "ascii",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "FrontID": "int",
     "SessionID": "int",
     "UserProductInfo": "string",
     "StatusMsg": "string",
     "UserForceClose": "int",
-    "ActiveUserID": "string",
+    "ActiveUserID": "ascii",
     "BrokerOrderSeq": "int",
-    "RelativeOrderSysID": "string",
+    "RelativeOrderSysID": "ascii",
     "ZCETotalTradedVolume": "int",
     "IsSwapOrder": "int",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
@@ -816,12 +816,12 @@ CThostFtdcOrderField = {
 CThostFtdcExchangeOrderField = {
     "OrderPriceType": "char",
     "Direction": "char",
-    "CombOffsetFlag": "string",
-    "CombHedgeFlag": "string",
+    "CombOffsetFlag": "ascii",
+    "CombHedgeFlag": "ascii",
     "LimitPrice": "double",
     "VolumeTotalOriginal": "int",
     "TimeCondition": "char",
-    "GTDDate": "string",
+    "GTDDate": "ascii",
     "VolumeCondition": "char",
     "MinVolume": "int",
     "ContingentCondition": "char",
@@ -830,251 +830,251 @@ CThostFtdcExchangeOrderField = {
     "IsAutoSuspend": "int",
     "BusinessUnit": "string",
     "RequestID": "int",
-    "OrderLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "TraderID": "string",
+    "OrderLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "OrderSysID": "string",
+    "OrderSysID": "ascii",
     "OrderSource": "char",
     "OrderStatus": "char",
     "OrderType": "char",
     "VolumeTraded": "int",
     "VolumeTotal": "int",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "ActiveTime": "string",
-    "SuspendTime": "string",
-    "UpdateTime": "string",
-    "CancelTime": "string",
-    "ActiveTraderID": "string",
-    "ClearingPartID": "string",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "ActiveTime": "ascii",
+    "SuspendTime": "ascii",
+    "UpdateTime": "ascii",
+    "CancelTime": "ascii",
+    "ActiveTraderID": "ascii",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "BranchID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcExchangeOrderInsertErrorField = {
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OrderLocalID": "string",
+    "OrderLocalID": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
 }
 
 CThostFtdcInputOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OrderActionRef": "int",
-    "OrderRef": "string",
+    "OrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "OrderSysID": "string",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
     "ActionFlag": "char",
     "LimitPrice": "double",
     "VolumeChange": "int",
-    "UserID": "string",
-    "reserve1": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OrderActionRef": "int",
-    "OrderRef": "string",
+    "OrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "OrderSysID": "string",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
     "ActionFlag": "char",
     "LimitPrice": "double",
     "VolumeChange": "int",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OrderLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OrderLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "StatusMsg": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcExchangeOrderActionField = {
-    "ExchangeID": "string",
-    "OrderSysID": "string",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
     "ActionFlag": "char",
     "LimitPrice": "double",
     "VolumeChange": "int",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OrderLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OrderLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "BranchID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "IPAddress": "string",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcExchangeOrderActionErrorField = {
-    "ExchangeID": "string",
-    "OrderSysID": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OrderLocalID": "string",
-    "ActionLocalID": "string",
+    "OrderLocalID": "ascii",
+    "ActionLocalID": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
 }
 
 CThostFtdcExchangeTradeField = {
-    "ExchangeID": "string",
-    "TradeID": "string",
+    "ExchangeID": "ascii",
+    "TradeID": "ascii",
     "Direction": "char",
-    "OrderSysID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OrderSysID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "TradingRole": "char",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "OffsetFlag": "char",
     "HedgeFlag": "char",
     "Price": "double",
     "Volume": "int",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "TradeType": "char",
     "PriceSource": "char",
-    "TraderID": "string",
-    "OrderLocalID": "string",
-    "ClearingPartID": "string",
+    "TraderID": "ascii",
+    "OrderLocalID": "ascii",
+    "ClearingPartID": "ascii",
     "BusinessUnit": "string",
     "SequenceNo": "int",
     "TradeSource": "char",
-    "ExchangeInstID": "string",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcTradeField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OrderRef": "string",
-    "UserID": "string",
-    "ExchangeID": "string",
-    "TradeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OrderRef": "ascii",
+    "UserID": "ascii",
+    "ExchangeID": "ascii",
+    "TradeID": "ascii",
     "Direction": "char",
-    "OrderSysID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OrderSysID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "TradingRole": "char",
-    "reserve2": "string",
+    "reserve2": "ascii",
     "OffsetFlag": "char",
     "HedgeFlag": "char",
     "Price": "double",
     "Volume": "int",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "TradeType": "char",
     "PriceSource": "char",
-    "TraderID": "string",
-    "OrderLocalID": "string",
-    "ClearingPartID": "string",
+    "TraderID": "ascii",
+    "OrderLocalID": "ascii",
+    "ClearingPartID": "ascii",
     "BusinessUnit": "string",
     "SequenceNo": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "BrokerOrderSeq": "int",
     "TradeSource": "char",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcUserSessionField = {
     "FrontID": "int",
     "SessionID": "int",
-    "BrokerID": "string",
-    "UserID": "string",
-    "LoginDate": "string",
-    "LoginTime": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
+    "LoginDate": "ascii",
+    "LoginTime": "ascii",
+    "reserve1": "ascii",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
-    "MacAddress": "string",
+    "MacAddress": "ascii",
     "LoginRemark": "string",
-    "IPAddress": "string",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryMaxOrderVolumeField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "Direction": "char",
     "OffsetFlag": "char",
     "HedgeFlag": "char",
     "MaxVolume": "int",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcSettlementInfoConfirmField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ConfirmDate": "string",
-    "ConfirmTime": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ConfirmDate": "ascii",
+    "ConfirmTime": "ascii",
     "SettlementID": "int",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcSyncDepositField = {
     "DepositSeqNo": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Deposit": "double",
     "IsForce": "int",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "IsFromSopt": "int",
     "TradingPassword": "string",
     "IsSecAgentTranfer": "int",
@@ -1082,53 +1082,53 @@ CThostFtdcSyncDepositField = {
 
 CThostFtdcSyncFundMortgageField = {
     "MortgageSeqNo": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "FromCurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "FromCurrencyID": "ascii",
     "MortgageAmount": "double",
-    "ToCurrencyID": "string",
+    "ToCurrencyID": "ascii",
 }
 
 CThostFtdcBrokerSyncField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcSyncingInvestorField = {
-    "InvestorID": "string",
-    "BrokerID": "string",
-    "InvestorGroupID": "string",
+    "InvestorID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorGroupID": "ascii",
     "InvestorName": "string",
     "IdentifiedCardType": "char",
     "IdentifiedCardNo": "string",
     "IsActive": "int",
     "Telephone": "string",
     "Address": "string",
-    "OpenDate": "string",
+    "OpenDate": "ascii",
     "Mobile": "string",
-    "CommModelID": "string",
-    "MarginModelID": "string",
+    "CommModelID": "ascii",
+    "MarginModelID": "ascii",
     "IsOrderFreq": "char",
     "IsOpenVolLimit": "char",
 }
 
 CThostFtdcSyncingTradingCodeField = {
-    "InvestorID": "string",
-    "BrokerID": "string",
-    "ExchangeID": "string",
-    "ClientID": "string",
+    "InvestorID": "ascii",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
+    "ClientID": "ascii",
     "IsActive": "int",
     "ClientIDType": "char",
 }
 
 CThostFtdcSyncingInvestorGroupField = {
-    "BrokerID": "string",
-    "InvestorGroupID": "string",
+    "BrokerID": "ascii",
+    "InvestorGroupID": "ascii",
     "InvestorGroupName": "string",
 }
 
 CThostFtdcSyncingTradingAccountField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "PreMortgage": "double",
     "PreCredit": "double",
     "PreDeposit": "double",
@@ -1150,7 +1150,7 @@ CThostFtdcSyncingTradingAccountField = {
     "Available": "double",
     "WithdrawQuota": "double",
     "Reserve": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "Credit": "double",
     "Mortgage": "double",
@@ -1158,7 +1158,7 @@ CThostFtdcSyncingTradingAccountField = {
     "DeliveryMargin": "double",
     "ExchangeDeliveryMargin": "double",
     "ReserveBalance": "double",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "PreFundMortgageIn": "double",
     "PreFundMortgageOut": "double",
     "FundMortgageIn": "double",
@@ -1178,9 +1178,9 @@ CThostFtdcSyncingTradingAccountField = {
 }
 
 CThostFtdcSyncingInvestorPositionField = {
-    "reserve1": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "reserve1": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "PosiDirection": "char",
     "HedgeFlag": "char",
     "PositionDate": "char",
@@ -1206,7 +1206,7 @@ CThostFtdcSyncingInvestorPositionField = {
     "PositionProfit": "double",
     "PreSettlementPrice": "double",
     "SettlementPrice": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "OpenCost": "double",
     "ExchangeMargin": "double",
@@ -1221,162 +1221,162 @@ CThostFtdcSyncingInvestorPositionField = {
     "StrikeFrozen": "int",
     "StrikeFrozenAmount": "double",
     "AbandonFrozen": "int",
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "YdStrikeFrozen": "int",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
     "PositionCostOffset": "double",
     "TasPosition": "int",
     "TasPositionCost": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcSyncingInstrumentMarginRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
     "ShortMarginRatioByMoney": "double",
     "ShortMarginRatioByVolume": "double",
     "IsRelative": "int",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcSyncingInstrumentCommissionRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
     "CloseRatioByVolume": "double",
     "CloseTodayRatioByMoney": "double",
     "CloseTodayRatioByVolume": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcSyncingInstrumentTradingRightField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "TradingRight": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "OrderSysID": "string",
-    "InsertTimeStart": "string",
-    "InsertTimeEnd": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
+    "InsertTimeStart": "ascii",
+    "InsertTimeEnd": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryTradeField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "TradeID": "string",
-    "TradeTimeStart": "string",
-    "TradeTimeEnd": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "TradeID": "ascii",
+    "TradeTimeStart": "ascii",
+    "TradeTimeEnd": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryInvestorPositionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryTradingAccountField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "CurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "CurrencyID": "ascii",
     "BizType": "char",
-    "AccountID": "string",
+    "AccountID": "ascii",
 }
 
 CThostFtdcQryInvestorField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcQryTradingCodeField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
-    "ClientID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
+    "ClientID": "ascii",
     "ClientIDType": "char",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcQryInvestorGroupField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcQryInstrumentMarginRateField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryInstrumentCommissionRateField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryInstrumentTradingRightField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryBrokerField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcQryTraderField = {
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "TraderID": "ascii",
 }
 
 CThostFtdcQrySuperUserFunctionField = {
-    "UserID": "string",
+    "UserID": "ascii",
 }
 
 CThostFtdcQryUserSessionField = {
     "FrontID": "int",
     "SessionID": "int",
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcQryPartBrokerField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "ParticipantID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "ParticipantID": "ascii",
 }
 
 CThostFtdcQryFrontStatusField = {
@@ -1384,143 +1384,143 @@ CThostFtdcQryFrontStatusField = {
 }
 
 CThostFtdcQryExchangeOrderField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ExchangeInstID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcQryOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcQryExchangeOrderActionField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
 }
 
 CThostFtdcQrySuperUserField = {
-    "UserID": "string",
+    "UserID": "ascii",
 }
 
 CThostFtdcQryExchangeField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcQryProductField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "ProductClass": "char",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
 }
 
 CThostFtdcQryInstrumentField = {
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "reserve2": "string",
-    "reserve3": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "ProductID": "string",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "reserve2": "ascii",
+    "reserve3": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "ProductID": "ascii",
 }
 
 CThostFtdcQryDepthMarketDataField = {
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
     "ProductClass": "char",
 }
 
 CThostFtdcQryBrokerUserField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcQryBrokerUserFunctionField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcQryTraderOfferField = {
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "TraderID": "ascii",
 }
 
 CThostFtdcQrySyncDepositField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "DepositSeqNo": "string",
 }
 
 CThostFtdcQrySettlementInfoField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "TradingDay": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "TradingDay": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcQryExchangeMarginRateField = {
-    "BrokerID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryExchangeMarginRateAdjustField = {
-    "BrokerID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryExchangeRateField = {
-    "BrokerID": "string",
-    "FromCurrencyID": "string",
-    "ToCurrencyID": "string",
+    "BrokerID": "ascii",
+    "FromCurrencyID": "ascii",
+    "ToCurrencyID": "ascii",
 }
 
 CThostFtdcQrySyncFundMortgageField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "MortgageSeqNo": "string",
 }
 
 CThostFtdcQryHisOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "OrderSysID": "string",
-    "InsertTimeStart": "string",
-    "InsertTimeEnd": "string",
-    "TradingDay": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
+    "InsertTimeStart": "ascii",
+    "InsertTimeEnd": "ascii",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcOptionInstrMiniMarginField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "MinMargin": "double",
     "ValueMethod": "char",
     "IsRelative": "int",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcOptionInstrMarginAdjustField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "SShortMarginRatioByMoney": "double",
     "SShortMarginRatioByVolume": "double",
     "HShortMarginRatioByMoney": "double",
@@ -1530,14 +1530,14 @@ CThostFtdcOptionInstrMarginAdjustField = {
     "IsRelative": "int",
     "MShortMarginRatioByMoney": "double",
     "MShortMarginRatioByVolume": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcOptionInstrCommRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
@@ -1546,60 +1546,60 @@ CThostFtdcOptionInstrCommRateField = {
     "CloseTodayRatioByVolume": "double",
     "StrikeRatioByMoney": "double",
     "StrikeRatioByVolume": "double",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcOptionInstrTradeCostField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
     "FixedMargin": "double",
     "MiniMargin": "double",
     "Royalty": "double",
     "ExchFixedMargin": "double",
     "ExchMiniMargin": "double",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryOptionInstrTradeCostField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
     "InputPrice": "double",
     "UnderlyingPrice": "double",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryOptionInstrCommRateField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcIndexPriceField = {
-    "BrokerID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
     "ClosePrice": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInputExecOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExecOrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExecOrderRef": "ascii",
+    "UserID": "ascii",
     "Volume": "int",
     "RequestID": "int",
     "BusinessUnit": "string",
@@ -1609,43 +1609,43 @@ CThostFtdcInputExecOrderField = {
     "PosiDirection": "char",
     "ReservePositionFlag": "char",
     "CloseFlag": "char",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcInputExecOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "ExecOrderActionRef": "int",
-    "ExecOrderRef": "string",
+    "ExecOrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "ExecOrderSysID": "string",
+    "ExchangeID": "ascii",
+    "ExecOrderSysID": "ascii",
     "ActionFlag": "char",
-    "UserID": "string",
-    "reserve1": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcExecOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExecOrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExecOrderRef": "ascii",
+    "UserID": "ascii",
     "Volume": "int",
     "RequestID": "int",
     "BusinessUnit": "string",
@@ -1655,83 +1655,83 @@ CThostFtdcExecOrderField = {
     "PosiDirection": "char",
     "ReservePositionFlag": "char",
     "CloseFlag": "char",
-    "ExecOrderLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "ExecOrderLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "ExecOrderSysID": "string",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "CancelTime": "string",
+    "ExecOrderSysID": "ascii",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "CancelTime": "ascii",
     "ExecResult": "char",
-    "ClearingPartID": "string",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "FrontID": "int",
     "SessionID": "int",
     "UserProductInfo": "string",
     "StatusMsg": "string",
-    "ActiveUserID": "string",
+    "ActiveUserID": "ascii",
     "BrokerExecOrderSeq": "int",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcExecOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "ExecOrderActionRef": "int",
-    "ExecOrderRef": "string",
+    "ExecOrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "ExecOrderSysID": "string",
+    "ExchangeID": "ascii",
+    "ExecOrderSysID": "ascii",
     "ActionFlag": "char",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "ExecOrderLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "ExecOrderLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "ActionType": "char",
     "StatusMsg": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryExecOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "ExecOrderSysID": "string",
-    "InsertTimeStart": "string",
-    "InsertTimeEnd": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "ExecOrderSysID": "ascii",
+    "InsertTimeStart": "ascii",
+    "InsertTimeEnd": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeExecOrderField = {
@@ -1744,84 +1744,84 @@ CThostFtdcExchangeExecOrderField = {
     "PosiDirection": "char",
     "ReservePositionFlag": "char",
     "CloseFlag": "char",
-    "ExecOrderLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "TraderID": "string",
+    "ExecOrderLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "ExecOrderSysID": "string",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "CancelTime": "string",
+    "ExecOrderSysID": "ascii",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "CancelTime": "ascii",
     "ExecResult": "char",
-    "ClearingPartID": "string",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "BranchID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryExchangeExecOrderField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ExchangeInstID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcQryExecOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcExchangeExecOrderActionField = {
-    "ExchangeID": "string",
-    "ExecOrderSysID": "string",
+    "ExchangeID": "ascii",
+    "ExecOrderSysID": "ascii",
     "ActionFlag": "char",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "ExecOrderLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "ExecOrderLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "ActionType": "char",
     "BranchID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "reserve2": "string",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "reserve2": "ascii",
     "Volume": "int",
-    "IPAddress": "string",
-    "ExchangeInstID": "string",
+    "IPAddress": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcQryExchangeExecOrderActionField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
 }
 
 CThostFtdcErrExecOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExecOrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExecOrderRef": "ascii",
+    "UserID": "ascii",
     "Volume": "int",
     "RequestID": "int",
     "BusinessUnit": "string",
@@ -1831,155 +1831,155 @@ CThostFtdcErrExecOrderField = {
     "PosiDirection": "char",
     "ReservePositionFlag": "char",
     "CloseFlag": "char",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryErrExecOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcErrExecOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "ExecOrderActionRef": "int",
-    "ExecOrderRef": "string",
+    "ExecOrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "ExecOrderSysID": "string",
+    "ExchangeID": "ascii",
+    "ExecOrderSysID": "ascii",
     "ActionFlag": "char",
-    "UserID": "string",
-    "reserve1": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryErrExecOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcOptionInstrTradingRightField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Direction": "char",
     "TradingRight": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryOptionInstrTradingRightField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "Direction": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInputForQuoteField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ForQuoteRef": "string",
-    "UserID": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ForQuoteRef": "ascii",
+    "UserID": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcForQuoteField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ForQuoteRef": "string",
-    "UserID": "string",
-    "ForQuoteLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ForQuoteRef": "ascii",
+    "UserID": "ascii",
+    "ForQuoteLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "InsertDate": "string",
-    "InsertTime": "string",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
     "ForQuoteStatus": "char",
     "FrontID": "int",
     "SessionID": "int",
     "StatusMsg": "string",
-    "ActiveUserID": "string",
+    "ActiveUserID": "ascii",
     "BrokerForQutoSeq": "int",
-    "InvestUnitID": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryForQuoteField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InsertTimeStart": "string",
-    "InsertTimeEnd": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InsertTimeStart": "ascii",
+    "InsertTimeEnd": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeForQuoteField = {
-    "ForQuoteLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "TraderID": "string",
+    "ForQuoteLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "InsertDate": "string",
-    "InsertTime": "string",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
     "ForQuoteStatus": "char",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryExchangeForQuoteField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ExchangeInstID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcInputQuoteField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "QuoteRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "QuoteRef": "ascii",
+    "UserID": "ascii",
     "AskPrice": "double",
     "BidPrice": "double",
     "AskVolume": "int",
@@ -1990,51 +1990,51 @@ CThostFtdcInputQuoteField = {
     "BidOffsetFlag": "char",
     "AskHedgeFlag": "char",
     "BidHedgeFlag": "char",
-    "AskOrderRef": "string",
-    "BidOrderRef": "string",
-    "ForQuoteSysID": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
-    "ReplaceSysID": "string",
+    "AskOrderRef": "ascii",
+    "BidOrderRef": "ascii",
+    "ForQuoteSysID": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
+    "ReplaceSysID": "ascii",
     "TimeCondition": "char",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcInputQuoteActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "QuoteActionRef": "int",
-    "QuoteRef": "string",
+    "QuoteRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "QuoteSysID": "string",
+    "ExchangeID": "ascii",
+    "QuoteSysID": "ascii",
     "ActionFlag": "char",
-    "UserID": "string",
-    "reserve1": "string",
-    "InvestUnitID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "InvestUnitID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcQuoteField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "QuoteRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "QuoteRef": "ascii",
+    "UserID": "ascii",
     "AskPrice": "double",
     "BidPrice": "double",
     "AskVolume": "int",
@@ -2045,94 +2045,94 @@ CThostFtdcQuoteField = {
     "BidOffsetFlag": "char",
     "AskHedgeFlag": "char",
     "BidHedgeFlag": "char",
-    "QuoteLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "QuoteLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "NotifySequence": "int",
     "OrderSubmitStatus": "char",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "QuoteSysID": "string",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "CancelTime": "string",
+    "QuoteSysID": "ascii",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "CancelTime": "ascii",
     "QuoteStatus": "char",
-    "ClearingPartID": "string",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
-    "AskOrderSysID": "string",
-    "BidOrderSysID": "string",
+    "AskOrderSysID": "ascii",
+    "BidOrderSysID": "ascii",
     "FrontID": "int",
     "SessionID": "int",
     "UserProductInfo": "string",
     "StatusMsg": "string",
-    "ActiveUserID": "string",
+    "ActiveUserID": "ascii",
     "BrokerQuoteSeq": "int",
-    "AskOrderRef": "string",
-    "BidOrderRef": "string",
-    "ForQuoteSysID": "string",
+    "AskOrderRef": "ascii",
+    "BidOrderRef": "ascii",
+    "ForQuoteSysID": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
-    "ReplaceSysID": "string",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
+    "ReplaceSysID": "ascii",
     "TimeCondition": "char",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcQuoteActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "QuoteActionRef": "int",
-    "QuoteRef": "string",
+    "QuoteRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "QuoteSysID": "string",
+    "ExchangeID": "ascii",
+    "QuoteSysID": "ascii",
     "ActionFlag": "char",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "QuoteLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "QuoteLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "StatusMsg": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcQryQuoteField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "QuoteSysID": "string",
-    "InsertTimeStart": "string",
-    "InsertTimeEnd": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "QuoteSysID": "ascii",
+    "InsertTimeStart": "ascii",
+    "InsertTimeEnd": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeQuoteField = {
@@ -2146,254 +2146,254 @@ CThostFtdcExchangeQuoteField = {
     "BidOffsetFlag": "char",
     "AskHedgeFlag": "char",
     "BidHedgeFlag": "char",
-    "QuoteLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "TraderID": "string",
+    "QuoteLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "NotifySequence": "int",
     "OrderSubmitStatus": "char",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "QuoteSysID": "string",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "CancelTime": "string",
+    "QuoteSysID": "ascii",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "CancelTime": "ascii",
     "QuoteStatus": "char",
-    "ClearingPartID": "string",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
-    "AskOrderSysID": "string",
-    "BidOrderSysID": "string",
-    "ForQuoteSysID": "string",
+    "AskOrderSysID": "ascii",
+    "BidOrderSysID": "ascii",
+    "ForQuoteSysID": "ascii",
     "BranchID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
     "TimeCondition": "char",
 }
 
 CThostFtdcQryExchangeQuoteField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ExchangeInstID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcQryQuoteActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcExchangeQuoteActionField = {
-    "ExchangeID": "string",
-    "QuoteSysID": "string",
+    "ExchangeID": "ascii",
+    "QuoteSysID": "ascii",
     "ActionFlag": "char",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "QuoteLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "QuoteLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "IPAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryExchangeQuoteActionField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
 }
 
 CThostFtdcOptionInstrDeltaField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Delta": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcForQuoteRspField = {
-    "TradingDay": "string",
-    "reserve1": "string",
-    "ForQuoteSysID": "string",
-    "ForQuoteTime": "string",
-    "ActionDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "TradingDay": "ascii",
+    "reserve1": "ascii",
+    "ForQuoteSysID": "ascii",
+    "ForQuoteTime": "ascii",
+    "ActionDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcStrikeOffsetField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Offset": "double",
     "OffsetType": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryStrikeOffsetField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInputBatchOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OrderActionRef": "int",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "UserID": "string",
-    "InvestUnitID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "IPAddress": "string",
+    "ExchangeID": "ascii",
+    "UserID": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcBatchOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OrderActionRef": "int",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "StatusMsg": "string",
-    "InvestUnitID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcExchangeBatchOrderActionField = {
-    "ExchangeID": "string",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "IPAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryBatchOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcCombInstrumentGuardField = {
-    "BrokerID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
     "GuarantRatio": "double",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryCombInstrumentGuardField = {
-    "BrokerID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInputCombActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "CombActionRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "CombActionRef": "ascii",
+    "UserID": "ascii",
     "Direction": "char",
     "Volume": "int",
     "CombDirection": "char",
     "HedgeFlag": "char",
-    "ExchangeID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InvestUnitID": "string",
+    "ExchangeID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InvestUnitID": "ascii",
     "FrontID": "int",
     "SessionID": "int",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcCombActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "CombActionRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "CombActionRef": "ascii",
+    "UserID": "ascii",
     "Direction": "char",
     "Volume": "int",
     "CombDirection": "char",
     "HedgeFlag": "char",
-    "ActionLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "ActionLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "ActionStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "SequenceNo": "int",
     "FrontID": "int",
     "SessionID": "int",
     "UserProductInfo": "string",
     "StatusMsg": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "ComTradeID": "string",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "ComTradeID": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryCombActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeCombActionField = {
@@ -2401,70 +2401,70 @@ CThostFtdcExchangeCombActionField = {
     "Volume": "int",
     "CombDirection": "char",
     "HedgeFlag": "char",
-    "ActionLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "TraderID": "string",
+    "ActionLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "ActionStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "SequenceNo": "int",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "ComTradeID": "string",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "ComTradeID": "ascii",
     "BranchID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryExchangeCombActionField = {
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ExchangeInstID": "string",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcProductExchRateField = {
-    "reserve1": "string",
-    "QuoteCurrencyID": "string",
+    "reserve1": "ascii",
+    "QuoteCurrencyID": "ascii",
     "ExchangeRate": "double",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
 }
 
 CThostFtdcQryProductExchRateField = {
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
 }
 
 CThostFtdcQryForQuoteParamField = {
-    "BrokerID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcForQuoteParamField = {
-    "BrokerID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
     "LastPrice": "double",
     "PriceInterval": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcMMOptionInstrCommRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
@@ -2473,230 +2473,230 @@ CThostFtdcMMOptionInstrCommRateField = {
     "CloseTodayRatioByVolume": "double",
     "StrikeRatioByMoney": "double",
     "StrikeRatioByVolume": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryMMOptionInstrCommRateField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcMMInstrumentCommissionRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
     "CloseRatioByVolume": "double",
     "CloseTodayRatioByMoney": "double",
     "CloseTodayRatioByVolume": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryMMInstrumentCommissionRateField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInstrumentOrderCommRateField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "OrderCommByVolume": "double",
     "OrderActionCommByVolume": "double",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
     "OrderCommByTrade": "double",
     "OrderActionCommByTrade": "double",
 }
 
 CThostFtdcQryInstrumentOrderCommRateField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcTradeParamField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "TradeParamID": "char",
     "TradeParamValue": "string",
     "Memo": "string",
 }
 
 CThostFtdcInstrumentMarginRateULField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
     "ShortMarginRatioByMoney": "double",
     "ShortMarginRatioByVolume": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcFutureLimitPosiParamField = {
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "SpecOpenVolume": "int",
     "ArbiOpenVolume": "int",
     "OpenVolume": "int",
-    "ProductID": "string",
+    "ProductID": "ascii",
 }
 
 CThostFtdcLoginForbiddenIPField = {
-    "reserve1": "string",
-    "IPAddress": "string",
+    "reserve1": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcIPListField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "IsWhite": "int",
-    "IPAddress": "string",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcInputOptionSelfCloseField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OptionSelfCloseRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OptionSelfCloseRef": "ascii",
+    "UserID": "ascii",
     "Volume": "int",
     "RequestID": "int",
     "BusinessUnit": "string",
     "HedgeFlag": "char",
     "OptSelfCloseFlag": "char",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcInputOptionSelfCloseActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OptionSelfCloseActionRef": "int",
-    "OptionSelfCloseRef": "string",
+    "OptionSelfCloseRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "OptionSelfCloseSysID": "string",
+    "ExchangeID": "ascii",
+    "OptionSelfCloseSysID": "ascii",
     "ActionFlag": "char",
-    "UserID": "string",
-    "reserve1": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcOptionSelfCloseField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OptionSelfCloseRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OptionSelfCloseRef": "ascii",
+    "UserID": "ascii",
     "Volume": "int",
     "RequestID": "int",
     "BusinessUnit": "string",
     "HedgeFlag": "char",
     "OptSelfCloseFlag": "char",
-    "OptionSelfCloseLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "OptionSelfCloseLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "OptionSelfCloseSysID": "string",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "CancelTime": "string",
+    "OptionSelfCloseSysID": "ascii",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "CancelTime": "ascii",
     "ExecResult": "char",
-    "ClearingPartID": "string",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "FrontID": "int",
     "SessionID": "int",
     "UserProductInfo": "string",
     "StatusMsg": "string",
-    "ActiveUserID": "string",
+    "ActiveUserID": "ascii",
     "BrokerOptionSelfCloseSeq": "int",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcOptionSelfCloseActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OptionSelfCloseActionRef": "int",
-    "OptionSelfCloseRef": "string",
+    "OptionSelfCloseRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "OptionSelfCloseSysID": "string",
+    "ExchangeID": "ascii",
+    "OptionSelfCloseSysID": "ascii",
     "ActionFlag": "char",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OptionSelfCloseLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OptionSelfCloseLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "StatusMsg": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryOptionSelfCloseField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "OptionSelfCloseSysID": "string",
-    "InsertTimeStart": "string",
-    "InsertTimeEnd": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "OptionSelfCloseSysID": "ascii",
+    "InsertTimeStart": "ascii",
+    "InsertTimeEnd": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcExchangeOptionSelfCloseField = {
@@ -2705,118 +2705,118 @@ CThostFtdcExchangeOptionSelfCloseField = {
     "BusinessUnit": "string",
     "HedgeFlag": "char",
     "OptSelfCloseFlag": "char",
-    "OptionSelfCloseLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve1": "string",
-    "TraderID": "string",
+    "OptionSelfCloseLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve1": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "OptionSelfCloseSysID": "string",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "CancelTime": "string",
+    "OptionSelfCloseSysID": "ascii",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "CancelTime": "ascii",
     "ExecResult": "char",
-    "ClearingPartID": "string",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "BranchID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryOptionSelfCloseActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcExchangeOptionSelfCloseActionField = {
-    "ExchangeID": "string",
-    "OptionSelfCloseSysID": "string",
+    "ExchangeID": "ascii",
+    "OptionSelfCloseSysID": "ascii",
     "ActionFlag": "char",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OptionSelfCloseLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OptionSelfCloseLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "BranchID": "string",
-    "reserve1": "string",
-    "MacAddress": "string",
-    "reserve2": "string",
+    "reserve1": "ascii",
+    "MacAddress": "ascii",
+    "reserve2": "ascii",
     "OptSelfCloseFlag": "char",
-    "IPAddress": "string",
-    "ExchangeInstID": "string",
+    "IPAddress": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcSyncDelaySwapField = {
     "DelaySwapSeqNo": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "FromCurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "FromCurrencyID": "ascii",
     "FromAmount": "double",
     "FromFrozenSwap": "double",
     "FromRemainSwap": "double",
-    "ToCurrencyID": "string",
+    "ToCurrencyID": "ascii",
     "ToAmount": "double",
     "IsManualSwap": "int",
     "IsAllRemainSetZero": "int",
 }
 
 CThostFtdcQrySyncDelaySwapField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "DelaySwapSeqNo": "string",
 }
 
 CThostFtdcInvestUnitField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InvestUnitID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InvestUnitID": "ascii",
     "InvestorUnitName": "string",
-    "InvestorGroupID": "string",
-    "CommModelID": "string",
-    "MarginModelID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "InvestorGroupID": "ascii",
+    "CommModelID": "ascii",
+    "MarginModelID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcQryInvestUnitField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InvestUnitID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcSecAgentCheckModeField = {
-    "InvestorID": "string",
-    "BrokerID": "string",
-    "CurrencyID": "string",
-    "BrokerSecAgentID": "string",
+    "InvestorID": "ascii",
+    "BrokerID": "ascii",
+    "CurrencyID": "ascii",
+    "BrokerSecAgentID": "ascii",
     "CheckSelfAccount": "int",
 }
 
 CThostFtdcSecAgentTradeInfoField = {
-    "BrokerID": "string",
-    "BrokerSecAgentID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "BrokerSecAgentID": "ascii",
+    "InvestorID": "ascii",
     "LongCustomerName": "string",
 }
 
 CThostFtdcMarketDataField = {
-    "TradingDay": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "reserve2": "string",
+    "TradingDay": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "reserve2": "ascii",
     "LastPrice": "double",
     "PreSettlementPrice": "double",
     "PreClosePrice": "double",
@@ -2833,15 +2833,15 @@ CThostFtdcMarketDataField = {
     "LowerLimitPrice": "double",
     "PreDelta": "double",
     "CurrDelta": "double",
-    "UpdateTime": "string",
+    "UpdateTime": "ascii",
     "UpdateMillisec": "int",
-    "ActionDay": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
+    "ActionDay": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcMarketDataBaseField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PreSettlementPrice": "double",
     "PreClosePrice": "double",
     "PreOpenInterest": "double",
@@ -2902,11 +2902,11 @@ CThostFtdcMarketDataAsk45Field = {
 }
 
 CThostFtdcMarketDataUpdateTimeField = {
-    "reserve1": "string",
-    "UpdateTime": "string",
+    "reserve1": "ascii",
+    "UpdateTime": "ascii",
     "UpdateMillisec": "int",
-    "ActionDay": "string",
-    "InstrumentID": "string",
+    "ActionDay": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcMarketDataBandingPriceField = {
@@ -2915,52 +2915,52 @@ CThostFtdcMarketDataBandingPriceField = {
 }
 
 CThostFtdcMarketDataExchangeField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcSpecificInstrumentField = {
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInstrumentStatusField = {
-    "ExchangeID": "string",
-    "reserve1": "string",
+    "ExchangeID": "ascii",
+    "reserve1": "ascii",
     "SettlementGroupID": "string",
-    "reserve2": "string",
+    "reserve2": "ascii",
     "InstrumentStatus": "char",
     "TradingSegmentSN": "int",
-    "EnterTime": "string",
+    "EnterTime": "ascii",
     "EnterReason": "char",
-    "ExchangeInstID": "string",
-    "InstrumentID": "string",
+    "ExchangeInstID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryInstrumentStatusField = {
-    "ExchangeID": "string",
-    "reserve1": "string",
-    "ExchangeInstID": "string",
+    "ExchangeID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeInstID": "ascii",
 }
 
 CThostFtdcInvestorAccountField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcPositionProfitAlgorithmField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "Algorithm": "char",
     "Memo": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcDiscountField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "InvestorRange": "char",
-    "InvestorID": "string",
+    "InvestorID": "ascii",
     "Discount": "double",
 }
 
@@ -2977,29 +2977,29 @@ CThostFtdcTransferBankField = {
 }
 
 CThostFtdcQryInvestorPositionDetailField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcInvestorPositionDetailField = {
-    "reserve1": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "reserve1": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "Direction": "char",
-    "OpenDate": "string",
-    "TradeID": "string",
+    "OpenDate": "ascii",
+    "TradeID": "ascii",
     "Volume": "int",
     "OpenPrice": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "TradeType": "char",
-    "reserve2": "string",
-    "ExchangeID": "string",
+    "reserve2": "ascii",
+    "ExchangeID": "ascii",
     "CloseProfitByDate": "double",
     "CloseProfitByTrade": "double",
     "PositionProfitByDate": "double",
@@ -3013,140 +3013,140 @@ CThostFtdcInvestorPositionDetailField = {
     "CloseVolume": "int",
     "CloseAmount": "double",
     "TimeFirstVolume": "int",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
     "SpecPosiType": "char",
-    "InstrumentID": "string",
-    "CombInstrumentID": "string",
+    "InstrumentID": "ascii",
+    "CombInstrumentID": "ascii",
 }
 
 CThostFtdcTradingAccountPasswordField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "Password": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcMDTraderOfferField = {
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ParticipantID": "string",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ParticipantID": "ascii",
     "Password": "string",
     "InstallID": "int",
-    "OrderLocalID": "string",
+    "OrderLocalID": "ascii",
     "TraderConnectStatus": "char",
-    "ConnectRequestDate": "string",
-    "ConnectRequestTime": "string",
-    "LastReportDate": "string",
-    "LastReportTime": "string",
-    "ConnectDate": "string",
-    "ConnectTime": "string",
-    "StartDate": "string",
-    "StartTime": "string",
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "MaxTradeID": "string",
+    "ConnectRequestDate": "ascii",
+    "ConnectRequestTime": "ascii",
+    "LastReportDate": "ascii",
+    "LastReportTime": "ascii",
+    "ConnectDate": "ascii",
+    "ConnectTime": "ascii",
+    "StartDate": "ascii",
+    "StartTime": "ascii",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "MaxTradeID": "ascii",
     "MaxOrderMessageReference": "string",
     "OrderCancelAlg": "char",
 }
 
 CThostFtdcQryMDTraderOfferField = {
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "TraderID": "string",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "TraderID": "ascii",
 }
 
 CThostFtdcQryNoticeField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcNoticeField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "Content": "string",
     "SequenceLabel": "string",
 }
 
 CThostFtdcUserRightField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserRightType": "char",
     "IsForbidden": "int",
 }
 
 CThostFtdcQrySettlementInfoConfirmField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcLoadSettlementInfoField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcBrokerWithdrawAlgorithmField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "WithdrawAlgorithm": "char",
     "UsingRatio": "double",
     "IncludeCloseProfit": "char",
     "AllWithoutTrade": "char",
     "AvailIncludeCloseProfit": "char",
     "IsBrokerUserEvent": "int",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "FundMortgageRatio": "double",
     "BalanceAlgorithm": "char",
 }
 
 CThostFtdcTradingAccountPasswordUpdateV1Field = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OldPassword": "string",
     "NewPassword": "string",
 }
 
 CThostFtdcTradingAccountPasswordUpdateField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "OldPassword": "string",
     "NewPassword": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcQryCombinationLegField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "LegID": "int",
-    "reserve2": "string",
-    "CombInstrumentID": "string",
-    "LegInstrumentID": "string",
+    "reserve2": "ascii",
+    "CombInstrumentID": "ascii",
+    "LegInstrumentID": "ascii",
 }
 
 CThostFtdcQrySyncStatusField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
 }
 
 CThostFtdcCombinationLegField = {
-    "reserve1": "string",
+    "reserve1": "ascii",
     "LegID": "int",
-    "reserve2": "string",
+    "reserve2": "ascii",
     "Direction": "char",
     "LegMultiple": "int",
     "ImplyLevel": "int",
-    "CombInstrumentID": "string",
-    "LegInstrumentID": "string",
+    "CombInstrumentID": "ascii",
+    "LegInstrumentID": "ascii",
 }
 
 CThostFtdcSyncStatusField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "DataSyncStatus": "char",
 }
 
 CThostFtdcQryLinkManField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcLinkManField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "PersonType": "char",
     "IdentifiedCardType": "char",
     "IdentifiedCardNo": "string",
@@ -3160,49 +3160,49 @@ CThostFtdcLinkManField = {
 }
 
 CThostFtdcQryBrokerUserEventField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserEventType": "char",
 }
 
 CThostFtdcBrokerUserEventField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "UserEventType": "char",
     "EventSequenceNo": "int",
-    "EventDate": "string",
-    "EventTime": "string",
+    "EventDate": "ascii",
+    "EventTime": "ascii",
     "UserEventInfo": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
     "DRIdentityID": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
 }
 
 CThostFtdcQryContractBankField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BankID": "string",
     "BankBrchID": "string",
 }
 
 CThostFtdcContractBankField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BankID": "string",
     "BankBrchID": "string",
     "BankName": "string",
 }
 
 CThostFtdcInvestorPositionCombineDetailField = {
-    "TradingDay": "string",
-    "OpenDate": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "OpenDate": "ascii",
+    "ExchangeID": "ascii",
     "SettlementID": "int",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ComTradeID": "string",
-    "TradeID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ComTradeID": "ascii",
+    "TradeID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
     "Direction": "char",
     "TotalAmt": "int",
@@ -3212,27 +3212,27 @@ CThostFtdcInvestorPositionCombineDetailField = {
     "MarginRateByVolume": "double",
     "LegID": "int",
     "LegMultiple": "int",
-    "reserve2": "string",
+    "reserve2": "ascii",
     "TradeGroupID": "int",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
-    "CombInstrumentID": "string",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
+    "CombInstrumentID": "ascii",
 }
 
 CThostFtdcParkedOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OrderRef": "ascii",
+    "UserID": "ascii",
     "OrderPriceType": "char",
     "Direction": "char",
-    "CombOffsetFlag": "string",
-    "CombHedgeFlag": "string",
+    "CombOffsetFlag": "ascii",
+    "CombHedgeFlag": "ascii",
     "LimitPrice": "double",
     "VolumeTotalOriginal": "int",
     "TimeCondition": "char",
-    "GTDDate": "string",
+    "GTDDate": "ascii",
     "VolumeCondition": "char",
     "MinVolume": "int",
     "ContingentCondition": "char",
@@ -3242,98 +3242,98 @@ CThostFtdcParkedOrderField = {
     "BusinessUnit": "string",
     "RequestID": "int",
     "UserForceClose": "int",
-    "ExchangeID": "string",
-    "ParkedOrderID": "string",
+    "ExchangeID": "ascii",
+    "ParkedOrderID": "ascii",
     "UserType": "char",
     "Status": "char",
     "ErrorID": "int",
     "ErrorMsg": "string",
     "IsSwapOrder": "int",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "ClientID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "ClientID": "ascii",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcParkedOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OrderActionRef": "int",
-    "OrderRef": "string",
+    "OrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "OrderSysID": "string",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
     "ActionFlag": "char",
     "LimitPrice": "double",
     "VolumeChange": "int",
-    "UserID": "string",
-    "reserve1": "string",
-    "ParkedOrderActionID": "string",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "ParkedOrderActionID": "ascii",
     "UserType": "char",
     "Status": "char",
     "ErrorID": "int",
     "ErrorMsg": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryParkedOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryParkedOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcRemoveParkedOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ParkedOrderID": "string",
-    "InvestUnitID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ParkedOrderID": "ascii",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcRemoveParkedOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ParkedOrderActionID": "string",
-    "InvestUnitID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ParkedOrderActionID": "ascii",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcInvestorWithdrawAlgorithmField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "InvestorRange": "char",
-    "InvestorID": "string",
+    "InvestorID": "ascii",
     "UsingRatio": "double",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "FundMortgageRatio": "double",
 }
 
 CThostFtdcQryInvestorPositionCombineDetailField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "CombInstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "CombInstrumentID": "ascii",
 }
 
 CThostFtdcMarketDataAveragePriceField = {
@@ -3341,68 +3341,68 @@ CThostFtdcMarketDataAveragePriceField = {
 }
 
 CThostFtdcVerifyInvestorPasswordField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Password": "string",
 }
 
 CThostFtdcUserIPField = {
-    "BrokerID": "string",
-    "UserID": "string",
-    "reserve1": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "IPAddress": "string",
-    "IPMask": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "IPAddress": "ascii",
+    "IPMask": "ascii",
 }
 
 CThostFtdcTradingNoticeInfoField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "SendTime": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "SendTime": "ascii",
     "FieldContent": "string",
     "SequenceSeries": "int",
     "SequenceNo": "int",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcTradingNoticeField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "InvestorRange": "char",
-    "InvestorID": "string",
+    "InvestorID": "ascii",
     "SequenceSeries": "int",
-    "UserID": "string",
-    "SendTime": "string",
+    "UserID": "ascii",
+    "SendTime": "ascii",
     "SequenceNo": "int",
     "FieldContent": "string",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcQryTradingNoticeField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InvestUnitID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcQryErrOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcErrOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OrderRef": "ascii",
+    "UserID": "ascii",
     "OrderPriceType": "char",
     "Direction": "char",
-    "CombOffsetFlag": "string",
-    "CombHedgeFlag": "string",
+    "CombOffsetFlag": "ascii",
+    "CombHedgeFlag": "ascii",
     "LimitPrice": "double",
     "VolumeTotalOriginal": "int",
     "TimeCondition": "char",
-    "GTDDate": "string",
+    "GTDDate": "ascii",
     "VolumeCondition": "char",
     "MinVolume": "int",
     "ContingentCondition": "char",
@@ -3415,33 +3415,33 @@ CThostFtdcErrOrderField = {
     "ErrorID": "int",
     "ErrorMsg": "string",
     "IsSwapOrder": "int",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcErrorConditionalOrderField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
-    "OrderRef": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
+    "OrderRef": "ascii",
+    "UserID": "ascii",
     "OrderPriceType": "char",
     "Direction": "char",
-    "CombOffsetFlag": "string",
-    "CombHedgeFlag": "string",
+    "CombOffsetFlag": "ascii",
+    "CombHedgeFlag": "ascii",
     "LimitPrice": "double",
     "VolumeTotalOriginal": "int",
     "TimeCondition": "char",
-    "GTDDate": "string",
+    "GTDDate": "ascii",
     "VolumeCondition": "char",
     "MinVolume": "int",
     "ContingentCondition": "char",
@@ -3450,167 +3450,167 @@ CThostFtdcErrorConditionalOrderField = {
     "IsAutoSuspend": "int",
     "BusinessUnit": "string",
     "RequestID": "int",
-    "OrderLocalID": "string",
-    "ExchangeID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
-    "reserve2": "string",
-    "TraderID": "string",
+    "OrderLocalID": "ascii",
+    "ExchangeID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
+    "reserve2": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
     "OrderSubmitStatus": "char",
     "NotifySequence": "int",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
-    "OrderSysID": "string",
+    "OrderSysID": "ascii",
     "OrderSource": "char",
     "OrderStatus": "char",
     "OrderType": "char",
     "VolumeTraded": "int",
     "VolumeTotal": "int",
-    "InsertDate": "string",
-    "InsertTime": "string",
-    "ActiveTime": "string",
-    "SuspendTime": "string",
-    "UpdateTime": "string",
-    "CancelTime": "string",
-    "ActiveTraderID": "string",
-    "ClearingPartID": "string",
+    "InsertDate": "ascii",
+    "InsertTime": "ascii",
+    "ActiveTime": "ascii",
+    "SuspendTime": "ascii",
+    "UpdateTime": "ascii",
+    "CancelTime": "ascii",
+    "ActiveTraderID": "ascii",
+    "ClearingPartID": "ascii",
     "SequenceNo": "int",
     "FrontID": "int",
     "SessionID": "int",
     "UserProductInfo": "string",
     "StatusMsg": "string",
     "UserForceClose": "int",
-    "ActiveUserID": "string",
+    "ActiveUserID": "ascii",
     "BrokerOrderSeq": "int",
-    "RelativeOrderSysID": "string",
+    "RelativeOrderSysID": "ascii",
     "ZCETotalTradedVolume": "int",
     "ErrorID": "int",
     "ErrorMsg": "string",
     "IsSwapOrder": "int",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "reserve3": "string",
-    "MacAddress": "string",
-    "InstrumentID": "string",
-    "ExchangeInstID": "string",
-    "IPAddress": "string",
+    "InvestUnitID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "reserve3": "ascii",
+    "MacAddress": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeInstID": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryErrOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcErrOrderActionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OrderActionRef": "int",
-    "OrderRef": "string",
+    "OrderRef": "ascii",
     "RequestID": "int",
     "FrontID": "int",
     "SessionID": "int",
-    "ExchangeID": "string",
-    "OrderSysID": "string",
+    "ExchangeID": "ascii",
+    "OrderSysID": "ascii",
     "ActionFlag": "char",
     "LimitPrice": "double",
     "VolumeChange": "int",
-    "ActionDate": "string",
-    "ActionTime": "string",
-    "TraderID": "string",
+    "ActionDate": "ascii",
+    "ActionTime": "ascii",
+    "TraderID": "ascii",
     "InstallID": "int",
-    "OrderLocalID": "string",
-    "ActionLocalID": "string",
-    "ParticipantID": "string",
-    "ClientID": "string",
+    "OrderLocalID": "ascii",
+    "ActionLocalID": "ascii",
+    "ParticipantID": "ascii",
+    "ClientID": "ascii",
     "BusinessUnit": "string",
     "OrderActionStatus": "char",
-    "UserID": "string",
+    "UserID": "ascii",
     "StatusMsg": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "BranchID": "string",
-    "InvestUnitID": "string",
-    "reserve2": "string",
-    "MacAddress": "string",
+    "InvestUnitID": "ascii",
+    "reserve2": "ascii",
+    "MacAddress": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
-    "InstrumentID": "string",
-    "IPAddress": "string",
+    "InstrumentID": "ascii",
+    "IPAddress": "ascii",
     "OrderMemo": "string",
     "SessionReqSeq": "int",
 }
 
 CThostFtdcQryExchangeSequenceField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcExchangeSequenceField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "SequenceNo": "int",
     "MarketStatus": "char",
 }
 
 CThostFtdcQryMaxOrderVolumeWithPriceField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "Direction": "char",
     "OffsetFlag": "char",
     "HedgeFlag": "char",
     "MaxVolume": "int",
     "Price": "double",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryBrokerTradingParamsField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "CurrencyID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "CurrencyID": "ascii",
+    "AccountID": "ascii",
 }
 
 CThostFtdcBrokerTradingParamsField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "MarginPriceType": "char",
     "Algorithm": "char",
     "AvailIncludeCloseProfit": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "OptionRoyaltyPriceType": "char",
-    "AccountID": "string",
+    "AccountID": "ascii",
 }
 
 CThostFtdcQryBrokerTradingAlgosField = {
-    "BrokerID": "string",
-    "ExchangeID": "string",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcBrokerTradingAlgosField = {
-    "BrokerID": "string",
-    "ExchangeID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
+    "reserve1": "ascii",
     "HandlePositionAlgoID": "char",
     "FindMarginRateAlgoID": "char",
     "HandleTradingAccountAlgoID": "char",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQueryBrokerDepositField = {
-    "BrokerID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
 }
 
 CThostFtdcBrokerDepositField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "ParticipantID": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "ParticipantID": "ascii",
+    "ExchangeID": "ascii",
     "PreBalance": "double",
     "CurrMargin": "double",
     "CloseProfit": "double",
@@ -3623,35 +3623,35 @@ CThostFtdcBrokerDepositField = {
 }
 
 CThostFtdcQryCFMMCBrokerKeyField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcCFMMCBrokerKeyField = {
-    "BrokerID": "string",
-    "ParticipantID": "string",
-    "CreateDate": "string",
-    "CreateTime": "string",
+    "BrokerID": "ascii",
+    "ParticipantID": "ascii",
+    "CreateDate": "ascii",
+    "CreateTime": "ascii",
     "KeyID": "int",
     "CurrentKey": "string",
     "KeyKind": "char",
 }
 
 CThostFtdcCFMMCTradingAccountKeyField = {
-    "BrokerID": "string",
-    "ParticipantID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "ParticipantID": "ascii",
+    "AccountID": "ascii",
     "KeyID": "int",
     "CurrentKey": "string",
 }
 
 CThostFtdcQryCFMMCTradingAccountKeyField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcBrokerUserOTPParamField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "OTPVendorsID": "string",
     "SerialNumber": "string",
     "AuthKey": "string",
@@ -3661,72 +3661,72 @@ CThostFtdcBrokerUserOTPParamField = {
 }
 
 CThostFtdcManualSyncBrokerUserOTPField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "OTPType": "char",
     "FirstOTP": "string",
     "SecondOTP": "string",
 }
 
 CThostFtdcCommRateModelField = {
-    "BrokerID": "string",
-    "CommModelID": "string",
+    "BrokerID": "ascii",
+    "CommModelID": "ascii",
     "CommModelName": "string",
 }
 
 CThostFtdcQryCommRateModelField = {
-    "BrokerID": "string",
-    "CommModelID": "string",
+    "BrokerID": "ascii",
+    "CommModelID": "ascii",
 }
 
 CThostFtdcMarginModelField = {
-    "BrokerID": "string",
-    "MarginModelID": "string",
+    "BrokerID": "ascii",
+    "MarginModelID": "ascii",
     "MarginModelName": "string",
 }
 
 CThostFtdcQryMarginModelField = {
-    "BrokerID": "string",
-    "MarginModelID": "string",
+    "BrokerID": "ascii",
+    "MarginModelID": "ascii",
 }
 
 CThostFtdcEWarrantOffsetField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
-    "reserve1": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
+    "reserve1": "ascii",
     "Direction": "char",
     "HedgeFlag": "char",
     "Volume": "int",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryEWarrantOffsetField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
-    "reserve1": "string",
-    "InvestUnitID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
+    "reserve1": "ascii",
+    "InvestUnitID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryInvestorProductGroupMarginField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "reserve1": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "reserve1": "ascii",
     "HedgeFlag": "char",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "ProductGroupID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcInvestorProductGroupMarginField = {
-    "reserve1": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "TradingDay": "string",
+    "reserve1": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "FrozenMargin": "double",
     "LongFrozenMargin": "double",
@@ -3750,47 +3750,47 @@ CThostFtdcInvestorProductGroupMarginField = {
     "LongExchOffsetAmount": "double",
     "ShortExchOffsetAmount": "double",
     "HedgeFlag": "char",
-    "ExchangeID": "string",
-    "InvestUnitID": "string",
-    "ProductGroupID": "string",
+    "ExchangeID": "ascii",
+    "InvestUnitID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcQueryCFMMCTradingAccountTokenField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InvestUnitID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InvestUnitID": "ascii",
 }
 
 CThostFtdcCFMMCTradingAccountTokenField = {
-    "BrokerID": "string",
-    "ParticipantID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "ParticipantID": "ascii",
+    "AccountID": "ascii",
     "KeyID": "int",
     "Token": "string",
 }
 
 CThostFtdcQryProductGroupField = {
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
 }
 
 CThostFtdcProductGroupField = {
-    "reserve1": "string",
-    "ExchangeID": "string",
-    "reserve2": "string",
-    "ProductID": "string",
-    "ProductGroupID": "string",
+    "reserve1": "ascii",
+    "ExchangeID": "ascii",
+    "reserve2": "ascii",
+    "ProductID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcBulletinField = {
-    "ExchangeID": "string",
-    "TradingDay": "string",
+    "ExchangeID": "ascii",
+    "TradingDay": "ascii",
     "BulletinID": "int",
     "SequenceNo": "int",
     "NewsType": "string",
     "NewsUrgency": "char",
-    "SendTime": "string",
+    "SendTime": "ascii",
     "Abstract": "string",
     "ComeFrom": "string",
     "Content": "string",
@@ -3799,7 +3799,7 @@ CThostFtdcBulletinField = {
 }
 
 CThostFtdcQryBulletinField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "BulletinID": "int",
     "SequenceNo": "int",
     "NewsType": "string",
@@ -3808,22 +3808,22 @@ CThostFtdcQryBulletinField = {
 
 CThostFtdcMulticastInstrumentField = {
     "TopicID": "int",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "InstrumentNo": "int",
     "CodePrice": "double",
     "VolumeMultiple": "int",
     "PriceTick": "double",
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryMulticastInstrumentField = {
     "TopicID": "int",
-    "reserve1": "string",
-    "InstrumentID": "string",
+    "reserve1": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcAppIDAuthAssignField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "AppID": "string",
     "DRIdentityID": "int",
 }
@@ -3832,12 +3832,12 @@ CThostFtdcReqOpenAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -3856,11 +3856,11 @@ CThostFtdcReqOpenAccountField = {
     "MoneyAccountStatus": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "CashExchangeCode": "char",
     "Digest": "string",
     "BankAccType": "char",
@@ -3872,7 +3872,7 @@ CThostFtdcReqOpenAccountField = {
     "SecuPwdFlag": "char",
     "OperNo": "string",
     "TID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "LongCustomerName": "string",
 }
 
@@ -3880,12 +3880,12 @@ CThostFtdcReqCancelAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -3904,11 +3904,11 @@ CThostFtdcReqCancelAccountField = {
     "MoneyAccountStatus": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "CashExchangeCode": "char",
     "Digest": "string",
     "BankAccType": "char",
@@ -3920,7 +3920,7 @@ CThostFtdcReqCancelAccountField = {
     "SecuPwdFlag": "char",
     "OperNo": "string",
     "TID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "LongCustomerName": "string",
 }
 
@@ -3928,12 +3928,12 @@ CThostFtdcReqChangeAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -3954,12 +3954,12 @@ CThostFtdcReqChangeAccountField = {
     "BankPassWord": "string",
     "NewBankAccount": "string",
     "NewBankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "BankAccType": "char",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "BrokerIDByBank": "string",
     "BankPwdFlag": "char",
     "SecuPwdFlag": "char",
@@ -3972,12 +3972,12 @@ CThostFtdcReqTransferField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -3987,13 +3987,13 @@ CThostFtdcReqTransferField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "FutureSerial": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "FutureFetchAmount": "double",
     "FeePayFlag": "char",
@@ -4019,12 +4019,12 @@ CThostFtdcRspTransferField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4034,13 +4034,13 @@ CThostFtdcRspTransferField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "FutureSerial": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "FutureFetchAmount": "double",
     "FeePayFlag": "char",
@@ -4075,12 +4075,12 @@ CThostFtdcReqRepealField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4090,13 +4090,13 @@ CThostFtdcReqRepealField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "FutureSerial": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "FutureFetchAmount": "double",
     "FeePayFlag": "char",
@@ -4129,12 +4129,12 @@ CThostFtdcRspRepealField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4144,13 +4144,13 @@ CThostFtdcRspRepealField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "FutureSerial": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "FutureFetchAmount": "double",
     "FeePayFlag": "char",
@@ -4178,12 +4178,12 @@ CThostFtdcReqQueryAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4193,13 +4193,13 @@ CThostFtdcReqQueryAccountField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "FutureSerial": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "Digest": "string",
     "BankAccType": "char",
     "DeviceID": "string",
@@ -4218,12 +4218,12 @@ CThostFtdcRspQueryAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4233,13 +4233,13 @@ CThostFtdcRspQueryAccountField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "FutureSerial": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "Digest": "string",
     "BankAccType": "char",
     "DeviceID": "string",
@@ -4260,19 +4260,19 @@ CThostFtdcFutureSignIOField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Digest": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
     "OperNo": "string",
@@ -4284,19 +4284,19 @@ CThostFtdcRspFutureSignInField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Digest": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
     "OperNo": "string",
@@ -4312,19 +4312,19 @@ CThostFtdcReqFutureSignOutField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Digest": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
     "OperNo": "string",
@@ -4336,19 +4336,19 @@ CThostFtdcRspFutureSignOutField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Digest": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
     "OperNo": "string",
@@ -4362,12 +4362,12 @@ CThostFtdcReqQueryTradeResultBySerialField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4380,9 +4380,9 @@ CThostFtdcReqQueryTradeResultBySerialField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "Digest": "string",
     "LongCustomerName": "string",
@@ -4392,12 +4392,12 @@ CThostFtdcRspQueryTradeResultBySerialField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4410,9 +4410,9 @@ CThostFtdcRspQueryTradeResultBySerialField = {
     "OriginDescrInfoForReturnCode": "string",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "Digest": "string",
 }
@@ -4421,12 +4421,12 @@ CThostFtdcReqDayEndFileReadyField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4443,22 +4443,22 @@ CThostFtdcVerifyFuturePasswordField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "BankAccount": "string",
     "BankPassWord": "string",
     "InstallID": "int",
     "TID": "int",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcVerifyCustInfoField = {
@@ -4474,16 +4474,16 @@ CThostFtdcVerifyFuturePasswordAndCustInfoField = {
     "IdCardType": "char",
     "IdentifiedCardNo": "string",
     "CustType": "char",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "LongCustomerName": "string",
 }
 
 CThostFtdcDepositResultInformField = {
     "DepositSeqNo": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Deposit": "double",
     "RequestID": "int",
     "ReturnCode": "string",
@@ -4494,17 +4494,17 @@ CThostFtdcReqSyncKeyField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Message": "string",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
@@ -4517,17 +4517,17 @@ CThostFtdcRspSyncKeyField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Message": "string",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
@@ -4542,12 +4542,12 @@ CThostFtdcNotifyQueryAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4557,13 +4557,13 @@ CThostFtdcNotifyQueryAccountField = {
     "CustType": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "FutureSerial": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "Digest": "string",
     "BankAccType": "char",
     "DeviceID": "string",
@@ -4584,9 +4584,9 @@ CThostFtdcNotifyQueryAccountField = {
 
 CThostFtdcTransferSerialField = {
     "PlateSerial": "int",
-    "TradeDate": "string",
-    "TradingDay": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradingDay": "ascii",
+    "TradeTime": "ascii",
     "TradeCode": "string",
     "SessionID": "int",
     "BankID": "string",
@@ -4594,15 +4594,15 @@ CThostFtdcTransferSerialField = {
     "BankAccType": "char",
     "BankAccount": "string",
     "BankSerial": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
     "FutureAccType": "char",
-    "AccountID": "string",
-    "InvestorID": "string",
+    "AccountID": "ascii",
+    "InvestorID": "ascii",
     "FutureSerial": "int",
     "IdCardType": "char",
     "IdentifiedCardNo": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "TradeAmount": "double",
     "CustFee": "double",
     "BrokerFee": "double",
@@ -4614,29 +4614,29 @@ CThostFtdcTransferSerialField = {
 }
 
 CThostFtdcQryTransferSerialField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "BankID": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcNotifyFutureSignInField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Digest": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
     "OperNo": "string",
@@ -4652,19 +4652,19 @@ CThostFtdcNotifyFutureSignOutField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Digest": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
     "OperNo": "string",
@@ -4678,17 +4678,17 @@ CThostFtdcNotifySyncKeyField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
     "InstallID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "Message": "string",
     "DeviceID": "string",
     "BrokerIDByBank": "string",
@@ -4700,28 +4700,28 @@ CThostFtdcNotifySyncKeyField = {
 }
 
 CThostFtdcQryAccountregisterField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "BankID": "string",
     "BankBranchID": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcAccountregisterField = {
-    "TradeDay": "string",
+    "TradeDay": "ascii",
     "BankID": "string",
     "BankBranchID": "string",
     "BankAccount": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "IdCardType": "char",
     "IdentifiedCardNo": "string",
     "CustomerName": "string",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "OpenOrDestroy": "char",
-    "RegDate": "string",
-    "OutDate": "string",
+    "RegDate": "ascii",
+    "OutDate": "ascii",
     "TID": "int",
     "CustType": "char",
     "BankAccType": "char",
@@ -4732,12 +4732,12 @@ CThostFtdcOpenAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4756,11 +4756,11 @@ CThostFtdcOpenAccountField = {
     "MoneyAccountStatus": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "CashExchangeCode": "char",
     "Digest": "string",
     "BankAccType": "char",
@@ -4772,7 +4772,7 @@ CThostFtdcOpenAccountField = {
     "SecuPwdFlag": "char",
     "OperNo": "string",
     "TID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
     "LongCustomerName": "string",
@@ -4782,12 +4782,12 @@ CThostFtdcCancelAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4806,11 +4806,11 @@ CThostFtdcCancelAccountField = {
     "MoneyAccountStatus": "char",
     "BankAccount": "string",
     "BankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "CashExchangeCode": "char",
     "Digest": "string",
     "BankAccType": "char",
@@ -4822,7 +4822,7 @@ CThostFtdcCancelAccountField = {
     "SecuPwdFlag": "char",
     "OperNo": "string",
     "TID": "int",
-    "UserID": "string",
+    "UserID": "ascii",
     "ErrorID": "int",
     "ErrorMsg": "string",
     "LongCustomerName": "string",
@@ -4832,12 +4832,12 @@ CThostFtdcChangeAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4858,12 +4858,12 @@ CThostFtdcChangeAccountField = {
     "BankPassWord": "string",
     "NewBankAccount": "string",
     "NewBankPassWord": "string",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "BankAccType": "char",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "BrokerIDByBank": "string",
     "BankPwdFlag": "char",
     "SecuPwdFlag": "char",
@@ -4875,28 +4875,28 @@ CThostFtdcChangeAccountField = {
 }
 
 CThostFtdcSecAgentACIDMapField = {
-    "BrokerID": "string",
-    "UserID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
-    "BrokerSecAgentID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
+    "BrokerSecAgentID": "ascii",
 }
 
 CThostFtdcQrySecAgentACIDMapField = {
-    "BrokerID": "string",
-    "UserID": "string",
-    "AccountID": "string",
-    "CurrencyID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
+    "AccountID": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcUserRightsAssignField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "DRIdentityID": "int",
 }
 
 CThostFtdcBrokerUserRightAssignField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "DRIdentityID": "int",
     "Tradeable": "int",
 }
@@ -4904,13 +4904,13 @@ CThostFtdcBrokerUserRightAssignField = {
 CThostFtdcDRTransferField = {
     "OrigDRIdentityID": "int",
     "DestDRIdentityID": "int",
-    "OrigBrokerID": "string",
-    "DestBrokerID": "string",
+    "OrigBrokerID": "ascii",
+    "DestBrokerID": "ascii",
 }
 
 CThostFtdcFensUserInfoField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "LoginMode": "char",
 }
 
@@ -4919,49 +4919,49 @@ CThostFtdcCurrTransferIdentityField = {
 }
 
 CThostFtdcLoginForbiddenUserField = {
-    "BrokerID": "string",
-    "UserID": "string",
-    "reserve1": "string",
-    "IPAddress": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
+    "reserve1": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryLoginForbiddenUserField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcTradingAccountReserveField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "Reserve": "double",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcQryLoginForbiddenIPField = {
-    "reserve1": "string",
-    "IPAddress": "string",
+    "reserve1": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryIPListField = {
-    "reserve1": "string",
-    "IPAddress": "string",
+    "reserve1": "ascii",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryUserRightsAssignField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcReserveOpenAccountConfirmField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -4982,15 +4982,15 @@ CThostFtdcReserveOpenAccountConfirmField = {
     "BankPassWord": "string",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "Digest": "string",
     "BankAccType": "char",
     "BrokerIDByBank": "string",
     "TID": "int",
-    "AccountID": "string",
+    "AccountID": "ascii",
     "Password": "string",
     "BankReserveOpenSeq": "string",
-    "BookDate": "string",
+    "BookDate": "ascii",
     "BookPsw": "string",
     "ErrorID": "int",
     "ErrorMsg": "string",
@@ -5000,12 +5000,12 @@ CThostFtdcReserveOpenAccountField = {
     "TradeCode": "string",
     "BankID": "string",
     "BankBranchID": "string",
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "BrokerBranchID": "string",
-    "TradeDate": "string",
-    "TradeTime": "string",
+    "TradeDate": "ascii",
+    "TradeTime": "ascii",
     "BankSerial": "string",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "PlateSerial": "int",
     "LastFragment": "char",
     "SessionID": "int",
@@ -5026,7 +5026,7 @@ CThostFtdcReserveOpenAccountField = {
     "BankPassWord": "string",
     "InstallID": "int",
     "VerifyCertNoFlag": "char",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "Digest": "string",
     "BankAccType": "char",
     "BrokerIDByBank": "string",
@@ -5037,20 +5037,20 @@ CThostFtdcReserveOpenAccountField = {
 }
 
 CThostFtdcAccountPropertyField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "BankID": "string",
     "BankAccount": "string",
     "OpenName": "string",
     "OpenBank": "string",
     "IsActive": "int",
     "AccountSourceType": "char",
-    "OpenDate": "string",
-    "CancelDate": "string",
+    "OpenDate": "ascii",
+    "CancelDate": "ascii",
     "OperatorID": "string",
-    "OperateDate": "string",
-    "OperateTime": "string",
-    "CurrencyID": "string",
+    "OperateDate": "ascii",
+    "OperateTime": "ascii",
+    "CurrencyID": "ascii",
 }
 
 CThostFtdcQryCurrDRIdentityField = {
@@ -5062,19 +5062,19 @@ CThostFtdcCurrDRIdentityField = {
 }
 
 CThostFtdcQrySecAgentCheckModeField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcQrySecAgentTradeInfoField = {
-    "BrokerID": "string",
-    "BrokerSecAgentID": "string",
+    "BrokerID": "ascii",
+    "BrokerSecAgentID": "ascii",
 }
 
 CThostFtdcReqUserAuthMethodField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcRspUserAuthMethodField = {
@@ -5082,22 +5082,22 @@ CThostFtdcRspUserAuthMethodField = {
 }
 
 CThostFtdcReqGenUserCaptchaField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcRspGenUserCaptchaField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "CaptchaInfoLen": "int",
     "CaptchaInfo": "string",
 }
 
 CThostFtdcReqGenUserTextField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcRspGenUserTextField = {
@@ -5105,51 +5105,51 @@ CThostFtdcRspGenUserTextField = {
 }
 
 CThostFtdcReqUserLoginWithCaptchaField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "Password": "string",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
-    "MacAddress": "string",
-    "reserve1": "string",
+    "MacAddress": "ascii",
+    "reserve1": "ascii",
     "LoginRemark": "string",
     "Captcha": "string",
     "ClientIPPort": "int",
-    "ClientIPAddress": "string",
+    "ClientIPAddress": "ascii",
 }
 
 CThostFtdcReqUserLoginWithTextField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "Password": "string",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
-    "MacAddress": "string",
-    "reserve1": "string",
+    "MacAddress": "ascii",
+    "reserve1": "ascii",
     "LoginRemark": "string",
     "Text": "string",
     "ClientIPPort": "int",
-    "ClientIPAddress": "string",
+    "ClientIPAddress": "ascii",
 }
 
 CThostFtdcReqUserLoginWithOTPField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "Password": "string",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
-    "MacAddress": "string",
-    "reserve1": "string",
+    "MacAddress": "ascii",
+    "reserve1": "ascii",
     "LoginRemark": "string",
     "OTPPassword": "string",
     "ClientIPPort": "int",
-    "ClientIPAddress": "string",
+    "ClientIPAddress": "ascii",
 }
 
 CThostFtdcReqApiHandshakeField = {
@@ -5168,10 +5168,10 @@ CThostFtdcReqVerifyApiKeyField = {
 }
 
 CThostFtdcDepartmentUserField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "InvestorRange": "char",
-    "InvestorID": "string",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcQueryFreqField = {
@@ -5180,83 +5180,83 @@ CThostFtdcQueryFreqField = {
 }
 
 CThostFtdcAuthForbiddenIPField = {
-    "IPAddress": "string",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryAuthForbiddenIPField = {
-    "IPAddress": "string",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcSyncDelaySwapFrozenField = {
     "DelaySwapSeqNo": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "FromCurrencyID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "FromCurrencyID": "ascii",
     "FromRemainSwap": "double",
     "IsManualSwap": "int",
 }
 
 CThostFtdcUserSystemInfoField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "ClientSystemInfoLen": "int",
     "ClientSystemInfo": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "ClientIPPort": "int",
-    "ClientLoginTime": "string",
+    "ClientLoginTime": "ascii",
     "ClientAppID": "string",
-    "ClientPublicIP": "string",
+    "ClientPublicIP": "ascii",
     "ClientLoginRemark": "string",
 }
 
 CThostFtdcAuthUserIDField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "AppID": "string",
-    "UserID": "string",
+    "UserID": "ascii",
     "AuthType": "char",
 }
 
 CThostFtdcAuthIPField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
     "AppID": "string",
-    "IPAddress": "string",
+    "IPAddress": "ascii",
 }
 
 CThostFtdcQryClassifiedInstrumentField = {
-    "InstrumentID": "string",
-    "ExchangeID": "string",
-    "ExchangeInstID": "string",
-    "ProductID": "string",
+    "InstrumentID": "ascii",
+    "ExchangeID": "ascii",
+    "ExchangeInstID": "ascii",
+    "ProductID": "ascii",
     "TradingType": "char",
     "ClassType": "char",
 }
 
 CThostFtdcQryCombPromotionParamField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcCombPromotionParamField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "CombHedgeFlag": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "CombHedgeFlag": "ascii",
     "Xparameter": "double",
 }
 
 CThostFtdcReqUserLoginSMField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "UserID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "Password": "string",
     "UserProductInfo": "string",
     "InterfaceProductInfo": "string",
     "ProtocolInfo": "string",
-    "MacAddress": "string",
+    "MacAddress": "ascii",
     "OneTimePassword": "string",
-    "reserve1": "string",
+    "reserve1": "ascii",
     "LoginRemark": "string",
     "ClientIPPort": "int",
-    "ClientIPAddress": "string",
+    "ClientIPAddress": "ascii",
     "BrokerName": "string",
     "AuthCode": "string",
     "AppID": "string",
@@ -5264,19 +5264,19 @@ CThostFtdcReqUserLoginSMField = {
 }
 
 CThostFtdcQryRiskSettleInvstPositionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryRiskSettleProductStatusField = {
-    "ProductID": "string",
+    "ProductID": "ascii",
 }
 
 CThostFtdcRiskSettleInvstPositionField = {
-    "InstrumentID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "InstrumentID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "PosiDirection": "char",
     "HedgeFlag": "char",
     "PositionDate": "char",
@@ -5302,7 +5302,7 @@ CThostFtdcRiskSettleInvstPositionField = {
     "PositionProfit": "double",
     "PreSettlementPrice": "double",
     "SettlementPrice": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "OpenCost": "double",
     "ExchangeMargin": "double",
@@ -5317,17 +5317,17 @@ CThostFtdcRiskSettleInvstPositionField = {
     "StrikeFrozen": "int",
     "StrikeFrozenAmount": "double",
     "AbandonFrozen": "int",
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "YdStrikeFrozen": "int",
-    "InvestUnitID": "string",
+    "InvestUnitID": "ascii",
     "PositionCostOffset": "double",
     "TasPosition": "int",
     "TasPositionCost": "double",
 }
 
 CThostFtdcRiskSettleProductStatusField = {
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
     "ProductStatus": "char",
 }
 
@@ -5340,26 +5340,26 @@ CThostFtdcSyncDeltaInfoField = {
 
 CThostFtdcSyncDeltaProductStatusField = {
     "SyncDeltaSequenceNo": "int",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
     "ProductStatus": "char",
 }
 
 CThostFtdcSyncDeltaInvstPosDtlField = {
-    "InstrumentID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "InstrumentID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "Direction": "char",
-    "OpenDate": "string",
-    "TradeID": "string",
+    "OpenDate": "ascii",
+    "TradeID": "ascii",
     "Volume": "int",
     "OpenPrice": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "TradeType": "char",
-    "CombInstrumentID": "string",
-    "ExchangeID": "string",
+    "CombInstrumentID": "ascii",
+    "ExchangeID": "ascii",
     "CloseProfitByDate": "double",
     "CloseProfitByTrade": "double",
     "PositionProfitByDate": "double",
@@ -5379,15 +5379,15 @@ CThostFtdcSyncDeltaInvstPosDtlField = {
 }
 
 CThostFtdcSyncDeltaInvstPosCombDtlField = {
-    "TradingDay": "string",
-    "OpenDate": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "OpenDate": "ascii",
+    "ExchangeID": "ascii",
     "SettlementID": "int",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ComTradeID": "string",
-    "TradeID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ComTradeID": "ascii",
+    "TradeID": "ascii",
+    "InstrumentID": "ascii",
     "HedgeFlag": "char",
     "Direction": "char",
     "TotalAmt": "int",
@@ -5403,8 +5403,8 @@ CThostFtdcSyncDeltaInvstPosCombDtlField = {
 }
 
 CThostFtdcSyncDeltaTradingAccountField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "PreMortgage": "double",
     "PreCredit": "double",
     "PreDeposit": "double",
@@ -5426,7 +5426,7 @@ CThostFtdcSyncDeltaTradingAccountField = {
     "Available": "double",
     "WithdrawQuota": "double",
     "Reserve": "double",
-    "TradingDay": "string",
+    "TradingDay": "ascii",
     "SettlementID": "int",
     "Credit": "double",
     "Mortgage": "double",
@@ -5434,7 +5434,7 @@ CThostFtdcSyncDeltaTradingAccountField = {
     "DeliveryMargin": "double",
     "ExchangeDeliveryMargin": "double",
     "ReserveBalance": "double",
-    "CurrencyID": "string",
+    "CurrencyID": "ascii",
     "PreFundMortgageIn": "double",
     "PreFundMortgageOut": "double",
     "FundMortgageIn": "double",
@@ -5455,8 +5455,8 @@ CThostFtdcSyncDeltaTradingAccountField = {
 }
 
 CThostFtdcSyncDeltaInitInvstMarginField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "LastRiskTotalInvstMargin": "double",
     "LastRiskTotalExchMargin": "double",
     "ThisSyncInvstMargin": "double",
@@ -5473,24 +5473,24 @@ CThostFtdcSyncDeltaInitInvstMarginField = {
 }
 
 CThostFtdcSyncDeltaDceCombInstrumentField = {
-    "CombInstrumentID": "string",
-    "ExchangeID": "string",
-    "ExchangeInstID": "string",
+    "CombInstrumentID": "ascii",
+    "ExchangeID": "ascii",
+    "ExchangeInstID": "ascii",
     "TradeGroupID": "int",
     "CombHedgeFlag": "char",
     "CombinationType": "char",
     "Direction": "char",
-    "ProductID": "string",
+    "ProductID": "ascii",
     "Xparameter": "double",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaInvstMarginRateField = {
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
@@ -5502,8 +5502,8 @@ CThostFtdcSyncDeltaInvstMarginRateField = {
 }
 
 CThostFtdcSyncDeltaExchMarginRateField = {
-    "BrokerID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InstrumentID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
@@ -5514,8 +5514,8 @@ CThostFtdcSyncDeltaExchMarginRateField = {
 }
 
 CThostFtdcSyncDeltaOptExchMarginField = {
-    "BrokerID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InstrumentID": "ascii",
     "SShortMarginRatioByMoney": "double",
     "SShortMarginRatioByVolume": "double",
     "HShortMarginRatioByMoney": "double",
@@ -5529,10 +5529,10 @@ CThostFtdcSyncDeltaOptExchMarginField = {
 }
 
 CThostFtdcSyncDeltaOptInvstMarginField = {
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "SShortMarginRatioByMoney": "double",
     "SShortMarginRatioByVolume": "double",
     "HShortMarginRatioByMoney": "double",
@@ -5547,10 +5547,10 @@ CThostFtdcSyncDeltaOptInvstMarginField = {
 }
 
 CThostFtdcSyncDeltaInvstMarginRateULField = {
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "LongMarginRatioByMoney": "double",
     "LongMarginRatioByVolume": "double",
@@ -5561,10 +5561,10 @@ CThostFtdcSyncDeltaInvstMarginRateULField = {
 }
 
 CThostFtdcSyncDeltaOptInvstCommRateField = {
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
@@ -5578,10 +5578,10 @@ CThostFtdcSyncDeltaOptInvstCommRateField = {
 }
 
 CThostFtdcSyncDeltaInvstCommRateField = {
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "OpenRatioByMoney": "double",
     "OpenRatioByVolume": "double",
     "CloseRatioByMoney": "double",
@@ -5593,18 +5593,18 @@ CThostFtdcSyncDeltaInvstCommRateField = {
 }
 
 CThostFtdcSyncDeltaProductExchRateField = {
-    "ProductID": "string",
-    "QuoteCurrencyID": "string",
+    "ProductID": "ascii",
+    "QuoteCurrencyID": "ascii",
     "ExchangeRate": "double",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaDepthMarketDataField = {
-    "TradingDay": "string",
-    "InstrumentID": "string",
-    "ExchangeID": "string",
-    "ExchangeInstID": "string",
+    "TradingDay": "ascii",
+    "InstrumentID": "ascii",
+    "ExchangeID": "ascii",
+    "ExchangeInstID": "ascii",
     "LastPrice": "double",
     "PreSettlementPrice": "double",
     "PreClosePrice": "double",
@@ -5621,7 +5621,7 @@ CThostFtdcSyncDeltaDepthMarketDataField = {
     "LowerLimitPrice": "double",
     "PreDelta": "double",
     "CurrDelta": "double",
-    "UpdateTime": "string",
+    "UpdateTime": "ascii",
     "UpdateMillisec": "int",
     "BidPrice1": "double",
     "BidVolume1": "int",
@@ -5644,7 +5644,7 @@ CThostFtdcSyncDeltaDepthMarketDataField = {
     "AskPrice5": "double",
     "AskVolume5": "int",
     "AveragePrice": "double",
-    "ActionDay": "string",
+    "ActionDay": "ascii",
     "BandingUpperPrice": "double",
     "BandingLowerPrice": "double",
     "ActionDirection": "char",
@@ -5652,19 +5652,19 @@ CThostFtdcSyncDeltaDepthMarketDataField = {
 }
 
 CThostFtdcSyncDeltaIndexPriceField = {
-    "BrokerID": "string",
-    "InstrumentID": "string",
+    "BrokerID": "ascii",
+    "InstrumentID": "ascii",
     "ClosePrice": "double",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaEWarrantOffsetField = {
-    "TradingDay": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "TradingDay": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
     "Direction": "char",
     "HedgeFlag": "char",
     "Volume": "int",
@@ -5673,10 +5673,10 @@ CThostFtdcSyncDeltaEWarrantOffsetField = {
 }
 
 CThostFtdcSPBMFutureParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "ProdFamilyCode": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "ProdFamilyCode": "ascii",
     "Cvf": "int",
     "TimeRange": "char",
     "MarginRate": "double",
@@ -5687,10 +5687,10 @@ CThostFtdcSPBMFutureParameterField = {
 }
 
 CThostFtdcSPBMOptionParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "ProdFamilyCode": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "ProdFamilyCode": "ascii",
     "Cvf": "int",
     "DownPrice": "double",
     "Delta": "double",
@@ -5699,96 +5699,96 @@ CThostFtdcSPBMOptionParameterField = {
 }
 
 CThostFtdcSPBMIntraParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProdFamilyCode": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProdFamilyCode": "ascii",
     "IntraRateY": "double",
     "AddOnIntraRateY2": "double",
 }
 
 CThostFtdcSPBMInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
     "SpreadId": "int",
     "InterRateZ": "double",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
 }
 
 CThostFtdcSyncSPBMParameterEndField = {
-    "TradingDay": "string",
+    "TradingDay": "ascii",
 }
 
 CThostFtdcQrySPBMFutureParameterField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQrySPBMOptionParameterField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQrySPBMIntraParameterField = {
-    "ExchangeID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQrySPBMInterParameterField = {
-    "ExchangeID": "string",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
 }
 
 CThostFtdcSPBMPortfDefinitionField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "PortfolioDefID": "int",
-    "ProdFamilyCode": "string",
+    "ProdFamilyCode": "ascii",
     "IsSPBM": "int",
 }
 
 CThostFtdcSPBMInvestorPortfDefField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "PortfolioDefID": "int",
 }
 
 CThostFtdcInvestorPortfMarginRatioField = {
     "InvestorRange": "char",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
     "MarginRatio": "double",
-    "ProductGroupID": "string",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcQrySPBMPortfDefinitionField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "PortfolioDefID": "int",
-    "ProdFamilyCode": "string",
+    "ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQrySPBMInvestorPortfDefField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcQryInvestorPortfMarginRatioField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ExchangeID": "string",
-    "ProductGroupID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ExchangeID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcInvestorProdSPBMDetailField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ProdFamilyCode": "ascii",
     "IntraInstrMargin": "double",
     "BCollectingMargin": "double",
     "SCollectingMargin": "double",
@@ -5809,81 +5809,81 @@ CThostFtdcInvestorProdSPBMDetailField = {
 }
 
 CThostFtdcQryInvestorProdSPBMDetailField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ProdFamilyCode": "ascii",
 }
 
 CThostFtdcPortfTradeParamSettingField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "Portfolio": "char",
     "IsActionVerify": "int",
     "IsCloseVerify": "int",
 }
 
 CThostFtdcInvestorTradingRightField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "InvstTradingRight": "char",
 }
 
 CThostFtdcMortgageParamField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "MortgageBalance": "double",
     "CheckMortgageRatio": "int",
 }
 
 CThostFtdcWithDrawParamField = {
-    "BrokerID": "string",
-    "AccountID": "string",
+    "BrokerID": "ascii",
+    "AccountID": "ascii",
     "WithDrawParamID": "char",
     "WithDrawParamValue": "string",
 }
 
 CThostFtdcThostUserFunctionField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
     "ThostFunctionCode": "int",
 }
 
 CThostFtdcQryThostUserFunctionField = {
-    "BrokerID": "string",
-    "UserID": "string",
+    "BrokerID": "ascii",
+    "UserID": "ascii",
 }
 
 CThostFtdcSPBMAddOnInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
     "SpreadId": "int",
     "AddOnInterRateZ2": "double",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQrySPBMAddOnInterParameterField = {
-    "ExchangeID": "string",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQryInvestorCommoditySPMMMarginField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "CommodityID": "string",
 }
 
 CThostFtdcQryInvestorCommodityGroupSPMMMarginField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "CommodityGroupID": "string",
 }
 
 CThostFtdcQrySPMMInstParamField = {
-    "InstrumentID": "string",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQrySPMMProductParamField = {
@@ -5891,9 +5891,9 @@ CThostFtdcQrySPMMProductParamField = {
 }
 
 CThostFtdcInvestorCommoditySPMMMarginField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "CommodityID": "string",
     "MarginBeforeDiscount": "double",
     "MarginNoDiscount": "double",
@@ -5917,9 +5917,9 @@ CThostFtdcInvestorCommoditySPMMMarginField = {
 }
 
 CThostFtdcInvestorCommodityGroupSPMMMarginField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "CommodityGroupID": "string",
     "MarginBeforeDiscount": "double",
     "MarginNoDiscount": "double",
@@ -5941,104 +5941,104 @@ CThostFtdcInvestorCommodityGroupSPMMMarginField = {
 }
 
 CThostFtdcSPMMInstParamField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
     "InstMarginCalID": "char",
     "CommodityID": "string",
     "CommodityGroupID": "string",
 }
 
 CThostFtdcSPMMProductParamField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "ProductID": "string",
     "CommodityID": "string",
     "CommodityGroupID": "string",
 }
 
 CThostFtdcQryTraderAssignField = {
-    "TraderID": "string",
+    "TraderID": "ascii",
 }
 
 CThostFtdcTraderAssignField = {
-    "BrokerID": "string",
-    "ExchangeID": "string",
-    "TraderID": "string",
-    "ParticipantID": "string",
+    "BrokerID": "ascii",
+    "ExchangeID": "ascii",
+    "TraderID": "ascii",
+    "ParticipantID": "ascii",
     "DRIdentityID": "int",
 }
 
 CThostFtdcInvestorInfoCntSettingField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ProductID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ProductID": "ascii",
     "IsCalInfoComm": "int",
     "IsLimitInfoMax": "int",
     "InfoMaxLimit": "int",
 }
 
 CThostFtdcRCAMSCombProductInfoField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProductID": "string",
-    "CombProductID": "string",
-    "ProductGroupID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
+    "CombProductID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcRCAMSInstrParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
     "HedgeRate": "double",
 }
 
 CThostFtdcRCAMSIntraParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "CombProductID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "CombProductID": "ascii",
     "HedgeRate": "double",
 }
 
 CThostFtdcRCAMSInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProductGroupID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProductGroupID": "ascii",
     "Priority": "int",
     "CreditRate": "double",
-    "CombProduct1": "string",
-    "CombProduct2": "string",
+    "CombProduct1": "ascii",
+    "CombProduct2": "ascii",
 }
 
 CThostFtdcRCAMSShortOptAdjustParamField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "CombProductID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "CombProductID": "ascii",
     "HedgeFlag": "char",
     "AdjustValue": "double",
 }
 
 CThostFtdcRCAMSInvestorCombPositionField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InstrumentID": "ascii",
     "HedgeFlag": "char",
     "PosiDirection": "char",
-    "CombInstrumentID": "string",
+    "CombInstrumentID": "ascii",
     "LegID": "int",
-    "ExchangeInstID": "string",
+    "ExchangeInstID": "ascii",
     "TotalAmt": "int",
     "ExchMargin": "double",
     "Margin": "double",
 }
 
 CThostFtdcInvestorProdRCAMSMarginField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "CombProductID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "CombProductID": "ascii",
     "HedgeFlag": "char",
-    "ProductGroupID": "string",
+    "ProductGroupID": "ascii",
     "RiskBeforeDiscount": "double",
     "IntraInstrRisk": "double",
     "BPosRisk": "double",
@@ -6063,49 +6063,49 @@ CThostFtdcInvestorProdRCAMSMarginField = {
 }
 
 CThostFtdcQryRCAMSCombProductInfoField = {
-    "ProductID": "string",
-    "CombProductID": "string",
-    "ProductGroupID": "string",
+    "ProductID": "ascii",
+    "CombProductID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcQryRCAMSInstrParameterField = {
-    "ProductID": "string",
+    "ProductID": "ascii",
 }
 
 CThostFtdcQryRCAMSIntraParameterField = {
-    "CombProductID": "string",
+    "CombProductID": "ascii",
 }
 
 CThostFtdcQryRCAMSInterParameterField = {
-    "ProductGroupID": "string",
-    "CombProduct1": "string",
-    "CombProduct2": "string",
+    "ProductGroupID": "ascii",
+    "CombProduct1": "ascii",
+    "CombProduct2": "ascii",
 }
 
 CThostFtdcQryRCAMSShortOptAdjustParamField = {
-    "CombProductID": "string",
+    "CombProductID": "ascii",
 }
 
 CThostFtdcQryRCAMSInvestorCombPositionField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InstrumentID": "string",
-    "CombInstrumentID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InstrumentID": "ascii",
+    "CombInstrumentID": "ascii",
 }
 
 CThostFtdcQryInvestorProdRCAMSMarginField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "CombProductID": "string",
-    "ProductGroupID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "CombProductID": "ascii",
+    "ProductGroupID": "ascii",
 }
 
 CThostFtdcRULEInstrParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
     "InstrumentClass": "char",
-    "StdInstrumentID": "string",
+    "StdInstrumentID": "ascii",
     "BSpecRatio": "double",
     "SSpecRatio": "double",
     "BHedgeRatio": "double",
@@ -6116,22 +6116,22 @@ CThostFtdcRULEInstrParameterField = {
 }
 
 CThostFtdcRULEIntraParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProdFamilyCode": "string",
-    "StdInstrumentID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProdFamilyCode": "ascii",
+    "StdInstrumentID": "ascii",
     "StdInstrMargin": "double",
     "UsualIntraRate": "double",
     "DeliveryIntraRate": "double",
 }
 
 CThostFtdcRULEInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
     "SpreadId": "int",
     "InterRate": "double",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
     "Leg1PropFactor": "int",
     "Leg2PropFactor": "int",
     "CommodityGroupID": "int",
@@ -6139,27 +6139,27 @@ CThostFtdcRULEInterParameterField = {
 }
 
 CThostFtdcQryRULEInstrParameterField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
 }
 
 CThostFtdcQryRULEIntraParameterField = {
-    "ExchangeID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "ProdFamilyCode": "ascii",
 }
 
 CThostFtdcQryRULEInterParameterField = {
-    "ExchangeID": "string",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
     "CommodityGroupID": "int",
 }
 
 CThostFtdcInvestorProdRULEMarginField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ProdFamilyCode": "ascii",
     "InstrumentClass": "char",
     "CommodityGroupID": "int",
     "BStdPosition": "double",
@@ -6186,36 +6186,36 @@ CThostFtdcInvestorProdRULEMarginField = {
 }
 
 CThostFtdcQryInvestorProdRULEMarginField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "ProdFamilyCode": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "ProdFamilyCode": "ascii",
     "CommodityGroupID": "int",
 }
 
 CThostFtdcSyncDeltaSPBMPortfDefinitionField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "PortfolioDefID": "int",
-    "ProdFamilyCode": "string",
+    "ProdFamilyCode": "ascii",
     "IsSPBM": "int",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaSPBMInvstPortfDefField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "PortfolioDefID": "int",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaSPBMFutureParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "ProdFamilyCode": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "ProdFamilyCode": "ascii",
     "Cvf": "int",
     "TimeRange": "char",
     "MarginRate": "double",
@@ -6228,10 +6228,10 @@ CThostFtdcSyncDeltaSPBMFutureParameterField = {
 }
 
 CThostFtdcSyncDeltaSPBMOptionParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
-    "ProdFamilyCode": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
+    "ProdFamilyCode": "ascii",
     "Cvf": "int",
     "DownPrice": "double",
     "Delta": "double",
@@ -6242,9 +6242,9 @@ CThostFtdcSyncDeltaSPBMOptionParameterField = {
 }
 
 CThostFtdcSyncDeltaSPBMIntraParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProdFamilyCode": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProdFamilyCode": "ascii",
     "IntraRateY": "double",
     "AddOnIntraRateY2": "double",
     "ActionDirection": "char",
@@ -6252,30 +6252,30 @@ CThostFtdcSyncDeltaSPBMIntraParameterField = {
 }
 
 CThostFtdcSyncDeltaSPBMInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
     "SpreadId": "int",
     "InterRateZ": "double",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaSPBMAddOnInterParamField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
     "SpreadId": "int",
     "AddOnInterRateZ2": "double",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaSPMMInstParamField = {
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
     "InstMarginCalID": "char",
     "CommodityID": "string",
     "CommodityGroupID": "string",
@@ -6284,7 +6284,7 @@ CThostFtdcSyncDeltaSPMMInstParamField = {
 }
 
 CThostFtdcSyncDeltaSPMMProductParamField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "ProductID": "string",
     "CommodityID": "string",
     "CommodityGroupID": "string",
@@ -6293,16 +6293,16 @@ CThostFtdcSyncDeltaSPMMProductParamField = {
 }
 
 CThostFtdcSyncDeltaInvestorSPMMModelField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "SPMMModelID": "string",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaSPMMModelParamField = {
-    "ExchangeID": "string",
+    "ExchangeID": "ascii",
     "SPMMModelID": "string",
     "CommodityGroupID": "string",
     "IntraCommodityRate": "double",
@@ -6314,49 +6314,49 @@ CThostFtdcSyncDeltaSPMMModelParamField = {
 }
 
 CThostFtdcSyncDeltaRCAMSCombProdInfoField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProductID": "string",
-    "CombProductID": "string",
-    "ProductGroupID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
+    "CombProductID": "ascii",
+    "ProductGroupID": "ascii",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaRCAMSInstrParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProductID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProductID": "ascii",
     "HedgeRate": "double",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaRCAMSIntraParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "CombProductID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "CombProductID": "ascii",
     "HedgeRate": "double",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaRCAMSInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProductGroupID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProductGroupID": "ascii",
     "Priority": "int",
     "CreditRate": "double",
-    "CombProduct1": "string",
-    "CombProduct2": "string",
+    "CombProduct1": "ascii",
+    "CombProduct2": "ascii",
     "ActionDirection": "char",
     "SyncDeltaSequenceNo": "int",
 }
 
 CThostFtdcSyncDeltaRCAMSSOptAdjParamField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "CombProductID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "CombProductID": "ascii",
     "HedgeFlag": "char",
     "AdjustValue": "double",
     "ActionDirection": "char",
@@ -6364,16 +6364,16 @@ CThostFtdcSyncDeltaRCAMSSOptAdjParamField = {
 }
 
 CThostFtdcSyncDeltaRCAMSCombRuleDtlField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProdGroup": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProdGroup": "ascii",
     "RuleId": "string",
     "Priority": "int",
     "HedgeFlag": "char",
     "CombMargin": "double",
-    "ExchangeInstID": "string",
+    "ExchangeInstID": "ascii",
     "LegID": "int",
-    "LegInstrumentID": "string",
+    "LegInstrumentID": "ascii",
     "Direction": "char",
     "LegMultiple": "int",
     "ActionDirection": "char",
@@ -6381,15 +6381,15 @@ CThostFtdcSyncDeltaRCAMSCombRuleDtlField = {
 }
 
 CThostFtdcSyncDeltaRCAMSInvstCombPosField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "InstrumentID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "InstrumentID": "ascii",
     "HedgeFlag": "char",
     "PosiDirection": "char",
-    "CombInstrumentID": "string",
+    "CombInstrumentID": "ascii",
     "LegID": "int",
-    "ExchangeInstID": "string",
+    "ExchangeInstID": "ascii",
     "TotalAmt": "int",
     "ExchMargin": "double",
     "Margin": "double",
@@ -6398,11 +6398,11 @@ CThostFtdcSyncDeltaRCAMSInvstCombPosField = {
 }
 
 CThostFtdcSyncDeltaRULEInstrParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "InstrumentID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "InstrumentID": "ascii",
     "InstrumentClass": "char",
-    "StdInstrumentID": "string",
+    "StdInstrumentID": "ascii",
     "BSpecRatio": "double",
     "SSpecRatio": "double",
     "BHedgeRatio": "double",
@@ -6415,10 +6415,10 @@ CThostFtdcSyncDeltaRULEInstrParameterField = {
 }
 
 CThostFtdcSyncDeltaRULEIntraParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
-    "ProdFamilyCode": "string",
-    "StdInstrumentID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
+    "ProdFamilyCode": "ascii",
+    "StdInstrumentID": "ascii",
     "StdInstrMargin": "double",
     "UsualIntraRate": "double",
     "DeliveryIntraRate": "double",
@@ -6427,12 +6427,12 @@ CThostFtdcSyncDeltaRULEIntraParameterField = {
 }
 
 CThostFtdcSyncDeltaRULEInterParameterField = {
-    "TradingDay": "string",
-    "ExchangeID": "string",
+    "TradingDay": "ascii",
+    "ExchangeID": "ascii",
     "SpreadId": "int",
     "InterRate": "double",
-    "Leg1ProdFamilyCode": "string",
-    "Leg2ProdFamilyCode": "string",
+    "Leg1ProdFamilyCode": "ascii",
+    "Leg2ProdFamilyCode": "ascii",
     "Leg1PropFactor": "int",
     "Leg2PropFactor": "int",
     "CommodityGroupID": "int",
@@ -6442,27 +6442,27 @@ CThostFtdcSyncDeltaRULEInterParameterField = {
 }
 
 CThostFtdcExitEmergencyField = {
-    "BrokerID": "string",
+    "BrokerID": "ascii",
 }
 
 CThostFtdcInvestorPortfMarginModelField = {
-    "BrokerID": "string",
-    "InvestorID": "string",
-    "MarginModelID": "string",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
+    "MarginModelID": "ascii",
 }
 
 CThostFtdcInvestorPortfSettingField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
     "HedgeFlag": "char",
     "UsePortf": "int",
 }
 
 CThostFtdcQryInvestorPortfSettingField = {
-    "ExchangeID": "string",
-    "BrokerID": "string",
-    "InvestorID": "string",
+    "ExchangeID": "ascii",
+    "BrokerID": "ascii",
+    "InvestorID": "ascii",
 }
 
 CThostFtdcFrontInfoField = {
@@ -153,3 +153,4 @@
 #define ONRSPQRYRULEINTERPARAMETER 152
 #define ONRSPQRYINVESTORPRODRULEMARGIN 153
 #define ONRSPQRYINVESTORPORTFSETTING 154
+#define CALLBACK_COUNT 155
@@ -0,0 +1,281 @@
+TaskPool<CThostFtdcRspAuthenticateField> pool_RspAuthenticate;
+TaskPool<CThostFtdcRspInfoField> pool_RspInfo;
+TaskPool<CThostFtdcRspUserLoginField> pool_RspUserLogin;
+TaskPool<CThostFtdcUserLogoutField> pool_UserLogout;
+TaskPool<CThostFtdcUserPasswordUpdateField> pool_UserPasswordUpdate;
+TaskPool<CThostFtdcTradingAccountPasswordUpdateField> pool_TradingAccountPasswordUpdate;
+TaskPool<CThostFtdcRspUserAuthMethodField> pool_RspUserAuthMethod;
+TaskPool<CThostFtdcRspGenUserCaptchaField> pool_RspGenUserCaptcha;
+TaskPool<CThostFtdcRspGenUserTextField> pool_RspGenUserText;
+TaskPool<CThostFtdcInputOrderField> pool_InputOrder;
+TaskPool<CThostFtdcParkedOrderField> pool_ParkedOrder;
+TaskPool<CThostFtdcParkedOrderActionField> pool_ParkedOrderAction;
+TaskPool<CThostFtdcInputOrderActionField> pool_InputOrderAction;
+TaskPool<CThostFtdcQryMaxOrderVolumeField> pool_QryMaxOrderVolume;
+TaskPool<CThostFtdcSettlementInfoConfirmField> pool_SettlementInfoConfirm;
+TaskPool<CThostFtdcRemoveParkedOrderField> pool_RemoveParkedOrder;
+TaskPool<CThostFtdcRemoveParkedOrderActionField> pool_RemoveParkedOrderAction;
+TaskPool<CThostFtdcInputExecOrderField> pool_InputExecOrder;
+TaskPool<CThostFtdcInputExecOrderActionField> pool_InputExecOrderAction;
+TaskPool<CThostFtdcInputForQuoteField> pool_InputForQuote;
+TaskPool<CThostFtdcInputQuoteField> pool_InputQuote;
+TaskPool<CThostFtdcInputQuoteActionField> pool_InputQuoteAction;
+TaskPool<CThostFtdcInputBatchOrderActionField> pool_InputBatchOrderAction;
+TaskPool<CThostFtdcInputOptionSelfCloseField> pool_InputOptionSelfClose;
+TaskPool<CThostFtdcInputOptionSelfCloseActionField> pool_InputOptionSelfCloseAction;
+TaskPool<CThostFtdcInputCombActionField> pool_InputCombAction;
+TaskPool<CThostFtdcOrderField> pool_Order;
+TaskPool<CThostFtdcTradeField> pool_Trade;
+TaskPool<CThostFtdcInvestorPositionField> pool_InvestorPosition;
+TaskPool<CThostFtdcTradingAccountField> pool_TradingAccount;
+TaskPool<CThostFtdcInvestorField> pool_Investor;
+TaskPool<CThostFtdcTradingCodeField> pool_TradingCode;
+TaskPool<CThostFtdcInstrumentMarginRateField> pool_InstrumentMarginRate;
+TaskPool<CThostFtdcInstrumentCommissionRateField> pool_InstrumentCommissionRate;
+TaskPool<CThostFtdcExchangeField> pool_Exchange;
+TaskPool<CThostFtdcProductField> pool_Product;
+TaskPool<CThostFtdcInstrumentField> pool_Instrument;
+TaskPool<CThostFtdcDepthMarketDataField> pool_DepthMarketData;
+TaskPool<CThostFtdcTraderOfferField> pool_TraderOffer;
+TaskPool<CThostFtdcSettlementInfoField> pool_SettlementInfo;
+TaskPool<CThostFtdcTransferBankField> pool_TransferBank;
+TaskPool<CThostFtdcInvestorPositionDetailField> pool_InvestorPositionDetail;
+TaskPool<CThostFtdcNoticeField> pool_Notice;
+TaskPool<CThostFtdcInvestorPositionCombineDetailField> pool_InvestorPositionCombineDetail;
+TaskPool<CThostFtdcCFMMCTradingAccountKeyField> pool_CFMMCTradingAccountKey;
+TaskPool<CThostFtdcEWarrantOffsetField> pool_EWarrantOffset;
+TaskPool<CThostFtdcInvestorProductGroupMarginField> pool_InvestorProductGroupMargin;
+TaskPool<CThostFtdcExchangeMarginRateField> pool_ExchangeMarginRate;
+TaskPool<CThostFtdcExchangeMarginRateAdjustField> pool_ExchangeMarginRateAdjust;
+TaskPool<CThostFtdcExchangeRateField> pool_ExchangeRate;
+TaskPool<CThostFtdcSecAgentACIDMapField> pool_SecAgentACIDMap;
+TaskPool<CThostFtdcProductExchRateField> pool_ProductExchRate;
+TaskPool<CThostFtdcProductGroupField> pool_ProductGroup;
+TaskPool<CThostFtdcMMInstrumentCommissionRateField> pool_MMInstrumentCommissionRate;
+TaskPool<CThostFtdcMMOptionInstrCommRateField> pool_MMOptionInstrCommRate;
+TaskPool<CThostFtdcInstrumentOrderCommRateField> pool_InstrumentOrderCommRate;
+TaskPool<CThostFtdcSecAgentCheckModeField> pool_SecAgentCheckMode;
+TaskPool<CThostFtdcSecAgentTradeInfoField> pool_SecAgentTradeInfo;
+TaskPool<CThostFtdcOptionInstrTradeCostField> pool_OptionInstrTradeCost;
+TaskPool<CThostFtdcOptionInstrCommRateField> pool_OptionInstrCommRate;
+TaskPool<CThostFtdcExecOrderField> pool_ExecOrder;
+TaskPool<CThostFtdcForQuoteField> pool_ForQuote;
+TaskPool<CThostFtdcQuoteField> pool_Quote;
+TaskPool<CThostFtdcOptionSelfCloseField> pool_OptionSelfClose;
+TaskPool<CThostFtdcInvestUnitField> pool_InvestUnit;
+TaskPool<CThostFtdcCombInstrumentGuardField> pool_CombInstrumentGuard;
+TaskPool<CThostFtdcCombActionField> pool_CombAction;
+TaskPool<CThostFtdcTransferSerialField> pool_TransferSerial;
+TaskPool<CThostFtdcAccountregisterField> pool_Accountregister;
+TaskPool<CThostFtdcOrderActionField> pool_OrderAction;
+TaskPool<CThostFtdcInstrumentStatusField> pool_InstrumentStatus;
+TaskPool<CThostFtdcBulletinField> pool_Bulletin;
+TaskPool<CThostFtdcTradingNoticeInfoField> pool_TradingNoticeInfo;
+TaskPool<CThostFtdcErrorConditionalOrderField> pool_ErrorConditionalOrder;
+TaskPool<CThostFtdcExecOrderActionField> pool_ExecOrderAction;
+TaskPool<CThostFtdcQuoteActionField> pool_QuoteAction;
+TaskPool<CThostFtdcForQuoteRspField> pool_ForQuoteRsp;
+TaskPool<CThostFtdcCFMMCTradingAccountTokenField> pool_CFMMCTradingAccountToken;
+TaskPool<CThostFtdcBatchOrderActionField> pool_BatchOrderAction;
+TaskPool<CThostFtdcOptionSelfCloseActionField> pool_OptionSelfCloseAction;
+TaskPool<CThostFtdcContractBankField> pool_ContractBank;
+TaskPool<CThostFtdcTradingNoticeField> pool_TradingNotice;
+TaskPool<CThostFtdcBrokerTradingParamsField> pool_BrokerTradingParams;
+TaskPool<CThostFtdcBrokerTradingAlgosField> pool_BrokerTradingAlgos;
+TaskPool<CThostFtdcQueryCFMMCTradingAccountTokenField> pool_QueryCFMMCTradingAccountToken;
+TaskPool<CThostFtdcRspTransferField> pool_RspTransfer;
+TaskPool<CThostFtdcRspRepealField> pool_RspRepeal;
+TaskPool<CThostFtdcNotifyQueryAccountField> pool_NotifyQueryAccount;
+TaskPool<CThostFtdcReqTransferField> pool_ReqTransfer;
+TaskPool<CThostFtdcReqRepealField> pool_ReqRepeal;
+TaskPool<CThostFtdcReqQueryAccountField> pool_ReqQueryAccount;
+TaskPool<CThostFtdcOpenAccountField> pool_OpenAccount;
+TaskPool<CThostFtdcCancelAccountField> pool_CancelAccount;
+TaskPool<CThostFtdcChangeAccountField> pool_ChangeAccount;
+TaskPool<CThostFtdcCombPromotionParamField> pool_CombPromotionParam;
+TaskPool<CThostFtdcRiskSettleInvstPositionField> pool_RiskSettleInvstPosition;
+TaskPool<CThostFtdcRiskSettleProductStatusField> pool_RiskSettleProductStatus;
+TaskPool<CThostFtdcSPBMFutureParameterField> pool_SPBMFutureParameter;
+TaskPool<CThostFtdcSPBMOptionParameterField> pool_SPBMOptionParameter;
+TaskPool<CThostFtdcSPBMIntraParameterField> pool_SPBMIntraParameter;
+TaskPool<CThostFtdcSPBMInterParameterField> pool_SPBMInterParameter;
+TaskPool<CThostFtdcSPBMPortfDefinitionField> pool_SPBMPortfDefinition;
+TaskPool<CThostFtdcSPBMInvestorPortfDefField> pool_SPBMInvestorPortfDef;
+TaskPool<CThostFtdcInvestorPortfMarginRatioField> pool_InvestorPortfMarginRatio;
+TaskPool<CThostFtdcInvestorProdSPBMDetailField> pool_InvestorProdSPBMDetail;
+TaskPool<CThostFtdcInvestorCommoditySPMMMarginField> pool_InvestorCommoditySPMMMargin;
+TaskPool<CThostFtdcInvestorCommodityGroupSPMMMarginField> pool_InvestorCommodityGroupSPMMMargin;
+TaskPool<CThostFtdcSPMMInstParamField> pool_SPMMInstParam;
+TaskPool<CThostFtdcSPMMProductParamField> pool_SPMMProductParam;
+TaskPool<CThostFtdcSPBMAddOnInterParameterField> pool_SPBMAddOnInterParameter;
+TaskPool<CThostFtdcRCAMSCombProductInfoField> pool_RCAMSCombProductInfo;
+TaskPool<CThostFtdcRCAMSInstrParameterField> pool_RCAMSInstrParameter;
+TaskPool<CThostFtdcRCAMSIntraParameterField> pool_RCAMSIntraParameter;
+TaskPool<CThostFtdcRCAMSInterParameterField> pool_RCAMSInterParameter;
+TaskPool<CThostFtdcRCAMSShortOptAdjustParamField> pool_RCAMSShortOptAdjustParam;
+TaskPool<CThostFtdcRCAMSInvestorCombPositionField> pool_RCAMSInvestorCombPosition;
+TaskPool<CThostFtdcInvestorProdRCAMSMarginField> pool_InvestorProdRCAMSMargin;
+TaskPool<CThostFtdcRULEInstrParameterField> pool_RULEInstrParameter;
+TaskPool<CThostFtdcRULEIntraParameterField> pool_RULEIntraParameter;
+TaskPool<CThostFtdcRULEInterParameterField> pool_RULEInterParameter;
+TaskPool<CThostFtdcInvestorProdRULEMarginField> pool_InvestorProdRULEMargin;
+TaskPool<CThostFtdcInvestorPortfSettingField> pool_InvestorPortfSetting;
+
+//各回调数据结构体对应的内存池（没有数据参数的回调为空）
+TaskPoolBase *data_pools[CALLBACK_COUNT] = {
+	nullptr,
+	nullptr,
+	nullptr,
+	&pool_RspAuthenticate,
+	&pool_RspUserLogin,
+	&pool_UserLogout,
+	&pool_UserPasswordUpdate,
+	&pool_TradingAccountPasswordUpdate,
+	&pool_RspUserAuthMethod,
+	&pool_RspGenUserCaptcha,
+	&pool_RspGenUserText,
+	&pool_InputOrder,
+	&pool_ParkedOrder,
+	&pool_ParkedOrderAction,
+	&pool_InputOrderAction,
+	&pool_QryMaxOrderVolume,
+	&pool_SettlementInfoConfirm,
+	&pool_RemoveParkedOrder,
+	&pool_RemoveParkedOrderAction,
+	&pool_InputExecOrder,
+	&pool_InputExecOrderAction,
+	&pool_InputForQuote,
+	&pool_InputQuote,
+	&pool_InputQuoteAction,
+	&pool_InputBatchOrderAction,
+	&pool_InputOptionSelfClose,
+	&pool_InputOptionSelfCloseAction,
+	&pool_InputCombAction,
+	&pool_Order,
+	&pool_Trade,
+	&pool_InvestorPosition,
+	&pool_TradingAccount,
+	&pool_Investor,
+	&pool_TradingCode,
+	&pool_InstrumentMarginRate,
+	&pool_InstrumentCommissionRate,
+	&pool_Exchange,
+	&pool_Product,
+	&pool_Instrument,
+	&pool_DepthMarketData,
+	&pool_TraderOffer,
+	&pool_SettlementInfo,
+	&pool_TransferBank,
+	&pool_InvestorPositionDetail,
+	&pool_Notice,
+	&pool_SettlementInfoConfirm,
+	&pool_InvestorPositionCombineDetail,
+	&pool_CFMMCTradingAccountKey,
+	&pool_EWarrantOffset,
+	&pool_InvestorProductGroupMargin,
+	&pool_ExchangeMarginRate,
+	&pool_ExchangeMarginRateAdjust,
+	&pool_ExchangeRate,
+	&pool_SecAgentACIDMap,
+	&pool_ProductExchRate,
+	&pool_ProductGroup,
+	&pool_MMInstrumentCommissionRate,
+	&pool_MMOptionInstrCommRate,
+	&pool_InstrumentOrderCommRate,
+	&pool_TradingAccount,
+	&pool_SecAgentCheckMode,
+	&pool_SecAgentTradeInfo,
+	&pool_OptionInstrTradeCost,
+	&pool_OptionInstrCommRate,
+	&pool_ExecOrder,
+	&pool_ForQuote,
+	&pool_Quote,
+	&pool_OptionSelfClose,
+	&pool_InvestUnit,
+	&pool_CombInstrumentGuard,
+	&pool_CombAction,
+	&pool_TransferSerial,
+	&pool_Accountregister,
+	nullptr,
+	&pool_Order,
+	&pool_Trade,
+	&pool_InputOrder,
+	&pool_OrderAction,
+	&pool_InstrumentStatus,
+	&pool_Bulletin,
+	&pool_TradingNoticeInfo,
+	&pool_ErrorConditionalOrder,
+	&pool_ExecOrder,
+	&pool_InputExecOrder,
+	&pool_ExecOrderAction,
+	&pool_InputForQuote,
+	&pool_Quote,
+	&pool_InputQuote,
+	&pool_QuoteAction,
+	&pool_ForQuoteRsp,
+	&pool_CFMMCTradingAccountToken,
+	&pool_BatchOrderAction,
+	&pool_OptionSelfClose,
+	&pool_InputOptionSelfClose,
+	&pool_OptionSelfCloseAction,
+	&pool_CombAction,
+	&pool_InputCombAction,
+	&pool_ContractBank,
+	&pool_ParkedOrder,
+	&pool_ParkedOrderAction,
+	&pool_TradingNotice,
+	&pool_BrokerTradingParams,
+	&pool_BrokerTradingAlgos,
+	&pool_QueryCFMMCTradingAccountToken,
+	&pool_RspTransfer,
+	&pool_RspTransfer,
+	&pool_RspRepeal,
+	&pool_RspRepeal,
+	&pool_RspTransfer,
+	&pool_RspTransfer,
+	&pool_RspRepeal,
+	&pool_RspRepeal,
+	&pool_NotifyQueryAccount,
+	&pool_ReqTransfer,
+	&pool_ReqTransfer,
+	&pool_ReqRepeal,
+	&pool_ReqRepeal,
+	&pool_ReqQueryAccount,
+	&pool_RspRepeal,
+	&pool_RspRepeal,
+	&pool_ReqTransfer,
+	&pool_ReqTransfer,
+	&pool_ReqQueryAccount,
+	&pool_OpenAccount,
+	&pool_CancelAccount,
+	&pool_ChangeAccount,
+	&pool_Instrument,
+	&pool_CombPromotionParam,
+	&pool_RiskSettleInvstPosition,
+	&pool_RiskSettleProductStatus,
+	&pool_SPBMFutureParameter,
+	&pool_SPBMOptionParameter,
+	&pool_SPBMIntraParameter,
+	&pool_SPBMInterParameter,
+	&pool_SPBMPortfDefinition,
+	&pool_SPBMInvestorPortfDef,
+	&pool_InvestorPortfMarginRatio,
+	&pool_InvestorProdSPBMDetail,
+	&pool_InvestorCommoditySPMMMargin,
+	&pool_InvestorCommodityGroupSPMMMargin,
+	&pool_SPMMInstParam,
+	&pool_SPMMProductParam,
+	&pool_SPBMAddOnInterParameter,
+	&pool_RCAMSCombProductInfo,
+	&pool_RCAMSInstrParameter,
+	&pool_RCAMSIntraParameter,
+	&pool_RCAMSInterParameter,
+	&pool_RCAMSShortOptAdjustParam,
+	&pool_RCAMSInvestorCombPosition,
+	&pool_InvestorProdRCAMSMargin,
+	&pool_RULEInstrParameter,
+	&pool_RULEIntraParameter,
+	&pool_RULEInterParameter,
+	&pool_InvestorProdRULEMargin,
+	&pool_InvestorPortfSetting,
+};
@@ -2,11 +2,11 @@ int TdApi::reqAuthenticate(const dict &req, int reqid)
 {
 	CThostFtdcReqAuthenticateField myreq = CThostFtdcReqAuthenticateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "AuthCode", myreq.AuthCode);
-	getString(req, "AppID", myreq.AppID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqAuthenticateFields, &myreq);
+	else
+		dictToStruct(req, ReqAuthenticateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqAuthenticate(&myreq, reqid);
 	return i;
 };
@@ -15,19 +15,11 @@ int TdApi::reqUserLogin(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginField myreq = CThostFtdcReqUserLoginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "Password", myreq.Password);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "InterfaceProductInfo", myreq.InterfaceProductInfo);
-	getString(req, "ProtocolInfo", myreq.ProtocolInfo);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "OneTimePassword", myreq.OneTimePassword);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "LoginRemark", myreq.LoginRemark);
-	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
-	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserLoginFields, &myreq);
+	else
+		dictToStruct(req, ReqUserLoginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogin(&myreq, reqid);
 	return i;
 };
@@ -36,8 +28,11 @@ int TdApi::reqUserLogout(const dict &req, int reqid)
 {
 	CThostFtdcUserLogoutField myreq = CThostFtdcUserLogoutField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, UserLogoutFields, &myreq);
+	else
+		dictToStruct(req, UserLogoutFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogout(&myreq, reqid);
 	return i;
 };
@@ -46,10 +41,11 @@ int TdApi::reqUserPasswordUpdate(const dict &req, int reqid)
 {
 	CThostFtdcUserPasswordUpdateField myreq = CThostFtdcUserPasswordUpdateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "OldPassword", myreq.OldPassword);
-	getString(req, "NewPassword", myreq.NewPassword);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, UserPasswordUpdateFields, &myreq);
+	else
+		dictToStruct(req, UserPasswordUpdateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserPasswordUpdate(&myreq, reqid);
 	return i;
 };
@@ -58,11 +54,11 @@ int TdApi::reqTradingAccountPasswordUpdate(const dict &req, int reqid)
 {
 	CThostFtdcTradingAccountPasswordUpdateField myreq = CThostFtdcTradingAccountPasswordUpdateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "OldPassword", myreq.OldPassword);
-	getString(req, "NewPassword", myreq.NewPassword);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, TradingAccountPasswordUpdateFields, &myreq);
+	else
+		dictToStruct(req, TradingAccountPasswordUpdateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqTradingAccountPasswordUpdate(&myreq, reqid);
 	return i;
 };
@@ -71,9 +67,11 @@ int TdApi::reqUserAuthMethod(const dict &req, int reqid)
 {
 	CThostFtdcReqUserAuthMethodField myreq = CThostFtdcReqUserAuthMethodField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserAuthMethodFields, &myreq);
+	else
+		dictToStruct(req, ReqUserAuthMethodFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserAuthMethod(&myreq, reqid);
 	return i;
 };
@@ -82,9 +80,11 @@ int TdApi::reqGenUserCaptcha(const dict &req, int reqid)
 {
 	CThostFtdcReqGenUserCaptchaField myreq = CThostFtdcReqGenUserCaptchaField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqGenUserCaptchaFields, &myreq);
+	else
+		dictToStruct(req, ReqGenUserCaptchaFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqGenUserCaptcha(&myreq, reqid);
 	return i;
 };
@@ -93,9 +93,11 @@ int TdApi::reqGenUserText(const dict &req, int reqid)
 {
 	CThostFtdcReqGenUserTextField myreq = CThostFtdcReqGenUserTextField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqGenUserTextFields, &myreq);
+	else
+		dictToStruct(req, ReqGenUserTextFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqGenUserText(&myreq, reqid);
 	return i;
 };
@@ -104,19 +106,11 @@ int TdApi::reqUserLoginWithCaptcha(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginWithCaptchaField myreq = CThostFtdcReqUserLoginWithCaptchaField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "Password", myreq.Password);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "InterfaceProductInfo", myreq.InterfaceProductInfo);
-	getString(req, "ProtocolInfo", myreq.ProtocolInfo);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "LoginRemark", myreq.LoginRemark);
-	getString(req, "Captcha", myreq.Captcha);
-	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
-	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserLoginWithCaptchaFields, &myreq);
+	else
+		dictToStruct(req, ReqUserLoginWithCaptchaFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLoginWithCaptcha(&myreq, reqid);
 	return i;
 };
@@ -125,19 +119,11 @@ int TdApi::reqUserLoginWithText(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginWithTextField myreq = CThostFtdcReqUserLoginWithTextField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "Password", myreq.Password);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "InterfaceProductInfo", myreq.InterfaceProductInfo);
-	getString(req, "ProtocolInfo", myreq.ProtocolInfo);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "LoginRemark", myreq.LoginRemark);
-	getString(req, "Text", myreq.Text);
-	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
-	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserLoginWithTextFields, &myreq);
+	else
+		dictToStruct(req, ReqUserLoginWithTextFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLoginWithText(&myreq, reqid);
 	return i;
 };
@@ -146,19 +132,11 @@ int TdApi::reqUserLoginWithOTP(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginWithOTPField myreq = CThostFtdcReqUserLoginWithOTPField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "Password", myreq.Password);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "InterfaceProductInfo", myreq.InterfaceProductInfo);
-	getString(req, "ProtocolInfo", myreq.ProtocolInfo);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "LoginRemark", myreq.LoginRemark);
-	getString(req, "OTPPassword", myreq.OTPPassword);
-	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
-	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserLoginWithOTPFields, &myreq);
+	else
+		dictToStruct(req, ReqUserLoginWithOTPFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLoginWithOTP(&myreq, reqid);
 	return i;
 };
@@ -167,40 +145,11 @@ int TdApi::reqOrderInsert(const dict &req, int reqid)
 {
 	CThostFtdcInputOrderField myreq = CThostFtdcInputOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "OrderRef", myreq.OrderRef);
-	getString(req, "UserID", myreq.UserID);
-	getChar(req, "OrderPriceType", &myreq.OrderPriceType);
-	getChar(req, "Direction", &myreq.Direction);
-	getString(req, "CombOffsetFlag", myreq.CombOffsetFlag);
-	getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
-	getDouble(req, "LimitPrice", &myreq.LimitPrice);
-	getInt(req, "VolumeTotalOriginal", &myreq.VolumeTotalOriginal);
-	getChar(req, "TimeCondition", &myreq.TimeCondition);
-	getString(req, "GTDDate", myreq.GTDDate);
-	getChar(req, "VolumeCondition", &myreq.VolumeCondition);
-	getInt(req, "MinVolume", &myreq.MinVolume);
-	getChar(req, "ContingentCondition", &myreq.ContingentCondition);
-	getDouble(req, "StopPrice", &myreq.StopPrice);
-	getChar(req, "ForceCloseReason", &myreq.ForceCloseReason);
-	getInt(req, "IsAutoSuspend", &myreq.IsAutoSuspend);
-	getString(req, "BusinessUnit", myreq.BusinessUnit);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "UserForceClose", &myreq.UserForceClose);
-	getInt(req, "IsSwapOrder", &myreq.IsSwapOrder);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getString(req, "ClientID", myreq.ClientID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
-	getString(req, "OrderMemo", myreq.OrderMemo);
-	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputOrderFields, &myreq);
+	else
+		dictToStruct(req, InputOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -209,43 +158,11 @@ int TdApi::reqParkedOrderInsert(const dict &req, int reqid)
 {
 	CThostFtdcParkedOrderField myreq = CThostFtdcParkedOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "OrderRef", myreq.OrderRef);
-	getString(req, "UserID", myreq.UserID);
-	getChar(req, "OrderPriceType", &myreq.OrderPriceType);
-	getChar(req, "Direction", &myreq.Direction);
-	getString(req, "CombOffsetFlag", myreq.CombOffsetFlag);
-	getString(req, "CombHedgeFlag", myreq.CombHedgeFlag);
-	getDouble(req, "LimitPrice", &myreq.LimitPrice);
-	getInt(req, "VolumeTotalOriginal", &myreq.VolumeTotalOriginal);
-	getChar(req, "TimeCondition", &myreq.TimeCondition);
-	getString(req, "GTDDate", myreq.GTDDate);
-	getChar(req, "VolumeCondition", &myreq.VolumeCondition);
-	getInt(req, "MinVolume", &myreq.MinVolume);
-	getChar(req, "ContingentCondition", &myreq.ContingentCondition);
-	getDouble(req, "StopPrice", &myreq.StopPrice);
-	getChar(req, "ForceCloseReason", &myreq.ForceCloseReason);
-	getInt(req, "IsAutoSuspend", &myreq.IsAutoSuspend);
-	getString(req, "BusinessUnit", myreq.BusinessUnit);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "UserForceClose", &myreq.UserForceClose);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ParkedOrderID", myreq.ParkedOrderID);
-	getChar(req, "UserType", &myreq.UserType);
-	getChar(req, "Status", &myreq.Status);
-	getInt(req, "ErrorID", &myreq.ErrorID);
-	getString(req, "ErrorMsg", myreq.ErrorMsg);
-	getInt(req, "IsSwapOrder", &myreq.IsSwapOrder);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getString(req, "ClientID", myreq.ClientID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ParkedOrderFields, &myreq);
+	else
+		dictToStruct(req, ParkedOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqParkedOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -254,30 +171,11 @@ int TdApi::reqParkedOrderAction(const dict &req, int reqid)
 {
 	CThostFtdcParkedOrderActionField myreq = CThostFtdcParkedOrderActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getInt(req, "OrderActionRef", &myreq.OrderActionRef);
-	getString(req, "OrderRef", myreq.OrderRef);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "OrderSysID", myreq.OrderSysID);
-	getChar(req, "ActionFlag", &myreq.ActionFlag);
-	getDouble(req, "LimitPrice", &myreq.LimitPrice);
-	getInt(req, "VolumeChange", &myreq.VolumeChange);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ParkedOrderActionID", myreq.ParkedOrderActionID);
-	getChar(req, "UserType", &myreq.UserType);
-	getChar(req, "Status", &myreq.Status);
-	getInt(req, "ErrorID", &myreq.ErrorID);
-	getString(req, "ErrorMsg", myreq.ErrorMsg);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ParkedOrderActionFields, &myreq);
+	else
+		dictToStruct(req, ParkedOrderActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -286,27 +184,11 @@ int TdApi::reqOrderAction(const dict &req, int reqid)
 {
 	CThostFtdcInputOrderActionField myreq = CThostFtdcInputOrderActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getInt(req, "OrderActionRef", &myreq.OrderActionRef);
-	getString(req, "OrderRef", myreq.OrderRef);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "OrderSysID", myreq.OrderSysID);
-	getChar(req, "ActionFlag", &myreq.ActionFlag);
-	getDouble(req, "LimitPrice", &myreq.LimitPrice);
-	getInt(req, "VolumeChange", &myreq.VolumeChange);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
-	getString(req, "OrderMemo", myreq.OrderMemo);
-	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputOrderActionFields, &myreq);
+	else
+		dictToStruct(req, InputOrderActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqOrderAction(&myreq, reqid);
 	return i;
 };
@@ -315,16 +197,11 @@ int TdApi::reqQryMaxOrderVolume(const dict &req, int reqid)
 {
 	CThostFtdcQryMaxOrderVolumeField myreq = CThostFtdcQryMaxOrderVolumeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "Direction", &myreq.Direction);
-	getChar(req, "OffsetFlag", &myreq.OffsetFlag);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getInt(req, "MaxVolume", &myreq.MaxVolume);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryMaxOrderVolumeFields, &myreq);
+	else
+		dictToStruct(req, QryMaxOrderVolumeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMaxOrderVolume(&myreq, reqid);
 	return i;
 };
@@ -333,13 +210,11 @@ int TdApi::reqSettlementInfoConfirm(const dict &req, int reqid)
 {
 	CThostFtdcSettlementInfoConfirmField myreq = CThostFtdcSettlementInfoConfirmField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ConfirmDate", myreq.ConfirmDate);
-	getString(req, "ConfirmTime", myreq.ConfirmTime);
-	getInt(req, "SettlementID", &myreq.SettlementID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, SettlementInfoConfirmFields, &myreq);
+	else
+		dictToStruct(req, SettlementInfoConfirmFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqSettlementInfoConfirm(&myreq, reqid);
 	return i;
 };
@@ -348,10 +223,11 @@ int TdApi::reqRemoveParkedOrder(const dict &req, int reqid)
 {
 	CThostFtdcRemoveParkedOrderField myreq = CThostFtdcRemoveParkedOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ParkedOrderID", myreq.ParkedOrderID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, RemoveParkedOrderFields, &myreq);
+	else
+		dictToStruct(req, RemoveParkedOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqRemoveParkedOrder(&myreq, reqid);
 	return i;
 };
@@ -360,10 +236,11 @@ int TdApi::reqRemoveParkedOrderAction(const dict &req, int reqid)
 {
 	CThostFtdcRemoveParkedOrderActionField myreq = CThostFtdcRemoveParkedOrderActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ParkedOrderActionID", myreq.ParkedOrderActionID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, RemoveParkedOrderActionFields, &myreq);
+	else
+		dictToStruct(req, RemoveParkedOrderActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqRemoveParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -372,29 +249,11 @@ int TdApi::reqExecOrderInsert(const dict &req, int reqid)
 {
 	CThostFtdcInputExecOrderField myreq = CThostFtdcInputExecOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExecOrderRef", myreq.ExecOrderRef);
-	getString(req, "UserID", myreq.UserID);
-	getInt(req, "Volume", &myreq.Volume);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getString(req, "BusinessUnit", myreq.BusinessUnit);
-	getChar(req, "OffsetFlag", &myreq.OffsetFlag);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getChar(req, "ActionType", &myreq.ActionType);
-	getChar(req, "PosiDirection", &myreq.PosiDirection);
-	getChar(req, "ReservePositionFlag", &myreq.ReservePositionFlag);
-	getChar(req, "CloseFlag", &myreq.CloseFlag);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getString(req, "ClientID", myreq.ClientID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputExecOrderFields, &myreq);
+	else
+		dictToStruct(req, InputExecOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqExecOrderInsert(&myreq, reqid);
 	return i;
 };
@@ -403,23 +262,11 @@ int TdApi::reqExecOrderAction(const dict &req, int reqid)
 {
 	CThostFtdcInputExecOrderActionField myreq = CThostFtdcInputExecOrderActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getInt(req, "ExecOrderActionRef", &myreq.ExecOrderActionRef);
-	getString(req, "ExecOrderRef", myreq.ExecOrderRef);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ExecOrderSysID", myreq.ExecOrderSysID);
-	getChar(req, "ActionFlag", &myreq.ActionFlag);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputExecOrderActionFields, &myreq);
+	else
+		dictToStruct(req, InputExecOrderActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqExecOrderAction(&myreq, reqid);
 	return i;
 };
@@ -428,17 +275,11 @@ int TdApi::reqForQuoteInsert(const dict &req, int reqid)
 {
 	CThostFtdcInputForQuoteField myreq = CThostFtdcInputForQuoteField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ForQuoteRef", myreq.ForQuoteRef);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputForQuoteFields, &myreq);
+	else
+		dictToStruct(req, InputForQuoteFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqForQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -447,35 +288,11 @@ int TdApi::reqQuoteInsert(const dict &req, int reqid)
 {
 	CThostFtdcInputQuoteField myreq = CThostFtdcInputQuoteField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "QuoteRef", myreq.QuoteRef);
-	getString(req, "UserID", myreq.UserID);
-	getDouble(req, "AskPrice", &myreq.AskPrice);
-	getDouble(req, "BidPrice", &myreq.BidPrice);
-	getInt(req, "AskVolume", &myreq.AskVolume);
-	getInt(req, "BidVolume", &myreq.BidVolume);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getString(req, "BusinessUnit", myreq.BusinessUnit);
-	getChar(req, "AskOffsetFlag", &myreq.AskOffsetFlag);
-	getChar(req, "BidOffsetFlag", &myreq.BidOffsetFlag);
-	getChar(req, "AskHedgeFlag", &myreq.AskHedgeFlag);
-	getChar(req, "BidHedgeFlag", &myreq.BidHedgeFlag);
-	getString(req, "AskOrderRef", myreq.AskOrderRef);
-	getString(req, "BidOrderRef", myreq.BidOrderRef);
-	getString(req, "ForQuoteSysID", myreq.ForQuoteSysID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "ClientID", myreq.ClientID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
-	getString(req, "ReplaceSysID", myreq.ReplaceSysID);
-	getChar(req, "TimeCondition", &myreq.TimeCondition);
-	getString(req, "OrderMemo", myreq.OrderMemo);
-	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputQuoteFields, &myreq);
+	else
+		dictToStruct(req, InputQuoteFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQuoteInsert(&myreq, reqid);
 	return i;
 };
@@ -484,26 +301,11 @@ int TdApi::reqQuoteAction(const dict &req, int reqid)
 {
 	CThostFtdcInputQuoteActionField myreq = CThostFtdcInputQuoteActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getInt(req, "QuoteActionRef", &myreq.QuoteActionRef);
-	getString(req, "QuoteRef", myreq.QuoteRef);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "QuoteSysID", myreq.QuoteSysID);
-	getChar(req, "ActionFlag", &myreq.ActionFlag);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "ClientID", myreq.ClientID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
-	getString(req, "OrderMemo", myreq.OrderMemo);
-	getInt(req, "SessionReqSeq", &myreq.SessionReqSeq);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputQuoteActionFields, &myreq);
+	else
+		dictToStruct(req, InputQuoteActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQuoteAction(&myreq, reqid);
 	return i;
 };
@@ -512,18 +314,11 @@ int TdApi::reqBatchOrderAction(const dict &req, int reqid)
 {
 	CThostFtdcInputBatchOrderActionField myreq = CThostFtdcInputBatchOrderActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getInt(req, "OrderActionRef", &myreq.OrderActionRef);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputBatchOrderActionFields, &myreq);
+	else
+		dictToStruct(req, InputBatchOrderActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqBatchOrderAction(&myreq, reqid);
 	return i;
 };
@@ -532,25 +327,11 @@ int TdApi::reqOptionSelfCloseInsert(const dict &req, int reqid)
 {
 	CThostFtdcInputOptionSelfCloseField myreq = CThostFtdcInputOptionSelfCloseField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "OptionSelfCloseRef", myreq.OptionSelfCloseRef);
-	getString(req, "UserID", myreq.UserID);
-	getInt(req, "Volume", &myreq.Volume);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getString(req, "BusinessUnit", myreq.BusinessUnit);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getChar(req, "OptSelfCloseFlag", &myreq.OptSelfCloseFlag);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getString(req, "ClientID", myreq.ClientID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputOptionSelfCloseFields, &myreq);
+	else
+		dictToStruct(req, InputOptionSelfCloseFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqOptionSelfCloseInsert(&myreq, reqid);
 	return i;
 };
@@ -559,23 +340,11 @@ int TdApi::reqOptionSelfCloseAction(const dict &req, int reqid)
 {
 	CThostFtdcInputOptionSelfCloseActionField myreq = CThostFtdcInputOptionSelfCloseActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getInt(req, "OptionSelfCloseActionRef", &myreq.OptionSelfCloseActionRef);
-	getString(req, "OptionSelfCloseRef", myreq.OptionSelfCloseRef);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "OptionSelfCloseSysID", myreq.OptionSelfCloseSysID);
-	getChar(req, "ActionFlag", &myreq.ActionFlag);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputOptionSelfCloseActionFields, &myreq);
+	else
+		dictToStruct(req, InputOptionSelfCloseActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqOptionSelfCloseAction(&myreq, reqid);
 	return i;
 };
@@ -584,23 +353,11 @@ int TdApi::reqCombActionInsert(const dict &req, int reqid)
 {
 	CThostFtdcInputCombActionField myreq = CThostFtdcInputCombActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "CombActionRef", myreq.CombActionRef);
-	getString(req, "UserID", myreq.UserID);
-	getChar(req, "Direction", &myreq.Direction);
-	getInt(req, "Volume", &myreq.Volume);
-	getChar(req, "CombDirection", &myreq.CombDirection);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getInt(req, "FrontID", &myreq.FrontID);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "IPAddress", myreq.IPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, InputCombActionFields, &myreq);
+	else
+		dictToStruct(req, InputCombActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqCombActionInsert(&myreq, reqid);
 	return i;
 };
@@ -609,15 +366,11 @@ int TdApi::reqQryOrder(const dict &req, int reqid)
 {
 	CThostFtdcQryOrderField myreq = CThostFtdcQryOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "OrderSysID", myreq.OrderSysID);
-	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
-	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryOrderFields, &myreq);
+	else
+		dictToStruct(req, QryOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOrder(&myreq, reqid);
 	return i;
 };
@@ -626,15 +379,11 @@ int TdApi::reqQryTrade(const dict &req, int reqid)
 {
 	CThostFtdcQryTradeField myreq = CThostFtdcQryTradeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "TradeID", myreq.TradeID);
-	getString(req, "TradeTimeStart", myreq.TradeTimeStart);
-	getString(req, "TradeTimeEnd", myreq.TradeTimeEnd);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTradeFields, &myreq);
+	else
+		dictToStruct(req, QryTradeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTrade(&myreq, reqid);
 	return i;
 };
@@ -643,12 +392,11 @@ int TdApi::reqQryInvestorPosition(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorPositionField myreq = CThostFtdcQryInvestorPositionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorPositionFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorPositionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPosition(&myreq, reqid);
 	return i;
 };
@@ -657,11 +405,11 @@ int TdApi::reqQryTradingAccount(const dict &req, int reqid)
 {
 	CThostFtdcQryTradingAccountField myreq = CThostFtdcQryTradingAccountField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getChar(req, "BizType", &myreq.BizType);
-	getString(req, "AccountID", myreq.AccountID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTradingAccountFields, &myreq);
+	else
+		dictToStruct(req, QryTradingAccountFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -670,8 +418,11 @@ int TdApi::reqQryInvestor(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorField myreq = CThostFtdcQryInvestorField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestor(&myreq, reqid);
 	return i;
 };
@@ -680,12 +431,11 @@ int TdApi::reqQryTradingCode(const dict &req, int reqid)
 {
 	CThostFtdcQryTradingCodeField myreq = CThostFtdcQryTradingCodeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ClientID", myreq.ClientID);
-	getChar(req, "ClientIDType", &myreq.ClientIDType);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTradingCodeFields, &myreq);
+	else
+		dictToStruct(req, QryTradingCodeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTradingCode(&myreq, reqid);
 	return i;
 };
@@ -694,13 +444,11 @@ int TdApi::reqQryInstrumentMarginRate(const dict &req, int reqid)
 {
 	CThostFtdcQryInstrumentMarginRateField myreq = CThostFtdcQryInstrumentMarginRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInstrumentMarginRateFields, &myreq);
+	else
+		dictToStruct(req, QryInstrumentMarginRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrumentMarginRate(&myreq, reqid);
 	return i;
 };
@@ -709,12 +457,11 @@ int TdApi::reqQryInstrumentCommissionRate(const dict &req, int reqid)
 {
 	CThostFtdcQryInstrumentCommissionRateField myreq = CThostFtdcQryInstrumentCommissionRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInstrumentCommissionRateFields, &myreq);
+	else
+		dictToStruct(req, QryInstrumentCommissionRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -723,7 +470,11 @@ int TdApi::reqQryExchange(const dict &req, int reqid)
 {
 	CThostFtdcQryExchangeField myreq = CThostFtdcQryExchangeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryExchangeFields, &myreq);
+	else
+		dictToStruct(req, QryExchangeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchange(&myreq, reqid);
 	return i;
 };
@@ -732,10 +483,11 @@ int TdApi::reqQryProduct(const dict &req, int reqid)
 {
 	CThostFtdcQryProductField myreq = CThostFtdcQryProductField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "ProductClass", &myreq.ProductClass);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryProductFields, &myreq);
+	else
+		dictToStruct(req, QryProductFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryProduct(&myreq, reqid);
 	return i;
 };
@@ -744,13 +496,11 @@ int TdApi::reqQryInstrument(const dict &req, int reqid)
 {
 	CThostFtdcQryInstrumentField myreq = CThostFtdcQryInstrumentField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "reserve2", myreq.reserve2);
-	getString(req, "reserve3", myreq.reserve3);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "ExchangeInstID", myreq.ExchangeInstID);
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInstrumentFields, &myreq);
+	else
+		dictToStruct(req, QryInstrumentFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrument(&myreq, reqid);
 	return i;
 };
@@ -759,10 +509,11 @@ int TdApi::reqQryDepthMarketData(const dict &req, int reqid)
 {
 	CThostFtdcQryDepthMarketDataField myreq = CThostFtdcQryDepthMarketDataField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getChar(req, "ProductClass", &myreq.ProductClass);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryDepthMarketDataFields, &myreq);
+	else
+		dictToStruct(req, QryDepthMarketDataFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryDepthMarketData(&myreq, reqid);
 	return i;
 };
@@ -771,9 +522,11 @@ int TdApi::reqQryTraderOffer(const dict &req, int reqid)
 {
 	CThostFtdcQryTraderOfferField myreq = CThostFtdcQryTraderOfferField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ParticipantID", myreq.ParticipantID);
-	getString(req, "TraderID", myreq.TraderID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTraderOfferFields, &myreq);
+	else
+		dictToStruct(req, QryTraderOfferFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTraderOffer(&myreq, reqid);
 	return i;
 };
@@ -782,11 +535,11 @@ int TdApi::reqQrySettlementInfo(const dict &req, int reqid)
 {
 	CThostFtdcQrySettlementInfoField myreq = CThostFtdcQrySettlementInfoField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySettlementInfoFields, &myreq);
+	else
+		dictToStruct(req, QrySettlementInfoFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySettlementInfo(&myreq, reqid);
 	return i;
 };
@@ -795,8 +548,11 @@ int TdApi::reqQryTransferBank(const dict &req, int reqid)
 {
 	CThostFtdcQryTransferBankField myreq = CThostFtdcQryTransferBankField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "BankBrchID", myreq.BankBrchID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTransferBankFields, &myreq);
+	else
+		dictToStruct(req, QryTransferBankFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTransferBank(&myreq, reqid);
 	return i;
 };
@@ -805,12 +561,11 @@ int TdApi::reqQryInvestorPositionDetail(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorPositionDetailField myreq = CThostFtdcQryInvestorPositionDetailField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorPositionDetailFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorPositionDetailFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPositionDetail(&myreq, reqid);
 	return i;
 };
@@ -819,7 +574,11 @@ int TdApi::reqQryNotice(const dict &req, int reqid)
 {
 	CThostFtdcQryNoticeField myreq = CThostFtdcQryNoticeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryNoticeFields, &myreq);
+	else
+		dictToStruct(req, QryNoticeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryNotice(&myreq, reqid);
 	return i;
 };
@@ -828,10 +587,11 @@ int TdApi::reqQrySettlementInfoConfirm(const dict &req, int reqid)
 {
 	CThostFtdcQrySettlementInfoConfirmField myreq = CThostFtdcQrySettlementInfoConfirmField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySettlementInfoConfirmFields, &myreq);
+	else
+		dictToStruct(req, QrySettlementInfoConfirmFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySettlementInfoConfirm(&myreq, reqid);
 	return i;
 };
@@ -840,12 +600,11 @@ int TdApi::reqQryInvestorPositionCombineDetail(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorPositionCombineDetailField myreq = CThostFtdcQryInvestorPositionCombineDetailField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "CombInstrumentID", myreq.CombInstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorPositionCombineDetailFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorPositionCombineDetailFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPositionCombineDetail(&myreq, reqid);
 	return i;
 };
@@ -854,8 +613,11 @@ int TdApi::reqQryCFMMCTradingAccountKey(const dict &req, int reqid)
 {
 	CThostFtdcQryCFMMCTradingAccountKeyField myreq = CThostFtdcQryCFMMCTradingAccountKeyField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryCFMMCTradingAccountKeyFields, &myreq);
+	else
+		dictToStruct(req, QryCFMMCTradingAccountKeyFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCFMMCTradingAccountKey(&myreq, reqid);
 	return i;
 };
@@ -864,12 +626,11 @@ int TdApi::reqQryEWarrantOffset(const dict &req, int reqid)
 {
 	CThostFtdcQryEWarrantOffsetField myreq = CThostFtdcQryEWarrantOffsetField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryEWarrantOffsetFields, &myreq);
+	else
+		dictToStruct(req, QryEWarrantOffsetFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryEWarrantOffset(&myreq, reqid);
 	return i;
 };
@@ -878,13 +639,11 @@ int TdApi::reqQryInvestorProductGroupMargin(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorProductGroupMarginField myreq = CThostFtdcQryInvestorProductGroupMarginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorProductGroupMarginFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorProductGroupMarginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProductGroupMargin(&myreq, reqid);
 	return i;
 };
@@ -893,11 +652,11 @@ int TdApi::reqQryExchangeMarginRate(const dict &req, int reqid)
 {
 	CThostFtdcQryExchangeMarginRateField myreq = CThostFtdcQryExchangeMarginRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryExchangeMarginRateFields, &myreq);
+	else
+		dictToStruct(req, QryExchangeMarginRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchangeMarginRate(&myreq, reqid);
 	return i;
 };
@@ -906,10 +665,11 @@ int TdApi::reqQryExchangeMarginRateAdjust(const dict &req, int reqid)
 {
 	CThostFtdcQryExchangeMarginRateAdjustField myreq = CThostFtdcQryExchangeMarginRateAdjustField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryExchangeMarginRateAdjustFields, &myreq);
+	else
+		dictToStruct(req, QryExchangeMarginRateAdjustFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchangeMarginRateAdjust(&myreq, reqid);
 	return i;
 };
@@ -918,9 +678,11 @@ int TdApi::reqQryExchangeRate(const dict &req, int reqid)
 {
 	CThostFtdcQryExchangeRateField myreq = CThostFtdcQryExchangeRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "FromCurrencyID", myreq.FromCurrencyID);
-	getString(req, "ToCurrencyID", myreq.ToCurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryExchangeRateFields, &myreq);
+	else
+		dictToStruct(req, QryExchangeRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExchangeRate(&myreq, reqid);
 	return i;
 };
@@ -929,10 +691,11 @@ int TdApi::reqQrySecAgentACIDMap(const dict &req, int reqid)
 {
 	CThostFtdcQrySecAgentACIDMapField myreq = CThostFtdcQrySecAgentACIDMapField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySecAgentACIDMapFields, &myreq);
+	else
+		dictToStruct(req, QrySecAgentACIDMapFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentACIDMap(&myreq, reqid);
 	return i;
 };
@@ -941,9 +704,11 @@ int TdApi::reqQryProductExchRate(const dict &req, int reqid)
 {
 	CThostFtdcQryProductExchRateField myreq = CThostFtdcQryProductExchRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryProductExchRateFields, &myreq);
+	else
+		dictToStruct(req, QryProductExchRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryProductExchRate(&myreq, reqid);
 	return i;
 };
@@ -952,9 +717,11 @@ int TdApi::reqQryProductGroup(const dict &req, int reqid)
 {
 	CThostFtdcQryProductGroupField myreq = CThostFtdcQryProductGroupField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryProductGroupFields, &myreq);
+	else
+		dictToStruct(req, QryProductGroupFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryProductGroup(&myreq, reqid);
 	return i;
 };
@@ -963,10 +730,11 @@ int TdApi::reqQryMMInstrumentCommissionRate(const dict &req, int reqid)
 {
 	CThostFtdcQryMMInstrumentCommissionRateField myreq = CThostFtdcQryMMInstrumentCommissionRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryMMInstrumentCommissionRateFields, &myreq);
+	else
+		dictToStruct(req, QryMMInstrumentCommissionRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMMInstrumentCommissionRate(&myreq, reqid);
 	return i;
 };
@@ -975,10 +743,11 @@ int TdApi::reqQryMMOptionInstrCommRate(const dict &req, int reqid)
 {
 	CThostFtdcQryMMOptionInstrCommRateField myreq = CThostFtdcQryMMOptionInstrCommRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryMMOptionInstrCommRateFields, &myreq);
+	else
+		dictToStruct(req, QryMMOptionInstrCommRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMMOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -987,10 +756,11 @@ int TdApi::reqQryInstrumentOrderCommRate(const dict &req, int reqid)
 {
 	CThostFtdcQryInstrumentOrderCommRateField myreq = CThostFtdcQryInstrumentOrderCommRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInstrumentOrderCommRateFields, &myreq);
+	else
+		dictToStruct(req, QryInstrumentOrderCommRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInstrumentOrderCommRate(&myreq, reqid);
 	return i;
 };
@@ -999,11 +769,11 @@ int TdApi::reqQrySecAgentTradingAccount(const dict &req, int reqid)
 {
 	CThostFtdcQryTradingAccountField myreq = CThostFtdcQryTradingAccountField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getChar(req, "BizType", &myreq.BizType);
-	getString(req, "AccountID", myreq.AccountID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTradingAccountFields, &myreq);
+	else
+		dictToStruct(req, QryTradingAccountFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentTradingAccount(&myreq, reqid);
 	return i;
 };
@@ -1012,8 +782,11 @@ int TdApi::reqQrySecAgentCheckMode(const dict &req, int reqid)
 {
 	CThostFtdcQrySecAgentCheckModeField myreq = CThostFtdcQrySecAgentCheckModeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySecAgentCheckModeFields, &myreq);
+	else
+		dictToStruct(req, QrySecAgentCheckModeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentCheckMode(&myreq, reqid);
 	return i;
 };
@@ -1022,8 +795,11 @@ int TdApi::reqQrySecAgentTradeInfo(const dict &req, int reqid)
 {
 	CThostFtdcQrySecAgentTradeInfoField myreq = CThostFtdcQrySecAgentTradeInfoField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "BrokerSecAgentID", myreq.BrokerSecAgentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySecAgentTradeInfoFields, &myreq);
+	else
+		dictToStruct(req, QrySecAgentTradeInfoFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySecAgentTradeInfo(&myreq, reqid);
 	return i;
 };
@@ -1032,15 +808,11 @@ int TdApi::reqQryOptionInstrTradeCost(const dict &req, int reqid)
 {
 	CThostFtdcQryOptionInstrTradeCostField myreq = CThostFtdcQryOptionInstrTradeCostField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getChar(req, "HedgeFlag", &myreq.HedgeFlag);
-	getDouble(req, "InputPrice", &myreq.InputPrice);
-	getDouble(req, "UnderlyingPrice", &myreq.UnderlyingPrice);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryOptionInstrTradeCostFields, &myreq);
+	else
+		dictToStruct(req, QryOptionInstrTradeCostFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOptionInstrTradeCost(&myreq, reqid);
 	return i;
 };
@@ -1049,12 +821,11 @@ int TdApi::reqQryOptionInstrCommRate(const dict &req, int reqid)
 {
 	CThostFtdcQryOptionInstrCommRateField myreq = CThostFtdcQryOptionInstrCommRateField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryOptionInstrCommRateFields, &myreq);
+	else
+		dictToStruct(req, QryOptionInstrCommRateFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOptionInstrCommRate(&myreq, reqid);
 	return i;
 };
@@ -1063,14 +834,11 @@ int TdApi::reqQryExecOrder(const dict &req, int reqid)
 {
 	CThostFtdcQryExecOrderField myreq = CThostFtdcQryExecOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ExecOrderSysID", myreq.ExecOrderSysID);
-	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
-	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryExecOrderFields, &myreq);
+	else
+		dictToStruct(req, QryExecOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryExecOrder(&myreq, reqid);
 	return i;
 };
@@ -1079,14 +847,11 @@ int TdApi::reqQryForQuote(const dict &req, int reqid)
 {
 	CThostFtdcQryForQuoteField myreq = CThostFtdcQryForQuoteField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
-	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryForQuoteFields, &myreq);
+	else
+		dictToStruct(req, QryForQuoteFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryForQuote(&myreq, reqid);
 	return i;
 };
@@ -1095,15 +860,11 @@ int TdApi::reqQryQuote(const dict &req, int reqid)
 {
 	CThostFtdcQryQuoteField myreq = CThostFtdcQryQuoteField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "QuoteSysID", myreq.QuoteSysID);
-	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
-	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryQuoteFields, &myreq);
+	else
+		dictToStruct(req, QryQuoteFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryQuote(&myreq, reqid);
 	return i;
 };
@@ -1112,14 +873,11 @@ int TdApi::reqQryOptionSelfClose(const dict &req, int reqid)
 {
 	CThostFtdcQryOptionSelfCloseField myreq = CThostFtdcQryOptionSelfCloseField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "OptionSelfCloseSysID", myreq.OptionSelfCloseSysID);
-	getString(req, "InsertTimeStart", myreq.InsertTimeStart);
-	getString(req, "InsertTimeEnd", myreq.InsertTimeEnd);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryOptionSelfCloseFields, &myreq);
+	else
+		dictToStruct(req, QryOptionSelfCloseFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryOptionSelfClose(&myreq, reqid);
 	return i;
 };
@@ -1128,9 +886,11 @@ int TdApi::reqQryInvestUnit(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestUnitField myreq = CThostFtdcQryInvestUnitField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestUnitFields, &myreq);
+	else
+		dictToStruct(req, QryInvestUnitFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestUnit(&myreq, reqid);
 	return i;
 };
@@ -1139,10 +899,11 @@ int TdApi::reqQryCombInstrumentGuard(const dict &req, int reqid)
 {
 	CThostFtdcQryCombInstrumentGuardField myreq = CThostFtdcQryCombInstrumentGuardField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryCombInstrumentGuardFields, &myreq);
+	else
+		dictToStruct(req, QryCombInstrumentGuardFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombInstrumentGuard(&myreq, reqid);
 	return i;
 };
@@ -1151,12 +912,11 @@ int TdApi::reqQryCombAction(const dict &req, int reqid)
 {
 	CThostFtdcQryCombActionField myreq = CThostFtdcQryCombActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryCombActionFields, &myreq);
+	else
+		dictToStruct(req, QryCombActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombAction(&myreq, reqid);
 	return i;
 };
@@ -1165,10 +925,11 @@ int TdApi::reqQryTransferSerial(const dict &req, int reqid)
 {
 	CThostFtdcQryTransferSerialField myreq = CThostFtdcQryTransferSerialField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTransferSerialFields, &myreq);
+	else
+		dictToStruct(req, QryTransferSerialFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTransferSerial(&myreq, reqid);
 	return i;
 };
@@ -1177,11 +938,11 @@ int TdApi::reqQryAccountregister(const dict &req, int reqid)
 {
 	CThostFtdcQryAccountregisterField myreq = CThostFtdcQryAccountregisterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "BankBranchID", myreq.BankBranchID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryAccountregisterFields, &myreq);
+	else
+		dictToStruct(req, QryAccountregisterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryAccountregister(&myreq, reqid);
 	return i;
 };
@@ -1190,9 +951,11 @@ int TdApi::reqQryContractBank(const dict &req, int reqid)
 {
 	CThostFtdcQryContractBankField myreq = CThostFtdcQryContractBankField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "BankBrchID", myreq.BankBrchID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryContractBankFields, &myreq);
+	else
+		dictToStruct(req, QryContractBankFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryContractBank(&myreq, reqid);
 	return i;
 };
@@ -1201,12 +964,11 @@ int TdApi::reqQryParkedOrder(const dict &req, int reqid)
 {
 	CThostFtdcQryParkedOrderField myreq = CThostFtdcQryParkedOrderField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryParkedOrderFields, &myreq);
+	else
+		dictToStruct(req, QryParkedOrderFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryParkedOrder(&myreq, reqid);
 	return i;
 };
@@ -1215,12 +977,11 @@ int TdApi::reqQryParkedOrderAction(const dict &req, int reqid)
 {
 	CThostFtdcQryParkedOrderActionField myreq = CThostFtdcQryParkedOrderActionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryParkedOrderActionFields, &myreq);
+	else
+		dictToStruct(req, QryParkedOrderActionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryParkedOrderAction(&myreq, reqid);
 	return i;
 };
@@ -1229,9 +990,11 @@ int TdApi::reqQryTradingNotice(const dict &req, int reqid)
 {
 	CThostFtdcQryTradingNoticeField myreq = CThostFtdcQryTradingNoticeField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryTradingNoticeFields, &myreq);
+	else
+		dictToStruct(req, QryTradingNoticeFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryTradingNotice(&myreq, reqid);
 	return i;
 };
@@ -1240,10 +1003,11 @@ int TdApi::reqQryBrokerTradingParams(const dict &req, int reqid)
 {
 	CThostFtdcQryBrokerTradingParamsField myreq = CThostFtdcQryBrokerTradingParamsField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getString(req, "AccountID", myreq.AccountID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryBrokerTradingParamsFields, &myreq);
+	else
+		dictToStruct(req, QryBrokerTradingParamsFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryBrokerTradingParams(&myreq, reqid);
 	return i;
 };
@@ -1252,10 +1016,11 @@ int TdApi::reqQryBrokerTradingAlgos(const dict &req, int reqid)
 {
 	CThostFtdcQryBrokerTradingAlgosField myreq = CThostFtdcQryBrokerTradingAlgosField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryBrokerTradingAlgosFields, &myreq);
+	else
+		dictToStruct(req, QryBrokerTradingAlgosFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryBrokerTradingAlgos(&myreq, reqid);
 	return i;
 };
@@ -1264,9 +1029,11 @@ int TdApi::reqQueryCFMMCTradingAccountToken(const dict &req, int reqid)
 {
 	CThostFtdcQueryCFMMCTradingAccountTokenField myreq = CThostFtdcQueryCFMMCTradingAccountTokenField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "InvestUnitID", myreq.InvestUnitID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QueryCFMMCTradingAccountTokenFields, &myreq);
+	else
+		dictToStruct(req, QueryCFMMCTradingAccountTokenFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQueryCFMMCTradingAccountToken(&myreq, reqid);
 	return i;
 };
@@ -1275,50 +1042,11 @@ int TdApi::reqFromBankToFutureByFuture(const dict &req, int reqid)
 {
 	CThostFtdcReqTransferField myreq = CThostFtdcReqTransferField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradeCode", myreq.TradeCode);
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "BankBranchID", myreq.BankBranchID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "BrokerBranchID", myreq.BrokerBranchID);
-	getString(req, "TradeDate", myreq.TradeDate);
-	getString(req, "TradeTime", myreq.TradeTime);
-	getString(req, "BankSerial", myreq.BankSerial);
-	getString(req, "TradingDay", myreq.TradingDay);
-	getInt(req, "PlateSerial", &myreq.PlateSerial);
-	getChar(req, "LastFragment", &myreq.LastFragment);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "CustomerName", myreq.CustomerName);
-	getChar(req, "IdCardType", &myreq.IdCardType);
-	getString(req, "IdentifiedCardNo", myreq.IdentifiedCardNo);
-	getChar(req, "CustType", &myreq.CustType);
-	getString(req, "BankAccount", myreq.BankAccount);
-	getString(req, "BankPassWord", myreq.BankPassWord);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "Password", myreq.Password);
-	getInt(req, "InstallID", &myreq.InstallID);
-	getInt(req, "FutureSerial", &myreq.FutureSerial);
-	getString(req, "UserID", myreq.UserID);
-	getChar(req, "VerifyCertNoFlag", &myreq.VerifyCertNoFlag);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getDouble(req, "TradeAmount", &myreq.TradeAmount);
-	getDouble(req, "FutureFetchAmount", &myreq.FutureFetchAmount);
-	getChar(req, "FeePayFlag", &myreq.FeePayFlag);
-	getDouble(req, "CustFee", &myreq.CustFee);
-	getDouble(req, "BrokerFee", &myreq.BrokerFee);
-	getString(req, "Message", myreq.Message);
-	getString(req, "Digest", myreq.Digest);
-	getChar(req, "BankAccType", &myreq.BankAccType);
-	getString(req, "DeviceID", myreq.DeviceID);
-	getChar(req, "BankSecuAccType", &myreq.BankSecuAccType);
-	getString(req, "BrokerIDByBank", myreq.BrokerIDByBank);
-	getString(req, "BankSecuAcc", myreq.BankSecuAcc);
-	getChar(req, "BankPwdFlag", &myreq.BankPwdFlag);
-	getChar(req, "SecuPwdFlag", &myreq.SecuPwdFlag);
-	getString(req, "OperNo", myreq.OperNo);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "TID", &myreq.TID);
-	getChar(req, "TransferStatus", &myreq.TransferStatus);
-	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqTransferFields, &myreq);
+	else
+		dictToStruct(req, ReqTransferFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqFromBankToFutureByFuture(&myreq, reqid);
 	return i;
 };
@@ -1327,50 +1055,11 @@ int TdApi::reqFromFutureToBankByFuture(const dict &req, int reqid)
 {
 	CThostFtdcReqTransferField myreq = CThostFtdcReqTransferField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradeCode", myreq.TradeCode);
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "BankBranchID", myreq.BankBranchID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "BrokerBranchID", myreq.BrokerBranchID);
-	getString(req, "TradeDate", myreq.TradeDate);
-	getString(req, "TradeTime", myreq.TradeTime);
-	getString(req, "BankSerial", myreq.BankSerial);
-	getString(req, "TradingDay", myreq.TradingDay);
-	getInt(req, "PlateSerial", &myreq.PlateSerial);
-	getChar(req, "LastFragment", &myreq.LastFragment);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "CustomerName", myreq.CustomerName);
-	getChar(req, "IdCardType", &myreq.IdCardType);
-	getString(req, "IdentifiedCardNo", myreq.IdentifiedCardNo);
-	getChar(req, "CustType", &myreq.CustType);
-	getString(req, "BankAccount", myreq.BankAccount);
-	getString(req, "BankPassWord", myreq.BankPassWord);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "Password", myreq.Password);
-	getInt(req, "InstallID", &myreq.InstallID);
-	getInt(req, "FutureSerial", &myreq.FutureSerial);
-	getString(req, "UserID", myreq.UserID);
-	getChar(req, "VerifyCertNoFlag", &myreq.VerifyCertNoFlag);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getDouble(req, "TradeAmount", &myreq.TradeAmount);
-	getDouble(req, "FutureFetchAmount", &myreq.FutureFetchAmount);
-	getChar(req, "FeePayFlag", &myreq.FeePayFlag);
-	getDouble(req, "CustFee", &myreq.CustFee);
-	getDouble(req, "BrokerFee", &myreq.BrokerFee);
-	getString(req, "Message", myreq.Message);
-	getString(req, "Digest", myreq.Digest);
-	getChar(req, "BankAccType", &myreq.BankAccType);
-	getString(req, "DeviceID", myreq.DeviceID);
-	getChar(req, "BankSecuAccType", &myreq.BankSecuAccType);
-	getString(req, "BrokerIDByBank", myreq.BrokerIDByBank);
-	getString(req, "BankSecuAcc", myreq.BankSecuAcc);
-	getChar(req, "BankPwdFlag", &myreq.BankPwdFlag);
-	getChar(req, "SecuPwdFlag", &myreq.SecuPwdFlag);
-	getString(req, "OperNo", myreq.OperNo);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "TID", &myreq.TID);
-	getChar(req, "TransferStatus", &myreq.TransferStatus);
-	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqTransferFields, &myreq);
+	else
+		dictToStruct(req, ReqTransferFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqFromFutureToBankByFuture(&myreq, reqid);
 	return i;
 };
@@ -1379,43 +1068,11 @@ int TdApi::reqQueryBankAccountMoneyByFuture(const dict &req, int reqid)
 {
 	CThostFtdcReqQueryAccountField myreq = CThostFtdcReqQueryAccountField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradeCode", myreq.TradeCode);
-	getString(req, "BankID", myreq.BankID);
-	getString(req, "BankBranchID", myreq.BankBranchID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "BrokerBranchID", myreq.BrokerBranchID);
-	getString(req, "TradeDate", myreq.TradeDate);
-	getString(req, "TradeTime", myreq.TradeTime);
-	getString(req, "BankSerial", myreq.BankSerial);
-	getString(req, "TradingDay", myreq.TradingDay);
-	getInt(req, "PlateSerial", &myreq.PlateSerial);
-	getChar(req, "LastFragment", &myreq.LastFragment);
-	getInt(req, "SessionID", &myreq.SessionID);
-	getString(req, "CustomerName", myreq.CustomerName);
-	getChar(req, "IdCardType", &myreq.IdCardType);
-	getString(req, "IdentifiedCardNo", myreq.IdentifiedCardNo);
-	getChar(req, "CustType", &myreq.CustType);
-	getString(req, "BankAccount", myreq.BankAccount);
-	getString(req, "BankPassWord", myreq.BankPassWord);
-	getString(req, "AccountID", myreq.AccountID);
-	getString(req, "Password", myreq.Password);
-	getInt(req, "FutureSerial", &myreq.FutureSerial);
-	getInt(req, "InstallID", &myreq.InstallID);
-	getString(req, "UserID", myreq.UserID);
-	getChar(req, "VerifyCertNoFlag", &myreq.VerifyCertNoFlag);
-	getString(req, "CurrencyID", myreq.CurrencyID);
-	getString(req, "Digest", myreq.Digest);
-	getChar(req, "BankAccType", &myreq.BankAccType);
-	getString(req, "DeviceID", myreq.DeviceID);
-	getChar(req, "BankSecuAccType", &myreq.BankSecuAccType);
-	getString(req, "BrokerIDByBank", myreq.BrokerIDByBank);
-	getString(req, "BankSecuAcc", myreq.BankSecuAcc);
-	getChar(req, "BankPwdFlag", &myreq.BankPwdFlag);
-	getChar(req, "SecuPwdFlag", &myreq.SecuPwdFlag);
-	getString(req, "OperNo", myreq.OperNo);
-	getInt(req, "RequestID", &myreq.RequestID);
-	getInt(req, "TID", &myreq.TID);
-	getString(req, "LongCustomerName", myreq.LongCustomerName);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqQueryAccountFields, &myreq);
+	else
+		dictToStruct(req, ReqQueryAccountFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQueryBankAccountMoneyByFuture(&myreq, reqid);
 	return i;
 };
@@ -1424,12 +1081,11 @@ int TdApi::reqQryClassifiedInstrument(const dict &req, int reqid)
 {
 	CThostFtdcQryClassifiedInstrumentField myreq = CThostFtdcQryClassifiedInstrumentField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ExchangeInstID", myreq.ExchangeInstID);
-	getString(req, "ProductID", myreq.ProductID);
-	getChar(req, "TradingType", &myreq.TradingType);
-	getChar(req, "ClassType", &myreq.ClassType);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryClassifiedInstrumentFields, &myreq);
+	else
+		dictToStruct(req, QryClassifiedInstrumentFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryClassifiedInstrument(&myreq, reqid);
 	return i;
 };
@@ -1438,8 +1094,11 @@ int TdApi::reqQryCombPromotionParam(const dict &req, int reqid)
 {
 	CThostFtdcQryCombPromotionParamField myreq = CThostFtdcQryCombPromotionParamField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryCombPromotionParamFields, &myreq);
+	else
+		dictToStruct(req, QryCombPromotionParamFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryCombPromotionParam(&myreq, reqid);
 	return i;
 };
@@ -1448,9 +1107,11 @@ int TdApi::reqQryRiskSettleInvstPosition(const dict &req, int reqid)
 {
 	CThostFtdcQryRiskSettleInvstPositionField myreq = CThostFtdcQryRiskSettleInvstPositionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRiskSettleInvstPositionFields, &myreq);
+	else
+		dictToStruct(req, QryRiskSettleInvstPositionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRiskSettleInvstPosition(&myreq, reqid);
 	return i;
 };
@@ -1459,7 +1120,11 @@ int TdApi::reqQryRiskSettleProductStatus(const dict &req, int reqid)
 {
 	CThostFtdcQryRiskSettleProductStatusField myreq = CThostFtdcQryRiskSettleProductStatusField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRiskSettleProductStatusFields, &myreq);
+	else
+		dictToStruct(req, QryRiskSettleProductStatusFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRiskSettleProductStatus(&myreq, reqid);
 	return i;
 };
@@ -1468,9 +1133,11 @@ int TdApi::reqQrySPBMFutureParameter(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMFutureParameterField myreq = CThostFtdcQrySPBMFutureParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMFutureParameterFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMFutureParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMFutureParameter(&myreq, reqid);
 	return i;
 };
@@ -1479,9 +1146,11 @@ int TdApi::reqQrySPBMOptionParameter(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMOptionParameterField myreq = CThostFtdcQrySPBMOptionParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMOptionParameterFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMOptionParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMOptionParameter(&myreq, reqid);
 	return i;
 };
@@ -1490,8 +1159,11 @@ int TdApi::reqQrySPBMIntraParameter(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMIntraParameterField myreq = CThostFtdcQrySPBMIntraParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMIntraParameterFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMIntraParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMIntraParameter(&myreq, reqid);
 	return i;
 };
@@ -1500,9 +1172,11 @@ int TdApi::reqQrySPBMInterParameter(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMInterParameterField myreq = CThostFtdcQrySPBMInterParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "Leg1ProdFamilyCode", myreq.Leg1ProdFamilyCode);
-	getString(req, "Leg2ProdFamilyCode", myreq.Leg2ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMInterParameterFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMInterParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMInterParameter(&myreq, reqid);
 	return i;
 };
@@ -1511,9 +1185,11 @@ int TdApi::reqQrySPBMPortfDefinition(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMPortfDefinitionField myreq = CThostFtdcQrySPBMPortfDefinitionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getInt(req, "PortfolioDefID", &myreq.PortfolioDefID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMPortfDefinitionFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMPortfDefinitionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMPortfDefinition(&myreq, reqid);
 	return i;
 };
@@ -1522,9 +1198,11 @@ int TdApi::reqQrySPBMInvestorPortfDef(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMInvestorPortfDefField myreq = CThostFtdcQrySPBMInvestorPortfDefField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMInvestorPortfDefFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMInvestorPortfDefFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMInvestorPortfDef(&myreq, reqid);
 	return i;
 };
@@ -1533,10 +1211,11 @@ int TdApi::reqQryInvestorPortfMarginRatio(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorPortfMarginRatioField myreq = CThostFtdcQryInvestorPortfMarginRatioField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorPortfMarginRatioFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorPortfMarginRatioFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPortfMarginRatio(&myreq, reqid);
 	return i;
 };
@@ -1545,10 +1224,11 @@ int TdApi::reqQryInvestorProdSPBMDetail(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorProdSPBMDetailField myreq = CThostFtdcQryInvestorProdSPBMDetailField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorProdSPBMDetailFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorProdSPBMDetailFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProdSPBMDetail(&myreq, reqid);
 	return i;
 };
@@ -1557,9 +1237,11 @@ int TdApi::reqQryInvestorCommoditySPMMMargin(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorCommoditySPMMMarginField myreq = CThostFtdcQryInvestorCommoditySPMMMarginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "CommodityID", myreq.CommodityID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorCommoditySPMMMarginFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorCommoditySPMMMarginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorCommoditySPMMMargin(&myreq, reqid);
 	return i;
 };
@@ -1568,9 +1250,11 @@ int TdApi::reqQryInvestorCommodityGroupSPMMMargin(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorCommodityGroupSPMMMarginField myreq = CThostFtdcQryInvestorCommodityGroupSPMMMarginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "CommodityGroupID", myreq.CommodityGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorCommodityGroupSPMMMarginFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorCommodityGroupSPMMMarginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorCommodityGroupSPMMMargin(&myreq, reqid);
 	return i;
 };
@@ -1579,7 +1263,11 @@ int TdApi::reqQrySPMMInstParam(const dict &req, int reqid)
 {
 	CThostFtdcQrySPMMInstParamField myreq = CThostFtdcQrySPMMInstParamField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPMMInstParamFields, &myreq);
+	else
+		dictToStruct(req, QrySPMMInstParamFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPMMInstParam(&myreq, reqid);
 	return i;
 };
@@ -1588,7 +1276,11 @@ int TdApi::reqQrySPMMProductParam(const dict &req, int reqid)
 {
 	CThostFtdcQrySPMMProductParamField myreq = CThostFtdcQrySPMMProductParamField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPMMProductParamFields, &myreq);
+	else
+		dictToStruct(req, QrySPMMProductParamFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPMMProductParam(&myreq, reqid);
 	return i;
 };
@@ -1597,9 +1289,11 @@ int TdApi::reqQrySPBMAddOnInterParameter(const dict &req, int reqid)
 {
 	CThostFtdcQrySPBMAddOnInterParameterField myreq = CThostFtdcQrySPBMAddOnInterParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "Leg1ProdFamilyCode", myreq.Leg1ProdFamilyCode);
-	getString(req, "Leg2ProdFamilyCode", myreq.Leg2ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QrySPBMAddOnInterParameterFields, &myreq);
+	else
+		dictToStruct(req, QrySPBMAddOnInterParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQrySPBMAddOnInterParameter(&myreq, reqid);
 	return i;
 };
@@ -1608,9 +1302,11 @@ int TdApi::reqQryRCAMSCombProductInfo(const dict &req, int reqid)
 {
 	CThostFtdcQryRCAMSCombProductInfoField myreq = CThostFtdcQryRCAMSCombProductInfoField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ProductID", myreq.ProductID);
-	getString(req, "CombProductID", myreq.CombProductID);
-	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRCAMSCombProductInfoFields, &myreq);
+	else
+		dictToStruct(req, QryRCAMSCombProductInfoFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSCombProductInfo(&myreq, reqid);
 	return i;
 };
@@ -1619,7 +1315,11 @@ int TdApi::reqQryRCAMSInstrParameter(const dict &req, int reqid)
 {
 	CThostFtdcQryRCAMSInstrParameterField myreq = CThostFtdcQryRCAMSInstrParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ProductID", myreq.ProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRCAMSInstrParameterFields, &myreq);
+	else
+		dictToStruct(req, QryRCAMSInstrParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSInstrParameter(&myreq, reqid);
 	return i;
 };
@@ -1628,7 +1328,11 @@ int TdApi::reqQryRCAMSIntraParameter(const dict &req, int reqid)
 {
 	CThostFtdcQryRCAMSIntraParameterField myreq = CThostFtdcQryRCAMSIntraParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "CombProductID", myreq.CombProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRCAMSIntraParameterFields, &myreq);
+	else
+		dictToStruct(req, QryRCAMSIntraParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSIntraParameter(&myreq, reqid);
 	return i;
 };
@@ -1637,9 +1341,11 @@ int TdApi::reqQryRCAMSInterParameter(const dict &req, int reqid)
 {
 	CThostFtdcQryRCAMSInterParameterField myreq = CThostFtdcQryRCAMSInterParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ProductGroupID", myreq.ProductGroupID);
-	getString(req, "CombProduct1", myreq.CombProduct1);
-	getString(req, "CombProduct2", myreq.CombProduct2);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRCAMSInterParameterFields, &myreq);
+	else
+		dictToStruct(req, QryRCAMSInterParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSInterParameter(&myreq, reqid);
 	return i;
 };
@@ -1648,7 +1354,11 @@ int TdApi::reqQryRCAMSShortOptAdjustParam(const dict &req, int reqid)
 {
 	CThostFtdcQryRCAMSShortOptAdjustParamField myreq = CThostFtdcQryRCAMSShortOptAdjustParamField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "CombProductID", myreq.CombProductID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRCAMSShortOptAdjustParamFields, &myreq);
+	else
+		dictToStruct(req, QryRCAMSShortOptAdjustParamFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSShortOptAdjustParam(&myreq, reqid);
 	return i;
 };
@@ -1657,10 +1367,11 @@ int TdApi::reqQryRCAMSInvestorCombPosition(const dict &req, int reqid)
 {
 	CThostFtdcQryRCAMSInvestorCombPositionField myreq = CThostFtdcQryRCAMSInvestorCombPositionField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
-	getString(req, "CombInstrumentID", myreq.CombInstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRCAMSInvestorCombPositionFields, &myreq);
+	else
+		dictToStruct(req, QryRCAMSInvestorCombPositionFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRCAMSInvestorCombPosition(&myreq, reqid);
 	return i;
 };
@@ -1669,10 +1380,11 @@ int TdApi::reqQryInvestorProdRCAMSMargin(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorProdRCAMSMarginField myreq = CThostFtdcQryInvestorProdRCAMSMarginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "CombProductID", myreq.CombProductID);
-	getString(req, "ProductGroupID", myreq.ProductGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorProdRCAMSMarginFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorProdRCAMSMarginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProdRCAMSMargin(&myreq, reqid);
 	return i;
 };
@@ -1681,8 +1393,11 @@ int TdApi::reqQryRULEInstrParameter(const dict &req, int reqid)
 {
 	CThostFtdcQryRULEInstrParameterField myreq = CThostFtdcQryRULEInstrParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRULEInstrParameterFields, &myreq);
+	else
+		dictToStruct(req, QryRULEInstrParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRULEInstrParameter(&myreq, reqid);
 	return i;
 };
@@ -1691,8 +1406,11 @@ int TdApi::reqQryRULEIntraParameter(const dict &req, int reqid)
 {
 	CThostFtdcQryRULEIntraParameterField myreq = CThostFtdcQryRULEIntraParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRULEIntraParameterFields, &myreq);
+	else
+		dictToStruct(req, QryRULEIntraParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRULEIntraParameter(&myreq, reqid);
 	return i;
 };
@@ -1701,10 +1419,11 @@ int TdApi::reqQryRULEInterParameter(const dict &req, int reqid)
 {
 	CThostFtdcQryRULEInterParameterField myreq = CThostFtdcQryRULEInterParameterField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "Leg1ProdFamilyCode", myreq.Leg1ProdFamilyCode);
-	getString(req, "Leg2ProdFamilyCode", myreq.Leg2ProdFamilyCode);
-	getInt(req, "CommodityGroupID", &myreq.CommodityGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryRULEInterParameterFields, &myreq);
+	else
+		dictToStruct(req, QryRULEInterParameterFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryRULEInterParameter(&myreq, reqid);
 	return i;
 };
@@ -1713,11 +1432,11 @@ int TdApi::reqQryInvestorProdRULEMargin(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorProdRULEMarginField myreq = CThostFtdcQryInvestorProdRULEMarginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
-	getString(req, "ProdFamilyCode", myreq.ProdFamilyCode);
-	getInt(req, "CommodityGroupID", &myreq.CommodityGroupID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorProdRULEMarginFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorProdRULEMarginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorProdRULEMargin(&myreq, reqid);
 	return i;
 };
@@ -1726,10 +1445,132 @@ int TdApi::reqQryInvestorPortfSetting(const dict &req, int reqid)
 {
 	CThostFtdcQryInvestorPortfSettingField myreq = CThostFtdcQryInvestorPortfSettingField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "ExchangeID", myreq.ExchangeID);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "InvestorID", myreq.InvestorID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryInvestorPortfSettingFields, &myreq);
+	else
+		dictToStruct(req, QryInvestorPortfSettingFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryInvestorPortfSetting(&myreq, reqid);
 	return i;
 };
 
+static void fillOrderTemplate(OrderTemplate &tmpl, const dict &req)
+{
+	dictToStruct(req, InputOrderFields, &tmpl.req);
+};
+
+static const pair<const char*, int (TdApi::*)(const dict&, int)> REQUEST_FUNCTIONS[] = {
+	{"reqAuthenticate", &TdApi::reqAuthenticate},
+	{"reqUserLogin", &TdApi::reqUserLogin},
+	{"reqUserLogout", &TdApi::reqUserLogout},
+	{"reqUserPasswordUpdate", &TdApi::reqUserPasswordUpdate},
+	{"reqTradingAccountPasswordUpdate", &TdApi::reqTradingAccountPasswordUpdate},
+	{"reqUserAuthMethod", &TdApi::reqUserAuthMethod},
+	{"reqGenUserCaptcha", &TdApi::reqGenUserCaptcha},
+	{"reqGenUserText", &TdApi::reqGenUserText},
+	{"reqUserLoginWithCaptcha", &TdApi::reqUserLoginWithCaptcha},
+	{"reqUserLoginWithText", &TdApi::reqUserLoginWithText},
+	{"reqUserLoginWithOTP", &TdApi::reqUserLoginWithOTP},
+	{"reqOrderInsert", &TdApi::reqOrderInsert},
+	{"reqParkedOrderInsert", &TdApi::reqParkedOrderInsert},
+	{"reqParkedOrderAction", &TdApi::reqParkedOrderAction},
+	{"reqOrderAction", &TdApi::reqOrderAction},
+	{"reqQryMaxOrderVolume", &TdApi::reqQryMaxOrderVolume},
+	{"reqSettlementInfoConfirm", &TdApi::reqSettlementInfoConfirm},
+	{"reqRemoveParkedOrder", &TdApi::reqRemoveParkedOrder},
+	{"reqRemoveParkedOrderAction", &TdApi::reqRemoveParkedOrderAction},
+	{"reqExecOrderInsert", &TdApi::reqExecOrderInsert},
+	{"reqExecOrderAction", &TdApi::reqExecOrderAction},
+	{"reqForQuoteInsert", &TdApi::reqForQuoteInsert},
+	{"reqQuoteInsert", &TdApi::reqQuoteInsert},
+	{"reqQuoteAction", &TdApi::reqQuoteAction},
+	{"reqBatchOrderAction", &TdApi::reqBatchOrderAction},
+	{"reqOptionSelfCloseInsert", &TdApi::reqOptionSelfCloseInsert},
+	{"reqOptionSelfCloseAction", &TdApi::reqOptionSelfCloseAction},
+	{"reqCombActionInsert", &TdApi::reqCombActionInsert},
+	{"reqQryOrder", &TdApi::reqQryOrder},
+	{"reqQryTrade", &TdApi::reqQryTrade},
+	{"reqQryInvestorPosition", &TdApi::reqQryInvestorPosition},
+	{"reqQryTradingAccount", &TdApi::reqQryTradingAccount},
+	{"reqQryInvestor", &TdApi::reqQryInvestor},
+	{"reqQryTradingCode", &TdApi::reqQryTradingCode},
+	{"reqQryInstrumentMarginRate", &TdApi::reqQryInstrumentMarginRate},
+	{"reqQryInstrumentCommissionRate", &TdApi::reqQryInstrumentCommissionRate},
+	{"reqQryExchange", &TdApi::reqQryExchange},
+	{"reqQryProduct", &TdApi::reqQryProduct},
+	{"reqQryInstrument", &TdApi::reqQryInstrument},
+	{"reqQryDepthMarketData", &TdApi::reqQryDepthMarketData},
+	{"reqQryTraderOffer", &TdApi::reqQryTraderOffer},
+	{"reqQrySettlementInfo", &TdApi::reqQrySettlementInfo},
+	{"reqQryTransferBank", &TdApi::reqQryTransferBank},
+	{"reqQryInvestorPositionDetail", &TdApi::reqQryInvestorPositionDetail},
+	{"reqQryNotice", &TdApi::reqQryNotice},
+	{"reqQrySettlementInfoConfirm", &TdApi::reqQrySettlementInfoConfirm},
+	{"reqQryInvestorPositionCombineDetail", &TdApi::reqQryInvestorPositionCombineDetail},
+	{"reqQryCFMMCTradingAccountKey", &TdApi::reqQryCFMMCTradingAccountKey},
+	{"reqQryEWarrantOffset", &TdApi::reqQryEWarrantOffset},
+	{"reqQryInvestorProductGroupMargin", &TdApi::reqQryInvestorProductGroupMargin},
+	{"reqQryExchangeMarginRate", &TdApi::reqQryExchangeMarginRate},
+	{"reqQryExchangeMarginRateAdjust", &TdApi::reqQryExchangeMarginRateAdjust},
+	{"reqQryExchangeRate", &TdApi::reqQryExchangeRate},
+	{"reqQrySecAgentACIDMap", &TdApi::reqQrySecAgentACIDMap},
+	{"reqQryProductExchRate", &TdApi::reqQryProductExchRate},
+	{"reqQryProductGroup", &TdApi::reqQryProductGroup},
+	{"reqQryMMInstrumentCommissionRate", &TdApi::reqQryMMInstrumentCommissionRate},
+	{"reqQryMMOptionInstrCommRate", &TdApi::reqQryMMOptionInstrCommRate},
+	{"reqQryInstrumentOrderCommRate", &TdApi::reqQryInstrumentOrderCommRate},
+	{"reqQrySecAgentTradingAccount", &TdApi::reqQrySecAgentTradingAccount},
+	{"reqQrySecAgentCheckMode", &TdApi::reqQrySecAgentCheckMode},
+	{"reqQrySecAgentTradeInfo", &TdApi::reqQrySecAgentTradeInfo},
+	{"reqQryOptionInstrTradeCost", &TdApi::reqQryOptionInstrTradeCost},
+	{"reqQryOptionInstrCommRate", &TdApi::reqQryOptionInstrCommRate},
+	{"reqQryExecOrder", &TdApi::reqQryExecOrder},
+	{"reqQryForQuote", &TdApi::reqQryForQuote},
+	{"reqQryQuote", &TdApi::reqQryQuote},
+	{"reqQryOptionSelfClose", &TdApi::reqQryOptionSelfClose},
+	{"reqQryInvestUnit", &TdApi::reqQryInvestUnit},
+	{"reqQryCombInstrumentGuard", &TdApi::reqQryCombInstrumentGuard},
+	{"reqQryCombAction", &TdApi::reqQryCombAction},
+	{"reqQryTransferSerial", &TdApi::reqQryTransferSerial},
+	{"reqQryAccountregister", &TdApi::reqQryAccountregister},
+	{"reqQryContractBank", &TdApi::reqQryContractBank},
+	{"reqQryParkedOrder", &TdApi::reqQryParkedOrder},
+	{"reqQryParkedOrderAction", &TdApi::reqQryParkedOrderAction},
+	{"reqQryTradingNotice", &TdApi::reqQryTradingNotice},
+	{"reqQryBrokerTradingParams", &TdApi::reqQryBrokerTradingParams},
+	{"reqQryBrokerTradingAlgos", &TdApi::reqQryBrokerTradingAlgos},
+	{"reqQueryCFMMCTradingAccountToken", &TdApi::reqQueryCFMMCTradingAccountToken},
+	{"reqFromBankToFutureByFuture", &TdApi::reqFromBankToFutureByFuture},
+	{"reqFromFutureToBankByFuture", &TdApi::reqFromFutureToBankByFuture},
+	{"reqQueryBankAccountMoneyByFuture", &TdApi::reqQueryBankAccountMoneyByFuture},
+	{"reqQryClassifiedInstrument", &TdApi::reqQryClassifiedInstrument},
+	{"reqQryCombPromotionParam", &TdApi::reqQryCombPromotionParam},
+	{"reqQryRiskSettleInvstPosition", &TdApi::reqQryRiskSettleInvstPosition},
+	{"reqQryRiskSettleProductStatus", &TdApi::reqQryRiskSettleProductStatus},
+	{"reqQrySPBMFutureParameter", &TdApi::reqQrySPBMFutureParameter},
+	{"reqQrySPBMOptionParameter", &TdApi::reqQrySPBMOptionParameter},
+	{"reqQrySPBMIntraParameter", &TdApi::reqQrySPBMIntraParameter},
+	{"reqQrySPBMInterParameter", &TdApi::reqQrySPBMInterParameter},
+	{"reqQrySPBMPortfDefinition", &TdApi::reqQrySPBMPortfDefinition},
+	{"reqQrySPBMInvestorPortfDef", &TdApi::reqQrySPBMInvestorPortfDef},
+	{"reqQryInvestorPortfMarginRatio", &TdApi::reqQryInvestorPortfMarginRatio},
+	{"reqQryInvestorProdSPBMDetail", &TdApi::reqQryInvestorProdSPBMDetail},
+	{"reqQryInvestorCommoditySPMMMargin", &TdApi::reqQryInvestorCommoditySPMMMargin},
+	{"reqQryInvestorCommodityGroupSPMMMargin", &TdApi::reqQryInvestorCommodityGroupSPMMMargin},
+	{"reqQrySPMMInstParam", &TdApi::reqQrySPMMInstParam},
+	{"reqQrySPMMProductParam", &TdApi::reqQrySPMMProductParam},
+	{"reqQrySPBMAddOnInterParameter", &TdApi::reqQrySPBMAddOnInterParameter},
+	{"reqQryRCAMSCombProductInfo", &TdApi::reqQryRCAMSCombProductInfo},
+	{"reqQryRCAMSInstrParameter", &TdApi::reqQryRCAMSInstrParameter},
+	{"reqQryRCAMSIntraParameter", &TdApi::reqQryRCAMSIntraParameter},
+	{"reqQryRCAMSInterParameter", &TdApi::reqQryRCAMSInterParameter},
+	{"reqQryRCAMSShortOptAdjustParam", &TdApi::reqQryRCAMSShortOptAdjustParam},
+	{"reqQryRCAMSInvestorCombPosition", &TdApi::reqQryRCAMSInvestorCombPosition},
+	{"reqQryInvestorProdRCAMSMargin", &TdApi::reqQryInvestorProdRCAMSMargin},
+	{"reqQryRULEInstrParameter", &TdApi::reqQryRULEInstrParameter},
+	{"reqQryRULEIntraParameter", &TdApi::reqQryRULEIntraParameter},
+	{"reqQryRULEInterParameter", &TdApi::reqQryRULEInterParameter},
+	{"reqQryInvestorProdRULEMargin", &TdApi::reqQryInvestorProdRULEMargin},
+	{"reqQryInvestorPortfSetting", &TdApi::reqQryInvestorPortfSetting},
+};
+
@@ -0,0 +1,4795 @@
+static PyObject *KEY_BrokerID;
+static PyObject *KEY_UserID;
+static PyObject *KEY_UserProductInfo;
+static PyObject *KEY_AppID;
+static PyObject *KEY_AppType;
+static PyObject *KEY_ErrorID;
+static PyObject *KEY_ErrorMsg;
+static PyObject *KEY_TradingDay;
+static PyObject *KEY_LoginTime;
+static PyObject *KEY_SystemName;
+static PyObject *KEY_FrontID;
+static PyObject *KEY_SessionID;
+static PyObject *KEY_MaxOrderRef;
+static PyObject *KEY_SHFETime;
+static PyObject *KEY_DCETime;
+static PyObject *KEY_CZCETime;
+static PyObject *KEY_FFEXTime;
+static PyObject *KEY_INETime;
+static PyObject *KEY_SysVersion;
+static PyObject *KEY_GFEXTime;
+static PyObject *KEY_OldPassword;
+static PyObject *KEY_NewPassword;
+static PyObject *KEY_AccountID;
+static PyObject *KEY_CurrencyID;
+static PyObject *KEY_UsableAuthMethod;
+static PyObject *KEY_CaptchaInfoLen;
+static PyObject *KEY_CaptchaInfo;
+static PyObject *KEY_UserTextSeq;
+static PyObject *KEY_InvestorID;
+static PyObject *KEY_reserve1;
+static PyObject *KEY_OrderRef;
+static PyObject *KEY_OrderPriceType;
+static PyObject *KEY_Direction;
+static PyObject *KEY_CombOffsetFlag;
+static PyObject *KEY_CombHedgeFlag;
+static PyObject *KEY_LimitPrice;
+static PyObject *KEY_VolumeTotalOriginal;
+static PyObject *KEY_TimeCondition;
+static PyObject *KEY_GTDDate;
+static PyObject *KEY_VolumeCondition;
+static PyObject *KEY_MinVolume;
+static PyObject *KEY_ContingentCondition;
+static PyObject *KEY_StopPrice;
+static PyObject *KEY_ForceCloseReason;
+static PyObject *KEY_IsAutoSuspend;
+static PyObject *KEY_BusinessUnit;
+static PyObject *KEY_RequestID;
+static PyObject *KEY_UserForceClose;
+static PyObject *KEY_IsSwapOrder;
+static PyObject *KEY_ExchangeID;
+static PyObject *KEY_InvestUnitID;
+static PyObject *KEY_ClientID;
+static PyObject *KEY_reserve2;
+static PyObject *KEY_MacAddress;
+static PyObject *KEY_InstrumentID;
+static PyObject *KEY_IPAddress;
+static PyObject *KEY_OrderMemo;
+static PyObject *KEY_SessionReqSeq;
+static PyObject *KEY_ParkedOrderID;
+static PyObject *KEY_UserType;
+static PyObject *KEY_Status;
+static PyObject *KEY_OrderActionRef;
+static PyObject *KEY_OrderSysID;
+static PyObject *KEY_ActionFlag;
+static PyObject *KEY_VolumeChange;
+static PyObject *KEY_ParkedOrderActionID;
+static PyObject *KEY_OffsetFlag;
+static PyObject *KEY_HedgeFlag;
+static PyObject *KEY_MaxVolume;
+static PyObject *KEY_ConfirmDate;
+static PyObject *KEY_ConfirmTime;
+static PyObject *KEY_SettlementID;
+static PyObject *KEY_ExecOrderRef;
+static PyObject *KEY_Volume;
+static PyObject *KEY_ActionType;
+static PyObject *KEY_PosiDirection;
+static PyObject *KEY_ReservePositionFlag;
+static PyObject *KEY_CloseFlag;
+static PyObject *KEY_ExecOrderActionRef;
+static PyObject *KEY_ExecOrderSysID;
+static PyObject *KEY_ForQuoteRef;
+static PyObject *KEY_QuoteRef;
+static PyObject *KEY_AskPrice;
+static PyObject *KEY_BidPrice;
+static PyObject *KEY_AskVolume;
+static PyObject *KEY_BidVolume;
+static PyObject *KEY_AskOffsetFlag;
+static PyObject *KEY_BidOffsetFlag;
+static PyObject *KEY_AskHedgeFlag;
+static PyObject *KEY_BidHedgeFlag;
+static PyObject *KEY_AskOrderRef;
+static PyObject *KEY_BidOrderRef;
+static PyObject *KEY_ForQuoteSysID;
+static PyObject *KEY_ReplaceSysID;
+static PyObject *KEY_QuoteActionRef;
+static PyObject *KEY_QuoteSysID;
+static PyObject *KEY_OptionSelfCloseRef;
+static PyObject *KEY_OptSelfCloseFlag;
+static PyObject *KEY_OptionSelfCloseActionRef;
+static PyObject *KEY_OptionSelfCloseSysID;
+static PyObject *KEY_CombActionRef;
+static PyObject *KEY_CombDirection;
+static PyObject *KEY_OrderLocalID;
+static PyObject *KEY_ParticipantID;
+static PyObject *KEY_TraderID;
+static PyObject *KEY_InstallID;
+static PyObject *KEY_OrderSubmitStatus;
+static PyObject *KEY_NotifySequence;
+static PyObject *KEY_OrderSource;
+static PyObject *KEY_OrderStatus;
+static PyObject *KEY_OrderType;
+static PyObject *KEY_VolumeTraded;
+static PyObject *KEY_VolumeTotal;
+static PyObject *KEY_InsertDate;
+static PyObject *KEY_InsertTime;
+static PyObject *KEY_ActiveTime;
+static PyObject *KEY_SuspendTime;
+static PyObject *KEY_UpdateTime;
+static PyObject *KEY_CancelTime;
+static PyObject *KEY_ActiveTraderID;
+static PyObject *KEY_ClearingPartID;
+static PyObject *KEY_SequenceNo;
+static PyObject *KEY_StatusMsg;
+static PyObject *KEY_ActiveUserID;
+static PyObject *KEY_BrokerOrderSeq;
+static PyObject *KEY_RelativeOrderSysID;
+static PyObject *KEY_ZCETotalTradedVolume;
+static PyObject *KEY_BranchID;
+static PyObject *KEY_reserve3;
+static PyObject *KEY_ExchangeInstID;
+static PyObject *KEY_TradeID;
+static PyObject *KEY_TradingRole;
+static PyObject *KEY_Price;
+static PyObject *KEY_TradeDate;
+static PyObject *KEY_TradeTime;
+static PyObject *KEY_TradeType;
+static PyObject *KEY_PriceSource;
+static PyObject *KEY_TradeSource;
+static PyObject *KEY_PositionDate;
+static PyObject *KEY_YdPosition;
+static PyObject *KEY_Position;
+static PyObject *KEY_LongFrozen;
+static PyObject *KEY_ShortFrozen;
+static PyObject *KEY_LongFrozenAmount;
+static PyObject *KEY_ShortFrozenAmount;
+static PyObject *KEY_OpenVolume;
+static PyObject *KEY_CloseVolume;
+static PyObject *KEY_OpenAmount;
+static PyObject *KEY_CloseAmount;
+static PyObject *KEY_PositionCost;
+static PyObject *KEY_PreMargin;
+static PyObject *KEY_UseMargin;
+static PyObject *KEY_FrozenMargin;
+static PyObject *KEY_FrozenCash;
+static PyObject *KEY_FrozenCommission;
+static PyObject *KEY_CashIn;
+static PyObject *KEY_Commission;
+static PyObject *KEY_CloseProfit;
+static PyObject *KEY_PositionProfit;
+static PyObject *KEY_PreSettlementPrice;
+static PyObject *KEY_SettlementPrice;
+static PyObject *KEY_OpenCost;
+static PyObject *KEY_ExchangeMargin;
+static PyObject *KEY_CombPosition;
+static PyObject *KEY_CombLongFrozen;
+static PyObject *KEY_CombShortFrozen;
+static PyObject *KEY_CloseProfitByDate;
+static PyObject *KEY_CloseProfitByTrade;
+static PyObject *KEY_TodayPosition;
+static PyObject *KEY_MarginRateByMoney;
+static PyObject *KEY_MarginRateByVolume;
+static PyObject *KEY_StrikeFrozen;
+static PyObject *KEY_StrikeFrozenAmount;
+static PyObject *KEY_AbandonFrozen;
+static PyObject *KEY_YdStrikeFrozen;
+static PyObject *KEY_PositionCostOffset;
+static PyObject *KEY_TasPosition;
+static PyObject *KEY_TasPositionCost;
+static PyObject *KEY_PreMortgage;
+static PyObject *KEY_PreCredit;
+static PyObject *KEY_PreDeposit;
+static PyObject *KEY_PreBalance;
+static PyObject *KEY_InterestBase;
+static PyObject *KEY_Interest;
+static PyObject *KEY_Deposit;
+static PyObject *KEY_Withdraw;
+static PyObject *KEY_CurrMargin;
+static PyObject *KEY_Balance;
+static PyObject *KEY_Available;
+static PyObject *KEY_WithdrawQuota;
+static PyObject *KEY_Reserve;
+static PyObject *KEY_Credit;
+static PyObject *KEY_Mortgage;
+static PyObject *KEY_DeliveryMargin;
+static PyObject *KEY_ExchangeDeliveryMargin;
+static PyObject *KEY_ReserveBalance;
+static PyObject *KEY_PreFundMortgageIn;
+static PyObject *KEY_PreFundMortgageOut;
+static PyObject *KEY_FundMortgageIn;
+static PyObject *KEY_FundMortgageOut;
+static PyObject *KEY_FundMortgageAvailable;
+static PyObject *KEY_MortgageableFund;
+static PyObject *KEY_SpecProductMargin;
+static PyObject *KEY_SpecProductFrozenMargin;
+static PyObject *KEY_SpecProductCommission;
+static PyObject *KEY_SpecProductFrozenCommission;
+static PyObject *KEY_SpecProductPositionProfit;
+static PyObject *KEY_SpecProductCloseProfit;
+static PyObject *KEY_SpecProductPositionProfitByAlg;
+static PyObject *KEY_SpecProductExchangeMargin;
+static PyObject *KEY_BizType;
+static PyObject *KEY_FrozenSwap;
+static PyObject *KEY_RemainSwap;
+static PyObject *KEY_InvestorGroupID;
+static PyObject *KEY_InvestorName;
+static PyObject *KEY_IdentifiedCardType;
+static PyObject *KEY_IdentifiedCardNo;
+static PyObject *KEY_IsActive;
+static PyObject *KEY_Telephone;
+static PyObject *KEY_Address;
+static PyObject *KEY_OpenDate;
+static PyObject *KEY_Mobile;
+static PyObject *KEY_CommModelID;
+static PyObject *KEY_MarginModelID;
+static PyObject *KEY_IsOrderFreq;
+static PyObject *KEY_IsOpenVolLimit;
+static PyObject *KEY_ClientIDType;
+static PyObject *KEY_InvestorRange;
+static PyObject *KEY_LongMarginRatioByMoney;
+static PyObject *KEY_LongMarginRatioByVolume;
+static PyObject *KEY_ShortMarginRatioByMoney;
+static PyObject *KEY_ShortMarginRatioByVolume;
+static PyObject *KEY_IsRelative;
+static PyObject *KEY_OpenRatioByMoney;
+static PyObject *KEY_OpenRatioByVolume;
+static PyObject *KEY_CloseRatioByMoney;
+static PyObject *KEY_CloseRatioByVolume;
+static PyObject *KEY_CloseTodayRatioByMoney;
+static PyObject *KEY_CloseTodayRatioByVolume;
+static PyObject *KEY_ExchangeName;
+static PyObject *KEY_ExchangeProperty;
+static PyObject *KEY_ProductName;
+static PyObject *KEY_ProductClass;
+static PyObject *KEY_VolumeMultiple;
+static PyObject *KEY_PriceTick;
+static PyObject *KEY_MaxMarketOrderVolume;
+static PyObject *KEY_MinMarketOrderVolume;
+static PyObject *KEY_MaxLimitOrderVolume;
+static PyObject *KEY_MinLimitOrderVolume;
+static PyObject *KEY_PositionType;
+static PyObject *KEY_PositionDateType;
+static PyObject *KEY_CloseDealType;
+static PyObject *KEY_TradeCurrencyID;
+static PyObject *KEY_MortgageFundUseRange;
+static PyObject *KEY_UnderlyingMultiple;
+static PyObject *KEY_ProductID;
+static PyObject *KEY_ExchangeProductID;
+static PyObject *KEY_OpenLimitControlLevel;
+static PyObject *KEY_OrderFreqControlLevel;
+static PyObject *KEY_InstrumentName;
+static PyObject *KEY_DeliveryYear;
+static PyObject *KEY_DeliveryMonth;
+static PyObject *KEY_CreateDate;
+static PyObject *KEY_ExpireDate;
+static PyObject *KEY_StartDelivDate;
+static PyObject *KEY_EndDelivDate;
+static PyObject *KEY_InstLifePhase;
+static PyObject *KEY_IsTrading;
+static PyObject *KEY_LongMarginRatio;
+static PyObject *KEY_ShortMarginRatio;
+static PyObject *KEY_MaxMarginSideAlgorithm;
+static PyObject *KEY_reserve4;
+static PyObject *KEY_StrikePrice;
+static PyObject *KEY_OptionsType;
+static PyObject *KEY_CombinationType;
+static PyObject *KEY_UnderlyingInstrID;
+static PyObject *KEY_LastPrice;
+static PyObject *KEY_PreClosePrice;
+static PyObject *KEY_PreOpenInterest;
+static PyObject *KEY_OpenPrice;
+static PyObject *KEY_HighestPrice;
+static PyObject *KEY_LowestPrice;
+static PyObject *KEY_Turnover;
+static PyObject *KEY_OpenInterest;
+static PyObject *KEY_ClosePrice;
+static PyObject *KEY_UpperLimitPrice;
+static PyObject *KEY_LowerLimitPrice;
+static PyObject *KEY_PreDelta;
+static PyObject *KEY_CurrDelta;
+static PyObject *KEY_UpdateMillisec;
+static PyObject *KEY_BidPrice1;
+static PyObject *KEY_BidVolume1;
+static PyObject *KEY_AskPrice1;
+static PyObject *KEY_AskVolume1;
+static PyObject *KEY_BidPrice2;
+static PyObject *KEY_BidVolume2;
+static PyObject *KEY_AskPrice2;
+static PyObject *KEY_AskVolume2;
+static PyObject *KEY_BidPrice3;
+static PyObject *KEY_BidVolume3;
+static PyObject *KEY_AskPrice3;
+static PyObject *KEY_AskVolume3;
+static PyObject *KEY_BidPrice4;
+static PyObject *KEY_BidVolume4;
+static PyObject *KEY_AskPrice4;
+static PyObject *KEY_AskVolume4;
+static PyObject *KEY_BidPrice5;
+static PyObject *KEY_BidVolume5;
+static PyObject *KEY_AskPrice5;
+static PyObject *KEY_AskVolume5;
+static PyObject *KEY_AveragePrice;
+static PyObject *KEY_ActionDay;
+static PyObject *KEY_BandingUpperPrice;
+static PyObject *KEY_BandingLowerPrice;
+static PyObject *KEY_Password;
+static PyObject *KEY_TraderConnectStatus;
+static PyObject *KEY_ConnectRequestDate;
+static PyObject *KEY_ConnectRequestTime;
+static PyObject *KEY_LastReportDate;
+static PyObject *KEY_LastReportTime;
+static PyObject *KEY_ConnectDate;
+static PyObject *KEY_ConnectTime;
+static PyObject *KEY_StartDate;
+static PyObject *KEY_StartTime;
+static PyObject *KEY_MaxTradeID;
+static PyObject *KEY_MaxOrderMessageReference;
+static PyObject *KEY_OrderCancelAlg;
+static PyObject *KEY_Content;
+static PyObject *KEY_BankID;
+static PyObject *KEY_BankBrchID;
+static PyObject *KEY_BankName;
+static PyObject *KEY_PositionProfitByDate;
+static PyObject *KEY_PositionProfitByTrade;
+static PyObject *KEY_Margin;
+static PyObject *KEY_ExchMargin;
+static PyObject *KEY_LastSettlementPrice;
+static PyObject *KEY_TimeFirstVolume;
+static PyObject *KEY_SpecPosiType;
+static PyObject *KEY_CombInstrumentID;
+static PyObject *KEY_SequenceLabel;
+static PyObject *KEY_ComTradeID;
+static PyObject *KEY_TotalAmt;
+static PyObject *KEY_LegID;
+static PyObject *KEY_LegMultiple;
+static PyObject *KEY_TradeGroupID;
+static PyObject *KEY_KeyID;
+static PyObject *KEY_CurrentKey;
+static PyObject *KEY_LongFrozenMargin;
+static PyObject *KEY_ShortFrozenMargin;
+static PyObject *KEY_LongUseMargin;
+static PyObject *KEY_ShortUseMargin;
+static PyObject *KEY_LongExchMargin;
+static PyObject *KEY_ShortExchMargin;
+static PyObject *KEY_OffsetAmount;
+static PyObject *KEY_LongOffsetAmount;
+static PyObject *KEY_ShortOffsetAmount;
+static PyObject *KEY_ExchOffsetAmount;
+static PyObject *KEY_LongExchOffsetAmount;
+static PyObject *KEY_ShortExchOffsetAmount;
+static PyObject *KEY_ProductGroupID;
+static PyObject *KEY_ExchLongMarginRatioByMoney;
+static PyObject *KEY_ExchLongMarginRatioByVolume;
+static PyObject *KEY_ExchShortMarginRatioByMoney;
+static PyObject *KEY_ExchShortMarginRatioByVolume;
+static PyObject *KEY_NoLongMarginRatioByMoney;
+static PyObject *KEY_NoLongMarginRatioByVolume;
+static PyObject *KEY_NoShortMarginRatioByMoney;
+static PyObject *KEY_NoShortMarginRatioByVolume;
+static PyObject *KEY_FromCurrencyID;
+static PyObject *KEY_FromCurrencyUnit;
+static PyObject *KEY_ToCurrencyID;
+static PyObject *KEY_ExchangeRate;
+static PyObject *KEY_BrokerSecAgentID;
+static PyObject *KEY_QuoteCurrencyID;
+static PyObject *KEY_StrikeRatioByMoney;
+static PyObject *KEY_StrikeRatioByVolume;
+static PyObject *KEY_OrderCommByVolume;
+static PyObject *KEY_OrderActionCommByVolume;
+static PyObject *KEY_OrderCommByTrade;
+static PyObject *KEY_OrderActionCommByTrade;
+static PyObject *KEY_CheckSelfAccount;
+static PyObject *KEY_LongCustomerName;
+static PyObject *KEY_FixedMargin;
+static PyObject *KEY_MiniMargin;
+static PyObject *KEY_Royalty;
+static PyObject *KEY_ExchFixedMargin;
+static PyObject *KEY_ExchMiniMargin;
+static PyObject *KEY_ExecOrderLocalID;
+static PyObject *KEY_ExecResult;
+static PyObject *KEY_BrokerExecOrderSeq;
+static PyObject *KEY_ForQuoteLocalID;
+static PyObject *KEY_ForQuoteStatus;
+static PyObject *KEY_BrokerForQutoSeq;
+static PyObject *KEY_QuoteLocalID;
+static PyObject *KEY_QuoteStatus;
+static PyObject *KEY_AskOrderSysID;
+static PyObject *KEY_BidOrderSysID;
+static PyObject *KEY_BrokerQuoteSeq;
+static PyObject *KEY_OptionSelfCloseLocalID;
+static PyObject *KEY_BrokerOptionSelfCloseSeq;
+static PyObject *KEY_InvestorUnitName;
+static PyObject *KEY_GuarantRatio;
+static PyObject *KEY_ActionLocalID;
+static PyObject *KEY_ActionStatus;
+static PyObject *KEY_PlateSerial;
+static PyObject *KEY_TradeCode;
+static PyObject *KEY_BankBranchID;
+static PyObject *KEY_BankAccType;
+static PyObject *KEY_BankAccount;
+static PyObject *KEY_BankSerial;
+static PyObject *KEY_BrokerBranchID;
+static PyObject *KEY_FutureAccType;
+static PyObject *KEY_FutureSerial;
+static PyObject *KEY_IdCardType;
+static PyObject *KEY_TradeAmount;
+static PyObject *KEY_CustFee;
+static PyObject *KEY_BrokerFee;
+static PyObject *KEY_AvailabilityFlag;
+static PyObject *KEY_OperatorCode;
+static PyObject *KEY_BankNewAccount;
+static PyObject *KEY_TradeDay;
+static PyObject *KEY_CustomerName;
+static PyObject *KEY_OpenOrDestroy;
+static PyObject *KEY_RegDate;
+static PyObject *KEY_OutDate;
+static PyObject *KEY_TID;
+static PyObject *KEY_CustType;
+static PyObject *KEY_ActionDate;
+static PyObject *KEY_ActionTime;
+static PyObject *KEY_OrderActionStatus;
+static PyObject *KEY_SettlementGroupID;
+static PyObject *KEY_InstrumentStatus;
+static PyObject *KEY_TradingSegmentSN;
+static PyObject *KEY_EnterTime;
+static PyObject *KEY_EnterReason;
+static PyObject *KEY_BulletinID;
+static PyObject *KEY_NewsType;
+static PyObject *KEY_NewsUrgency;
+static PyObject *KEY_SendTime;
+static PyObject *KEY_Abstract;
+static PyObject *KEY_ComeFrom;
+static PyObject *KEY_URLLink;
+static PyObject *KEY_MarketID;
+static PyObject *KEY_FieldContent;
+static PyObject *KEY_SequenceSeries;
+static PyObject *KEY_ForQuoteTime;
+static PyObject *KEY_Token;
+static PyObject *KEY_MarginPriceType;
+static PyObject *KEY_Algorithm;
+static PyObject *KEY_AvailIncludeCloseProfit;
+static PyObject *KEY_OptionRoyaltyPriceType;
+static PyObject *KEY_HandlePositionAlgoID;
+static PyObject *KEY_FindMarginRateAlgoID;
+static PyObject *KEY_HandleTradingAccountAlgoID;
+static PyObject *KEY_LastFragment;
+static PyObject *KEY_BankPassWord;
+static PyObject *KEY_VerifyCertNoFlag;
+static PyObject *KEY_FutureFetchAmount;
+static PyObject *KEY_FeePayFlag;
+static PyObject *KEY_Message;
+static PyObject *KEY_Digest;
+static PyObject *KEY_DeviceID;
+static PyObject *KEY_BankSecuAccType;
+static PyObject *KEY_BrokerIDByBank;
+static PyObject *KEY_BankSecuAcc;
+static PyObject *KEY_BankPwdFlag;
+static PyObject *KEY_SecuPwdFlag;
+static PyObject *KEY_OperNo;
+static PyObject *KEY_TransferStatus;
+static PyObject *KEY_RepealTimeInterval;
+static PyObject *KEY_RepealedTimes;
+static PyObject *KEY_BankRepealFlag;
+static PyObject *KEY_BrokerRepealFlag;
+static PyObject *KEY_PlateRepealSerial;
+static PyObject *KEY_BankRepealSerial;
+static PyObject *KEY_FutureRepealSerial;
+static PyObject *KEY_BankUseAmount;
+static PyObject *KEY_BankFetchAmount;
+static PyObject *KEY_Gender;
+static PyObject *KEY_CountryCode;
+static PyObject *KEY_ZipCode;
+static PyObject *KEY_MobilePhone;
+static PyObject *KEY_Fax;
+static PyObject *KEY_EMail;
+static PyObject *KEY_MoneyAccountStatus;
+static PyObject *KEY_CashExchangeCode;
+static PyObject *KEY_NewBankAccount;
+static PyObject *KEY_NewBankPassWord;
+static PyObject *KEY_Xparameter;
+static PyObject *KEY_ProductStatus;
+static PyObject *KEY_ProdFamilyCode;
+static PyObject *KEY_Cvf;
+static PyObject *KEY_TimeRange;
+static PyObject *KEY_MarginRate;
+static PyObject *KEY_LockRateX;
+static PyObject *KEY_AddOnRate;
+static PyObject *KEY_AddOnLockRateX2;
+static PyObject *KEY_DownPrice;
+static PyObject *KEY_Delta;
+static PyObject *KEY_SlimiDelta;
+static PyObject *KEY_IntraRateY;
+static PyObject *KEY_AddOnIntraRateY2;
+static PyObject *KEY_SpreadId;
+static PyObject *KEY_InterRateZ;
+static PyObject *KEY_Leg1ProdFamilyCode;
+static PyObject *KEY_Leg2ProdFamilyCode;
+static PyObject *KEY_PortfolioDefID;
+static PyObject *KEY_IsSPBM;
+static PyObject *KEY_MarginRatio;
+static PyObject *KEY_IntraInstrMargin;
+static PyObject *KEY_BCollectingMargin;
+static PyObject *KEY_SCollectingMargin;
+static PyObject *KEY_IntraProdMargin;
+static PyObject *KEY_NetMargin;
+static PyObject *KEY_InterProdMargin;
+static PyObject *KEY_SingleMargin;
+static PyObject *KEY_AddOnMargin;
+static PyObject *KEY_CallOptionMinRisk;
+static PyObject *KEY_PutOptionMinRisk;
+static PyObject *KEY_OptionMinRisk;
+static PyObject *KEY_OptionValueOffset;
+static PyObject *KEY_OptionRoyalty;
+static PyObject *KEY_RealOptionValueOffset;
+static PyObject *KEY_CommodityID;
+static PyObject *KEY_MarginBeforeDiscount;
+static PyObject *KEY_MarginNoDiscount;
+static PyObject *KEY_LongPosRisk;
+static PyObject *KEY_LongOpenFrozenRisk;
+static PyObject *KEY_LongCloseFrozenRisk;
+static PyObject *KEY_ShortPosRisk;
+static PyObject *KEY_ShortOpenFrozenRisk;
+static PyObject *KEY_ShortCloseFrozenRisk;
+static PyObject *KEY_IntraCommodityRate;
+static PyObject *KEY_OptionDiscountRate;
+static PyObject *KEY_PosDiscount;
+static PyObject *KEY_OpenFrozenDiscount;
+static PyObject *KEY_NetRisk;
+static PyObject *KEY_CloseFrozenMargin;
+static PyObject *KEY_StrikeFrozenMargin;
+static PyObject *KEY_CommodityGroupID;
+static PyObject *KEY_LongRisk;
+static PyObject *KEY_ShortRisk;
+static PyObject *KEY_InterCommodityRate;
+static PyObject *KEY_MiniMarginRatio;
+static PyObject *KEY_AdjustRatio;
+static PyObject *KEY_IntraCommodityDiscount;
+static PyObject *KEY_InterCommodityDiscount;
+static PyObject *KEY_InvestorMargin;
+static PyObject *KEY_InstMarginCalID;
+static PyObject *KEY_AddOnInterRateZ2;
+static PyObject *KEY_CombProductID;
+static PyObject *KEY_HedgeRate;
+static PyObject *KEY_Priority;
+static PyObject *KEY_CreditRate;
+static PyObject *KEY_CombProduct1;
+static PyObject *KEY_CombProduct2;
+static PyObject *KEY_AdjustValue;
+static PyObject *KEY_RiskBeforeDiscount;
+static PyObject *KEY_IntraInstrRisk;
+static PyObject *KEY_BPosRisk;
+static PyObject *KEY_SPosRisk;
+static PyObject *KEY_IntraProdRisk;
+static PyObject *KEY_InterProdRisk;
+static PyObject *KEY_ShortOptRiskAdj;
+static PyObject *KEY_MMSACloseFrozenMargin;
+static PyObject *KEY_CloseCombFrozenMargin;
+static PyObject *KEY_MMSAOpenFrozenMargin;
+static PyObject *KEY_DeliveryOpenFrozenMargin;
+static PyObject *KEY_OpenFrozenMargin;
+static PyObject *KEY_UseFrozenMargin;
+static PyObject *KEY_MMSAExchMargin;
+static PyObject *KEY_DeliveryExchMargin;
+static PyObject *KEY_CombExchMargin;
+static PyObject *KEY_InstrumentClass;
+static PyObject *KEY_StdInstrumentID;
+static PyObject *KEY_BSpecRatio;
+static PyObject *KEY_SSpecRatio;
+static PyObject *KEY_BHedgeRatio;
+static PyObject *KEY_SHedgeRatio;
+static PyObject *KEY_BAddOnMargin;
+static PyObject *KEY_SAddOnMargin;
+static PyObject *KEY_StdInstrMargin;
+static PyObject *KEY_UsualIntraRate;
+static PyObject *KEY_DeliveryIntraRate;
+static PyObject *KEY_InterRate;
+static PyObject *KEY_Leg1PropFactor;
+static PyObject *KEY_Leg2PropFactor;
+static PyObject *KEY_CommodityGroupName;
+static PyObject *KEY_BStdPosition;
+static PyObject *KEY_SStdPosition;
+static PyObject *KEY_BStdOpenFrozen;
+static PyObject *KEY_SStdOpenFrozen;
+static PyObject *KEY_BStdCloseFrozen;
+static PyObject *KEY_SStdCloseFrozen;
+static PyObject *KEY_IntraProdStdPosition;
+static PyObject *KEY_NetStdPosition;
+static PyObject *KEY_InterProdStdPosition;
+static PyObject *KEY_SingleStdPosition;
+static PyObject *KEY_NonCombMargin;
+static PyObject *KEY_AddOnFrozenMargin;
+static PyObject *KEY_UsePortf;
+static PyObject *KEY_AuthCode;
+static PyObject *KEY_InterfaceProductInfo;
+static PyObject *KEY_ProtocolInfo;
+static PyObject *KEY_OneTimePassword;
+static PyObject *KEY_LoginRemark;
+static PyObject *KEY_ClientIPPort;
+static PyObject *KEY_ClientIPAddress;
+static PyObject *KEY_Captcha;
+static PyObject *KEY_Text;
+static PyObject *KEY_OTPPassword;
+static PyObject *KEY_InsertTimeStart;
+static PyObject *KEY_InsertTimeEnd;
+static PyObject *KEY_TradeTimeStart;
+static PyObject *KEY_TradeTimeEnd;
+static PyObject *KEY_InputPrice;
+static PyObject *KEY_UnderlyingPrice;
+static PyObject *KEY_TradingType;
+static PyObject *KEY_ClassType;
+
+static void initKeys()
+{
+	KEY_BrokerID = PyUnicode_InternFromString("BrokerID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_UserProductInfo = PyUnicode_InternFromString("UserProductInfo");
+	KEY_AppID = PyUnicode_InternFromString("AppID");
+	KEY_AppType = PyUnicode_InternFromString("AppType");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_SystemName = PyUnicode_InternFromString("SystemName");
+	KEY_FrontID = PyUnicode_InternFromString("FrontID");
+	KEY_SessionID = PyUnicode_InternFromString("SessionID");
+	KEY_MaxOrderRef = PyUnicode_InternFromString("MaxOrderRef");
+	KEY_SHFETime = PyUnicode_InternFromString("SHFETime");
+	KEY_DCETime = PyUnicode_InternFromString("DCETime");
+	KEY_CZCETime = PyUnicode_InternFromString("CZCETime");
+	KEY_FFEXTime = PyUnicode_InternFromString("FFEXTime");
+	KEY_INETime = PyUnicode_InternFromString("INETime");
+	KEY_SysVersion = PyUnicode_InternFromString("SysVersion");
+	KEY_GFEXTime = PyUnicode_InternFromString("GFEXTime");
+	KEY_OldPassword = PyUnicode_InternFromString("OldPassword");
+	KEY_NewPassword = PyUnicode_InternFromString("NewPassword");
+	KEY_AccountID = PyUnicode_InternFromString("AccountID");
+	KEY_CurrencyID = PyUnicode_InternFromString("CurrencyID");
+	KEY_UsableAuthMethod = PyUnicode_InternFromString("UsableAuthMethod");
+	KEY_CaptchaInfoLen = PyUnicode_InternFromString("CaptchaInfoLen");
+	KEY_CaptchaInfo = PyUnicode_InternFromString("CaptchaInfo");
+	KEY_UserTextSeq = PyUnicode_InternFromString("UserTextSeq");
+	KEY_InvestorID = PyUnicode_InternFromString("InvestorID");
+	KEY_reserve1 = PyUnicode_InternFromString("reserve1");
+	KEY_OrderRef = PyUnicode_InternFromString("OrderRef");
+	KEY_OrderPriceType = PyUnicode_InternFromString("OrderPriceType");
+	KEY_Direction = PyUnicode_InternFromString("Direction");
+	KEY_CombOffsetFlag = PyUnicode_InternFromString("CombOffsetFlag");
+	KEY_CombHedgeFlag = PyUnicode_InternFromString("CombHedgeFlag");
+	KEY_LimitPrice = PyUnicode_InternFromString("LimitPrice");
+	KEY_VolumeTotalOriginal = PyUnicode_InternFromString("VolumeTotalOriginal");
+	KEY_TimeCondition = PyUnicode_InternFromString("TimeCondition");
+	KEY_GTDDate = PyUnicode_InternFromString("GTDDate");
+	KEY_VolumeCondition = PyUnicode_InternFromString("VolumeCondition");
+	KEY_MinVolume = PyUnicode_InternFromString("MinVolume");
+	KEY_ContingentCondition = PyUnicode_InternFromString("ContingentCondition");
+	KEY_StopPrice = PyUnicode_InternFromString("StopPrice");
+	KEY_ForceCloseReason = PyUnicode_InternFromString("ForceCloseReason");
+	KEY_IsAutoSuspend = PyUnicode_InternFromString("IsAutoSuspend");
+	KEY_BusinessUnit = PyUnicode_InternFromString("BusinessUnit");
+	KEY_RequestID = PyUnicode_InternFromString("RequestID");
+	KEY_UserForceClose = PyUnicode_InternFromString("UserForceClose");
+	KEY_IsSwapOrder = PyUnicode_InternFromString("IsSwapOrder");
+	KEY_ExchangeID = PyUnicode_InternFromString("ExchangeID");
+	KEY_InvestUnitID = PyUnicode_InternFromString("InvestUnitID");
+	KEY_ClientID = PyUnicode_InternFromString("ClientID");
+	KEY_reserve2 = PyUnicode_InternFromString("reserve2");
+	KEY_MacAddress = PyUnicode_InternFromString("MacAddress");
+	KEY_InstrumentID = PyUnicode_InternFromString("InstrumentID");
+	KEY_IPAddress = PyUnicode_InternFromString("IPAddress");
+	KEY_OrderMemo = PyUnicode_InternFromString("OrderMemo");
+	KEY_SessionReqSeq = PyUnicode_InternFromString("SessionReqSeq");
+	KEY_ParkedOrderID = PyUnicode_InternFromString("ParkedOrderID");
+	KEY_UserType = PyUnicode_InternFromString("UserType");
+	KEY_Status = PyUnicode_InternFromString("Status");
+	KEY_OrderActionRef = PyUnicode_InternFromString("OrderActionRef");
+	KEY_OrderSysID = PyUnicode_InternFromString("OrderSysID");
+	KEY_ActionFlag = PyUnicode_InternFromString("ActionFlag");
+	KEY_VolumeChange = PyUnicode_InternFromString("VolumeChange");
+	KEY_ParkedOrderActionID = PyUnicode_InternFromString("ParkedOrderActionID");
+	KEY_OffsetFlag = PyUnicode_InternFromString("OffsetFlag");
+	KEY_HedgeFlag = PyUnicode_InternFromString("HedgeFlag");
+	KEY_MaxVolume = PyUnicode_InternFromString("MaxVolume");
+	KEY_ConfirmDate = PyUnicode_InternFromString("ConfirmDate");
+	KEY_ConfirmTime = PyUnicode_InternFromString("ConfirmTime");
+	KEY_SettlementID = PyUnicode_InternFromString("SettlementID");
+	KEY_ExecOrderRef = PyUnicode_InternFromString("ExecOrderRef");
+	KEY_Volume = PyUnicode_InternFromString("Volume");
+	KEY_ActionType = PyUnicode_InternFromString("ActionType");
+	KEY_PosiDirection = PyUnicode_InternFromString("PosiDirection");
+	KEY_ReservePositionFlag = PyUnicode_InternFromString("ReservePositionFlag");
+	KEY_CloseFlag = PyUnicode_InternFromString("CloseFlag");
+	KEY_ExecOrderActionRef = PyUnicode_InternFromString("ExecOrderActionRef");
+	KEY_ExecOrderSysID = PyUnicode_InternFromString("ExecOrderSysID");
+	KEY_ForQuoteRef = PyUnicode_InternFromString("ForQuoteRef");
+	KEY_QuoteRef = PyUnicode_InternFromString("QuoteRef");
+	KEY_AskPrice = PyUnicode_InternFromString("AskPrice");
+	KEY_BidPrice = PyUnicode_InternFromString("BidPrice");
+	KEY_AskVolume = PyUnicode_InternFromString("AskVolume");
+	KEY_BidVolume = PyUnicode_InternFromString("BidVolume");
+	KEY_AskOffsetFlag = PyUnicode_InternFromString("AskOffsetFlag");
+	KEY_BidOffsetFlag = PyUnicode_InternFromString("BidOffsetFlag");
+	KEY_AskHedgeFlag = PyUnicode_InternFromString("AskHedgeFlag");
+	KEY_BidHedgeFlag = PyUnicode_InternFromString("BidHedgeFlag");
+	KEY_AskOrderRef = PyUnicode_InternFromString("AskOrderRef");
+	KEY_BidOrderRef = PyUnicode_InternFromString("BidOrderRef");
+	KEY_ForQuoteSysID = PyUnicode_InternFromString("ForQuoteSysID");
+	KEY_ReplaceSysID = PyUnicode_InternFromString("ReplaceSysID");
+	KEY_QuoteActionRef = PyUnicode_InternFromString("QuoteActionRef");
+	KEY_QuoteSysID = PyUnicode_InternFromString("QuoteSysID");
+	KEY_OptionSelfCloseRef = PyUnicode_InternFromString("OptionSelfCloseRef");
+	KEY_OptSelfCloseFlag = PyUnicode_InternFromString("OptSelfCloseFlag");
+	KEY_OptionSelfCloseActionRef = PyUnicode_InternFromString("OptionSelfCloseActionRef");
+	KEY_OptionSelfCloseSysID = PyUnicode_InternFromString("OptionSelfCloseSysID");
+	KEY_CombActionRef = PyUnicode_InternFromString("CombActionRef");
+	KEY_CombDirection = PyUnicode_InternFromString("CombDirection");
+	KEY_OrderLocalID = PyUnicode_InternFromString("OrderLocalID");
+	KEY_ParticipantID = PyUnicode_InternFromString("ParticipantID");
+	KEY_TraderID = PyUnicode_InternFromString("TraderID");
+	KEY_InstallID = PyUnicode_InternFromString("InstallID");
+	KEY_OrderSubmitStatus = PyUnicode_InternFromString("OrderSubmitStatus");
+	KEY_NotifySequence = PyUnicode_InternFromString("NotifySequence");
+	KEY_OrderSource = PyUnicode_InternFromString("OrderSource");
+	KEY_OrderStatus = PyUnicode_InternFromString("OrderStatus");
+	KEY_OrderType = PyUnicode_InternFromString("OrderType");
+	KEY_VolumeTraded = PyUnicode_InternFromString("VolumeTraded");
+	KEY_VolumeTotal = PyUnicode_InternFromString("VolumeTotal");
+	KEY_InsertDate = PyUnicode_InternFromString("InsertDate");
+	KEY_InsertTime = PyUnicode_InternFromString("InsertTime");
+	KEY_ActiveTime = PyUnicode_InternFromString("ActiveTime");
+	KEY_SuspendTime = PyUnicode_InternFromString("SuspendTime");
+	KEY_UpdateTime = PyUnicode_InternFromString("UpdateTime");
+	KEY_CancelTime = PyUnicode_InternFromString("CancelTime");
+	KEY_ActiveTraderID = PyUnicode_InternFromString("ActiveTraderID");
+	KEY_ClearingPartID = PyUnicode_InternFromString("ClearingPartID");
+	KEY_SequenceNo = PyUnicode_InternFromString("SequenceNo");
+	KEY_StatusMsg = PyUnicode_InternFromString("StatusMsg");
+	KEY_ActiveUserID = PyUnicode_InternFromString("ActiveUserID");
+	KEY_BrokerOrderSeq = PyUnicode_InternFromString("BrokerOrderSeq");
+	KEY_RelativeOrderSysID = PyUnicode_InternFromString("RelativeOrderSysID");
+	KEY_ZCETotalTradedVolume = PyUnicode_InternFromString("ZCETotalTradedVolume");
+	KEY_BranchID = PyUnicode_InternFromString("BranchID");
+	KEY_reserve3 = PyUnicode_InternFromString("reserve3");
+	KEY_ExchangeInstID = PyUnicode_InternFromString("ExchangeInstID");
+	KEY_TradeID = PyUnicode_InternFromString("TradeID");
+	KEY_TradingRole = PyUnicode_InternFromString("TradingRole");
+	KEY_Price = PyUnicode_InternFromString("Price");
+	KEY_TradeDate = PyUnicode_InternFromString("TradeDate");
+	KEY_TradeTime = PyUnicode_InternFromString("TradeTime");
+	KEY_TradeType = PyUnicode_InternFromString("TradeType");
+	KEY_PriceSource = PyUnicode_InternFromString("PriceSource");
+	KEY_TradeSource = PyUnicode_InternFromString("TradeSource");
+	KEY_PositionDate = PyUnicode_InternFromString("PositionDate");
+	KEY_YdPosition = PyUnicode_InternFromString("YdPosition");
+	KEY_Position = PyUnicode_InternFromString("Position");
+	KEY_LongFrozen = PyUnicode_InternFromString("LongFrozen");
+	KEY_ShortFrozen = PyUnicode_InternFromString("ShortFrozen");
+	KEY_LongFrozenAmount = PyUnicode_InternFromString("LongFrozenAmount");
+	KEY_ShortFrozenAmount = PyUnicode_InternFromString("ShortFrozenAmount");
+	KEY_OpenVolume = PyUnicode_InternFromString("OpenVolume");
+	KEY_CloseVolume = PyUnicode_InternFromString("CloseVolume");
+	KEY_OpenAmount = PyUnicode_InternFromString("OpenAmount");
+	KEY_CloseAmount = PyUnicode_InternFromString("CloseAmount");
+	KEY_PositionCost = PyUnicode_InternFromString("PositionCost");
+	KEY_PreMargin = PyUnicode_InternFromString("PreMargin");
+	KEY_UseMargin = PyUnicode_InternFromString("UseMargin");
+	KEY_FrozenMargin = PyUnicode_InternFromString("FrozenMargin");
+	KEY_FrozenCash = PyUnicode_InternFromString("FrozenCash");
+	KEY_FrozenCommission = PyUnicode_InternFromString("FrozenCommission");
+	KEY_CashIn = PyUnicode_InternFromString("CashIn");
+	KEY_Commission = PyUnicode_InternFromString("Commission");
+	KEY_CloseProfit = PyUnicode_InternFromString("CloseProfit");
+	KEY_PositionProfit = PyUnicode_InternFromString("PositionProfit");
+	KEY_PreSettlementPrice = PyUnicode_InternFromString("PreSettlementPrice");
+	KEY_SettlementPrice = PyUnicode_InternFromString("SettlementPrice");
+	KEY_OpenCost = PyUnicode_InternFromString("OpenCost");
+	KEY_ExchangeMargin = PyUnicode_InternFromString("ExchangeMargin");
+	KEY_CombPosition = PyUnicode_InternFromString("CombPosition");
+	KEY_CombLongFrozen = PyUnicode_InternFromString("CombLongFrozen");
+	KEY_CombShortFrozen = PyUnicode_InternFromString("CombShortFrozen");
+	KEY_CloseProfitByDate = PyUnicode_InternFromString("CloseProfitByDate");
+	KEY_CloseProfitByTrade = PyUnicode_InternFromString("CloseProfitByTrade");
+	KEY_TodayPosition = PyUnicode_InternFromString("TodayPosition");
+	KEY_MarginRateByMoney = PyUnicode_InternFromString("MarginRateByMoney");
+	KEY_MarginRateByVolume = PyUnicode_InternFromString("MarginRateByVolume");
+	KEY_StrikeFrozen = PyUnicode_InternFromString("StrikeFrozen");
+	KEY_StrikeFrozenAmount = PyUnicode_InternFromString("StrikeFrozenAmount");
+	KEY_AbandonFrozen = PyUnicode_InternFromString("AbandonFrozen");
+	KEY_YdStrikeFrozen = PyUnicode_InternFromString("YdStrikeFrozen");
+	KEY_PositionCostOffset = PyUnicode_InternFromString("PositionCostOffset");
+	KEY_TasPosition = PyUnicode_InternFromString("TasPosition");
+	KEY_TasPositionCost = PyUnicode_InternFromString("TasPositionCost");
+	KEY_PreMortgage = PyUnicode_InternFromString("PreMortgage");
+	KEY_PreCredit = PyUnicode_InternFromString("PreCredit");
+	KEY_PreDeposit = PyUnicode_InternFromString("PreDeposit");
+	KEY_PreBalance = PyUnicode_InternFromString("PreBalance");
+	KEY_InterestBase = PyUnicode_InternFromString("InterestBase");
+	KEY_Interest = PyUnicode_InternFromString("Interest");
+	KEY_Deposit = PyUnicode_InternFromString("Deposit");
+	KEY_Withdraw = PyUnicode_InternFromString("Withdraw");
+	KEY_CurrMargin = PyUnicode_InternFromString("CurrMargin");
+	KEY_Balance = PyUnicode_InternFromString("Balance");
+	KEY_Available = PyUnicode_InternFromString("Available");
+	KEY_WithdrawQuota = PyUnicode_InternFromString("WithdrawQuota");
+	KEY_Reserve = PyUnicode_InternFromString("Reserve");
+	KEY_Credit = PyUnicode_InternFromString("Credit");
+	KEY_Mortgage = PyUnicode_InternFromString("Mortgage");
+	KEY_DeliveryMargin = PyUnicode_InternFromString("DeliveryMargin");
+	KEY_ExchangeDeliveryMargin = PyUnicode_InternFromString("ExchangeDeliveryMargin");
+	KEY_ReserveBalance = PyUnicode_InternFromString("ReserveBalance");
+	KEY_PreFundMortgageIn = PyUnicode_InternFromString("PreFundMortgageIn");
+	KEY_PreFundMortgageOut = PyUnicode_InternFromString("PreFundMortgageOut");
+	KEY_FundMortgageIn = PyUnicode_InternFromString("FundMortgageIn");
+	KEY_FundMortgageOut = PyUnicode_InternFromString("FundMortgageOut");
+	KEY_FundMortgageAvailable = PyUnicode_InternFromString("FundMortgageAvailable");
+	KEY_MortgageableFund = PyUnicode_InternFromString("MortgageableFund");
+	KEY_SpecProductMargin = PyUnicode_InternFromString("SpecProductMargin");
+	KEY_SpecProductFrozenMargin = PyUnicode_InternFromString("SpecProductFrozenMargin");
+	KEY_SpecProductCommission = PyUnicode_InternFromString("SpecProductCommission");
+	KEY_SpecProductFrozenCommission = PyUnicode_InternFromString("SpecProductFrozenCommission");
+	KEY_SpecProductPositionProfit = PyUnicode_InternFromString("SpecProductPositionProfit");
+	KEY_SpecProductCloseProfit = PyUnicode_InternFromString("SpecProductCloseProfit");
+	KEY_SpecProductPositionProfitByAlg = PyUnicode_InternFromString("SpecProductPositionProfitByAlg");
+	KEY_SpecProductExchangeMargin = PyUnicode_InternFromString("SpecProductExchangeMargin");
+	KEY_BizType = PyUnicode_InternFromString("BizType");
+	KEY_FrozenSwap = PyUnicode_InternFromString("FrozenSwap");
+	KEY_RemainSwap = PyUnicode_InternFromString("RemainSwap");
+	KEY_InvestorGroupID = PyUnicode_InternFromString("InvestorGroupID");
+	KEY_InvestorName = PyUnicode_InternFromString("InvestorName");
+	KEY_IdentifiedCardType = PyUnicode_InternFromString("IdentifiedCardType");
+	KEY_IdentifiedCardNo = PyUnicode_InternFromString("IdentifiedCardNo");
+	KEY_IsActive = PyUnicode_InternFromString("IsActive");
+	KEY_Telephone = PyUnicode_InternFromString("Telephone");
+	KEY_Address = PyUnicode_InternFromString("Address");
+	KEY_OpenDate = PyUnicode_InternFromString("OpenDate");
+	KEY_Mobile = PyUnicode_InternFromString("Mobile");
+	KEY_CommModelID = PyUnicode_InternFromString("CommModelID");
+	KEY_MarginModelID = PyUnicode_InternFromString("MarginModelID");
+	KEY_IsOrderFreq = PyUnicode_InternFromString("IsOrderFreq");
+	KEY_IsOpenVolLimit = PyUnicode_InternFromString("IsOpenVolLimit");
+	KEY_ClientIDType = PyUnicode_InternFromString("ClientIDType");
+	KEY_InvestorRange = PyUnicode_InternFromString("InvestorRange");
+	KEY_LongMarginRatioByMoney = PyUnicode_InternFromString("LongMarginRatioByMoney");
+	KEY_LongMarginRatioByVolume = PyUnicode_InternFromString("LongMarginRatioByVolume");
+	KEY_ShortMarginRatioByMoney = PyUnicode_InternFromString("ShortMarginRatioByMoney");
+	KEY_ShortMarginRatioByVolume = PyUnicode_InternFromString("ShortMarginRatioByVolume");
+	KEY_IsRelative = PyUnicode_InternFromString("IsRelative");
+	KEY_OpenRatioByMoney = PyUnicode_InternFromString("OpenRatioByMoney");
+	KEY_OpenRatioByVolume = PyUnicode_InternFromString("OpenRatioByVolume");
+	KEY_CloseRatioByMoney = PyUnicode_InternFromString("CloseRatioByMoney");
+	KEY_CloseRatioByVolume = PyUnicode_InternFromString("CloseRatioByVolume");
+	KEY_CloseTodayRatioByMoney = PyUnicode_InternFromString("CloseTodayRatioByMoney");
+	KEY_CloseTodayRatioByVolume = PyUnicode_InternFromString("CloseTodayRatioByVolume");
+	KEY_ExchangeName = PyUnicode_InternFromString("ExchangeName");
+	KEY_ExchangeProperty = PyUnicode_InternFromString("ExchangeProperty");
+	KEY_ProductName = PyUnicode_InternFromString("ProductName");
+	KEY_ProductClass = PyUnicode_InternFromString("ProductClass");
+	KEY_VolumeMultiple = PyUnicode_InternFromString("VolumeMultiple");
+	KEY_PriceTick = PyUnicode_InternFromString("PriceTick");
+	KEY_MaxMarketOrderVolume = PyUnicode_InternFromString("MaxMarketOrderVolume");
+	KEY_MinMarketOrderVolume = PyUnicode_InternFromString("MinMarketOrderVolume");
+	KEY_MaxLimitOrderVolume = PyUnicode_InternFromString("MaxLimitOrderVolume");
+	KEY_MinLimitOrderVolume = PyUnicode_InternFromString("MinLimitOrderVolume");
+	KEY_PositionType = PyUnicode_InternFromString("PositionType");
+	KEY_PositionDateType = PyUnicode_InternFromString("PositionDateType");
+	KEY_CloseDealType = PyUnicode_InternFromString("CloseDealType");
+	KEY_TradeCurrencyID = PyUnicode_InternFromString("TradeCurrencyID");
+	KEY_MortgageFundUseRange = PyUnicode_InternFromString("MortgageFundUseRange");
+	KEY_UnderlyingMultiple = PyUnicode_InternFromString("UnderlyingMultiple");
+	KEY_ProductID = PyUnicode_InternFromString("ProductID");
+	KEY_ExchangeProductID = PyUnicode_InternFromString("ExchangeProductID");
+	KEY_OpenLimitControlLevel = PyUnicode_InternFromString("OpenLimitControlLevel");
+	KEY_OrderFreqControlLevel = PyUnicode_InternFromString("OrderFreqControlLevel");
+	KEY_InstrumentName = PyUnicode_InternFromString("InstrumentName");
+	KEY_DeliveryYear = PyUnicode_InternFromString("DeliveryYear");
+	KEY_DeliveryMonth = PyUnicode_InternFromString("DeliveryMonth");
+	KEY_CreateDate = PyUnicode_InternFromString("CreateDate");
+	KEY_ExpireDate = PyUnicode_InternFromString("ExpireDate");
+	KEY_StartDelivDate = PyUnicode_InternFromString("StartDelivDate");
+	KEY_EndDelivDate = PyUnicode_InternFromString("EndDelivDate");
+	KEY_InstLifePhase = PyUnicode_InternFromString("InstLifePhase");
+	KEY_IsTrading = PyUnicode_InternFromString("IsTrading");
+	KEY_LongMarginRatio = PyUnicode_InternFromString("LongMarginRatio");
+	KEY_ShortMarginRatio = PyUnicode_InternFromString("ShortMarginRatio");
+	KEY_MaxMarginSideAlgorithm = PyUnicode_InternFromString("MaxMarginSideAlgorithm");
+	KEY_reserve4 = PyUnicode_InternFromString("reserve4");
+	KEY_StrikePrice = PyUnicode_InternFromString("StrikePrice");
+	KEY_OptionsType = PyUnicode_InternFromString("OptionsType");
+	KEY_CombinationType = PyUnicode_InternFromString("CombinationType");
+	KEY_UnderlyingInstrID = PyUnicode_InternFromString("UnderlyingInstrID");
+	KEY_LastPrice = PyUnicode_InternFromString("LastPrice");
+	KEY_PreClosePrice = PyUnicode_InternFromString("PreClosePrice");
+	KEY_PreOpenInterest = PyUnicode_InternFromString("PreOpenInterest");
+	KEY_OpenPrice = PyUnicode_InternFromString("OpenPrice");
+	KEY_HighestPrice = PyUnicode_InternFromString("HighestPrice");
+	KEY_LowestPrice = PyUnicode_InternFromString("LowestPrice");
+	KEY_Turnover = PyUnicode_InternFromString("Turnover");
+	KEY_OpenInterest = PyUnicode_InternFromString("OpenInterest");
+	KEY_ClosePrice = PyUnicode_InternFromString("ClosePrice");
+	KEY_UpperLimitPrice = PyUnicode_InternFromString("UpperLimitPrice");
+	KEY_LowerLimitPrice = PyUnicode_InternFromString("LowerLimitPrice");
+	KEY_PreDelta = PyUnicode_InternFromString("PreDelta");
+	KEY_CurrDelta = PyUnicode_InternFromString("CurrDelta");
+	KEY_UpdateMillisec = PyUnicode_InternFromString("UpdateMillisec");
+	KEY_BidPrice1 = PyUnicode_InternFromString("BidPrice1");
+	KEY_BidVolume1 = PyUnicode_InternFromString("BidVolume1");
+	KEY_AskPrice1 = PyUnicode_InternFromString("AskPrice1");
+	KEY_AskVolume1 = PyUnicode_InternFromString("AskVolume1");
+	KEY_BidPrice2 = PyUnicode_InternFromString("BidPrice2");
+	KEY_BidVolume2 = PyUnicode_InternFromString("BidVolume2");
+	KEY_AskPrice2 = PyUnicode_InternFromString("AskPrice2");
+	KEY_AskVolume2 = PyUnicode_InternFromString("AskVolume2");
+	KEY_BidPrice3 = PyUnicode_InternFromString("BidPrice3");
+	KEY_BidVolume3 = PyUnicode_InternFromString("BidVolume3");
+	KEY_AskPrice3 = PyUnicode_InternFromString("AskPrice3");
+	KEY_AskVolume3 = PyUnicode_InternFromString("AskVolume3");
+	KEY_BidPrice4 = PyUnicode_InternFromString("BidPrice4");
+	KEY_BidVolume4 = PyUnicode_InternFromString("BidVolume4");
+	KEY_AskPrice4 = PyUnicode_InternFromString("AskPrice4");
+	KEY_AskVolume4 = PyUnicode_InternFromString("AskVolume4");
+	KEY_BidPrice5 = PyUnicode_InternFromString("BidPrice5");
+	KEY_BidVolume5 = PyUnicode_InternFromString("BidVolume5");
+	KEY_AskPrice5 = PyUnicode_InternFromString("AskPrice5");
+	KEY_AskVolume5 = PyUnicode_InternFromString("AskVolume5");
+	KEY_AveragePrice = PyUnicode_InternFromString("AveragePrice");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_BandingUpperPrice = PyUnicode_InternFromString("BandingUpperPrice");
+	KEY_BandingLowerPrice = PyUnicode_InternFromString("BandingLowerPrice");
+	KEY_Password = PyUnicode_InternFromString("Password");
+	KEY_TraderConnectStatus = PyUnicode_InternFromString("TraderConnectStatus");
+	KEY_ConnectRequestDate = PyUnicode_InternFromString("ConnectRequestDate");
+	KEY_ConnectRequestTime = PyUnicode_InternFromString("ConnectRequestTime");
+	KEY_LastReportDate = PyUnicode_InternFromString("LastReportDate");
+	KEY_LastReportTime = PyUnicode_InternFromString("LastReportTime");
+	KEY_ConnectDate = PyUnicode_InternFromString("ConnectDate");
+	KEY_ConnectTime = PyUnicode_InternFromString("ConnectTime");
+	KEY_StartDate = PyUnicode_InternFromString("StartDate");
+	KEY_StartTime = PyUnicode_InternFromString("StartTime");
+	KEY_MaxTradeID = PyUnicode_InternFromString("MaxTradeID");
+	KEY_MaxOrderMessageReference = PyUnicode_InternFromString("MaxOrderMessageReference");
+	KEY_OrderCancelAlg = PyUnicode_InternFromString("OrderCancelAlg");
+	KEY_Content = PyUnicode_InternFromString("Content");
+	KEY_BankID = PyUnicode_InternFromString("BankID");
+	KEY_BankBrchID = PyUnicode_InternFromString("BankBrchID");
+	KEY_BankName = PyUnicode_InternFromString("BankName");
+	KEY_PositionProfitByDate = PyUnicode_InternFromString("PositionProfitByDate");
+	KEY_PositionProfitByTrade = PyUnicode_InternFromString("PositionProfitByTrade");
+	KEY_Margin = PyUnicode_InternFromString("Margin");
+	KEY_ExchMargin = PyUnicode_InternFromString("ExchMargin");
+	KEY_LastSettlementPrice = PyUnicode_InternFromString("LastSettlementPrice");
+	KEY_TimeFirstVolume = PyUnicode_InternFromString("TimeFirstVolume");
+	KEY_SpecPosiType = PyUnicode_InternFromString("SpecPosiType");
+	KEY_CombInstrumentID = PyUnicode_InternFromString("CombInstrumentID");
+	KEY_SequenceLabel = PyUnicode_InternFromString("SequenceLabel");
+	KEY_ComTradeID = PyUnicode_InternFromString("ComTradeID");
+	KEY_TotalAmt = PyUnicode_InternFromString("TotalAmt");
+	KEY_LegID = PyUnicode_InternFromString("LegID");
+	KEY_LegMultiple = PyUnicode_InternFromString("LegMultiple");
+	KEY_TradeGroupID = PyUnicode_InternFromString("TradeGroupID");
+	KEY_KeyID = PyUnicode_InternFromString("KeyID");
+	KEY_CurrentKey = PyUnicode_InternFromString("CurrentKey");
+	KEY_LongFrozenMargin = PyUnicode_InternFromString("LongFrozenMargin");
+	KEY_ShortFrozenMargin = PyUnicode_InternFromString("ShortFrozenMargin");
+	KEY_LongUseMargin = PyUnicode_InternFromString("LongUseMargin");
+	KEY_ShortUseMargin = PyUnicode_InternFromString("ShortUseMargin");
+	KEY_LongExchMargin = PyUnicode_InternFromString("LongExchMargin");
+	KEY_ShortExchMargin = PyUnicode_InternFromString("ShortExchMargin");
+	KEY_OffsetAmount = PyUnicode_InternFromString("OffsetAmount");
+	KEY_LongOffsetAmount = PyUnicode_InternFromString("LongOffsetAmount");
+	KEY_ShortOffsetAmount = PyUnicode_InternFromString("ShortOffsetAmount");
+	KEY_ExchOffsetAmount = PyUnicode_InternFromString("ExchOffsetAmount");
+	KEY_LongExchOffsetAmount = PyUnicode_InternFromString("LongExchOffsetAmount");
+	KEY_ShortExchOffsetAmount = PyUnicode_InternFromString("ShortExchOffsetAmount");
+	KEY_ProductGroupID = PyUnicode_InternFromString("ProductGroupID");
+	KEY_ExchLongMarginRatioByMoney = PyUnicode_InternFromString("ExchLongMarginRatioByMoney");
+	KEY_ExchLongMarginRatioByVolume = PyUnicode_InternFromString("ExchLongMarginRatioByVolume");
+	KEY_ExchShortMarginRatioByMoney = PyUnicode_InternFromString("ExchShortMarginRatioByMoney");
+	KEY_ExchShortMarginRatioByVolume = PyUnicode_InternFromString("ExchShortMarginRatioByVolume");
+	KEY_NoLongMarginRatioByMoney = PyUnicode_InternFromString("NoLongMarginRatioByMoney");
+	KEY_NoLongMarginRatioByVolume = PyUnicode_InternFromString("NoLongMarginRatioByVolume");
+	KEY_NoShortMarginRatioByMoney = PyUnicode_InternFromString("NoShortMarginRatioByMoney");
+	KEY_NoShortMarginRatioByVolume = PyUnicode_InternFromString("NoShortMarginRatioByVolume");
+	KEY_FromCurrencyID = PyUnicode_InternFromString("FromCurrencyID");
+	KEY_FromCurrencyUnit = PyUnicode_InternFromString("FromCurrencyUnit");
+	KEY_ToCurrencyID = PyUnicode_InternFromString("ToCurrencyID");
+	KEY_ExchangeRate = PyUnicode_InternFromString("ExchangeRate");
+	KEY_BrokerSecAgentID = PyUnicode_InternFromString("BrokerSecAgentID");
+	KEY_QuoteCurrencyID = PyUnicode_InternFromString("QuoteCurrencyID");
+	KEY_StrikeRatioByMoney = PyUnicode_InternFromString("StrikeRatioByMoney");
+	KEY_StrikeRatioByVolume = PyUnicode_InternFromString("StrikeRatioByVolume");
+	KEY_OrderCommByVolume = PyUnicode_InternFromString("OrderCommByVolume");
+	KEY_OrderActionCommByVolume = PyUnicode_InternFromString("OrderActionCommByVolume");
+	KEY_OrderCommByTrade = PyUnicode_InternFromString("OrderCommByTrade");
+	KEY_OrderActionCommByTrade = PyUnicode_InternFromString("OrderActionCommByTrade");
+	KEY_CheckSelfAccount = PyUnicode_InternFromString("CheckSelfAccount");
+	KEY_LongCustomerName = PyUnicode_InternFromString("LongCustomerName");
+	KEY_FixedMargin = PyUnicode_InternFromString("FixedMargin");
+	KEY_MiniMargin = PyUnicode_InternFromString("MiniMargin");
+	KEY_Royalty = PyUnicode_InternFromString("Royalty");
+	KEY_ExchFixedMargin = PyUnicode_InternFromString("ExchFixedMargin");
+	KEY_ExchMiniMargin = PyUnicode_InternFromString("ExchMiniMargin");
+	KEY_ExecOrderLocalID = PyUnicode_InternFromString("ExecOrderLocalID");
+	KEY_ExecResult = PyUnicode_InternFromString("ExecResult");
+	KEY_BrokerExecOrderSeq = PyUnicode_InternFromString("BrokerExecOrderSeq");
+	KEY_ForQuoteLocalID = PyUnicode_InternFromString("ForQuoteLocalID");
+	KEY_ForQuoteStatus = PyUnicode_InternFromString("ForQuoteStatus");
+	KEY_BrokerForQutoSeq = PyUnicode_InternFromString("BrokerForQutoSeq");
+	KEY_QuoteLocalID = PyUnicode_InternFromString("QuoteLocalID");
+	KEY_QuoteStatus = PyUnicode_InternFromString("QuoteStatus");
+	KEY_AskOrderSysID = PyUnicode_InternFromString("AskOrderSysID");
+	KEY_BidOrderSysID = PyUnicode_InternFromString("BidOrderSysID");
+	KEY_BrokerQuoteSeq = PyUnicode_InternFromString("BrokerQuoteSeq");
+	KEY_OptionSelfCloseLocalID = PyUnicode_InternFromString("OptionSelfCloseLocalID");
+	KEY_BrokerOptionSelfCloseSeq = PyUnicode_InternFromString("BrokerOptionSelfCloseSeq");
+	KEY_InvestorUnitName = PyUnicode_InternFromString("InvestorUnitName");
+	KEY_GuarantRatio = PyUnicode_InternFromString("GuarantRatio");
+	KEY_ActionLocalID = PyUnicode_InternFromString("ActionLocalID");
+	KEY_ActionStatus = PyUnicode_InternFromString("ActionStatus");
+	KEY_PlateSerial = PyUnicode_InternFromString("PlateSerial");
+	KEY_TradeCode = PyUnicode_InternFromString("TradeCode");
+	KEY_BankBranchID = PyUnicode_InternFromString("BankBranchID");
+	KEY_BankAccType = PyUnicode_InternFromString("BankAccType");
+	KEY_BankAccount = PyUnicode_InternFromString("BankAccount");
+	KEY_BankSerial = PyUnicode_InternFromString("BankSerial");
+	KEY_BrokerBranchID = PyUnicode_InternFromString("BrokerBranchID");
+	KEY_FutureAccType = PyUnicode_InternFromString("FutureAccType");
+	KEY_FutureSerial = PyUnicode_InternFromString("FutureSerial");
+	KEY_IdCardType = PyUnicode_InternFromString("IdCardType");
+	KEY_TradeAmount = PyUnicode_InternFromString("TradeAmount");
+	KEY_CustFee = PyUnicode_InternFromString("CustFee");
+	KEY_BrokerFee = PyUnicode_InternFromString("BrokerFee");
+	KEY_AvailabilityFlag = PyUnicode_InternFromString("AvailabilityFlag");
+	KEY_OperatorCode = PyUnicode_InternFromString("OperatorCode");
+	KEY_BankNewAccount = PyUnicode_InternFromString("BankNewAccount");
+	KEY_TradeDay = PyUnicode_InternFromString("TradeDay");
+	KEY_CustomerName = PyUnicode_InternFromString("CustomerName");
+	KEY_OpenOrDestroy = PyUnicode_InternFromString("OpenOrDestroy");
+	KEY_RegDate = PyUnicode_InternFromString("RegDate");
+	KEY_OutDate = PyUnicode_InternFromString("OutDate");
+	KEY_TID = PyUnicode_InternFromString("TID");
+	KEY_CustType = PyUnicode_InternFromString("CustType");
+	KEY_ActionDate = PyUnicode_InternFromString("ActionDate");
+	KEY_ActionTime = PyUnicode_InternFromString("ActionTime");
+	KEY_OrderActionStatus = PyUnicode_InternFromString("OrderActionStatus");
+	KEY_SettlementGroupID = PyUnicode_InternFromString("SettlementGroupID");
+	KEY_InstrumentStatus = PyUnicode_InternFromString("InstrumentStatus");
+	KEY_TradingSegmentSN = PyUnicode_InternFromString("TradingSegmentSN");
+	KEY_EnterTime = PyUnicode_InternFromString("EnterTime");
+	KEY_EnterReason = PyUnicode_InternFromString("EnterReason");
+	KEY_BulletinID = PyUnicode_InternFromString("BulletinID");
+	KEY_NewsType = PyUnicode_InternFromString("NewsType");
+	KEY_NewsUrgency = PyUnicode_InternFromString("NewsUrgency");
+	KEY_SendTime = PyUnicode_InternFromString("SendTime");
+	KEY_Abstract = PyUnicode_InternFromString("Abstract");
+	KEY_ComeFrom = PyUnicode_InternFromString("ComeFrom");
+	KEY_URLLink = PyUnicode_InternFromString("URLLink");
+	KEY_MarketID = PyUnicode_InternFromString("MarketID");
+	KEY_FieldContent = PyUnicode_InternFromString("FieldContent");
+	KEY_SequenceSeries = PyUnicode_InternFromString("SequenceSeries");
+	KEY_ForQuoteTime = PyUnicode_InternFromString("ForQuoteTime");
+	KEY_Token = PyUnicode_InternFromString("Token");
+	KEY_MarginPriceType = PyUnicode_InternFromString("MarginPriceType");
+	KEY_Algorithm = PyUnicode_InternFromString("Algorithm");
+	KEY_AvailIncludeCloseProfit = PyUnicode_InternFromString("AvailIncludeCloseProfit");
+	KEY_OptionRoyaltyPriceType = PyUnicode_InternFromString("OptionRoyaltyPriceType");
+	KEY_HandlePositionAlgoID = PyUnicode_InternFromString("HandlePositionAlgoID");
+	KEY_FindMarginRateAlgoID = PyUnicode_InternFromString("FindMarginRateAlgoID");
+	KEY_HandleTradingAccountAlgoID = PyUnicode_InternFromString("HandleTradingAccountAlgoID");
+	KEY_LastFragment = PyUnicode_InternFromString("LastFragment");
+	KEY_BankPassWord = PyUnicode_InternFromString("BankPassWord");
+	KEY_VerifyCertNoFlag = PyUnicode_InternFromString("VerifyCertNoFlag");
+	KEY_FutureFetchAmount = PyUnicode_InternFromString("FutureFetchAmount");
+	KEY_FeePayFlag = PyUnicode_InternFromString("FeePayFlag");
+	KEY_Message = PyUnicode_InternFromString("Message");
+	KEY_Digest = PyUnicode_InternFromString("Digest");
+	KEY_DeviceID = PyUnicode_InternFromString("DeviceID");
+	KEY_BankSecuAccType = PyUnicode_InternFromString("BankSecuAccType");
+	KEY_BrokerIDByBank = PyUnicode_InternFromString("BrokerIDByBank");
+	KEY_BankSecuAcc = PyUnicode_InternFromString("BankSecuAcc");
+	KEY_BankPwdFlag = PyUnicode_InternFromString("BankPwdFlag");
+	KEY_SecuPwdFlag = PyUnicode_InternFromString("SecuPwdFlag");
+	KEY_OperNo = PyUnicode_InternFromString("OperNo");
+	KEY_TransferStatus = PyUnicode_InternFromString("TransferStatus");
+	KEY_RepealTimeInterval = PyUnicode_InternFromString("RepealTimeInterval");
+	KEY_RepealedTimes = PyUnicode_InternFromString("RepealedTimes");
+	KEY_BankRepealFlag = PyUnicode_InternFromString("BankRepealFlag");
+	KEY_BrokerRepealFlag = PyUnicode_InternFromString("BrokerRepealFlag");
+	KEY_PlateRepealSerial = PyUnicode_InternFromString("PlateRepealSerial");
+	KEY_BankRepealSerial = PyUnicode_InternFromString("BankRepealSerial");
+	KEY_FutureRepealSerial = PyUnicode_InternFromString("FutureRepealSerial");
+	KEY_BankUseAmount = PyUnicode_InternFromString("BankUseAmount");
+	KEY_BankFetchAmount = PyUnicode_InternFromString("BankFetchAmount");
+	KEY_Gender = PyUnicode_InternFromString("Gender");
+	KEY_CountryCode = PyUnicode_InternFromString("CountryCode");
+	KEY_ZipCode = PyUnicode_InternFromString("ZipCode");
+	KEY_MobilePhone = PyUnicode_InternFromString("MobilePhone");
+	KEY_Fax = PyUnicode_InternFromString("Fax");
+	KEY_EMail = PyUnicode_InternFromString("EMail");
+	KEY_MoneyAccountStatus = PyUnicode_InternFromString("MoneyAccountStatus");
+	KEY_CashExchangeCode = PyUnicode_InternFromString("CashExchangeCode");
+	KEY_NewBankAccount = PyUnicode_InternFromString("NewBankAccount");
+	KEY_NewBankPassWord = PyUnicode_InternFromString("NewBankPassWord");
+	KEY_Xparameter = PyUnicode_InternFromString("Xparameter");
+	KEY_ProductStatus = PyUnicode_InternFromString("ProductStatus");
+	KEY_ProdFamilyCode = PyUnicode_InternFromString("ProdFamilyCode");
+	KEY_Cvf = PyUnicode_InternFromString("Cvf");
+	KEY_TimeRange = PyUnicode_InternFromString("TimeRange");
+	KEY_MarginRate = PyUnicode_InternFromString("MarginRate");
+	KEY_LockRateX = PyUnicode_InternFromString("LockRateX");
+	KEY_AddOnRate = PyUnicode_InternFromString("AddOnRate");
+	KEY_AddOnLockRateX2 = PyUnicode_InternFromString("AddOnLockRateX2");
+	KEY_DownPrice = PyUnicode_InternFromString("DownPrice");
+	KEY_Delta = PyUnicode_InternFromString("Delta");
+	KEY_SlimiDelta = PyUnicode_InternFromString("SlimiDelta");
+	KEY_IntraRateY = PyUnicode_InternFromString("IntraRateY");
+	KEY_AddOnIntraRateY2 = PyUnicode_InternFromString("AddOnIntraRateY2");
+	KEY_SpreadId = PyUnicode_InternFromString("SpreadId");
+	KEY_InterRateZ = PyUnicode_InternFromString("InterRateZ");
+	KEY_Leg1ProdFamilyCode = PyUnicode_InternFromString("Leg1ProdFamilyCode");
+	KEY_Leg2ProdFamilyCode = PyUnicode_InternFromString("Leg2ProdFamilyCode");
+	KEY_PortfolioDefID = PyUnicode_InternFromString("PortfolioDefID");
+	KEY_IsSPBM = PyUnicode_InternFromString("IsSPBM");
+	KEY_MarginRatio = PyUnicode_InternFromString("MarginRatio");
+	KEY_IntraInstrMargin = PyUnicode_InternFromString("IntraInstrMargin");
+	KEY_BCollectingMargin = PyUnicode_InternFromString("BCollectingMargin");
+	KEY_SCollectingMargin = PyUnicode_InternFromString("SCollectingMargin");
+	KEY_IntraProdMargin = PyUnicode_InternFromString("IntraProdMargin");
+	KEY_NetMargin = PyUnicode_InternFromString("NetMargin");
+	KEY_InterProdMargin = PyUnicode_InternFromString("InterProdMargin");
+	KEY_SingleMargin = PyUnicode_InternFromString("SingleMargin");
+	KEY_AddOnMargin = PyUnicode_InternFromString("AddOnMargin");
+	KEY_CallOptionMinRisk = PyUnicode_InternFromString("CallOptionMinRisk");
+	KEY_PutOptionMinRisk = PyUnicode_InternFromString("PutOptionMinRisk");
+	KEY_OptionMinRisk = PyUnicode_InternFromString("OptionMinRisk");
+	KEY_OptionValueOffset = PyUnicode_InternFromString("OptionValueOffset");
+	KEY_OptionRoyalty = PyUnicode_InternFromString("OptionRoyalty");
+	KEY_RealOptionValueOffset = PyUnicode_InternFromString("RealOptionValueOffset");
+	KEY_CommodityID = PyUnicode_InternFromString("CommodityID");
+	KEY_MarginBeforeDiscount = PyUnicode_InternFromString("MarginBeforeDiscount");
+	KEY_MarginNoDiscount = PyUnicode_InternFromString("MarginNoDiscount");
+	KEY_LongPosRisk = PyUnicode_InternFromString("LongPosRisk");
+	KEY_LongOpenFrozenRisk = PyUnicode_InternFromString("LongOpenFrozenRisk");
+	KEY_LongCloseFrozenRisk = PyUnicode_InternFromString("LongCloseFrozenRisk");
+	KEY_ShortPosRisk = PyUnicode_InternFromString("ShortPosRisk");
+	KEY_ShortOpenFrozenRisk = PyUnicode_InternFromString("ShortOpenFrozenRisk");
+	KEY_ShortCloseFrozenRisk = PyUnicode_InternFromString("ShortCloseFrozenRisk");
+	KEY_IntraCommodityRate = PyUnicode_InternFromString("IntraCommodityRate");
+	KEY_OptionDiscountRate = PyUnicode_InternFromString("OptionDiscountRate");
+	KEY_PosDiscount = PyUnicode_InternFromString("PosDiscount");
+	KEY_OpenFrozenDiscount = PyUnicode_InternFromString("OpenFrozenDiscount");
+	KEY_NetRisk = PyUnicode_InternFromString("NetRisk");
+	KEY_CloseFrozenMargin = PyUnicode_InternFromString("CloseFrozenMargin");
+	KEY_StrikeFrozenMargin = PyUnicode_InternFromString("StrikeFrozenMargin");
+	KEY_CommodityGroupID = PyUnicode_InternFromString("CommodityGroupID");
+	KEY_LongRisk = PyUnicode_InternFromString("LongRisk");
+	KEY_ShortRisk = PyUnicode_InternFromString("ShortRisk");
+	KEY_InterCommodityRate = PyUnicode_InternFromString("InterCommodityRate");
+	KEY_MiniMarginRatio = PyUnicode_InternFromString("MiniMarginRatio");
+	KEY_AdjustRatio = PyUnicode_InternFromString("AdjustRatio");
+	KEY_IntraCommodityDiscount = PyUnicode_InternFromString("IntraCommodityDiscount");
+	KEY_InterCommodityDiscount = PyUnicode_InternFromString("InterCommodityDiscount");
+	KEY_InvestorMargin = PyUnicode_InternFromString("InvestorMargin");
+	KEY_InstMarginCalID = PyUnicode_InternFromString("InstMarginCalID");
+	KEY_AddOnInterRateZ2 = PyUnicode_InternFromString("AddOnInterRateZ2");
+	KEY_CombProductID = PyUnicode_InternFromString("CombProductID");
+	KEY_HedgeRate = PyUnicode_InternFromString("HedgeRate");
+	KEY_Priority = PyUnicode_InternFromString("Priority");
+	KEY_CreditRate = PyUnicode_InternFromString("CreditRate");
+	KEY_CombProduct1 = PyUnicode_InternFromString("CombProduct1");
+	KEY_CombProduct2 = PyUnicode_InternFromString("CombProduct2");
+	KEY_AdjustValue = PyUnicode_InternFromString("AdjustValue");
+	KEY_RiskBeforeDiscount = PyUnicode_InternFromString("RiskBeforeDiscount");
+	KEY_IntraInstrRisk = PyUnicode_InternFromString("IntraInstrRisk");
+	KEY_BPosRisk = PyUnicode_InternFromString("BPosRisk");
+	KEY_SPosRisk = PyUnicode_InternFromString("SPosRisk");
+	KEY_IntraProdRisk = PyUnicode_InternFromString("IntraProdRisk");
+	KEY_InterProdRisk = PyUnicode_InternFromString("InterProdRisk");
+	KEY_ShortOptRiskAdj = PyUnicode_InternFromString("ShortOptRiskAdj");
+	KEY_MMSACloseFrozenMargin = PyUnicode_InternFromString("MMSACloseFrozenMargin");
+	KEY_CloseCombFrozenMargin = PyUnicode_InternFromString("CloseCombFrozenMargin");
+	KEY_MMSAOpenFrozenMargin = PyUnicode_InternFromString("MMSAOpenFrozenMargin");
+	KEY_DeliveryOpenFrozenMargin = PyUnicode_InternFromString("DeliveryOpenFrozenMargin");
+	KEY_OpenFrozenMargin = PyUnicode_InternFromString("OpenFrozenMargin");
+	KEY_UseFrozenMargin = PyUnicode_InternFromString("UseFrozenMargin");
+	KEY_MMSAExchMargin = PyUnicode_InternFromString("MMSAExchMargin");
+	KEY_DeliveryExchMargin = PyUnicode_InternFromString("DeliveryExchMargin");
+	KEY_CombExchMargin = PyUnicode_InternFromString("CombExchMargin");
+	KEY_InstrumentClass = PyUnicode_InternFromString("InstrumentClass");
+	KEY_StdInstrumentID = PyUnicode_InternFromString("StdInstrumentID");
+	KEY_BSpecRatio = PyUnicode_InternFromString("BSpecRatio");
+	KEY_SSpecRatio = PyUnicode_InternFromString("SSpecRatio");
+	KEY_BHedgeRatio = PyUnicode_InternFromString("BHedgeRatio");
+	KEY_SHedgeRatio = PyUnicode_InternFromString("SHedgeRatio");
+	KEY_BAddOnMargin = PyUnicode_InternFromString("BAddOnMargin");
+	KEY_SAddOnMargin = PyUnicode_InternFromString("SAddOnMargin");
+	KEY_StdInstrMargin = PyUnicode_InternFromString("StdInstrMargin");
+	KEY_UsualIntraRate = PyUnicode_InternFromString("UsualIntraRate");
+	KEY_DeliveryIntraRate = PyUnicode_InternFromString("DeliveryIntraRate");
+	KEY_InterRate = PyUnicode_InternFromString("InterRate");
+	KEY_Leg1PropFactor = PyUnicode_InternFromString("Leg1PropFactor");
+	KEY_Leg2PropFactor = PyUnicode_InternFromString("Leg2PropFactor");
+	KEY_CommodityGroupName = PyUnicode_InternFromString("CommodityGroupName");
+	KEY_BStdPosition = PyUnicode_InternFromString("BStdPosition");
+	KEY_SStdPosition = PyUnicode_InternFromString("SStdPosition");
+	KEY_BStdOpenFrozen = PyUnicode_InternFromString("BStdOpenFrozen");
+	KEY_SStdOpenFrozen = PyUnicode_InternFromString("SStdOpenFrozen");
+	KEY_BStdCloseFrozen = PyUnicode_InternFromString("BStdCloseFrozen");
+	KEY_SStdCloseFrozen = PyUnicode_InternFromString("SStdCloseFrozen");
+	KEY_IntraProdStdPosition = PyUnicode_InternFromString("IntraProdStdPosition");
+	KEY_NetStdPosition = PyUnicode_InternFromString("NetStdPosition");
+	KEY_InterProdStdPosition = PyUnicode_InternFromString("InterProdStdPosition");
+	KEY_SingleStdPosition = PyUnicode_InternFromString("SingleStdPosition");
+	KEY_NonCombMargin = PyUnicode_InternFromString("NonCombMargin");
+	KEY_AddOnFrozenMargin = PyUnicode_InternFromString("AddOnFrozenMargin");
+	KEY_UsePortf = PyUnicode_InternFromString("UsePortf");
+	KEY_AuthCode = PyUnicode_InternFromString("AuthCode");
+	KEY_InterfaceProductInfo = PyUnicode_InternFromString("InterfaceProductInfo");
+	KEY_ProtocolInfo = PyUnicode_InternFromString("ProtocolInfo");
+	KEY_OneTimePassword = PyUnicode_InternFromString("OneTimePassword");
+	KEY_LoginRemark = PyUnicode_InternFromString("LoginRemark");
+	KEY_ClientIPPort = PyUnicode_InternFromString("ClientIPPort");
+	KEY_ClientIPAddress = PyUnicode_InternFromString("ClientIPAddress");
+	KEY_Captcha = PyUnicode_InternFromString("Captcha");
+	KEY_Text = PyUnicode_InternFromString("Text");
+	KEY_OTPPassword = PyUnicode_InternFromString("OTPPassword");
+	KEY_InsertTimeStart = PyUnicode_InternFromString("InsertTimeStart");
+	KEY_InsertTimeEnd = PyUnicode_InternFromString("InsertTimeEnd");
+	KEY_TradeTimeStart = PyUnicode_InternFromString("TradeTimeStart");
+	KEY_TradeTimeEnd = PyUnicode_InternFromString("TradeTimeEnd");
+	KEY_InputPrice = PyUnicode_InternFromString("InputPrice");
+	KEY_UnderlyingPrice = PyUnicode_InternFromString("UnderlyingPrice");
+	KEY_TradingType = PyUnicode_InternFromString("TradingType");
+	KEY_ClassType = PyUnicode_InternFromString("ClassType");
+};
+
+static const FieldDesc RspAuthenticateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspAuthenticateField, BrokerID), sizeof(CThostFtdcRspAuthenticateField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspAuthenticateField, UserID), sizeof(CThostFtdcRspAuthenticateField::UserID), FIELD_ASCII},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcRspAuthenticateField, UserProductInfo), sizeof(CThostFtdcRspAuthenticateField::UserProductInfo), FIELD_GBK},
+	{"AppID", &KEY_AppID, offsetof(CThostFtdcRspAuthenticateField, AppID), sizeof(CThostFtdcRspAuthenticateField::AppID), FIELD_GBK},
+	{"AppType", &KEY_AppType, offsetof(CThostFtdcRspAuthenticateField, AppType), sizeof(CThostFtdcRspAuthenticateField::AppType), FIELD_CHAR},
+};
+
+static const FieldDesc RspInfoFields[] = {
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcRspInfoField, ErrorID), sizeof(CThostFtdcRspInfoField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcRspInfoField, ErrorMsg), sizeof(CThostFtdcRspInfoField::ErrorMsg), FIELD_GBK},
+};
+
+static const FieldDesc RspUserLoginFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRspUserLoginField, TradingDay), sizeof(CThostFtdcRspUserLoginField::TradingDay), FIELD_ASCII},
+	{"LoginTime", &KEY_LoginTime, offsetof(CThostFtdcRspUserLoginField, LoginTime), sizeof(CThostFtdcRspUserLoginField::LoginTime), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspUserLoginField, BrokerID), sizeof(CThostFtdcRspUserLoginField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspUserLoginField, UserID), sizeof(CThostFtdcRspUserLoginField::UserID), FIELD_ASCII},
+	{"SystemName", &KEY_SystemName, offsetof(CThostFtdcRspUserLoginField, SystemName), sizeof(CThostFtdcRspUserLoginField::SystemName), FIELD_GBK},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcRspUserLoginField, FrontID), sizeof(CThostFtdcRspUserLoginField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcRspUserLoginField, SessionID), sizeof(CThostFtdcRspUserLoginField::SessionID), FIELD_INT},
+	{"MaxOrderRef", &KEY_MaxOrderRef, offsetof(CThostFtdcRspUserLoginField, MaxOrderRef), sizeof(CThostFtdcRspUserLoginField::MaxOrderRef), FIELD_ASCII},
+	{"SHFETime", &KEY_SHFETime, offsetof(CThostFtdcRspUserLoginField, SHFETime), sizeof(CThostFtdcRspUserLoginField::SHFETime), FIELD_ASCII},
+	{"DCETime", &KEY_DCETime, offsetof(CThostFtdcRspUserLoginField, DCETime), sizeof(CThostFtdcRspUserLoginField::DCETime), FIELD_ASCII},
+	{"CZCETime", &KEY_CZCETime, offsetof(CThostFtdcRspUserLoginField, CZCETime), sizeof(CThostFtdcRspUserLoginField::CZCETime), FIELD_ASCII},
+	{"FFEXTime", &KEY_FFEXTime, offsetof(CThostFtdcRspUserLoginField, FFEXTime), sizeof(CThostFtdcRspUserLoginField::FFEXTime), FIELD_ASCII},
+	{"INETime", &KEY_INETime, offsetof(CThostFtdcRspUserLoginField, INETime), sizeof(CThostFtdcRspUserLoginField::INETime), FIELD_ASCII},
+	{"SysVersion", &KEY_SysVersion, offsetof(CThostFtdcRspUserLoginField, SysVersion), sizeof(CThostFtdcRspUserLoginField::SysVersion), FIELD_GBK},
+	{"GFEXTime", &KEY_GFEXTime, offsetof(CThostFtdcRspUserLoginField, GFEXTime), sizeof(CThostFtdcRspUserLoginField::GFEXTime), FIELD_ASCII},
+};
+
+static const FieldDesc UserLogoutFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcUserLogoutField, BrokerID), sizeof(CThostFtdcUserLogoutField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcUserLogoutField, UserID), sizeof(CThostFtdcUserLogoutField::UserID), FIELD_ASCII},
+};
+
+static const FieldDesc UserPasswordUpdateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcUserPasswordUpdateField, BrokerID), sizeof(CThostFtdcUserPasswordUpdateField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcUserPasswordUpdateField, UserID), sizeof(CThostFtdcUserPasswordUpdateField::UserID), FIELD_ASCII},
+	{"OldPassword", &KEY_OldPassword, offsetof(CThostFtdcUserPasswordUpdateField, OldPassword), sizeof(CThostFtdcUserPasswordUpdateField::OldPassword), FIELD_GBK},
+	{"NewPassword", &KEY_NewPassword, offsetof(CThostFtdcUserPasswordUpdateField, NewPassword), sizeof(CThostFtdcUserPasswordUpdateField::NewPassword), FIELD_GBK},
+};
+
+static const FieldDesc TradingAccountPasswordUpdateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTradingAccountPasswordUpdateField, BrokerID), sizeof(CThostFtdcTradingAccountPasswordUpdateField::BrokerID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcTradingAccountPasswordUpdateField, AccountID), sizeof(CThostFtdcTradingAccountPasswordUpdateField::AccountID), FIELD_ASCII},
+	{"OldPassword", &KEY_OldPassword, offsetof(CThostFtdcTradingAccountPasswordUpdateField, OldPassword), sizeof(CThostFtdcTradingAccountPasswordUpdateField::OldPassword), FIELD_GBK},
+	{"NewPassword", &KEY_NewPassword, offsetof(CThostFtdcTradingAccountPasswordUpdateField, NewPassword), sizeof(CThostFtdcTradingAccountPasswordUpdateField::NewPassword), FIELD_GBK},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcTradingAccountPasswordUpdateField, CurrencyID), sizeof(CThostFtdcTradingAccountPasswordUpdateField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc RspUserAuthMethodFields[] = {
+	{"UsableAuthMethod", &KEY_UsableAuthMethod, offsetof(CThostFtdcRspUserAuthMethodField, UsableAuthMethod), sizeof(CThostFtdcRspUserAuthMethodField::UsableAuthMethod), FIELD_INT},
+};
+
+static const FieldDesc RspGenUserCaptchaFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspGenUserCaptchaField, BrokerID), sizeof(CThostFtdcRspGenUserCaptchaField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspGenUserCaptchaField, UserID), sizeof(CThostFtdcRspGenUserCaptchaField::UserID), FIELD_ASCII},
+	{"CaptchaInfoLen", &KEY_CaptchaInfoLen, offsetof(CThostFtdcRspGenUserCaptchaField, CaptchaInfoLen), sizeof(CThostFtdcRspGenUserCaptchaField::CaptchaInfoLen), FIELD_INT},
+	{"CaptchaInfo", &KEY_CaptchaInfo, offsetof(CThostFtdcRspGenUserCaptchaField, CaptchaInfo), sizeof(CThostFtdcRspGenUserCaptchaField::CaptchaInfo), FIELD_GBK},
+};
+
+static const FieldDesc RspGenUserTextFields[] = {
+	{"UserTextSeq", &KEY_UserTextSeq, offsetof(CThostFtdcRspGenUserTextField, UserTextSeq), sizeof(CThostFtdcRspGenUserTextField::UserTextSeq), FIELD_INT},
+};
+
+static const FieldDesc InputOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputOrderField, BrokerID), sizeof(CThostFtdcInputOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputOrderField, InvestorID), sizeof(CThostFtdcInputOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputOrderField, reserve1), sizeof(CThostFtdcInputOrderField::reserve1), FIELD_ASCII},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcInputOrderField, OrderRef), sizeof(CThostFtdcInputOrderField::OrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputOrderField, UserID), sizeof(CThostFtdcInputOrderField::UserID), FIELD_ASCII},
+	{"OrderPriceType", &KEY_OrderPriceType, offsetof(CThostFtdcInputOrderField, OrderPriceType), sizeof(CThostFtdcInputOrderField::OrderPriceType), FIELD_CHAR},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcInputOrderField, Direction), sizeof(CThostFtdcInputOrderField::Direction), FIELD_CHAR},
+	{"CombOffsetFlag", &KEY_CombOffsetFlag, offsetof(CThostFtdcInputOrderField, CombOffsetFlag), sizeof(CThostFtdcInputOrderField::CombOffsetFlag), FIELD_ASCII},
+	{"CombHedgeFlag", &KEY_CombHedgeFlag, offsetof(CThostFtdcInputOrderField, CombHedgeFlag), sizeof(CThostFtdcInputOrderField::CombHedgeFlag), FIELD_ASCII},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcInputOrderField, LimitPrice), sizeof(CThostFtdcInputOrderField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeTotalOriginal", &KEY_VolumeTotalOriginal, offsetof(CThostFtdcInputOrderField, VolumeTotalOriginal), sizeof(CThostFtdcInputOrderField::VolumeTotalOriginal), FIELD_INT},
+	{"TimeCondition", &KEY_TimeCondition, offsetof(CThostFtdcInputOrderField, TimeCondition), sizeof(CThostFtdcInputOrderField::TimeCondition), FIELD_CHAR},
+	{"GTDDate", &KEY_GTDDate, offsetof(CThostFtdcInputOrderField, GTDDate), sizeof(CThostFtdcInputOrderField::GTDDate), FIELD_ASCII},
+	{"VolumeCondition", &KEY_VolumeCondition, offsetof(CThostFtdcInputOrderField, VolumeCondition), sizeof(CThostFtdcInputOrderField::VolumeCondition), FIELD_CHAR},
+	{"MinVolume", &KEY_MinVolume, offsetof(CThostFtdcInputOrderField, MinVolume), sizeof(CThostFtdcInputOrderField::MinVolume), FIELD_INT},
+	{"ContingentCondition", &KEY_ContingentCondition, offsetof(CThostFtdcInputOrderField, ContingentCondition), sizeof(CThostFtdcInputOrderField::ContingentCondition), FIELD_CHAR},
+	{"StopPrice", &KEY_StopPrice, offsetof(CThostFtdcInputOrderField, StopPrice), sizeof(CThostFtdcInputOrderField::StopPrice), FIELD_DOUBLE},
+	{"ForceCloseReason", &KEY_ForceCloseReason, offsetof(CThostFtdcInputOrderField, ForceCloseReason), sizeof(CThostFtdcInputOrderField::ForceCloseReason), FIELD_CHAR},
+	{"IsAutoSuspend", &KEY_IsAutoSuspend, offsetof(CThostFtdcInputOrderField, IsAutoSuspend), sizeof(CThostFtdcInputOrderField::IsAutoSuspend), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcInputOrderField, BusinessUnit), sizeof(CThostFtdcInputOrderField::BusinessUnit), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputOrderField, RequestID), sizeof(CThostFtdcInputOrderField::RequestID), FIELD_INT},
+	{"UserForceClose", &KEY_UserForceClose, offsetof(CThostFtdcInputOrderField, UserForceClose), sizeof(CThostFtdcInputOrderField::UserForceClose), FIELD_INT},
+	{"IsSwapOrder", &KEY_IsSwapOrder, offsetof(CThostFtdcInputOrderField, IsSwapOrder), sizeof(CThostFtdcInputOrderField::IsSwapOrder), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputOrderField, ExchangeID), sizeof(CThostFtdcInputOrderField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputOrderField, InvestUnitID), sizeof(CThostFtdcInputOrderField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcInputOrderField, AccountID), sizeof(CThostFtdcInputOrderField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcInputOrderField, CurrencyID), sizeof(CThostFtdcInputOrderField::CurrencyID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcInputOrderField, ClientID), sizeof(CThostFtdcInputOrderField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputOrderField, reserve2), sizeof(CThostFtdcInputOrderField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputOrderField, MacAddress), sizeof(CThostFtdcInputOrderField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputOrderField, InstrumentID), sizeof(CThostFtdcInputOrderField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputOrderField, IPAddress), sizeof(CThostFtdcInputOrderField::IPAddress), FIELD_ASCII},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcInputOrderField, OrderMemo), sizeof(CThostFtdcInputOrderField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcInputOrderField, SessionReqSeq), sizeof(CThostFtdcInputOrderField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc ParkedOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcParkedOrderField, BrokerID), sizeof(CThostFtdcParkedOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcParkedOrderField, InvestorID), sizeof(CThostFtdcParkedOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcParkedOrderField, reserve1), sizeof(CThostFtdcParkedOrderField::reserve1), FIELD_ASCII},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcParkedOrderField, OrderRef), sizeof(CThostFtdcParkedOrderField::OrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcParkedOrderField, UserID), sizeof(CThostFtdcParkedOrderField::UserID), FIELD_ASCII},
+	{"OrderPriceType", &KEY_OrderPriceType, offsetof(CThostFtdcParkedOrderField, OrderPriceType), sizeof(CThostFtdcParkedOrderField::OrderPriceType), FIELD_CHAR},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcParkedOrderField, Direction), sizeof(CThostFtdcParkedOrderField::Direction), FIELD_CHAR},
+	{"CombOffsetFlag", &KEY_CombOffsetFlag, offsetof(CThostFtdcParkedOrderField, CombOffsetFlag), sizeof(CThostFtdcParkedOrderField::CombOffsetFlag), FIELD_ASCII},
+	{"CombHedgeFlag", &KEY_CombHedgeFlag, offsetof(CThostFtdcParkedOrderField, CombHedgeFlag), sizeof(CThostFtdcParkedOrderField::CombHedgeFlag), FIELD_ASCII},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcParkedOrderField, LimitPrice), sizeof(CThostFtdcParkedOrderField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeTotalOriginal", &KEY_VolumeTotalOriginal, offsetof(CThostFtdcParkedOrderField, VolumeTotalOriginal), sizeof(CThostFtdcParkedOrderField::VolumeTotalOriginal), FIELD_INT},
+	{"TimeCondition", &KEY_TimeCondition, offsetof(CThostFtdcParkedOrderField, TimeCondition), sizeof(CThostFtdcParkedOrderField::TimeCondition), FIELD_CHAR},
+	{"GTDDate", &KEY_GTDDate, offsetof(CThostFtdcParkedOrderField, GTDDate), sizeof(CThostFtdcParkedOrderField::GTDDate), FIELD_ASCII},
+	{"VolumeCondition", &KEY_VolumeCondition, offsetof(CThostFtdcParkedOrderField, VolumeCondition), sizeof(CThostFtdcParkedOrderField::VolumeCondition), FIELD_CHAR},
+	{"MinVolume", &KEY_MinVolume, offsetof(CThostFtdcParkedOrderField, MinVolume), sizeof(CThostFtdcParkedOrderField::MinVolume), FIELD_INT},
+	{"ContingentCondition", &KEY_ContingentCondition, offsetof(CThostFtdcParkedOrderField, ContingentCondition), sizeof(CThostFtdcParkedOrderField::ContingentCondition), FIELD_CHAR},
+	{"StopPrice", &KEY_StopPrice, offsetof(CThostFtdcParkedOrderField, StopPrice), sizeof(CThostFtdcParkedOrderField::StopPrice), FIELD_DOUBLE},
+	{"ForceCloseReason", &KEY_ForceCloseReason, offsetof(CThostFtdcParkedOrderField, ForceCloseReason), sizeof(CThostFtdcParkedOrderField::ForceCloseReason), FIELD_CHAR},
+	{"IsAutoSuspend", &KEY_IsAutoSuspend, offsetof(CThostFtdcParkedOrderField, IsAutoSuspend), sizeof(CThostFtdcParkedOrderField::IsAutoSuspend), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcParkedOrderField, BusinessUnit), sizeof(CThostFtdcParkedOrderField::BusinessUnit), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcParkedOrderField, RequestID), sizeof(CThostFtdcParkedOrderField::RequestID), FIELD_INT},
+	{"UserForceClose", &KEY_UserForceClose, offsetof(CThostFtdcParkedOrderField, UserForceClose), sizeof(CThostFtdcParkedOrderField::UserForceClose), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcParkedOrderField, ExchangeID), sizeof(CThostFtdcParkedOrderField::ExchangeID), FIELD_ASCII},
+	{"ParkedOrderID", &KEY_ParkedOrderID, offsetof(CThostFtdcParkedOrderField, ParkedOrderID), sizeof(CThostFtdcParkedOrderField::ParkedOrderID), FIELD_ASCII},
+	{"UserType", &KEY_UserType, offsetof(CThostFtdcParkedOrderField, UserType), sizeof(CThostFtdcParkedOrderField::UserType), FIELD_CHAR},
+	{"Status", &KEY_Status, offsetof(CThostFtdcParkedOrderField, Status), sizeof(CThostFtdcParkedOrderField::Status), FIELD_CHAR},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcParkedOrderField, ErrorID), sizeof(CThostFtdcParkedOrderField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcParkedOrderField, ErrorMsg), sizeof(CThostFtdcParkedOrderField::ErrorMsg), FIELD_GBK},
+	{"IsSwapOrder", &KEY_IsSwapOrder, offsetof(CThostFtdcParkedOrderField, IsSwapOrder), sizeof(CThostFtdcParkedOrderField::IsSwapOrder), FIELD_INT},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcParkedOrderField, AccountID), sizeof(CThostFtdcParkedOrderField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcParkedOrderField, CurrencyID), sizeof(CThostFtdcParkedOrderField::CurrencyID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcParkedOrderField, ClientID), sizeof(CThostFtdcParkedOrderField::ClientID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcParkedOrderField, InvestUnitID), sizeof(CThostFtdcParkedOrderField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcParkedOrderField, reserve2), sizeof(CThostFtdcParkedOrderField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcParkedOrderField, MacAddress), sizeof(CThostFtdcParkedOrderField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcParkedOrderField, InstrumentID), sizeof(CThostFtdcParkedOrderField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcParkedOrderField, IPAddress), sizeof(CThostFtdcParkedOrderField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ParkedOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcParkedOrderActionField, BrokerID), sizeof(CThostFtdcParkedOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcParkedOrderActionField, InvestorID), sizeof(CThostFtdcParkedOrderActionField::InvestorID), FIELD_ASCII},
+	{"OrderActionRef", &KEY_OrderActionRef, offsetof(CThostFtdcParkedOrderActionField, OrderActionRef), sizeof(CThostFtdcParkedOrderActionField::OrderActionRef), FIELD_INT},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcParkedOrderActionField, OrderRef), sizeof(CThostFtdcParkedOrderActionField::OrderRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcParkedOrderActionField, RequestID), sizeof(CThostFtdcParkedOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcParkedOrderActionField, FrontID), sizeof(CThostFtdcParkedOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcParkedOrderActionField, SessionID), sizeof(CThostFtdcParkedOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcParkedOrderActionField, ExchangeID), sizeof(CThostFtdcParkedOrderActionField::ExchangeID), FIELD_ASCII},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcParkedOrderActionField, OrderSysID), sizeof(CThostFtdcParkedOrderActionField::OrderSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcParkedOrderActionField, ActionFlag), sizeof(CThostFtdcParkedOrderActionField::ActionFlag), FIELD_CHAR},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcParkedOrderActionField, LimitPrice), sizeof(CThostFtdcParkedOrderActionField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeChange", &KEY_VolumeChange, offsetof(CThostFtdcParkedOrderActionField, VolumeChange), sizeof(CThostFtdcParkedOrderActionField::VolumeChange), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcParkedOrderActionField, UserID), sizeof(CThostFtdcParkedOrderActionField::UserID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcParkedOrderActionField, reserve1), sizeof(CThostFtdcParkedOrderActionField::reserve1), FIELD_ASCII},
+	{"ParkedOrderActionID", &KEY_ParkedOrderActionID, offsetof(CThostFtdcParkedOrderActionField, ParkedOrderActionID), sizeof(CThostFtdcParkedOrderActionField::ParkedOrderActionID), FIELD_ASCII},
+	{"UserType", &KEY_UserType, offsetof(CThostFtdcParkedOrderActionField, UserType), sizeof(CThostFtdcParkedOrderActionField::UserType), FIELD_CHAR},
+	{"Status", &KEY_Status, offsetof(CThostFtdcParkedOrderActionField, Status), sizeof(CThostFtdcParkedOrderActionField::Status), FIELD_CHAR},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcParkedOrderActionField, ErrorID), sizeof(CThostFtdcParkedOrderActionField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcParkedOrderActionField, ErrorMsg), sizeof(CThostFtdcParkedOrderActionField::ErrorMsg), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcParkedOrderActionField, InvestUnitID), sizeof(CThostFtdcParkedOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcParkedOrderActionField, reserve2), sizeof(CThostFtdcParkedOrderActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcParkedOrderActionField, MacAddress), sizeof(CThostFtdcParkedOrderActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcParkedOrderActionField, InstrumentID), sizeof(CThostFtdcParkedOrderActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcParkedOrderActionField, IPAddress), sizeof(CThostFtdcParkedOrderActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputOrderActionField, BrokerID), sizeof(CThostFtdcInputOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputOrderActionField, InvestorID), sizeof(CThostFtdcInputOrderActionField::InvestorID), FIELD_ASCII},
+	{"OrderActionRef", &KEY_OrderActionRef, offsetof(CThostFtdcInputOrderActionField, OrderActionRef), sizeof(CThostFtdcInputOrderActionField::OrderActionRef), FIELD_INT},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcInputOrderActionField, OrderRef), sizeof(CThostFtdcInputOrderActionField::OrderRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputOrderActionField, RequestID), sizeof(CThostFtdcInputOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcInputOrderActionField, FrontID), sizeof(CThostFtdcInputOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcInputOrderActionField, SessionID), sizeof(CThostFtdcInputOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputOrderActionField, ExchangeID), sizeof(CThostFtdcInputOrderActionField::ExchangeID), FIELD_ASCII},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcInputOrderActionField, OrderSysID), sizeof(CThostFtdcInputOrderActionField::OrderSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcInputOrderActionField, ActionFlag), sizeof(CThostFtdcInputOrderActionField::ActionFlag), FIELD_CHAR},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcInputOrderActionField, LimitPrice), sizeof(CThostFtdcInputOrderActionField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeChange", &KEY_VolumeChange, offsetof(CThostFtdcInputOrderActionField, VolumeChange), sizeof(CThostFtdcInputOrderActionField::VolumeChange), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputOrderActionField, UserID), sizeof(CThostFtdcInputOrderActionField::UserID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputOrderActionField, reserve1), sizeof(CThostFtdcInputOrderActionField::reserve1), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputOrderActionField, InvestUnitID), sizeof(CThostFtdcInputOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputOrderActionField, reserve2), sizeof(CThostFtdcInputOrderActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputOrderActionField, MacAddress), sizeof(CThostFtdcInputOrderActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputOrderActionField, InstrumentID), sizeof(CThostFtdcInputOrderActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputOrderActionField, IPAddress), sizeof(CThostFtdcInputOrderActionField::IPAddress), FIELD_ASCII},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcInputOrderActionField, OrderMemo), sizeof(CThostFtdcInputOrderActionField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcInputOrderActionField, SessionReqSeq), sizeof(CThostFtdcInputOrderActionField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc QryMaxOrderVolumeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryMaxOrderVolumeField, BrokerID), sizeof(CThostFtdcQryMaxOrderVolumeField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryMaxOrderVolumeField, InvestorID), sizeof(CThostFtdcQryMaxOrderVolumeField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryMaxOrderVolumeField, reserve1), sizeof(CThostFtdcQryMaxOrderVolumeField::reserve1), FIELD_ASCII},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcQryMaxOrderVolumeField, Direction), sizeof(CThostFtdcQryMaxOrderVolumeField::Direction), FIELD_CHAR},
+	{"OffsetFlag", &KEY_OffsetFlag, offsetof(CThostFtdcQryMaxOrderVolumeField, OffsetFlag), sizeof(CThostFtdcQryMaxOrderVolumeField::OffsetFlag), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcQryMaxOrderVolumeField, HedgeFlag), sizeof(CThostFtdcQryMaxOrderVolumeField::HedgeFlag), FIELD_CHAR},
+	{"MaxVolume", &KEY_MaxVolume, offsetof(CThostFtdcQryMaxOrderVolumeField, MaxVolume), sizeof(CThostFtdcQryMaxOrderVolumeField::MaxVolume), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryMaxOrderVolumeField, ExchangeID), sizeof(CThostFtdcQryMaxOrderVolumeField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryMaxOrderVolumeField, InvestUnitID), sizeof(CThostFtdcQryMaxOrderVolumeField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryMaxOrderVolumeField, InstrumentID), sizeof(CThostFtdcQryMaxOrderVolumeField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc SettlementInfoConfirmFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcSettlementInfoConfirmField, BrokerID), sizeof(CThostFtdcSettlementInfoConfirmField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcSettlementInfoConfirmField, InvestorID), sizeof(CThostFtdcSettlementInfoConfirmField::InvestorID), FIELD_ASCII},
+	{"ConfirmDate", &KEY_ConfirmDate, offsetof(CThostFtdcSettlementInfoConfirmField, ConfirmDate), sizeof(CThostFtdcSettlementInfoConfirmField::ConfirmDate), FIELD_ASCII},
+	{"ConfirmTime", &KEY_ConfirmTime, offsetof(CThostFtdcSettlementInfoConfirmField, ConfirmTime), sizeof(CThostFtdcSettlementInfoConfirmField::ConfirmTime), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcSettlementInfoConfirmField, SettlementID), sizeof(CThostFtdcSettlementInfoConfirmField::SettlementID), FIELD_INT},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcSettlementInfoConfirmField, AccountID), sizeof(CThostFtdcSettlementInfoConfirmField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcSettlementInfoConfirmField, CurrencyID), sizeof(CThostFtdcSettlementInfoConfirmField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc RemoveParkedOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRemoveParkedOrderField, BrokerID), sizeof(CThostFtdcRemoveParkedOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcRemoveParkedOrderField, InvestorID), sizeof(CThostFtdcRemoveParkedOrderField::InvestorID), FIELD_ASCII},
+	{"ParkedOrderID", &KEY_ParkedOrderID, offsetof(CThostFtdcRemoveParkedOrderField, ParkedOrderID), sizeof(CThostFtdcRemoveParkedOrderField::ParkedOrderID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcRemoveParkedOrderField, InvestUnitID), sizeof(CThostFtdcRemoveParkedOrderField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc RemoveParkedOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRemoveParkedOrderActionField, BrokerID), sizeof(CThostFtdcRemoveParkedOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcRemoveParkedOrderActionField, InvestorID), sizeof(CThostFtdcRemoveParkedOrderActionField::InvestorID), FIELD_ASCII},
+	{"ParkedOrderActionID", &KEY_ParkedOrderActionID, offsetof(CThostFtdcRemoveParkedOrderActionField, ParkedOrderActionID), sizeof(CThostFtdcRemoveParkedOrderActionField::ParkedOrderActionID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcRemoveParkedOrderActionField, InvestUnitID), sizeof(CThostFtdcRemoveParkedOrderActionField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc InputExecOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputExecOrderField, BrokerID), sizeof(CThostFtdcInputExecOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputExecOrderField, InvestorID), sizeof(CThostFtdcInputExecOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputExecOrderField, reserve1), sizeof(CThostFtdcInputExecOrderField::reserve1), FIELD_ASCII},
+	{"ExecOrderRef", &KEY_ExecOrderRef, offsetof(CThostFtdcInputExecOrderField, ExecOrderRef), sizeof(CThostFtdcInputExecOrderField::ExecOrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputExecOrderField, UserID), sizeof(CThostFtdcInputExecOrderField::UserID), FIELD_ASCII},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcInputExecOrderField, Volume), sizeof(CThostFtdcInputExecOrderField::Volume), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputExecOrderField, RequestID), sizeof(CThostFtdcInputExecOrderField::RequestID), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcInputExecOrderField, BusinessUnit), sizeof(CThostFtdcInputExecOrderField::BusinessUnit), FIELD_GBK},
+	{"OffsetFlag", &KEY_OffsetFlag, offsetof(CThostFtdcInputExecOrderField, OffsetFlag), sizeof(CThostFtdcInputExecOrderField::OffsetFlag), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInputExecOrderField, HedgeFlag), sizeof(CThostFtdcInputExecOrderField::HedgeFlag), FIELD_CHAR},
+	{"ActionType", &KEY_ActionType, offsetof(CThostFtdcInputExecOrderField, ActionType), sizeof(CThostFtdcInputExecOrderField::ActionType), FIELD_CHAR},
+	{"PosiDirection", &KEY_PosiDirection, offsetof(CThostFtdcInputExecOrderField, PosiDirection), sizeof(CThostFtdcInputExecOrderField::PosiDirection), FIELD_CHAR},
+	{"ReservePositionFlag", &KEY_ReservePositionFlag, offsetof(CThostFtdcInputExecOrderField, ReservePositionFlag), sizeof(CThostFtdcInputExecOrderField::ReservePositionFlag), FIELD_CHAR},
+	{"CloseFlag", &KEY_CloseFlag, offsetof(CThostFtdcInputExecOrderField, CloseFlag), sizeof(CThostFtdcInputExecOrderField::CloseFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputExecOrderField, ExchangeID), sizeof(CThostFtdcInputExecOrderField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputExecOrderField, InvestUnitID), sizeof(CThostFtdcInputExecOrderField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcInputExecOrderField, AccountID), sizeof(CThostFtdcInputExecOrderField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcInputExecOrderField, CurrencyID), sizeof(CThostFtdcInputExecOrderField::CurrencyID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcInputExecOrderField, ClientID), sizeof(CThostFtdcInputExecOrderField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputExecOrderField, reserve2), sizeof(CThostFtdcInputExecOrderField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputExecOrderField, MacAddress), sizeof(CThostFtdcInputExecOrderField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputExecOrderField, InstrumentID), sizeof(CThostFtdcInputExecOrderField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputExecOrderField, IPAddress), sizeof(CThostFtdcInputExecOrderField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputExecOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputExecOrderActionField, BrokerID), sizeof(CThostFtdcInputExecOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputExecOrderActionField, InvestorID), sizeof(CThostFtdcInputExecOrderActionField::InvestorID), FIELD_ASCII},
+	{"ExecOrderActionRef", &KEY_ExecOrderActionRef, offsetof(CThostFtdcInputExecOrderActionField, ExecOrderActionRef), sizeof(CThostFtdcInputExecOrderActionField::ExecOrderActionRef), FIELD_INT},
+	{"ExecOrderRef", &KEY_ExecOrderRef, offsetof(CThostFtdcInputExecOrderActionField, ExecOrderRef), sizeof(CThostFtdcInputExecOrderActionField::ExecOrderRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputExecOrderActionField, RequestID), sizeof(CThostFtdcInputExecOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcInputExecOrderActionField, FrontID), sizeof(CThostFtdcInputExecOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcInputExecOrderActionField, SessionID), sizeof(CThostFtdcInputExecOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputExecOrderActionField, ExchangeID), sizeof(CThostFtdcInputExecOrderActionField::ExchangeID), FIELD_ASCII},
+	{"ExecOrderSysID", &KEY_ExecOrderSysID, offsetof(CThostFtdcInputExecOrderActionField, ExecOrderSysID), sizeof(CThostFtdcInputExecOrderActionField::ExecOrderSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcInputExecOrderActionField, ActionFlag), sizeof(CThostFtdcInputExecOrderActionField::ActionFlag), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputExecOrderActionField, UserID), sizeof(CThostFtdcInputExecOrderActionField::UserID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputExecOrderActionField, reserve1), sizeof(CThostFtdcInputExecOrderActionField::reserve1), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputExecOrderActionField, InvestUnitID), sizeof(CThostFtdcInputExecOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputExecOrderActionField, reserve2), sizeof(CThostFtdcInputExecOrderActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputExecOrderActionField, MacAddress), sizeof(CThostFtdcInputExecOrderActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputExecOrderActionField, InstrumentID), sizeof(CThostFtdcInputExecOrderActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputExecOrderActionField, IPAddress), sizeof(CThostFtdcInputExecOrderActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputForQuoteFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputForQuoteField, BrokerID), sizeof(CThostFtdcInputForQuoteField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputForQuoteField, InvestorID), sizeof(CThostFtdcInputForQuoteField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputForQuoteField, reserve1), sizeof(CThostFtdcInputForQuoteField::reserve1), FIELD_ASCII},
+	{"ForQuoteRef", &KEY_ForQuoteRef, offsetof(CThostFtdcInputForQuoteField, ForQuoteRef), sizeof(CThostFtdcInputForQuoteField::ForQuoteRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputForQuoteField, UserID), sizeof(CThostFtdcInputForQuoteField::UserID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputForQuoteField, ExchangeID), sizeof(CThostFtdcInputForQuoteField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputForQuoteField, InvestUnitID), sizeof(CThostFtdcInputForQuoteField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputForQuoteField, reserve2), sizeof(CThostFtdcInputForQuoteField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputForQuoteField, MacAddress), sizeof(CThostFtdcInputForQuoteField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputForQuoteField, InstrumentID), sizeof(CThostFtdcInputForQuoteField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputForQuoteField, IPAddress), sizeof(CThostFtdcInputForQuoteField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputQuoteFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputQuoteField, BrokerID), sizeof(CThostFtdcInputQuoteField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputQuoteField, InvestorID), sizeof(CThostFtdcInputQuoteField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputQuoteField, reserve1), sizeof(CThostFtdcInputQuoteField::reserve1), FIELD_ASCII},
+	{"QuoteRef", &KEY_QuoteRef, offsetof(CThostFtdcInputQuoteField, QuoteRef), sizeof(CThostFtdcInputQuoteField::QuoteRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputQuoteField, UserID), sizeof(CThostFtdcInputQuoteField::UserID), FIELD_ASCII},
+	{"AskPrice", &KEY_AskPrice, offsetof(CThostFtdcInputQuoteField, AskPrice), sizeof(CThostFtdcInputQuoteField::AskPrice), FIELD_DOUBLE},
+	{"BidPrice", &KEY_BidPrice, offsetof(CThostFtdcInputQuoteField, BidPrice), sizeof(CThostFtdcInputQuoteField::BidPrice), FIELD_DOUBLE},
+	{"AskVolume", &KEY_AskVolume, offsetof(CThostFtdcInputQuoteField, AskVolume), sizeof(CThostFtdcInputQuoteField::AskVolume), FIELD_INT},
+	{"BidVolume", &KEY_BidVolume, offsetof(CThostFtdcInputQuoteField, BidVolume), sizeof(CThostFtdcInputQuoteField::BidVolume), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputQuoteField, RequestID), sizeof(CThostFtdcInputQuoteField::RequestID), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcInputQuoteField, BusinessUnit), sizeof(CThostFtdcInputQuoteField::BusinessUnit), FIELD_GBK},
+	{"AskOffsetFlag", &KEY_AskOffsetFlag, offsetof(CThostFtdcInputQuoteField, AskOffsetFlag), sizeof(CThostFtdcInputQuoteField::AskOffsetFlag), FIELD_CHAR},
+	{"BidOffsetFlag", &KEY_BidOffsetFlag, offsetof(CThostFtdcInputQuoteField, BidOffsetFlag), sizeof(CThostFtdcInputQuoteField::BidOffsetFlag), FIELD_CHAR},
+	{"AskHedgeFlag", &KEY_AskHedgeFlag, offsetof(CThostFtdcInputQuoteField, AskHedgeFlag), sizeof(CThostFtdcInputQuoteField::AskHedgeFlag), FIELD_CHAR},
+	{"BidHedgeFlag", &KEY_BidHedgeFlag, offsetof(CThostFtdcInputQuoteField, BidHedgeFlag), sizeof(CThostFtdcInputQuoteField::BidHedgeFlag), FIELD_CHAR},
+	{"AskOrderRef", &KEY_AskOrderRef, offsetof(CThostFtdcInputQuoteField, AskOrderRef), sizeof(CThostFtdcInputQuoteField::AskOrderRef), FIELD_ASCII},
+	{"BidOrderRef", &KEY_BidOrderRef, offsetof(CThostFtdcInputQuoteField, BidOrderRef), sizeof(CThostFtdcInputQuoteField::BidOrderRef), FIELD_ASCII},
+	{"ForQuoteSysID", &KEY_ForQuoteSysID, offsetof(CThostFtdcInputQuoteField, ForQuoteSysID), sizeof(CThostFtdcInputQuoteField::ForQuoteSysID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputQuoteField, ExchangeID), sizeof(CThostFtdcInputQuoteField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputQuoteField, InvestUnitID), sizeof(CThostFtdcInputQuoteField::InvestUnitID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcInputQuoteField, ClientID), sizeof(CThostFtdcInputQuoteField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputQuoteField, reserve2), sizeof(CThostFtdcInputQuoteField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputQuoteField, MacAddress), sizeof(CThostFtdcInputQuoteField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputQuoteField, InstrumentID), sizeof(CThostFtdcInputQuoteField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputQuoteField, IPAddress), sizeof(CThostFtdcInputQuoteField::IPAddress), FIELD_ASCII},
+	{"ReplaceSysID", &KEY_ReplaceSysID, offsetof(CThostFtdcInputQuoteField, ReplaceSysID), sizeof(CThostFtdcInputQuoteField::ReplaceSysID), FIELD_ASCII},
+	{"TimeCondition", &KEY_TimeCondition, offsetof(CThostFtdcInputQuoteField, TimeCondition), sizeof(CThostFtdcInputQuoteField::TimeCondition), FIELD_CHAR},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcInputQuoteField, OrderMemo), sizeof(CThostFtdcInputQuoteField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcInputQuoteField, SessionReqSeq), sizeof(CThostFtdcInputQuoteField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc InputQuoteActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputQuoteActionField, BrokerID), sizeof(CThostFtdcInputQuoteActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputQuoteActionField, InvestorID), sizeof(CThostFtdcInputQuoteActionField::InvestorID), FIELD_ASCII},
+	{"QuoteActionRef", &KEY_QuoteActionRef, offsetof(CThostFtdcInputQuoteActionField, QuoteActionRef), sizeof(CThostFtdcInputQuoteActionField::QuoteActionRef), FIELD_INT},
+	{"QuoteRef", &KEY_QuoteRef, offsetof(CThostFtdcInputQuoteActionField, QuoteRef), sizeof(CThostFtdcInputQuoteActionField::QuoteRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputQuoteActionField, RequestID), sizeof(CThostFtdcInputQuoteActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcInputQuoteActionField, FrontID), sizeof(CThostFtdcInputQuoteActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcInputQuoteActionField, SessionID), sizeof(CThostFtdcInputQuoteActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputQuoteActionField, ExchangeID), sizeof(CThostFtdcInputQuoteActionField::ExchangeID), FIELD_ASCII},
+	{"QuoteSysID", &KEY_QuoteSysID, offsetof(CThostFtdcInputQuoteActionField, QuoteSysID), sizeof(CThostFtdcInputQuoteActionField::QuoteSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcInputQuoteActionField, ActionFlag), sizeof(CThostFtdcInputQuoteActionField::ActionFlag), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputQuoteActionField, UserID), sizeof(CThostFtdcInputQuoteActionField::UserID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputQuoteActionField, reserve1), sizeof(CThostFtdcInputQuoteActionField::reserve1), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputQuoteActionField, InvestUnitID), sizeof(CThostFtdcInputQuoteActionField::InvestUnitID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcInputQuoteActionField, ClientID), sizeof(CThostFtdcInputQuoteActionField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputQuoteActionField, reserve2), sizeof(CThostFtdcInputQuoteActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputQuoteActionField, MacAddress), sizeof(CThostFtdcInputQuoteActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputQuoteActionField, InstrumentID), sizeof(CThostFtdcInputQuoteActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputQuoteActionField, IPAddress), sizeof(CThostFtdcInputQuoteActionField::IPAddress), FIELD_ASCII},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcInputQuoteActionField, OrderMemo), sizeof(CThostFtdcInputQuoteActionField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcInputQuoteActionField, SessionReqSeq), sizeof(CThostFtdcInputQuoteActionField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc InputBatchOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputBatchOrderActionField, BrokerID), sizeof(CThostFtdcInputBatchOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputBatchOrderActionField, InvestorID), sizeof(CThostFtdcInputBatchOrderActionField::InvestorID), FIELD_ASCII},
+	{"OrderActionRef", &KEY_OrderActionRef, offsetof(CThostFtdcInputBatchOrderActionField, OrderActionRef), sizeof(CThostFtdcInputBatchOrderActionField::OrderActionRef), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputBatchOrderActionField, RequestID), sizeof(CThostFtdcInputBatchOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcInputBatchOrderActionField, FrontID), sizeof(CThostFtdcInputBatchOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcInputBatchOrderActionField, SessionID), sizeof(CThostFtdcInputBatchOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputBatchOrderActionField, ExchangeID), sizeof(CThostFtdcInputBatchOrderActionField::ExchangeID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputBatchOrderActionField, UserID), sizeof(CThostFtdcInputBatchOrderActionField::UserID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputBatchOrderActionField, InvestUnitID), sizeof(CThostFtdcInputBatchOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputBatchOrderActionField, reserve1), sizeof(CThostFtdcInputBatchOrderActionField::reserve1), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputBatchOrderActionField, MacAddress), sizeof(CThostFtdcInputBatchOrderActionField::MacAddress), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputBatchOrderActionField, IPAddress), sizeof(CThostFtdcInputBatchOrderActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputOptionSelfCloseFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputOptionSelfCloseField, BrokerID), sizeof(CThostFtdcInputOptionSelfCloseField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputOptionSelfCloseField, InvestorID), sizeof(CThostFtdcInputOptionSelfCloseField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputOptionSelfCloseField, reserve1), sizeof(CThostFtdcInputOptionSelfCloseField::reserve1), FIELD_ASCII},
+	{"OptionSelfCloseRef", &KEY_OptionSelfCloseRef, offsetof(CThostFtdcInputOptionSelfCloseField, OptionSelfCloseRef), sizeof(CThostFtdcInputOptionSelfCloseField::OptionSelfCloseRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputOptionSelfCloseField, UserID), sizeof(CThostFtdcInputOptionSelfCloseField::UserID), FIELD_ASCII},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcInputOptionSelfCloseField, Volume), sizeof(CThostFtdcInputOptionSelfCloseField::Volume), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputOptionSelfCloseField, RequestID), sizeof(CThostFtdcInputOptionSelfCloseField::RequestID), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcInputOptionSelfCloseField, BusinessUnit), sizeof(CThostFtdcInputOptionSelfCloseField::BusinessUnit), FIELD_GBK},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInputOptionSelfCloseField, HedgeFlag), sizeof(CThostFtdcInputOptionSelfCloseField::HedgeFlag), FIELD_CHAR},
+	{"OptSelfCloseFlag", &KEY_OptSelfCloseFlag, offsetof(CThostFtdcInputOptionSelfCloseField, OptSelfCloseFlag), sizeof(CThostFtdcInputOptionSelfCloseField::OptSelfCloseFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputOptionSelfCloseField, ExchangeID), sizeof(CThostFtdcInputOptionSelfCloseField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputOptionSelfCloseField, InvestUnitID), sizeof(CThostFtdcInputOptionSelfCloseField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcInputOptionSelfCloseField, AccountID), sizeof(CThostFtdcInputOptionSelfCloseField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcInputOptionSelfCloseField, CurrencyID), sizeof(CThostFtdcInputOptionSelfCloseField::CurrencyID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcInputOptionSelfCloseField, ClientID), sizeof(CThostFtdcInputOptionSelfCloseField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputOptionSelfCloseField, reserve2), sizeof(CThostFtdcInputOptionSelfCloseField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputOptionSelfCloseField, MacAddress), sizeof(CThostFtdcInputOptionSelfCloseField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputOptionSelfCloseField, InstrumentID), sizeof(CThostFtdcInputOptionSelfCloseField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputOptionSelfCloseField, IPAddress), sizeof(CThostFtdcInputOptionSelfCloseField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputOptionSelfCloseActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputOptionSelfCloseActionField, BrokerID), sizeof(CThostFtdcInputOptionSelfCloseActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputOptionSelfCloseActionField, InvestorID), sizeof(CThostFtdcInputOptionSelfCloseActionField::InvestorID), FIELD_ASCII},
+	{"OptionSelfCloseActionRef", &KEY_OptionSelfCloseActionRef, offsetof(CThostFtdcInputOptionSelfCloseActionField, OptionSelfCloseActionRef), sizeof(CThostFtdcInputOptionSelfCloseActionField::OptionSelfCloseActionRef), FIELD_INT},
+	{"OptionSelfCloseRef", &KEY_OptionSelfCloseRef, offsetof(CThostFtdcInputOptionSelfCloseActionField, OptionSelfCloseRef), sizeof(CThostFtdcInputOptionSelfCloseActionField::OptionSelfCloseRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcInputOptionSelfCloseActionField, RequestID), sizeof(CThostFtdcInputOptionSelfCloseActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcInputOptionSelfCloseActionField, FrontID), sizeof(CThostFtdcInputOptionSelfCloseActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcInputOptionSelfCloseActionField, SessionID), sizeof(CThostFtdcInputOptionSelfCloseActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputOptionSelfCloseActionField, ExchangeID), sizeof(CThostFtdcInputOptionSelfCloseActionField::ExchangeID), FIELD_ASCII},
+	{"OptionSelfCloseSysID", &KEY_OptionSelfCloseSysID, offsetof(CThostFtdcInputOptionSelfCloseActionField, OptionSelfCloseSysID), sizeof(CThostFtdcInputOptionSelfCloseActionField::OptionSelfCloseSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcInputOptionSelfCloseActionField, ActionFlag), sizeof(CThostFtdcInputOptionSelfCloseActionField::ActionFlag), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputOptionSelfCloseActionField, UserID), sizeof(CThostFtdcInputOptionSelfCloseActionField::UserID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputOptionSelfCloseActionField, reserve1), sizeof(CThostFtdcInputOptionSelfCloseActionField::reserve1), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputOptionSelfCloseActionField, InvestUnitID), sizeof(CThostFtdcInputOptionSelfCloseActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputOptionSelfCloseActionField, reserve2), sizeof(CThostFtdcInputOptionSelfCloseActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputOptionSelfCloseActionField, MacAddress), sizeof(CThostFtdcInputOptionSelfCloseActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputOptionSelfCloseActionField, InstrumentID), sizeof(CThostFtdcInputOptionSelfCloseActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputOptionSelfCloseActionField, IPAddress), sizeof(CThostFtdcInputOptionSelfCloseActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InputCombActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInputCombActionField, BrokerID), sizeof(CThostFtdcInputCombActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInputCombActionField, InvestorID), sizeof(CThostFtdcInputCombActionField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInputCombActionField, reserve1), sizeof(CThostFtdcInputCombActionField::reserve1), FIELD_ASCII},
+	{"CombActionRef", &KEY_CombActionRef, offsetof(CThostFtdcInputCombActionField, CombActionRef), sizeof(CThostFtdcInputCombActionField::CombActionRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcInputCombActionField, UserID), sizeof(CThostFtdcInputCombActionField::UserID), FIELD_ASCII},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcInputCombActionField, Direction), sizeof(CThostFtdcInputCombActionField::Direction), FIELD_CHAR},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcInputCombActionField, Volume), sizeof(CThostFtdcInputCombActionField::Volume), FIELD_INT},
+	{"CombDirection", &KEY_CombDirection, offsetof(CThostFtdcInputCombActionField, CombDirection), sizeof(CThostFtdcInputCombActionField::CombDirection), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInputCombActionField, HedgeFlag), sizeof(CThostFtdcInputCombActionField::HedgeFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInputCombActionField, ExchangeID), sizeof(CThostFtdcInputCombActionField::ExchangeID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInputCombActionField, reserve2), sizeof(CThostFtdcInputCombActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcInputCombActionField, MacAddress), sizeof(CThostFtdcInputCombActionField::MacAddress), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInputCombActionField, InvestUnitID), sizeof(CThostFtdcInputCombActionField::InvestUnitID), FIELD_ASCII},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcInputCombActionField, FrontID), sizeof(CThostFtdcInputCombActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcInputCombActionField, SessionID), sizeof(CThostFtdcInputCombActionField::SessionID), FIELD_INT},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInputCombActionField, InstrumentID), sizeof(CThostFtdcInputCombActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcInputCombActionField, IPAddress), sizeof(CThostFtdcInputCombActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc OrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOrderField, BrokerID), sizeof(CThostFtdcOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcOrderField, InvestorID), sizeof(CThostFtdcOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcOrderField, reserve1), sizeof(CThostFtdcOrderField::reserve1), FIELD_ASCII},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcOrderField, OrderRef), sizeof(CThostFtdcOrderField::OrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcOrderField, UserID), sizeof(CThostFtdcOrderField::UserID), FIELD_ASCII},
+	{"OrderPriceType", &KEY_OrderPriceType, offsetof(CThostFtdcOrderField, OrderPriceType), sizeof(CThostFtdcOrderField::OrderPriceType), FIELD_CHAR},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcOrderField, Direction), sizeof(CThostFtdcOrderField::Direction), FIELD_CHAR},
+	{"CombOffsetFlag", &KEY_CombOffsetFlag, offsetof(CThostFtdcOrderField, CombOffsetFlag), sizeof(CThostFtdcOrderField::CombOffsetFlag), FIELD_ASCII},
+	{"CombHedgeFlag", &KEY_CombHedgeFlag, offsetof(CThostFtdcOrderField, CombHedgeFlag), sizeof(CThostFtdcOrderField::CombHedgeFlag), FIELD_ASCII},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcOrderField, LimitPrice), sizeof(CThostFtdcOrderField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeTotalOriginal", &KEY_VolumeTotalOriginal, offsetof(CThostFtdcOrderField, VolumeTotalOriginal), sizeof(CThostFtdcOrderField::VolumeTotalOriginal), FIELD_INT},
+	{"TimeCondition", &KEY_TimeCondition, offsetof(CThostFtdcOrderField, TimeCondition), sizeof(CThostFtdcOrderField::TimeCondition), FIELD_CHAR},
+	{"GTDDate", &KEY_GTDDate, offsetof(CThostFtdcOrderField, GTDDate), sizeof(CThostFtdcOrderField::GTDDate), FIELD_ASCII},
+	{"VolumeCondition", &KEY_VolumeCondition, offsetof(CThostFtdcOrderField, VolumeCondition), sizeof(CThostFtdcOrderField::VolumeCondition), FIELD_CHAR},
+	{"MinVolume", &KEY_MinVolume, offsetof(CThostFtdcOrderField, MinVolume), sizeof(CThostFtdcOrderField::MinVolume), FIELD_INT},
+	{"ContingentCondition", &KEY_ContingentCondition, offsetof(CThostFtdcOrderField, ContingentCondition), sizeof(CThostFtdcOrderField::ContingentCondition), FIELD_CHAR},
+	{"StopPrice", &KEY_StopPrice, offsetof(CThostFtdcOrderField, StopPrice), sizeof(CThostFtdcOrderField::StopPrice), FIELD_DOUBLE},
+	{"ForceCloseReason", &KEY_ForceCloseReason, offsetof(CThostFtdcOrderField, ForceCloseReason), sizeof(CThostFtdcOrderField::ForceCloseReason), FIELD_CHAR},
+	{"IsAutoSuspend", &KEY_IsAutoSuspend, offsetof(CThostFtdcOrderField, IsAutoSuspend), sizeof(CThostFtdcOrderField::IsAutoSuspend), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcOrderField, BusinessUnit), sizeof(CThostFtdcOrderField::BusinessUnit), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcOrderField, RequestID), sizeof(CThostFtdcOrderField::RequestID), FIELD_INT},
+	{"OrderLocalID", &KEY_OrderLocalID, offsetof(CThostFtdcOrderField, OrderLocalID), sizeof(CThostFtdcOrderField::OrderLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcOrderField, ExchangeID), sizeof(CThostFtdcOrderField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcOrderField, ParticipantID), sizeof(CThostFtdcOrderField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcOrderField, ClientID), sizeof(CThostFtdcOrderField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcOrderField, reserve2), sizeof(CThostFtdcOrderField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcOrderField, TraderID), sizeof(CThostFtdcOrderField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcOrderField, InstallID), sizeof(CThostFtdcOrderField::InstallID), FIELD_INT},
+	{"OrderSubmitStatus", &KEY_OrderSubmitStatus, offsetof(CThostFtdcOrderField, OrderSubmitStatus), sizeof(CThostFtdcOrderField::OrderSubmitStatus), FIELD_CHAR},
+	{"NotifySequence", &KEY_NotifySequence, offsetof(CThostFtdcOrderField, NotifySequence), sizeof(CThostFtdcOrderField::NotifySequence), FIELD_INT},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcOrderField, TradingDay), sizeof(CThostFtdcOrderField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcOrderField, SettlementID), sizeof(CThostFtdcOrderField::SettlementID), FIELD_INT},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcOrderField, OrderSysID), sizeof(CThostFtdcOrderField::OrderSysID), FIELD_ASCII},
+	{"OrderSource", &KEY_OrderSource, offsetof(CThostFtdcOrderField, OrderSource), sizeof(CThostFtdcOrderField::OrderSource), FIELD_CHAR},
+	{"OrderStatus", &KEY_OrderStatus, offsetof(CThostFtdcOrderField, OrderStatus), sizeof(CThostFtdcOrderField::OrderStatus), FIELD_CHAR},
+	{"OrderType", &KEY_OrderType, offsetof(CThostFtdcOrderField, OrderType), sizeof(CThostFtdcOrderField::OrderType), FIELD_CHAR},
+	{"VolumeTraded", &KEY_VolumeTraded, offsetof(CThostFtdcOrderField, VolumeTraded), sizeof(CThostFtdcOrderField::VolumeTraded), FIELD_INT},
+	{"VolumeTotal", &KEY_VolumeTotal, offsetof(CThostFtdcOrderField, VolumeTotal), sizeof(CThostFtdcOrderField::VolumeTotal), FIELD_INT},
+	{"InsertDate", &KEY_InsertDate, offsetof(CThostFtdcOrderField, InsertDate), sizeof(CThostFtdcOrderField::InsertDate), FIELD_ASCII},
+	{"InsertTime", &KEY_InsertTime, offsetof(CThostFtdcOrderField, InsertTime), sizeof(CThostFtdcOrderField::InsertTime), FIELD_ASCII},
+	{"ActiveTime", &KEY_ActiveTime, offsetof(CThostFtdcOrderField, ActiveTime), sizeof(CThostFtdcOrderField::ActiveTime), FIELD_ASCII},
+	{"SuspendTime", &KEY_SuspendTime, offsetof(CThostFtdcOrderField, SuspendTime), sizeof(CThostFtdcOrderField::SuspendTime), FIELD_ASCII},
+	{"UpdateTime", &KEY_UpdateTime, offsetof(CThostFtdcOrderField, UpdateTime), sizeof(CThostFtdcOrderField::UpdateTime), FIELD_ASCII},
+	{"CancelTime", &KEY_CancelTime, offsetof(CThostFtdcOrderField, CancelTime), sizeof(CThostFtdcOrderField::CancelTime), FIELD_ASCII},
+	{"ActiveTraderID", &KEY_ActiveTraderID, offsetof(CThostFtdcOrderField, ActiveTraderID), sizeof(CThostFtdcOrderField::ActiveTraderID), FIELD_ASCII},
+	{"ClearingPartID", &KEY_ClearingPartID, offsetof(CThostFtdcOrderField, ClearingPartID), sizeof(CThostFtdcOrderField::ClearingPartID), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcOrderField, SequenceNo), sizeof(CThostFtdcOrderField::SequenceNo), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcOrderField, FrontID), sizeof(CThostFtdcOrderField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcOrderField, SessionID), sizeof(CThostFtdcOrderField::SessionID), FIELD_INT},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcOrderField, UserProductInfo), sizeof(CThostFtdcOrderField::UserProductInfo), FIELD_GBK},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcOrderField, StatusMsg), sizeof(CThostFtdcOrderField::StatusMsg), FIELD_GBK},
+	{"UserForceClose", &KEY_UserForceClose, offsetof(CThostFtdcOrderField, UserForceClose), sizeof(CThostFtdcOrderField::UserForceClose), FIELD_INT},
+	{"ActiveUserID", &KEY_ActiveUserID, offsetof(CThostFtdcOrderField, ActiveUserID), sizeof(CThostFtdcOrderField::ActiveUserID), FIELD_ASCII},
+	{"BrokerOrderSeq", &KEY_BrokerOrderSeq, offsetof(CThostFtdcOrderField, BrokerOrderSeq), sizeof(CThostFtdcOrderField::BrokerOrderSeq), FIELD_INT},
+	{"RelativeOrderSysID", &KEY_RelativeOrderSysID, offsetof(CThostFtdcOrderField, RelativeOrderSysID), sizeof(CThostFtdcOrderField::RelativeOrderSysID), FIELD_ASCII},
+	{"ZCETotalTradedVolume", &KEY_ZCETotalTradedVolume, offsetof(CThostFtdcOrderField, ZCETotalTradedVolume), sizeof(CThostFtdcOrderField::ZCETotalTradedVolume), FIELD_INT},
+	{"IsSwapOrder", &KEY_IsSwapOrder, offsetof(CThostFtdcOrderField, IsSwapOrder), sizeof(CThostFtdcOrderField::IsSwapOrder), FIELD_INT},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcOrderField, BranchID), sizeof(CThostFtdcOrderField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcOrderField, InvestUnitID), sizeof(CThostFtdcOrderField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcOrderField, AccountID), sizeof(CThostFtdcOrderField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcOrderField, CurrencyID), sizeof(CThostFtdcOrderField::CurrencyID), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcOrderField, reserve3), sizeof(CThostFtdcOrderField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcOrderField, MacAddress), sizeof(CThostFtdcOrderField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcOrderField, InstrumentID), sizeof(CThostFtdcOrderField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcOrderField, ExchangeInstID), sizeof(CThostFtdcOrderField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcOrderField, IPAddress), sizeof(CThostFtdcOrderField::IPAddress), FIELD_ASCII},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcOrderField, OrderMemo), sizeof(CThostFtdcOrderField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcOrderField, SessionReqSeq), sizeof(CThostFtdcOrderField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc TradeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTradeField, BrokerID), sizeof(CThostFtdcTradeField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcTradeField, InvestorID), sizeof(CThostFtdcTradeField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcTradeField, reserve1), sizeof(CThostFtdcTradeField::reserve1), FIELD_ASCII},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcTradeField, OrderRef), sizeof(CThostFtdcTradeField::OrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcTradeField, UserID), sizeof(CThostFtdcTradeField::UserID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcTradeField, ExchangeID), sizeof(CThostFtdcTradeField::ExchangeID), FIELD_ASCII},
+	{"TradeID", &KEY_TradeID, offsetof(CThostFtdcTradeField, TradeID), sizeof(CThostFtdcTradeField::TradeID), FIELD_ASCII},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcTradeField, Direction), sizeof(CThostFtdcTradeField::Direction), FIELD_CHAR},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcTradeField, OrderSysID), sizeof(CThostFtdcTradeField::OrderSysID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcTradeField, ParticipantID), sizeof(CThostFtdcTradeField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcTradeField, ClientID), sizeof(CThostFtdcTradeField::ClientID), FIELD_ASCII},
+	{"TradingRole", &KEY_TradingRole, offsetof(CThostFtdcTradeField, TradingRole), sizeof(CThostFtdcTradeField::TradingRole), FIELD_CHAR},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcTradeField, reserve2), sizeof(CThostFtdcTradeField::reserve2), FIELD_ASCII},
+	{"OffsetFlag", &KEY_OffsetFlag, offsetof(CThostFtdcTradeField, OffsetFlag), sizeof(CThostFtdcTradeField::OffsetFlag), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcTradeField, HedgeFlag), sizeof(CThostFtdcTradeField::HedgeFlag), FIELD_CHAR},
+	{"Price", &KEY_Price, offsetof(CThostFtdcTradeField, Price), sizeof(CThostFtdcTradeField::Price), FIELD_DOUBLE},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcTradeField, Volume), sizeof(CThostFtdcTradeField::Volume), FIELD_INT},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcTradeField, TradeDate), sizeof(CThostFtdcTradeField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcTradeField, TradeTime), sizeof(CThostFtdcTradeField::TradeTime), FIELD_ASCII},
+	{"TradeType", &KEY_TradeType, offsetof(CThostFtdcTradeField, TradeType), sizeof(CThostFtdcTradeField::TradeType), FIELD_CHAR},
+	{"PriceSource", &KEY_PriceSource, offsetof(CThostFtdcTradeField, PriceSource), sizeof(CThostFtdcTradeField::PriceSource), FIELD_CHAR},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcTradeField, TraderID), sizeof(CThostFtdcTradeField::TraderID), FIELD_ASCII},
+	{"OrderLocalID", &KEY_OrderLocalID, offsetof(CThostFtdcTradeField, OrderLocalID), sizeof(CThostFtdcTradeField::OrderLocalID), FIELD_ASCII},
+	{"ClearingPartID", &KEY_ClearingPartID, offsetof(CThostFtdcTradeField, ClearingPartID), sizeof(CThostFtdcTradeField::ClearingPartID), FIELD_ASCII},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcTradeField, BusinessUnit), sizeof(CThostFtdcTradeField::BusinessUnit), FIELD_GBK},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcTradeField, SequenceNo), sizeof(CThostFtdcTradeField::SequenceNo), FIELD_INT},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcTradeField, TradingDay), sizeof(CThostFtdcTradeField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcTradeField, SettlementID), sizeof(CThostFtdcTradeField::SettlementID), FIELD_INT},
+	{"BrokerOrderSeq", &KEY_BrokerOrderSeq, offsetof(CThostFtdcTradeField, BrokerOrderSeq), sizeof(CThostFtdcTradeField::BrokerOrderSeq), FIELD_INT},
+	{"TradeSource", &KEY_TradeSource, offsetof(CThostFtdcTradeField, TradeSource), sizeof(CThostFtdcTradeField::TradeSource), FIELD_CHAR},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcTradeField, InvestUnitID), sizeof(CThostFtdcTradeField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcTradeField, InstrumentID), sizeof(CThostFtdcTradeField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcTradeField, ExchangeInstID), sizeof(CThostFtdcTradeField::ExchangeInstID), FIELD_ASCII},
+};
+
+static const FieldDesc InvestorPositionFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInvestorPositionField, reserve1), sizeof(CThostFtdcInvestorPositionField::reserve1), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorPositionField, BrokerID), sizeof(CThostFtdcInvestorPositionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorPositionField, InvestorID), sizeof(CThostFtdcInvestorPositionField::InvestorID), FIELD_ASCII},
+	{"PosiDirection", &KEY_PosiDirection, offsetof(CThostFtdcInvestorPositionField, PosiDirection), sizeof(CThostFtdcInvestorPositionField::PosiDirection), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInvestorPositionField, HedgeFlag), sizeof(CThostFtdcInvestorPositionField::HedgeFlag), FIELD_CHAR},
+	{"PositionDate", &KEY_PositionDate, offsetof(CThostFtdcInvestorPositionField, PositionDate), sizeof(CThostFtdcInvestorPositionField::PositionDate), FIELD_CHAR},
+	{"YdPosition", &KEY_YdPosition, offsetof(CThostFtdcInvestorPositionField, YdPosition), sizeof(CThostFtdcInvestorPositionField::YdPosition), FIELD_INT},
+	{"Position", &KEY_Position, offsetof(CThostFtdcInvestorPositionField, Position), sizeof(CThostFtdcInvestorPositionField::Position), FIELD_INT},
+	{"LongFrozen", &KEY_LongFrozen, offsetof(CThostFtdcInvestorPositionField, LongFrozen), sizeof(CThostFtdcInvestorPositionField::LongFrozen), FIELD_INT},
+	{"ShortFrozen", &KEY_ShortFrozen, offsetof(CThostFtdcInvestorPositionField, ShortFrozen), sizeof(CThostFtdcInvestorPositionField::ShortFrozen), FIELD_INT},
+	{"LongFrozenAmount", &KEY_LongFrozenAmount, offsetof(CThostFtdcInvestorPositionField, LongFrozenAmount), sizeof(CThostFtdcInvestorPositionField::LongFrozenAmount), FIELD_DOUBLE},
+	{"ShortFrozenAmount", &KEY_ShortFrozenAmount, offsetof(CThostFtdcInvestorPositionField, ShortFrozenAmount), sizeof(CThostFtdcInvestorPositionField::ShortFrozenAmount), FIELD_DOUBLE},
+	{"OpenVolume", &KEY_OpenVolume, offsetof(CThostFtdcInvestorPositionField, OpenVolume), sizeof(CThostFtdcInvestorPositionField::OpenVolume), FIELD_INT},
+	{"CloseVolume", &KEY_CloseVolume, offsetof(CThostFtdcInvestorPositionField, CloseVolume), sizeof(CThostFtdcInvestorPositionField::CloseVolume), FIELD_INT},
+	{"OpenAmount", &KEY_OpenAmount, offsetof(CThostFtdcInvestorPositionField, OpenAmount), sizeof(CThostFtdcInvestorPositionField::OpenAmount), FIELD_DOUBLE},
+	{"CloseAmount", &KEY_CloseAmount, offsetof(CThostFtdcInvestorPositionField, CloseAmount), sizeof(CThostFtdcInvestorPositionField::CloseAmount), FIELD_DOUBLE},
+	{"PositionCost", &KEY_PositionCost, offsetof(CThostFtdcInvestorPositionField, PositionCost), sizeof(CThostFtdcInvestorPositionField::PositionCost), FIELD_DOUBLE},
+	{"PreMargin", &KEY_PreMargin, offsetof(CThostFtdcInvestorPositionField, PreMargin), sizeof(CThostFtdcInvestorPositionField::PreMargin), FIELD_DOUBLE},
+	{"UseMargin", &KEY_UseMargin, offsetof(CThostFtdcInvestorPositionField, UseMargin), sizeof(CThostFtdcInvestorPositionField::UseMargin), FIELD_DOUBLE},
+	{"FrozenMargin", &KEY_FrozenMargin, offsetof(CThostFtdcInvestorPositionField, FrozenMargin), sizeof(CThostFtdcInvestorPositionField::FrozenMargin), FIELD_DOUBLE},
+	{"FrozenCash", &KEY_FrozenCash, offsetof(CThostFtdcInvestorPositionField, FrozenCash), sizeof(CThostFtdcInvestorPositionField::FrozenCash), FIELD_DOUBLE},
+	{"FrozenCommission", &KEY_FrozenCommission, offsetof(CThostFtdcInvestorPositionField, FrozenCommission), sizeof(CThostFtdcInvestorPositionField::FrozenCommission), FIELD_DOUBLE},
+	{"CashIn", &KEY_CashIn, offsetof(CThostFtdcInvestorPositionField, CashIn), sizeof(CThostFtdcInvestorPositionField::CashIn), FIELD_DOUBLE},
+	{"Commission", &KEY_Commission, offsetof(CThostFtdcInvestorPositionField, Commission), sizeof(CThostFtdcInvestorPositionField::Commission), FIELD_DOUBLE},
+	{"CloseProfit", &KEY_CloseProfit, offsetof(CThostFtdcInvestorPositionField, CloseProfit), sizeof(CThostFtdcInvestorPositionField::CloseProfit), FIELD_DOUBLE},
+	{"PositionProfit", &KEY_PositionProfit, offsetof(CThostFtdcInvestorPositionField, PositionProfit), sizeof(CThostFtdcInvestorPositionField::PositionProfit), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcInvestorPositionField, PreSettlementPrice), sizeof(CThostFtdcInvestorPositionField::PreSettlementPrice), FIELD_DOUBLE},
+	{"SettlementPrice", &KEY_SettlementPrice, offsetof(CThostFtdcInvestorPositionField, SettlementPrice), sizeof(CThostFtdcInvestorPositionField::SettlementPrice), FIELD_DOUBLE},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcInvestorPositionField, TradingDay), sizeof(CThostFtdcInvestorPositionField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcInvestorPositionField, SettlementID), sizeof(CThostFtdcInvestorPositionField::SettlementID), FIELD_INT},
+	{"OpenCost", &KEY_OpenCost, offsetof(CThostFtdcInvestorPositionField, OpenCost), sizeof(CThostFtdcInvestorPositionField::OpenCost), FIELD_DOUBLE},
+	{"ExchangeMargin", &KEY_ExchangeMargin, offsetof(CThostFtdcInvestorPositionField, ExchangeMargin), sizeof(CThostFtdcInvestorPositionField::ExchangeMargin), FIELD_DOUBLE},
+	{"CombPosition", &KEY_CombPosition, offsetof(CThostFtdcInvestorPositionField, CombPosition), sizeof(CThostFtdcInvestorPositionField::CombPosition), FIELD_INT},
+	{"CombLongFrozen", &KEY_CombLongFrozen, offsetof(CThostFtdcInvestorPositionField, CombLongFrozen), sizeof(CThostFtdcInvestorPositionField::CombLongFrozen), FIELD_INT},
+	{"CombShortFrozen", &KEY_CombShortFrozen, offsetof(CThostFtdcInvestorPositionField, CombShortFrozen), sizeof(CThostFtdcInvestorPositionField::CombShortFrozen), FIELD_INT},
+	{"CloseProfitByDate", &KEY_CloseProfitByDate, offsetof(CThostFtdcInvestorPositionField, CloseProfitByDate), sizeof(CThostFtdcInvestorPositionField::CloseProfitByDate), FIELD_DOUBLE},
+	{"CloseProfitByTrade", &KEY_CloseProfitByTrade, offsetof(CThostFtdcInvestorPositionField, CloseProfitByTrade), sizeof(CThostFtdcInvestorPositionField::CloseProfitByTrade), FIELD_DOUBLE},
+	{"TodayPosition", &KEY_TodayPosition, offsetof(CThostFtdcInvestorPositionField, TodayPosition), sizeof(CThostFtdcInvestorPositionField::TodayPosition), FIELD_INT},
+	{"MarginRateByMoney", &KEY_MarginRateByMoney, offsetof(CThostFtdcInvestorPositionField, MarginRateByMoney), sizeof(CThostFtdcInvestorPositionField::MarginRateByMoney), FIELD_DOUBLE},
+	{"MarginRateByVolume", &KEY_MarginRateByVolume, offsetof(CThostFtdcInvestorPositionField, MarginRateByVolume), sizeof(CThostFtdcInvestorPositionField::MarginRateByVolume), FIELD_DOUBLE},
+	{"StrikeFrozen", &KEY_StrikeFrozen, offsetof(CThostFtdcInvestorPositionField, StrikeFrozen), sizeof(CThostFtdcInvestorPositionField::StrikeFrozen), FIELD_INT},
+	{"StrikeFrozenAmount", &KEY_StrikeFrozenAmount, offsetof(CThostFtdcInvestorPositionField, StrikeFrozenAmount), sizeof(CThostFtdcInvestorPositionField::StrikeFrozenAmount), FIELD_DOUBLE},
+	{"AbandonFrozen", &KEY_AbandonFrozen, offsetof(CThostFtdcInvestorPositionField, AbandonFrozen), sizeof(CThostFtdcInvestorPositionField::AbandonFrozen), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorPositionField, ExchangeID), sizeof(CThostFtdcInvestorPositionField::ExchangeID), FIELD_ASCII},
+	{"YdStrikeFrozen", &KEY_YdStrikeFrozen, offsetof(CThostFtdcInvestorPositionField, YdStrikeFrozen), sizeof(CThostFtdcInvestorPositionField::YdStrikeFrozen), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInvestorPositionField, InvestUnitID), sizeof(CThostFtdcInvestorPositionField::InvestUnitID), FIELD_ASCII},
+	{"PositionCostOffset", &KEY_PositionCostOffset, offsetof(CThostFtdcInvestorPositionField, PositionCostOffset), sizeof(CThostFtdcInvestorPositionField::PositionCostOffset), FIELD_DOUBLE},
+	{"TasPosition", &KEY_TasPosition, offsetof(CThostFtdcInvestorPositionField, TasPosition), sizeof(CThostFtdcInvestorPositionField::TasPosition), FIELD_INT},
+	{"TasPositionCost", &KEY_TasPositionCost, offsetof(CThostFtdcInvestorPositionField, TasPositionCost), sizeof(CThostFtdcInvestorPositionField::TasPositionCost), FIELD_DOUBLE},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInvestorPositionField, InstrumentID), sizeof(CThostFtdcInvestorPositionField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc TradingAccountFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTradingAccountField, BrokerID), sizeof(CThostFtdcTradingAccountField::BrokerID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcTradingAccountField, AccountID), sizeof(CThostFtdcTradingAccountField::AccountID), FIELD_ASCII},
+	{"PreMortgage", &KEY_PreMortgage, offsetof(CThostFtdcTradingAccountField, PreMortgage), sizeof(CThostFtdcTradingAccountField::PreMortgage), FIELD_DOUBLE},
+	{"PreCredit", &KEY_PreCredit, offsetof(CThostFtdcTradingAccountField, PreCredit), sizeof(CThostFtdcTradingAccountField::PreCredit), FIELD_DOUBLE},
+	{"PreDeposit", &KEY_PreDeposit, offsetof(CThostFtdcTradingAccountField, PreDeposit), sizeof(CThostFtdcTradingAccountField::PreDeposit), FIELD_DOUBLE},
+	{"PreBalance", &KEY_PreBalance, offsetof(CThostFtdcTradingAccountField, PreBalance), sizeof(CThostFtdcTradingAccountField::PreBalance), FIELD_DOUBLE},
+	{"PreMargin", &KEY_PreMargin, offsetof(CThostFtdcTradingAccountField, PreMargin), sizeof(CThostFtdcTradingAccountField::PreMargin), FIELD_DOUBLE},
+	{"InterestBase", &KEY_InterestBase, offsetof(CThostFtdcTradingAccountField, InterestBase), sizeof(CThostFtdcTradingAccountField::InterestBase), FIELD_DOUBLE},
+	{"Interest", &KEY_Interest, offsetof(CThostFtdcTradingAccountField, Interest), sizeof(CThostFtdcTradingAccountField::Interest), FIELD_DOUBLE},
+	{"Deposit", &KEY_Deposit, offsetof(CThostFtdcTradingAccountField, Deposit), sizeof(CThostFtdcTradingAccountField::Deposit), FIELD_DOUBLE},
+	{"Withdraw", &KEY_Withdraw, offsetof(CThostFtdcTradingAccountField, Withdraw), sizeof(CThostFtdcTradingAccountField::Withdraw), FIELD_DOUBLE},
+	{"FrozenMargin", &KEY_FrozenMargin, offsetof(CThostFtdcTradingAccountField, FrozenMargin), sizeof(CThostFtdcTradingAccountField::FrozenMargin), FIELD_DOUBLE},
+	{"FrozenCash", &KEY_FrozenCash, offsetof(CThostFtdcTradingAccountField, FrozenCash), sizeof(CThostFtdcTradingAccountField::FrozenCash), FIELD_DOUBLE},
+	{"FrozenCommission", &KEY_FrozenCommission, offsetof(CThostFtdcTradingAccountField, FrozenCommission), sizeof(CThostFtdcTradingAccountField::FrozenCommission), FIELD_DOUBLE},
+	{"CurrMargin", &KEY_CurrMargin, offsetof(CThostFtdcTradingAccountField, CurrMargin), sizeof(CThostFtdcTradingAccountField::CurrMargin), FIELD_DOUBLE},
+	{"CashIn", &KEY_CashIn, offsetof(CThostFtdcTradingAccountField, CashIn), sizeof(CThostFtdcTradingAccountField::CashIn), FIELD_DOUBLE},
+	{"Commission", &KEY_Commission, offsetof(CThostFtdcTradingAccountField, Commission), sizeof(CThostFtdcTradingAccountField::Commission), FIELD_DOUBLE},
+	{"CloseProfit", &KEY_CloseProfit, offsetof(CThostFtdcTradingAccountField, CloseProfit), sizeof(CThostFtdcTradingAccountField::CloseProfit), FIELD_DOUBLE},
+	{"PositionProfit", &KEY_PositionProfit, offsetof(CThostFtdcTradingAccountField, PositionProfit), sizeof(CThostFtdcTradingAccountField::PositionProfit), FIELD_DOUBLE},
+	{"Balance", &KEY_Balance, offsetof(CThostFtdcTradingAccountField, Balance), sizeof(CThostFtdcTradingAccountField::Balance), FIELD_DOUBLE},
+	{"Available", &KEY_Available, offsetof(CThostFtdcTradingAccountField, Available), sizeof(CThostFtdcTradingAccountField::Available), FIELD_DOUBLE},
+	{"WithdrawQuota", &KEY_WithdrawQuota, offsetof(CThostFtdcTradingAccountField, WithdrawQuota), sizeof(CThostFtdcTradingAccountField::WithdrawQuota), FIELD_DOUBLE},
+	{"Reserve", &KEY_Reserve, offsetof(CThostFtdcTradingAccountField, Reserve), sizeof(CThostFtdcTradingAccountField::Reserve), FIELD_DOUBLE},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcTradingAccountField, TradingDay), sizeof(CThostFtdcTradingAccountField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcTradingAccountField, SettlementID), sizeof(CThostFtdcTradingAccountField::SettlementID), FIELD_INT},
+	{"Credit", &KEY_Credit, offsetof(CThostFtdcTradingAccountField, Credit), sizeof(CThostFtdcTradingAccountField::Credit), FIELD_DOUBLE},
+	{"Mortgage", &KEY_Mortgage, offsetof(CThostFtdcTradingAccountField, Mortgage), sizeof(CThostFtdcTradingAccountField::Mortgage), FIELD_DOUBLE},
+	{"ExchangeMargin", &KEY_ExchangeMargin, offsetof(CThostFtdcTradingAccountField, ExchangeMargin), sizeof(CThostFtdcTradingAccountField::ExchangeMargin), FIELD_DOUBLE},
+	{"DeliveryMargin", &KEY_DeliveryMargin, offsetof(CThostFtdcTradingAccountField, DeliveryMargin), sizeof(CThostFtdcTradingAccountField::DeliveryMargin), FIELD_DOUBLE},
+	{"ExchangeDeliveryMargin", &KEY_ExchangeDeliveryMargin, offsetof(CThostFtdcTradingAccountField, ExchangeDeliveryMargin), sizeof(CThostFtdcTradingAccountField::ExchangeDeliveryMargin), FIELD_DOUBLE},
+	{"ReserveBalance", &KEY_ReserveBalance, offsetof(CThostFtdcTradingAccountField, ReserveBalance), sizeof(CThostFtdcTradingAccountField::ReserveBalance), FIELD_DOUBLE},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcTradingAccountField, CurrencyID), sizeof(CThostFtdcTradingAccountField::CurrencyID), FIELD_ASCII},
+	{"PreFundMortgageIn", &KEY_PreFundMortgageIn, offsetof(CThostFtdcTradingAccountField, PreFundMortgageIn), sizeof(CThostFtdcTradingAccountField::PreFundMortgageIn), FIELD_DOUBLE},
+	{"PreFundMortgageOut", &KEY_PreFundMortgageOut, offsetof(CThostFtdcTradingAccountField, PreFundMortgageOut), sizeof(CThostFtdcTradingAccountField::PreFundMortgageOut), FIELD_DOUBLE},
+	{"FundMortgageIn", &KEY_FundMortgageIn, offsetof(CThostFtdcTradingAccountField, FundMortgageIn), sizeof(CThostFtdcTradingAccountField::FundMortgageIn), FIELD_DOUBLE},
+	{"FundMortgageOut", &KEY_FundMortgageOut, offsetof(CThostFtdcTradingAccountField, FundMortgageOut), sizeof(CThostFtdcTradingAccountField::FundMortgageOut), FIELD_DOUBLE},
+	{"FundMortgageAvailable", &KEY_FundMortgageAvailable, offsetof(CThostFtdcTradingAccountField, FundMortgageAvailable), sizeof(CThostFtdcTradingAccountField::FundMortgageAvailable), FIELD_DOUBLE},
+	{"MortgageableFund", &KEY_MortgageableFund, offsetof(CThostFtdcTradingAccountField, MortgageableFund), sizeof(CThostFtdcTradingAccountField::MortgageableFund), FIELD_DOUBLE},
+	{"SpecProductMargin", &KEY_SpecProductMargin, offsetof(CThostFtdcTradingAccountField, SpecProductMargin), sizeof(CThostFtdcTradingAccountField::SpecProductMargin), FIELD_DOUBLE},
+	{"SpecProductFrozenMargin", &KEY_SpecProductFrozenMargin, offsetof(CThostFtdcTradingAccountField, SpecProductFrozenMargin), sizeof(CThostFtdcTradingAccountField::SpecProductFrozenMargin), FIELD_DOUBLE},
+	{"SpecProductCommission", &KEY_SpecProductCommission, offsetof(CThostFtdcTradingAccountField, SpecProductCommission), sizeof(CThostFtdcTradingAccountField::SpecProductCommission), FIELD_DOUBLE},
+	{"SpecProductFrozenCommission", &KEY_SpecProductFrozenCommission, offsetof(CThostFtdcTradingAccountField, SpecProductFrozenCommission), sizeof(CThostFtdcTradingAccountField::SpecProductFrozenCommission), FIELD_DOUBLE},
+	{"SpecProductPositionProfit", &KEY_SpecProductPositionProfit, offsetof(CThostFtdcTradingAccountField, SpecProductPositionProfit), sizeof(CThostFtdcTradingAccountField::SpecProductPositionProfit), FIELD_DOUBLE},
+	{"SpecProductCloseProfit", &KEY_SpecProductCloseProfit, offsetof(CThostFtdcTradingAccountField, SpecProductCloseProfit), sizeof(CThostFtdcTradingAccountField::SpecProductCloseProfit), FIELD_DOUBLE},
+	{"SpecProductPositionProfitByAlg", &KEY_SpecProductPositionProfitByAlg, offsetof(CThostFtdcTradingAccountField, SpecProductPositionProfitByAlg), sizeof(CThostFtdcTradingAccountField::SpecProductPositionProfitByAlg), FIELD_DOUBLE},
+	{"SpecProductExchangeMargin", &KEY_SpecProductExchangeMargin, offsetof(CThostFtdcTradingAccountField, SpecProductExchangeMargin), sizeof(CThostFtdcTradingAccountField::SpecProductExchangeMargin), FIELD_DOUBLE},
+	{"BizType", &KEY_BizType, offsetof(CThostFtdcTradingAccountField, BizType), sizeof(CThostFtdcTradingAccountField::BizType), FIELD_CHAR},
+	{"FrozenSwap", &KEY_FrozenSwap, offsetof(CThostFtdcTradingAccountField, FrozenSwap), sizeof(CThostFtdcTradingAccountField::FrozenSwap), FIELD_DOUBLE},
+	{"RemainSwap", &KEY_RemainSwap, offsetof(CThostFtdcTradingAccountField, RemainSwap), sizeof(CThostFtdcTradingAccountField::RemainSwap), FIELD_DOUBLE},
+};
+
+static const FieldDesc InvestorFields[] = {
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorField, InvestorID), sizeof(CThostFtdcInvestorField::InvestorID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorField, BrokerID), sizeof(CThostFtdcInvestorField::BrokerID), FIELD_ASCII},
+	{"InvestorGroupID", &KEY_InvestorGroupID, offsetof(CThostFtdcInvestorField, InvestorGroupID), sizeof(CThostFtdcInvestorField::InvestorGroupID), FIELD_ASCII},
+	{"InvestorName", &KEY_InvestorName, offsetof(CThostFtdcInvestorField, InvestorName), sizeof(CThostFtdcInvestorField::InvestorName), FIELD_GBK},
+	{"IdentifiedCardType", &KEY_IdentifiedCardType, offsetof(CThostFtdcInvestorField, IdentifiedCardType), sizeof(CThostFtdcInvestorField::IdentifiedCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcInvestorField, IdentifiedCardNo), sizeof(CThostFtdcInvestorField::IdentifiedCardNo), FIELD_GBK},
+	{"IsActive", &KEY_IsActive, offsetof(CThostFtdcInvestorField, IsActive), sizeof(CThostFtdcInvestorField::IsActive), FIELD_INT},
+	{"Telephone", &KEY_Telephone, offsetof(CThostFtdcInvestorField, Telephone), sizeof(CThostFtdcInvestorField::Telephone), FIELD_GBK},
+	{"Address", &KEY_Address, offsetof(CThostFtdcInvestorField, Address), sizeof(CThostFtdcInvestorField::Address), FIELD_GBK},
+	{"OpenDate", &KEY_OpenDate, offsetof(CThostFtdcInvestorField, OpenDate), sizeof(CThostFtdcInvestorField::OpenDate), FIELD_ASCII},
+	{"Mobile", &KEY_Mobile, offsetof(CThostFtdcInvestorField, Mobile), sizeof(CThostFtdcInvestorField::Mobile), FIELD_GBK},
+	{"CommModelID", &KEY_CommModelID, offsetof(CThostFtdcInvestorField, CommModelID), sizeof(CThostFtdcInvestorField::CommModelID), FIELD_ASCII},
+	{"MarginModelID", &KEY_MarginModelID, offsetof(CThostFtdcInvestorField, MarginModelID), sizeof(CThostFtdcInvestorField::MarginModelID), FIELD_ASCII},
+	{"IsOrderFreq", &KEY_IsOrderFreq, offsetof(CThostFtdcInvestorField, IsOrderFreq), sizeof(CThostFtdcInvestorField::IsOrderFreq), FIELD_CHAR},
+	{"IsOpenVolLimit", &KEY_IsOpenVolLimit, offsetof(CThostFtdcInvestorField, IsOpenVolLimit), sizeof(CThostFtdcInvestorField::IsOpenVolLimit), FIELD_CHAR},
+};
+
+static const FieldDesc TradingCodeFields[] = {
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcTradingCodeField, InvestorID), sizeof(CThostFtdcTradingCodeField::InvestorID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTradingCodeField, BrokerID), sizeof(CThostFtdcTradingCodeField::BrokerID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcTradingCodeField, ExchangeID), sizeof(CThostFtdcTradingCodeField::ExchangeID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcTradingCodeField, ClientID), sizeof(CThostFtdcTradingCodeField::ClientID), FIELD_ASCII},
+	{"IsActive", &KEY_IsActive, offsetof(CThostFtdcTradingCodeField, IsActive), sizeof(CThostFtdcTradingCodeField::IsActive), FIELD_INT},
+	{"ClientIDType", &KEY_ClientIDType, offsetof(CThostFtdcTradingCodeField, ClientIDType), sizeof(CThostFtdcTradingCodeField::ClientIDType), FIELD_CHAR},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcTradingCodeField, BranchID), sizeof(CThostFtdcTradingCodeField::BranchID), FIELD_GBK},
+	{"BizType", &KEY_BizType, offsetof(CThostFtdcTradingCodeField, BizType), sizeof(CThostFtdcTradingCodeField::BizType), FIELD_CHAR},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcTradingCodeField, InvestUnitID), sizeof(CThostFtdcTradingCodeField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc InstrumentMarginRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInstrumentMarginRateField, reserve1), sizeof(CThostFtdcInstrumentMarginRateField::reserve1), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcInstrumentMarginRateField, InvestorRange), sizeof(CThostFtdcInstrumentMarginRateField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInstrumentMarginRateField, BrokerID), sizeof(CThostFtdcInstrumentMarginRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInstrumentMarginRateField, InvestorID), sizeof(CThostFtdcInstrumentMarginRateField::InvestorID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInstrumentMarginRateField, HedgeFlag), sizeof(CThostFtdcInstrumentMarginRateField::HedgeFlag), FIELD_CHAR},
+	{"LongMarginRatioByMoney", &KEY_LongMarginRatioByMoney, offsetof(CThostFtdcInstrumentMarginRateField, LongMarginRatioByMoney), sizeof(CThostFtdcInstrumentMarginRateField::LongMarginRatioByMoney), FIELD_DOUBLE},
+	{"LongMarginRatioByVolume", &KEY_LongMarginRatioByVolume, offsetof(CThostFtdcInstrumentMarginRateField, LongMarginRatioByVolume), sizeof(CThostFtdcInstrumentMarginRateField::LongMarginRatioByVolume), FIELD_DOUBLE},
+	{"ShortMarginRatioByMoney", &KEY_ShortMarginRatioByMoney, offsetof(CThostFtdcInstrumentMarginRateField, ShortMarginRatioByMoney), sizeof(CThostFtdcInstrumentMarginRateField::ShortMarginRatioByMoney), FIELD_DOUBLE},
+	{"ShortMarginRatioByVolume", &KEY_ShortMarginRatioByVolume, offsetof(CThostFtdcInstrumentMarginRateField, ShortMarginRatioByVolume), sizeof(CThostFtdcInstrumentMarginRateField::ShortMarginRatioByVolume), FIELD_DOUBLE},
+	{"IsRelative", &KEY_IsRelative, offsetof(CThostFtdcInstrumentMarginRateField, IsRelative), sizeof(CThostFtdcInstrumentMarginRateField::IsRelative), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInstrumentMarginRateField, ExchangeID), sizeof(CThostFtdcInstrumentMarginRateField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInstrumentMarginRateField, InvestUnitID), sizeof(CThostFtdcInstrumentMarginRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInstrumentMarginRateField, InstrumentID), sizeof(CThostFtdcInstrumentMarginRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc InstrumentCommissionRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInstrumentCommissionRateField, reserve1), sizeof(CThostFtdcInstrumentCommissionRateField::reserve1), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcInstrumentCommissionRateField, InvestorRange), sizeof(CThostFtdcInstrumentCommissionRateField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInstrumentCommissionRateField, BrokerID), sizeof(CThostFtdcInstrumentCommissionRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInstrumentCommissionRateField, InvestorID), sizeof(CThostFtdcInstrumentCommissionRateField::InvestorID), FIELD_ASCII},
+	{"OpenRatioByMoney", &KEY_OpenRatioByMoney, offsetof(CThostFtdcInstrumentCommissionRateField, OpenRatioByMoney), sizeof(CThostFtdcInstrumentCommissionRateField::OpenRatioByMoney), FIELD_DOUBLE},
+	{"OpenRatioByVolume", &KEY_OpenRatioByVolume, offsetof(CThostFtdcInstrumentCommissionRateField, OpenRatioByVolume), sizeof(CThostFtdcInstrumentCommissionRateField::OpenRatioByVolume), FIELD_DOUBLE},
+	{"CloseRatioByMoney", &KEY_CloseRatioByMoney, offsetof(CThostFtdcInstrumentCommissionRateField, CloseRatioByMoney), sizeof(CThostFtdcInstrumentCommissionRateField::CloseRatioByMoney), FIELD_DOUBLE},
+	{"CloseRatioByVolume", &KEY_CloseRatioByVolume, offsetof(CThostFtdcInstrumentCommissionRateField, CloseRatioByVolume), sizeof(CThostFtdcInstrumentCommissionRateField::CloseRatioByVolume), FIELD_DOUBLE},
+	{"CloseTodayRatioByMoney", &KEY_CloseTodayRatioByMoney, offsetof(CThostFtdcInstrumentCommissionRateField, CloseTodayRatioByMoney), sizeof(CThostFtdcInstrumentCommissionRateField::CloseTodayRatioByMoney), FIELD_DOUBLE},
+	{"CloseTodayRatioByVolume", &KEY_CloseTodayRatioByVolume, offsetof(CThostFtdcInstrumentCommissionRateField, CloseTodayRatioByVolume), sizeof(CThostFtdcInstrumentCommissionRateField::CloseTodayRatioByVolume), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInstrumentCommissionRateField, ExchangeID), sizeof(CThostFtdcInstrumentCommissionRateField::ExchangeID), FIELD_ASCII},
+	{"BizType", &KEY_BizType, offsetof(CThostFtdcInstrumentCommissionRateField, BizType), sizeof(CThostFtdcInstrumentCommissionRateField::BizType), FIELD_CHAR},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInstrumentCommissionRateField, InvestUnitID), sizeof(CThostFtdcInstrumentCommissionRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInstrumentCommissionRateField, InstrumentID), sizeof(CThostFtdcInstrumentCommissionRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc ExchangeFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcExchangeField, ExchangeID), sizeof(CThostFtdcExchangeField::ExchangeID), FIELD_ASCII},
+	{"ExchangeName", &KEY_ExchangeName, offsetof(CThostFtdcExchangeField, ExchangeName), sizeof(CThostFtdcExchangeField::ExchangeName), FIELD_GBK},
+	{"ExchangeProperty", &KEY_ExchangeProperty, offsetof(CThostFtdcExchangeField, ExchangeProperty), sizeof(CThostFtdcExchangeField::ExchangeProperty), FIELD_CHAR},
+};
+
+static const FieldDesc ProductFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcProductField, reserve1), sizeof(CThostFtdcProductField::reserve1), FIELD_ASCII},
+	{"ProductName", &KEY_ProductName, offsetof(CThostFtdcProductField, ProductName), sizeof(CThostFtdcProductField::ProductName), FIELD_GBK},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcProductField, ExchangeID), sizeof(CThostFtdcProductField::ExchangeID), FIELD_ASCII},
+	{"ProductClass", &KEY_ProductClass, offsetof(CThostFtdcProductField, ProductClass), sizeof(CThostFtdcProductField::ProductClass), FIELD_CHAR},
+	{"VolumeMultiple", &KEY_VolumeMultiple, offsetof(CThostFtdcProductField, VolumeMultiple), sizeof(CThostFtdcProductField::VolumeMultiple), FIELD_INT},
+	{"PriceTick", &KEY_PriceTick, offsetof(CThostFtdcProductField, PriceTick), sizeof(CThostFtdcProductField::PriceTick), FIELD_DOUBLE},
+	{"MaxMarketOrderVolume", &KEY_MaxMarketOrderVolume, offsetof(CThostFtdcProductField, MaxMarketOrderVolume), sizeof(CThostFtdcProductField::MaxMarketOrderVolume), FIELD_INT},
+	{"MinMarketOrderVolume", &KEY_MinMarketOrderVolume, offsetof(CThostFtdcProductField, MinMarketOrderVolume), sizeof(CThostFtdcProductField::MinMarketOrderVolume), FIELD_INT},
+	{"MaxLimitOrderVolume", &KEY_MaxLimitOrderVolume, offsetof(CThostFtdcProductField, MaxLimitOrderVolume), sizeof(CThostFtdcProductField::MaxLimitOrderVolume), FIELD_INT},
+	{"MinLimitOrderVolume", &KEY_MinLimitOrderVolume, offsetof(CThostFtdcProductField, MinLimitOrderVolume), sizeof(CThostFtdcProductField::MinLimitOrderVolume), FIELD_INT},
+	{"PositionType", &KEY_PositionType, offsetof(CThostFtdcProductField, PositionType), sizeof(CThostFtdcProductField::PositionType), FIELD_CHAR},
+	{"PositionDateType", &KEY_PositionDateType, offsetof(CThostFtdcProductField, PositionDateType), sizeof(CThostFtdcProductField::PositionDateType), FIELD_CHAR},
+	{"CloseDealType", &KEY_CloseDealType, offsetof(CThostFtdcProductField, CloseDealType), sizeof(CThostFtdcProductField::CloseDealType), FIELD_CHAR},
+	{"TradeCurrencyID", &KEY_TradeCurrencyID, offsetof(CThostFtdcProductField, TradeCurrencyID), sizeof(CThostFtdcProductField::TradeCurrencyID), FIELD_ASCII},
+	{"MortgageFundUseRange", &KEY_MortgageFundUseRange, offsetof(CThostFtdcProductField, MortgageFundUseRange), sizeof(CThostFtdcProductField::MortgageFundUseRange), FIELD_CHAR},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcProductField, reserve2), sizeof(CThostFtdcProductField::reserve2), FIELD_ASCII},
+	{"UnderlyingMultiple", &KEY_UnderlyingMultiple, offsetof(CThostFtdcProductField, UnderlyingMultiple), sizeof(CThostFtdcProductField::UnderlyingMultiple), FIELD_DOUBLE},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcProductField, ProductID), sizeof(CThostFtdcProductField::ProductID), FIELD_ASCII},
+	{"ExchangeProductID", &KEY_ExchangeProductID, offsetof(CThostFtdcProductField, ExchangeProductID), sizeof(CThostFtdcProductField::ExchangeProductID), FIELD_ASCII},
+	{"OpenLimitControlLevel", &KEY_OpenLimitControlLevel, offsetof(CThostFtdcProductField, OpenLimitControlLevel), sizeof(CThostFtdcProductField::OpenLimitControlLevel), FIELD_CHAR},
+	{"OrderFreqControlLevel", &KEY_OrderFreqControlLevel, offsetof(CThostFtdcProductField, OrderFreqControlLevel), sizeof(CThostFtdcProductField::OrderFreqControlLevel), FIELD_CHAR},
+};
+
+static const FieldDesc InstrumentFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInstrumentField, reserve1), sizeof(CThostFtdcInstrumentField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInstrumentField, ExchangeID), sizeof(CThostFtdcInstrumentField::ExchangeID), FIELD_ASCII},
+	{"InstrumentName", &KEY_InstrumentName, offsetof(CThostFtdcInstrumentField, InstrumentName), sizeof(CThostFtdcInstrumentField::InstrumentName), FIELD_GBK},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInstrumentField, reserve2), sizeof(CThostFtdcInstrumentField::reserve2), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcInstrumentField, reserve3), sizeof(CThostFtdcInstrumentField::reserve3), FIELD_ASCII},
+	{"ProductClass", &KEY_ProductClass, offsetof(CThostFtdcInstrumentField, ProductClass), sizeof(CThostFtdcInstrumentField::ProductClass), FIELD_CHAR},
+	{"DeliveryYear", &KEY_DeliveryYear, offsetof(CThostFtdcInstrumentField, DeliveryYear), sizeof(CThostFtdcInstrumentField::DeliveryYear), FIELD_INT},
+	{"DeliveryMonth", &KEY_DeliveryMonth, offsetof(CThostFtdcInstrumentField, DeliveryMonth), sizeof(CThostFtdcInstrumentField::DeliveryMonth), FIELD_INT},
+	{"MaxMarketOrderVolume", &KEY_MaxMarketOrderVolume, offsetof(CThostFtdcInstrumentField, MaxMarketOrderVolume), sizeof(CThostFtdcInstrumentField::MaxMarketOrderVolume), FIELD_INT},
+	{"MinMarketOrderVolume", &KEY_MinMarketOrderVolume, offsetof(CThostFtdcInstrumentField, MinMarketOrderVolume), sizeof(CThostFtdcInstrumentField::MinMarketOrderVolume), FIELD_INT},
+	{"MaxLimitOrderVolume", &KEY_MaxLimitOrderVolume, offsetof(CThostFtdcInstrumentField, MaxLimitOrderVolume), sizeof(CThostFtdcInstrumentField::MaxLimitOrderVolume), FIELD_INT},
+	{"MinLimitOrderVolume", &KEY_MinLimitOrderVolume, offsetof(CThostFtdcInstrumentField, MinLimitOrderVolume), sizeof(CThostFtdcInstrumentField::MinLimitOrderVolume), FIELD_INT},
+	{"VolumeMultiple", &KEY_VolumeMultiple, offsetof(CThostFtdcInstrumentField, VolumeMultiple), sizeof(CThostFtdcInstrumentField::VolumeMultiple), FIELD_INT},
+	{"PriceTick", &KEY_PriceTick, offsetof(CThostFtdcInstrumentField, PriceTick), sizeof(CThostFtdcInstrumentField::PriceTick), FIELD_DOUBLE},
+	{"CreateDate", &KEY_CreateDate, offsetof(CThostFtdcInstrumentField, CreateDate), sizeof(CThostFtdcInstrumentField::CreateDate), FIELD_ASCII},
+	{"OpenDate", &KEY_OpenDate, offsetof(CThostFtdcInstrumentField, OpenDate), sizeof(CThostFtdcInstrumentField::OpenDate), FIELD_ASCII},
+	{"ExpireDate", &KEY_ExpireDate, offsetof(CThostFtdcInstrumentField, ExpireDate), sizeof(CThostFtdcInstrumentField::ExpireDate), FIELD_ASCII},
+	{"StartDelivDate", &KEY_StartDelivDate, offsetof(CThostFtdcInstrumentField, StartDelivDate), sizeof(CThostFtdcInstrumentField::StartDelivDate), FIELD_ASCII},
+	{"EndDelivDate", &KEY_EndDelivDate, offsetof(CThostFtdcInstrumentField, EndDelivDate), sizeof(CThostFtdcInstrumentField::EndDelivDate), FIELD_ASCII},
+	{"InstLifePhase", &KEY_InstLifePhase, offsetof(CThostFtdcInstrumentField, InstLifePhase), sizeof(CThostFtdcInstrumentField::InstLifePhase), FIELD_CHAR},
+	{"IsTrading", &KEY_IsTrading, offsetof(CThostFtdcInstrumentField, IsTrading), sizeof(CThostFtdcInstrumentField::IsTrading), FIELD_INT},
+	{"PositionType", &KEY_PositionType, offsetof(CThostFtdcInstrumentField, PositionType), sizeof(CThostFtdcInstrumentField::PositionType), FIELD_CHAR},
+	{"PositionDateType", &KEY_PositionDateType, offsetof(CThostFtdcInstrumentField, PositionDateType), sizeof(CThostFtdcInstrumentField::PositionDateType), FIELD_CHAR},
+	{"LongMarginRatio", &KEY_LongMarginRatio, offsetof(CThostFtdcInstrumentField, LongMarginRatio), sizeof(CThostFtdcInstrumentField::LongMarginRatio), FIELD_DOUBLE},
+	{"ShortMarginRatio", &KEY_ShortMarginRatio, offsetof(CThostFtdcInstrumentField, ShortMarginRatio), sizeof(CThostFtdcInstrumentField::ShortMarginRatio), FIELD_DOUBLE},
+	{"MaxMarginSideAlgorithm", &KEY_MaxMarginSideAlgorithm, offsetof(CThostFtdcInstrumentField, MaxMarginSideAlgorithm), sizeof(CThostFtdcInstrumentField::MaxMarginSideAlgorithm), FIELD_CHAR},
+	{"reserve4", &KEY_reserve4, offsetof(CThostFtdcInstrumentField, reserve4), sizeof(CThostFtdcInstrumentField::reserve4), FIELD_ASCII},
+	{"StrikePrice", &KEY_StrikePrice, offsetof(CThostFtdcInstrumentField, StrikePrice), sizeof(CThostFtdcInstrumentField::StrikePrice), FIELD_DOUBLE},
+	{"OptionsType", &KEY_OptionsType, offsetof(CThostFtdcInstrumentField, OptionsType), sizeof(CThostFtdcInstrumentField::OptionsType), FIELD_CHAR},
+	{"UnderlyingMultiple", &KEY_UnderlyingMultiple, offsetof(CThostFtdcInstrumentField, UnderlyingMultiple), sizeof(CThostFtdcInstrumentField::UnderlyingMultiple), FIELD_DOUBLE},
+	{"CombinationType", &KEY_CombinationType, offsetof(CThostFtdcInstrumentField, CombinationType), sizeof(CThostFtdcInstrumentField::CombinationType), FIELD_CHAR},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInstrumentField, InstrumentID), sizeof(CThostFtdcInstrumentField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcInstrumentField, ExchangeInstID), sizeof(CThostFtdcInstrumentField::ExchangeInstID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcInstrumentField, ProductID), sizeof(CThostFtdcInstrumentField::ProductID), FIELD_ASCII},
+	{"UnderlyingInstrID", &KEY_UnderlyingInstrID, offsetof(CThostFtdcInstrumentField, UnderlyingInstrID), sizeof(CThostFtdcInstrumentField::UnderlyingInstrID), FIELD_ASCII},
+};
+
+static const FieldDesc DepthMarketDataFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcDepthMarketDataField, TradingDay), sizeof(CThostFtdcDepthMarketDataField::TradingDay), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcDepthMarketDataField, reserve1), sizeof(CThostFtdcDepthMarketDataField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcDepthMarketDataField, ExchangeID), sizeof(CThostFtdcDepthMarketDataField::ExchangeID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcDepthMarketDataField, reserve2), sizeof(CThostFtdcDepthMarketDataField::reserve2), FIELD_ASCII},
+	{"LastPrice", &KEY_LastPrice, offsetof(CThostFtdcDepthMarketDataField, LastPrice), sizeof(CThostFtdcDepthMarketDataField::LastPrice), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcDepthMarketDataField, PreSettlementPrice), sizeof(CThostFtdcDepthMarketDataField::PreSettlementPrice), FIELD_DOUBLE},
+	{"PreClosePrice", &KEY_PreClosePrice, offsetof(CThostFtdcDepthMarketDataField, PreClosePrice), sizeof(CThostFtdcDepthMarketDataField::PreClosePrice), FIELD_DOUBLE},
+	{"PreOpenInterest", &KEY_PreOpenInterest, offsetof(CThostFtdcDepthMarketDataField, PreOpenInterest), sizeof(CThostFtdcDepthMarketDataField::PreOpenInterest), FIELD_DOUBLE},
+	{"OpenPrice", &KEY_OpenPrice, offsetof(CThostFtdcDepthMarketDataField, OpenPrice), sizeof(CThostFtdcDepthMarketDataField::OpenPrice), FIELD_DOUBLE},
+	{"HighestPrice", &KEY_HighestPrice, offsetof(CThostFtdcDepthMarketDataField, HighestPrice), sizeof(CThostFtdcDepthMarketDataField::HighestPrice), FIELD_DOUBLE},
+	{"LowestPrice", &KEY_LowestPrice, offsetof(CThostFtdcDepthMarketDataField, LowestPrice), sizeof(CThostFtdcDepthMarketDataField::LowestPrice), FIELD_DOUBLE},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcDepthMarketDataField, Volume), sizeof(CThostFtdcDepthMarketDataField::Volume), FIELD_INT},
+	{"Turnover", &KEY_Turnover, offsetof(CThostFtdcDepthMarketDataField, Turnover), sizeof(CThostFtdcDepthMarketDataField::Turnover), FIELD_DOUBLE},
+	{"OpenInterest", &KEY_OpenInterest, offsetof(CThostFtdcDepthMarketDataField, OpenInterest), sizeof(CThostFtdcDepthMarketDataField::OpenInterest), FIELD_DOUBLE},
+	{"ClosePrice", &KEY_ClosePrice, offsetof(CThostFtdcDepthMarketDataField, ClosePrice), sizeof(CThostFtdcDepthMarketDataField::ClosePrice), FIELD_DOUBLE},
+	{"SettlementPrice", &KEY_SettlementPrice, offsetof(CThostFtdcDepthMarketDataField, SettlementPrice), sizeof(CThostFtdcDepthMarketDataField::SettlementPrice), FIELD_DOUBLE},
+	{"UpperLimitPrice", &KEY_UpperLimitPrice, offsetof(CThostFtdcDepthMarketDataField, UpperLimitPrice), sizeof(CThostFtdcDepthMarketDataField::UpperLimitPrice), FIELD_DOUBLE},
+	{"LowerLimitPrice", &KEY_LowerLimitPrice, offsetof(CThostFtdcDepthMarketDataField, LowerLimitPrice), sizeof(CThostFtdcDepthMarketDataField::LowerLimitPrice), FIELD_DOUBLE},
+	{"PreDelta", &KEY_PreDelta, offsetof(CThostFtdcDepthMarketDataField, PreDelta), sizeof(CThostFtdcDepthMarketDataField::PreDelta), FIELD_DOUBLE},
+	{"CurrDelta", &KEY_CurrDelta, offsetof(CThostFtdcDepthMarketDataField, CurrDelta), sizeof(CThostFtdcDepthMarketDataField::CurrDelta), FIELD_DOUBLE},
+	{"UpdateTime", &KEY_UpdateTime, offsetof(CThostFtdcDepthMarketDataField, UpdateTime), sizeof(CThostFtdcDepthMarketDataField::UpdateTime), FIELD_ASCII},
+	{"UpdateMillisec", &KEY_UpdateMillisec, offsetof(CThostFtdcDepthMarketDataField, UpdateMillisec), sizeof(CThostFtdcDepthMarketDataField::UpdateMillisec), FIELD_INT},
+	{"BidPrice1", &KEY_BidPrice1, offsetof(CThostFtdcDepthMarketDataField, BidPrice1), sizeof(CThostFtdcDepthMarketDataField::BidPrice1), FIELD_DOUBLE},
+	{"BidVolume1", &KEY_BidVolume1, offsetof(CThostFtdcDepthMarketDataField, BidVolume1), sizeof(CThostFtdcDepthMarketDataField::BidVolume1), FIELD_INT},
+	{"AskPrice1", &KEY_AskPrice1, offsetof(CThostFtdcDepthMarketDataField, AskPrice1), sizeof(CThostFtdcDepthMarketDataField::AskPrice1), FIELD_DOUBLE},
+	{"AskVolume1", &KEY_AskVolume1, offsetof(CThostFtdcDepthMarketDataField, AskVolume1), sizeof(CThostFtdcDepthMarketDataField::AskVolume1), FIELD_INT},
+	{"BidPrice2", &KEY_BidPrice2, offsetof(CThostFtdcDepthMarketDataField, BidPrice2), sizeof(CThostFtdcDepthMarketDataField::BidPrice2), FIELD_DOUBLE},
+	{"BidVolume2", &KEY_BidVolume2, offsetof(CThostFtdcDepthMarketDataField, BidVolume2), sizeof(CThostFtdcDepthMarketDataField::BidVolume2), FIELD_INT},
+	{"AskPrice2", &KEY_AskPrice2, offsetof(CThostFtdcDepthMarketDataField, AskPrice2), sizeof(CThostFtdcDepthMarketDataField::AskPrice2), FIELD_DOUBLE},
+	{"AskVolume2", &KEY_AskVolume2, offsetof(CThostFtdcDepthMarketDataField, AskVolume2), sizeof(CThostFtdcDepthMarketDataField::AskVolume2), FIELD_INT},
+	{"BidPrice3", &KEY_BidPrice3, offsetof(CThostFtdcDepthMarketDataField, BidPrice3), sizeof(CThostFtdcDepthMarketDataField::BidPrice3), FIELD_DOUBLE},
+	{"BidVolume3", &KEY_BidVolume3, offsetof(CThostFtdcDepthMarketDataField, BidVolume3), sizeof(CThostFtdcDepthMarketDataField::BidVolume3), FIELD_INT},
+	{"AskPrice3", &KEY_AskPrice3, offsetof(CThostFtdcDepthMarketDataField, AskPrice3), sizeof(CThostFtdcDepthMarketDataField::AskPrice3), FIELD_DOUBLE},
+	{"AskVolume3", &KEY_AskVolume3, offsetof(CThostFtdcDepthMarketDataField, AskVolume3), sizeof(CThostFtdcDepthMarketDataField::AskVolume3), FIELD_INT},
+	{"BidPrice4", &KEY_BidPrice4, offsetof(CThostFtdcDepthMarketDataField, BidPrice4), sizeof(CThostFtdcDepthMarketDataField::BidPrice4), FIELD_DOUBLE},
+	{"BidVolume4", &KEY_BidVolume4, offsetof(CThostFtdcDepthMarketDataField, BidVolume4), sizeof(CThostFtdcDepthMarketDataField::BidVolume4), FIELD_INT},
+	{"AskPrice4", &KEY_AskPrice4, offsetof(CThostFtdcDepthMarketDataField, AskPrice4), sizeof(CThostFtdcDepthMarketDataField::AskPrice4), FIELD_DOUBLE},
+	{"AskVolume4", &KEY_AskVolume4, offsetof(CThostFtdcDepthMarketDataField, AskVolume4), sizeof(CThostFtdcDepthMarketDataField::AskVolume4), FIELD_INT},
+	{"BidPrice5", &KEY_BidPrice5, offsetof(CThostFtdcDepthMarketDataField, BidPrice5), sizeof(CThostFtdcDepthMarketDataField::BidPrice5), FIELD_DOUBLE},
+	{"BidVolume5", &KEY_BidVolume5, offsetof(CThostFtdcDepthMarketDataField, BidVolume5), sizeof(CThostFtdcDepthMarketDataField::BidVolume5), FIELD_INT},
+	{"AskPrice5", &KEY_AskPrice5, offsetof(CThostFtdcDepthMarketDataField, AskPrice5), sizeof(CThostFtdcDepthMarketDataField::AskPrice5), FIELD_DOUBLE},
+	{"AskVolume5", &KEY_AskVolume5, offsetof(CThostFtdcDepthMarketDataField, AskVolume5), sizeof(CThostFtdcDepthMarketDataField::AskVolume5), FIELD_INT},
+	{"AveragePrice", &KEY_AveragePrice, offsetof(CThostFtdcDepthMarketDataField, AveragePrice), sizeof(CThostFtdcDepthMarketDataField::AveragePrice), FIELD_DOUBLE},
+	{"ActionDay", &KEY_ActionDay, offsetof(CThostFtdcDepthMarketDataField, ActionDay), sizeof(CThostFtdcDepthMarketDataField::ActionDay), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcDepthMarketDataField, InstrumentID), sizeof(CThostFtdcDepthMarketDataField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcDepthMarketDataField, ExchangeInstID), sizeof(CThostFtdcDepthMarketDataField::ExchangeInstID), FIELD_ASCII},
+	{"BandingUpperPrice", &KEY_BandingUpperPrice, offsetof(CThostFtdcDepthMarketDataField, BandingUpperPrice), sizeof(CThostFtdcDepthMarketDataField::BandingUpperPrice), FIELD_DOUBLE},
+	{"BandingLowerPrice", &KEY_BandingLowerPrice, offsetof(CThostFtdcDepthMarketDataField, BandingLowerPrice), sizeof(CThostFtdcDepthMarketDataField::BandingLowerPrice), FIELD_DOUBLE},
+};
+
+static const FieldDesc TraderOfferFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcTraderOfferField, ExchangeID), sizeof(CThostFtdcTraderOfferField::ExchangeID), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcTraderOfferField, TraderID), sizeof(CThostFtdcTraderOfferField::TraderID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcTraderOfferField, ParticipantID), sizeof(CThostFtdcTraderOfferField::ParticipantID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcTraderOfferField, Password), sizeof(CThostFtdcTraderOfferField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcTraderOfferField, InstallID), sizeof(CThostFtdcTraderOfferField::InstallID), FIELD_INT},
+	{"OrderLocalID", &KEY_OrderLocalID, offsetof(CThostFtdcTraderOfferField, OrderLocalID), sizeof(CThostFtdcTraderOfferField::OrderLocalID), FIELD_ASCII},
+	{"TraderConnectStatus", &KEY_TraderConnectStatus, offsetof(CThostFtdcTraderOfferField, TraderConnectStatus), sizeof(CThostFtdcTraderOfferField::TraderConnectStatus), FIELD_CHAR},
+	{"ConnectRequestDate", &KEY_ConnectRequestDate, offsetof(CThostFtdcTraderOfferField, ConnectRequestDate), sizeof(CThostFtdcTraderOfferField::ConnectRequestDate), FIELD_ASCII},
+	{"ConnectRequestTime", &KEY_ConnectRequestTime, offsetof(CThostFtdcTraderOfferField, ConnectRequestTime), sizeof(CThostFtdcTraderOfferField::ConnectRequestTime), FIELD_ASCII},
+	{"LastReportDate", &KEY_LastReportDate, offsetof(CThostFtdcTraderOfferField, LastReportDate), sizeof(CThostFtdcTraderOfferField::LastReportDate), FIELD_ASCII},
+	{"LastReportTime", &KEY_LastReportTime, offsetof(CThostFtdcTraderOfferField, LastReportTime), sizeof(CThostFtdcTraderOfferField::LastReportTime), FIELD_ASCII},
+	{"ConnectDate", &KEY_ConnectDate, offsetof(CThostFtdcTraderOfferField, ConnectDate), sizeof(CThostFtdcTraderOfferField::ConnectDate), FIELD_ASCII},
+	{"ConnectTime", &KEY_ConnectTime, offsetof(CThostFtdcTraderOfferField, ConnectTime), sizeof(CThostFtdcTraderOfferField::ConnectTime), FIELD_ASCII},
+	{"StartDate", &KEY_StartDate, offsetof(CThostFtdcTraderOfferField, StartDate), sizeof(CThostFtdcTraderOfferField::StartDate), FIELD_ASCII},
+	{"StartTime", &KEY_StartTime, offsetof(CThostFtdcTraderOfferField, StartTime), sizeof(CThostFtdcTraderOfferField::StartTime), FIELD_ASCII},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcTraderOfferField, TradingDay), sizeof(CThostFtdcTraderOfferField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTraderOfferField, BrokerID), sizeof(CThostFtdcTraderOfferField::BrokerID), FIELD_ASCII},
+	{"MaxTradeID", &KEY_MaxTradeID, offsetof(CThostFtdcTraderOfferField, MaxTradeID), sizeof(CThostFtdcTraderOfferField::MaxTradeID), FIELD_ASCII},
+	{"MaxOrderMessageReference", &KEY_MaxOrderMessageReference, offsetof(CThostFtdcTraderOfferField, MaxOrderMessageReference), sizeof(CThostFtdcTraderOfferField::MaxOrderMessageReference), FIELD_GBK},
+	{"OrderCancelAlg", &KEY_OrderCancelAlg, offsetof(CThostFtdcTraderOfferField, OrderCancelAlg), sizeof(CThostFtdcTraderOfferField::OrderCancelAlg), FIELD_CHAR},
+};
+
+static const FieldDesc SettlementInfoFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcSettlementInfoField, TradingDay), sizeof(CThostFtdcSettlementInfoField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcSettlementInfoField, SettlementID), sizeof(CThostFtdcSettlementInfoField::SettlementID), FIELD_INT},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcSettlementInfoField, BrokerID), sizeof(CThostFtdcSettlementInfoField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcSettlementInfoField, InvestorID), sizeof(CThostFtdcSettlementInfoField::InvestorID), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcSettlementInfoField, SequenceNo), sizeof(CThostFtdcSettlementInfoField::SequenceNo), FIELD_INT},
+	{"Content", &KEY_Content, offsetof(CThostFtdcSettlementInfoField, Content), sizeof(CThostFtdcSettlementInfoField::Content), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcSettlementInfoField, AccountID), sizeof(CThostFtdcSettlementInfoField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcSettlementInfoField, CurrencyID), sizeof(CThostFtdcSettlementInfoField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc TransferBankFields[] = {
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcTransferBankField, BankID), sizeof(CThostFtdcTransferBankField::BankID), FIELD_GBK},
+	{"BankBrchID", &KEY_BankBrchID, offsetof(CThostFtdcTransferBankField, BankBrchID), sizeof(CThostFtdcTransferBankField::BankBrchID), FIELD_GBK},
+	{"BankName", &KEY_BankName, offsetof(CThostFtdcTransferBankField, BankName), sizeof(CThostFtdcTransferBankField::BankName), FIELD_GBK},
+	{"IsActive", &KEY_IsActive, offsetof(CThostFtdcTransferBankField, IsActive), sizeof(CThostFtdcTransferBankField::IsActive), FIELD_INT},
+};
+
+static const FieldDesc InvestorPositionDetailFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInvestorPositionDetailField, reserve1), sizeof(CThostFtdcInvestorPositionDetailField::reserve1), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorPositionDetailField, BrokerID), sizeof(CThostFtdcInvestorPositionDetailField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorPositionDetailField, InvestorID), sizeof(CThostFtdcInvestorPositionDetailField::InvestorID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInvestorPositionDetailField, HedgeFlag), sizeof(CThostFtdcInvestorPositionDetailField::HedgeFlag), FIELD_CHAR},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcInvestorPositionDetailField, Direction), sizeof(CThostFtdcInvestorPositionDetailField::Direction), FIELD_CHAR},
+	{"OpenDate", &KEY_OpenDate, offsetof(CThostFtdcInvestorPositionDetailField, OpenDate), sizeof(CThostFtdcInvestorPositionDetailField::OpenDate), FIELD_ASCII},
+	{"TradeID", &KEY_TradeID, offsetof(CThostFtdcInvestorPositionDetailField, TradeID), sizeof(CThostFtdcInvestorPositionDetailField::TradeID), FIELD_ASCII},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcInvestorPositionDetailField, Volume), sizeof(CThostFtdcInvestorPositionDetailField::Volume), FIELD_INT},
+	{"OpenPrice", &KEY_OpenPrice, offsetof(CThostFtdcInvestorPositionDetailField, OpenPrice), sizeof(CThostFtdcInvestorPositionDetailField::OpenPrice), FIELD_DOUBLE},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcInvestorPositionDetailField, TradingDay), sizeof(CThostFtdcInvestorPositionDetailField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcInvestorPositionDetailField, SettlementID), sizeof(CThostFtdcInvestorPositionDetailField::SettlementID), FIELD_INT},
+	{"TradeType", &KEY_TradeType, offsetof(CThostFtdcInvestorPositionDetailField, TradeType), sizeof(CThostFtdcInvestorPositionDetailField::TradeType), FIELD_CHAR},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInvestorPositionDetailField, reserve2), sizeof(CThostFtdcInvestorPositionDetailField::reserve2), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorPositionDetailField, ExchangeID), sizeof(CThostFtdcInvestorPositionDetailField::ExchangeID), FIELD_ASCII},
+	{"CloseProfitByDate", &KEY_CloseProfitByDate, offsetof(CThostFtdcInvestorPositionDetailField, CloseProfitByDate), sizeof(CThostFtdcInvestorPositionDetailField::CloseProfitByDate), FIELD_DOUBLE},
+	{"CloseProfitByTrade", &KEY_CloseProfitByTrade, offsetof(CThostFtdcInvestorPositionDetailField, CloseProfitByTrade), sizeof(CThostFtdcInvestorPositionDetailField::CloseProfitByTrade), FIELD_DOUBLE},
+	{"PositionProfitByDate", &KEY_PositionProfitByDate, offsetof(CThostFtdcInvestorPositionDetailField, PositionProfitByDate), sizeof(CThostFtdcInvestorPositionDetailField::PositionProfitByDate), FIELD_DOUBLE},
+	{"PositionProfitByTrade", &KEY_PositionProfitByTrade, offsetof(CThostFtdcInvestorPositionDetailField, PositionProfitByTrade), sizeof(CThostFtdcInvestorPositionDetailField::PositionProfitByTrade), FIELD_DOUBLE},
+	{"Margin", &KEY_Margin, offsetof(CThostFtdcInvestorPositionDetailField, Margin), sizeof(CThostFtdcInvestorPositionDetailField::Margin), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorPositionDetailField, ExchMargin), sizeof(CThostFtdcInvestorPositionDetailField::ExchMargin), FIELD_DOUBLE},
+	{"MarginRateByMoney", &KEY_MarginRateByMoney, offsetof(CThostFtdcInvestorPositionDetailField, MarginRateByMoney), sizeof(CThostFtdcInvestorPositionDetailField::MarginRateByMoney), FIELD_DOUBLE},
+	{"MarginRateByVolume", &KEY_MarginRateByVolume, offsetof(CThostFtdcInvestorPositionDetailField, MarginRateByVolume), sizeof(CThostFtdcInvestorPositionDetailField::MarginRateByVolume), FIELD_DOUBLE},
+	{"LastSettlementPrice", &KEY_LastSettlementPrice, offsetof(CThostFtdcInvestorPositionDetailField, LastSettlementPrice), sizeof(CThostFtdcInvestorPositionDetailField::LastSettlementPrice), FIELD_DOUBLE},
+	{"SettlementPrice", &KEY_SettlementPrice, offsetof(CThostFtdcInvestorPositionDetailField, SettlementPrice), sizeof(CThostFtdcInvestorPositionDetailField::SettlementPrice), FIELD_DOUBLE},
+	{"CloseVolume", &KEY_CloseVolume, offsetof(CThostFtdcInvestorPositionDetailField, CloseVolume), sizeof(CThostFtdcInvestorPositionDetailField::CloseVolume), FIELD_INT},
+	{"CloseAmount", &KEY_CloseAmount, offsetof(CThostFtdcInvestorPositionDetailField, CloseAmount), sizeof(CThostFtdcInvestorPositionDetailField::CloseAmount), FIELD_DOUBLE},
+	{"TimeFirstVolume", &KEY_TimeFirstVolume, offsetof(CThostFtdcInvestorPositionDetailField, TimeFirstVolume), sizeof(CThostFtdcInvestorPositionDetailField::TimeFirstVolume), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInvestorPositionDetailField, InvestUnitID), sizeof(CThostFtdcInvestorPositionDetailField::InvestUnitID), FIELD_ASCII},
+	{"SpecPosiType", &KEY_SpecPosiType, offsetof(CThostFtdcInvestorPositionDetailField, SpecPosiType), sizeof(CThostFtdcInvestorPositionDetailField::SpecPosiType), FIELD_CHAR},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInvestorPositionDetailField, InstrumentID), sizeof(CThostFtdcInvestorPositionDetailField::InstrumentID), FIELD_ASCII},
+	{"CombInstrumentID", &KEY_CombInstrumentID, offsetof(CThostFtdcInvestorPositionDetailField, CombInstrumentID), sizeof(CThostFtdcInvestorPositionDetailField::CombInstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc NoticeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcNoticeField, BrokerID), sizeof(CThostFtdcNoticeField::BrokerID), FIELD_ASCII},
+	{"Content", &KEY_Content, offsetof(CThostFtdcNoticeField, Content), sizeof(CThostFtdcNoticeField::Content), FIELD_GBK},
+	{"SequenceLabel", &KEY_SequenceLabel, offsetof(CThostFtdcNoticeField, SequenceLabel), sizeof(CThostFtdcNoticeField::SequenceLabel), FIELD_GBK},
+};
+
+static const FieldDesc InvestorPositionCombineDetailFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcInvestorPositionCombineDetailField, TradingDay), sizeof(CThostFtdcInvestorPositionCombineDetailField::TradingDay), FIELD_ASCII},
+	{"OpenDate", &KEY_OpenDate, offsetof(CThostFtdcInvestorPositionCombineDetailField, OpenDate), sizeof(CThostFtdcInvestorPositionCombineDetailField::OpenDate), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorPositionCombineDetailField, ExchangeID), sizeof(CThostFtdcInvestorPositionCombineDetailField::ExchangeID), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcInvestorPositionCombineDetailField, SettlementID), sizeof(CThostFtdcInvestorPositionCombineDetailField::SettlementID), FIELD_INT},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorPositionCombineDetailField, BrokerID), sizeof(CThostFtdcInvestorPositionCombineDetailField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorPositionCombineDetailField, InvestorID), sizeof(CThostFtdcInvestorPositionCombineDetailField::InvestorID), FIELD_ASCII},
+	{"ComTradeID", &KEY_ComTradeID, offsetof(CThostFtdcInvestorPositionCombineDetailField, ComTradeID), sizeof(CThostFtdcInvestorPositionCombineDetailField::ComTradeID), FIELD_ASCII},
+	{"TradeID", &KEY_TradeID, offsetof(CThostFtdcInvestorPositionCombineDetailField, TradeID), sizeof(CThostFtdcInvestorPositionCombineDetailField::TradeID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInvestorPositionCombineDetailField, reserve1), sizeof(CThostFtdcInvestorPositionCombineDetailField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInvestorPositionCombineDetailField, HedgeFlag), sizeof(CThostFtdcInvestorPositionCombineDetailField::HedgeFlag), FIELD_CHAR},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcInvestorPositionCombineDetailField, Direction), sizeof(CThostFtdcInvestorPositionCombineDetailField::Direction), FIELD_CHAR},
+	{"TotalAmt", &KEY_TotalAmt, offsetof(CThostFtdcInvestorPositionCombineDetailField, TotalAmt), sizeof(CThostFtdcInvestorPositionCombineDetailField::TotalAmt), FIELD_INT},
+	{"Margin", &KEY_Margin, offsetof(CThostFtdcInvestorPositionCombineDetailField, Margin), sizeof(CThostFtdcInvestorPositionCombineDetailField::Margin), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorPositionCombineDetailField, ExchMargin), sizeof(CThostFtdcInvestorPositionCombineDetailField::ExchMargin), FIELD_DOUBLE},
+	{"MarginRateByMoney", &KEY_MarginRateByMoney, offsetof(CThostFtdcInvestorPositionCombineDetailField, MarginRateByMoney), sizeof(CThostFtdcInvestorPositionCombineDetailField::MarginRateByMoney), FIELD_DOUBLE},
+	{"MarginRateByVolume", &KEY_MarginRateByVolume, offsetof(CThostFtdcInvestorPositionCombineDetailField, MarginRateByVolume), sizeof(CThostFtdcInvestorPositionCombineDetailField::MarginRateByVolume), FIELD_DOUBLE},
+	{"LegID", &KEY_LegID, offsetof(CThostFtdcInvestorPositionCombineDetailField, LegID), sizeof(CThostFtdcInvestorPositionCombineDetailField::LegID), FIELD_INT},
+	{"LegMultiple", &KEY_LegMultiple, offsetof(CThostFtdcInvestorPositionCombineDetailField, LegMultiple), sizeof(CThostFtdcInvestorPositionCombineDetailField::LegMultiple), FIELD_INT},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInvestorPositionCombineDetailField, reserve2), sizeof(CThostFtdcInvestorPositionCombineDetailField::reserve2), FIELD_ASCII},
+	{"TradeGroupID", &KEY_TradeGroupID, offsetof(CThostFtdcInvestorPositionCombineDetailField, TradeGroupID), sizeof(CThostFtdcInvestorPositionCombineDetailField::TradeGroupID), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInvestorPositionCombineDetailField, InvestUnitID), sizeof(CThostFtdcInvestorPositionCombineDetailField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInvestorPositionCombineDetailField, InstrumentID), sizeof(CThostFtdcInvestorPositionCombineDetailField::InstrumentID), FIELD_ASCII},
+	{"CombInstrumentID", &KEY_CombInstrumentID, offsetof(CThostFtdcInvestorPositionCombineDetailField, CombInstrumentID), sizeof(CThostFtdcInvestorPositionCombineDetailField::CombInstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc CFMMCTradingAccountKeyFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcCFMMCTradingAccountKeyField, BrokerID), sizeof(CThostFtdcCFMMCTradingAccountKeyField::BrokerID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcCFMMCTradingAccountKeyField, ParticipantID), sizeof(CThostFtdcCFMMCTradingAccountKeyField::ParticipantID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcCFMMCTradingAccountKeyField, AccountID), sizeof(CThostFtdcCFMMCTradingAccountKeyField::AccountID), FIELD_ASCII},
+	{"KeyID", &KEY_KeyID, offsetof(CThostFtdcCFMMCTradingAccountKeyField, KeyID), sizeof(CThostFtdcCFMMCTradingAccountKeyField::KeyID), FIELD_INT},
+	{"CurrentKey", &KEY_CurrentKey, offsetof(CThostFtdcCFMMCTradingAccountKeyField, CurrentKey), sizeof(CThostFtdcCFMMCTradingAccountKeyField::CurrentKey), FIELD_GBK},
+};
+
+static const FieldDesc EWarrantOffsetFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcEWarrantOffsetField, TradingDay), sizeof(CThostFtdcEWarrantOffsetField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcEWarrantOffsetField, BrokerID), sizeof(CThostFtdcEWarrantOffsetField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcEWarrantOffsetField, InvestorID), sizeof(CThostFtdcEWarrantOffsetField::InvestorID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcEWarrantOffsetField, ExchangeID), sizeof(CThostFtdcEWarrantOffsetField::ExchangeID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcEWarrantOffsetField, reserve1), sizeof(CThostFtdcEWarrantOffsetField::reserve1), FIELD_ASCII},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcEWarrantOffsetField, Direction), sizeof(CThostFtdcEWarrantOffsetField::Direction), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcEWarrantOffsetField, HedgeFlag), sizeof(CThostFtdcEWarrantOffsetField::HedgeFlag), FIELD_CHAR},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcEWarrantOffsetField, Volume), sizeof(CThostFtdcEWarrantOffsetField::Volume), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcEWarrantOffsetField, InvestUnitID), sizeof(CThostFtdcEWarrantOffsetField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcEWarrantOffsetField, InstrumentID), sizeof(CThostFtdcEWarrantOffsetField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc InvestorProductGroupMarginFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInvestorProductGroupMarginField, reserve1), sizeof(CThostFtdcInvestorProductGroupMarginField::reserve1), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorProductGroupMarginField, BrokerID), sizeof(CThostFtdcInvestorProductGroupMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorProductGroupMarginField, InvestorID), sizeof(CThostFtdcInvestorProductGroupMarginField::InvestorID), FIELD_ASCII},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcInvestorProductGroupMarginField, TradingDay), sizeof(CThostFtdcInvestorProductGroupMarginField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcInvestorProductGroupMarginField, SettlementID), sizeof(CThostFtdcInvestorProductGroupMarginField::SettlementID), FIELD_INT},
+	{"FrozenMargin", &KEY_FrozenMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, FrozenMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::FrozenMargin), FIELD_DOUBLE},
+	{"LongFrozenMargin", &KEY_LongFrozenMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, LongFrozenMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::LongFrozenMargin), FIELD_DOUBLE},
+	{"ShortFrozenMargin", &KEY_ShortFrozenMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, ShortFrozenMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::ShortFrozenMargin), FIELD_DOUBLE},
+	{"UseMargin", &KEY_UseMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, UseMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::UseMargin), FIELD_DOUBLE},
+	{"LongUseMargin", &KEY_LongUseMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, LongUseMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::LongUseMargin), FIELD_DOUBLE},
+	{"ShortUseMargin", &KEY_ShortUseMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, ShortUseMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::ShortUseMargin), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, ExchMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::ExchMargin), FIELD_DOUBLE},
+	{"LongExchMargin", &KEY_LongExchMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, LongExchMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::LongExchMargin), FIELD_DOUBLE},
+	{"ShortExchMargin", &KEY_ShortExchMargin, offsetof(CThostFtdcInvestorProductGroupMarginField, ShortExchMargin), sizeof(CThostFtdcInvestorProductGroupMarginField::ShortExchMargin), FIELD_DOUBLE},
+	{"CloseProfit", &KEY_CloseProfit, offsetof(CThostFtdcInvestorProductGroupMarginField, CloseProfit), sizeof(CThostFtdcInvestorProductGroupMarginField::CloseProfit), FIELD_DOUBLE},
+	{"FrozenCommission", &KEY_FrozenCommission, offsetof(CThostFtdcInvestorProductGroupMarginField, FrozenCommission), sizeof(CThostFtdcInvestorProductGroupMarginField::FrozenCommission), FIELD_DOUBLE},
+	{"Commission", &KEY_Commission, offsetof(CThostFtdcInvestorProductGroupMarginField, Commission), sizeof(CThostFtdcInvestorProductGroupMarginField::Commission), FIELD_DOUBLE},
+	{"FrozenCash", &KEY_FrozenCash, offsetof(CThostFtdcInvestorProductGroupMarginField, FrozenCash), sizeof(CThostFtdcInvestorProductGroupMarginField::FrozenCash), FIELD_DOUBLE},
+	{"CashIn", &KEY_CashIn, offsetof(CThostFtdcInvestorProductGroupMarginField, CashIn), sizeof(CThostFtdcInvestorProductGroupMarginField::CashIn), FIELD_DOUBLE},
+	{"PositionProfit", &KEY_PositionProfit, offsetof(CThostFtdcInvestorProductGroupMarginField, PositionProfit), sizeof(CThostFtdcInvestorProductGroupMarginField::PositionProfit), FIELD_DOUBLE},
+	{"OffsetAmount", &KEY_OffsetAmount, offsetof(CThostFtdcInvestorProductGroupMarginField, OffsetAmount), sizeof(CThostFtdcInvestorProductGroupMarginField::OffsetAmount), FIELD_DOUBLE},
+	{"LongOffsetAmount", &KEY_LongOffsetAmount, offsetof(CThostFtdcInvestorProductGroupMarginField, LongOffsetAmount), sizeof(CThostFtdcInvestorProductGroupMarginField::LongOffsetAmount), FIELD_DOUBLE},
+	{"ShortOffsetAmount", &KEY_ShortOffsetAmount, offsetof(CThostFtdcInvestorProductGroupMarginField, ShortOffsetAmount), sizeof(CThostFtdcInvestorProductGroupMarginField::ShortOffsetAmount), FIELD_DOUBLE},
+	{"ExchOffsetAmount", &KEY_ExchOffsetAmount, offsetof(CThostFtdcInvestorProductGroupMarginField, ExchOffsetAmount), sizeof(CThostFtdcInvestorProductGroupMarginField::ExchOffsetAmount), FIELD_DOUBLE},
+	{"LongExchOffsetAmount", &KEY_LongExchOffsetAmount, offsetof(CThostFtdcInvestorProductGroupMarginField, LongExchOffsetAmount), sizeof(CThostFtdcInvestorProductGroupMarginField::LongExchOffsetAmount), FIELD_DOUBLE},
+	{"ShortExchOffsetAmount", &KEY_ShortExchOffsetAmount, offsetof(CThostFtdcInvestorProductGroupMarginField, ShortExchOffsetAmount), sizeof(CThostFtdcInvestorProductGroupMarginField::ShortExchOffsetAmount), FIELD_DOUBLE},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInvestorProductGroupMarginField, HedgeFlag), sizeof(CThostFtdcInvestorProductGroupMarginField::HedgeFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorProductGroupMarginField, ExchangeID), sizeof(CThostFtdcInvestorProductGroupMarginField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInvestorProductGroupMarginField, InvestUnitID), sizeof(CThostFtdcInvestorProductGroupMarginField::InvestUnitID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcInvestorProductGroupMarginField, ProductGroupID), sizeof(CThostFtdcInvestorProductGroupMarginField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc ExchangeMarginRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcExchangeMarginRateField, BrokerID), sizeof(CThostFtdcExchangeMarginRateField::BrokerID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcExchangeMarginRateField, reserve1), sizeof(CThostFtdcExchangeMarginRateField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcExchangeMarginRateField, HedgeFlag), sizeof(CThostFtdcExchangeMarginRateField::HedgeFlag), FIELD_CHAR},
+	{"LongMarginRatioByMoney", &KEY_LongMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateField, LongMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateField::LongMarginRatioByMoney), FIELD_DOUBLE},
+	{"LongMarginRatioByVolume", &KEY_LongMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateField, LongMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateField::LongMarginRatioByVolume), FIELD_DOUBLE},
+	{"ShortMarginRatioByMoney", &KEY_ShortMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateField, ShortMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateField::ShortMarginRatioByMoney), FIELD_DOUBLE},
+	{"ShortMarginRatioByVolume", &KEY_ShortMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateField, ShortMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateField::ShortMarginRatioByVolume), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcExchangeMarginRateField, ExchangeID), sizeof(CThostFtdcExchangeMarginRateField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcExchangeMarginRateField, InstrumentID), sizeof(CThostFtdcExchangeMarginRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc ExchangeMarginRateAdjustFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcExchangeMarginRateAdjustField, BrokerID), sizeof(CThostFtdcExchangeMarginRateAdjustField::BrokerID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcExchangeMarginRateAdjustField, reserve1), sizeof(CThostFtdcExchangeMarginRateAdjustField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcExchangeMarginRateAdjustField, HedgeFlag), sizeof(CThostFtdcExchangeMarginRateAdjustField::HedgeFlag), FIELD_CHAR},
+	{"LongMarginRatioByMoney", &KEY_LongMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateAdjustField, LongMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateAdjustField::LongMarginRatioByMoney), FIELD_DOUBLE},
+	{"LongMarginRatioByVolume", &KEY_LongMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateAdjustField, LongMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateAdjustField::LongMarginRatioByVolume), FIELD_DOUBLE},
+	{"ShortMarginRatioByMoney", &KEY_ShortMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateAdjustField, ShortMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateAdjustField::ShortMarginRatioByMoney), FIELD_DOUBLE},
+	{"ShortMarginRatioByVolume", &KEY_ShortMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateAdjustField, ShortMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateAdjustField::ShortMarginRatioByVolume), FIELD_DOUBLE},
+	{"ExchLongMarginRatioByMoney", &KEY_ExchLongMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateAdjustField, ExchLongMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateAdjustField::ExchLongMarginRatioByMoney), FIELD_DOUBLE},
+	{"ExchLongMarginRatioByVolume", &KEY_ExchLongMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateAdjustField, ExchLongMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateAdjustField::ExchLongMarginRatioByVolume), FIELD_DOUBLE},
+	{"ExchShortMarginRatioByMoney", &KEY_ExchShortMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateAdjustField, ExchShortMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateAdjustField::ExchShortMarginRatioByMoney), FIELD_DOUBLE},
+	{"ExchShortMarginRatioByVolume", &KEY_ExchShortMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateAdjustField, ExchShortMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateAdjustField::ExchShortMarginRatioByVolume), FIELD_DOUBLE},
+	{"NoLongMarginRatioByMoney", &KEY_NoLongMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateAdjustField, NoLongMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateAdjustField::NoLongMarginRatioByMoney), FIELD_DOUBLE},
+	{"NoLongMarginRatioByVolume", &KEY_NoLongMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateAdjustField, NoLongMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateAdjustField::NoLongMarginRatioByVolume), FIELD_DOUBLE},
+	{"NoShortMarginRatioByMoney", &KEY_NoShortMarginRatioByMoney, offsetof(CThostFtdcExchangeMarginRateAdjustField, NoShortMarginRatioByMoney), sizeof(CThostFtdcExchangeMarginRateAdjustField::NoShortMarginRatioByMoney), FIELD_DOUBLE},
+	{"NoShortMarginRatioByVolume", &KEY_NoShortMarginRatioByVolume, offsetof(CThostFtdcExchangeMarginRateAdjustField, NoShortMarginRatioByVolume), sizeof(CThostFtdcExchangeMarginRateAdjustField::NoShortMarginRatioByVolume), FIELD_DOUBLE},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcExchangeMarginRateAdjustField, InstrumentID), sizeof(CThostFtdcExchangeMarginRateAdjustField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc ExchangeRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcExchangeRateField, BrokerID), sizeof(CThostFtdcExchangeRateField::BrokerID), FIELD_ASCII},
+	{"FromCurrencyID", &KEY_FromCurrencyID, offsetof(CThostFtdcExchangeRateField, FromCurrencyID), sizeof(CThostFtdcExchangeRateField::FromCurrencyID), FIELD_ASCII},
+	{"FromCurrencyUnit", &KEY_FromCurrencyUnit, offsetof(CThostFtdcExchangeRateField, FromCurrencyUnit), sizeof(CThostFtdcExchangeRateField::FromCurrencyUnit), FIELD_DOUBLE},
+	{"ToCurrencyID", &KEY_ToCurrencyID, offsetof(CThostFtdcExchangeRateField, ToCurrencyID), sizeof(CThostFtdcExchangeRateField::ToCurrencyID), FIELD_ASCII},
+	{"ExchangeRate", &KEY_ExchangeRate, offsetof(CThostFtdcExchangeRateField, ExchangeRate), sizeof(CThostFtdcExchangeRateField::ExchangeRate), FIELD_DOUBLE},
+};
+
+static const FieldDesc SecAgentACIDMapFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcSecAgentACIDMapField, BrokerID), sizeof(CThostFtdcSecAgentACIDMapField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcSecAgentACIDMapField, UserID), sizeof(CThostFtdcSecAgentACIDMapField::UserID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcSecAgentACIDMapField, AccountID), sizeof(CThostFtdcSecAgentACIDMapField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcSecAgentACIDMapField, CurrencyID), sizeof(CThostFtdcSecAgentACIDMapField::CurrencyID), FIELD_ASCII},
+	{"BrokerSecAgentID", &KEY_BrokerSecAgentID, offsetof(CThostFtdcSecAgentACIDMapField, BrokerSecAgentID), sizeof(CThostFtdcSecAgentACIDMapField::BrokerSecAgentID), FIELD_ASCII},
+};
+
+static const FieldDesc ProductExchRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcProductExchRateField, reserve1), sizeof(CThostFtdcProductExchRateField::reserve1), FIELD_ASCII},
+	{"QuoteCurrencyID", &KEY_QuoteCurrencyID, offsetof(CThostFtdcProductExchRateField, QuoteCurrencyID), sizeof(CThostFtdcProductExchRateField::QuoteCurrencyID), FIELD_ASCII},
+	{"ExchangeRate", &KEY_ExchangeRate, offsetof(CThostFtdcProductExchRateField, ExchangeRate), sizeof(CThostFtdcProductExchRateField::ExchangeRate), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcProductExchRateField, ExchangeID), sizeof(CThostFtdcProductExchRateField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcProductExchRateField, ProductID), sizeof(CThostFtdcProductExchRateField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc ProductGroupFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcProductGroupField, reserve1), sizeof(CThostFtdcProductGroupField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcProductGroupField, ExchangeID), sizeof(CThostFtdcProductGroupField::ExchangeID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcProductGroupField, reserve2), sizeof(CThostFtdcProductGroupField::reserve2), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcProductGroupField, ProductID), sizeof(CThostFtdcProductGroupField::ProductID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcProductGroupField, ProductGroupID), sizeof(CThostFtdcProductGroupField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc MMInstrumentCommissionRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcMMInstrumentCommissionRateField, reserve1), sizeof(CThostFtdcMMInstrumentCommissionRateField::reserve1), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcMMInstrumentCommissionRateField, InvestorRange), sizeof(CThostFtdcMMInstrumentCommissionRateField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcMMInstrumentCommissionRateField, BrokerID), sizeof(CThostFtdcMMInstrumentCommissionRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcMMInstrumentCommissionRateField, InvestorID), sizeof(CThostFtdcMMInstrumentCommissionRateField::InvestorID), FIELD_ASCII},
+	{"OpenRatioByMoney", &KEY_OpenRatioByMoney, offsetof(CThostFtdcMMInstrumentCommissionRateField, OpenRatioByMoney), sizeof(CThostFtdcMMInstrumentCommissionRateField::OpenRatioByMoney), FIELD_DOUBLE},
+	{"OpenRatioByVolume", &KEY_OpenRatioByVolume, offsetof(CThostFtdcMMInstrumentCommissionRateField, OpenRatioByVolume), sizeof(CThostFtdcMMInstrumentCommissionRateField::OpenRatioByVolume), FIELD_DOUBLE},
+	{"CloseRatioByMoney", &KEY_CloseRatioByMoney, offsetof(CThostFtdcMMInstrumentCommissionRateField, CloseRatioByMoney), sizeof(CThostFtdcMMInstrumentCommissionRateField::CloseRatioByMoney), FIELD_DOUBLE},
+	{"CloseRatioByVolume", &KEY_CloseRatioByVolume, offsetof(CThostFtdcMMInstrumentCommissionRateField, CloseRatioByVolume), sizeof(CThostFtdcMMInstrumentCommissionRateField::CloseRatioByVolume), FIELD_DOUBLE},
+	{"CloseTodayRatioByMoney", &KEY_CloseTodayRatioByMoney, offsetof(CThostFtdcMMInstrumentCommissionRateField, CloseTodayRatioByMoney), sizeof(CThostFtdcMMInstrumentCommissionRateField::CloseTodayRatioByMoney), FIELD_DOUBLE},
+	{"CloseTodayRatioByVolume", &KEY_CloseTodayRatioByVolume, offsetof(CThostFtdcMMInstrumentCommissionRateField, CloseTodayRatioByVolume), sizeof(CThostFtdcMMInstrumentCommissionRateField::CloseTodayRatioByVolume), FIELD_DOUBLE},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcMMInstrumentCommissionRateField, InstrumentID), sizeof(CThostFtdcMMInstrumentCommissionRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc MMOptionInstrCommRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcMMOptionInstrCommRateField, reserve1), sizeof(CThostFtdcMMOptionInstrCommRateField::reserve1), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcMMOptionInstrCommRateField, InvestorRange), sizeof(CThostFtdcMMOptionInstrCommRateField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcMMOptionInstrCommRateField, BrokerID), sizeof(CThostFtdcMMOptionInstrCommRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcMMOptionInstrCommRateField, InvestorID), sizeof(CThostFtdcMMOptionInstrCommRateField::InvestorID), FIELD_ASCII},
+	{"OpenRatioByMoney", &KEY_OpenRatioByMoney, offsetof(CThostFtdcMMOptionInstrCommRateField, OpenRatioByMoney), sizeof(CThostFtdcMMOptionInstrCommRateField::OpenRatioByMoney), FIELD_DOUBLE},
+	{"OpenRatioByVolume", &KEY_OpenRatioByVolume, offsetof(CThostFtdcMMOptionInstrCommRateField, OpenRatioByVolume), sizeof(CThostFtdcMMOptionInstrCommRateField::OpenRatioByVolume), FIELD_DOUBLE},
+	{"CloseRatioByMoney", &KEY_CloseRatioByMoney, offsetof(CThostFtdcMMOptionInstrCommRateField, CloseRatioByMoney), sizeof(CThostFtdcMMOptionInstrCommRateField::CloseRatioByMoney), FIELD_DOUBLE},
+	{"CloseRatioByVolume", &KEY_CloseRatioByVolume, offsetof(CThostFtdcMMOptionInstrCommRateField, CloseRatioByVolume), sizeof(CThostFtdcMMOptionInstrCommRateField::CloseRatioByVolume), FIELD_DOUBLE},
+	{"CloseTodayRatioByMoney", &KEY_CloseTodayRatioByMoney, offsetof(CThostFtdcMMOptionInstrCommRateField, CloseTodayRatioByMoney), sizeof(CThostFtdcMMOptionInstrCommRateField::CloseTodayRatioByMoney), FIELD_DOUBLE},
+	{"CloseTodayRatioByVolume", &KEY_CloseTodayRatioByVolume, offsetof(CThostFtdcMMOptionInstrCommRateField, CloseTodayRatioByVolume), sizeof(CThostFtdcMMOptionInstrCommRateField::CloseTodayRatioByVolume), FIELD_DOUBLE},
+	{"StrikeRatioByMoney", &KEY_StrikeRatioByMoney, offsetof(CThostFtdcMMOptionInstrCommRateField, StrikeRatioByMoney), sizeof(CThostFtdcMMOptionInstrCommRateField::StrikeRatioByMoney), FIELD_DOUBLE},
+	{"StrikeRatioByVolume", &KEY_StrikeRatioByVolume, offsetof(CThostFtdcMMOptionInstrCommRateField, StrikeRatioByVolume), sizeof(CThostFtdcMMOptionInstrCommRateField::StrikeRatioByVolume), FIELD_DOUBLE},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcMMOptionInstrCommRateField, InstrumentID), sizeof(CThostFtdcMMOptionInstrCommRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc InstrumentOrderCommRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInstrumentOrderCommRateField, reserve1), sizeof(CThostFtdcInstrumentOrderCommRateField::reserve1), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcInstrumentOrderCommRateField, InvestorRange), sizeof(CThostFtdcInstrumentOrderCommRateField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInstrumentOrderCommRateField, BrokerID), sizeof(CThostFtdcInstrumentOrderCommRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInstrumentOrderCommRateField, InvestorID), sizeof(CThostFtdcInstrumentOrderCommRateField::InvestorID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInstrumentOrderCommRateField, HedgeFlag), sizeof(CThostFtdcInstrumentOrderCommRateField::HedgeFlag), FIELD_CHAR},
+	{"OrderCommByVolume", &KEY_OrderCommByVolume, offsetof(CThostFtdcInstrumentOrderCommRateField, OrderCommByVolume), sizeof(CThostFtdcInstrumentOrderCommRateField::OrderCommByVolume), FIELD_DOUBLE},
+	{"OrderActionCommByVolume", &KEY_OrderActionCommByVolume, offsetof(CThostFtdcInstrumentOrderCommRateField, OrderActionCommByVolume), sizeof(CThostFtdcInstrumentOrderCommRateField::OrderActionCommByVolume), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInstrumentOrderCommRateField, ExchangeID), sizeof(CThostFtdcInstrumentOrderCommRateField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInstrumentOrderCommRateField, InvestUnitID), sizeof(CThostFtdcInstrumentOrderCommRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInstrumentOrderCommRateField, InstrumentID), sizeof(CThostFtdcInstrumentOrderCommRateField::InstrumentID), FIELD_ASCII},
+	{"OrderCommByTrade", &KEY_OrderCommByTrade, offsetof(CThostFtdcInstrumentOrderCommRateField, OrderCommByTrade), sizeof(CThostFtdcInstrumentOrderCommRateField::OrderCommByTrade), FIELD_DOUBLE},
+	{"OrderActionCommByTrade", &KEY_OrderActionCommByTrade, offsetof(CThostFtdcInstrumentOrderCommRateField, OrderActionCommByTrade), sizeof(CThostFtdcInstrumentOrderCommRateField::OrderActionCommByTrade), FIELD_DOUBLE},
+};
+
+static const FieldDesc SecAgentCheckModeFields[] = {
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcSecAgentCheckModeField, InvestorID), sizeof(CThostFtdcSecAgentCheckModeField::InvestorID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcSecAgentCheckModeField, BrokerID), sizeof(CThostFtdcSecAgentCheckModeField::BrokerID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcSecAgentCheckModeField, CurrencyID), sizeof(CThostFtdcSecAgentCheckModeField::CurrencyID), FIELD_ASCII},
+	{"BrokerSecAgentID", &KEY_BrokerSecAgentID, offsetof(CThostFtdcSecAgentCheckModeField, BrokerSecAgentID), sizeof(CThostFtdcSecAgentCheckModeField::BrokerSecAgentID), FIELD_ASCII},
+	{"CheckSelfAccount", &KEY_CheckSelfAccount, offsetof(CThostFtdcSecAgentCheckModeField, CheckSelfAccount), sizeof(CThostFtdcSecAgentCheckModeField::CheckSelfAccount), FIELD_INT},
+};
+
+static const FieldDesc SecAgentTradeInfoFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcSecAgentTradeInfoField, BrokerID), sizeof(CThostFtdcSecAgentTradeInfoField::BrokerID), FIELD_ASCII},
+	{"BrokerSecAgentID", &KEY_BrokerSecAgentID, offsetof(CThostFtdcSecAgentTradeInfoField, BrokerSecAgentID), sizeof(CThostFtdcSecAgentTradeInfoField::BrokerSecAgentID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcSecAgentTradeInfoField, InvestorID), sizeof(CThostFtdcSecAgentTradeInfoField::InvestorID), FIELD_ASCII},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcSecAgentTradeInfoField, LongCustomerName), sizeof(CThostFtdcSecAgentTradeInfoField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc OptionInstrTradeCostFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOptionInstrTradeCostField, BrokerID), sizeof(CThostFtdcOptionInstrTradeCostField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcOptionInstrTradeCostField, InvestorID), sizeof(CThostFtdcOptionInstrTradeCostField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcOptionInstrTradeCostField, reserve1), sizeof(CThostFtdcOptionInstrTradeCostField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcOptionInstrTradeCostField, HedgeFlag), sizeof(CThostFtdcOptionInstrTradeCostField::HedgeFlag), FIELD_CHAR},
+	{"FixedMargin", &KEY_FixedMargin, offsetof(CThostFtdcOptionInstrTradeCostField, FixedMargin), sizeof(CThostFtdcOptionInstrTradeCostField::FixedMargin), FIELD_DOUBLE},
+	{"MiniMargin", &KEY_MiniMargin, offsetof(CThostFtdcOptionInstrTradeCostField, MiniMargin), sizeof(CThostFtdcOptionInstrTradeCostField::MiniMargin), FIELD_DOUBLE},
+	{"Royalty", &KEY_Royalty, offsetof(CThostFtdcOptionInstrTradeCostField, Royalty), sizeof(CThostFtdcOptionInstrTradeCostField::Royalty), FIELD_DOUBLE},
+	{"ExchFixedMargin", &KEY_ExchFixedMargin, offsetof(CThostFtdcOptionInstrTradeCostField, ExchFixedMargin), sizeof(CThostFtdcOptionInstrTradeCostField::ExchFixedMargin), FIELD_DOUBLE},
+	{"ExchMiniMargin", &KEY_ExchMiniMargin, offsetof(CThostFtdcOptionInstrTradeCostField, ExchMiniMargin), sizeof(CThostFtdcOptionInstrTradeCostField::ExchMiniMargin), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcOptionInstrTradeCostField, ExchangeID), sizeof(CThostFtdcOptionInstrTradeCostField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcOptionInstrTradeCostField, InvestUnitID), sizeof(CThostFtdcOptionInstrTradeCostField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcOptionInstrTradeCostField, InstrumentID), sizeof(CThostFtdcOptionInstrTradeCostField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc OptionInstrCommRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcOptionInstrCommRateField, reserve1), sizeof(CThostFtdcOptionInstrCommRateField::reserve1), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcOptionInstrCommRateField, InvestorRange), sizeof(CThostFtdcOptionInstrCommRateField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOptionInstrCommRateField, BrokerID), sizeof(CThostFtdcOptionInstrCommRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcOptionInstrCommRateField, InvestorID), sizeof(CThostFtdcOptionInstrCommRateField::InvestorID), FIELD_ASCII},
+	{"OpenRatioByMoney", &KEY_OpenRatioByMoney, offsetof(CThostFtdcOptionInstrCommRateField, OpenRatioByMoney), sizeof(CThostFtdcOptionInstrCommRateField::OpenRatioByMoney), FIELD_DOUBLE},
+	{"OpenRatioByVolume", &KEY_OpenRatioByVolume, offsetof(CThostFtdcOptionInstrCommRateField, OpenRatioByVolume), sizeof(CThostFtdcOptionInstrCommRateField::OpenRatioByVolume), FIELD_DOUBLE},
+	{"CloseRatioByMoney", &KEY_CloseRatioByMoney, offsetof(CThostFtdcOptionInstrCommRateField, CloseRatioByMoney), sizeof(CThostFtdcOptionInstrCommRateField::CloseRatioByMoney), FIELD_DOUBLE},
+	{"CloseRatioByVolume", &KEY_CloseRatioByVolume, offsetof(CThostFtdcOptionInstrCommRateField, CloseRatioByVolume), sizeof(CThostFtdcOptionInstrCommRateField::CloseRatioByVolume), FIELD_DOUBLE},
+	{"CloseTodayRatioByMoney", &KEY_CloseTodayRatioByMoney, offsetof(CThostFtdcOptionInstrCommRateField, CloseTodayRatioByMoney), sizeof(CThostFtdcOptionInstrCommRateField::CloseTodayRatioByMoney), FIELD_DOUBLE},
+	{"CloseTodayRatioByVolume", &KEY_CloseTodayRatioByVolume, offsetof(CThostFtdcOptionInstrCommRateField, CloseTodayRatioByVolume), sizeof(CThostFtdcOptionInstrCommRateField::CloseTodayRatioByVolume), FIELD_DOUBLE},
+	{"StrikeRatioByMoney", &KEY_StrikeRatioByMoney, offsetof(CThostFtdcOptionInstrCommRateField, StrikeRatioByMoney), sizeof(CThostFtdcOptionInstrCommRateField::StrikeRatioByMoney), FIELD_DOUBLE},
+	{"StrikeRatioByVolume", &KEY_StrikeRatioByVolume, offsetof(CThostFtdcOptionInstrCommRateField, StrikeRatioByVolume), sizeof(CThostFtdcOptionInstrCommRateField::StrikeRatioByVolume), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcOptionInstrCommRateField, ExchangeID), sizeof(CThostFtdcOptionInstrCommRateField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcOptionInstrCommRateField, InvestUnitID), sizeof(CThostFtdcOptionInstrCommRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcOptionInstrCommRateField, InstrumentID), sizeof(CThostFtdcOptionInstrCommRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc ExecOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcExecOrderField, BrokerID), sizeof(CThostFtdcExecOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcExecOrderField, InvestorID), sizeof(CThostFtdcExecOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcExecOrderField, reserve1), sizeof(CThostFtdcExecOrderField::reserve1), FIELD_ASCII},
+	{"ExecOrderRef", &KEY_ExecOrderRef, offsetof(CThostFtdcExecOrderField, ExecOrderRef), sizeof(CThostFtdcExecOrderField::ExecOrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcExecOrderField, UserID), sizeof(CThostFtdcExecOrderField::UserID), FIELD_ASCII},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcExecOrderField, Volume), sizeof(CThostFtdcExecOrderField::Volume), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcExecOrderField, RequestID), sizeof(CThostFtdcExecOrderField::RequestID), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcExecOrderField, BusinessUnit), sizeof(CThostFtdcExecOrderField::BusinessUnit), FIELD_GBK},
+	{"OffsetFlag", &KEY_OffsetFlag, offsetof(CThostFtdcExecOrderField, OffsetFlag), sizeof(CThostFtdcExecOrderField::OffsetFlag), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcExecOrderField, HedgeFlag), sizeof(CThostFtdcExecOrderField::HedgeFlag), FIELD_CHAR},
+	{"ActionType", &KEY_ActionType, offsetof(CThostFtdcExecOrderField, ActionType), sizeof(CThostFtdcExecOrderField::ActionType), FIELD_CHAR},
+	{"PosiDirection", &KEY_PosiDirection, offsetof(CThostFtdcExecOrderField, PosiDirection), sizeof(CThostFtdcExecOrderField::PosiDirection), FIELD_CHAR},
+	{"ReservePositionFlag", &KEY_ReservePositionFlag, offsetof(CThostFtdcExecOrderField, ReservePositionFlag), sizeof(CThostFtdcExecOrderField::ReservePositionFlag), FIELD_CHAR},
+	{"CloseFlag", &KEY_CloseFlag, offsetof(CThostFtdcExecOrderField, CloseFlag), sizeof(CThostFtdcExecOrderField::CloseFlag), FIELD_CHAR},
+	{"ExecOrderLocalID", &KEY_ExecOrderLocalID, offsetof(CThostFtdcExecOrderField, ExecOrderLocalID), sizeof(CThostFtdcExecOrderField::ExecOrderLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcExecOrderField, ExchangeID), sizeof(CThostFtdcExecOrderField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcExecOrderField, ParticipantID), sizeof(CThostFtdcExecOrderField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcExecOrderField, ClientID), sizeof(CThostFtdcExecOrderField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcExecOrderField, reserve2), sizeof(CThostFtdcExecOrderField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcExecOrderField, TraderID), sizeof(CThostFtdcExecOrderField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcExecOrderField, InstallID), sizeof(CThostFtdcExecOrderField::InstallID), FIELD_INT},
+	{"OrderSubmitStatus", &KEY_OrderSubmitStatus, offsetof(CThostFtdcExecOrderField, OrderSubmitStatus), sizeof(CThostFtdcExecOrderField::OrderSubmitStatus), FIELD_CHAR},
+	{"NotifySequence", &KEY_NotifySequence, offsetof(CThostFtdcExecOrderField, NotifySequence), sizeof(CThostFtdcExecOrderField::NotifySequence), FIELD_INT},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcExecOrderField, TradingDay), sizeof(CThostFtdcExecOrderField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcExecOrderField, SettlementID), sizeof(CThostFtdcExecOrderField::SettlementID), FIELD_INT},
+	{"ExecOrderSysID", &KEY_ExecOrderSysID, offsetof(CThostFtdcExecOrderField, ExecOrderSysID), sizeof(CThostFtdcExecOrderField::ExecOrderSysID), FIELD_ASCII},
+	{"InsertDate", &KEY_InsertDate, offsetof(CThostFtdcExecOrderField, InsertDate), sizeof(CThostFtdcExecOrderField::InsertDate), FIELD_ASCII},
+	{"InsertTime", &KEY_InsertTime, offsetof(CThostFtdcExecOrderField, InsertTime), sizeof(CThostFtdcExecOrderField::InsertTime), FIELD_ASCII},
+	{"CancelTime", &KEY_CancelTime, offsetof(CThostFtdcExecOrderField, CancelTime), sizeof(CThostFtdcExecOrderField::CancelTime), FIELD_ASCII},
+	{"ExecResult", &KEY_ExecResult, offsetof(CThostFtdcExecOrderField, ExecResult), sizeof(CThostFtdcExecOrderField::ExecResult), FIELD_CHAR},
+	{"ClearingPartID", &KEY_ClearingPartID, offsetof(CThostFtdcExecOrderField, ClearingPartID), sizeof(CThostFtdcExecOrderField::ClearingPartID), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcExecOrderField, SequenceNo), sizeof(CThostFtdcExecOrderField::SequenceNo), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcExecOrderField, FrontID), sizeof(CThostFtdcExecOrderField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcExecOrderField, SessionID), sizeof(CThostFtdcExecOrderField::SessionID), FIELD_INT},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcExecOrderField, UserProductInfo), sizeof(CThostFtdcExecOrderField::UserProductInfo), FIELD_GBK},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcExecOrderField, StatusMsg), sizeof(CThostFtdcExecOrderField::StatusMsg), FIELD_GBK},
+	{"ActiveUserID", &KEY_ActiveUserID, offsetof(CThostFtdcExecOrderField, ActiveUserID), sizeof(CThostFtdcExecOrderField::ActiveUserID), FIELD_ASCII},
+	{"BrokerExecOrderSeq", &KEY_BrokerExecOrderSeq, offsetof(CThostFtdcExecOrderField, BrokerExecOrderSeq), sizeof(CThostFtdcExecOrderField::BrokerExecOrderSeq), FIELD_INT},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcExecOrderField, BranchID), sizeof(CThostFtdcExecOrderField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcExecOrderField, InvestUnitID), sizeof(CThostFtdcExecOrderField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcExecOrderField, AccountID), sizeof(CThostFtdcExecOrderField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcExecOrderField, CurrencyID), sizeof(CThostFtdcExecOrderField::CurrencyID), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcExecOrderField, reserve3), sizeof(CThostFtdcExecOrderField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcExecOrderField, MacAddress), sizeof(CThostFtdcExecOrderField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcExecOrderField, InstrumentID), sizeof(CThostFtdcExecOrderField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcExecOrderField, ExchangeInstID), sizeof(CThostFtdcExecOrderField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcExecOrderField, IPAddress), sizeof(CThostFtdcExecOrderField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ForQuoteFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcForQuoteField, BrokerID), sizeof(CThostFtdcForQuoteField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcForQuoteField, InvestorID), sizeof(CThostFtdcForQuoteField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcForQuoteField, reserve1), sizeof(CThostFtdcForQuoteField::reserve1), FIELD_ASCII},
+	{"ForQuoteRef", &KEY_ForQuoteRef, offsetof(CThostFtdcForQuoteField, ForQuoteRef), sizeof(CThostFtdcForQuoteField::ForQuoteRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcForQuoteField, UserID), sizeof(CThostFtdcForQuoteField::UserID), FIELD_ASCII},
+	{"ForQuoteLocalID", &KEY_ForQuoteLocalID, offsetof(CThostFtdcForQuoteField, ForQuoteLocalID), sizeof(CThostFtdcForQuoteField::ForQuoteLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcForQuoteField, ExchangeID), sizeof(CThostFtdcForQuoteField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcForQuoteField, ParticipantID), sizeof(CThostFtdcForQuoteField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcForQuoteField, ClientID), sizeof(CThostFtdcForQuoteField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcForQuoteField, reserve2), sizeof(CThostFtdcForQuoteField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcForQuoteField, TraderID), sizeof(CThostFtdcForQuoteField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcForQuoteField, InstallID), sizeof(CThostFtdcForQuoteField::InstallID), FIELD_INT},
+	{"InsertDate", &KEY_InsertDate, offsetof(CThostFtdcForQuoteField, InsertDate), sizeof(CThostFtdcForQuoteField::InsertDate), FIELD_ASCII},
+	{"InsertTime", &KEY_InsertTime, offsetof(CThostFtdcForQuoteField, InsertTime), sizeof(CThostFtdcForQuoteField::InsertTime), FIELD_ASCII},
+	{"ForQuoteStatus", &KEY_ForQuoteStatus, offsetof(CThostFtdcForQuoteField, ForQuoteStatus), sizeof(CThostFtdcForQuoteField::ForQuoteStatus), FIELD_CHAR},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcForQuoteField, FrontID), sizeof(CThostFtdcForQuoteField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcForQuoteField, SessionID), sizeof(CThostFtdcForQuoteField::SessionID), FIELD_INT},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcForQuoteField, StatusMsg), sizeof(CThostFtdcForQuoteField::StatusMsg), FIELD_GBK},
+	{"ActiveUserID", &KEY_ActiveUserID, offsetof(CThostFtdcForQuoteField, ActiveUserID), sizeof(CThostFtdcForQuoteField::ActiveUserID), FIELD_ASCII},
+	{"BrokerForQutoSeq", &KEY_BrokerForQutoSeq, offsetof(CThostFtdcForQuoteField, BrokerForQutoSeq), sizeof(CThostFtdcForQuoteField::BrokerForQutoSeq), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcForQuoteField, InvestUnitID), sizeof(CThostFtdcForQuoteField::InvestUnitID), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcForQuoteField, reserve3), sizeof(CThostFtdcForQuoteField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcForQuoteField, MacAddress), sizeof(CThostFtdcForQuoteField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcForQuoteField, InstrumentID), sizeof(CThostFtdcForQuoteField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcForQuoteField, ExchangeInstID), sizeof(CThostFtdcForQuoteField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcForQuoteField, IPAddress), sizeof(CThostFtdcForQuoteField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc QuoteFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQuoteField, BrokerID), sizeof(CThostFtdcQuoteField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQuoteField, InvestorID), sizeof(CThostFtdcQuoteField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQuoteField, reserve1), sizeof(CThostFtdcQuoteField::reserve1), FIELD_ASCII},
+	{"QuoteRef", &KEY_QuoteRef, offsetof(CThostFtdcQuoteField, QuoteRef), sizeof(CThostFtdcQuoteField::QuoteRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcQuoteField, UserID), sizeof(CThostFtdcQuoteField::UserID), FIELD_ASCII},
+	{"AskPrice", &KEY_AskPrice, offsetof(CThostFtdcQuoteField, AskPrice), sizeof(CThostFtdcQuoteField::AskPrice), FIELD_DOUBLE},
+	{"BidPrice", &KEY_BidPrice, offsetof(CThostFtdcQuoteField, BidPrice), sizeof(CThostFtdcQuoteField::BidPrice), FIELD_DOUBLE},
+	{"AskVolume", &KEY_AskVolume, offsetof(CThostFtdcQuoteField, AskVolume), sizeof(CThostFtdcQuoteField::AskVolume), FIELD_INT},
+	{"BidVolume", &KEY_BidVolume, offsetof(CThostFtdcQuoteField, BidVolume), sizeof(CThostFtdcQuoteField::BidVolume), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcQuoteField, RequestID), sizeof(CThostFtdcQuoteField::RequestID), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcQuoteField, BusinessUnit), sizeof(CThostFtdcQuoteField::BusinessUnit), FIELD_GBK},
+	{"AskOffsetFlag", &KEY_AskOffsetFlag, offsetof(CThostFtdcQuoteField, AskOffsetFlag), sizeof(CThostFtdcQuoteField::AskOffsetFlag), FIELD_CHAR},
+	{"BidOffsetFlag", &KEY_BidOffsetFlag, offsetof(CThostFtdcQuoteField, BidOffsetFlag), sizeof(CThostFtdcQuoteField::BidOffsetFlag), FIELD_CHAR},
+	{"AskHedgeFlag", &KEY_AskHedgeFlag, offsetof(CThostFtdcQuoteField, AskHedgeFlag), sizeof(CThostFtdcQuoteField::AskHedgeFlag), FIELD_CHAR},
+	{"BidHedgeFlag", &KEY_BidHedgeFlag, offsetof(CThostFtdcQuoteField, BidHedgeFlag), sizeof(CThostFtdcQuoteField::BidHedgeFlag), FIELD_CHAR},
+	{"QuoteLocalID", &KEY_QuoteLocalID, offsetof(CThostFtdcQuoteField, QuoteLocalID), sizeof(CThostFtdcQuoteField::QuoteLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQuoteField, ExchangeID), sizeof(CThostFtdcQuoteField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcQuoteField, ParticipantID), sizeof(CThostFtdcQuoteField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcQuoteField, ClientID), sizeof(CThostFtdcQuoteField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcQuoteField, reserve2), sizeof(CThostFtdcQuoteField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcQuoteField, TraderID), sizeof(CThostFtdcQuoteField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcQuoteField, InstallID), sizeof(CThostFtdcQuoteField::InstallID), FIELD_INT},
+	{"NotifySequence", &KEY_NotifySequence, offsetof(CThostFtdcQuoteField, NotifySequence), sizeof(CThostFtdcQuoteField::NotifySequence), FIELD_INT},
+	{"OrderSubmitStatus", &KEY_OrderSubmitStatus, offsetof(CThostFtdcQuoteField, OrderSubmitStatus), sizeof(CThostFtdcQuoteField::OrderSubmitStatus), FIELD_CHAR},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcQuoteField, TradingDay), sizeof(CThostFtdcQuoteField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcQuoteField, SettlementID), sizeof(CThostFtdcQuoteField::SettlementID), FIELD_INT},
+	{"QuoteSysID", &KEY_QuoteSysID, offsetof(CThostFtdcQuoteField, QuoteSysID), sizeof(CThostFtdcQuoteField::QuoteSysID), FIELD_ASCII},
+	{"InsertDate", &KEY_InsertDate, offsetof(CThostFtdcQuoteField, InsertDate), sizeof(CThostFtdcQuoteField::InsertDate), FIELD_ASCII},
+	{"InsertTime", &KEY_InsertTime, offsetof(CThostFtdcQuoteField, InsertTime), sizeof(CThostFtdcQuoteField::InsertTime), FIELD_ASCII},
+	{"CancelTime", &KEY_CancelTime, offsetof(CThostFtdcQuoteField, CancelTime), sizeof(CThostFtdcQuoteField::CancelTime), FIELD_ASCII},
+	{"QuoteStatus", &KEY_QuoteStatus, offsetof(CThostFtdcQuoteField, QuoteStatus), sizeof(CThostFtdcQuoteField::QuoteStatus), FIELD_CHAR},
+	{"ClearingPartID", &KEY_ClearingPartID, offsetof(CThostFtdcQuoteField, ClearingPartID), sizeof(CThostFtdcQuoteField::ClearingPartID), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcQuoteField, SequenceNo), sizeof(CThostFtdcQuoteField::SequenceNo), FIELD_INT},
+	{"AskOrderSysID", &KEY_AskOrderSysID, offsetof(CThostFtdcQuoteField, AskOrderSysID), sizeof(CThostFtdcQuoteField::AskOrderSysID), FIELD_ASCII},
+	{"BidOrderSysID", &KEY_BidOrderSysID, offsetof(CThostFtdcQuoteField, BidOrderSysID), sizeof(CThostFtdcQuoteField::BidOrderSysID), FIELD_ASCII},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcQuoteField, FrontID), sizeof(CThostFtdcQuoteField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcQuoteField, SessionID), sizeof(CThostFtdcQuoteField::SessionID), FIELD_INT},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcQuoteField, UserProductInfo), sizeof(CThostFtdcQuoteField::UserProductInfo), FIELD_GBK},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcQuoteField, StatusMsg), sizeof(CThostFtdcQuoteField::StatusMsg), FIELD_GBK},
+	{"ActiveUserID", &KEY_ActiveUserID, offsetof(CThostFtdcQuoteField, ActiveUserID), sizeof(CThostFtdcQuoteField::ActiveUserID), FIELD_ASCII},
+	{"BrokerQuoteSeq", &KEY_BrokerQuoteSeq, offsetof(CThostFtdcQuoteField, BrokerQuoteSeq), sizeof(CThostFtdcQuoteField::BrokerQuoteSeq), FIELD_INT},
+	{"AskOrderRef", &KEY_AskOrderRef, offsetof(CThostFtdcQuoteField, AskOrderRef), sizeof(CThostFtdcQuoteField::AskOrderRef), FIELD_ASCII},
+	{"BidOrderRef", &KEY_BidOrderRef, offsetof(CThostFtdcQuoteField, BidOrderRef), sizeof(CThostFtdcQuoteField::BidOrderRef), FIELD_ASCII},
+	{"ForQuoteSysID", &KEY_ForQuoteSysID, offsetof(CThostFtdcQuoteField, ForQuoteSysID), sizeof(CThostFtdcQuoteField::ForQuoteSysID), FIELD_ASCII},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcQuoteField, BranchID), sizeof(CThostFtdcQuoteField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQuoteField, InvestUnitID), sizeof(CThostFtdcQuoteField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQuoteField, AccountID), sizeof(CThostFtdcQuoteField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQuoteField, CurrencyID), sizeof(CThostFtdcQuoteField::CurrencyID), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcQuoteField, reserve3), sizeof(CThostFtdcQuoteField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcQuoteField, MacAddress), sizeof(CThostFtdcQuoteField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQuoteField, InstrumentID), sizeof(CThostFtdcQuoteField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcQuoteField, ExchangeInstID), sizeof(CThostFtdcQuoteField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcQuoteField, IPAddress), sizeof(CThostFtdcQuoteField::IPAddress), FIELD_ASCII},
+	{"ReplaceSysID", &KEY_ReplaceSysID, offsetof(CThostFtdcQuoteField, ReplaceSysID), sizeof(CThostFtdcQuoteField::ReplaceSysID), FIELD_ASCII},
+	{"TimeCondition", &KEY_TimeCondition, offsetof(CThostFtdcQuoteField, TimeCondition), sizeof(CThostFtdcQuoteField::TimeCondition), FIELD_CHAR},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcQuoteField, OrderMemo), sizeof(CThostFtdcQuoteField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcQuoteField, SessionReqSeq), sizeof(CThostFtdcQuoteField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc OptionSelfCloseFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOptionSelfCloseField, BrokerID), sizeof(CThostFtdcOptionSelfCloseField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcOptionSelfCloseField, InvestorID), sizeof(CThostFtdcOptionSelfCloseField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcOptionSelfCloseField, reserve1), sizeof(CThostFtdcOptionSelfCloseField::reserve1), FIELD_ASCII},
+	{"OptionSelfCloseRef", &KEY_OptionSelfCloseRef, offsetof(CThostFtdcOptionSelfCloseField, OptionSelfCloseRef), sizeof(CThostFtdcOptionSelfCloseField::OptionSelfCloseRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcOptionSelfCloseField, UserID), sizeof(CThostFtdcOptionSelfCloseField::UserID), FIELD_ASCII},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcOptionSelfCloseField, Volume), sizeof(CThostFtdcOptionSelfCloseField::Volume), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcOptionSelfCloseField, RequestID), sizeof(CThostFtdcOptionSelfCloseField::RequestID), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcOptionSelfCloseField, BusinessUnit), sizeof(CThostFtdcOptionSelfCloseField::BusinessUnit), FIELD_GBK},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcOptionSelfCloseField, HedgeFlag), sizeof(CThostFtdcOptionSelfCloseField::HedgeFlag), FIELD_CHAR},
+	{"OptSelfCloseFlag", &KEY_OptSelfCloseFlag, offsetof(CThostFtdcOptionSelfCloseField, OptSelfCloseFlag), sizeof(CThostFtdcOptionSelfCloseField::OptSelfCloseFlag), FIELD_CHAR},
+	{"OptionSelfCloseLocalID", &KEY_OptionSelfCloseLocalID, offsetof(CThostFtdcOptionSelfCloseField, OptionSelfCloseLocalID), sizeof(CThostFtdcOptionSelfCloseField::OptionSelfCloseLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcOptionSelfCloseField, ExchangeID), sizeof(CThostFtdcOptionSelfCloseField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcOptionSelfCloseField, ParticipantID), sizeof(CThostFtdcOptionSelfCloseField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcOptionSelfCloseField, ClientID), sizeof(CThostFtdcOptionSelfCloseField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcOptionSelfCloseField, reserve2), sizeof(CThostFtdcOptionSelfCloseField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcOptionSelfCloseField, TraderID), sizeof(CThostFtdcOptionSelfCloseField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcOptionSelfCloseField, InstallID), sizeof(CThostFtdcOptionSelfCloseField::InstallID), FIELD_INT},
+	{"OrderSubmitStatus", &KEY_OrderSubmitStatus, offsetof(CThostFtdcOptionSelfCloseField, OrderSubmitStatus), sizeof(CThostFtdcOptionSelfCloseField::OrderSubmitStatus), FIELD_CHAR},
+	{"NotifySequence", &KEY_NotifySequence, offsetof(CThostFtdcOptionSelfCloseField, NotifySequence), sizeof(CThostFtdcOptionSelfCloseField::NotifySequence), FIELD_INT},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcOptionSelfCloseField, TradingDay), sizeof(CThostFtdcOptionSelfCloseField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcOptionSelfCloseField, SettlementID), sizeof(CThostFtdcOptionSelfCloseField::SettlementID), FIELD_INT},
+	{"OptionSelfCloseSysID", &KEY_OptionSelfCloseSysID, offsetof(CThostFtdcOptionSelfCloseField, OptionSelfCloseSysID), sizeof(CThostFtdcOptionSelfCloseField::OptionSelfCloseSysID), FIELD_ASCII},
+	{"InsertDate", &KEY_InsertDate, offsetof(CThostFtdcOptionSelfCloseField, InsertDate), sizeof(CThostFtdcOptionSelfCloseField::InsertDate), FIELD_ASCII},
+	{"InsertTime", &KEY_InsertTime, offsetof(CThostFtdcOptionSelfCloseField, InsertTime), sizeof(CThostFtdcOptionSelfCloseField::InsertTime), FIELD_ASCII},
+	{"CancelTime", &KEY_CancelTime, offsetof(CThostFtdcOptionSelfCloseField, CancelTime), sizeof(CThostFtdcOptionSelfCloseField::CancelTime), FIELD_ASCII},
+	{"ExecResult", &KEY_ExecResult, offsetof(CThostFtdcOptionSelfCloseField, ExecResult), sizeof(CThostFtdcOptionSelfCloseField::ExecResult), FIELD_CHAR},
+	{"ClearingPartID", &KEY_ClearingPartID, offsetof(CThostFtdcOptionSelfCloseField, ClearingPartID), sizeof(CThostFtdcOptionSelfCloseField::ClearingPartID), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcOptionSelfCloseField, SequenceNo), sizeof(CThostFtdcOptionSelfCloseField::SequenceNo), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcOptionSelfCloseField, FrontID), sizeof(CThostFtdcOptionSelfCloseField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcOptionSelfCloseField, SessionID), sizeof(CThostFtdcOptionSelfCloseField::SessionID), FIELD_INT},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcOptionSelfCloseField, UserProductInfo), sizeof(CThostFtdcOptionSelfCloseField::UserProductInfo), FIELD_GBK},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcOptionSelfCloseField, StatusMsg), sizeof(CThostFtdcOptionSelfCloseField::StatusMsg), FIELD_GBK},
+	{"ActiveUserID", &KEY_ActiveUserID, offsetof(CThostFtdcOptionSelfCloseField, ActiveUserID), sizeof(CThostFtdcOptionSelfCloseField::ActiveUserID), FIELD_ASCII},
+	{"BrokerOptionSelfCloseSeq", &KEY_BrokerOptionSelfCloseSeq, offsetof(CThostFtdcOptionSelfCloseField, BrokerOptionSelfCloseSeq), sizeof(CThostFtdcOptionSelfCloseField::BrokerOptionSelfCloseSeq), FIELD_INT},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcOptionSelfCloseField, BranchID), sizeof(CThostFtdcOptionSelfCloseField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcOptionSelfCloseField, InvestUnitID), sizeof(CThostFtdcOptionSelfCloseField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcOptionSelfCloseField, AccountID), sizeof(CThostFtdcOptionSelfCloseField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcOptionSelfCloseField, CurrencyID), sizeof(CThostFtdcOptionSelfCloseField::CurrencyID), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcOptionSelfCloseField, reserve3), sizeof(CThostFtdcOptionSelfCloseField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcOptionSelfCloseField, MacAddress), sizeof(CThostFtdcOptionSelfCloseField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcOptionSelfCloseField, InstrumentID), sizeof(CThostFtdcOptionSelfCloseField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcOptionSelfCloseField, ExchangeInstID), sizeof(CThostFtdcOptionSelfCloseField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcOptionSelfCloseField, IPAddress), sizeof(CThostFtdcOptionSelfCloseField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc InvestUnitFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestUnitField, BrokerID), sizeof(CThostFtdcInvestUnitField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestUnitField, InvestorID), sizeof(CThostFtdcInvestUnitField::InvestorID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcInvestUnitField, InvestUnitID), sizeof(CThostFtdcInvestUnitField::InvestUnitID), FIELD_ASCII},
+	{"InvestorUnitName", &KEY_InvestorUnitName, offsetof(CThostFtdcInvestUnitField, InvestorUnitName), sizeof(CThostFtdcInvestUnitField::InvestorUnitName), FIELD_GBK},
+	{"InvestorGroupID", &KEY_InvestorGroupID, offsetof(CThostFtdcInvestUnitField, InvestorGroupID), sizeof(CThostFtdcInvestUnitField::InvestorGroupID), FIELD_ASCII},
+	{"CommModelID", &KEY_CommModelID, offsetof(CThostFtdcInvestUnitField, CommModelID), sizeof(CThostFtdcInvestUnitField::CommModelID), FIELD_ASCII},
+	{"MarginModelID", &KEY_MarginModelID, offsetof(CThostFtdcInvestUnitField, MarginModelID), sizeof(CThostFtdcInvestUnitField::MarginModelID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcInvestUnitField, AccountID), sizeof(CThostFtdcInvestUnitField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcInvestUnitField, CurrencyID), sizeof(CThostFtdcInvestUnitField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc CombInstrumentGuardFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcCombInstrumentGuardField, BrokerID), sizeof(CThostFtdcCombInstrumentGuardField::BrokerID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcCombInstrumentGuardField, reserve1), sizeof(CThostFtdcCombInstrumentGuardField::reserve1), FIELD_ASCII},
+	{"GuarantRatio", &KEY_GuarantRatio, offsetof(CThostFtdcCombInstrumentGuardField, GuarantRatio), sizeof(CThostFtdcCombInstrumentGuardField::GuarantRatio), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcCombInstrumentGuardField, ExchangeID), sizeof(CThostFtdcCombInstrumentGuardField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcCombInstrumentGuardField, InstrumentID), sizeof(CThostFtdcCombInstrumentGuardField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc CombActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcCombActionField, BrokerID), sizeof(CThostFtdcCombActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcCombActionField, InvestorID), sizeof(CThostFtdcCombActionField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcCombActionField, reserve1), sizeof(CThostFtdcCombActionField::reserve1), FIELD_ASCII},
+	{"CombActionRef", &KEY_CombActionRef, offsetof(CThostFtdcCombActionField, CombActionRef), sizeof(CThostFtdcCombActionField::CombActionRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcCombActionField, UserID), sizeof(CThostFtdcCombActionField::UserID), FIELD_ASCII},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcCombActionField, Direction), sizeof(CThostFtdcCombActionField::Direction), FIELD_CHAR},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcCombActionField, Volume), sizeof(CThostFtdcCombActionField::Volume), FIELD_INT},
+	{"CombDirection", &KEY_CombDirection, offsetof(CThostFtdcCombActionField, CombDirection), sizeof(CThostFtdcCombActionField::CombDirection), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcCombActionField, HedgeFlag), sizeof(CThostFtdcCombActionField::HedgeFlag), FIELD_CHAR},
+	{"ActionLocalID", &KEY_ActionLocalID, offsetof(CThostFtdcCombActionField, ActionLocalID), sizeof(CThostFtdcCombActionField::ActionLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcCombActionField, ExchangeID), sizeof(CThostFtdcCombActionField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcCombActionField, ParticipantID), sizeof(CThostFtdcCombActionField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcCombActionField, ClientID), sizeof(CThostFtdcCombActionField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcCombActionField, reserve2), sizeof(CThostFtdcCombActionField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcCombActionField, TraderID), sizeof(CThostFtdcCombActionField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcCombActionField, InstallID), sizeof(CThostFtdcCombActionField::InstallID), FIELD_INT},
+	{"ActionStatus", &KEY_ActionStatus, offsetof(CThostFtdcCombActionField, ActionStatus), sizeof(CThostFtdcCombActionField::ActionStatus), FIELD_CHAR},
+	{"NotifySequence", &KEY_NotifySequence, offsetof(CThostFtdcCombActionField, NotifySequence), sizeof(CThostFtdcCombActionField::NotifySequence), FIELD_INT},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcCombActionField, TradingDay), sizeof(CThostFtdcCombActionField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcCombActionField, SettlementID), sizeof(CThostFtdcCombActionField::SettlementID), FIELD_INT},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcCombActionField, SequenceNo), sizeof(CThostFtdcCombActionField::SequenceNo), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcCombActionField, FrontID), sizeof(CThostFtdcCombActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcCombActionField, SessionID), sizeof(CThostFtdcCombActionField::SessionID), FIELD_INT},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcCombActionField, UserProductInfo), sizeof(CThostFtdcCombActionField::UserProductInfo), FIELD_GBK},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcCombActionField, StatusMsg), sizeof(CThostFtdcCombActionField::StatusMsg), FIELD_GBK},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcCombActionField, reserve3), sizeof(CThostFtdcCombActionField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcCombActionField, MacAddress), sizeof(CThostFtdcCombActionField::MacAddress), FIELD_ASCII},
+	{"ComTradeID", &KEY_ComTradeID, offsetof(CThostFtdcCombActionField, ComTradeID), sizeof(CThostFtdcCombActionField::ComTradeID), FIELD_ASCII},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcCombActionField, BranchID), sizeof(CThostFtdcCombActionField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcCombActionField, InvestUnitID), sizeof(CThostFtdcCombActionField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcCombActionField, InstrumentID), sizeof(CThostFtdcCombActionField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcCombActionField, ExchangeInstID), sizeof(CThostFtdcCombActionField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcCombActionField, IPAddress), sizeof(CThostFtdcCombActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc TransferSerialFields[] = {
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcTransferSerialField, PlateSerial), sizeof(CThostFtdcTransferSerialField::PlateSerial), FIELD_INT},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcTransferSerialField, TradeDate), sizeof(CThostFtdcTransferSerialField::TradeDate), FIELD_ASCII},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcTransferSerialField, TradingDay), sizeof(CThostFtdcTransferSerialField::TradingDay), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcTransferSerialField, TradeTime), sizeof(CThostFtdcTransferSerialField::TradeTime), FIELD_ASCII},
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcTransferSerialField, TradeCode), sizeof(CThostFtdcTransferSerialField::TradeCode), FIELD_GBK},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcTransferSerialField, SessionID), sizeof(CThostFtdcTransferSerialField::SessionID), FIELD_INT},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcTransferSerialField, BankID), sizeof(CThostFtdcTransferSerialField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcTransferSerialField, BankBranchID), sizeof(CThostFtdcTransferSerialField::BankBranchID), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcTransferSerialField, BankAccType), sizeof(CThostFtdcTransferSerialField::BankAccType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcTransferSerialField, BankAccount), sizeof(CThostFtdcTransferSerialField::BankAccount), FIELD_GBK},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcTransferSerialField, BankSerial), sizeof(CThostFtdcTransferSerialField::BankSerial), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTransferSerialField, BrokerID), sizeof(CThostFtdcTransferSerialField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcTransferSerialField, BrokerBranchID), sizeof(CThostFtdcTransferSerialField::BrokerBranchID), FIELD_GBK},
+	{"FutureAccType", &KEY_FutureAccType, offsetof(CThostFtdcTransferSerialField, FutureAccType), sizeof(CThostFtdcTransferSerialField::FutureAccType), FIELD_CHAR},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcTransferSerialField, AccountID), sizeof(CThostFtdcTransferSerialField::AccountID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcTransferSerialField, InvestorID), sizeof(CThostFtdcTransferSerialField::InvestorID), FIELD_ASCII},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcTransferSerialField, FutureSerial), sizeof(CThostFtdcTransferSerialField::FutureSerial), FIELD_INT},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcTransferSerialField, IdCardType), sizeof(CThostFtdcTransferSerialField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcTransferSerialField, IdentifiedCardNo), sizeof(CThostFtdcTransferSerialField::IdentifiedCardNo), FIELD_GBK},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcTransferSerialField, CurrencyID), sizeof(CThostFtdcTransferSerialField::CurrencyID), FIELD_ASCII},
+	{"TradeAmount", &KEY_TradeAmount, offsetof(CThostFtdcTransferSerialField, TradeAmount), sizeof(CThostFtdcTransferSerialField::TradeAmount), FIELD_DOUBLE},
+	{"CustFee", &KEY_CustFee, offsetof(CThostFtdcTransferSerialField, CustFee), sizeof(CThostFtdcTransferSerialField::CustFee), FIELD_DOUBLE},
+	{"BrokerFee", &KEY_BrokerFee, offsetof(CThostFtdcTransferSerialField, BrokerFee), sizeof(CThostFtdcTransferSerialField::BrokerFee), FIELD_DOUBLE},
+	{"AvailabilityFlag", &KEY_AvailabilityFlag, offsetof(CThostFtdcTransferSerialField, AvailabilityFlag), sizeof(CThostFtdcTransferSerialField::AvailabilityFlag), FIELD_CHAR},
+	{"OperatorCode", &KEY_OperatorCode, offsetof(CThostFtdcTransferSerialField, OperatorCode), sizeof(CThostFtdcTransferSerialField::OperatorCode), FIELD_GBK},
+	{"BankNewAccount", &KEY_BankNewAccount, offsetof(CThostFtdcTransferSerialField, BankNewAccount), sizeof(CThostFtdcTransferSerialField::BankNewAccount), FIELD_GBK},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcTransferSerialField, ErrorID), sizeof(CThostFtdcTransferSerialField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcTransferSerialField, ErrorMsg), sizeof(CThostFtdcTransferSerialField::ErrorMsg), FIELD_GBK},
+};
+
+static const FieldDesc AccountregisterFields[] = {
+	{"TradeDay", &KEY_TradeDay, offsetof(CThostFtdcAccountregisterField, TradeDay), sizeof(CThostFtdcAccountregisterField::TradeDay), FIELD_ASCII},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcAccountregisterField, BankID), sizeof(CThostFtdcAccountregisterField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcAccountregisterField, BankBranchID), sizeof(CThostFtdcAccountregisterField::BankBranchID), FIELD_GBK},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcAccountregisterField, BankAccount), sizeof(CThostFtdcAccountregisterField::BankAccount), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcAccountregisterField, BrokerID), sizeof(CThostFtdcAccountregisterField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcAccountregisterField, BrokerBranchID), sizeof(CThostFtdcAccountregisterField::BrokerBranchID), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcAccountregisterField, AccountID), sizeof(CThostFtdcAccountregisterField::AccountID), FIELD_ASCII},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcAccountregisterField, IdCardType), sizeof(CThostFtdcAccountregisterField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcAccountregisterField, IdentifiedCardNo), sizeof(CThostFtdcAccountregisterField::IdentifiedCardNo), FIELD_GBK},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcAccountregisterField, CustomerName), sizeof(CThostFtdcAccountregisterField::CustomerName), FIELD_GBK},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcAccountregisterField, CurrencyID), sizeof(CThostFtdcAccountregisterField::CurrencyID), FIELD_ASCII},
+	{"OpenOrDestroy", &KEY_OpenOrDestroy, offsetof(CThostFtdcAccountregisterField, OpenOrDestroy), sizeof(CThostFtdcAccountregisterField::OpenOrDestroy), FIELD_CHAR},
+	{"RegDate", &KEY_RegDate, offsetof(CThostFtdcAccountregisterField, RegDate), sizeof(CThostFtdcAccountregisterField::RegDate), FIELD_ASCII},
+	{"OutDate", &KEY_OutDate, offsetof(CThostFtdcAccountregisterField, OutDate), sizeof(CThostFtdcAccountregisterField::OutDate), FIELD_ASCII},
+	{"TID", &KEY_TID, offsetof(CThostFtdcAccountregisterField, TID), sizeof(CThostFtdcAccountregisterField::TID), FIELD_INT},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcAccountregisterField, CustType), sizeof(CThostFtdcAccountregisterField::CustType), FIELD_CHAR},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcAccountregisterField, BankAccType), sizeof(CThostFtdcAccountregisterField::BankAccType), FIELD_CHAR},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcAccountregisterField, LongCustomerName), sizeof(CThostFtdcAccountregisterField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc OrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOrderActionField, BrokerID), sizeof(CThostFtdcOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcOrderActionField, InvestorID), sizeof(CThostFtdcOrderActionField::InvestorID), FIELD_ASCII},
+	{"OrderActionRef", &KEY_OrderActionRef, offsetof(CThostFtdcOrderActionField, OrderActionRef), sizeof(CThostFtdcOrderActionField::OrderActionRef), FIELD_INT},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcOrderActionField, OrderRef), sizeof(CThostFtdcOrderActionField::OrderRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcOrderActionField, RequestID), sizeof(CThostFtdcOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcOrderActionField, FrontID), sizeof(CThostFtdcOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcOrderActionField, SessionID), sizeof(CThostFtdcOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcOrderActionField, ExchangeID), sizeof(CThostFtdcOrderActionField::ExchangeID), FIELD_ASCII},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcOrderActionField, OrderSysID), sizeof(CThostFtdcOrderActionField::OrderSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcOrderActionField, ActionFlag), sizeof(CThostFtdcOrderActionField::ActionFlag), FIELD_CHAR},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcOrderActionField, LimitPrice), sizeof(CThostFtdcOrderActionField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeChange", &KEY_VolumeChange, offsetof(CThostFtdcOrderActionField, VolumeChange), sizeof(CThostFtdcOrderActionField::VolumeChange), FIELD_INT},
+	{"ActionDate", &KEY_ActionDate, offsetof(CThostFtdcOrderActionField, ActionDate), sizeof(CThostFtdcOrderActionField::ActionDate), FIELD_ASCII},
+	{"ActionTime", &KEY_ActionTime, offsetof(CThostFtdcOrderActionField, ActionTime), sizeof(CThostFtdcOrderActionField::ActionTime), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcOrderActionField, TraderID), sizeof(CThostFtdcOrderActionField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcOrderActionField, InstallID), sizeof(CThostFtdcOrderActionField::InstallID), FIELD_INT},
+	{"OrderLocalID", &KEY_OrderLocalID, offsetof(CThostFtdcOrderActionField, OrderLocalID), sizeof(CThostFtdcOrderActionField::OrderLocalID), FIELD_ASCII},
+	{"ActionLocalID", &KEY_ActionLocalID, offsetof(CThostFtdcOrderActionField, ActionLocalID), sizeof(CThostFtdcOrderActionField::ActionLocalID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcOrderActionField, ParticipantID), sizeof(CThostFtdcOrderActionField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcOrderActionField, ClientID), sizeof(CThostFtdcOrderActionField::ClientID), FIELD_ASCII},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcOrderActionField, BusinessUnit), sizeof(CThostFtdcOrderActionField::BusinessUnit), FIELD_GBK},
+	{"OrderActionStatus", &KEY_OrderActionStatus, offsetof(CThostFtdcOrderActionField, OrderActionStatus), sizeof(CThostFtdcOrderActionField::OrderActionStatus), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcOrderActionField, UserID), sizeof(CThostFtdcOrderActionField::UserID), FIELD_ASCII},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcOrderActionField, StatusMsg), sizeof(CThostFtdcOrderActionField::StatusMsg), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcOrderActionField, reserve1), sizeof(CThostFtdcOrderActionField::reserve1), FIELD_ASCII},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcOrderActionField, BranchID), sizeof(CThostFtdcOrderActionField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcOrderActionField, InvestUnitID), sizeof(CThostFtdcOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcOrderActionField, reserve2), sizeof(CThostFtdcOrderActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcOrderActionField, MacAddress), sizeof(CThostFtdcOrderActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcOrderActionField, InstrumentID), sizeof(CThostFtdcOrderActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcOrderActionField, IPAddress), sizeof(CThostFtdcOrderActionField::IPAddress), FIELD_ASCII},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcOrderActionField, OrderMemo), sizeof(CThostFtdcOrderActionField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcOrderActionField, SessionReqSeq), sizeof(CThostFtdcOrderActionField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc InstrumentStatusFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInstrumentStatusField, ExchangeID), sizeof(CThostFtdcInstrumentStatusField::ExchangeID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcInstrumentStatusField, reserve1), sizeof(CThostFtdcInstrumentStatusField::reserve1), FIELD_ASCII},
+	{"SettlementGroupID", &KEY_SettlementGroupID, offsetof(CThostFtdcInstrumentStatusField, SettlementGroupID), sizeof(CThostFtdcInstrumentStatusField::SettlementGroupID), FIELD_GBK},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcInstrumentStatusField, reserve2), sizeof(CThostFtdcInstrumentStatusField::reserve2), FIELD_ASCII},
+	{"InstrumentStatus", &KEY_InstrumentStatus, offsetof(CThostFtdcInstrumentStatusField, InstrumentStatus), sizeof(CThostFtdcInstrumentStatusField::InstrumentStatus), FIELD_CHAR},
+	{"TradingSegmentSN", &KEY_TradingSegmentSN, offsetof(CThostFtdcInstrumentStatusField, TradingSegmentSN), sizeof(CThostFtdcInstrumentStatusField::TradingSegmentSN), FIELD_INT},
+	{"EnterTime", &KEY_EnterTime, offsetof(CThostFtdcInstrumentStatusField, EnterTime), sizeof(CThostFtdcInstrumentStatusField::EnterTime), FIELD_ASCII},
+	{"EnterReason", &KEY_EnterReason, offsetof(CThostFtdcInstrumentStatusField, EnterReason), sizeof(CThostFtdcInstrumentStatusField::EnterReason), FIELD_CHAR},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcInstrumentStatusField, ExchangeInstID), sizeof(CThostFtdcInstrumentStatusField::ExchangeInstID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcInstrumentStatusField, InstrumentID), sizeof(CThostFtdcInstrumentStatusField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc BulletinFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcBulletinField, ExchangeID), sizeof(CThostFtdcBulletinField::ExchangeID), FIELD_ASCII},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcBulletinField, TradingDay), sizeof(CThostFtdcBulletinField::TradingDay), FIELD_ASCII},
+	{"BulletinID", &KEY_BulletinID, offsetof(CThostFtdcBulletinField, BulletinID), sizeof(CThostFtdcBulletinField::BulletinID), FIELD_INT},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcBulletinField, SequenceNo), sizeof(CThostFtdcBulletinField::SequenceNo), FIELD_INT},
+	{"NewsType", &KEY_NewsType, offsetof(CThostFtdcBulletinField, NewsType), sizeof(CThostFtdcBulletinField::NewsType), FIELD_GBK},
+	{"NewsUrgency", &KEY_NewsUrgency, offsetof(CThostFtdcBulletinField, NewsUrgency), sizeof(CThostFtdcBulletinField::NewsUrgency), FIELD_CHAR},
+	{"SendTime", &KEY_SendTime, offsetof(CThostFtdcBulletinField, SendTime), sizeof(CThostFtdcBulletinField::SendTime), FIELD_ASCII},
+	{"Abstract", &KEY_Abstract, offsetof(CThostFtdcBulletinField, Abstract), sizeof(CThostFtdcBulletinField::Abstract), FIELD_GBK},
+	{"ComeFrom", &KEY_ComeFrom, offsetof(CThostFtdcBulletinField, ComeFrom), sizeof(CThostFtdcBulletinField::ComeFrom), FIELD_GBK},
+	{"Content", &KEY_Content, offsetof(CThostFtdcBulletinField, Content), sizeof(CThostFtdcBulletinField::Content), FIELD_GBK},
+	{"URLLink", &KEY_URLLink, offsetof(CThostFtdcBulletinField, URLLink), sizeof(CThostFtdcBulletinField::URLLink), FIELD_GBK},
+	{"MarketID", &KEY_MarketID, offsetof(CThostFtdcBulletinField, MarketID), sizeof(CThostFtdcBulletinField::MarketID), FIELD_GBK},
+};
+
+static const FieldDesc TradingNoticeInfoFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTradingNoticeInfoField, BrokerID), sizeof(CThostFtdcTradingNoticeInfoField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcTradingNoticeInfoField, InvestorID), sizeof(CThostFtdcTradingNoticeInfoField::InvestorID), FIELD_ASCII},
+	{"SendTime", &KEY_SendTime, offsetof(CThostFtdcTradingNoticeInfoField, SendTime), sizeof(CThostFtdcTradingNoticeInfoField::SendTime), FIELD_ASCII},
+	{"FieldContent", &KEY_FieldContent, offsetof(CThostFtdcTradingNoticeInfoField, FieldContent), sizeof(CThostFtdcTradingNoticeInfoField::FieldContent), FIELD_GBK},
+	{"SequenceSeries", &KEY_SequenceSeries, offsetof(CThostFtdcTradingNoticeInfoField, SequenceSeries), sizeof(CThostFtdcTradingNoticeInfoField::SequenceSeries), FIELD_INT},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcTradingNoticeInfoField, SequenceNo), sizeof(CThostFtdcTradingNoticeInfoField::SequenceNo), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcTradingNoticeInfoField, InvestUnitID), sizeof(CThostFtdcTradingNoticeInfoField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc ErrorConditionalOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcErrorConditionalOrderField, BrokerID), sizeof(CThostFtdcErrorConditionalOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcErrorConditionalOrderField, InvestorID), sizeof(CThostFtdcErrorConditionalOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcErrorConditionalOrderField, reserve1), sizeof(CThostFtdcErrorConditionalOrderField::reserve1), FIELD_ASCII},
+	{"OrderRef", &KEY_OrderRef, offsetof(CThostFtdcErrorConditionalOrderField, OrderRef), sizeof(CThostFtdcErrorConditionalOrderField::OrderRef), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcErrorConditionalOrderField, UserID), sizeof(CThostFtdcErrorConditionalOrderField::UserID), FIELD_ASCII},
+	{"OrderPriceType", &KEY_OrderPriceType, offsetof(CThostFtdcErrorConditionalOrderField, OrderPriceType), sizeof(CThostFtdcErrorConditionalOrderField::OrderPriceType), FIELD_CHAR},
+	{"Direction", &KEY_Direction, offsetof(CThostFtdcErrorConditionalOrderField, Direction), sizeof(CThostFtdcErrorConditionalOrderField::Direction), FIELD_CHAR},
+	{"CombOffsetFlag", &KEY_CombOffsetFlag, offsetof(CThostFtdcErrorConditionalOrderField, CombOffsetFlag), sizeof(CThostFtdcErrorConditionalOrderField::CombOffsetFlag), FIELD_ASCII},
+	{"CombHedgeFlag", &KEY_CombHedgeFlag, offsetof(CThostFtdcErrorConditionalOrderField, CombHedgeFlag), sizeof(CThostFtdcErrorConditionalOrderField::CombHedgeFlag), FIELD_ASCII},
+	{"LimitPrice", &KEY_LimitPrice, offsetof(CThostFtdcErrorConditionalOrderField, LimitPrice), sizeof(CThostFtdcErrorConditionalOrderField::LimitPrice), FIELD_DOUBLE},
+	{"VolumeTotalOriginal", &KEY_VolumeTotalOriginal, offsetof(CThostFtdcErrorConditionalOrderField, VolumeTotalOriginal), sizeof(CThostFtdcErrorConditionalOrderField::VolumeTotalOriginal), FIELD_INT},
+	{"TimeCondition", &KEY_TimeCondition, offsetof(CThostFtdcErrorConditionalOrderField, TimeCondition), sizeof(CThostFtdcErrorConditionalOrderField::TimeCondition), FIELD_CHAR},
+	{"GTDDate", &KEY_GTDDate, offsetof(CThostFtdcErrorConditionalOrderField, GTDDate), sizeof(CThostFtdcErrorConditionalOrderField::GTDDate), FIELD_ASCII},
+	{"VolumeCondition", &KEY_VolumeCondition, offsetof(CThostFtdcErrorConditionalOrderField, VolumeCondition), sizeof(CThostFtdcErrorConditionalOrderField::VolumeCondition), FIELD_CHAR},
+	{"MinVolume", &KEY_MinVolume, offsetof(CThostFtdcErrorConditionalOrderField, MinVolume), sizeof(CThostFtdcErrorConditionalOrderField::MinVolume), FIELD_INT},
+	{"ContingentCondition", &KEY_ContingentCondition, offsetof(CThostFtdcErrorConditionalOrderField, ContingentCondition), sizeof(CThostFtdcErrorConditionalOrderField::ContingentCondition), FIELD_CHAR},
+	{"StopPrice", &KEY_StopPrice, offsetof(CThostFtdcErrorConditionalOrderField, StopPrice), sizeof(CThostFtdcErrorConditionalOrderField::StopPrice), FIELD_DOUBLE},
+	{"ForceCloseReason", &KEY_ForceCloseReason, offsetof(CThostFtdcErrorConditionalOrderField, ForceCloseReason), sizeof(CThostFtdcErrorConditionalOrderField::ForceCloseReason), FIELD_CHAR},
+	{"IsAutoSuspend", &KEY_IsAutoSuspend, offsetof(CThostFtdcErrorConditionalOrderField, IsAutoSuspend), sizeof(CThostFtdcErrorConditionalOrderField::IsAutoSuspend), FIELD_INT},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcErrorConditionalOrderField, BusinessUnit), sizeof(CThostFtdcErrorConditionalOrderField::BusinessUnit), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcErrorConditionalOrderField, RequestID), sizeof(CThostFtdcErrorConditionalOrderField::RequestID), FIELD_INT},
+	{"OrderLocalID", &KEY_OrderLocalID, offsetof(CThostFtdcErrorConditionalOrderField, OrderLocalID), sizeof(CThostFtdcErrorConditionalOrderField::OrderLocalID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcErrorConditionalOrderField, ExchangeID), sizeof(CThostFtdcErrorConditionalOrderField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcErrorConditionalOrderField, ParticipantID), sizeof(CThostFtdcErrorConditionalOrderField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcErrorConditionalOrderField, ClientID), sizeof(CThostFtdcErrorConditionalOrderField::ClientID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcErrorConditionalOrderField, reserve2), sizeof(CThostFtdcErrorConditionalOrderField::reserve2), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcErrorConditionalOrderField, TraderID), sizeof(CThostFtdcErrorConditionalOrderField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcErrorConditionalOrderField, InstallID), sizeof(CThostFtdcErrorConditionalOrderField::InstallID), FIELD_INT},
+	{"OrderSubmitStatus", &KEY_OrderSubmitStatus, offsetof(CThostFtdcErrorConditionalOrderField, OrderSubmitStatus), sizeof(CThostFtdcErrorConditionalOrderField::OrderSubmitStatus), FIELD_CHAR},
+	{"NotifySequence", &KEY_NotifySequence, offsetof(CThostFtdcErrorConditionalOrderField, NotifySequence), sizeof(CThostFtdcErrorConditionalOrderField::NotifySequence), FIELD_INT},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcErrorConditionalOrderField, TradingDay), sizeof(CThostFtdcErrorConditionalOrderField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcErrorConditionalOrderField, SettlementID), sizeof(CThostFtdcErrorConditionalOrderField::SettlementID), FIELD_INT},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcErrorConditionalOrderField, OrderSysID), sizeof(CThostFtdcErrorConditionalOrderField::OrderSysID), FIELD_ASCII},
+	{"OrderSource", &KEY_OrderSource, offsetof(CThostFtdcErrorConditionalOrderField, OrderSource), sizeof(CThostFtdcErrorConditionalOrderField::OrderSource), FIELD_CHAR},
+	{"OrderStatus", &KEY_OrderStatus, offsetof(CThostFtdcErrorConditionalOrderField, OrderStatus), sizeof(CThostFtdcErrorConditionalOrderField::OrderStatus), FIELD_CHAR},
+	{"OrderType", &KEY_OrderType, offsetof(CThostFtdcErrorConditionalOrderField, OrderType), sizeof(CThostFtdcErrorConditionalOrderField::OrderType), FIELD_CHAR},
+	{"VolumeTraded", &KEY_VolumeTraded, offsetof(CThostFtdcErrorConditionalOrderField, VolumeTraded), sizeof(CThostFtdcErrorConditionalOrderField::VolumeTraded), FIELD_INT},
+	{"VolumeTotal", &KEY_VolumeTotal, offsetof(CThostFtdcErrorConditionalOrderField, VolumeTotal), sizeof(CThostFtdcErrorConditionalOrderField::VolumeTotal), FIELD_INT},
+	{"InsertDate", &KEY_InsertDate, offsetof(CThostFtdcErrorConditionalOrderField, InsertDate), sizeof(CThostFtdcErrorConditionalOrderField::InsertDate), FIELD_ASCII},
+	{"InsertTime", &KEY_InsertTime, offsetof(CThostFtdcErrorConditionalOrderField, InsertTime), sizeof(CThostFtdcErrorConditionalOrderField::InsertTime), FIELD_ASCII},
+	{"ActiveTime", &KEY_ActiveTime, offsetof(CThostFtdcErrorConditionalOrderField, ActiveTime), sizeof(CThostFtdcErrorConditionalOrderField::ActiveTime), FIELD_ASCII},
+	{"SuspendTime", &KEY_SuspendTime, offsetof(CThostFtdcErrorConditionalOrderField, SuspendTime), sizeof(CThostFtdcErrorConditionalOrderField::SuspendTime), FIELD_ASCII},
+	{"UpdateTime", &KEY_UpdateTime, offsetof(CThostFtdcErrorConditionalOrderField, UpdateTime), sizeof(CThostFtdcErrorConditionalOrderField::UpdateTime), FIELD_ASCII},
+	{"CancelTime", &KEY_CancelTime, offsetof(CThostFtdcErrorConditionalOrderField, CancelTime), sizeof(CThostFtdcErrorConditionalOrderField::CancelTime), FIELD_ASCII},
+	{"ActiveTraderID", &KEY_ActiveTraderID, offsetof(CThostFtdcErrorConditionalOrderField, ActiveTraderID), sizeof(CThostFtdcErrorConditionalOrderField::ActiveTraderID), FIELD_ASCII},
+	{"ClearingPartID", &KEY_ClearingPartID, offsetof(CThostFtdcErrorConditionalOrderField, ClearingPartID), sizeof(CThostFtdcErrorConditionalOrderField::ClearingPartID), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcErrorConditionalOrderField, SequenceNo), sizeof(CThostFtdcErrorConditionalOrderField::SequenceNo), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcErrorConditionalOrderField, FrontID), sizeof(CThostFtdcErrorConditionalOrderField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcErrorConditionalOrderField, SessionID), sizeof(CThostFtdcErrorConditionalOrderField::SessionID), FIELD_INT},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcErrorConditionalOrderField, UserProductInfo), sizeof(CThostFtdcErrorConditionalOrderField::UserProductInfo), FIELD_GBK},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcErrorConditionalOrderField, StatusMsg), sizeof(CThostFtdcErrorConditionalOrderField::StatusMsg), FIELD_GBK},
+	{"UserForceClose", &KEY_UserForceClose, offsetof(CThostFtdcErrorConditionalOrderField, UserForceClose), sizeof(CThostFtdcErrorConditionalOrderField::UserForceClose), FIELD_INT},
+	{"ActiveUserID", &KEY_ActiveUserID, offsetof(CThostFtdcErrorConditionalOrderField, ActiveUserID), sizeof(CThostFtdcErrorConditionalOrderField::ActiveUserID), FIELD_ASCII},
+	{"BrokerOrderSeq", &KEY_BrokerOrderSeq, offsetof(CThostFtdcErrorConditionalOrderField, BrokerOrderSeq), sizeof(CThostFtdcErrorConditionalOrderField::BrokerOrderSeq), FIELD_INT},
+	{"RelativeOrderSysID", &KEY_RelativeOrderSysID, offsetof(CThostFtdcErrorConditionalOrderField, RelativeOrderSysID), sizeof(CThostFtdcErrorConditionalOrderField::RelativeOrderSysID), FIELD_ASCII},
+	{"ZCETotalTradedVolume", &KEY_ZCETotalTradedVolume, offsetof(CThostFtdcErrorConditionalOrderField, ZCETotalTradedVolume), sizeof(CThostFtdcErrorConditionalOrderField::ZCETotalTradedVolume), FIELD_INT},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcErrorConditionalOrderField, ErrorID), sizeof(CThostFtdcErrorConditionalOrderField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcErrorConditionalOrderField, ErrorMsg), sizeof(CThostFtdcErrorConditionalOrderField::ErrorMsg), FIELD_GBK},
+	{"IsSwapOrder", &KEY_IsSwapOrder, offsetof(CThostFtdcErrorConditionalOrderField, IsSwapOrder), sizeof(CThostFtdcErrorConditionalOrderField::IsSwapOrder), FIELD_INT},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcErrorConditionalOrderField, BranchID), sizeof(CThostFtdcErrorConditionalOrderField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcErrorConditionalOrderField, InvestUnitID), sizeof(CThostFtdcErrorConditionalOrderField::InvestUnitID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcErrorConditionalOrderField, AccountID), sizeof(CThostFtdcErrorConditionalOrderField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcErrorConditionalOrderField, CurrencyID), sizeof(CThostFtdcErrorConditionalOrderField::CurrencyID), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcErrorConditionalOrderField, reserve3), sizeof(CThostFtdcErrorConditionalOrderField::reserve3), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcErrorConditionalOrderField, MacAddress), sizeof(CThostFtdcErrorConditionalOrderField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcErrorConditionalOrderField, InstrumentID), sizeof(CThostFtdcErrorConditionalOrderField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcErrorConditionalOrderField, ExchangeInstID), sizeof(CThostFtdcErrorConditionalOrderField::ExchangeInstID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcErrorConditionalOrderField, IPAddress), sizeof(CThostFtdcErrorConditionalOrderField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ExecOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcExecOrderActionField, BrokerID), sizeof(CThostFtdcExecOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcExecOrderActionField, InvestorID), sizeof(CThostFtdcExecOrderActionField::InvestorID), FIELD_ASCII},
+	{"ExecOrderActionRef", &KEY_ExecOrderActionRef, offsetof(CThostFtdcExecOrderActionField, ExecOrderActionRef), sizeof(CThostFtdcExecOrderActionField::ExecOrderActionRef), FIELD_INT},
+	{"ExecOrderRef", &KEY_ExecOrderRef, offsetof(CThostFtdcExecOrderActionField, ExecOrderRef), sizeof(CThostFtdcExecOrderActionField::ExecOrderRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcExecOrderActionField, RequestID), sizeof(CThostFtdcExecOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcExecOrderActionField, FrontID), sizeof(CThostFtdcExecOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcExecOrderActionField, SessionID), sizeof(CThostFtdcExecOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcExecOrderActionField, ExchangeID), sizeof(CThostFtdcExecOrderActionField::ExchangeID), FIELD_ASCII},
+	{"ExecOrderSysID", &KEY_ExecOrderSysID, offsetof(CThostFtdcExecOrderActionField, ExecOrderSysID), sizeof(CThostFtdcExecOrderActionField::ExecOrderSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcExecOrderActionField, ActionFlag), sizeof(CThostFtdcExecOrderActionField::ActionFlag), FIELD_CHAR},
+	{"ActionDate", &KEY_ActionDate, offsetof(CThostFtdcExecOrderActionField, ActionDate), sizeof(CThostFtdcExecOrderActionField::ActionDate), FIELD_ASCII},
+	{"ActionTime", &KEY_ActionTime, offsetof(CThostFtdcExecOrderActionField, ActionTime), sizeof(CThostFtdcExecOrderActionField::ActionTime), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcExecOrderActionField, TraderID), sizeof(CThostFtdcExecOrderActionField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcExecOrderActionField, InstallID), sizeof(CThostFtdcExecOrderActionField::InstallID), FIELD_INT},
+	{"ExecOrderLocalID", &KEY_ExecOrderLocalID, offsetof(CThostFtdcExecOrderActionField, ExecOrderLocalID), sizeof(CThostFtdcExecOrderActionField::ExecOrderLocalID), FIELD_ASCII},
+	{"ActionLocalID", &KEY_ActionLocalID, offsetof(CThostFtdcExecOrderActionField, ActionLocalID), sizeof(CThostFtdcExecOrderActionField::ActionLocalID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcExecOrderActionField, ParticipantID), sizeof(CThostFtdcExecOrderActionField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcExecOrderActionField, ClientID), sizeof(CThostFtdcExecOrderActionField::ClientID), FIELD_ASCII},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcExecOrderActionField, BusinessUnit), sizeof(CThostFtdcExecOrderActionField::BusinessUnit), FIELD_GBK},
+	{"OrderActionStatus", &KEY_OrderActionStatus, offsetof(CThostFtdcExecOrderActionField, OrderActionStatus), sizeof(CThostFtdcExecOrderActionField::OrderActionStatus), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcExecOrderActionField, UserID), sizeof(CThostFtdcExecOrderActionField::UserID), FIELD_ASCII},
+	{"ActionType", &KEY_ActionType, offsetof(CThostFtdcExecOrderActionField, ActionType), sizeof(CThostFtdcExecOrderActionField::ActionType), FIELD_CHAR},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcExecOrderActionField, StatusMsg), sizeof(CThostFtdcExecOrderActionField::StatusMsg), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcExecOrderActionField, reserve1), sizeof(CThostFtdcExecOrderActionField::reserve1), FIELD_ASCII},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcExecOrderActionField, BranchID), sizeof(CThostFtdcExecOrderActionField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcExecOrderActionField, InvestUnitID), sizeof(CThostFtdcExecOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcExecOrderActionField, reserve2), sizeof(CThostFtdcExecOrderActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcExecOrderActionField, MacAddress), sizeof(CThostFtdcExecOrderActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcExecOrderActionField, InstrumentID), sizeof(CThostFtdcExecOrderActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcExecOrderActionField, IPAddress), sizeof(CThostFtdcExecOrderActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc QuoteActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQuoteActionField, BrokerID), sizeof(CThostFtdcQuoteActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQuoteActionField, InvestorID), sizeof(CThostFtdcQuoteActionField::InvestorID), FIELD_ASCII},
+	{"QuoteActionRef", &KEY_QuoteActionRef, offsetof(CThostFtdcQuoteActionField, QuoteActionRef), sizeof(CThostFtdcQuoteActionField::QuoteActionRef), FIELD_INT},
+	{"QuoteRef", &KEY_QuoteRef, offsetof(CThostFtdcQuoteActionField, QuoteRef), sizeof(CThostFtdcQuoteActionField::QuoteRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcQuoteActionField, RequestID), sizeof(CThostFtdcQuoteActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcQuoteActionField, FrontID), sizeof(CThostFtdcQuoteActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcQuoteActionField, SessionID), sizeof(CThostFtdcQuoteActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQuoteActionField, ExchangeID), sizeof(CThostFtdcQuoteActionField::ExchangeID), FIELD_ASCII},
+	{"QuoteSysID", &KEY_QuoteSysID, offsetof(CThostFtdcQuoteActionField, QuoteSysID), sizeof(CThostFtdcQuoteActionField::QuoteSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcQuoteActionField, ActionFlag), sizeof(CThostFtdcQuoteActionField::ActionFlag), FIELD_CHAR},
+	{"ActionDate", &KEY_ActionDate, offsetof(CThostFtdcQuoteActionField, ActionDate), sizeof(CThostFtdcQuoteActionField::ActionDate), FIELD_ASCII},
+	{"ActionTime", &KEY_ActionTime, offsetof(CThostFtdcQuoteActionField, ActionTime), sizeof(CThostFtdcQuoteActionField::ActionTime), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcQuoteActionField, TraderID), sizeof(CThostFtdcQuoteActionField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcQuoteActionField, InstallID), sizeof(CThostFtdcQuoteActionField::InstallID), FIELD_INT},
+	{"QuoteLocalID", &KEY_QuoteLocalID, offsetof(CThostFtdcQuoteActionField, QuoteLocalID), sizeof(CThostFtdcQuoteActionField::QuoteLocalID), FIELD_ASCII},
+	{"ActionLocalID", &KEY_ActionLocalID, offsetof(CThostFtdcQuoteActionField, ActionLocalID), sizeof(CThostFtdcQuoteActionField::ActionLocalID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcQuoteActionField, ParticipantID), sizeof(CThostFtdcQuoteActionField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcQuoteActionField, ClientID), sizeof(CThostFtdcQuoteActionField::ClientID), FIELD_ASCII},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcQuoteActionField, BusinessUnit), sizeof(CThostFtdcQuoteActionField::BusinessUnit), FIELD_GBK},
+	{"OrderActionStatus", &KEY_OrderActionStatus, offsetof(CThostFtdcQuoteActionField, OrderActionStatus), sizeof(CThostFtdcQuoteActionField::OrderActionStatus), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcQuoteActionField, UserID), sizeof(CThostFtdcQuoteActionField::UserID), FIELD_ASCII},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcQuoteActionField, StatusMsg), sizeof(CThostFtdcQuoteActionField::StatusMsg), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQuoteActionField, reserve1), sizeof(CThostFtdcQuoteActionField::reserve1), FIELD_ASCII},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcQuoteActionField, BranchID), sizeof(CThostFtdcQuoteActionField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQuoteActionField, InvestUnitID), sizeof(CThostFtdcQuoteActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcQuoteActionField, reserve2), sizeof(CThostFtdcQuoteActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcQuoteActionField, MacAddress), sizeof(CThostFtdcQuoteActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQuoteActionField, InstrumentID), sizeof(CThostFtdcQuoteActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcQuoteActionField, IPAddress), sizeof(CThostFtdcQuoteActionField::IPAddress), FIELD_ASCII},
+	{"OrderMemo", &KEY_OrderMemo, offsetof(CThostFtdcQuoteActionField, OrderMemo), sizeof(CThostFtdcQuoteActionField::OrderMemo), FIELD_GBK},
+	{"SessionReqSeq", &KEY_SessionReqSeq, offsetof(CThostFtdcQuoteActionField, SessionReqSeq), sizeof(CThostFtdcQuoteActionField::SessionReqSeq), FIELD_INT},
+};
+
+static const FieldDesc ForQuoteRspFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcForQuoteRspField, TradingDay), sizeof(CThostFtdcForQuoteRspField::TradingDay), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcForQuoteRspField, reserve1), sizeof(CThostFtdcForQuoteRspField::reserve1), FIELD_ASCII},
+	{"ForQuoteSysID", &KEY_ForQuoteSysID, offsetof(CThostFtdcForQuoteRspField, ForQuoteSysID), sizeof(CThostFtdcForQuoteRspField::ForQuoteSysID), FIELD_ASCII},
+	{"ForQuoteTime", &KEY_ForQuoteTime, offsetof(CThostFtdcForQuoteRspField, ForQuoteTime), sizeof(CThostFtdcForQuoteRspField::ForQuoteTime), FIELD_ASCII},
+	{"ActionDay", &KEY_ActionDay, offsetof(CThostFtdcForQuoteRspField, ActionDay), sizeof(CThostFtdcForQuoteRspField::ActionDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcForQuoteRspField, ExchangeID), sizeof(CThostFtdcForQuoteRspField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcForQuoteRspField, InstrumentID), sizeof(CThostFtdcForQuoteRspField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc CFMMCTradingAccountTokenFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcCFMMCTradingAccountTokenField, BrokerID), sizeof(CThostFtdcCFMMCTradingAccountTokenField::BrokerID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcCFMMCTradingAccountTokenField, ParticipantID), sizeof(CThostFtdcCFMMCTradingAccountTokenField::ParticipantID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcCFMMCTradingAccountTokenField, AccountID), sizeof(CThostFtdcCFMMCTradingAccountTokenField::AccountID), FIELD_ASCII},
+	{"KeyID", &KEY_KeyID, offsetof(CThostFtdcCFMMCTradingAccountTokenField, KeyID), sizeof(CThostFtdcCFMMCTradingAccountTokenField::KeyID), FIELD_INT},
+	{"Token", &KEY_Token, offsetof(CThostFtdcCFMMCTradingAccountTokenField, Token), sizeof(CThostFtdcCFMMCTradingAccountTokenField::Token), FIELD_GBK},
+};
+
+static const FieldDesc BatchOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcBatchOrderActionField, BrokerID), sizeof(CThostFtdcBatchOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcBatchOrderActionField, InvestorID), sizeof(CThostFtdcBatchOrderActionField::InvestorID), FIELD_ASCII},
+	{"OrderActionRef", &KEY_OrderActionRef, offsetof(CThostFtdcBatchOrderActionField, OrderActionRef), sizeof(CThostFtdcBatchOrderActionField::OrderActionRef), FIELD_INT},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcBatchOrderActionField, RequestID), sizeof(CThostFtdcBatchOrderActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcBatchOrderActionField, FrontID), sizeof(CThostFtdcBatchOrderActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcBatchOrderActionField, SessionID), sizeof(CThostFtdcBatchOrderActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcBatchOrderActionField, ExchangeID), sizeof(CThostFtdcBatchOrderActionField::ExchangeID), FIELD_ASCII},
+	{"ActionDate", &KEY_ActionDate, offsetof(CThostFtdcBatchOrderActionField, ActionDate), sizeof(CThostFtdcBatchOrderActionField::ActionDate), FIELD_ASCII},
+	{"ActionTime", &KEY_ActionTime, offsetof(CThostFtdcBatchOrderActionField, ActionTime), sizeof(CThostFtdcBatchOrderActionField::ActionTime), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcBatchOrderActionField, TraderID), sizeof(CThostFtdcBatchOrderActionField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcBatchOrderActionField, InstallID), sizeof(CThostFtdcBatchOrderActionField::InstallID), FIELD_INT},
+	{"ActionLocalID", &KEY_ActionLocalID, offsetof(CThostFtdcBatchOrderActionField, ActionLocalID), sizeof(CThostFtdcBatchOrderActionField::ActionLocalID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcBatchOrderActionField, ParticipantID), sizeof(CThostFtdcBatchOrderActionField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcBatchOrderActionField, ClientID), sizeof(CThostFtdcBatchOrderActionField::ClientID), FIELD_ASCII},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcBatchOrderActionField, BusinessUnit), sizeof(CThostFtdcBatchOrderActionField::BusinessUnit), FIELD_GBK},
+	{"OrderActionStatus", &KEY_OrderActionStatus, offsetof(CThostFtdcBatchOrderActionField, OrderActionStatus), sizeof(CThostFtdcBatchOrderActionField::OrderActionStatus), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcBatchOrderActionField, UserID), sizeof(CThostFtdcBatchOrderActionField::UserID), FIELD_ASCII},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcBatchOrderActionField, StatusMsg), sizeof(CThostFtdcBatchOrderActionField::StatusMsg), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcBatchOrderActionField, InvestUnitID), sizeof(CThostFtdcBatchOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcBatchOrderActionField, reserve1), sizeof(CThostFtdcBatchOrderActionField::reserve1), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcBatchOrderActionField, MacAddress), sizeof(CThostFtdcBatchOrderActionField::MacAddress), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcBatchOrderActionField, IPAddress), sizeof(CThostFtdcBatchOrderActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc OptionSelfCloseActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOptionSelfCloseActionField, BrokerID), sizeof(CThostFtdcOptionSelfCloseActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcOptionSelfCloseActionField, InvestorID), sizeof(CThostFtdcOptionSelfCloseActionField::InvestorID), FIELD_ASCII},
+	{"OptionSelfCloseActionRef", &KEY_OptionSelfCloseActionRef, offsetof(CThostFtdcOptionSelfCloseActionField, OptionSelfCloseActionRef), sizeof(CThostFtdcOptionSelfCloseActionField::OptionSelfCloseActionRef), FIELD_INT},
+	{"OptionSelfCloseRef", &KEY_OptionSelfCloseRef, offsetof(CThostFtdcOptionSelfCloseActionField, OptionSelfCloseRef), sizeof(CThostFtdcOptionSelfCloseActionField::OptionSelfCloseRef), FIELD_ASCII},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcOptionSelfCloseActionField, RequestID), sizeof(CThostFtdcOptionSelfCloseActionField::RequestID), FIELD_INT},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcOptionSelfCloseActionField, FrontID), sizeof(CThostFtdcOptionSelfCloseActionField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcOptionSelfCloseActionField, SessionID), sizeof(CThostFtdcOptionSelfCloseActionField::SessionID), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcOptionSelfCloseActionField, ExchangeID), sizeof(CThostFtdcOptionSelfCloseActionField::ExchangeID), FIELD_ASCII},
+	{"OptionSelfCloseSysID", &KEY_OptionSelfCloseSysID, offsetof(CThostFtdcOptionSelfCloseActionField, OptionSelfCloseSysID), sizeof(CThostFtdcOptionSelfCloseActionField::OptionSelfCloseSysID), FIELD_ASCII},
+	{"ActionFlag", &KEY_ActionFlag, offsetof(CThostFtdcOptionSelfCloseActionField, ActionFlag), sizeof(CThostFtdcOptionSelfCloseActionField::ActionFlag), FIELD_CHAR},
+	{"ActionDate", &KEY_ActionDate, offsetof(CThostFtdcOptionSelfCloseActionField, ActionDate), sizeof(CThostFtdcOptionSelfCloseActionField::ActionDate), FIELD_ASCII},
+	{"ActionTime", &KEY_ActionTime, offsetof(CThostFtdcOptionSelfCloseActionField, ActionTime), sizeof(CThostFtdcOptionSelfCloseActionField::ActionTime), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcOptionSelfCloseActionField, TraderID), sizeof(CThostFtdcOptionSelfCloseActionField::TraderID), FIELD_ASCII},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcOptionSelfCloseActionField, InstallID), sizeof(CThostFtdcOptionSelfCloseActionField::InstallID), FIELD_INT},
+	{"OptionSelfCloseLocalID", &KEY_OptionSelfCloseLocalID, offsetof(CThostFtdcOptionSelfCloseActionField, OptionSelfCloseLocalID), sizeof(CThostFtdcOptionSelfCloseActionField::OptionSelfCloseLocalID), FIELD_ASCII},
+	{"ActionLocalID", &KEY_ActionLocalID, offsetof(CThostFtdcOptionSelfCloseActionField, ActionLocalID), sizeof(CThostFtdcOptionSelfCloseActionField::ActionLocalID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcOptionSelfCloseActionField, ParticipantID), sizeof(CThostFtdcOptionSelfCloseActionField::ParticipantID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcOptionSelfCloseActionField, ClientID), sizeof(CThostFtdcOptionSelfCloseActionField::ClientID), FIELD_ASCII},
+	{"BusinessUnit", &KEY_BusinessUnit, offsetof(CThostFtdcOptionSelfCloseActionField, BusinessUnit), sizeof(CThostFtdcOptionSelfCloseActionField::BusinessUnit), FIELD_GBK},
+	{"OrderActionStatus", &KEY_OrderActionStatus, offsetof(CThostFtdcOptionSelfCloseActionField, OrderActionStatus), sizeof(CThostFtdcOptionSelfCloseActionField::OrderActionStatus), FIELD_CHAR},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcOptionSelfCloseActionField, UserID), sizeof(CThostFtdcOptionSelfCloseActionField::UserID), FIELD_ASCII},
+	{"StatusMsg", &KEY_StatusMsg, offsetof(CThostFtdcOptionSelfCloseActionField, StatusMsg), sizeof(CThostFtdcOptionSelfCloseActionField::StatusMsg), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcOptionSelfCloseActionField, reserve1), sizeof(CThostFtdcOptionSelfCloseActionField::reserve1), FIELD_ASCII},
+	{"BranchID", &KEY_BranchID, offsetof(CThostFtdcOptionSelfCloseActionField, BranchID), sizeof(CThostFtdcOptionSelfCloseActionField::BranchID), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcOptionSelfCloseActionField, InvestUnitID), sizeof(CThostFtdcOptionSelfCloseActionField::InvestUnitID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcOptionSelfCloseActionField, reserve2), sizeof(CThostFtdcOptionSelfCloseActionField::reserve2), FIELD_ASCII},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcOptionSelfCloseActionField, MacAddress), sizeof(CThostFtdcOptionSelfCloseActionField::MacAddress), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcOptionSelfCloseActionField, InstrumentID), sizeof(CThostFtdcOptionSelfCloseActionField::InstrumentID), FIELD_ASCII},
+	{"IPAddress", &KEY_IPAddress, offsetof(CThostFtdcOptionSelfCloseActionField, IPAddress), sizeof(CThostFtdcOptionSelfCloseActionField::IPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ContractBankFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcContractBankField, BrokerID), sizeof(CThostFtdcContractBankField::BrokerID), FIELD_ASCII},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcContractBankField, BankID), sizeof(CThostFtdcContractBankField::BankID), FIELD_GBK},
+	{"BankBrchID", &KEY_BankBrchID, offsetof(CThostFtdcContractBankField, BankBrchID), sizeof(CThostFtdcContractBankField::BankBrchID), FIELD_GBK},
+	{"BankName", &KEY_BankName, offsetof(CThostFtdcContractBankField, BankName), sizeof(CThostFtdcContractBankField::BankName), FIELD_GBK},
+};
+
+static const FieldDesc TradingNoticeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcTradingNoticeField, BrokerID), sizeof(CThostFtdcTradingNoticeField::BrokerID), FIELD_ASCII},
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcTradingNoticeField, InvestorRange), sizeof(CThostFtdcTradingNoticeField::InvestorRange), FIELD_CHAR},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcTradingNoticeField, InvestorID), sizeof(CThostFtdcTradingNoticeField::InvestorID), FIELD_ASCII},
+	{"SequenceSeries", &KEY_SequenceSeries, offsetof(CThostFtdcTradingNoticeField, SequenceSeries), sizeof(CThostFtdcTradingNoticeField::SequenceSeries), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcTradingNoticeField, UserID), sizeof(CThostFtdcTradingNoticeField::UserID), FIELD_ASCII},
+	{"SendTime", &KEY_SendTime, offsetof(CThostFtdcTradingNoticeField, SendTime), sizeof(CThostFtdcTradingNoticeField::SendTime), FIELD_ASCII},
+	{"SequenceNo", &KEY_SequenceNo, offsetof(CThostFtdcTradingNoticeField, SequenceNo), sizeof(CThostFtdcTradingNoticeField::SequenceNo), FIELD_INT},
+	{"FieldContent", &KEY_FieldContent, offsetof(CThostFtdcTradingNoticeField, FieldContent), sizeof(CThostFtdcTradingNoticeField::FieldContent), FIELD_GBK},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcTradingNoticeField, InvestUnitID), sizeof(CThostFtdcTradingNoticeField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc BrokerTradingParamsFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcBrokerTradingParamsField, BrokerID), sizeof(CThostFtdcBrokerTradingParamsField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcBrokerTradingParamsField, InvestorID), sizeof(CThostFtdcBrokerTradingParamsField::InvestorID), FIELD_ASCII},
+	{"MarginPriceType", &KEY_MarginPriceType, offsetof(CThostFtdcBrokerTradingParamsField, MarginPriceType), sizeof(CThostFtdcBrokerTradingParamsField::MarginPriceType), FIELD_CHAR},
+	{"Algorithm", &KEY_Algorithm, offsetof(CThostFtdcBrokerTradingParamsField, Algorithm), sizeof(CThostFtdcBrokerTradingParamsField::Algorithm), FIELD_CHAR},
+	{"AvailIncludeCloseProfit", &KEY_AvailIncludeCloseProfit, offsetof(CThostFtdcBrokerTradingParamsField, AvailIncludeCloseProfit), sizeof(CThostFtdcBrokerTradingParamsField::AvailIncludeCloseProfit), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcBrokerTradingParamsField, CurrencyID), sizeof(CThostFtdcBrokerTradingParamsField::CurrencyID), FIELD_ASCII},
+	{"OptionRoyaltyPriceType", &KEY_OptionRoyaltyPriceType, offsetof(CThostFtdcBrokerTradingParamsField, OptionRoyaltyPriceType), sizeof(CThostFtdcBrokerTradingParamsField::OptionRoyaltyPriceType), FIELD_CHAR},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcBrokerTradingParamsField, AccountID), sizeof(CThostFtdcBrokerTradingParamsField::AccountID), FIELD_ASCII},
+};
+
+static const FieldDesc BrokerTradingAlgosFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcBrokerTradingAlgosField, BrokerID), sizeof(CThostFtdcBrokerTradingAlgosField::BrokerID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcBrokerTradingAlgosField, ExchangeID), sizeof(CThostFtdcBrokerTradingAlgosField::ExchangeID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcBrokerTradingAlgosField, reserve1), sizeof(CThostFtdcBrokerTradingAlgosField::reserve1), FIELD_ASCII},
+	{"HandlePositionAlgoID", &KEY_HandlePositionAlgoID, offsetof(CThostFtdcBrokerTradingAlgosField, HandlePositionAlgoID), sizeof(CThostFtdcBrokerTradingAlgosField::HandlePositionAlgoID), FIELD_CHAR},
+	{"FindMarginRateAlgoID", &KEY_FindMarginRateAlgoID, offsetof(CThostFtdcBrokerTradingAlgosField, FindMarginRateAlgoID), sizeof(CThostFtdcBrokerTradingAlgosField::FindMarginRateAlgoID), FIELD_CHAR},
+	{"HandleTradingAccountAlgoID", &KEY_HandleTradingAccountAlgoID, offsetof(CThostFtdcBrokerTradingAlgosField, HandleTradingAccountAlgoID), sizeof(CThostFtdcBrokerTradingAlgosField::HandleTradingAccountAlgoID), FIELD_CHAR},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcBrokerTradingAlgosField, InstrumentID), sizeof(CThostFtdcBrokerTradingAlgosField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QueryCFMMCTradingAccountTokenFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQueryCFMMCTradingAccountTokenField, BrokerID), sizeof(CThostFtdcQueryCFMMCTradingAccountTokenField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQueryCFMMCTradingAccountTokenField, InvestorID), sizeof(CThostFtdcQueryCFMMCTradingAccountTokenField::InvestorID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQueryCFMMCTradingAccountTokenField, InvestUnitID), sizeof(CThostFtdcQueryCFMMCTradingAccountTokenField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc RspTransferFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcRspTransferField, TradeCode), sizeof(CThostFtdcRspTransferField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcRspTransferField, BankID), sizeof(CThostFtdcRspTransferField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcRspTransferField, BankBranchID), sizeof(CThostFtdcRspTransferField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspTransferField, BrokerID), sizeof(CThostFtdcRspTransferField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcRspTransferField, BrokerBranchID), sizeof(CThostFtdcRspTransferField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcRspTransferField, TradeDate), sizeof(CThostFtdcRspTransferField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcRspTransferField, TradeTime), sizeof(CThostFtdcRspTransferField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcRspTransferField, BankSerial), sizeof(CThostFtdcRspTransferField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRspTransferField, TradingDay), sizeof(CThostFtdcRspTransferField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcRspTransferField, PlateSerial), sizeof(CThostFtdcRspTransferField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcRspTransferField, LastFragment), sizeof(CThostFtdcRspTransferField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcRspTransferField, SessionID), sizeof(CThostFtdcRspTransferField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcRspTransferField, CustomerName), sizeof(CThostFtdcRspTransferField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcRspTransferField, IdCardType), sizeof(CThostFtdcRspTransferField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcRspTransferField, IdentifiedCardNo), sizeof(CThostFtdcRspTransferField::IdentifiedCardNo), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcRspTransferField, CustType), sizeof(CThostFtdcRspTransferField::CustType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcRspTransferField, BankAccount), sizeof(CThostFtdcRspTransferField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcRspTransferField, BankPassWord), sizeof(CThostFtdcRspTransferField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcRspTransferField, AccountID), sizeof(CThostFtdcRspTransferField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcRspTransferField, Password), sizeof(CThostFtdcRspTransferField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcRspTransferField, InstallID), sizeof(CThostFtdcRspTransferField::InstallID), FIELD_INT},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcRspTransferField, FutureSerial), sizeof(CThostFtdcRspTransferField::FutureSerial), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspTransferField, UserID), sizeof(CThostFtdcRspTransferField::UserID), FIELD_ASCII},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcRspTransferField, VerifyCertNoFlag), sizeof(CThostFtdcRspTransferField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcRspTransferField, CurrencyID), sizeof(CThostFtdcRspTransferField::CurrencyID), FIELD_ASCII},
+	{"TradeAmount", &KEY_TradeAmount, offsetof(CThostFtdcRspTransferField, TradeAmount), sizeof(CThostFtdcRspTransferField::TradeAmount), FIELD_DOUBLE},
+	{"FutureFetchAmount", &KEY_FutureFetchAmount, offsetof(CThostFtdcRspTransferField, FutureFetchAmount), sizeof(CThostFtdcRspTransferField::FutureFetchAmount), FIELD_DOUBLE},
+	{"FeePayFlag", &KEY_FeePayFlag, offsetof(CThostFtdcRspTransferField, FeePayFlag), sizeof(CThostFtdcRspTransferField::FeePayFlag), FIELD_CHAR},
+	{"CustFee", &KEY_CustFee, offsetof(CThostFtdcRspTransferField, CustFee), sizeof(CThostFtdcRspTransferField::CustFee), FIELD_DOUBLE},
+	{"BrokerFee", &KEY_BrokerFee, offsetof(CThostFtdcRspTransferField, BrokerFee), sizeof(CThostFtdcRspTransferField::BrokerFee), FIELD_DOUBLE},
+	{"Message", &KEY_Message, offsetof(CThostFtdcRspTransferField, Message), sizeof(CThostFtdcRspTransferField::Message), FIELD_GBK},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcRspTransferField, Digest), sizeof(CThostFtdcRspTransferField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcRspTransferField, BankAccType), sizeof(CThostFtdcRspTransferField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcRspTransferField, DeviceID), sizeof(CThostFtdcRspTransferField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcRspTransferField, BankSecuAccType), sizeof(CThostFtdcRspTransferField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcRspTransferField, BrokerIDByBank), sizeof(CThostFtdcRspTransferField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcRspTransferField, BankSecuAcc), sizeof(CThostFtdcRspTransferField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcRspTransferField, BankPwdFlag), sizeof(CThostFtdcRspTransferField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcRspTransferField, SecuPwdFlag), sizeof(CThostFtdcRspTransferField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcRspTransferField, OperNo), sizeof(CThostFtdcRspTransferField::OperNo), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcRspTransferField, RequestID), sizeof(CThostFtdcRspTransferField::RequestID), FIELD_INT},
+	{"TID", &KEY_TID, offsetof(CThostFtdcRspTransferField, TID), sizeof(CThostFtdcRspTransferField::TID), FIELD_INT},
+	{"TransferStatus", &KEY_TransferStatus, offsetof(CThostFtdcRspTransferField, TransferStatus), sizeof(CThostFtdcRspTransferField::TransferStatus), FIELD_CHAR},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcRspTransferField, ErrorID), sizeof(CThostFtdcRspTransferField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcRspTransferField, ErrorMsg), sizeof(CThostFtdcRspTransferField::ErrorMsg), FIELD_GBK},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcRspTransferField, LongCustomerName), sizeof(CThostFtdcRspTransferField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc RspRepealFields[] = {
+	{"RepealTimeInterval", &KEY_RepealTimeInterval, offsetof(CThostFtdcRspRepealField, RepealTimeInterval), sizeof(CThostFtdcRspRepealField::RepealTimeInterval), FIELD_INT},
+	{"RepealedTimes", &KEY_RepealedTimes, offsetof(CThostFtdcRspRepealField, RepealedTimes), sizeof(CThostFtdcRspRepealField::RepealedTimes), FIELD_INT},
+	{"BankRepealFlag", &KEY_BankRepealFlag, offsetof(CThostFtdcRspRepealField, BankRepealFlag), sizeof(CThostFtdcRspRepealField::BankRepealFlag), FIELD_CHAR},
+	{"BrokerRepealFlag", &KEY_BrokerRepealFlag, offsetof(CThostFtdcRspRepealField, BrokerRepealFlag), sizeof(CThostFtdcRspRepealField::BrokerRepealFlag), FIELD_CHAR},
+	{"PlateRepealSerial", &KEY_PlateRepealSerial, offsetof(CThostFtdcRspRepealField, PlateRepealSerial), sizeof(CThostFtdcRspRepealField::PlateRepealSerial), FIELD_INT},
+	{"BankRepealSerial", &KEY_BankRepealSerial, offsetof(CThostFtdcRspRepealField, BankRepealSerial), sizeof(CThostFtdcRspRepealField::BankRepealSerial), FIELD_GBK},
+	{"FutureRepealSerial", &KEY_FutureRepealSerial, offsetof(CThostFtdcRspRepealField, FutureRepealSerial), sizeof(CThostFtdcRspRepealField::FutureRepealSerial), FIELD_INT},
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcRspRepealField, TradeCode), sizeof(CThostFtdcRspRepealField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcRspRepealField, BankID), sizeof(CThostFtdcRspRepealField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcRspRepealField, BankBranchID), sizeof(CThostFtdcRspRepealField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspRepealField, BrokerID), sizeof(CThostFtdcRspRepealField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcRspRepealField, BrokerBranchID), sizeof(CThostFtdcRspRepealField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcRspRepealField, TradeDate), sizeof(CThostFtdcRspRepealField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcRspRepealField, TradeTime), sizeof(CThostFtdcRspRepealField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcRspRepealField, BankSerial), sizeof(CThostFtdcRspRepealField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRspRepealField, TradingDay), sizeof(CThostFtdcRspRepealField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcRspRepealField, PlateSerial), sizeof(CThostFtdcRspRepealField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcRspRepealField, LastFragment), sizeof(CThostFtdcRspRepealField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcRspRepealField, SessionID), sizeof(CThostFtdcRspRepealField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcRspRepealField, CustomerName), sizeof(CThostFtdcRspRepealField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcRspRepealField, IdCardType), sizeof(CThostFtdcRspRepealField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcRspRepealField, IdentifiedCardNo), sizeof(CThostFtdcRspRepealField::IdentifiedCardNo), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcRspRepealField, CustType), sizeof(CThostFtdcRspRepealField::CustType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcRspRepealField, BankAccount), sizeof(CThostFtdcRspRepealField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcRspRepealField, BankPassWord), sizeof(CThostFtdcRspRepealField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcRspRepealField, AccountID), sizeof(CThostFtdcRspRepealField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcRspRepealField, Password), sizeof(CThostFtdcRspRepealField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcRspRepealField, InstallID), sizeof(CThostFtdcRspRepealField::InstallID), FIELD_INT},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcRspRepealField, FutureSerial), sizeof(CThostFtdcRspRepealField::FutureSerial), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspRepealField, UserID), sizeof(CThostFtdcRspRepealField::UserID), FIELD_ASCII},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcRspRepealField, VerifyCertNoFlag), sizeof(CThostFtdcRspRepealField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcRspRepealField, CurrencyID), sizeof(CThostFtdcRspRepealField::CurrencyID), FIELD_ASCII},
+	{"TradeAmount", &KEY_TradeAmount, offsetof(CThostFtdcRspRepealField, TradeAmount), sizeof(CThostFtdcRspRepealField::TradeAmount), FIELD_DOUBLE},
+	{"FutureFetchAmount", &KEY_FutureFetchAmount, offsetof(CThostFtdcRspRepealField, FutureFetchAmount), sizeof(CThostFtdcRspRepealField::FutureFetchAmount), FIELD_DOUBLE},
+	{"FeePayFlag", &KEY_FeePayFlag, offsetof(CThostFtdcRspRepealField, FeePayFlag), sizeof(CThostFtdcRspRepealField::FeePayFlag), FIELD_CHAR},
+	{"CustFee", &KEY_CustFee, offsetof(CThostFtdcRspRepealField, CustFee), sizeof(CThostFtdcRspRepealField::CustFee), FIELD_DOUBLE},
+	{"BrokerFee", &KEY_BrokerFee, offsetof(CThostFtdcRspRepealField, BrokerFee), sizeof(CThostFtdcRspRepealField::BrokerFee), FIELD_DOUBLE},
+	{"Message", &KEY_Message, offsetof(CThostFtdcRspRepealField, Message), sizeof(CThostFtdcRspRepealField::Message), FIELD_GBK},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcRspRepealField, Digest), sizeof(CThostFtdcRspRepealField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcRspRepealField, BankAccType), sizeof(CThostFtdcRspRepealField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcRspRepealField, DeviceID), sizeof(CThostFtdcRspRepealField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcRspRepealField, BankSecuAccType), sizeof(CThostFtdcRspRepealField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcRspRepealField, BrokerIDByBank), sizeof(CThostFtdcRspRepealField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcRspRepealField, BankSecuAcc), sizeof(CThostFtdcRspRepealField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcRspRepealField, BankPwdFlag), sizeof(CThostFtdcRspRepealField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcRspRepealField, SecuPwdFlag), sizeof(CThostFtdcRspRepealField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcRspRepealField, OperNo), sizeof(CThostFtdcRspRepealField::OperNo), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcRspRepealField, RequestID), sizeof(CThostFtdcRspRepealField::RequestID), FIELD_INT},
+	{"TID", &KEY_TID, offsetof(CThostFtdcRspRepealField, TID), sizeof(CThostFtdcRspRepealField::TID), FIELD_INT},
+	{"TransferStatus", &KEY_TransferStatus, offsetof(CThostFtdcRspRepealField, TransferStatus), sizeof(CThostFtdcRspRepealField::TransferStatus), FIELD_CHAR},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcRspRepealField, ErrorID), sizeof(CThostFtdcRspRepealField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcRspRepealField, ErrorMsg), sizeof(CThostFtdcRspRepealField::ErrorMsg), FIELD_GBK},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcRspRepealField, LongCustomerName), sizeof(CThostFtdcRspRepealField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc NotifyQueryAccountFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcNotifyQueryAccountField, TradeCode), sizeof(CThostFtdcNotifyQueryAccountField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcNotifyQueryAccountField, BankID), sizeof(CThostFtdcNotifyQueryAccountField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcNotifyQueryAccountField, BankBranchID), sizeof(CThostFtdcNotifyQueryAccountField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcNotifyQueryAccountField, BrokerID), sizeof(CThostFtdcNotifyQueryAccountField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcNotifyQueryAccountField, BrokerBranchID), sizeof(CThostFtdcNotifyQueryAccountField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcNotifyQueryAccountField, TradeDate), sizeof(CThostFtdcNotifyQueryAccountField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcNotifyQueryAccountField, TradeTime), sizeof(CThostFtdcNotifyQueryAccountField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcNotifyQueryAccountField, BankSerial), sizeof(CThostFtdcNotifyQueryAccountField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcNotifyQueryAccountField, TradingDay), sizeof(CThostFtdcNotifyQueryAccountField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcNotifyQueryAccountField, PlateSerial), sizeof(CThostFtdcNotifyQueryAccountField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcNotifyQueryAccountField, LastFragment), sizeof(CThostFtdcNotifyQueryAccountField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcNotifyQueryAccountField, SessionID), sizeof(CThostFtdcNotifyQueryAccountField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcNotifyQueryAccountField, CustomerName), sizeof(CThostFtdcNotifyQueryAccountField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcNotifyQueryAccountField, IdCardType), sizeof(CThostFtdcNotifyQueryAccountField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcNotifyQueryAccountField, IdentifiedCardNo), sizeof(CThostFtdcNotifyQueryAccountField::IdentifiedCardNo), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcNotifyQueryAccountField, CustType), sizeof(CThostFtdcNotifyQueryAccountField::CustType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcNotifyQueryAccountField, BankAccount), sizeof(CThostFtdcNotifyQueryAccountField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcNotifyQueryAccountField, BankPassWord), sizeof(CThostFtdcNotifyQueryAccountField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcNotifyQueryAccountField, AccountID), sizeof(CThostFtdcNotifyQueryAccountField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcNotifyQueryAccountField, Password), sizeof(CThostFtdcNotifyQueryAccountField::Password), FIELD_GBK},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcNotifyQueryAccountField, FutureSerial), sizeof(CThostFtdcNotifyQueryAccountField::FutureSerial), FIELD_INT},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcNotifyQueryAccountField, InstallID), sizeof(CThostFtdcNotifyQueryAccountField::InstallID), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcNotifyQueryAccountField, UserID), sizeof(CThostFtdcNotifyQueryAccountField::UserID), FIELD_ASCII},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcNotifyQueryAccountField, VerifyCertNoFlag), sizeof(CThostFtdcNotifyQueryAccountField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcNotifyQueryAccountField, CurrencyID), sizeof(CThostFtdcNotifyQueryAccountField::CurrencyID), FIELD_ASCII},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcNotifyQueryAccountField, Digest), sizeof(CThostFtdcNotifyQueryAccountField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcNotifyQueryAccountField, BankAccType), sizeof(CThostFtdcNotifyQueryAccountField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcNotifyQueryAccountField, DeviceID), sizeof(CThostFtdcNotifyQueryAccountField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcNotifyQueryAccountField, BankSecuAccType), sizeof(CThostFtdcNotifyQueryAccountField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcNotifyQueryAccountField, BrokerIDByBank), sizeof(CThostFtdcNotifyQueryAccountField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcNotifyQueryAccountField, BankSecuAcc), sizeof(CThostFtdcNotifyQueryAccountField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcNotifyQueryAccountField, BankPwdFlag), sizeof(CThostFtdcNotifyQueryAccountField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcNotifyQueryAccountField, SecuPwdFlag), sizeof(CThostFtdcNotifyQueryAccountField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcNotifyQueryAccountField, OperNo), sizeof(CThostFtdcNotifyQueryAccountField::OperNo), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcNotifyQueryAccountField, RequestID), sizeof(CThostFtdcNotifyQueryAccountField::RequestID), FIELD_INT},
+	{"TID", &KEY_TID, offsetof(CThostFtdcNotifyQueryAccountField, TID), sizeof(CThostFtdcNotifyQueryAccountField::TID), FIELD_INT},
+	{"BankUseAmount", &KEY_BankUseAmount, offsetof(CThostFtdcNotifyQueryAccountField, BankUseAmount), sizeof(CThostFtdcNotifyQueryAccountField::BankUseAmount), FIELD_DOUBLE},
+	{"BankFetchAmount", &KEY_BankFetchAmount, offsetof(CThostFtdcNotifyQueryAccountField, BankFetchAmount), sizeof(CThostFtdcNotifyQueryAccountField::BankFetchAmount), FIELD_DOUBLE},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcNotifyQueryAccountField, ErrorID), sizeof(CThostFtdcNotifyQueryAccountField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcNotifyQueryAccountField, ErrorMsg), sizeof(CThostFtdcNotifyQueryAccountField::ErrorMsg), FIELD_GBK},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcNotifyQueryAccountField, LongCustomerName), sizeof(CThostFtdcNotifyQueryAccountField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc ReqTransferFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcReqTransferField, TradeCode), sizeof(CThostFtdcReqTransferField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcReqTransferField, BankID), sizeof(CThostFtdcReqTransferField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcReqTransferField, BankBranchID), sizeof(CThostFtdcReqTransferField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqTransferField, BrokerID), sizeof(CThostFtdcReqTransferField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcReqTransferField, BrokerBranchID), sizeof(CThostFtdcReqTransferField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcReqTransferField, TradeDate), sizeof(CThostFtdcReqTransferField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcReqTransferField, TradeTime), sizeof(CThostFtdcReqTransferField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcReqTransferField, BankSerial), sizeof(CThostFtdcReqTransferField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqTransferField, TradingDay), sizeof(CThostFtdcReqTransferField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcReqTransferField, PlateSerial), sizeof(CThostFtdcReqTransferField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcReqTransferField, LastFragment), sizeof(CThostFtdcReqTransferField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcReqTransferField, SessionID), sizeof(CThostFtdcReqTransferField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcReqTransferField, CustomerName), sizeof(CThostFtdcReqTransferField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcReqTransferField, IdCardType), sizeof(CThostFtdcReqTransferField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcReqTransferField, IdentifiedCardNo), sizeof(CThostFtdcReqTransferField::IdentifiedCardNo), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcReqTransferField, CustType), sizeof(CThostFtdcReqTransferField::CustType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcReqTransferField, BankAccount), sizeof(CThostFtdcReqTransferField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcReqTransferField, BankPassWord), sizeof(CThostFtdcReqTransferField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcReqTransferField, AccountID), sizeof(CThostFtdcReqTransferField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqTransferField, Password), sizeof(CThostFtdcReqTransferField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcReqTransferField, InstallID), sizeof(CThostFtdcReqTransferField::InstallID), FIELD_INT},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcReqTransferField, FutureSerial), sizeof(CThostFtdcReqTransferField::FutureSerial), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqTransferField, UserID), sizeof(CThostFtdcReqTransferField::UserID), FIELD_ASCII},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcReqTransferField, VerifyCertNoFlag), sizeof(CThostFtdcReqTransferField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcReqTransferField, CurrencyID), sizeof(CThostFtdcReqTransferField::CurrencyID), FIELD_ASCII},
+	{"TradeAmount", &KEY_TradeAmount, offsetof(CThostFtdcReqTransferField, TradeAmount), sizeof(CThostFtdcReqTransferField::TradeAmount), FIELD_DOUBLE},
+	{"FutureFetchAmount", &KEY_FutureFetchAmount, offsetof(CThostFtdcReqTransferField, FutureFetchAmount), sizeof(CThostFtdcReqTransferField::FutureFetchAmount), FIELD_DOUBLE},
+	{"FeePayFlag", &KEY_FeePayFlag, offsetof(CThostFtdcReqTransferField, FeePayFlag), sizeof(CThostFtdcReqTransferField::FeePayFlag), FIELD_CHAR},
+	{"CustFee", &KEY_CustFee, offsetof(CThostFtdcReqTransferField, CustFee), sizeof(CThostFtdcReqTransferField::CustFee), FIELD_DOUBLE},
+	{"BrokerFee", &KEY_BrokerFee, offsetof(CThostFtdcReqTransferField, BrokerFee), sizeof(CThostFtdcReqTransferField::BrokerFee), FIELD_DOUBLE},
+	{"Message", &KEY_Message, offsetof(CThostFtdcReqTransferField, Message), sizeof(CThostFtdcReqTransferField::Message), FIELD_GBK},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcReqTransferField, Digest), sizeof(CThostFtdcReqTransferField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcReqTransferField, BankAccType), sizeof(CThostFtdcReqTransferField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcReqTransferField, DeviceID), sizeof(CThostFtdcReqTransferField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcReqTransferField, BankSecuAccType), sizeof(CThostFtdcReqTransferField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcReqTransferField, BrokerIDByBank), sizeof(CThostFtdcReqTransferField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcReqTransferField, BankSecuAcc), sizeof(CThostFtdcReqTransferField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcReqTransferField, BankPwdFlag), sizeof(CThostFtdcReqTransferField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcReqTransferField, SecuPwdFlag), sizeof(CThostFtdcReqTransferField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcReqTransferField, OperNo), sizeof(CThostFtdcReqTransferField::OperNo), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcReqTransferField, RequestID), sizeof(CThostFtdcReqTransferField::RequestID), FIELD_INT},
+	{"TID", &KEY_TID, offsetof(CThostFtdcReqTransferField, TID), sizeof(CThostFtdcReqTransferField::TID), FIELD_INT},
+	{"TransferStatus", &KEY_TransferStatus, offsetof(CThostFtdcReqTransferField, TransferStatus), sizeof(CThostFtdcReqTransferField::TransferStatus), FIELD_CHAR},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcReqTransferField, LongCustomerName), sizeof(CThostFtdcReqTransferField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc ReqRepealFields[] = {
+	{"RepealTimeInterval", &KEY_RepealTimeInterval, offsetof(CThostFtdcReqRepealField, RepealTimeInterval), sizeof(CThostFtdcReqRepealField::RepealTimeInterval), FIELD_INT},
+	{"RepealedTimes", &KEY_RepealedTimes, offsetof(CThostFtdcReqRepealField, RepealedTimes), sizeof(CThostFtdcReqRepealField::RepealedTimes), FIELD_INT},
+	{"BankRepealFlag", &KEY_BankRepealFlag, offsetof(CThostFtdcReqRepealField, BankRepealFlag), sizeof(CThostFtdcReqRepealField::BankRepealFlag), FIELD_CHAR},
+	{"BrokerRepealFlag", &KEY_BrokerRepealFlag, offsetof(CThostFtdcReqRepealField, BrokerRepealFlag), sizeof(CThostFtdcReqRepealField::BrokerRepealFlag), FIELD_CHAR},
+	{"PlateRepealSerial", &KEY_PlateRepealSerial, offsetof(CThostFtdcReqRepealField, PlateRepealSerial), sizeof(CThostFtdcReqRepealField::PlateRepealSerial), FIELD_INT},
+	{"BankRepealSerial", &KEY_BankRepealSerial, offsetof(CThostFtdcReqRepealField, BankRepealSerial), sizeof(CThostFtdcReqRepealField::BankRepealSerial), FIELD_GBK},
+	{"FutureRepealSerial", &KEY_FutureRepealSerial, offsetof(CThostFtdcReqRepealField, FutureRepealSerial), sizeof(CThostFtdcReqRepealField::FutureRepealSerial), FIELD_INT},
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcReqRepealField, TradeCode), sizeof(CThostFtdcReqRepealField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcReqRepealField, BankID), sizeof(CThostFtdcReqRepealField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcReqRepealField, BankBranchID), sizeof(CThostFtdcReqRepealField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqRepealField, BrokerID), sizeof(CThostFtdcReqRepealField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcReqRepealField, BrokerBranchID), sizeof(CThostFtdcReqRepealField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcReqRepealField, TradeDate), sizeof(CThostFtdcReqRepealField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcReqRepealField, TradeTime), sizeof(CThostFtdcReqRepealField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcReqRepealField, BankSerial), sizeof(CThostFtdcReqRepealField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqRepealField, TradingDay), sizeof(CThostFtdcReqRepealField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcReqRepealField, PlateSerial), sizeof(CThostFtdcReqRepealField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcReqRepealField, LastFragment), sizeof(CThostFtdcReqRepealField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcReqRepealField, SessionID), sizeof(CThostFtdcReqRepealField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcReqRepealField, CustomerName), sizeof(CThostFtdcReqRepealField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcReqRepealField, IdCardType), sizeof(CThostFtdcReqRepealField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcReqRepealField, IdentifiedCardNo), sizeof(CThostFtdcReqRepealField::IdentifiedCardNo), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcReqRepealField, CustType), sizeof(CThostFtdcReqRepealField::CustType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcReqRepealField, BankAccount), sizeof(CThostFtdcReqRepealField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcReqRepealField, BankPassWord), sizeof(CThostFtdcReqRepealField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcReqRepealField, AccountID), sizeof(CThostFtdcReqRepealField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqRepealField, Password), sizeof(CThostFtdcReqRepealField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcReqRepealField, InstallID), sizeof(CThostFtdcReqRepealField::InstallID), FIELD_INT},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcReqRepealField, FutureSerial), sizeof(CThostFtdcReqRepealField::FutureSerial), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqRepealField, UserID), sizeof(CThostFtdcReqRepealField::UserID), FIELD_ASCII},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcReqRepealField, VerifyCertNoFlag), sizeof(CThostFtdcReqRepealField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcReqRepealField, CurrencyID), sizeof(CThostFtdcReqRepealField::CurrencyID), FIELD_ASCII},
+	{"TradeAmount", &KEY_TradeAmount, offsetof(CThostFtdcReqRepealField, TradeAmount), sizeof(CThostFtdcReqRepealField::TradeAmount), FIELD_DOUBLE},
+	{"FutureFetchAmount", &KEY_FutureFetchAmount, offsetof(CThostFtdcReqRepealField, FutureFetchAmount), sizeof(CThostFtdcReqRepealField::FutureFetchAmount), FIELD_DOUBLE},
+	{"FeePayFlag", &KEY_FeePayFlag, offsetof(CThostFtdcReqRepealField, FeePayFlag), sizeof(CThostFtdcReqRepealField::FeePayFlag), FIELD_CHAR},
+	{"CustFee", &KEY_CustFee, offsetof(CThostFtdcReqRepealField, CustFee), sizeof(CThostFtdcReqRepealField::CustFee), FIELD_DOUBLE},
+	{"BrokerFee", &KEY_BrokerFee, offsetof(CThostFtdcReqRepealField, BrokerFee), sizeof(CThostFtdcReqRepealField::BrokerFee), FIELD_DOUBLE},
+	{"Message", &KEY_Message, offsetof(CThostFtdcReqRepealField, Message), sizeof(CThostFtdcReqRepealField::Message), FIELD_GBK},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcReqRepealField, Digest), sizeof(CThostFtdcReqRepealField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcReqRepealField, BankAccType), sizeof(CThostFtdcReqRepealField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcReqRepealField, DeviceID), sizeof(CThostFtdcReqRepealField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcReqRepealField, BankSecuAccType), sizeof(CThostFtdcReqRepealField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcReqRepealField, BrokerIDByBank), sizeof(CThostFtdcReqRepealField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcReqRepealField, BankSecuAcc), sizeof(CThostFtdcReqRepealField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcReqRepealField, BankPwdFlag), sizeof(CThostFtdcReqRepealField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcReqRepealField, SecuPwdFlag), sizeof(CThostFtdcReqRepealField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcReqRepealField, OperNo), sizeof(CThostFtdcReqRepealField::OperNo), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcReqRepealField, RequestID), sizeof(CThostFtdcReqRepealField::RequestID), FIELD_INT},
+	{"TID", &KEY_TID, offsetof(CThostFtdcReqRepealField, TID), sizeof(CThostFtdcReqRepealField::TID), FIELD_INT},
+	{"TransferStatus", &KEY_TransferStatus, offsetof(CThostFtdcReqRepealField, TransferStatus), sizeof(CThostFtdcReqRepealField::TransferStatus), FIELD_CHAR},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcReqRepealField, LongCustomerName), sizeof(CThostFtdcReqRepealField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc ReqQueryAccountFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcReqQueryAccountField, TradeCode), sizeof(CThostFtdcReqQueryAccountField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcReqQueryAccountField, BankID), sizeof(CThostFtdcReqQueryAccountField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcReqQueryAccountField, BankBranchID), sizeof(CThostFtdcReqQueryAccountField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqQueryAccountField, BrokerID), sizeof(CThostFtdcReqQueryAccountField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcReqQueryAccountField, BrokerBranchID), sizeof(CThostFtdcReqQueryAccountField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcReqQueryAccountField, TradeDate), sizeof(CThostFtdcReqQueryAccountField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcReqQueryAccountField, TradeTime), sizeof(CThostFtdcReqQueryAccountField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcReqQueryAccountField, BankSerial), sizeof(CThostFtdcReqQueryAccountField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqQueryAccountField, TradingDay), sizeof(CThostFtdcReqQueryAccountField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcReqQueryAccountField, PlateSerial), sizeof(CThostFtdcReqQueryAccountField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcReqQueryAccountField, LastFragment), sizeof(CThostFtdcReqQueryAccountField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcReqQueryAccountField, SessionID), sizeof(CThostFtdcReqQueryAccountField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcReqQueryAccountField, CustomerName), sizeof(CThostFtdcReqQueryAccountField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcReqQueryAccountField, IdCardType), sizeof(CThostFtdcReqQueryAccountField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcReqQueryAccountField, IdentifiedCardNo), sizeof(CThostFtdcReqQueryAccountField::IdentifiedCardNo), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcReqQueryAccountField, CustType), sizeof(CThostFtdcReqQueryAccountField::CustType), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcReqQueryAccountField, BankAccount), sizeof(CThostFtdcReqQueryAccountField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcReqQueryAccountField, BankPassWord), sizeof(CThostFtdcReqQueryAccountField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcReqQueryAccountField, AccountID), sizeof(CThostFtdcReqQueryAccountField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqQueryAccountField, Password), sizeof(CThostFtdcReqQueryAccountField::Password), FIELD_GBK},
+	{"FutureSerial", &KEY_FutureSerial, offsetof(CThostFtdcReqQueryAccountField, FutureSerial), sizeof(CThostFtdcReqQueryAccountField::FutureSerial), FIELD_INT},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcReqQueryAccountField, InstallID), sizeof(CThostFtdcReqQueryAccountField::InstallID), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqQueryAccountField, UserID), sizeof(CThostFtdcReqQueryAccountField::UserID), FIELD_ASCII},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcReqQueryAccountField, VerifyCertNoFlag), sizeof(CThostFtdcReqQueryAccountField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcReqQueryAccountField, CurrencyID), sizeof(CThostFtdcReqQueryAccountField::CurrencyID), FIELD_ASCII},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcReqQueryAccountField, Digest), sizeof(CThostFtdcReqQueryAccountField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcReqQueryAccountField, BankAccType), sizeof(CThostFtdcReqQueryAccountField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcReqQueryAccountField, DeviceID), sizeof(CThostFtdcReqQueryAccountField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcReqQueryAccountField, BankSecuAccType), sizeof(CThostFtdcReqQueryAccountField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcReqQueryAccountField, BrokerIDByBank), sizeof(CThostFtdcReqQueryAccountField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcReqQueryAccountField, BankSecuAcc), sizeof(CThostFtdcReqQueryAccountField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcReqQueryAccountField, BankPwdFlag), sizeof(CThostFtdcReqQueryAccountField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcReqQueryAccountField, SecuPwdFlag), sizeof(CThostFtdcReqQueryAccountField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcReqQueryAccountField, OperNo), sizeof(CThostFtdcReqQueryAccountField::OperNo), FIELD_GBK},
+	{"RequestID", &KEY_RequestID, offsetof(CThostFtdcReqQueryAccountField, RequestID), sizeof(CThostFtdcReqQueryAccountField::RequestID), FIELD_INT},
+	{"TID", &KEY_TID, offsetof(CThostFtdcReqQueryAccountField, TID), sizeof(CThostFtdcReqQueryAccountField::TID), FIELD_INT},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcReqQueryAccountField, LongCustomerName), sizeof(CThostFtdcReqQueryAccountField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc OpenAccountFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcOpenAccountField, TradeCode), sizeof(CThostFtdcOpenAccountField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcOpenAccountField, BankID), sizeof(CThostFtdcOpenAccountField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcOpenAccountField, BankBranchID), sizeof(CThostFtdcOpenAccountField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcOpenAccountField, BrokerID), sizeof(CThostFtdcOpenAccountField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcOpenAccountField, BrokerBranchID), sizeof(CThostFtdcOpenAccountField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcOpenAccountField, TradeDate), sizeof(CThostFtdcOpenAccountField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcOpenAccountField, TradeTime), sizeof(CThostFtdcOpenAccountField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcOpenAccountField, BankSerial), sizeof(CThostFtdcOpenAccountField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcOpenAccountField, TradingDay), sizeof(CThostFtdcOpenAccountField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcOpenAccountField, PlateSerial), sizeof(CThostFtdcOpenAccountField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcOpenAccountField, LastFragment), sizeof(CThostFtdcOpenAccountField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcOpenAccountField, SessionID), sizeof(CThostFtdcOpenAccountField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcOpenAccountField, CustomerName), sizeof(CThostFtdcOpenAccountField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcOpenAccountField, IdCardType), sizeof(CThostFtdcOpenAccountField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcOpenAccountField, IdentifiedCardNo), sizeof(CThostFtdcOpenAccountField::IdentifiedCardNo), FIELD_GBK},
+	{"Gender", &KEY_Gender, offsetof(CThostFtdcOpenAccountField, Gender), sizeof(CThostFtdcOpenAccountField::Gender), FIELD_CHAR},
+	{"CountryCode", &KEY_CountryCode, offsetof(CThostFtdcOpenAccountField, CountryCode), sizeof(CThostFtdcOpenAccountField::CountryCode), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcOpenAccountField, CustType), sizeof(CThostFtdcOpenAccountField::CustType), FIELD_CHAR},
+	{"Address", &KEY_Address, offsetof(CThostFtdcOpenAccountField, Address), sizeof(CThostFtdcOpenAccountField::Address), FIELD_GBK},
+	{"ZipCode", &KEY_ZipCode, offsetof(CThostFtdcOpenAccountField, ZipCode), sizeof(CThostFtdcOpenAccountField::ZipCode), FIELD_GBK},
+	{"Telephone", &KEY_Telephone, offsetof(CThostFtdcOpenAccountField, Telephone), sizeof(CThostFtdcOpenAccountField::Telephone), FIELD_GBK},
+	{"MobilePhone", &KEY_MobilePhone, offsetof(CThostFtdcOpenAccountField, MobilePhone), sizeof(CThostFtdcOpenAccountField::MobilePhone), FIELD_GBK},
+	{"Fax", &KEY_Fax, offsetof(CThostFtdcOpenAccountField, Fax), sizeof(CThostFtdcOpenAccountField::Fax), FIELD_GBK},
+	{"EMail", &KEY_EMail, offsetof(CThostFtdcOpenAccountField, EMail), sizeof(CThostFtdcOpenAccountField::EMail), FIELD_GBK},
+	{"MoneyAccountStatus", &KEY_MoneyAccountStatus, offsetof(CThostFtdcOpenAccountField, MoneyAccountStatus), sizeof(CThostFtdcOpenAccountField::MoneyAccountStatus), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcOpenAccountField, BankAccount), sizeof(CThostFtdcOpenAccountField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcOpenAccountField, BankPassWord), sizeof(CThostFtdcOpenAccountField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcOpenAccountField, AccountID), sizeof(CThostFtdcOpenAccountField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcOpenAccountField, Password), sizeof(CThostFtdcOpenAccountField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcOpenAccountField, InstallID), sizeof(CThostFtdcOpenAccountField::InstallID), FIELD_INT},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcOpenAccountField, VerifyCertNoFlag), sizeof(CThostFtdcOpenAccountField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcOpenAccountField, CurrencyID), sizeof(CThostFtdcOpenAccountField::CurrencyID), FIELD_ASCII},
+	{"CashExchangeCode", &KEY_CashExchangeCode, offsetof(CThostFtdcOpenAccountField, CashExchangeCode), sizeof(CThostFtdcOpenAccountField::CashExchangeCode), FIELD_CHAR},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcOpenAccountField, Digest), sizeof(CThostFtdcOpenAccountField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcOpenAccountField, BankAccType), sizeof(CThostFtdcOpenAccountField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcOpenAccountField, DeviceID), sizeof(CThostFtdcOpenAccountField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcOpenAccountField, BankSecuAccType), sizeof(CThostFtdcOpenAccountField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcOpenAccountField, BrokerIDByBank), sizeof(CThostFtdcOpenAccountField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcOpenAccountField, BankSecuAcc), sizeof(CThostFtdcOpenAccountField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcOpenAccountField, BankPwdFlag), sizeof(CThostFtdcOpenAccountField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcOpenAccountField, SecuPwdFlag), sizeof(CThostFtdcOpenAccountField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcOpenAccountField, OperNo), sizeof(CThostFtdcOpenAccountField::OperNo), FIELD_GBK},
+	{"TID", &KEY_TID, offsetof(CThostFtdcOpenAccountField, TID), sizeof(CThostFtdcOpenAccountField::TID), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcOpenAccountField, UserID), sizeof(CThostFtdcOpenAccountField::UserID), FIELD_ASCII},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcOpenAccountField, ErrorID), sizeof(CThostFtdcOpenAccountField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcOpenAccountField, ErrorMsg), sizeof(CThostFtdcOpenAccountField::ErrorMsg), FIELD_GBK},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcOpenAccountField, LongCustomerName), sizeof(CThostFtdcOpenAccountField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc CancelAccountFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcCancelAccountField, TradeCode), sizeof(CThostFtdcCancelAccountField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcCancelAccountField, BankID), sizeof(CThostFtdcCancelAccountField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcCancelAccountField, BankBranchID), sizeof(CThostFtdcCancelAccountField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcCancelAccountField, BrokerID), sizeof(CThostFtdcCancelAccountField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcCancelAccountField, BrokerBranchID), sizeof(CThostFtdcCancelAccountField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcCancelAccountField, TradeDate), sizeof(CThostFtdcCancelAccountField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcCancelAccountField, TradeTime), sizeof(CThostFtdcCancelAccountField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcCancelAccountField, BankSerial), sizeof(CThostFtdcCancelAccountField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcCancelAccountField, TradingDay), sizeof(CThostFtdcCancelAccountField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcCancelAccountField, PlateSerial), sizeof(CThostFtdcCancelAccountField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcCancelAccountField, LastFragment), sizeof(CThostFtdcCancelAccountField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcCancelAccountField, SessionID), sizeof(CThostFtdcCancelAccountField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcCancelAccountField, CustomerName), sizeof(CThostFtdcCancelAccountField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcCancelAccountField, IdCardType), sizeof(CThostFtdcCancelAccountField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcCancelAccountField, IdentifiedCardNo), sizeof(CThostFtdcCancelAccountField::IdentifiedCardNo), FIELD_GBK},
+	{"Gender", &KEY_Gender, offsetof(CThostFtdcCancelAccountField, Gender), sizeof(CThostFtdcCancelAccountField::Gender), FIELD_CHAR},
+	{"CountryCode", &KEY_CountryCode, offsetof(CThostFtdcCancelAccountField, CountryCode), sizeof(CThostFtdcCancelAccountField::CountryCode), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcCancelAccountField, CustType), sizeof(CThostFtdcCancelAccountField::CustType), FIELD_CHAR},
+	{"Address", &KEY_Address, offsetof(CThostFtdcCancelAccountField, Address), sizeof(CThostFtdcCancelAccountField::Address), FIELD_GBK},
+	{"ZipCode", &KEY_ZipCode, offsetof(CThostFtdcCancelAccountField, ZipCode), sizeof(CThostFtdcCancelAccountField::ZipCode), FIELD_GBK},
+	{"Telephone", &KEY_Telephone, offsetof(CThostFtdcCancelAccountField, Telephone), sizeof(CThostFtdcCancelAccountField::Telephone), FIELD_GBK},
+	{"MobilePhone", &KEY_MobilePhone, offsetof(CThostFtdcCancelAccountField, MobilePhone), sizeof(CThostFtdcCancelAccountField::MobilePhone), FIELD_GBK},
+	{"Fax", &KEY_Fax, offsetof(CThostFtdcCancelAccountField, Fax), sizeof(CThostFtdcCancelAccountField::Fax), FIELD_GBK},
+	{"EMail", &KEY_EMail, offsetof(CThostFtdcCancelAccountField, EMail), sizeof(CThostFtdcCancelAccountField::EMail), FIELD_GBK},
+	{"MoneyAccountStatus", &KEY_MoneyAccountStatus, offsetof(CThostFtdcCancelAccountField, MoneyAccountStatus), sizeof(CThostFtdcCancelAccountField::MoneyAccountStatus), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcCancelAccountField, BankAccount), sizeof(CThostFtdcCancelAccountField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcCancelAccountField, BankPassWord), sizeof(CThostFtdcCancelAccountField::BankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcCancelAccountField, AccountID), sizeof(CThostFtdcCancelAccountField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcCancelAccountField, Password), sizeof(CThostFtdcCancelAccountField::Password), FIELD_GBK},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcCancelAccountField, InstallID), sizeof(CThostFtdcCancelAccountField::InstallID), FIELD_INT},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcCancelAccountField, VerifyCertNoFlag), sizeof(CThostFtdcCancelAccountField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcCancelAccountField, CurrencyID), sizeof(CThostFtdcCancelAccountField::CurrencyID), FIELD_ASCII},
+	{"CashExchangeCode", &KEY_CashExchangeCode, offsetof(CThostFtdcCancelAccountField, CashExchangeCode), sizeof(CThostFtdcCancelAccountField::CashExchangeCode), FIELD_CHAR},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcCancelAccountField, Digest), sizeof(CThostFtdcCancelAccountField::Digest), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcCancelAccountField, BankAccType), sizeof(CThostFtdcCancelAccountField::BankAccType), FIELD_CHAR},
+	{"DeviceID", &KEY_DeviceID, offsetof(CThostFtdcCancelAccountField, DeviceID), sizeof(CThostFtdcCancelAccountField::DeviceID), FIELD_GBK},
+	{"BankSecuAccType", &KEY_BankSecuAccType, offsetof(CThostFtdcCancelAccountField, BankSecuAccType), sizeof(CThostFtdcCancelAccountField::BankSecuAccType), FIELD_CHAR},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcCancelAccountField, BrokerIDByBank), sizeof(CThostFtdcCancelAccountField::BrokerIDByBank), FIELD_GBK},
+	{"BankSecuAcc", &KEY_BankSecuAcc, offsetof(CThostFtdcCancelAccountField, BankSecuAcc), sizeof(CThostFtdcCancelAccountField::BankSecuAcc), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcCancelAccountField, BankPwdFlag), sizeof(CThostFtdcCancelAccountField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcCancelAccountField, SecuPwdFlag), sizeof(CThostFtdcCancelAccountField::SecuPwdFlag), FIELD_CHAR},
+	{"OperNo", &KEY_OperNo, offsetof(CThostFtdcCancelAccountField, OperNo), sizeof(CThostFtdcCancelAccountField::OperNo), FIELD_GBK},
+	{"TID", &KEY_TID, offsetof(CThostFtdcCancelAccountField, TID), sizeof(CThostFtdcCancelAccountField::TID), FIELD_INT},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcCancelAccountField, UserID), sizeof(CThostFtdcCancelAccountField::UserID), FIELD_ASCII},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcCancelAccountField, ErrorID), sizeof(CThostFtdcCancelAccountField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcCancelAccountField, ErrorMsg), sizeof(CThostFtdcCancelAccountField::ErrorMsg), FIELD_GBK},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcCancelAccountField, LongCustomerName), sizeof(CThostFtdcCancelAccountField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc ChangeAccountFields[] = {
+	{"TradeCode", &KEY_TradeCode, offsetof(CThostFtdcChangeAccountField, TradeCode), sizeof(CThostFtdcChangeAccountField::TradeCode), FIELD_GBK},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcChangeAccountField, BankID), sizeof(CThostFtdcChangeAccountField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcChangeAccountField, BankBranchID), sizeof(CThostFtdcChangeAccountField::BankBranchID), FIELD_GBK},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcChangeAccountField, BrokerID), sizeof(CThostFtdcChangeAccountField::BrokerID), FIELD_ASCII},
+	{"BrokerBranchID", &KEY_BrokerBranchID, offsetof(CThostFtdcChangeAccountField, BrokerBranchID), sizeof(CThostFtdcChangeAccountField::BrokerBranchID), FIELD_GBK},
+	{"TradeDate", &KEY_TradeDate, offsetof(CThostFtdcChangeAccountField, TradeDate), sizeof(CThostFtdcChangeAccountField::TradeDate), FIELD_ASCII},
+	{"TradeTime", &KEY_TradeTime, offsetof(CThostFtdcChangeAccountField, TradeTime), sizeof(CThostFtdcChangeAccountField::TradeTime), FIELD_ASCII},
+	{"BankSerial", &KEY_BankSerial, offsetof(CThostFtdcChangeAccountField, BankSerial), sizeof(CThostFtdcChangeAccountField::BankSerial), FIELD_GBK},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcChangeAccountField, TradingDay), sizeof(CThostFtdcChangeAccountField::TradingDay), FIELD_ASCII},
+	{"PlateSerial", &KEY_PlateSerial, offsetof(CThostFtdcChangeAccountField, PlateSerial), sizeof(CThostFtdcChangeAccountField::PlateSerial), FIELD_INT},
+	{"LastFragment", &KEY_LastFragment, offsetof(CThostFtdcChangeAccountField, LastFragment), sizeof(CThostFtdcChangeAccountField::LastFragment), FIELD_CHAR},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcChangeAccountField, SessionID), sizeof(CThostFtdcChangeAccountField::SessionID), FIELD_INT},
+	{"CustomerName", &KEY_CustomerName, offsetof(CThostFtdcChangeAccountField, CustomerName), sizeof(CThostFtdcChangeAccountField::CustomerName), FIELD_GBK},
+	{"IdCardType", &KEY_IdCardType, offsetof(CThostFtdcChangeAccountField, IdCardType), sizeof(CThostFtdcChangeAccountField::IdCardType), FIELD_CHAR},
+	{"IdentifiedCardNo", &KEY_IdentifiedCardNo, offsetof(CThostFtdcChangeAccountField, IdentifiedCardNo), sizeof(CThostFtdcChangeAccountField::IdentifiedCardNo), FIELD_GBK},
+	{"Gender", &KEY_Gender, offsetof(CThostFtdcChangeAccountField, Gender), sizeof(CThostFtdcChangeAccountField::Gender), FIELD_CHAR},
+	{"CountryCode", &KEY_CountryCode, offsetof(CThostFtdcChangeAccountField, CountryCode), sizeof(CThostFtdcChangeAccountField::CountryCode), FIELD_GBK},
+	{"CustType", &KEY_CustType, offsetof(CThostFtdcChangeAccountField, CustType), sizeof(CThostFtdcChangeAccountField::CustType), FIELD_CHAR},
+	{"Address", &KEY_Address, offsetof(CThostFtdcChangeAccountField, Address), sizeof(CThostFtdcChangeAccountField::Address), FIELD_GBK},
+	{"ZipCode", &KEY_ZipCode, offsetof(CThostFtdcChangeAccountField, ZipCode), sizeof(CThostFtdcChangeAccountField::ZipCode), FIELD_GBK},
+	{"Telephone", &KEY_Telephone, offsetof(CThostFtdcChangeAccountField, Telephone), sizeof(CThostFtdcChangeAccountField::Telephone), FIELD_GBK},
+	{"MobilePhone", &KEY_MobilePhone, offsetof(CThostFtdcChangeAccountField, MobilePhone), sizeof(CThostFtdcChangeAccountField::MobilePhone), FIELD_GBK},
+	{"Fax", &KEY_Fax, offsetof(CThostFtdcChangeAccountField, Fax), sizeof(CThostFtdcChangeAccountField::Fax), FIELD_GBK},
+	{"EMail", &KEY_EMail, offsetof(CThostFtdcChangeAccountField, EMail), sizeof(CThostFtdcChangeAccountField::EMail), FIELD_GBK},
+	{"MoneyAccountStatus", &KEY_MoneyAccountStatus, offsetof(CThostFtdcChangeAccountField, MoneyAccountStatus), sizeof(CThostFtdcChangeAccountField::MoneyAccountStatus), FIELD_CHAR},
+	{"BankAccount", &KEY_BankAccount, offsetof(CThostFtdcChangeAccountField, BankAccount), sizeof(CThostFtdcChangeAccountField::BankAccount), FIELD_GBK},
+	{"BankPassWord", &KEY_BankPassWord, offsetof(CThostFtdcChangeAccountField, BankPassWord), sizeof(CThostFtdcChangeAccountField::BankPassWord), FIELD_GBK},
+	{"NewBankAccount", &KEY_NewBankAccount, offsetof(CThostFtdcChangeAccountField, NewBankAccount), sizeof(CThostFtdcChangeAccountField::NewBankAccount), FIELD_GBK},
+	{"NewBankPassWord", &KEY_NewBankPassWord, offsetof(CThostFtdcChangeAccountField, NewBankPassWord), sizeof(CThostFtdcChangeAccountField::NewBankPassWord), FIELD_GBK},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcChangeAccountField, AccountID), sizeof(CThostFtdcChangeAccountField::AccountID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcChangeAccountField, Password), sizeof(CThostFtdcChangeAccountField::Password), FIELD_GBK},
+	{"BankAccType", &KEY_BankAccType, offsetof(CThostFtdcChangeAccountField, BankAccType), sizeof(CThostFtdcChangeAccountField::BankAccType), FIELD_CHAR},
+	{"InstallID", &KEY_InstallID, offsetof(CThostFtdcChangeAccountField, InstallID), sizeof(CThostFtdcChangeAccountField::InstallID), FIELD_INT},
+	{"VerifyCertNoFlag", &KEY_VerifyCertNoFlag, offsetof(CThostFtdcChangeAccountField, VerifyCertNoFlag), sizeof(CThostFtdcChangeAccountField::VerifyCertNoFlag), FIELD_CHAR},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcChangeAccountField, CurrencyID), sizeof(CThostFtdcChangeAccountField::CurrencyID), FIELD_ASCII},
+	{"BrokerIDByBank", &KEY_BrokerIDByBank, offsetof(CThostFtdcChangeAccountField, BrokerIDByBank), sizeof(CThostFtdcChangeAccountField::BrokerIDByBank), FIELD_GBK},
+	{"BankPwdFlag", &KEY_BankPwdFlag, offsetof(CThostFtdcChangeAccountField, BankPwdFlag), sizeof(CThostFtdcChangeAccountField::BankPwdFlag), FIELD_CHAR},
+	{"SecuPwdFlag", &KEY_SecuPwdFlag, offsetof(CThostFtdcChangeAccountField, SecuPwdFlag), sizeof(CThostFtdcChangeAccountField::SecuPwdFlag), FIELD_CHAR},
+	{"TID", &KEY_TID, offsetof(CThostFtdcChangeAccountField, TID), sizeof(CThostFtdcChangeAccountField::TID), FIELD_INT},
+	{"Digest", &KEY_Digest, offsetof(CThostFtdcChangeAccountField, Digest), sizeof(CThostFtdcChangeAccountField::Digest), FIELD_GBK},
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcChangeAccountField, ErrorID), sizeof(CThostFtdcChangeAccountField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcChangeAccountField, ErrorMsg), sizeof(CThostFtdcChangeAccountField::ErrorMsg), FIELD_GBK},
+	{"LongCustomerName", &KEY_LongCustomerName, offsetof(CThostFtdcChangeAccountField, LongCustomerName), sizeof(CThostFtdcChangeAccountField::LongCustomerName), FIELD_GBK},
+};
+
+static const FieldDesc CombPromotionParamFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcCombPromotionParamField, ExchangeID), sizeof(CThostFtdcCombPromotionParamField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcCombPromotionParamField, InstrumentID), sizeof(CThostFtdcCombPromotionParamField::InstrumentID), FIELD_ASCII},
+	{"CombHedgeFlag", &KEY_CombHedgeFlag, offsetof(CThostFtdcCombPromotionParamField, CombHedgeFlag), sizeof(CThostFtdcCombPromotionParamField::CombHedgeFlag), FIELD_ASCII},
+	{"Xparameter", &KEY_Xparameter, offsetof(CThostFtdcCombPromotionParamField, Xparameter), sizeof(CThostFtdcCombPromotionParamField::Xparameter), FIELD_DOUBLE},
+};
+
+static const FieldDesc RiskSettleInvstPositionFields[] = {
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcRiskSettleInvstPositionField, InstrumentID), sizeof(CThostFtdcRiskSettleInvstPositionField::InstrumentID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRiskSettleInvstPositionField, BrokerID), sizeof(CThostFtdcRiskSettleInvstPositionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcRiskSettleInvstPositionField, InvestorID), sizeof(CThostFtdcRiskSettleInvstPositionField::InvestorID), FIELD_ASCII},
+	{"PosiDirection", &KEY_PosiDirection, offsetof(CThostFtdcRiskSettleInvstPositionField, PosiDirection), sizeof(CThostFtdcRiskSettleInvstPositionField::PosiDirection), FIELD_CHAR},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcRiskSettleInvstPositionField, HedgeFlag), sizeof(CThostFtdcRiskSettleInvstPositionField::HedgeFlag), FIELD_CHAR},
+	{"PositionDate", &KEY_PositionDate, offsetof(CThostFtdcRiskSettleInvstPositionField, PositionDate), sizeof(CThostFtdcRiskSettleInvstPositionField::PositionDate), FIELD_CHAR},
+	{"YdPosition", &KEY_YdPosition, offsetof(CThostFtdcRiskSettleInvstPositionField, YdPosition), sizeof(CThostFtdcRiskSettleInvstPositionField::YdPosition), FIELD_INT},
+	{"Position", &KEY_Position, offsetof(CThostFtdcRiskSettleInvstPositionField, Position), sizeof(CThostFtdcRiskSettleInvstPositionField::Position), FIELD_INT},
+	{"LongFrozen", &KEY_LongFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, LongFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::LongFrozen), FIELD_INT},
+	{"ShortFrozen", &KEY_ShortFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, ShortFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::ShortFrozen), FIELD_INT},
+	{"LongFrozenAmount", &KEY_LongFrozenAmount, offsetof(CThostFtdcRiskSettleInvstPositionField, LongFrozenAmount), sizeof(CThostFtdcRiskSettleInvstPositionField::LongFrozenAmount), FIELD_DOUBLE},
+	{"ShortFrozenAmount", &KEY_ShortFrozenAmount, offsetof(CThostFtdcRiskSettleInvstPositionField, ShortFrozenAmount), sizeof(CThostFtdcRiskSettleInvstPositionField::ShortFrozenAmount), FIELD_DOUBLE},
+	{"OpenVolume", &KEY_OpenVolume, offsetof(CThostFtdcRiskSettleInvstPositionField, OpenVolume), sizeof(CThostFtdcRiskSettleInvstPositionField::OpenVolume), FIELD_INT},
+	{"CloseVolume", &KEY_CloseVolume, offsetof(CThostFtdcRiskSettleInvstPositionField, CloseVolume), sizeof(CThostFtdcRiskSettleInvstPositionField::CloseVolume), FIELD_INT},
+	{"OpenAmount", &KEY_OpenAmount, offsetof(CThostFtdcRiskSettleInvstPositionField, OpenAmount), sizeof(CThostFtdcRiskSettleInvstPositionField::OpenAmount), FIELD_DOUBLE},
+	{"CloseAmount", &KEY_CloseAmount, offsetof(CThostFtdcRiskSettleInvstPositionField, CloseAmount), sizeof(CThostFtdcRiskSettleInvstPositionField::CloseAmount), FIELD_DOUBLE},
+	{"PositionCost", &KEY_PositionCost, offsetof(CThostFtdcRiskSettleInvstPositionField, PositionCost), sizeof(CThostFtdcRiskSettleInvstPositionField::PositionCost), FIELD_DOUBLE},
+	{"PreMargin", &KEY_PreMargin, offsetof(CThostFtdcRiskSettleInvstPositionField, PreMargin), sizeof(CThostFtdcRiskSettleInvstPositionField::PreMargin), FIELD_DOUBLE},
+	{"UseMargin", &KEY_UseMargin, offsetof(CThostFtdcRiskSettleInvstPositionField, UseMargin), sizeof(CThostFtdcRiskSettleInvstPositionField::UseMargin), FIELD_DOUBLE},
+	{"FrozenMargin", &KEY_FrozenMargin, offsetof(CThostFtdcRiskSettleInvstPositionField, FrozenMargin), sizeof(CThostFtdcRiskSettleInvstPositionField::FrozenMargin), FIELD_DOUBLE},
+	{"FrozenCash", &KEY_FrozenCash, offsetof(CThostFtdcRiskSettleInvstPositionField, FrozenCash), sizeof(CThostFtdcRiskSettleInvstPositionField::FrozenCash), FIELD_DOUBLE},
+	{"FrozenCommission", &KEY_FrozenCommission, offsetof(CThostFtdcRiskSettleInvstPositionField, FrozenCommission), sizeof(CThostFtdcRiskSettleInvstPositionField::FrozenCommission), FIELD_DOUBLE},
+	{"CashIn", &KEY_CashIn, offsetof(CThostFtdcRiskSettleInvstPositionField, CashIn), sizeof(CThostFtdcRiskSettleInvstPositionField::CashIn), FIELD_DOUBLE},
+	{"Commission", &KEY_Commission, offsetof(CThostFtdcRiskSettleInvstPositionField, Commission), sizeof(CThostFtdcRiskSettleInvstPositionField::Commission), FIELD_DOUBLE},
+	{"CloseProfit", &KEY_CloseProfit, offsetof(CThostFtdcRiskSettleInvstPositionField, CloseProfit), sizeof(CThostFtdcRiskSettleInvstPositionField::CloseProfit), FIELD_DOUBLE},
+	{"PositionProfit", &KEY_PositionProfit, offsetof(CThostFtdcRiskSettleInvstPositionField, PositionProfit), sizeof(CThostFtdcRiskSettleInvstPositionField::PositionProfit), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcRiskSettleInvstPositionField, PreSettlementPrice), sizeof(CThostFtdcRiskSettleInvstPositionField::PreSettlementPrice), FIELD_DOUBLE},
+	{"SettlementPrice", &KEY_SettlementPrice, offsetof(CThostFtdcRiskSettleInvstPositionField, SettlementPrice), sizeof(CThostFtdcRiskSettleInvstPositionField::SettlementPrice), FIELD_DOUBLE},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRiskSettleInvstPositionField, TradingDay), sizeof(CThostFtdcRiskSettleInvstPositionField::TradingDay), FIELD_ASCII},
+	{"SettlementID", &KEY_SettlementID, offsetof(CThostFtdcRiskSettleInvstPositionField, SettlementID), sizeof(CThostFtdcRiskSettleInvstPositionField::SettlementID), FIELD_INT},
+	{"OpenCost", &KEY_OpenCost, offsetof(CThostFtdcRiskSettleInvstPositionField, OpenCost), sizeof(CThostFtdcRiskSettleInvstPositionField::OpenCost), FIELD_DOUBLE},
+	{"ExchangeMargin", &KEY_ExchangeMargin, offsetof(CThostFtdcRiskSettleInvstPositionField, ExchangeMargin), sizeof(CThostFtdcRiskSettleInvstPositionField::ExchangeMargin), FIELD_DOUBLE},
+	{"CombPosition", &KEY_CombPosition, offsetof(CThostFtdcRiskSettleInvstPositionField, CombPosition), sizeof(CThostFtdcRiskSettleInvstPositionField::CombPosition), FIELD_INT},
+	{"CombLongFrozen", &KEY_CombLongFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, CombLongFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::CombLongFrozen), FIELD_INT},
+	{"CombShortFrozen", &KEY_CombShortFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, CombShortFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::CombShortFrozen), FIELD_INT},
+	{"CloseProfitByDate", &KEY_CloseProfitByDate, offsetof(CThostFtdcRiskSettleInvstPositionField, CloseProfitByDate), sizeof(CThostFtdcRiskSettleInvstPositionField::CloseProfitByDate), FIELD_DOUBLE},
+	{"CloseProfitByTrade", &KEY_CloseProfitByTrade, offsetof(CThostFtdcRiskSettleInvstPositionField, CloseProfitByTrade), sizeof(CThostFtdcRiskSettleInvstPositionField::CloseProfitByTrade), FIELD_DOUBLE},
+	{"TodayPosition", &KEY_TodayPosition, offsetof(CThostFtdcRiskSettleInvstPositionField, TodayPosition), sizeof(CThostFtdcRiskSettleInvstPositionField::TodayPosition), FIELD_INT},
+	{"MarginRateByMoney", &KEY_MarginRateByMoney, offsetof(CThostFtdcRiskSettleInvstPositionField, MarginRateByMoney), sizeof(CThostFtdcRiskSettleInvstPositionField::MarginRateByMoney), FIELD_DOUBLE},
+	{"MarginRateByVolume", &KEY_MarginRateByVolume, offsetof(CThostFtdcRiskSettleInvstPositionField, MarginRateByVolume), sizeof(CThostFtdcRiskSettleInvstPositionField::MarginRateByVolume), FIELD_DOUBLE},
+	{"StrikeFrozen", &KEY_StrikeFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, StrikeFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::StrikeFrozen), FIELD_INT},
+	{"StrikeFrozenAmount", &KEY_StrikeFrozenAmount, offsetof(CThostFtdcRiskSettleInvstPositionField, StrikeFrozenAmount), sizeof(CThostFtdcRiskSettleInvstPositionField::StrikeFrozenAmount), FIELD_DOUBLE},
+	{"AbandonFrozen", &KEY_AbandonFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, AbandonFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::AbandonFrozen), FIELD_INT},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRiskSettleInvstPositionField, ExchangeID), sizeof(CThostFtdcRiskSettleInvstPositionField::ExchangeID), FIELD_ASCII},
+	{"YdStrikeFrozen", &KEY_YdStrikeFrozen, offsetof(CThostFtdcRiskSettleInvstPositionField, YdStrikeFrozen), sizeof(CThostFtdcRiskSettleInvstPositionField::YdStrikeFrozen), FIELD_INT},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcRiskSettleInvstPositionField, InvestUnitID), sizeof(CThostFtdcRiskSettleInvstPositionField::InvestUnitID), FIELD_ASCII},
+	{"PositionCostOffset", &KEY_PositionCostOffset, offsetof(CThostFtdcRiskSettleInvstPositionField, PositionCostOffset), sizeof(CThostFtdcRiskSettleInvstPositionField::PositionCostOffset), FIELD_DOUBLE},
+	{"TasPosition", &KEY_TasPosition, offsetof(CThostFtdcRiskSettleInvstPositionField, TasPosition), sizeof(CThostFtdcRiskSettleInvstPositionField::TasPosition), FIELD_INT},
+	{"TasPositionCost", &KEY_TasPositionCost, offsetof(CThostFtdcRiskSettleInvstPositionField, TasPositionCost), sizeof(CThostFtdcRiskSettleInvstPositionField::TasPositionCost), FIELD_DOUBLE},
+};
+
+static const FieldDesc RiskSettleProductStatusFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRiskSettleProductStatusField, ExchangeID), sizeof(CThostFtdcRiskSettleProductStatusField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcRiskSettleProductStatusField, ProductID), sizeof(CThostFtdcRiskSettleProductStatusField::ProductID), FIELD_ASCII},
+	{"ProductStatus", &KEY_ProductStatus, offsetof(CThostFtdcRiskSettleProductStatusField, ProductStatus), sizeof(CThostFtdcRiskSettleProductStatusField::ProductStatus), FIELD_CHAR},
+};
+
+static const FieldDesc SPBMFutureParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcSPBMFutureParameterField, TradingDay), sizeof(CThostFtdcSPBMFutureParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMFutureParameterField, ExchangeID), sizeof(CThostFtdcSPBMFutureParameterField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcSPBMFutureParameterField, InstrumentID), sizeof(CThostFtdcSPBMFutureParameterField::InstrumentID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcSPBMFutureParameterField, ProdFamilyCode), sizeof(CThostFtdcSPBMFutureParameterField::ProdFamilyCode), FIELD_ASCII},
+	{"Cvf", &KEY_Cvf, offsetof(CThostFtdcSPBMFutureParameterField, Cvf), sizeof(CThostFtdcSPBMFutureParameterField::Cvf), FIELD_INT},
+	{"TimeRange", &KEY_TimeRange, offsetof(CThostFtdcSPBMFutureParameterField, TimeRange), sizeof(CThostFtdcSPBMFutureParameterField::TimeRange), FIELD_CHAR},
+	{"MarginRate", &KEY_MarginRate, offsetof(CThostFtdcSPBMFutureParameterField, MarginRate), sizeof(CThostFtdcSPBMFutureParameterField::MarginRate), FIELD_DOUBLE},
+	{"LockRateX", &KEY_LockRateX, offsetof(CThostFtdcSPBMFutureParameterField, LockRateX), sizeof(CThostFtdcSPBMFutureParameterField::LockRateX), FIELD_DOUBLE},
+	{"AddOnRate", &KEY_AddOnRate, offsetof(CThostFtdcSPBMFutureParameterField, AddOnRate), sizeof(CThostFtdcSPBMFutureParameterField::AddOnRate), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcSPBMFutureParameterField, PreSettlementPrice), sizeof(CThostFtdcSPBMFutureParameterField::PreSettlementPrice), FIELD_DOUBLE},
+	{"AddOnLockRateX2", &KEY_AddOnLockRateX2, offsetof(CThostFtdcSPBMFutureParameterField, AddOnLockRateX2), sizeof(CThostFtdcSPBMFutureParameterField::AddOnLockRateX2), FIELD_DOUBLE},
+};
+
+static const FieldDesc SPBMOptionParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcSPBMOptionParameterField, TradingDay), sizeof(CThostFtdcSPBMOptionParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMOptionParameterField, ExchangeID), sizeof(CThostFtdcSPBMOptionParameterField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcSPBMOptionParameterField, InstrumentID), sizeof(CThostFtdcSPBMOptionParameterField::InstrumentID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcSPBMOptionParameterField, ProdFamilyCode), sizeof(CThostFtdcSPBMOptionParameterField::ProdFamilyCode), FIELD_ASCII},
+	{"Cvf", &KEY_Cvf, offsetof(CThostFtdcSPBMOptionParameterField, Cvf), sizeof(CThostFtdcSPBMOptionParameterField::Cvf), FIELD_INT},
+	{"DownPrice", &KEY_DownPrice, offsetof(CThostFtdcSPBMOptionParameterField, DownPrice), sizeof(CThostFtdcSPBMOptionParameterField::DownPrice), FIELD_DOUBLE},
+	{"Delta", &KEY_Delta, offsetof(CThostFtdcSPBMOptionParameterField, Delta), sizeof(CThostFtdcSPBMOptionParameterField::Delta), FIELD_DOUBLE},
+	{"SlimiDelta", &KEY_SlimiDelta, offsetof(CThostFtdcSPBMOptionParameterField, SlimiDelta), sizeof(CThostFtdcSPBMOptionParameterField::SlimiDelta), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcSPBMOptionParameterField, PreSettlementPrice), sizeof(CThostFtdcSPBMOptionParameterField::PreSettlementPrice), FIELD_DOUBLE},
+};
+
+static const FieldDesc SPBMIntraParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcSPBMIntraParameterField, TradingDay), sizeof(CThostFtdcSPBMIntraParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMIntraParameterField, ExchangeID), sizeof(CThostFtdcSPBMIntraParameterField::ExchangeID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcSPBMIntraParameterField, ProdFamilyCode), sizeof(CThostFtdcSPBMIntraParameterField::ProdFamilyCode), FIELD_ASCII},
+	{"IntraRateY", &KEY_IntraRateY, offsetof(CThostFtdcSPBMIntraParameterField, IntraRateY), sizeof(CThostFtdcSPBMIntraParameterField::IntraRateY), FIELD_DOUBLE},
+	{"AddOnIntraRateY2", &KEY_AddOnIntraRateY2, offsetof(CThostFtdcSPBMIntraParameterField, AddOnIntraRateY2), sizeof(CThostFtdcSPBMIntraParameterField::AddOnIntraRateY2), FIELD_DOUBLE},
+};
+
+static const FieldDesc SPBMInterParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcSPBMInterParameterField, TradingDay), sizeof(CThostFtdcSPBMInterParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMInterParameterField, ExchangeID), sizeof(CThostFtdcSPBMInterParameterField::ExchangeID), FIELD_ASCII},
+	{"SpreadId", &KEY_SpreadId, offsetof(CThostFtdcSPBMInterParameterField, SpreadId), sizeof(CThostFtdcSPBMInterParameterField::SpreadId), FIELD_INT},
+	{"InterRateZ", &KEY_InterRateZ, offsetof(CThostFtdcSPBMInterParameterField, InterRateZ), sizeof(CThostFtdcSPBMInterParameterField::InterRateZ), FIELD_DOUBLE},
+	{"Leg1ProdFamilyCode", &KEY_Leg1ProdFamilyCode, offsetof(CThostFtdcSPBMInterParameterField, Leg1ProdFamilyCode), sizeof(CThostFtdcSPBMInterParameterField::Leg1ProdFamilyCode), FIELD_ASCII},
+	{"Leg2ProdFamilyCode", &KEY_Leg2ProdFamilyCode, offsetof(CThostFtdcSPBMInterParameterField, Leg2ProdFamilyCode), sizeof(CThostFtdcSPBMInterParameterField::Leg2ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc SPBMPortfDefinitionFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMPortfDefinitionField, ExchangeID), sizeof(CThostFtdcSPBMPortfDefinitionField::ExchangeID), FIELD_ASCII},
+	{"PortfolioDefID", &KEY_PortfolioDefID, offsetof(CThostFtdcSPBMPortfDefinitionField, PortfolioDefID), sizeof(CThostFtdcSPBMPortfDefinitionField::PortfolioDefID), FIELD_INT},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcSPBMPortfDefinitionField, ProdFamilyCode), sizeof(CThostFtdcSPBMPortfDefinitionField::ProdFamilyCode), FIELD_ASCII},
+	{"IsSPBM", &KEY_IsSPBM, offsetof(CThostFtdcSPBMPortfDefinitionField, IsSPBM), sizeof(CThostFtdcSPBMPortfDefinitionField::IsSPBM), FIELD_INT},
+};
+
+static const FieldDesc SPBMInvestorPortfDefFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMInvestorPortfDefField, ExchangeID), sizeof(CThostFtdcSPBMInvestorPortfDefField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcSPBMInvestorPortfDefField, BrokerID), sizeof(CThostFtdcSPBMInvestorPortfDefField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcSPBMInvestorPortfDefField, InvestorID), sizeof(CThostFtdcSPBMInvestorPortfDefField::InvestorID), FIELD_ASCII},
+	{"PortfolioDefID", &KEY_PortfolioDefID, offsetof(CThostFtdcSPBMInvestorPortfDefField, PortfolioDefID), sizeof(CThostFtdcSPBMInvestorPortfDefField::PortfolioDefID), FIELD_INT},
+};
+
+static const FieldDesc InvestorPortfMarginRatioFields[] = {
+	{"InvestorRange", &KEY_InvestorRange, offsetof(CThostFtdcInvestorPortfMarginRatioField, InvestorRange), sizeof(CThostFtdcInvestorPortfMarginRatioField::InvestorRange), FIELD_CHAR},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorPortfMarginRatioField, BrokerID), sizeof(CThostFtdcInvestorPortfMarginRatioField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorPortfMarginRatioField, InvestorID), sizeof(CThostFtdcInvestorPortfMarginRatioField::InvestorID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorPortfMarginRatioField, ExchangeID), sizeof(CThostFtdcInvestorPortfMarginRatioField::ExchangeID), FIELD_ASCII},
+	{"MarginRatio", &KEY_MarginRatio, offsetof(CThostFtdcInvestorPortfMarginRatioField, MarginRatio), sizeof(CThostFtdcInvestorPortfMarginRatioField::MarginRatio), FIELD_DOUBLE},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcInvestorPortfMarginRatioField, ProductGroupID), sizeof(CThostFtdcInvestorPortfMarginRatioField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc InvestorProdSPBMDetailFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorProdSPBMDetailField, ExchangeID), sizeof(CThostFtdcInvestorProdSPBMDetailField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorProdSPBMDetailField, BrokerID), sizeof(CThostFtdcInvestorProdSPBMDetailField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorProdSPBMDetailField, InvestorID), sizeof(CThostFtdcInvestorProdSPBMDetailField::InvestorID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcInvestorProdSPBMDetailField, ProdFamilyCode), sizeof(CThostFtdcInvestorProdSPBMDetailField::ProdFamilyCode), FIELD_ASCII},
+	{"IntraInstrMargin", &KEY_IntraInstrMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, IntraInstrMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::IntraInstrMargin), FIELD_DOUBLE},
+	{"BCollectingMargin", &KEY_BCollectingMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, BCollectingMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::BCollectingMargin), FIELD_DOUBLE},
+	{"SCollectingMargin", &KEY_SCollectingMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, SCollectingMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::SCollectingMargin), FIELD_DOUBLE},
+	{"IntraProdMargin", &KEY_IntraProdMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, IntraProdMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::IntraProdMargin), FIELD_DOUBLE},
+	{"NetMargin", &KEY_NetMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, NetMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::NetMargin), FIELD_DOUBLE},
+	{"InterProdMargin", &KEY_InterProdMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, InterProdMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::InterProdMargin), FIELD_DOUBLE},
+	{"SingleMargin", &KEY_SingleMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, SingleMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::SingleMargin), FIELD_DOUBLE},
+	{"AddOnMargin", &KEY_AddOnMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, AddOnMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::AddOnMargin), FIELD_DOUBLE},
+	{"DeliveryMargin", &KEY_DeliveryMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, DeliveryMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::DeliveryMargin), FIELD_DOUBLE},
+	{"CallOptionMinRisk", &KEY_CallOptionMinRisk, offsetof(CThostFtdcInvestorProdSPBMDetailField, CallOptionMinRisk), sizeof(CThostFtdcInvestorProdSPBMDetailField::CallOptionMinRisk), FIELD_DOUBLE},
+	{"PutOptionMinRisk", &KEY_PutOptionMinRisk, offsetof(CThostFtdcInvestorProdSPBMDetailField, PutOptionMinRisk), sizeof(CThostFtdcInvestorProdSPBMDetailField::PutOptionMinRisk), FIELD_DOUBLE},
+	{"OptionMinRisk", &KEY_OptionMinRisk, offsetof(CThostFtdcInvestorProdSPBMDetailField, OptionMinRisk), sizeof(CThostFtdcInvestorProdSPBMDetailField::OptionMinRisk), FIELD_DOUBLE},
+	{"OptionValueOffset", &KEY_OptionValueOffset, offsetof(CThostFtdcInvestorProdSPBMDetailField, OptionValueOffset), sizeof(CThostFtdcInvestorProdSPBMDetailField::OptionValueOffset), FIELD_DOUBLE},
+	{"OptionRoyalty", &KEY_OptionRoyalty, offsetof(CThostFtdcInvestorProdSPBMDetailField, OptionRoyalty), sizeof(CThostFtdcInvestorProdSPBMDetailField::OptionRoyalty), FIELD_DOUBLE},
+	{"RealOptionValueOffset", &KEY_RealOptionValueOffset, offsetof(CThostFtdcInvestorProdSPBMDetailField, RealOptionValueOffset), sizeof(CThostFtdcInvestorProdSPBMDetailField::RealOptionValueOffset), FIELD_DOUBLE},
+	{"Margin", &KEY_Margin, offsetof(CThostFtdcInvestorProdSPBMDetailField, Margin), sizeof(CThostFtdcInvestorProdSPBMDetailField::Margin), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorProdSPBMDetailField, ExchMargin), sizeof(CThostFtdcInvestorProdSPBMDetailField::ExchMargin), FIELD_DOUBLE},
+};
+
+static const FieldDesc InvestorCommoditySPMMMarginFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, ExchangeID), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, BrokerID), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, InvestorID), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::InvestorID), FIELD_ASCII},
+	{"CommodityID", &KEY_CommodityID, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, CommodityID), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::CommodityID), FIELD_GBK},
+	{"MarginBeforeDiscount", &KEY_MarginBeforeDiscount, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, MarginBeforeDiscount), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::MarginBeforeDiscount), FIELD_DOUBLE},
+	{"MarginNoDiscount", &KEY_MarginNoDiscount, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, MarginNoDiscount), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::MarginNoDiscount), FIELD_DOUBLE},
+	{"LongPosRisk", &KEY_LongPosRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, LongPosRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::LongPosRisk), FIELD_DOUBLE},
+	{"LongOpenFrozenRisk", &KEY_LongOpenFrozenRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, LongOpenFrozenRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::LongOpenFrozenRisk), FIELD_DOUBLE},
+	{"LongCloseFrozenRisk", &KEY_LongCloseFrozenRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, LongCloseFrozenRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::LongCloseFrozenRisk), FIELD_DOUBLE},
+	{"ShortPosRisk", &KEY_ShortPosRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, ShortPosRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::ShortPosRisk), FIELD_DOUBLE},
+	{"ShortOpenFrozenRisk", &KEY_ShortOpenFrozenRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, ShortOpenFrozenRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::ShortOpenFrozenRisk), FIELD_DOUBLE},
+	{"ShortCloseFrozenRisk", &KEY_ShortCloseFrozenRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, ShortCloseFrozenRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::ShortCloseFrozenRisk), FIELD_DOUBLE},
+	{"IntraCommodityRate", &KEY_IntraCommodityRate, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, IntraCommodityRate), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::IntraCommodityRate), FIELD_DOUBLE},
+	{"OptionDiscountRate", &KEY_OptionDiscountRate, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, OptionDiscountRate), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::OptionDiscountRate), FIELD_DOUBLE},
+	{"PosDiscount", &KEY_PosDiscount, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, PosDiscount), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::PosDiscount), FIELD_DOUBLE},
+	{"OpenFrozenDiscount", &KEY_OpenFrozenDiscount, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, OpenFrozenDiscount), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::OpenFrozenDiscount), FIELD_DOUBLE},
+	{"NetRisk", &KEY_NetRisk, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, NetRisk), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::NetRisk), FIELD_DOUBLE},
+	{"CloseFrozenMargin", &KEY_CloseFrozenMargin, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, CloseFrozenMargin), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::CloseFrozenMargin), FIELD_DOUBLE},
+	{"FrozenCommission", &KEY_FrozenCommission, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, FrozenCommission), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::FrozenCommission), FIELD_DOUBLE},
+	{"Commission", &KEY_Commission, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, Commission), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::Commission), FIELD_DOUBLE},
+	{"FrozenCash", &KEY_FrozenCash, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, FrozenCash), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::FrozenCash), FIELD_DOUBLE},
+	{"CashIn", &KEY_CashIn, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, CashIn), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::CashIn), FIELD_DOUBLE},
+	{"StrikeFrozenMargin", &KEY_StrikeFrozenMargin, offsetof(CThostFtdcInvestorCommoditySPMMMarginField, StrikeFrozenMargin), sizeof(CThostFtdcInvestorCommoditySPMMMarginField::StrikeFrozenMargin), FIELD_DOUBLE},
+};
+
+static const FieldDesc InvestorCommodityGroupSPMMMarginFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, ExchangeID), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, BrokerID), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, InvestorID), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::InvestorID), FIELD_ASCII},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, CommodityGroupID), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::CommodityGroupID), FIELD_GBK},
+	{"MarginBeforeDiscount", &KEY_MarginBeforeDiscount, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, MarginBeforeDiscount), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::MarginBeforeDiscount), FIELD_DOUBLE},
+	{"MarginNoDiscount", &KEY_MarginNoDiscount, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, MarginNoDiscount), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::MarginNoDiscount), FIELD_DOUBLE},
+	{"LongRisk", &KEY_LongRisk, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, LongRisk), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::LongRisk), FIELD_DOUBLE},
+	{"ShortRisk", &KEY_ShortRisk, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, ShortRisk), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::ShortRisk), FIELD_DOUBLE},
+	{"CloseFrozenMargin", &KEY_CloseFrozenMargin, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, CloseFrozenMargin), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::CloseFrozenMargin), FIELD_DOUBLE},
+	{"InterCommodityRate", &KEY_InterCommodityRate, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, InterCommodityRate), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::InterCommodityRate), FIELD_DOUBLE},
+	{"MiniMarginRatio", &KEY_MiniMarginRatio, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, MiniMarginRatio), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::MiniMarginRatio), FIELD_DOUBLE},
+	{"AdjustRatio", &KEY_AdjustRatio, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, AdjustRatio), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::AdjustRatio), FIELD_DOUBLE},
+	{"IntraCommodityDiscount", &KEY_IntraCommodityDiscount, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, IntraCommodityDiscount), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::IntraCommodityDiscount), FIELD_DOUBLE},
+	{"InterCommodityDiscount", &KEY_InterCommodityDiscount, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, InterCommodityDiscount), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::InterCommodityDiscount), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, ExchMargin), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::ExchMargin), FIELD_DOUBLE},
+	{"InvestorMargin", &KEY_InvestorMargin, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, InvestorMargin), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::InvestorMargin), FIELD_DOUBLE},
+	{"FrozenCommission", &KEY_FrozenCommission, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, FrozenCommission), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::FrozenCommission), FIELD_DOUBLE},
+	{"Commission", &KEY_Commission, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, Commission), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::Commission), FIELD_DOUBLE},
+	{"FrozenCash", &KEY_FrozenCash, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, FrozenCash), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::FrozenCash), FIELD_DOUBLE},
+	{"CashIn", &KEY_CashIn, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, CashIn), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::CashIn), FIELD_DOUBLE},
+	{"StrikeFrozenMargin", &KEY_StrikeFrozenMargin, offsetof(CThostFtdcInvestorCommodityGroupSPMMMarginField, StrikeFrozenMargin), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField::StrikeFrozenMargin), FIELD_DOUBLE},
+};
+
+static const FieldDesc SPMMInstParamFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPMMInstParamField, ExchangeID), sizeof(CThostFtdcSPMMInstParamField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcSPMMInstParamField, InstrumentID), sizeof(CThostFtdcSPMMInstParamField::InstrumentID), FIELD_ASCII},
+	{"InstMarginCalID", &KEY_InstMarginCalID, offsetof(CThostFtdcSPMMInstParamField, InstMarginCalID), sizeof(CThostFtdcSPMMInstParamField::InstMarginCalID), FIELD_CHAR},
+	{"CommodityID", &KEY_CommodityID, offsetof(CThostFtdcSPMMInstParamField, CommodityID), sizeof(CThostFtdcSPMMInstParamField::CommodityID), FIELD_GBK},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcSPMMInstParamField, CommodityGroupID), sizeof(CThostFtdcSPMMInstParamField::CommodityGroupID), FIELD_GBK},
+};
+
+static const FieldDesc SPMMProductParamFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPMMProductParamField, ExchangeID), sizeof(CThostFtdcSPMMProductParamField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcSPMMProductParamField, ProductID), sizeof(CThostFtdcSPMMProductParamField::ProductID), FIELD_GBK},
+	{"CommodityID", &KEY_CommodityID, offsetof(CThostFtdcSPMMProductParamField, CommodityID), sizeof(CThostFtdcSPMMProductParamField::CommodityID), FIELD_GBK},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcSPMMProductParamField, CommodityGroupID), sizeof(CThostFtdcSPMMProductParamField::CommodityGroupID), FIELD_GBK},
+};
+
+static const FieldDesc SPBMAddOnInterParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcSPBMAddOnInterParameterField, TradingDay), sizeof(CThostFtdcSPBMAddOnInterParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcSPBMAddOnInterParameterField, ExchangeID), sizeof(CThostFtdcSPBMAddOnInterParameterField::ExchangeID), FIELD_ASCII},
+	{"SpreadId", &KEY_SpreadId, offsetof(CThostFtdcSPBMAddOnInterParameterField, SpreadId), sizeof(CThostFtdcSPBMAddOnInterParameterField::SpreadId), FIELD_INT},
+	{"AddOnInterRateZ2", &KEY_AddOnInterRateZ2, offsetof(CThostFtdcSPBMAddOnInterParameterField, AddOnInterRateZ2), sizeof(CThostFtdcSPBMAddOnInterParameterField::AddOnInterRateZ2), FIELD_DOUBLE},
+	{"Leg1ProdFamilyCode", &KEY_Leg1ProdFamilyCode, offsetof(CThostFtdcSPBMAddOnInterParameterField, Leg1ProdFamilyCode), sizeof(CThostFtdcSPBMAddOnInterParameterField::Leg1ProdFamilyCode), FIELD_ASCII},
+	{"Leg2ProdFamilyCode", &KEY_Leg2ProdFamilyCode, offsetof(CThostFtdcSPBMAddOnInterParameterField, Leg2ProdFamilyCode), sizeof(CThostFtdcSPBMAddOnInterParameterField::Leg2ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc RCAMSCombProductInfoFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRCAMSCombProductInfoField, TradingDay), sizeof(CThostFtdcRCAMSCombProductInfoField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRCAMSCombProductInfoField, ExchangeID), sizeof(CThostFtdcRCAMSCombProductInfoField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcRCAMSCombProductInfoField, ProductID), sizeof(CThostFtdcRCAMSCombProductInfoField::ProductID), FIELD_ASCII},
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcRCAMSCombProductInfoField, CombProductID), sizeof(CThostFtdcRCAMSCombProductInfoField::CombProductID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcRCAMSCombProductInfoField, ProductGroupID), sizeof(CThostFtdcRCAMSCombProductInfoField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc RCAMSInstrParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRCAMSInstrParameterField, TradingDay), sizeof(CThostFtdcRCAMSInstrParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRCAMSInstrParameterField, ExchangeID), sizeof(CThostFtdcRCAMSInstrParameterField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcRCAMSInstrParameterField, ProductID), sizeof(CThostFtdcRCAMSInstrParameterField::ProductID), FIELD_ASCII},
+	{"HedgeRate", &KEY_HedgeRate, offsetof(CThostFtdcRCAMSInstrParameterField, HedgeRate), sizeof(CThostFtdcRCAMSInstrParameterField::HedgeRate), FIELD_DOUBLE},
+};
+
+static const FieldDesc RCAMSIntraParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRCAMSIntraParameterField, TradingDay), sizeof(CThostFtdcRCAMSIntraParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRCAMSIntraParameterField, ExchangeID), sizeof(CThostFtdcRCAMSIntraParameterField::ExchangeID), FIELD_ASCII},
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcRCAMSIntraParameterField, CombProductID), sizeof(CThostFtdcRCAMSIntraParameterField::CombProductID), FIELD_ASCII},
+	{"HedgeRate", &KEY_HedgeRate, offsetof(CThostFtdcRCAMSIntraParameterField, HedgeRate), sizeof(CThostFtdcRCAMSIntraParameterField::HedgeRate), FIELD_DOUBLE},
+};
+
+static const FieldDesc RCAMSInterParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRCAMSInterParameterField, TradingDay), sizeof(CThostFtdcRCAMSInterParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRCAMSInterParameterField, ExchangeID), sizeof(CThostFtdcRCAMSInterParameterField::ExchangeID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcRCAMSInterParameterField, ProductGroupID), sizeof(CThostFtdcRCAMSInterParameterField::ProductGroupID), FIELD_ASCII},
+	{"Priority", &KEY_Priority, offsetof(CThostFtdcRCAMSInterParameterField, Priority), sizeof(CThostFtdcRCAMSInterParameterField::Priority), FIELD_INT},
+	{"CreditRate", &KEY_CreditRate, offsetof(CThostFtdcRCAMSInterParameterField, CreditRate), sizeof(CThostFtdcRCAMSInterParameterField::CreditRate), FIELD_DOUBLE},
+	{"CombProduct1", &KEY_CombProduct1, offsetof(CThostFtdcRCAMSInterParameterField, CombProduct1), sizeof(CThostFtdcRCAMSInterParameterField::CombProduct1), FIELD_ASCII},
+	{"CombProduct2", &KEY_CombProduct2, offsetof(CThostFtdcRCAMSInterParameterField, CombProduct2), sizeof(CThostFtdcRCAMSInterParameterField::CombProduct2), FIELD_ASCII},
+};
+
+static const FieldDesc RCAMSShortOptAdjustParamFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRCAMSShortOptAdjustParamField, TradingDay), sizeof(CThostFtdcRCAMSShortOptAdjustParamField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRCAMSShortOptAdjustParamField, ExchangeID), sizeof(CThostFtdcRCAMSShortOptAdjustParamField::ExchangeID), FIELD_ASCII},
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcRCAMSShortOptAdjustParamField, CombProductID), sizeof(CThostFtdcRCAMSShortOptAdjustParamField::CombProductID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcRCAMSShortOptAdjustParamField, HedgeFlag), sizeof(CThostFtdcRCAMSShortOptAdjustParamField::HedgeFlag), FIELD_CHAR},
+	{"AdjustValue", &KEY_AdjustValue, offsetof(CThostFtdcRCAMSShortOptAdjustParamField, AdjustValue), sizeof(CThostFtdcRCAMSShortOptAdjustParamField::AdjustValue), FIELD_DOUBLE},
+};
+
+static const FieldDesc RCAMSInvestorCombPositionFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, ExchangeID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, BrokerID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, InvestorID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::InvestorID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, InstrumentID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::InstrumentID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcRCAMSInvestorCombPositionField, HedgeFlag), sizeof(CThostFtdcRCAMSInvestorCombPositionField::HedgeFlag), FIELD_CHAR},
+	{"PosiDirection", &KEY_PosiDirection, offsetof(CThostFtdcRCAMSInvestorCombPositionField, PosiDirection), sizeof(CThostFtdcRCAMSInvestorCombPositionField::PosiDirection), FIELD_CHAR},
+	{"CombInstrumentID", &KEY_CombInstrumentID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, CombInstrumentID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::CombInstrumentID), FIELD_ASCII},
+	{"LegID", &KEY_LegID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, LegID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::LegID), FIELD_INT},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcRCAMSInvestorCombPositionField, ExchangeInstID), sizeof(CThostFtdcRCAMSInvestorCombPositionField::ExchangeInstID), FIELD_ASCII},
+	{"TotalAmt", &KEY_TotalAmt, offsetof(CThostFtdcRCAMSInvestorCombPositionField, TotalAmt), sizeof(CThostFtdcRCAMSInvestorCombPositionField::TotalAmt), FIELD_INT},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcRCAMSInvestorCombPositionField, ExchMargin), sizeof(CThostFtdcRCAMSInvestorCombPositionField::ExchMargin), FIELD_DOUBLE},
+	{"Margin", &KEY_Margin, offsetof(CThostFtdcRCAMSInvestorCombPositionField, Margin), sizeof(CThostFtdcRCAMSInvestorCombPositionField::Margin), FIELD_DOUBLE},
+};
+
+static const FieldDesc InvestorProdRCAMSMarginFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorProdRCAMSMarginField, ExchangeID), sizeof(CThostFtdcInvestorProdRCAMSMarginField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorProdRCAMSMarginField, BrokerID), sizeof(CThostFtdcInvestorProdRCAMSMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorProdRCAMSMarginField, InvestorID), sizeof(CThostFtdcInvestorProdRCAMSMarginField::InvestorID), FIELD_ASCII},
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcInvestorProdRCAMSMarginField, CombProductID), sizeof(CThostFtdcInvestorProdRCAMSMarginField::CombProductID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInvestorProdRCAMSMarginField, HedgeFlag), sizeof(CThostFtdcInvestorProdRCAMSMarginField::HedgeFlag), FIELD_CHAR},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcInvestorProdRCAMSMarginField, ProductGroupID), sizeof(CThostFtdcInvestorProdRCAMSMarginField::ProductGroupID), FIELD_ASCII},
+	{"RiskBeforeDiscount", &KEY_RiskBeforeDiscount, offsetof(CThostFtdcInvestorProdRCAMSMarginField, RiskBeforeDiscount), sizeof(CThostFtdcInvestorProdRCAMSMarginField::RiskBeforeDiscount), FIELD_DOUBLE},
+	{"IntraInstrRisk", &KEY_IntraInstrRisk, offsetof(CThostFtdcInvestorProdRCAMSMarginField, IntraInstrRisk), sizeof(CThostFtdcInvestorProdRCAMSMarginField::IntraInstrRisk), FIELD_DOUBLE},
+	{"BPosRisk", &KEY_BPosRisk, offsetof(CThostFtdcInvestorProdRCAMSMarginField, BPosRisk), sizeof(CThostFtdcInvestorProdRCAMSMarginField::BPosRisk), FIELD_DOUBLE},
+	{"SPosRisk", &KEY_SPosRisk, offsetof(CThostFtdcInvestorProdRCAMSMarginField, SPosRisk), sizeof(CThostFtdcInvestorProdRCAMSMarginField::SPosRisk), FIELD_DOUBLE},
+	{"IntraProdRisk", &KEY_IntraProdRisk, offsetof(CThostFtdcInvestorProdRCAMSMarginField, IntraProdRisk), sizeof(CThostFtdcInvestorProdRCAMSMarginField::IntraProdRisk), FIELD_DOUBLE},
+	{"NetRisk", &KEY_NetRisk, offsetof(CThostFtdcInvestorProdRCAMSMarginField, NetRisk), sizeof(CThostFtdcInvestorProdRCAMSMarginField::NetRisk), FIELD_DOUBLE},
+	{"InterProdRisk", &KEY_InterProdRisk, offsetof(CThostFtdcInvestorProdRCAMSMarginField, InterProdRisk), sizeof(CThostFtdcInvestorProdRCAMSMarginField::InterProdRisk), FIELD_DOUBLE},
+	{"ShortOptRiskAdj", &KEY_ShortOptRiskAdj, offsetof(CThostFtdcInvestorProdRCAMSMarginField, ShortOptRiskAdj), sizeof(CThostFtdcInvestorProdRCAMSMarginField::ShortOptRiskAdj), FIELD_DOUBLE},
+	{"OptionRoyalty", &KEY_OptionRoyalty, offsetof(CThostFtdcInvestorProdRCAMSMarginField, OptionRoyalty), sizeof(CThostFtdcInvestorProdRCAMSMarginField::OptionRoyalty), FIELD_DOUBLE},
+	{"MMSACloseFrozenMargin", &KEY_MMSACloseFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, MMSACloseFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::MMSACloseFrozenMargin), FIELD_DOUBLE},
+	{"CloseCombFrozenMargin", &KEY_CloseCombFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, CloseCombFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::CloseCombFrozenMargin), FIELD_DOUBLE},
+	{"CloseFrozenMargin", &KEY_CloseFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, CloseFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::CloseFrozenMargin), FIELD_DOUBLE},
+	{"MMSAOpenFrozenMargin", &KEY_MMSAOpenFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, MMSAOpenFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::MMSAOpenFrozenMargin), FIELD_DOUBLE},
+	{"DeliveryOpenFrozenMargin", &KEY_DeliveryOpenFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, DeliveryOpenFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::DeliveryOpenFrozenMargin), FIELD_DOUBLE},
+	{"OpenFrozenMargin", &KEY_OpenFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, OpenFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::OpenFrozenMargin), FIELD_DOUBLE},
+	{"UseFrozenMargin", &KEY_UseFrozenMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, UseFrozenMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::UseFrozenMargin), FIELD_DOUBLE},
+	{"MMSAExchMargin", &KEY_MMSAExchMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, MMSAExchMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::MMSAExchMargin), FIELD_DOUBLE},
+	{"DeliveryExchMargin", &KEY_DeliveryExchMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, DeliveryExchMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::DeliveryExchMargin), FIELD_DOUBLE},
+	{"CombExchMargin", &KEY_CombExchMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, CombExchMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::CombExchMargin), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, ExchMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::ExchMargin), FIELD_DOUBLE},
+	{"UseMargin", &KEY_UseMargin, offsetof(CThostFtdcInvestorProdRCAMSMarginField, UseMargin), sizeof(CThostFtdcInvestorProdRCAMSMarginField::UseMargin), FIELD_DOUBLE},
+};
+
+static const FieldDesc RULEInstrParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRULEInstrParameterField, TradingDay), sizeof(CThostFtdcRULEInstrParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRULEInstrParameterField, ExchangeID), sizeof(CThostFtdcRULEInstrParameterField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcRULEInstrParameterField, InstrumentID), sizeof(CThostFtdcRULEInstrParameterField::InstrumentID), FIELD_ASCII},
+	{"InstrumentClass", &KEY_InstrumentClass, offsetof(CThostFtdcRULEInstrParameterField, InstrumentClass), sizeof(CThostFtdcRULEInstrParameterField::InstrumentClass), FIELD_CHAR},
+	{"StdInstrumentID", &KEY_StdInstrumentID, offsetof(CThostFtdcRULEInstrParameterField, StdInstrumentID), sizeof(CThostFtdcRULEInstrParameterField::StdInstrumentID), FIELD_ASCII},
+	{"BSpecRatio", &KEY_BSpecRatio, offsetof(CThostFtdcRULEInstrParameterField, BSpecRatio), sizeof(CThostFtdcRULEInstrParameterField::BSpecRatio), FIELD_DOUBLE},
+	{"SSpecRatio", &KEY_SSpecRatio, offsetof(CThostFtdcRULEInstrParameterField, SSpecRatio), sizeof(CThostFtdcRULEInstrParameterField::SSpecRatio), FIELD_DOUBLE},
+	{"BHedgeRatio", &KEY_BHedgeRatio, offsetof(CThostFtdcRULEInstrParameterField, BHedgeRatio), sizeof(CThostFtdcRULEInstrParameterField::BHedgeRatio), FIELD_DOUBLE},
+	{"SHedgeRatio", &KEY_SHedgeRatio, offsetof(CThostFtdcRULEInstrParameterField, SHedgeRatio), sizeof(CThostFtdcRULEInstrParameterField::SHedgeRatio), FIELD_DOUBLE},
+	{"BAddOnMargin", &KEY_BAddOnMargin, offsetof(CThostFtdcRULEInstrParameterField, BAddOnMargin), sizeof(CThostFtdcRULEInstrParameterField::BAddOnMargin), FIELD_DOUBLE},
+	{"SAddOnMargin", &KEY_SAddOnMargin, offsetof(CThostFtdcRULEInstrParameterField, SAddOnMargin), sizeof(CThostFtdcRULEInstrParameterField::SAddOnMargin), FIELD_DOUBLE},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcRULEInstrParameterField, CommodityGroupID), sizeof(CThostFtdcRULEInstrParameterField::CommodityGroupID), FIELD_INT},
+};
+
+static const FieldDesc RULEIntraParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRULEIntraParameterField, TradingDay), sizeof(CThostFtdcRULEIntraParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRULEIntraParameterField, ExchangeID), sizeof(CThostFtdcRULEIntraParameterField::ExchangeID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcRULEIntraParameterField, ProdFamilyCode), sizeof(CThostFtdcRULEIntraParameterField::ProdFamilyCode), FIELD_ASCII},
+	{"StdInstrumentID", &KEY_StdInstrumentID, offsetof(CThostFtdcRULEIntraParameterField, StdInstrumentID), sizeof(CThostFtdcRULEIntraParameterField::StdInstrumentID), FIELD_ASCII},
+	{"StdInstrMargin", &KEY_StdInstrMargin, offsetof(CThostFtdcRULEIntraParameterField, StdInstrMargin), sizeof(CThostFtdcRULEIntraParameterField::StdInstrMargin), FIELD_DOUBLE},
+	{"UsualIntraRate", &KEY_UsualIntraRate, offsetof(CThostFtdcRULEIntraParameterField, UsualIntraRate), sizeof(CThostFtdcRULEIntraParameterField::UsualIntraRate), FIELD_DOUBLE},
+	{"DeliveryIntraRate", &KEY_DeliveryIntraRate, offsetof(CThostFtdcRULEIntraParameterField, DeliveryIntraRate), sizeof(CThostFtdcRULEIntraParameterField::DeliveryIntraRate), FIELD_DOUBLE},
+};
+
+static const FieldDesc RULEInterParameterFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRULEInterParameterField, TradingDay), sizeof(CThostFtdcRULEInterParameterField::TradingDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcRULEInterParameterField, ExchangeID), sizeof(CThostFtdcRULEInterParameterField::ExchangeID), FIELD_ASCII},
+	{"SpreadId", &KEY_SpreadId, offsetof(CThostFtdcRULEInterParameterField, SpreadId), sizeof(CThostFtdcRULEInterParameterField::SpreadId), FIELD_INT},
+	{"InterRate", &KEY_InterRate, offsetof(CThostFtdcRULEInterParameterField, InterRate), sizeof(CThostFtdcRULEInterParameterField::InterRate), FIELD_DOUBLE},
+	{"Leg1ProdFamilyCode", &KEY_Leg1ProdFamilyCode, offsetof(CThostFtdcRULEInterParameterField, Leg1ProdFamilyCode), sizeof(CThostFtdcRULEInterParameterField::Leg1ProdFamilyCode), FIELD_ASCII},
+	{"Leg2ProdFamilyCode", &KEY_Leg2ProdFamilyCode, offsetof(CThostFtdcRULEInterParameterField, Leg2ProdFamilyCode), sizeof(CThostFtdcRULEInterParameterField::Leg2ProdFamilyCode), FIELD_ASCII},
+	{"Leg1PropFactor", &KEY_Leg1PropFactor, offsetof(CThostFtdcRULEInterParameterField, Leg1PropFactor), sizeof(CThostFtdcRULEInterParameterField::Leg1PropFactor), FIELD_INT},
+	{"Leg2PropFactor", &KEY_Leg2PropFactor, offsetof(CThostFtdcRULEInterParameterField, Leg2PropFactor), sizeof(CThostFtdcRULEInterParameterField::Leg2PropFactor), FIELD_INT},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcRULEInterParameterField, CommodityGroupID), sizeof(CThostFtdcRULEInterParameterField::CommodityGroupID), FIELD_INT},
+	{"CommodityGroupName", &KEY_CommodityGroupName, offsetof(CThostFtdcRULEInterParameterField, CommodityGroupName), sizeof(CThostFtdcRULEInterParameterField::CommodityGroupName), FIELD_GBK},
+};
+
+static const FieldDesc InvestorProdRULEMarginFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorProdRULEMarginField, ExchangeID), sizeof(CThostFtdcInvestorProdRULEMarginField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorProdRULEMarginField, BrokerID), sizeof(CThostFtdcInvestorProdRULEMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorProdRULEMarginField, InvestorID), sizeof(CThostFtdcInvestorProdRULEMarginField::InvestorID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcInvestorProdRULEMarginField, ProdFamilyCode), sizeof(CThostFtdcInvestorProdRULEMarginField::ProdFamilyCode), FIELD_ASCII},
+	{"InstrumentClass", &KEY_InstrumentClass, offsetof(CThostFtdcInvestorProdRULEMarginField, InstrumentClass), sizeof(CThostFtdcInvestorProdRULEMarginField::InstrumentClass), FIELD_CHAR},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcInvestorProdRULEMarginField, CommodityGroupID), sizeof(CThostFtdcInvestorProdRULEMarginField::CommodityGroupID), FIELD_INT},
+	{"BStdPosition", &KEY_BStdPosition, offsetof(CThostFtdcInvestorProdRULEMarginField, BStdPosition), sizeof(CThostFtdcInvestorProdRULEMarginField::BStdPosition), FIELD_DOUBLE},
+	{"SStdPosition", &KEY_SStdPosition, offsetof(CThostFtdcInvestorProdRULEMarginField, SStdPosition), sizeof(CThostFtdcInvestorProdRULEMarginField::SStdPosition), FIELD_DOUBLE},
+	{"BStdOpenFrozen", &KEY_BStdOpenFrozen, offsetof(CThostFtdcInvestorProdRULEMarginField, BStdOpenFrozen), sizeof(CThostFtdcInvestorProdRULEMarginField::BStdOpenFrozen), FIELD_DOUBLE},
+	{"SStdOpenFrozen", &KEY_SStdOpenFrozen, offsetof(CThostFtdcInvestorProdRULEMarginField, SStdOpenFrozen), sizeof(CThostFtdcInvestorProdRULEMarginField::SStdOpenFrozen), FIELD_DOUBLE},
+	{"BStdCloseFrozen", &KEY_BStdCloseFrozen, offsetof(CThostFtdcInvestorProdRULEMarginField, BStdCloseFrozen), sizeof(CThostFtdcInvestorProdRULEMarginField::BStdCloseFrozen), FIELD_DOUBLE},
+	{"SStdCloseFrozen", &KEY_SStdCloseFrozen, offsetof(CThostFtdcInvestorProdRULEMarginField, SStdCloseFrozen), sizeof(CThostFtdcInvestorProdRULEMarginField::SStdCloseFrozen), FIELD_DOUBLE},
+	{"IntraProdStdPosition", &KEY_IntraProdStdPosition, offsetof(CThostFtdcInvestorProdRULEMarginField, IntraProdStdPosition), sizeof(CThostFtdcInvestorProdRULEMarginField::IntraProdStdPosition), FIELD_DOUBLE},
+	{"NetStdPosition", &KEY_NetStdPosition, offsetof(CThostFtdcInvestorProdRULEMarginField, NetStdPosition), sizeof(CThostFtdcInvestorProdRULEMarginField::NetStdPosition), FIELD_DOUBLE},
+	{"InterProdStdPosition", &KEY_InterProdStdPosition, offsetof(CThostFtdcInvestorProdRULEMarginField, InterProdStdPosition), sizeof(CThostFtdcInvestorProdRULEMarginField::InterProdStdPosition), FIELD_DOUBLE},
+	{"SingleStdPosition", &KEY_SingleStdPosition, offsetof(CThostFtdcInvestorProdRULEMarginField, SingleStdPosition), sizeof(CThostFtdcInvestorProdRULEMarginField::SingleStdPosition), FIELD_DOUBLE},
+	{"IntraProdMargin", &KEY_IntraProdMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, IntraProdMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::IntraProdMargin), FIELD_DOUBLE},
+	{"InterProdMargin", &KEY_InterProdMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, InterProdMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::InterProdMargin), FIELD_DOUBLE},
+	{"SingleMargin", &KEY_SingleMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, SingleMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::SingleMargin), FIELD_DOUBLE},
+	{"NonCombMargin", &KEY_NonCombMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, NonCombMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::NonCombMargin), FIELD_DOUBLE},
+	{"AddOnMargin", &KEY_AddOnMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, AddOnMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::AddOnMargin), FIELD_DOUBLE},
+	{"ExchMargin", &KEY_ExchMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, ExchMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::ExchMargin), FIELD_DOUBLE},
+	{"AddOnFrozenMargin", &KEY_AddOnFrozenMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, AddOnFrozenMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::AddOnFrozenMargin), FIELD_DOUBLE},
+	{"OpenFrozenMargin", &KEY_OpenFrozenMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, OpenFrozenMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::OpenFrozenMargin), FIELD_DOUBLE},
+	{"CloseFrozenMargin", &KEY_CloseFrozenMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, CloseFrozenMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::CloseFrozenMargin), FIELD_DOUBLE},
+	{"Margin", &KEY_Margin, offsetof(CThostFtdcInvestorProdRULEMarginField, Margin), sizeof(CThostFtdcInvestorProdRULEMarginField::Margin), FIELD_DOUBLE},
+	{"FrozenMargin", &KEY_FrozenMargin, offsetof(CThostFtdcInvestorProdRULEMarginField, FrozenMargin), sizeof(CThostFtdcInvestorProdRULEMarginField::FrozenMargin), FIELD_DOUBLE},
+};
+
+static const FieldDesc InvestorPortfSettingFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcInvestorPortfSettingField, ExchangeID), sizeof(CThostFtdcInvestorPortfSettingField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcInvestorPortfSettingField, BrokerID), sizeof(CThostFtdcInvestorPortfSettingField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcInvestorPortfSettingField, InvestorID), sizeof(CThostFtdcInvestorPortfSettingField::InvestorID), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcInvestorPortfSettingField, HedgeFlag), sizeof(CThostFtdcInvestorPortfSettingField::HedgeFlag), FIELD_CHAR},
+	{"UsePortf", &KEY_UsePortf, offsetof(CThostFtdcInvestorPortfSettingField, UsePortf), sizeof(CThostFtdcInvestorPortfSettingField::UsePortf), FIELD_INT},
+};
+
+static const FieldDesc ReqAuthenticateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqAuthenticateField, BrokerID), sizeof(CThostFtdcReqAuthenticateField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqAuthenticateField, UserID), sizeof(CThostFtdcReqAuthenticateField::UserID), FIELD_ASCII},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqAuthenticateField, UserProductInfo), sizeof(CThostFtdcReqAuthenticateField::UserProductInfo), FIELD_GBK},
+	{"AuthCode", &KEY_AuthCode, offsetof(CThostFtdcReqAuthenticateField, AuthCode), sizeof(CThostFtdcReqAuthenticateField::AuthCode), FIELD_GBK},
+	{"AppID", &KEY_AppID, offsetof(CThostFtdcReqAuthenticateField, AppID), sizeof(CThostFtdcReqAuthenticateField::AppID), FIELD_GBK},
+};
+
+static const FieldDesc ReqUserLoginFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserLoginField, TradingDay), sizeof(CThostFtdcReqUserLoginField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserLoginField, BrokerID), sizeof(CThostFtdcReqUserLoginField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserLoginField, UserID), sizeof(CThostFtdcReqUserLoginField::UserID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqUserLoginField, Password), sizeof(CThostFtdcReqUserLoginField::Password), FIELD_GBK},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqUserLoginField, UserProductInfo), sizeof(CThostFtdcReqUserLoginField::UserProductInfo), FIELD_GBK},
+	{"InterfaceProductInfo", &KEY_InterfaceProductInfo, offsetof(CThostFtdcReqUserLoginField, InterfaceProductInfo), sizeof(CThostFtdcReqUserLoginField::InterfaceProductInfo), FIELD_GBK},
+	{"ProtocolInfo", &KEY_ProtocolInfo, offsetof(CThostFtdcReqUserLoginField, ProtocolInfo), sizeof(CThostFtdcReqUserLoginField::ProtocolInfo), FIELD_GBK},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcReqUserLoginField, MacAddress), sizeof(CThostFtdcReqUserLoginField::MacAddress), FIELD_ASCII},
+	{"OneTimePassword", &KEY_OneTimePassword, offsetof(CThostFtdcReqUserLoginField, OneTimePassword), sizeof(CThostFtdcReqUserLoginField::OneTimePassword), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcReqUserLoginField, reserve1), sizeof(CThostFtdcReqUserLoginField::reserve1), FIELD_ASCII},
+	{"LoginRemark", &KEY_LoginRemark, offsetof(CThostFtdcReqUserLoginField, LoginRemark), sizeof(CThostFtdcReqUserLoginField::LoginRemark), FIELD_GBK},
+	{"ClientIPPort", &KEY_ClientIPPort, offsetof(CThostFtdcReqUserLoginField, ClientIPPort), sizeof(CThostFtdcReqUserLoginField::ClientIPPort), FIELD_INT},
+	{"ClientIPAddress", &KEY_ClientIPAddress, offsetof(CThostFtdcReqUserLoginField, ClientIPAddress), sizeof(CThostFtdcReqUserLoginField::ClientIPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ReqUserAuthMethodFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserAuthMethodField, TradingDay), sizeof(CThostFtdcReqUserAuthMethodField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserAuthMethodField, BrokerID), sizeof(CThostFtdcReqUserAuthMethodField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserAuthMethodField, UserID), sizeof(CThostFtdcReqUserAuthMethodField::UserID), FIELD_ASCII},
+};
+
+static const FieldDesc ReqGenUserCaptchaFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqGenUserCaptchaField, TradingDay), sizeof(CThostFtdcReqGenUserCaptchaField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqGenUserCaptchaField, BrokerID), sizeof(CThostFtdcReqGenUserCaptchaField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqGenUserCaptchaField, UserID), sizeof(CThostFtdcReqGenUserCaptchaField::UserID), FIELD_ASCII},
+};
+
+static const FieldDesc ReqGenUserTextFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqGenUserTextField, TradingDay), sizeof(CThostFtdcReqGenUserTextField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqGenUserTextField, BrokerID), sizeof(CThostFtdcReqGenUserTextField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqGenUserTextField, UserID), sizeof(CThostFtdcReqGenUserTextField::UserID), FIELD_ASCII},
+};
+
+static const FieldDesc ReqUserLoginWithCaptchaFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserLoginWithCaptchaField, TradingDay), sizeof(CThostFtdcReqUserLoginWithCaptchaField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserLoginWithCaptchaField, BrokerID), sizeof(CThostFtdcReqUserLoginWithCaptchaField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserLoginWithCaptchaField, UserID), sizeof(CThostFtdcReqUserLoginWithCaptchaField::UserID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqUserLoginWithCaptchaField, Password), sizeof(CThostFtdcReqUserLoginWithCaptchaField::Password), FIELD_GBK},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqUserLoginWithCaptchaField, UserProductInfo), sizeof(CThostFtdcReqUserLoginWithCaptchaField::UserProductInfo), FIELD_GBK},
+	{"InterfaceProductInfo", &KEY_InterfaceProductInfo, offsetof(CThostFtdcReqUserLoginWithCaptchaField, InterfaceProductInfo), sizeof(CThostFtdcReqUserLoginWithCaptchaField::InterfaceProductInfo), FIELD_GBK},
+	{"ProtocolInfo", &KEY_ProtocolInfo, offsetof(CThostFtdcReqUserLoginWithCaptchaField, ProtocolInfo), sizeof(CThostFtdcReqUserLoginWithCaptchaField::ProtocolInfo), FIELD_GBK},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcReqUserLoginWithCaptchaField, MacAddress), sizeof(CThostFtdcReqUserLoginWithCaptchaField::MacAddress), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcReqUserLoginWithCaptchaField, reserve1), sizeof(CThostFtdcReqUserLoginWithCaptchaField::reserve1), FIELD_ASCII},
+	{"LoginRemark", &KEY_LoginRemark, offsetof(CThostFtdcReqUserLoginWithCaptchaField, LoginRemark), sizeof(CThostFtdcReqUserLoginWithCaptchaField::LoginRemark), FIELD_GBK},
+	{"Captcha", &KEY_Captcha, offsetof(CThostFtdcReqUserLoginWithCaptchaField, Captcha), sizeof(CThostFtdcReqUserLoginWithCaptchaField::Captcha), FIELD_GBK},
+	{"ClientIPPort", &KEY_ClientIPPort, offsetof(CThostFtdcReqUserLoginWithCaptchaField, ClientIPPort), sizeof(CThostFtdcReqUserLoginWithCaptchaField::ClientIPPort), FIELD_INT},
+	{"ClientIPAddress", &KEY_ClientIPAddress, offsetof(CThostFtdcReqUserLoginWithCaptchaField, ClientIPAddress), sizeof(CThostFtdcReqUserLoginWithCaptchaField::ClientIPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ReqUserLoginWithTextFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserLoginWithTextField, TradingDay), sizeof(CThostFtdcReqUserLoginWithTextField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserLoginWithTextField, BrokerID), sizeof(CThostFtdcReqUserLoginWithTextField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserLoginWithTextField, UserID), sizeof(CThostFtdcReqUserLoginWithTextField::UserID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqUserLoginWithTextField, Password), sizeof(CThostFtdcReqUserLoginWithTextField::Password), FIELD_GBK},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqUserLoginWithTextField, UserProductInfo), sizeof(CThostFtdcReqUserLoginWithTextField::UserProductInfo), FIELD_GBK},
+	{"InterfaceProductInfo", &KEY_InterfaceProductInfo, offsetof(CThostFtdcReqUserLoginWithTextField, InterfaceProductInfo), sizeof(CThostFtdcReqUserLoginWithTextField::InterfaceProductInfo), FIELD_GBK},
+	{"ProtocolInfo", &KEY_ProtocolInfo, offsetof(CThostFtdcReqUserLoginWithTextField, ProtocolInfo), sizeof(CThostFtdcReqUserLoginWithTextField::ProtocolInfo), FIELD_GBK},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcReqUserLoginWithTextField, MacAddress), sizeof(CThostFtdcReqUserLoginWithTextField::MacAddress), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcReqUserLoginWithTextField, reserve1), sizeof(CThostFtdcReqUserLoginWithTextField::reserve1), FIELD_ASCII},
+	{"LoginRemark", &KEY_LoginRemark, offsetof(CThostFtdcReqUserLoginWithTextField, LoginRemark), sizeof(CThostFtdcReqUserLoginWithTextField::LoginRemark), FIELD_GBK},
+	{"Text", &KEY_Text, offsetof(CThostFtdcReqUserLoginWithTextField, Text), sizeof(CThostFtdcReqUserLoginWithTextField::Text), FIELD_GBK},
+	{"ClientIPPort", &KEY_ClientIPPort, offsetof(CThostFtdcReqUserLoginWithTextField, ClientIPPort), sizeof(CThostFtdcReqUserLoginWithTextField::ClientIPPort), FIELD_INT},
+	{"ClientIPAddress", &KEY_ClientIPAddress, offsetof(CThostFtdcReqUserLoginWithTextField, ClientIPAddress), sizeof(CThostFtdcReqUserLoginWithTextField::ClientIPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc ReqUserLoginWithOTPFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserLoginWithOTPField, TradingDay), sizeof(CThostFtdcReqUserLoginWithOTPField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserLoginWithOTPField, BrokerID), sizeof(CThostFtdcReqUserLoginWithOTPField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserLoginWithOTPField, UserID), sizeof(CThostFtdcReqUserLoginWithOTPField::UserID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqUserLoginWithOTPField, Password), sizeof(CThostFtdcReqUserLoginWithOTPField::Password), FIELD_GBK},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqUserLoginWithOTPField, UserProductInfo), sizeof(CThostFtdcReqUserLoginWithOTPField::UserProductInfo), FIELD_GBK},
+	{"InterfaceProductInfo", &KEY_InterfaceProductInfo, offsetof(CThostFtdcReqUserLoginWithOTPField, InterfaceProductInfo), sizeof(CThostFtdcReqUserLoginWithOTPField::InterfaceProductInfo), FIELD_GBK},
+	{"ProtocolInfo", &KEY_ProtocolInfo, offsetof(CThostFtdcReqUserLoginWithOTPField, ProtocolInfo), sizeof(CThostFtdcReqUserLoginWithOTPField::ProtocolInfo), FIELD_GBK},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcReqUserLoginWithOTPField, MacAddress), sizeof(CThostFtdcReqUserLoginWithOTPField::MacAddress), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcReqUserLoginWithOTPField, reserve1), sizeof(CThostFtdcReqUserLoginWithOTPField::reserve1), FIELD_ASCII},
+	{"LoginRemark", &KEY_LoginRemark, offsetof(CThostFtdcReqUserLoginWithOTPField, LoginRemark), sizeof(CThostFtdcReqUserLoginWithOTPField::LoginRemark), FIELD_GBK},
+	{"OTPPassword", &KEY_OTPPassword, offsetof(CThostFtdcReqUserLoginWithOTPField, OTPPassword), sizeof(CThostFtdcReqUserLoginWithOTPField::OTPPassword), FIELD_GBK},
+	{"ClientIPPort", &KEY_ClientIPPort, offsetof(CThostFtdcReqUserLoginWithOTPField, ClientIPPort), sizeof(CThostFtdcReqUserLoginWithOTPField::ClientIPPort), FIELD_INT},
+	{"ClientIPAddress", &KEY_ClientIPAddress, offsetof(CThostFtdcReqUserLoginWithOTPField, ClientIPAddress), sizeof(CThostFtdcReqUserLoginWithOTPField::ClientIPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc QryOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryOrderField, BrokerID), sizeof(CThostFtdcQryOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryOrderField, InvestorID), sizeof(CThostFtdcQryOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryOrderField, reserve1), sizeof(CThostFtdcQryOrderField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryOrderField, ExchangeID), sizeof(CThostFtdcQryOrderField::ExchangeID), FIELD_ASCII},
+	{"OrderSysID", &KEY_OrderSysID, offsetof(CThostFtdcQryOrderField, OrderSysID), sizeof(CThostFtdcQryOrderField::OrderSysID), FIELD_ASCII},
+	{"InsertTimeStart", &KEY_InsertTimeStart, offsetof(CThostFtdcQryOrderField, InsertTimeStart), sizeof(CThostFtdcQryOrderField::InsertTimeStart), FIELD_ASCII},
+	{"InsertTimeEnd", &KEY_InsertTimeEnd, offsetof(CThostFtdcQryOrderField, InsertTimeEnd), sizeof(CThostFtdcQryOrderField::InsertTimeEnd), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryOrderField, InvestUnitID), sizeof(CThostFtdcQryOrderField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryOrderField, InstrumentID), sizeof(CThostFtdcQryOrderField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryTradeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryTradeField, BrokerID), sizeof(CThostFtdcQryTradeField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryTradeField, InvestorID), sizeof(CThostFtdcQryTradeField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryTradeField, reserve1), sizeof(CThostFtdcQryTradeField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryTradeField, ExchangeID), sizeof(CThostFtdcQryTradeField::ExchangeID), FIELD_ASCII},
+	{"TradeID", &KEY_TradeID, offsetof(CThostFtdcQryTradeField, TradeID), sizeof(CThostFtdcQryTradeField::TradeID), FIELD_ASCII},
+	{"TradeTimeStart", &KEY_TradeTimeStart, offsetof(CThostFtdcQryTradeField, TradeTimeStart), sizeof(CThostFtdcQryTradeField::TradeTimeStart), FIELD_ASCII},
+	{"TradeTimeEnd", &KEY_TradeTimeEnd, offsetof(CThostFtdcQryTradeField, TradeTimeEnd), sizeof(CThostFtdcQryTradeField::TradeTimeEnd), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryTradeField, InvestUnitID), sizeof(CThostFtdcQryTradeField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryTradeField, InstrumentID), sizeof(CThostFtdcQryTradeField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorPositionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorPositionField, BrokerID), sizeof(CThostFtdcQryInvestorPositionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorPositionField, InvestorID), sizeof(CThostFtdcQryInvestorPositionField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInvestorPositionField, reserve1), sizeof(CThostFtdcQryInvestorPositionField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorPositionField, ExchangeID), sizeof(CThostFtdcQryInvestorPositionField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInvestorPositionField, InvestUnitID), sizeof(CThostFtdcQryInvestorPositionField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryInvestorPositionField, InstrumentID), sizeof(CThostFtdcQryInvestorPositionField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryTradingAccountFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryTradingAccountField, BrokerID), sizeof(CThostFtdcQryTradingAccountField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryTradingAccountField, InvestorID), sizeof(CThostFtdcQryTradingAccountField::InvestorID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQryTradingAccountField, CurrencyID), sizeof(CThostFtdcQryTradingAccountField::CurrencyID), FIELD_ASCII},
+	{"BizType", &KEY_BizType, offsetof(CThostFtdcQryTradingAccountField, BizType), sizeof(CThostFtdcQryTradingAccountField::BizType), FIELD_CHAR},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQryTradingAccountField, AccountID), sizeof(CThostFtdcQryTradingAccountField::AccountID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorField, BrokerID), sizeof(CThostFtdcQryInvestorField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorField, InvestorID), sizeof(CThostFtdcQryInvestorField::InvestorID), FIELD_ASCII},
+};
+
+static const FieldDesc QryTradingCodeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryTradingCodeField, BrokerID), sizeof(CThostFtdcQryTradingCodeField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryTradingCodeField, InvestorID), sizeof(CThostFtdcQryTradingCodeField::InvestorID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryTradingCodeField, ExchangeID), sizeof(CThostFtdcQryTradingCodeField::ExchangeID), FIELD_ASCII},
+	{"ClientID", &KEY_ClientID, offsetof(CThostFtdcQryTradingCodeField, ClientID), sizeof(CThostFtdcQryTradingCodeField::ClientID), FIELD_ASCII},
+	{"ClientIDType", &KEY_ClientIDType, offsetof(CThostFtdcQryTradingCodeField, ClientIDType), sizeof(CThostFtdcQryTradingCodeField::ClientIDType), FIELD_CHAR},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryTradingCodeField, InvestUnitID), sizeof(CThostFtdcQryTradingCodeField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInstrumentMarginRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInstrumentMarginRateField, BrokerID), sizeof(CThostFtdcQryInstrumentMarginRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInstrumentMarginRateField, InvestorID), sizeof(CThostFtdcQryInstrumentMarginRateField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInstrumentMarginRateField, reserve1), sizeof(CThostFtdcQryInstrumentMarginRateField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcQryInstrumentMarginRateField, HedgeFlag), sizeof(CThostFtdcQryInstrumentMarginRateField::HedgeFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInstrumentMarginRateField, ExchangeID), sizeof(CThostFtdcQryInstrumentMarginRateField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInstrumentMarginRateField, InvestUnitID), sizeof(CThostFtdcQryInstrumentMarginRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryInstrumentMarginRateField, InstrumentID), sizeof(CThostFtdcQryInstrumentMarginRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInstrumentCommissionRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInstrumentCommissionRateField, BrokerID), sizeof(CThostFtdcQryInstrumentCommissionRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInstrumentCommissionRateField, InvestorID), sizeof(CThostFtdcQryInstrumentCommissionRateField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInstrumentCommissionRateField, reserve1), sizeof(CThostFtdcQryInstrumentCommissionRateField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInstrumentCommissionRateField, ExchangeID), sizeof(CThostFtdcQryInstrumentCommissionRateField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInstrumentCommissionRateField, InvestUnitID), sizeof(CThostFtdcQryInstrumentCommissionRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryInstrumentCommissionRateField, InstrumentID), sizeof(CThostFtdcQryInstrumentCommissionRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryExchangeFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryExchangeField, ExchangeID), sizeof(CThostFtdcQryExchangeField::ExchangeID), FIELD_ASCII},
+};
+
+static const FieldDesc QryProductFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryProductField, reserve1), sizeof(CThostFtdcQryProductField::reserve1), FIELD_ASCII},
+	{"ProductClass", &KEY_ProductClass, offsetof(CThostFtdcQryProductField, ProductClass), sizeof(CThostFtdcQryProductField::ProductClass), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryProductField, ExchangeID), sizeof(CThostFtdcQryProductField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryProductField, ProductID), sizeof(CThostFtdcQryProductField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInstrumentFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInstrumentField, reserve1), sizeof(CThostFtdcQryInstrumentField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInstrumentField, ExchangeID), sizeof(CThostFtdcQryInstrumentField::ExchangeID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcQryInstrumentField, reserve2), sizeof(CThostFtdcQryInstrumentField::reserve2), FIELD_ASCII},
+	{"reserve3", &KEY_reserve3, offsetof(CThostFtdcQryInstrumentField, reserve3), sizeof(CThostFtdcQryInstrumentField::reserve3), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryInstrumentField, InstrumentID), sizeof(CThostFtdcQryInstrumentField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcQryInstrumentField, ExchangeInstID), sizeof(CThostFtdcQryInstrumentField::ExchangeInstID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryInstrumentField, ProductID), sizeof(CThostFtdcQryInstrumentField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryDepthMarketDataFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryDepthMarketDataField, reserve1), sizeof(CThostFtdcQryDepthMarketDataField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryDepthMarketDataField, ExchangeID), sizeof(CThostFtdcQryDepthMarketDataField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryDepthMarketDataField, InstrumentID), sizeof(CThostFtdcQryDepthMarketDataField::InstrumentID), FIELD_ASCII},
+	{"ProductClass", &KEY_ProductClass, offsetof(CThostFtdcQryDepthMarketDataField, ProductClass), sizeof(CThostFtdcQryDepthMarketDataField::ProductClass), FIELD_CHAR},
+};
+
+static const FieldDesc QryTraderOfferFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryTraderOfferField, ExchangeID), sizeof(CThostFtdcQryTraderOfferField::ExchangeID), FIELD_ASCII},
+	{"ParticipantID", &KEY_ParticipantID, offsetof(CThostFtdcQryTraderOfferField, ParticipantID), sizeof(CThostFtdcQryTraderOfferField::ParticipantID), FIELD_ASCII},
+	{"TraderID", &KEY_TraderID, offsetof(CThostFtdcQryTraderOfferField, TraderID), sizeof(CThostFtdcQryTraderOfferField::TraderID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySettlementInfoFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQrySettlementInfoField, BrokerID), sizeof(CThostFtdcQrySettlementInfoField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQrySettlementInfoField, InvestorID), sizeof(CThostFtdcQrySettlementInfoField::InvestorID), FIELD_ASCII},
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcQrySettlementInfoField, TradingDay), sizeof(CThostFtdcQrySettlementInfoField::TradingDay), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQrySettlementInfoField, AccountID), sizeof(CThostFtdcQrySettlementInfoField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQrySettlementInfoField, CurrencyID), sizeof(CThostFtdcQrySettlementInfoField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc QryTransferBankFields[] = {
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcQryTransferBankField, BankID), sizeof(CThostFtdcQryTransferBankField::BankID), FIELD_GBK},
+	{"BankBrchID", &KEY_BankBrchID, offsetof(CThostFtdcQryTransferBankField, BankBrchID), sizeof(CThostFtdcQryTransferBankField::BankBrchID), FIELD_GBK},
+};
+
+static const FieldDesc QryInvestorPositionDetailFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorPositionDetailField, BrokerID), sizeof(CThostFtdcQryInvestorPositionDetailField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorPositionDetailField, InvestorID), sizeof(CThostFtdcQryInvestorPositionDetailField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInvestorPositionDetailField, reserve1), sizeof(CThostFtdcQryInvestorPositionDetailField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorPositionDetailField, ExchangeID), sizeof(CThostFtdcQryInvestorPositionDetailField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInvestorPositionDetailField, InvestUnitID), sizeof(CThostFtdcQryInvestorPositionDetailField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryInvestorPositionDetailField, InstrumentID), sizeof(CThostFtdcQryInvestorPositionDetailField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryNoticeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryNoticeField, BrokerID), sizeof(CThostFtdcQryNoticeField::BrokerID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySettlementInfoConfirmFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQrySettlementInfoConfirmField, BrokerID), sizeof(CThostFtdcQrySettlementInfoConfirmField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQrySettlementInfoConfirmField, InvestorID), sizeof(CThostFtdcQrySettlementInfoConfirmField::InvestorID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQrySettlementInfoConfirmField, AccountID), sizeof(CThostFtdcQrySettlementInfoConfirmField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQrySettlementInfoConfirmField, CurrencyID), sizeof(CThostFtdcQrySettlementInfoConfirmField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorPositionCombineDetailFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorPositionCombineDetailField, BrokerID), sizeof(CThostFtdcQryInvestorPositionCombineDetailField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorPositionCombineDetailField, InvestorID), sizeof(CThostFtdcQryInvestorPositionCombineDetailField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInvestorPositionCombineDetailField, reserve1), sizeof(CThostFtdcQryInvestorPositionCombineDetailField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorPositionCombineDetailField, ExchangeID), sizeof(CThostFtdcQryInvestorPositionCombineDetailField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInvestorPositionCombineDetailField, InvestUnitID), sizeof(CThostFtdcQryInvestorPositionCombineDetailField::InvestUnitID), FIELD_ASCII},
+	{"CombInstrumentID", &KEY_CombInstrumentID, offsetof(CThostFtdcQryInvestorPositionCombineDetailField, CombInstrumentID), sizeof(CThostFtdcQryInvestorPositionCombineDetailField::CombInstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryCFMMCTradingAccountKeyFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryCFMMCTradingAccountKeyField, BrokerID), sizeof(CThostFtdcQryCFMMCTradingAccountKeyField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryCFMMCTradingAccountKeyField, InvestorID), sizeof(CThostFtdcQryCFMMCTradingAccountKeyField::InvestorID), FIELD_ASCII},
+};
+
+static const FieldDesc QryEWarrantOffsetFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryEWarrantOffsetField, BrokerID), sizeof(CThostFtdcQryEWarrantOffsetField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryEWarrantOffsetField, InvestorID), sizeof(CThostFtdcQryEWarrantOffsetField::InvestorID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryEWarrantOffsetField, ExchangeID), sizeof(CThostFtdcQryEWarrantOffsetField::ExchangeID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryEWarrantOffsetField, reserve1), sizeof(CThostFtdcQryEWarrantOffsetField::reserve1), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryEWarrantOffsetField, InvestUnitID), sizeof(CThostFtdcQryEWarrantOffsetField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryEWarrantOffsetField, InstrumentID), sizeof(CThostFtdcQryEWarrantOffsetField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorProductGroupMarginFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorProductGroupMarginField, BrokerID), sizeof(CThostFtdcQryInvestorProductGroupMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorProductGroupMarginField, InvestorID), sizeof(CThostFtdcQryInvestorProductGroupMarginField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInvestorProductGroupMarginField, reserve1), sizeof(CThostFtdcQryInvestorProductGroupMarginField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcQryInvestorProductGroupMarginField, HedgeFlag), sizeof(CThostFtdcQryInvestorProductGroupMarginField::HedgeFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorProductGroupMarginField, ExchangeID), sizeof(CThostFtdcQryInvestorProductGroupMarginField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInvestorProductGroupMarginField, InvestUnitID), sizeof(CThostFtdcQryInvestorProductGroupMarginField::InvestUnitID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcQryInvestorProductGroupMarginField, ProductGroupID), sizeof(CThostFtdcQryInvestorProductGroupMarginField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc QryExchangeMarginRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryExchangeMarginRateField, BrokerID), sizeof(CThostFtdcQryExchangeMarginRateField::BrokerID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryExchangeMarginRateField, reserve1), sizeof(CThostFtdcQryExchangeMarginRateField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcQryExchangeMarginRateField, HedgeFlag), sizeof(CThostFtdcQryExchangeMarginRateField::HedgeFlag), FIELD_CHAR},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryExchangeMarginRateField, ExchangeID), sizeof(CThostFtdcQryExchangeMarginRateField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryExchangeMarginRateField, InstrumentID), sizeof(CThostFtdcQryExchangeMarginRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryExchangeMarginRateAdjustFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryExchangeMarginRateAdjustField, BrokerID), sizeof(CThostFtdcQryExchangeMarginRateAdjustField::BrokerID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryExchangeMarginRateAdjustField, reserve1), sizeof(CThostFtdcQryExchangeMarginRateAdjustField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcQryExchangeMarginRateAdjustField, HedgeFlag), sizeof(CThostFtdcQryExchangeMarginRateAdjustField::HedgeFlag), FIELD_CHAR},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryExchangeMarginRateAdjustField, InstrumentID), sizeof(CThostFtdcQryExchangeMarginRateAdjustField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryExchangeRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryExchangeRateField, BrokerID), sizeof(CThostFtdcQryExchangeRateField::BrokerID), FIELD_ASCII},
+	{"FromCurrencyID", &KEY_FromCurrencyID, offsetof(CThostFtdcQryExchangeRateField, FromCurrencyID), sizeof(CThostFtdcQryExchangeRateField::FromCurrencyID), FIELD_ASCII},
+	{"ToCurrencyID", &KEY_ToCurrencyID, offsetof(CThostFtdcQryExchangeRateField, ToCurrencyID), sizeof(CThostFtdcQryExchangeRateField::ToCurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySecAgentACIDMapFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQrySecAgentACIDMapField, BrokerID), sizeof(CThostFtdcQrySecAgentACIDMapField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcQrySecAgentACIDMapField, UserID), sizeof(CThostFtdcQrySecAgentACIDMapField::UserID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQrySecAgentACIDMapField, AccountID), sizeof(CThostFtdcQrySecAgentACIDMapField::AccountID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQrySecAgentACIDMapField, CurrencyID), sizeof(CThostFtdcQrySecAgentACIDMapField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc QryProductExchRateFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryProductExchRateField, reserve1), sizeof(CThostFtdcQryProductExchRateField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryProductExchRateField, ExchangeID), sizeof(CThostFtdcQryProductExchRateField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryProductExchRateField, ProductID), sizeof(CThostFtdcQryProductExchRateField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryProductGroupFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryProductGroupField, reserve1), sizeof(CThostFtdcQryProductGroupField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryProductGroupField, ExchangeID), sizeof(CThostFtdcQryProductGroupField::ExchangeID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryProductGroupField, ProductID), sizeof(CThostFtdcQryProductGroupField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryMMInstrumentCommissionRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryMMInstrumentCommissionRateField, BrokerID), sizeof(CThostFtdcQryMMInstrumentCommissionRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryMMInstrumentCommissionRateField, InvestorID), sizeof(CThostFtdcQryMMInstrumentCommissionRateField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryMMInstrumentCommissionRateField, reserve1), sizeof(CThostFtdcQryMMInstrumentCommissionRateField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryMMInstrumentCommissionRateField, InstrumentID), sizeof(CThostFtdcQryMMInstrumentCommissionRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryMMOptionInstrCommRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryMMOptionInstrCommRateField, BrokerID), sizeof(CThostFtdcQryMMOptionInstrCommRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryMMOptionInstrCommRateField, InvestorID), sizeof(CThostFtdcQryMMOptionInstrCommRateField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryMMOptionInstrCommRateField, reserve1), sizeof(CThostFtdcQryMMOptionInstrCommRateField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryMMOptionInstrCommRateField, InstrumentID), sizeof(CThostFtdcQryMMOptionInstrCommRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInstrumentOrderCommRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInstrumentOrderCommRateField, BrokerID), sizeof(CThostFtdcQryInstrumentOrderCommRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInstrumentOrderCommRateField, InvestorID), sizeof(CThostFtdcQryInstrumentOrderCommRateField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryInstrumentOrderCommRateField, reserve1), sizeof(CThostFtdcQryInstrumentOrderCommRateField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryInstrumentOrderCommRateField, InstrumentID), sizeof(CThostFtdcQryInstrumentOrderCommRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySecAgentCheckModeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQrySecAgentCheckModeField, BrokerID), sizeof(CThostFtdcQrySecAgentCheckModeField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQrySecAgentCheckModeField, InvestorID), sizeof(CThostFtdcQrySecAgentCheckModeField::InvestorID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySecAgentTradeInfoFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQrySecAgentTradeInfoField, BrokerID), sizeof(CThostFtdcQrySecAgentTradeInfoField::BrokerID), FIELD_ASCII},
+	{"BrokerSecAgentID", &KEY_BrokerSecAgentID, offsetof(CThostFtdcQrySecAgentTradeInfoField, BrokerSecAgentID), sizeof(CThostFtdcQrySecAgentTradeInfoField::BrokerSecAgentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryOptionInstrTradeCostFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryOptionInstrTradeCostField, BrokerID), sizeof(CThostFtdcQryOptionInstrTradeCostField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryOptionInstrTradeCostField, InvestorID), sizeof(CThostFtdcQryOptionInstrTradeCostField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryOptionInstrTradeCostField, reserve1), sizeof(CThostFtdcQryOptionInstrTradeCostField::reserve1), FIELD_ASCII},
+	{"HedgeFlag", &KEY_HedgeFlag, offsetof(CThostFtdcQryOptionInstrTradeCostField, HedgeFlag), sizeof(CThostFtdcQryOptionInstrTradeCostField::HedgeFlag), FIELD_CHAR},
+	{"InputPrice", &KEY_InputPrice, offsetof(CThostFtdcQryOptionInstrTradeCostField, InputPrice), sizeof(CThostFtdcQryOptionInstrTradeCostField::InputPrice), FIELD_DOUBLE},
+	{"UnderlyingPrice", &KEY_UnderlyingPrice, offsetof(CThostFtdcQryOptionInstrTradeCostField, UnderlyingPrice), sizeof(CThostFtdcQryOptionInstrTradeCostField::UnderlyingPrice), FIELD_DOUBLE},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryOptionInstrTradeCostField, ExchangeID), sizeof(CThostFtdcQryOptionInstrTradeCostField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryOptionInstrTradeCostField, InvestUnitID), sizeof(CThostFtdcQryOptionInstrTradeCostField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryOptionInstrTradeCostField, InstrumentID), sizeof(CThostFtdcQryOptionInstrTradeCostField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryOptionInstrCommRateFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryOptionInstrCommRateField, BrokerID), sizeof(CThostFtdcQryOptionInstrCommRateField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryOptionInstrCommRateField, InvestorID), sizeof(CThostFtdcQryOptionInstrCommRateField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryOptionInstrCommRateField, reserve1), sizeof(CThostFtdcQryOptionInstrCommRateField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryOptionInstrCommRateField, ExchangeID), sizeof(CThostFtdcQryOptionInstrCommRateField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryOptionInstrCommRateField, InvestUnitID), sizeof(CThostFtdcQryOptionInstrCommRateField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryOptionInstrCommRateField, InstrumentID), sizeof(CThostFtdcQryOptionInstrCommRateField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryExecOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryExecOrderField, BrokerID), sizeof(CThostFtdcQryExecOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryExecOrderField, InvestorID), sizeof(CThostFtdcQryExecOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryExecOrderField, reserve1), sizeof(CThostFtdcQryExecOrderField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryExecOrderField, ExchangeID), sizeof(CThostFtdcQryExecOrderField::ExchangeID), FIELD_ASCII},
+	{"ExecOrderSysID", &KEY_ExecOrderSysID, offsetof(CThostFtdcQryExecOrderField, ExecOrderSysID), sizeof(CThostFtdcQryExecOrderField::ExecOrderSysID), FIELD_ASCII},
+	{"InsertTimeStart", &KEY_InsertTimeStart, offsetof(CThostFtdcQryExecOrderField, InsertTimeStart), sizeof(CThostFtdcQryExecOrderField::InsertTimeStart), FIELD_ASCII},
+	{"InsertTimeEnd", &KEY_InsertTimeEnd, offsetof(CThostFtdcQryExecOrderField, InsertTimeEnd), sizeof(CThostFtdcQryExecOrderField::InsertTimeEnd), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryExecOrderField, InstrumentID), sizeof(CThostFtdcQryExecOrderField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryForQuoteFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryForQuoteField, BrokerID), sizeof(CThostFtdcQryForQuoteField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryForQuoteField, InvestorID), sizeof(CThostFtdcQryForQuoteField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryForQuoteField, reserve1), sizeof(CThostFtdcQryForQuoteField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryForQuoteField, ExchangeID), sizeof(CThostFtdcQryForQuoteField::ExchangeID), FIELD_ASCII},
+	{"InsertTimeStart", &KEY_InsertTimeStart, offsetof(CThostFtdcQryForQuoteField, InsertTimeStart), sizeof(CThostFtdcQryForQuoteField::InsertTimeStart), FIELD_ASCII},
+	{"InsertTimeEnd", &KEY_InsertTimeEnd, offsetof(CThostFtdcQryForQuoteField, InsertTimeEnd), sizeof(CThostFtdcQryForQuoteField::InsertTimeEnd), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryForQuoteField, InvestUnitID), sizeof(CThostFtdcQryForQuoteField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryForQuoteField, InstrumentID), sizeof(CThostFtdcQryForQuoteField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryQuoteFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryQuoteField, BrokerID), sizeof(CThostFtdcQryQuoteField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryQuoteField, InvestorID), sizeof(CThostFtdcQryQuoteField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryQuoteField, reserve1), sizeof(CThostFtdcQryQuoteField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryQuoteField, ExchangeID), sizeof(CThostFtdcQryQuoteField::ExchangeID), FIELD_ASCII},
+	{"QuoteSysID", &KEY_QuoteSysID, offsetof(CThostFtdcQryQuoteField, QuoteSysID), sizeof(CThostFtdcQryQuoteField::QuoteSysID), FIELD_ASCII},
+	{"InsertTimeStart", &KEY_InsertTimeStart, offsetof(CThostFtdcQryQuoteField, InsertTimeStart), sizeof(CThostFtdcQryQuoteField::InsertTimeStart), FIELD_ASCII},
+	{"InsertTimeEnd", &KEY_InsertTimeEnd, offsetof(CThostFtdcQryQuoteField, InsertTimeEnd), sizeof(CThostFtdcQryQuoteField::InsertTimeEnd), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryQuoteField, InvestUnitID), sizeof(CThostFtdcQryQuoteField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryQuoteField, InstrumentID), sizeof(CThostFtdcQryQuoteField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryOptionSelfCloseFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryOptionSelfCloseField, BrokerID), sizeof(CThostFtdcQryOptionSelfCloseField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryOptionSelfCloseField, InvestorID), sizeof(CThostFtdcQryOptionSelfCloseField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryOptionSelfCloseField, reserve1), sizeof(CThostFtdcQryOptionSelfCloseField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryOptionSelfCloseField, ExchangeID), sizeof(CThostFtdcQryOptionSelfCloseField::ExchangeID), FIELD_ASCII},
+	{"OptionSelfCloseSysID", &KEY_OptionSelfCloseSysID, offsetof(CThostFtdcQryOptionSelfCloseField, OptionSelfCloseSysID), sizeof(CThostFtdcQryOptionSelfCloseField::OptionSelfCloseSysID), FIELD_ASCII},
+	{"InsertTimeStart", &KEY_InsertTimeStart, offsetof(CThostFtdcQryOptionSelfCloseField, InsertTimeStart), sizeof(CThostFtdcQryOptionSelfCloseField::InsertTimeStart), FIELD_ASCII},
+	{"InsertTimeEnd", &KEY_InsertTimeEnd, offsetof(CThostFtdcQryOptionSelfCloseField, InsertTimeEnd), sizeof(CThostFtdcQryOptionSelfCloseField::InsertTimeEnd), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryOptionSelfCloseField, InstrumentID), sizeof(CThostFtdcQryOptionSelfCloseField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestUnitFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestUnitField, BrokerID), sizeof(CThostFtdcQryInvestUnitField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestUnitField, InvestorID), sizeof(CThostFtdcQryInvestUnitField::InvestorID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryInvestUnitField, InvestUnitID), sizeof(CThostFtdcQryInvestUnitField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc QryCombInstrumentGuardFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryCombInstrumentGuardField, BrokerID), sizeof(CThostFtdcQryCombInstrumentGuardField::BrokerID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryCombInstrumentGuardField, reserve1), sizeof(CThostFtdcQryCombInstrumentGuardField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryCombInstrumentGuardField, ExchangeID), sizeof(CThostFtdcQryCombInstrumentGuardField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryCombInstrumentGuardField, InstrumentID), sizeof(CThostFtdcQryCombInstrumentGuardField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryCombActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryCombActionField, BrokerID), sizeof(CThostFtdcQryCombActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryCombActionField, InvestorID), sizeof(CThostFtdcQryCombActionField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryCombActionField, reserve1), sizeof(CThostFtdcQryCombActionField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryCombActionField, ExchangeID), sizeof(CThostFtdcQryCombActionField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryCombActionField, InvestUnitID), sizeof(CThostFtdcQryCombActionField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryCombActionField, InstrumentID), sizeof(CThostFtdcQryCombActionField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryTransferSerialFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryTransferSerialField, BrokerID), sizeof(CThostFtdcQryTransferSerialField::BrokerID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQryTransferSerialField, AccountID), sizeof(CThostFtdcQryTransferSerialField::AccountID), FIELD_ASCII},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcQryTransferSerialField, BankID), sizeof(CThostFtdcQryTransferSerialField::BankID), FIELD_GBK},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQryTransferSerialField, CurrencyID), sizeof(CThostFtdcQryTransferSerialField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc QryAccountregisterFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryAccountregisterField, BrokerID), sizeof(CThostFtdcQryAccountregisterField::BrokerID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQryAccountregisterField, AccountID), sizeof(CThostFtdcQryAccountregisterField::AccountID), FIELD_ASCII},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcQryAccountregisterField, BankID), sizeof(CThostFtdcQryAccountregisterField::BankID), FIELD_GBK},
+	{"BankBranchID", &KEY_BankBranchID, offsetof(CThostFtdcQryAccountregisterField, BankBranchID), sizeof(CThostFtdcQryAccountregisterField::BankBranchID), FIELD_GBK},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQryAccountregisterField, CurrencyID), sizeof(CThostFtdcQryAccountregisterField::CurrencyID), FIELD_ASCII},
+};
+
+static const FieldDesc QryContractBankFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryContractBankField, BrokerID), sizeof(CThostFtdcQryContractBankField::BrokerID), FIELD_ASCII},
+	{"BankID", &KEY_BankID, offsetof(CThostFtdcQryContractBankField, BankID), sizeof(CThostFtdcQryContractBankField::BankID), FIELD_GBK},
+	{"BankBrchID", &KEY_BankBrchID, offsetof(CThostFtdcQryContractBankField, BankBrchID), sizeof(CThostFtdcQryContractBankField::BankBrchID), FIELD_GBK},
+};
+
+static const FieldDesc QryParkedOrderFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryParkedOrderField, BrokerID), sizeof(CThostFtdcQryParkedOrderField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryParkedOrderField, InvestorID), sizeof(CThostFtdcQryParkedOrderField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryParkedOrderField, reserve1), sizeof(CThostFtdcQryParkedOrderField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryParkedOrderField, ExchangeID), sizeof(CThostFtdcQryParkedOrderField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryParkedOrderField, InvestUnitID), sizeof(CThostFtdcQryParkedOrderField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryParkedOrderField, InstrumentID), sizeof(CThostFtdcQryParkedOrderField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryParkedOrderActionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryParkedOrderActionField, BrokerID), sizeof(CThostFtdcQryParkedOrderActionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryParkedOrderActionField, InvestorID), sizeof(CThostFtdcQryParkedOrderActionField::InvestorID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryParkedOrderActionField, reserve1), sizeof(CThostFtdcQryParkedOrderActionField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryParkedOrderActionField, ExchangeID), sizeof(CThostFtdcQryParkedOrderActionField::ExchangeID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryParkedOrderActionField, InvestUnitID), sizeof(CThostFtdcQryParkedOrderActionField::InvestUnitID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryParkedOrderActionField, InstrumentID), sizeof(CThostFtdcQryParkedOrderActionField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryTradingNoticeFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryTradingNoticeField, BrokerID), sizeof(CThostFtdcQryTradingNoticeField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryTradingNoticeField, InvestorID), sizeof(CThostFtdcQryTradingNoticeField::InvestorID), FIELD_ASCII},
+	{"InvestUnitID", &KEY_InvestUnitID, offsetof(CThostFtdcQryTradingNoticeField, InvestUnitID), sizeof(CThostFtdcQryTradingNoticeField::InvestUnitID), FIELD_ASCII},
+};
+
+static const FieldDesc QryBrokerTradingParamsFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryBrokerTradingParamsField, BrokerID), sizeof(CThostFtdcQryBrokerTradingParamsField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryBrokerTradingParamsField, InvestorID), sizeof(CThostFtdcQryBrokerTradingParamsField::InvestorID), FIELD_ASCII},
+	{"CurrencyID", &KEY_CurrencyID, offsetof(CThostFtdcQryBrokerTradingParamsField, CurrencyID), sizeof(CThostFtdcQryBrokerTradingParamsField::CurrencyID), FIELD_ASCII},
+	{"AccountID", &KEY_AccountID, offsetof(CThostFtdcQryBrokerTradingParamsField, AccountID), sizeof(CThostFtdcQryBrokerTradingParamsField::AccountID), FIELD_ASCII},
+};
+
+static const FieldDesc QryBrokerTradingAlgosFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryBrokerTradingAlgosField, BrokerID), sizeof(CThostFtdcQryBrokerTradingAlgosField::BrokerID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryBrokerTradingAlgosField, ExchangeID), sizeof(CThostFtdcQryBrokerTradingAlgosField::ExchangeID), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryBrokerTradingAlgosField, reserve1), sizeof(CThostFtdcQryBrokerTradingAlgosField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryBrokerTradingAlgosField, InstrumentID), sizeof(CThostFtdcQryBrokerTradingAlgosField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryClassifiedInstrumentFields[] = {
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryClassifiedInstrumentField, InstrumentID), sizeof(CThostFtdcQryClassifiedInstrumentField::InstrumentID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryClassifiedInstrumentField, ExchangeID), sizeof(CThostFtdcQryClassifiedInstrumentField::ExchangeID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcQryClassifiedInstrumentField, ExchangeInstID), sizeof(CThostFtdcQryClassifiedInstrumentField::ExchangeInstID), FIELD_ASCII},
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryClassifiedInstrumentField, ProductID), sizeof(CThostFtdcQryClassifiedInstrumentField::ProductID), FIELD_ASCII},
+	{"TradingType", &KEY_TradingType, offsetof(CThostFtdcQryClassifiedInstrumentField, TradingType), sizeof(CThostFtdcQryClassifiedInstrumentField::TradingType), FIELD_CHAR},
+	{"ClassType", &KEY_ClassType, offsetof(CThostFtdcQryClassifiedInstrumentField, ClassType), sizeof(CThostFtdcQryClassifiedInstrumentField::ClassType), FIELD_CHAR},
+};
+
+static const FieldDesc QryCombPromotionParamFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryCombPromotionParamField, ExchangeID), sizeof(CThostFtdcQryCombPromotionParamField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryCombPromotionParamField, InstrumentID), sizeof(CThostFtdcQryCombPromotionParamField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRiskSettleInvstPositionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryRiskSettleInvstPositionField, BrokerID), sizeof(CThostFtdcQryRiskSettleInvstPositionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryRiskSettleInvstPositionField, InvestorID), sizeof(CThostFtdcQryRiskSettleInvstPositionField::InvestorID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryRiskSettleInvstPositionField, InstrumentID), sizeof(CThostFtdcQryRiskSettleInvstPositionField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRiskSettleProductStatusFields[] = {
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryRiskSettleProductStatusField, ProductID), sizeof(CThostFtdcQryRiskSettleProductStatusField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPBMFutureParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMFutureParameterField, ExchangeID), sizeof(CThostFtdcQrySPBMFutureParameterField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQrySPBMFutureParameterField, InstrumentID), sizeof(CThostFtdcQrySPBMFutureParameterField::InstrumentID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQrySPBMFutureParameterField, ProdFamilyCode), sizeof(CThostFtdcQrySPBMFutureParameterField::ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPBMOptionParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMOptionParameterField, ExchangeID), sizeof(CThostFtdcQrySPBMOptionParameterField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQrySPBMOptionParameterField, InstrumentID), sizeof(CThostFtdcQrySPBMOptionParameterField::InstrumentID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQrySPBMOptionParameterField, ProdFamilyCode), sizeof(CThostFtdcQrySPBMOptionParameterField::ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPBMIntraParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMIntraParameterField, ExchangeID), sizeof(CThostFtdcQrySPBMIntraParameterField::ExchangeID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQrySPBMIntraParameterField, ProdFamilyCode), sizeof(CThostFtdcQrySPBMIntraParameterField::ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPBMInterParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMInterParameterField, ExchangeID), sizeof(CThostFtdcQrySPBMInterParameterField::ExchangeID), FIELD_ASCII},
+	{"Leg1ProdFamilyCode", &KEY_Leg1ProdFamilyCode, offsetof(CThostFtdcQrySPBMInterParameterField, Leg1ProdFamilyCode), sizeof(CThostFtdcQrySPBMInterParameterField::Leg1ProdFamilyCode), FIELD_ASCII},
+	{"Leg2ProdFamilyCode", &KEY_Leg2ProdFamilyCode, offsetof(CThostFtdcQrySPBMInterParameterField, Leg2ProdFamilyCode), sizeof(CThostFtdcQrySPBMInterParameterField::Leg2ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPBMPortfDefinitionFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMPortfDefinitionField, ExchangeID), sizeof(CThostFtdcQrySPBMPortfDefinitionField::ExchangeID), FIELD_ASCII},
+	{"PortfolioDefID", &KEY_PortfolioDefID, offsetof(CThostFtdcQrySPBMPortfDefinitionField, PortfolioDefID), sizeof(CThostFtdcQrySPBMPortfDefinitionField::PortfolioDefID), FIELD_INT},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQrySPBMPortfDefinitionField, ProdFamilyCode), sizeof(CThostFtdcQrySPBMPortfDefinitionField::ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPBMInvestorPortfDefFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMInvestorPortfDefField, ExchangeID), sizeof(CThostFtdcQrySPBMInvestorPortfDefField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQrySPBMInvestorPortfDefField, BrokerID), sizeof(CThostFtdcQrySPBMInvestorPortfDefField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQrySPBMInvestorPortfDefField, InvestorID), sizeof(CThostFtdcQrySPBMInvestorPortfDefField::InvestorID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorPortfMarginRatioFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorPortfMarginRatioField, BrokerID), sizeof(CThostFtdcQryInvestorPortfMarginRatioField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorPortfMarginRatioField, InvestorID), sizeof(CThostFtdcQryInvestorPortfMarginRatioField::InvestorID), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorPortfMarginRatioField, ExchangeID), sizeof(CThostFtdcQryInvestorPortfMarginRatioField::ExchangeID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcQryInvestorPortfMarginRatioField, ProductGroupID), sizeof(CThostFtdcQryInvestorPortfMarginRatioField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorProdSPBMDetailFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorProdSPBMDetailField, ExchangeID), sizeof(CThostFtdcQryInvestorProdSPBMDetailField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorProdSPBMDetailField, BrokerID), sizeof(CThostFtdcQryInvestorProdSPBMDetailField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorProdSPBMDetailField, InvestorID), sizeof(CThostFtdcQryInvestorProdSPBMDetailField::InvestorID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQryInvestorProdSPBMDetailField, ProdFamilyCode), sizeof(CThostFtdcQryInvestorProdSPBMDetailField::ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorCommoditySPMMMarginFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorCommoditySPMMMarginField, BrokerID), sizeof(CThostFtdcQryInvestorCommoditySPMMMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorCommoditySPMMMarginField, InvestorID), sizeof(CThostFtdcQryInvestorCommoditySPMMMarginField::InvestorID), FIELD_ASCII},
+	{"CommodityID", &KEY_CommodityID, offsetof(CThostFtdcQryInvestorCommoditySPMMMarginField, CommodityID), sizeof(CThostFtdcQryInvestorCommoditySPMMMarginField::CommodityID), FIELD_GBK},
+};
+
+static const FieldDesc QryInvestorCommodityGroupSPMMMarginFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorCommodityGroupSPMMMarginField, BrokerID), sizeof(CThostFtdcQryInvestorCommodityGroupSPMMMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorCommodityGroupSPMMMarginField, InvestorID), sizeof(CThostFtdcQryInvestorCommodityGroupSPMMMarginField::InvestorID), FIELD_ASCII},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcQryInvestorCommodityGroupSPMMMarginField, CommodityGroupID), sizeof(CThostFtdcQryInvestorCommodityGroupSPMMMarginField::CommodityGroupID), FIELD_GBK},
+};
+
+static const FieldDesc QrySPMMInstParamFields[] = {
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQrySPMMInstParamField, InstrumentID), sizeof(CThostFtdcQrySPMMInstParamField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QrySPMMProductParamFields[] = {
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQrySPMMProductParamField, ProductID), sizeof(CThostFtdcQrySPMMProductParamField::ProductID), FIELD_GBK},
+};
+
+static const FieldDesc QrySPBMAddOnInterParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQrySPBMAddOnInterParameterField, ExchangeID), sizeof(CThostFtdcQrySPBMAddOnInterParameterField::ExchangeID), FIELD_ASCII},
+	{"Leg1ProdFamilyCode", &KEY_Leg1ProdFamilyCode, offsetof(CThostFtdcQrySPBMAddOnInterParameterField, Leg1ProdFamilyCode), sizeof(CThostFtdcQrySPBMAddOnInterParameterField::Leg1ProdFamilyCode), FIELD_ASCII},
+	{"Leg2ProdFamilyCode", &KEY_Leg2ProdFamilyCode, offsetof(CThostFtdcQrySPBMAddOnInterParameterField, Leg2ProdFamilyCode), sizeof(CThostFtdcQrySPBMAddOnInterParameterField::Leg2ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QryRCAMSCombProductInfoFields[] = {
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryRCAMSCombProductInfoField, ProductID), sizeof(CThostFtdcQryRCAMSCombProductInfoField::ProductID), FIELD_ASCII},
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcQryRCAMSCombProductInfoField, CombProductID), sizeof(CThostFtdcQryRCAMSCombProductInfoField::CombProductID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcQryRCAMSCombProductInfoField, ProductGroupID), sizeof(CThostFtdcQryRCAMSCombProductInfoField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRCAMSInstrParameterFields[] = {
+	{"ProductID", &KEY_ProductID, offsetof(CThostFtdcQryRCAMSInstrParameterField, ProductID), sizeof(CThostFtdcQryRCAMSInstrParameterField::ProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRCAMSIntraParameterFields[] = {
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcQryRCAMSIntraParameterField, CombProductID), sizeof(CThostFtdcQryRCAMSIntraParameterField::CombProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRCAMSInterParameterFields[] = {
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcQryRCAMSInterParameterField, ProductGroupID), sizeof(CThostFtdcQryRCAMSInterParameterField::ProductGroupID), FIELD_ASCII},
+	{"CombProduct1", &KEY_CombProduct1, offsetof(CThostFtdcQryRCAMSInterParameterField, CombProduct1), sizeof(CThostFtdcQryRCAMSInterParameterField::CombProduct1), FIELD_ASCII},
+	{"CombProduct2", &KEY_CombProduct2, offsetof(CThostFtdcQryRCAMSInterParameterField, CombProduct2), sizeof(CThostFtdcQryRCAMSInterParameterField::CombProduct2), FIELD_ASCII},
+};
+
+static const FieldDesc QryRCAMSShortOptAdjustParamFields[] = {
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcQryRCAMSShortOptAdjustParamField, CombProductID), sizeof(CThostFtdcQryRCAMSShortOptAdjustParamField::CombProductID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRCAMSInvestorCombPositionFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryRCAMSInvestorCombPositionField, BrokerID), sizeof(CThostFtdcQryRCAMSInvestorCombPositionField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryRCAMSInvestorCombPositionField, InvestorID), sizeof(CThostFtdcQryRCAMSInvestorCombPositionField::InvestorID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryRCAMSInvestorCombPositionField, InstrumentID), sizeof(CThostFtdcQryRCAMSInvestorCombPositionField::InstrumentID), FIELD_ASCII},
+	{"CombInstrumentID", &KEY_CombInstrumentID, offsetof(CThostFtdcQryRCAMSInvestorCombPositionField, CombInstrumentID), sizeof(CThostFtdcQryRCAMSInvestorCombPositionField::CombInstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryInvestorProdRCAMSMarginFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorProdRCAMSMarginField, BrokerID), sizeof(CThostFtdcQryInvestorProdRCAMSMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorProdRCAMSMarginField, InvestorID), sizeof(CThostFtdcQryInvestorProdRCAMSMarginField::InvestorID), FIELD_ASCII},
+	{"CombProductID", &KEY_CombProductID, offsetof(CThostFtdcQryInvestorProdRCAMSMarginField, CombProductID), sizeof(CThostFtdcQryInvestorProdRCAMSMarginField::CombProductID), FIELD_ASCII},
+	{"ProductGroupID", &KEY_ProductGroupID, offsetof(CThostFtdcQryInvestorProdRCAMSMarginField, ProductGroupID), sizeof(CThostFtdcQryInvestorProdRCAMSMarginField::ProductGroupID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRULEInstrParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryRULEInstrParameterField, ExchangeID), sizeof(CThostFtdcQryRULEInstrParameterField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryRULEInstrParameterField, InstrumentID), sizeof(CThostFtdcQryRULEInstrParameterField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc QryRULEIntraParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryRULEIntraParameterField, ExchangeID), sizeof(CThostFtdcQryRULEIntraParameterField::ExchangeID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQryRULEIntraParameterField, ProdFamilyCode), sizeof(CThostFtdcQryRULEIntraParameterField::ProdFamilyCode), FIELD_ASCII},
+};
+
+static const FieldDesc QryRULEInterParameterFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryRULEInterParameterField, ExchangeID), sizeof(CThostFtdcQryRULEInterParameterField::ExchangeID), FIELD_ASCII},
+	{"Leg1ProdFamilyCode", &KEY_Leg1ProdFamilyCode, offsetof(CThostFtdcQryRULEInterParameterField, Leg1ProdFamilyCode), sizeof(CThostFtdcQryRULEInterParameterField::Leg1ProdFamilyCode), FIELD_ASCII},
+	{"Leg2ProdFamilyCode", &KEY_Leg2ProdFamilyCode, offsetof(CThostFtdcQryRULEInterParameterField, Leg2ProdFamilyCode), sizeof(CThostFtdcQryRULEInterParameterField::Leg2ProdFamilyCode), FIELD_ASCII},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcQryRULEInterParameterField, CommodityGroupID), sizeof(CThostFtdcQryRULEInterParameterField::CommodityGroupID), FIELD_INT},
+};
+
+static const FieldDesc QryInvestorProdRULEMarginFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorProdRULEMarginField, ExchangeID), sizeof(CThostFtdcQryInvestorProdRULEMarginField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorProdRULEMarginField, BrokerID), sizeof(CThostFtdcQryInvestorProdRULEMarginField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorProdRULEMarginField, InvestorID), sizeof(CThostFtdcQryInvestorProdRULEMarginField::InvestorID), FIELD_ASCII},
+	{"ProdFamilyCode", &KEY_ProdFamilyCode, offsetof(CThostFtdcQryInvestorProdRULEMarginField, ProdFamilyCode), sizeof(CThostFtdcQryInvestorProdRULEMarginField::ProdFamilyCode), FIELD_ASCII},
+	{"CommodityGroupID", &KEY_CommodityGroupID, offsetof(CThostFtdcQryInvestorProdRULEMarginField, CommodityGroupID), sizeof(CThostFtdcQryInvestorProdRULEMarginField::CommodityGroupID), FIELD_INT},
+};
+
+static const FieldDesc QryInvestorPortfSettingFields[] = {
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcQryInvestorPortfSettingField, ExchangeID), sizeof(CThostFtdcQryInvestorPortfSettingField::ExchangeID), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcQryInvestorPortfSettingField, BrokerID), sizeof(CThostFtdcQryInvestorPortfSettingField::BrokerID), FIELD_ASCII},
+	{"InvestorID", &KEY_InvestorID, offsetof(CThostFtdcQryInvestorPortfSettingField, InvestorID), sizeof(CThostFtdcQryInvestorPortfSettingField::InvestorID), FIELD_ASCII},
+};
+
+static const char *CALLBACK_NAMES[CALLBACK_COUNT] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspAuthenticate",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspUserPasswordUpdate",
+	"onRspTradingAccountPasswordUpdate",
+	"onRspUserAuthMethod",
+	"onRspGenUserCaptcha",
+	"onRspGenUserText",
+	"onRspOrderInsert",
+	"onRspParkedOrderInsert",
+	"onRspParkedOrderAction",
+	"onRspOrderAction",
+	"onRspQryMaxOrderVolume",
+	"onRspSettlementInfoConfirm",
+	"onRspRemoveParkedOrder",
+	"onRspRemoveParkedOrderAction",
+	"onRspExecOrderInsert",
+	"onRspExecOrderAction",
+	"onRspForQuoteInsert",
+	"onRspQuoteInsert",
+	"onRspQuoteAction",
+	"onRspBatchOrderAction",
+	"onRspOptionSelfCloseInsert",
+	"onRspOptionSelfCloseAction",
+	"onRspCombActionInsert",
+	"onRspQryOrder",
+	"onRspQryTrade",
+	"onRspQryInvestorPosition",
+	"onRspQryTradingAccount",
+	"onRspQryInvestor",
+	"onRspQryTradingCode",
+	"onRspQryInstrumentMarginRate",
+	"onRspQryInstrumentCommissionRate",
+	"onRspQryExchange",
+	"onRspQryProduct",
+	"onRspQryInstrument",
+	"onRspQryDepthMarketData",
+	"onRspQryTraderOffer",
+	"onRspQrySettlementInfo",
+	"onRspQryTransferBank",
+	"onRspQryInvestorPositionDetail",
+	"onRspQryNotice",
+	"onRspQrySettlementInfoConfirm",
+	"onRspQryInvestorPositionCombineDetail",
+	"onRspQryCFMMCTradingAccountKey",
+	"onRspQryEWarrantOffset",
+	"onRspQryInvestorProductGroupMargin",
+	"onRspQryExchangeMarginRate",
+	"onRspQryExchangeMarginRateAdjust",
+	"onRspQryExchangeRate",
+	"onRspQrySecAgentACIDMap",
+	"onRspQryProductExchRate",
+	"onRspQryProductGroup",
+	"onRspQryMMInstrumentCommissionRate",
+	"onRspQryMMOptionInstrCommRate",
+	"onRspQryInstrumentOrderCommRate",
+	"onRspQrySecAgentTradingAccount",
+	"onRspQrySecAgentCheckMode",
+	"onRspQrySecAgentTradeInfo",
+	"onRspQryOptionInstrTradeCost",
+	"onRspQryOptionInstrCommRate",
+	"onRspQryExecOrder",
+	"onRspQryForQuote",
+	"onRspQryQuote",
+	"onRspQryOptionSelfClose",
+	"onRspQryInvestUnit",
+	"onRspQryCombInstrumentGuard",
+	"onRspQryCombAction",
+	"onRspQryTransferSerial",
+	"onRspQryAccountregister",
+	"onRspError",
+	"onRtnOrder",
+	"onRtnTrade",
+	"onErrRtnOrderInsert",
+	"onErrRtnOrderAction",
+	"onRtnInstrumentStatus",
+	"onRtnBulletin",
+	"onRtnTradingNotice",
+	"onRtnErrorConditionalOrder",
+	"onRtnExecOrder",
+	"onErrRtnExecOrderInsert",
+	"onErrRtnExecOrderAction",
+	"onErrRtnForQuoteInsert",
+	"onRtnQuote",
+	"onErrRtnQuoteInsert",
+	"onErrRtnQuoteAction",
+	"onRtnForQuoteRsp",
+	"onRtnCFMMCTradingAccountToken",
+	"onErrRtnBatchOrderAction",
+	"onRtnOptionSelfClose",
+	"onErrRtnOptionSelfCloseInsert",
+	"onErrRtnOptionSelfCloseAction",
+	"onRtnCombAction",
+	"onErrRtnCombActionInsert",
+	"onRspQryContractBank",
+	"onRspQryParkedOrder",
+	"onRspQryParkedOrderAction",
+	"onRspQryTradingNotice",
+	"onRspQryBrokerTradingParams",
+	"onRspQryBrokerTradingAlgos",
+	"onRspQueryCFMMCTradingAccountToken",
+	"onRtnFromBankToFutureByBank",
+	"onRtnFromFutureToBankByBank",
+	"onRtnRepealFromBankToFutureByBank",
+	"onRtnRepealFromFutureToBankByBank",
+	"onRtnFromBankToFutureByFuture",
+	"onRtnFromFutureToBankByFuture",
+	"onRtnRepealFromBankToFutureByFutureManual",
+	"onRtnRepealFromFutureToBankByFutureManual",
+	"onRtnQueryBankBalanceByFuture",
+	"onErrRtnBankToFutureByFuture",
+	"onErrRtnFutureToBankByFuture",
+	"onErrRtnRepealBankToFutureByFutureManual",
+	"onErrRtnRepealFutureToBankByFutureManual",
+	"onErrRtnQueryBankBalanceByFuture",
+	"onRtnRepealFromBankToFutureByFuture",
+	"onRtnRepealFromFutureToBankByFuture",
+	"onRspFromBankToFutureByFuture",
+	"onRspFromFutureToBankByFuture",
+	"onRspQueryBankAccountMoneyByFuture",
+	"onRtnOpenAccountByBank",
+	"onRtnCancelAccountByBank",
+	"onRtnChangeAccountByBank",
+	"onRspQryClassifiedInstrument",
+	"onRspQryCombPromotionParam",
+	"onRspQryRiskSettleInvstPosition",
+	"onRspQryRiskSettleProductStatus",
+	"onRspQrySPBMFutureParameter",
+	"onRspQrySPBMOptionParameter",
+	"onRspQrySPBMIntraParameter",
+	"onRspQrySPBMInterParameter",
+	"onRspQrySPBMPortfDefinition",
+	"onRspQrySPBMInvestorPortfDef",
+	"onRspQryInvestorPortfMarginRatio",
+	"onRspQryInvestorProdSPBMDetail",
+	"onRspQryInvestorCommoditySPMMMargin",
+	"onRspQryInvestorCommodityGroupSPMMMargin",
+	"onRspQrySPMMInstParam",
+	"onRspQrySPMMProductParam",
+	"onRspQrySPBMAddonInterParameter",
+	"onRspQryRCAMSCombProductInfo",
+	"onRspQryRCAMSInstrParameter",
+	"onRspQryRCAMSIntraParameter",
+	"onRspQryRCAMSInterParameter",
+	"onRspQryRCAMSShortOptAdjustParam",
+	"onRspQryRCAMSInvestorCombPosition",
+	"onRspQryInvestorProdRCAMSMargin",
+	"onRspQryRULEInstrParameter",
+	"onRspQryRULEIntraParameter",
+	"onRspQryRULEInterParameter",
+	"onRspQryInvestorProdRULEMargin",
+	"onRspQryInvestorPortfSetting",
+};
+
+static const CallbackDesc CALLBACKS[CALLBACK_COUNT] = {
+	{0, nullptr, 0, 0},
+	{CALLBACK_ARG_ID, nullptr, 0, 0},
+	{CALLBACK_ARG_ID, nullptr, 0, 0},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspAuthenticateFields, std::size(RspAuthenticateFields), sizeof(CThostFtdcRspAuthenticateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspUserLoginFields, std::size(RspUserLoginFields), sizeof(CThostFtdcRspUserLoginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, UserLogoutFields, std::size(UserLogoutFields), sizeof(CThostFtdcUserLogoutField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, UserPasswordUpdateFields, std::size(UserPasswordUpdateFields), sizeof(CThostFtdcUserPasswordUpdateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TradingAccountPasswordUpdateFields, std::size(TradingAccountPasswordUpdateFields), sizeof(CThostFtdcTradingAccountPasswordUpdateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspUserAuthMethodFields, std::size(RspUserAuthMethodFields), sizeof(CThostFtdcRspUserAuthMethodField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspGenUserCaptchaFields, std::size(RspGenUserCaptchaFields), sizeof(CThostFtdcRspGenUserCaptchaField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspGenUserTextFields, std::size(RspGenUserTextFields), sizeof(CThostFtdcRspGenUserTextField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputOrderFields, std::size(InputOrderFields), sizeof(CThostFtdcInputOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ParkedOrderFields, std::size(ParkedOrderFields), sizeof(CThostFtdcParkedOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ParkedOrderActionFields, std::size(ParkedOrderActionFields), sizeof(CThostFtdcParkedOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputOrderActionFields, std::size(InputOrderActionFields), sizeof(CThostFtdcInputOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, QryMaxOrderVolumeFields, std::size(QryMaxOrderVolumeFields), sizeof(CThostFtdcQryMaxOrderVolumeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SettlementInfoConfirmFields, std::size(SettlementInfoConfirmFields), sizeof(CThostFtdcSettlementInfoConfirmField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RemoveParkedOrderFields, std::size(RemoveParkedOrderFields), sizeof(CThostFtdcRemoveParkedOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RemoveParkedOrderActionFields, std::size(RemoveParkedOrderActionFields), sizeof(CThostFtdcRemoveParkedOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputExecOrderFields, std::size(InputExecOrderFields), sizeof(CThostFtdcInputExecOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputExecOrderActionFields, std::size(InputExecOrderActionFields), sizeof(CThostFtdcInputExecOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputForQuoteFields, std::size(InputForQuoteFields), sizeof(CThostFtdcInputForQuoteField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputQuoteFields, std::size(InputQuoteFields), sizeof(CThostFtdcInputQuoteField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputQuoteActionFields, std::size(InputQuoteActionFields), sizeof(CThostFtdcInputQuoteActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputBatchOrderActionFields, std::size(InputBatchOrderActionFields), sizeof(CThostFtdcInputBatchOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputOptionSelfCloseFields, std::size(InputOptionSelfCloseFields), sizeof(CThostFtdcInputOptionSelfCloseField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputOptionSelfCloseActionFields, std::size(InputOptionSelfCloseActionFields), sizeof(CThostFtdcInputOptionSelfCloseActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InputCombActionFields, std::size(InputCombActionFields), sizeof(CThostFtdcInputCombActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, OrderFields, std::size(OrderFields), sizeof(CThostFtdcOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TradeFields, std::size(TradeFields), sizeof(CThostFtdcTradeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorPositionFields, std::size(InvestorPositionFields), sizeof(CThostFtdcInvestorPositionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TradingAccountFields, std::size(TradingAccountFields), sizeof(CThostFtdcTradingAccountField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorFields, std::size(InvestorFields), sizeof(CThostFtdcInvestorField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TradingCodeFields, std::size(TradingCodeFields), sizeof(CThostFtdcTradingCodeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InstrumentMarginRateFields, std::size(InstrumentMarginRateFields), sizeof(CThostFtdcInstrumentMarginRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InstrumentCommissionRateFields, std::size(InstrumentCommissionRateFields), sizeof(CThostFtdcInstrumentCommissionRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ExchangeFields, std::size(ExchangeFields), sizeof(CThostFtdcExchangeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ProductFields, std::size(ProductFields), sizeof(CThostFtdcProductField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InstrumentFields, std::size(InstrumentFields), sizeof(CThostFtdcInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, DepthMarketDataFields, std::size(DepthMarketDataFields), sizeof(CThostFtdcDepthMarketDataField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TraderOfferFields, std::size(TraderOfferFields), sizeof(CThostFtdcTraderOfferField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SettlementInfoFields, std::size(SettlementInfoFields), sizeof(CThostFtdcSettlementInfoField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TransferBankFields, std::size(TransferBankFields), sizeof(CThostFtdcTransferBankField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorPositionDetailFields, std::size(InvestorPositionDetailFields), sizeof(CThostFtdcInvestorPositionDetailField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, NoticeFields, std::size(NoticeFields), sizeof(CThostFtdcNoticeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SettlementInfoConfirmFields, std::size(SettlementInfoConfirmFields), sizeof(CThostFtdcSettlementInfoConfirmField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorPositionCombineDetailFields, std::size(InvestorPositionCombineDetailFields), sizeof(CThostFtdcInvestorPositionCombineDetailField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, CFMMCTradingAccountKeyFields, std::size(CFMMCTradingAccountKeyFields), sizeof(CThostFtdcCFMMCTradingAccountKeyField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, EWarrantOffsetFields, std::size(EWarrantOffsetFields), sizeof(CThostFtdcEWarrantOffsetField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorProductGroupMarginFields, std::size(InvestorProductGroupMarginFields), sizeof(CThostFtdcInvestorProductGroupMarginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ExchangeMarginRateFields, std::size(ExchangeMarginRateFields), sizeof(CThostFtdcExchangeMarginRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ExchangeMarginRateAdjustFields, std::size(ExchangeMarginRateAdjustFields), sizeof(CThostFtdcExchangeMarginRateAdjustField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ExchangeRateFields, std::size(ExchangeRateFields), sizeof(CThostFtdcExchangeRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SecAgentACIDMapFields, std::size(SecAgentACIDMapFields), sizeof(CThostFtdcSecAgentACIDMapField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ProductExchRateFields, std::size(ProductExchRateFields), sizeof(CThostFtdcProductExchRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ProductGroupFields, std::size(ProductGroupFields), sizeof(CThostFtdcProductGroupField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, MMInstrumentCommissionRateFields, std::size(MMInstrumentCommissionRateFields), sizeof(CThostFtdcMMInstrumentCommissionRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, MMOptionInstrCommRateFields, std::size(MMOptionInstrCommRateFields), sizeof(CThostFtdcMMOptionInstrCommRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InstrumentOrderCommRateFields, std::size(InstrumentOrderCommRateFields), sizeof(CThostFtdcInstrumentOrderCommRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TradingAccountFields, std::size(TradingAccountFields), sizeof(CThostFtdcTradingAccountField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SecAgentCheckModeFields, std::size(SecAgentCheckModeFields), sizeof(CThostFtdcSecAgentCheckModeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SecAgentTradeInfoFields, std::size(SecAgentTradeInfoFields), sizeof(CThostFtdcSecAgentTradeInfoField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, OptionInstrTradeCostFields, std::size(OptionInstrTradeCostFields), sizeof(CThostFtdcOptionInstrTradeCostField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, OptionInstrCommRateFields, std::size(OptionInstrCommRateFields), sizeof(CThostFtdcOptionInstrCommRateField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ExecOrderFields, std::size(ExecOrderFields), sizeof(CThostFtdcExecOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ForQuoteFields, std::size(ForQuoteFields), sizeof(CThostFtdcForQuoteField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, QuoteFields, std::size(QuoteFields), sizeof(CThostFtdcQuoteField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, OptionSelfCloseFields, std::size(OptionSelfCloseFields), sizeof(CThostFtdcOptionSelfCloseField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestUnitFields, std::size(InvestUnitFields), sizeof(CThostFtdcInvestUnitField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, CombInstrumentGuardFields, std::size(CombInstrumentGuardFields), sizeof(CThostFtdcCombInstrumentGuardField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, CombActionFields, std::size(CombActionFields), sizeof(CThostFtdcCombActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TransferSerialFields, std::size(TransferSerialFields), sizeof(CThostFtdcTransferSerialField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, AccountregisterFields, std::size(AccountregisterFields), sizeof(CThostFtdcAccountregisterField)},
+	{CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, nullptr, 0, 0},
+	{CALLBACK_ARG_DATA, OrderFields, std::size(OrderFields), sizeof(CThostFtdcOrderField)},
+	{CALLBACK_ARG_DATA, TradeFields, std::size(TradeFields), sizeof(CThostFtdcTradeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, InputOrderFields, std::size(InputOrderFields), sizeof(CThostFtdcInputOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, OrderActionFields, std::size(OrderActionFields), sizeof(CThostFtdcOrderActionField)},
+	{CALLBACK_ARG_DATA, InstrumentStatusFields, std::size(InstrumentStatusFields), sizeof(CThostFtdcInstrumentStatusField)},
+	{CALLBACK_ARG_DATA, BulletinFields, std::size(BulletinFields), sizeof(CThostFtdcBulletinField)},
+	{CALLBACK_ARG_DATA, TradingNoticeInfoFields, std::size(TradingNoticeInfoFields), sizeof(CThostFtdcTradingNoticeInfoField)},
+	{CALLBACK_ARG_DATA, ErrorConditionalOrderFields, std::size(ErrorConditionalOrderFields), sizeof(CThostFtdcErrorConditionalOrderField)},
+	{CALLBACK_ARG_DATA, ExecOrderFields, std::size(ExecOrderFields), sizeof(CThostFtdcExecOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, InputExecOrderFields, std::size(InputExecOrderFields), sizeof(CThostFtdcInputExecOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, ExecOrderActionFields, std::size(ExecOrderActionFields), sizeof(CThostFtdcExecOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, InputForQuoteFields, std::size(InputForQuoteFields), sizeof(CThostFtdcInputForQuoteField)},
+	{CALLBACK_ARG_DATA, QuoteFields, std::size(QuoteFields), sizeof(CThostFtdcQuoteField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, InputQuoteFields, std::size(InputQuoteFields), sizeof(CThostFtdcInputQuoteField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, QuoteActionFields, std::size(QuoteActionFields), sizeof(CThostFtdcQuoteActionField)},
+	{CALLBACK_ARG_DATA, ForQuoteRspFields, std::size(ForQuoteRspFields), sizeof(CThostFtdcForQuoteRspField)},
+	{CALLBACK_ARG_DATA, CFMMCTradingAccountTokenFields, std::size(CFMMCTradingAccountTokenFields), sizeof(CThostFtdcCFMMCTradingAccountTokenField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, BatchOrderActionFields, std::size(BatchOrderActionFields), sizeof(CThostFtdcBatchOrderActionField)},
+	{CALLBACK_ARG_DATA, OptionSelfCloseFields, std::size(OptionSelfCloseFields), sizeof(CThostFtdcOptionSelfCloseField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, InputOptionSelfCloseFields, std::size(InputOptionSelfCloseFields), sizeof(CThostFtdcInputOptionSelfCloseField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, OptionSelfCloseActionFields, std::size(OptionSelfCloseActionFields), sizeof(CThostFtdcOptionSelfCloseActionField)},
+	{CALLBACK_ARG_DATA, CombActionFields, std::size(CombActionFields), sizeof(CThostFtdcCombActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, InputCombActionFields, std::size(InputCombActionFields), sizeof(CThostFtdcInputCombActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ContractBankFields, std::size(ContractBankFields), sizeof(CThostFtdcContractBankField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ParkedOrderFields, std::size(ParkedOrderFields), sizeof(CThostFtdcParkedOrderField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ParkedOrderActionFields, std::size(ParkedOrderActionFields), sizeof(CThostFtdcParkedOrderActionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, TradingNoticeFields, std::size(TradingNoticeFields), sizeof(CThostFtdcTradingNoticeField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, BrokerTradingParamsFields, std::size(BrokerTradingParamsFields), sizeof(CThostFtdcBrokerTradingParamsField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, BrokerTradingAlgosFields, std::size(BrokerTradingAlgosFields), sizeof(CThostFtdcBrokerTradingAlgosField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, QueryCFMMCTradingAccountTokenFields, std::size(QueryCFMMCTradingAccountTokenFields), sizeof(CThostFtdcQueryCFMMCTradingAccountTokenField)},
+	{CALLBACK_ARG_DATA, RspTransferFields, std::size(RspTransferFields), sizeof(CThostFtdcRspTransferField)},
+	{CALLBACK_ARG_DATA, RspTransferFields, std::size(RspTransferFields), sizeof(CThostFtdcRspTransferField)},
+	{CALLBACK_ARG_DATA, RspRepealFields, std::size(RspRepealFields), sizeof(CThostFtdcRspRepealField)},
+	{CALLBACK_ARG_DATA, RspRepealFields, std::size(RspRepealFields), sizeof(CThostFtdcRspRepealField)},
+	{CALLBACK_ARG_DATA, RspTransferFields, std::size(RspTransferFields), sizeof(CThostFtdcRspTransferField)},
+	{CALLBACK_ARG_DATA, RspTransferFields, std::size(RspTransferFields), sizeof(CThostFtdcRspTransferField)},
+	{CALLBACK_ARG_DATA, RspRepealFields, std::size(RspRepealFields), sizeof(CThostFtdcRspRepealField)},
+	{CALLBACK_ARG_DATA, RspRepealFields, std::size(RspRepealFields), sizeof(CThostFtdcRspRepealField)},
+	{CALLBACK_ARG_DATA, NotifyQueryAccountFields, std::size(NotifyQueryAccountFields), sizeof(CThostFtdcNotifyQueryAccountField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, ReqTransferFields, std::size(ReqTransferFields), sizeof(CThostFtdcReqTransferField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, ReqTransferFields, std::size(ReqTransferFields), sizeof(CThostFtdcReqTransferField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, ReqRepealFields, std::size(ReqRepealFields), sizeof(CThostFtdcReqRepealField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, ReqRepealFields, std::size(ReqRepealFields), sizeof(CThostFtdcReqRepealField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR, ReqQueryAccountFields, std::size(ReqQueryAccountFields), sizeof(CThostFtdcReqQueryAccountField)},
+	{CALLBACK_ARG_DATA, RspRepealFields, std::size(RspRepealFields), sizeof(CThostFtdcRspRepealField)},
+	{CALLBACK_ARG_DATA, RspRepealFields, std::size(RspRepealFields), sizeof(CThostFtdcRspRepealField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ReqTransferFields, std::size(ReqTransferFields), sizeof(CThostFtdcReqTransferField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ReqTransferFields, std::size(ReqTransferFields), sizeof(CThostFtdcReqTransferField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, ReqQueryAccountFields, std::size(ReqQueryAccountFields), sizeof(CThostFtdcReqQueryAccountField)},
+	{CALLBACK_ARG_DATA, OpenAccountFields, std::size(OpenAccountFields), sizeof(CThostFtdcOpenAccountField)},
+	{CALLBACK_ARG_DATA, CancelAccountFields, std::size(CancelAccountFields), sizeof(CThostFtdcCancelAccountField)},
+	{CALLBACK_ARG_DATA, ChangeAccountFields, std::size(ChangeAccountFields), sizeof(CThostFtdcChangeAccountField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InstrumentFields, std::size(InstrumentFields), sizeof(CThostFtdcInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, CombPromotionParamFields, std::size(CombPromotionParamFields), sizeof(CThostFtdcCombPromotionParamField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RiskSettleInvstPositionFields, std::size(RiskSettleInvstPositionFields), sizeof(CThostFtdcRiskSettleInvstPositionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RiskSettleProductStatusFields, std::size(RiskSettleProductStatusFields), sizeof(CThostFtdcRiskSettleProductStatusField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMFutureParameterFields, std::size(SPBMFutureParameterFields), sizeof(CThostFtdcSPBMFutureParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMOptionParameterFields, std::size(SPBMOptionParameterFields), sizeof(CThostFtdcSPBMOptionParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMIntraParameterFields, std::size(SPBMIntraParameterFields), sizeof(CThostFtdcSPBMIntraParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMInterParameterFields, std::size(SPBMInterParameterFields), sizeof(CThostFtdcSPBMInterParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMPortfDefinitionFields, std::size(SPBMPortfDefinitionFields), sizeof(CThostFtdcSPBMPortfDefinitionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMInvestorPortfDefFields, std::size(SPBMInvestorPortfDefFields), sizeof(CThostFtdcSPBMInvestorPortfDefField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorPortfMarginRatioFields, std::size(InvestorPortfMarginRatioFields), sizeof(CThostFtdcInvestorPortfMarginRatioField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorProdSPBMDetailFields, std::size(InvestorProdSPBMDetailFields), sizeof(CThostFtdcInvestorProdSPBMDetailField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorCommoditySPMMMarginFields, std::size(InvestorCommoditySPMMMarginFields), sizeof(CThostFtdcInvestorCommoditySPMMMarginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorCommodityGroupSPMMMarginFields, std::size(InvestorCommodityGroupSPMMMarginFields), sizeof(CThostFtdcInvestorCommodityGroupSPMMMarginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPMMInstParamFields, std::size(SPMMInstParamFields), sizeof(CThostFtdcSPMMInstParamField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPMMProductParamFields, std::size(SPMMProductParamFields), sizeof(CThostFtdcSPMMProductParamField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SPBMAddOnInterParameterFields, std::size(SPBMAddOnInterParameterFields), sizeof(CThostFtdcSPBMAddOnInterParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RCAMSCombProductInfoFields, std::size(RCAMSCombProductInfoFields), sizeof(CThostFtdcRCAMSCombProductInfoField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RCAMSInstrParameterFields, std::size(RCAMSInstrParameterFields), sizeof(CThostFtdcRCAMSInstrParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RCAMSIntraParameterFields, std::size(RCAMSIntraParameterFields), sizeof(CThostFtdcRCAMSIntraParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RCAMSInterParameterFields, std::size(RCAMSInterParameterFields), sizeof(CThostFtdcRCAMSInterParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RCAMSShortOptAdjustParamFields, std::size(RCAMSShortOptAdjustParamFields), sizeof(CThostFtdcRCAMSShortOptAdjustParamField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RCAMSInvestorCombPositionFields, std::size(RCAMSInvestorCombPositionFields), sizeof(CThostFtdcRCAMSInvestorCombPositionField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorProdRCAMSMarginFields, std::size(InvestorProdRCAMSMarginFields), sizeof(CThostFtdcInvestorProdRCAMSMarginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RULEInstrParameterFields, std::size(RULEInstrParameterFields), sizeof(CThostFtdcRULEInstrParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RULEIntraParameterFields, std::size(RULEIntraParameterFields), sizeof(CThostFtdcRULEIntraParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RULEInterParameterFields, std::size(RULEInterParameterFields), sizeof(CThostFtdcRULEInterParameterField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorProdRULEMarginFields, std::size(InvestorProdRULEMarginFields), sizeof(CThostFtdcInvestorProdRULEMarginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, InvestorPortfSettingFields, std::size(InvestorPortfSettingFields), sizeof(CThostFtdcInvestorPortfSettingField)},
+};
+
@@ -0,0 +1,240 @@
+void TdApi::checkOverrides()
+{
+	this->overrides[ONFRONTCONNECTED] = bool(get_overload(this, "onFrontConnected"));
+	this->overrides[ONFRONTDISCONNECTED] = bool(get_overload(this, "onFrontDisconnected"));
+	this->overrides[ONHEARTBEATWARNING] = bool(get_overload(this, "onHeartBeatWarning"));
+	this->overrides[ONRSPAUTHENTICATE] = bool(get_overload(this, "onRspAuthenticate"));
+	this->overrides[ONRSPUSERLOGIN] = bool(get_overload(this, "onRspUserLogin"));
+	this->overrides[ONRSPUSERLOGOUT] = bool(get_overload(this, "onRspUserLogout"));
+	this->overrides[ONRSPUSERPASSWORDUPDATE] = bool(get_overload(this, "onRspUserPasswordUpdate"));
+	this->overrides[ONRSPTRADINGACCOUNTPASSWORDUPDATE] = bool(get_overload(this, "onRspTradingAccountPasswordUpdate"));
+	this->overrides[ONRSPUSERAUTHMETHOD] = bool(get_overload(this, "onRspUserAuthMethod"));
+	this->overrides[ONRSPGENUSERCAPTCHA] = bool(get_overload(this, "onRspGenUserCaptcha"));
+	this->overrides[ONRSPGENUSERTEXT] = bool(get_overload(this, "onRspGenUserText"));
+	this->overrides[ONRSPORDERINSERT] = bool(get_overload(this, "onRspOrderInsert"));
+	this->overrides[ONRSPPARKEDORDERINSERT] = bool(get_overload(this, "onRspParkedOrderInsert"));
+	this->overrides[ONRSPPARKEDORDERACTION] = bool(get_overload(this, "onRspParkedOrderAction"));
+	this->overrides[ONRSPORDERACTION] = bool(get_overload(this, "onRspOrderAction"));
+	this->overrides[ONRSPQRYMAXORDERVOLUME] = bool(get_overload(this, "onRspQryMaxOrderVolume"));
+	this->query_rows.enable(ONRSPQRYMAXORDERVOLUME, bool(get_overload(this, "onRspQryMaxOrderVolumeAll")));
+	this->overrides[ONRSPSETTLEMENTINFOCONFIRM] = bool(get_overload(this, "onRspSettlementInfoConfirm"));
+	this->overrides[ONRSPREMOVEPARKEDORDER] = bool(get_overload(this, "onRspRemoveParkedOrder"));
+	this->overrides[ONRSPREMOVEPARKEDORDERACTION] = bool(get_overload(this, "onRspRemoveParkedOrderAction"));
+	this->overrides[ONRSPEXECORDERINSERT] = bool(get_overload(this, "onRspExecOrderInsert"));
+	this->overrides[ONRSPEXECORDERACTION] = bool(get_overload(this, "onRspExecOrderAction"));
+	this->overrides[ONRSPFORQUOTEINSERT] = bool(get_overload(this, "onRspForQuoteInsert"));
+	this->overrides[ONRSPQUOTEINSERT] = bool(get_overload(this, "onRspQuoteInsert"));
+	this->overrides[ONRSPQUOTEACTION] = bool(get_overload(this, "onRspQuoteAction"));
+	this->overrides[ONRSPBATCHORDERACTION] = bool(get_overload(this, "onRspBatchOrderAction"));
+	this->overrides[ONRSPOPTIONSELFCLOSEINSERT] = bool(get_overload(this, "onRspOptionSelfCloseInsert"));
+	this->overrides[ONRSPOPTIONSELFCLOSEACTION] = bool(get_overload(this, "onRspOptionSelfCloseAction"));
+	this->overrides[ONRSPCOMBACTIONINSERT] = bool(get_overload(this, "onRspCombActionInsert"));
+	this->overrides[ONRSPQRYORDER] = bool(get_overload(this, "onRspQryOrder"));
+	this->query_rows.enable(ONRSPQRYORDER, bool(get_overload(this, "onRspQryOrderAll")));
+	this->overrides[ONRSPQRYTRADE] = bool(get_overload(this, "onRspQryTrade"));
+	this->query_rows.enable(ONRSPQRYTRADE, bool(get_overload(this, "onRspQryTradeAll")));
+	this->overrides[ONRSPQRYINVESTORPOSITION] = bool(get_overload(this, "onRspQryInvestorPosition"));
+	this->query_rows.enable(ONRSPQRYINVESTORPOSITION, bool(get_overload(this, "onRspQryInvestorPositionAll")));
+	this->overrides[ONRSPQRYTRADINGACCOUNT] = bool(get_overload(this, "onRspQryTradingAccount"));
+	this->query_rows.enable(ONRSPQRYTRADINGACCOUNT, bool(get_overload(this, "onRspQryTradingAccountAll")));
+	this->overrides[ONRSPQRYINVESTOR] = bool(get_overload(this, "onRspQryInvestor"));
+	this->query_rows.enable(ONRSPQRYINVESTOR, bool(get_overload(this, "onRspQryInvestorAll")));
+	this->overrides[ONRSPQRYTRADINGCODE] = bool(get_overload(this, "onRspQryTradingCode"));
+	this->query_rows.enable(ONRSPQRYTRADINGCODE, bool(get_overload(this, "onRspQryTradingCodeAll")));
+	this->overrides[ONRSPQRYINSTRUMENTMARGINRATE] = bool(get_overload(this, "onRspQryInstrumentMarginRate"));
+	this->query_rows.enable(ONRSPQRYINSTRUMENTMARGINRATE, bool(get_overload(this, "onRspQryInstrumentMarginRateAll")));
+	this->overrides[ONRSPQRYINSTRUMENTCOMMISSIONRATE] = bool(get_overload(this, "onRspQryInstrumentCommissionRate"));
+	this->query_rows.enable(ONRSPQRYINSTRUMENTCOMMISSIONRATE, bool(get_overload(this, "onRspQryInstrumentCommissionRateAll")));
+	this->overrides[ONRSPQRYEXCHANGE] = bool(get_overload(this, "onRspQryExchange"));
+	this->query_rows.enable(ONRSPQRYEXCHANGE, bool(get_overload(this, "onRspQryExchangeAll")));
+	this->overrides[ONRSPQRYPRODUCT] = bool(get_overload(this, "onRspQryProduct"));
+	this->query_rows.enable(ONRSPQRYPRODUCT, bool(get_overload(this, "onRspQryProductAll")));
+	this->overrides[ONRSPQRYINSTRUMENT] = bool(get_overload(this, "onRspQryInstrument"));
+	this->query_rows.enable(ONRSPQRYINSTRUMENT, bool(get_overload(this, "onRspQryInstrumentAll")));
+	this->overrides[ONRSPQRYDEPTHMARKETDATA] = bool(get_overload(this, "onRspQryDepthMarketData"));
+	this->query_rows.enable(ONRSPQRYDEPTHMARKETDATA, bool(get_overload(this, "onRspQryDepthMarketDataAll")));
+	this->overrides[ONRSPQRYTRADEROFFER] = bool(get_overload(this, "onRspQryTraderOffer"));
+	this->query_rows.enable(ONRSPQRYTRADEROFFER, bool(get_overload(this, "onRspQryTraderOfferAll")));
+	this->overrides[ONRSPQRYSETTLEMENTINFO] = bool(get_overload(this, "onRspQrySettlementInfo"));
+	this->query_rows.enable(ONRSPQRYSETTLEMENTINFO, bool(get_overload(this, "onRspQrySettlementInfoAll")));
+	this->overrides[ONRSPQRYTRANSFERBANK] = bool(get_overload(this, "onRspQryTransferBank"));
+	this->query_rows.enable(ONRSPQRYTRANSFERBANK, bool(get_overload(this, "onRspQryTransferBankAll")));
+	this->overrides[ONRSPQRYINVESTORPOSITIONDETAIL] = bool(get_overload(this, "onRspQryInvestorPositionDetail"));
+	this->query_rows.enable(ONRSPQRYINVESTORPOSITIONDETAIL, bool(get_overload(this, "onRspQryInvestorPositionDetailAll")));
+	this->overrides[ONRSPQRYNOTICE] = bool(get_overload(this, "onRspQryNotice"));
+	this->query_rows.enable(ONRSPQRYNOTICE, bool(get_overload(this, "onRspQryNoticeAll")));
+	this->overrides[ONRSPQRYSETTLEMENTINFOCONFIRM] = bool(get_overload(this, "onRspQrySettlementInfoConfirm"));
+	this->query_rows.enable(ONRSPQRYSETTLEMENTINFOCONFIRM, bool(get_overload(this, "onRspQrySettlementInfoConfirmAll")));
+	this->overrides[ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL] = bool(get_overload(this, "onRspQryInvestorPositionCombineDetail"));
+	this->query_rows.enable(ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL, bool(get_overload(this, "onRspQryInvestorPositionCombineDetailAll")));
+	this->overrides[ONRSPQRYCFMMCTRADINGACCOUNTKEY] = bool(get_overload(this, "onRspQryCFMMCTradingAccountKey"));
+	this->query_rows.enable(ONRSPQRYCFMMCTRADINGACCOUNTKEY, bool(get_overload(this, "onRspQryCFMMCTradingAccountKeyAll")));
+	this->overrides[ONRSPQRYEWARRANTOFFSET] = bool(get_overload(this, "onRspQryEWarrantOffset"));
+	this->query_rows.enable(ONRSPQRYEWARRANTOFFSET, bool(get_overload(this, "onRspQryEWarrantOffsetAll")));
+	this->overrides[ONRSPQRYINVESTORPRODUCTGROUPMARGIN] = bool(get_overload(this, "onRspQryInvestorProductGroupMargin"));
+	this->query_rows.enable(ONRSPQRYINVESTORPRODUCTGROUPMARGIN, bool(get_overload(this, "onRspQryInvestorProductGroupMarginAll")));
+	this->overrides[ONRSPQRYEXCHANGEMARGINRATE] = bool(get_overload(this, "onRspQryExchangeMarginRate"));
+	this->query_rows.enable(ONRSPQRYEXCHANGEMARGINRATE, bool(get_overload(this, "onRspQryExchangeMarginRateAll")));
+	this->overrides[ONRSPQRYEXCHANGEMARGINRATEADJUST] = bool(get_overload(this, "onRspQryExchangeMarginRateAdjust"));
+	this->query_rows.enable(ONRSPQRYEXCHANGEMARGINRATEADJUST, bool(get_overload(this, "onRspQryExchangeMarginRateAdjustAll")));
+	this->overrides[ONRSPQRYEXCHANGERATE] = bool(get_overload(this, "onRspQryExchangeRate"));
+	this->query_rows.enable(ONRSPQRYEXCHANGERATE, bool(get_overload(this, "onRspQryExchangeRateAll")));
+	this->overrides[ONRSPQRYSECAGENTACIDMAP] = bool(get_overload(this, "onRspQrySecAgentACIDMap"));
+	this->query_rows.enable(ONRSPQRYSECAGENTACIDMAP, bool(get_overload(this, "onRspQrySecAgentACIDMapAll")));
+	this->overrides[ONRSPQRYPRODUCTEXCHRATE] = bool(get_overload(this, "onRspQryProductExchRate"));
+	this->query_rows.enable(ONRSPQRYPRODUCTEXCHRATE, bool(get_overload(this, "onRspQryProductExchRateAll")));
+	this->overrides[ONRSPQRYPRODUCTGROUP] = bool(get_overload(this, "onRspQryProductGroup"));
+	this->query_rows.enable(ONRSPQRYPRODUCTGROUP, bool(get_overload(this, "onRspQryProductGroupAll")));
+	this->overrides[ONRSPQRYMMINSTRUMENTCOMMISSIONRATE] = bool(get_overload(this, "onRspQryMMInstrumentCommissionRate"));
+	this->query_rows.enable(ONRSPQRYMMINSTRUMENTCOMMISSIONRATE, bool(get_overload(this, "onRspQryMMInstrumentCommissionRateAll")));
+	this->overrides[ONRSPQRYMMOPTIONINSTRCOMMRATE] = bool(get_overload(this, "onRspQryMMOptionInstrCommRate"));
+	this->query_rows.enable(ONRSPQRYMMOPTIONINSTRCOMMRATE, bool(get_overload(this, "onRspQryMMOptionInstrCommRateAll")));
+	this->overrides[ONRSPQRYINSTRUMENTORDERCOMMRATE] = bool(get_overload(this, "onRspQryInstrumentOrderCommRate"));
+	this->query_rows.enable(ONRSPQRYINSTRUMENTORDERCOMMRATE, bool(get_overload(this, "onRspQryInstrumentOrderCommRateAll")));
+	this->overrides[ONRSPQRYSECAGENTTRADINGACCOUNT] = bool(get_overload(this, "onRspQrySecAgentTradingAccount"));
+	this->query_rows.enable(ONRSPQRYSECAGENTTRADINGACCOUNT, bool(get_overload(this, "onRspQrySecAgentTradingAccountAll")));
+	this->overrides[ONRSPQRYSECAGENTCHECKMODE] = bool(get_overload(this, "onRspQrySecAgentCheckMode"));
+	this->query_rows.enable(ONRSPQRYSECAGENTCHECKMODE, bool(get_overload(this, "onRspQrySecAgentCheckModeAll")));
+	this->overrides[ONRSPQRYSECAGENTTRADEINFO] = bool(get_overload(this, "onRspQrySecAgentTradeInfo"));
+	this->query_rows.enable(ONRSPQRYSECAGENTTRADEINFO, bool(get_overload(this, "onRspQrySecAgentTradeInfoAll")));
+	this->overrides[ONRSPQRYOPTIONINSTRTRADECOST] = bool(get_overload(this, "onRspQryOptionInstrTradeCost"));
+	this->query_rows.enable(ONRSPQRYOPTIONINSTRTRADECOST, bool(get_overload(this, "onRspQryOptionInstrTradeCostAll")));
+	this->overrides[ONRSPQRYOPTIONINSTRCOMMRATE] = bool(get_overload(this, "onRspQryOptionInstrCommRate"));
+	this->query_rows.enable(ONRSPQRYOPTIONINSTRCOMMRATE, bool(get_overload(this, "onRspQryOptionInstrCommRateAll")));
+	this->overrides[ONRSPQRYEXECORDER] = bool(get_overload(this, "onRspQryExecOrder"));
+	this->query_rows.enable(ONRSPQRYEXECORDER, bool(get_overload(this, "onRspQryExecOrderAll")));
+	this->overrides[ONRSPQRYFORQUOTE] = bool(get_overload(this, "onRspQryForQuote"));
+	this->query_rows.enable(ONRSPQRYFORQUOTE, bool(get_overload(this, "onRspQryForQuoteAll")));
+	this->overrides[ONRSPQRYQUOTE] = bool(get_overload(this, "onRspQryQuote"));
+	this->query_rows.enable(ONRSPQRYQUOTE, bool(get_overload(this, "onRspQryQuoteAll")));
+	this->overrides[ONRSPQRYOPTIONSELFCLOSE] = bool(get_overload(this, "onRspQryOptionSelfClose"));
+	this->query_rows.enable(ONRSPQRYOPTIONSELFCLOSE, bool(get_overload(this, "onRspQryOptionSelfCloseAll")));
+	this->overrides[ONRSPQRYINVESTUNIT] = bool(get_overload(this, "onRspQryInvestUnit"));
+	this->query_rows.enable(ONRSPQRYINVESTUNIT, bool(get_overload(this, "onRspQryInvestUnitAll")));
+	this->overrides[ONRSPQRYCOMBINSTRUMENTGUARD] = bool(get_overload(this, "onRspQryCombInstrumentGuard"));
+	this->query_rows.enable(ONRSPQRYCOMBINSTRUMENTGUARD, bool(get_overload(this, "onRspQryCombInstrumentGuardAll")));
+	this->overrides[ONRSPQRYCOMBACTION] = bool(get_overload(this, "onRspQryCombAction"));
+	this->query_rows.enable(ONRSPQRYCOMBACTION, bool(get_overload(this, "onRspQryCombActionAll")));
+	this->overrides[ONRSPQRYTRANSFERSERIAL] = bool(get_overload(this, "onRspQryTransferSerial"));
+	this->query_rows.enable(ONRSPQRYTRANSFERSERIAL, bool(get_overload(this, "onRspQryTransferSerialAll")));
+	this->overrides[ONRSPQRYACCOUNTREGISTER] = bool(get_overload(this, "onRspQryAccountregister"));
+	this->query_rows.enable(ONRSPQRYACCOUNTREGISTER, bool(get_overload(this, "onRspQryAccountregisterAll")));
+	this->overrides[ONRSPERROR] = bool(get_overload(this, "onRspError"));
+	this->overrides[ONRTNORDER] = bool(get_overload(this, "onRtnOrder"));
+	this->overrides[ONRTNTRADE] = bool(get_overload(this, "onRtnTrade"));
+	this->overrides[ONERRRTNORDERINSERT] = bool(get_overload(this, "onErrRtnOrderInsert"));
+	this->overrides[ONERRRTNORDERACTION] = bool(get_overload(this, "onErrRtnOrderAction"));
+	this->overrides[ONRTNINSTRUMENTSTATUS] = bool(get_overload(this, "onRtnInstrumentStatus"));
+	this->overrides[ONRTNBULLETIN] = bool(get_overload(this, "onRtnBulletin"));
+	this->overrides[ONRTNTRADINGNOTICE] = bool(get_overload(this, "onRtnTradingNotice"));
+	this->overrides[ONRTNERRORCONDITIONALORDER] = bool(get_overload(this, "onRtnErrorConditionalOrder"));
+	this->overrides[ONRTNEXECORDER] = bool(get_overload(this, "onRtnExecOrder"));
+	this->overrides[ONERRRTNEXECORDERINSERT] = bool(get_overload(this, "onErrRtnExecOrderInsert"));
+	this->overrides[ONERRRTNEXECORDERACTION] = bool(get_overload(this, "onErrRtnExecOrderAction"));
+	this->overrides[ONERRRTNFORQUOTEINSERT] = bool(get_overload(this, "onErrRtnForQuoteInsert"));
+	this->overrides[ONRTNQUOTE] = bool(get_overload(this, "onRtnQuote"));
+	this->overrides[ONERRRTNQUOTEINSERT] = bool(get_overload(this, "onErrRtnQuoteInsert"));
+	this->overrides[ONERRRTNQUOTEACTION] = bool(get_overload(this, "onErrRtnQuoteAction"));
+	this->overrides[ONRTNFORQUOTERSP] = bool(get_overload(this, "onRtnForQuoteRsp"));
+	this->overrides[ONRTNCFMMCTRADINGACCOUNTTOKEN] = bool(get_overload(this, "onRtnCFMMCTradingAccountToken"));
+	this->overrides[ONERRRTNBATCHORDERACTION] = bool(get_overload(this, "onErrRtnBatchOrderAction"));
+	this->overrides[ONRTNOPTIONSELFCLOSE] = bool(get_overload(this, "onRtnOptionSelfClose"));
+	this->overrides[ONERRRTNOPTIONSELFCLOSEINSERT] = bool(get_overload(this, "onErrRtnOptionSelfCloseInsert"));
+	this->overrides[ONERRRTNOPTIONSELFCLOSEACTION] = bool(get_overload(this, "onErrRtnOptionSelfCloseAction"));
+	this->overrides[ONRTNCOMBACTION] = bool(get_overload(this, "onRtnCombAction"));
+	this->overrides[ONERRRTNCOMBACTIONINSERT] = bool(get_overload(this, "onErrRtnCombActionInsert"));
+	this->overrides[ONRSPQRYCONTRACTBANK] = bool(get_overload(this, "onRspQryContractBank"));
+	this->query_rows.enable(ONRSPQRYCONTRACTBANK, bool(get_overload(this, "onRspQryContractBankAll")));
+	this->overrides[ONRSPQRYPARKEDORDER] = bool(get_overload(this, "onRspQryParkedOrder"));
+	this->query_rows.enable(ONRSPQRYPARKEDORDER, bool(get_overload(this, "onRspQryParkedOrderAll")));
+	this->overrides[ONRSPQRYPARKEDORDERACTION] = bool(get_overload(this, "onRspQryParkedOrderAction"));
+	this->query_rows.enable(ONRSPQRYPARKEDORDERACTION, bool(get_overload(this, "onRspQryParkedOrderActionAll")));
+	this->overrides[ONRSPQRYTRADINGNOTICE] = bool(get_overload(this, "onRspQryTradingNotice"));
+	this->query_rows.enable(ONRSPQRYTRADINGNOTICE, bool(get_overload(this, "onRspQryTradingNoticeAll")));
+	this->overrides[ONRSPQRYBROKERTRADINGPARAMS] = bool(get_overload(this, "onRspQryBrokerTradingParams"));
+	this->query_rows.enable(ONRSPQRYBROKERTRADINGPARAMS, bool(get_overload(this, "onRspQryBrokerTradingParamsAll")));
+	this->overrides[ONRSPQRYBROKERTRADINGALGOS] = bool(get_overload(this, "onRspQryBrokerTradingAlgos"));
+	this->query_rows.enable(ONRSPQRYBROKERTRADINGALGOS, bool(get_overload(this, "onRspQryBrokerTradingAlgosAll")));
+	this->overrides[ONRSPQUERYCFMMCTRADINGACCOUNTTOKEN] = bool(get_overload(this, "onRspQueryCFMMCTradingAccountToken"));
+	this->overrides[ONRTNFROMBANKTOFUTUREBYBANK] = bool(get_overload(this, "onRtnFromBankToFutureByBank"));
+	this->overrides[ONRTNFROMFUTURETOBANKBYBANK] = bool(get_overload(this, "onRtnFromFutureToBankByBank"));
+	this->overrides[ONRTNREPEALFROMBANKTOFUTUREBYBANK] = bool(get_overload(this, "onRtnRepealFromBankToFutureByBank"));
+	this->overrides[ONRTNREPEALFROMFUTURETOBANKBYBANK] = bool(get_overload(this, "onRtnRepealFromFutureToBankByBank"));
+	this->overrides[ONRTNFROMBANKTOFUTUREBYFUTURE] = bool(get_overload(this, "onRtnFromBankToFutureByFuture"));
+	this->overrides[ONRTNFROMFUTURETOBANKBYFUTURE] = bool(get_overload(this, "onRtnFromFutureToBankByFuture"));
+	this->overrides[ONRTNREPEALFROMBANKTOFUTUREBYFUTUREMANUAL] = bool(get_overload(this, "onRtnRepealFromBankToFutureByFutureManual"));
+	this->overrides[ONRTNREPEALFROMFUTURETOBANKBYFUTUREMANUAL] = bool(get_overload(this, "onRtnRepealFromFutureToBankByFutureManual"));
+	this->overrides[ONRTNQUERYBANKBALANCEBYFUTURE] = bool(get_overload(this, "onRtnQueryBankBalanceByFuture"));
+	this->overrides[ONERRRTNBANKTOFUTUREBYFUTURE] = bool(get_overload(this, "onErrRtnBankToFutureByFuture"));
+	this->overrides[ONERRRTNFUTURETOBANKBYFUTURE] = bool(get_overload(this, "onErrRtnFutureToBankByFuture"));
+	this->overrides[ONERRRTNREPEALBANKTOFUTUREBYFUTUREMANUAL] = bool(get_overload(this, "onErrRtnRepealBankToFutureByFutureManual"));
+	this->overrides[ONERRRTNREPEALFUTURETOBANKBYFUTUREMANUAL] = bool(get_overload(this, "onErrRtnRepealFutureToBankByFutureManual"));
+	this->overrides[ONERRRTNQUERYBANKBALANCEBYFUTURE] = bool(get_overload(this, "onErrRtnQueryBankBalanceByFuture"));
+	this->overrides[ONRTNREPEALFROMBANKTOFUTUREBYFUTURE] = bool(get_overload(this, "onRtnRepealFromBankToFutureByFuture"));
+	this->overrides[ONRTNREPEALFROMFUTURETOBANKBYFUTURE] = bool(get_overload(this, "onRtnRepealFromFutureToBankByFuture"));
+	this->overrides[ONRSPFROMBANKTOFUTUREBYFUTURE] = bool(get_overload(this, "onRspFromBankToFutureByFuture"));
+	this->overrides[ONRSPFROMFUTURETOBANKBYFUTURE] = bool(get_overload(this, "onRspFromFutureToBankByFuture"));
+	this->overrides[ONRSPQUERYBANKACCOUNTMONEYBYFUTURE] = bool(get_overload(this, "onRspQueryBankAccountMoneyByFuture"));
+	this->overrides[ONRTNOPENACCOUNTBYBANK] = bool(get_overload(this, "onRtnOpenAccountByBank"));
+	this->overrides[ONRTNCANCELACCOUNTBYBANK] = bool(get_overload(this, "onRtnCancelAccountByBank"));
+	this->overrides[ONRTNCHANGEACCOUNTBYBANK] = bool(get_overload(this, "onRtnChangeAccountByBank"));
+	this->overrides[ONRSPQRYCLASSIFIEDINSTRUMENT] = bool(get_overload(this, "onRspQryClassifiedInstrument"));
+	this->query_rows.enable(ONRSPQRYCLASSIFIEDINSTRUMENT, bool(get_overload(this, "onRspQryClassifiedInstrumentAll")));
+	this->overrides[ONRSPQRYCOMBPROMOTIONPARAM] = bool(get_overload(this, "onRspQryCombPromotionParam"));
+	this->query_rows.enable(ONRSPQRYCOMBPROMOTIONPARAM, bool(get_overload(this, "onRspQryCombPromotionParamAll")));
+	this->overrides[ONRSPQRYRISKSETTLEINVSTPOSITION] = bool(get_overload(this, "onRspQryRiskSettleInvstPosition"));
+	this->query_rows.enable(ONRSPQRYRISKSETTLEINVSTPOSITION, bool(get_overload(this, "onRspQryRiskSettleInvstPositionAll")));
+	this->overrides[ONRSPQRYRISKSETTLEPRODUCTSTATUS] = bool(get_overload(this, "onRspQryRiskSettleProductStatus"));
+	this->query_rows.enable(ONRSPQRYRISKSETTLEPRODUCTSTATUS, bool(get_overload(this, "onRspQryRiskSettleProductStatusAll")));
+	this->overrides[ONRSPQRYSPBMFUTUREPARAMETER] = bool(get_overload(this, "onRspQrySPBMFutureParameter"));
+	this->query_rows.enable(ONRSPQRYSPBMFUTUREPARAMETER, bool(get_overload(this, "onRspQrySPBMFutureParameterAll")));
+	this->overrides[ONRSPQRYSPBMOPTIONPARAMETER] = bool(get_overload(this, "onRspQrySPBMOptionParameter"));
+	this->query_rows.enable(ONRSPQRYSPBMOPTIONPARAMETER, bool(get_overload(this, "onRspQrySPBMOptionParameterAll")));
+	this->overrides[ONRSPQRYSPBMINTRAPARAMETER] = bool(get_overload(this, "onRspQrySPBMIntraParameter"));
+	this->query_rows.enable(ONRSPQRYSPBMINTRAPARAMETER, bool(get_overload(this, "onRspQrySPBMIntraParameterAll")));
+	this->overrides[ONRSPQRYSPBMINTERPARAMETER] = bool(get_overload(this, "onRspQrySPBMInterParameter"));
+	this->query_rows.enable(ONRSPQRYSPBMINTERPARAMETER, bool(get_overload(this, "onRspQrySPBMInterParameterAll")));
+	this->overrides[ONRSPQRYSPBMPORTFDEFINITION] = bool(get_overload(this, "onRspQrySPBMPortfDefinition"));
+	this->query_rows.enable(ONRSPQRYSPBMPORTFDEFINITION, bool(get_overload(this, "onRspQrySPBMPortfDefinitionAll")));
+	this->overrides[ONRSPQRYSPBMINVESTORPORTFDEF] = bool(get_overload(this, "onRspQrySPBMInvestorPortfDef"));
+	this->query_rows.enable(ONRSPQRYSPBMINVESTORPORTFDEF, bool(get_overload(this, "onRspQrySPBMInvestorPortfDefAll")));
+	this->overrides[ONRSPQRYINVESTORPORTFMARGINRATIO] = bool(get_overload(this, "onRspQryInvestorPortfMarginRatio"));
+	this->query_rows.enable(ONRSPQRYINVESTORPORTFMARGINRATIO, bool(get_overload(this, "onRspQryInvestorPortfMarginRatioAll")));
+	this->overrides[ONRSPQRYINVESTORPRODSPBMDETAIL] = bool(get_overload(this, "onRspQryInvestorProdSPBMDetail"));
+	this->query_rows.enable(ONRSPQRYINVESTORPRODSPBMDETAIL, bool(get_overload(this, "onRspQryInvestorProdSPBMDetailAll")));
+	this->overrides[ONRSPQRYINVESTORCOMMODITYSPMMMARGIN] = bool(get_overload(this, "onRspQryInvestorCommoditySPMMMargin"));
+	this->query_rows.enable(ONRSPQRYINVESTORCOMMODITYSPMMMARGIN, bool(get_overload(this, "onRspQryInvestorCommoditySPMMMarginAll")));
+	this->overrides[ONRSPQRYINVESTORCOMMODITYGROUPSPMMMARGIN] = bool(get_overload(this, "onRspQryInvestorCommodityGroupSPMMMargin"));
+	this->query_rows.enable(ONRSPQRYINVESTORCOMMODITYGROUPSPMMMARGIN, bool(get_overload(this, "onRspQryInvestorCommodityGroupSPMMMarginAll")));
+	this->overrides[ONRSPQRYSPMMINSTPARAM] = bool(get_overload(this, "onRspQrySPMMInstParam"));
+	this->query_rows.enable(ONRSPQRYSPMMINSTPARAM, bool(get_overload(this, "onRspQrySPMMInstParamAll")));
+	this->overrides[ONRSPQRYSPMMPRODUCTPARAM] = bool(get_overload(this, "onRspQrySPMMProductParam"));
+	this->query_rows.enable(ONRSPQRYSPMMPRODUCTPARAM, bool(get_overload(this, "onRspQrySPMMProductParamAll")));
+	this->overrides[ONRSPQRYSPBMADDONINTERPARAMETER] = bool(get_overload(this, "onRspQrySPBMAddonInterParameter"));
+	this->query_rows.enable(ONRSPQRYSPBMADDONINTERPARAMETER, bool(get_overload(this, "onRspQrySPBMAddonInterParameterAll")));
+	this->overrides[ONRSPQRYRCAMSCOMBPRODUCTINFO] = bool(get_overload(this, "onRspQryRCAMSCombProductInfo"));
+	this->query_rows.enable(ONRSPQRYRCAMSCOMBPRODUCTINFO, bool(get_overload(this, "onRspQryRCAMSCombProductInfoAll")));
+	this->overrides[ONRSPQRYRCAMSINSTRPARAMETER] = bool(get_overload(this, "onRspQryRCAMSInstrParameter"));
+	this->query_rows.enable(ONRSPQRYRCAMSINSTRPARAMETER, bool(get_overload(this, "onRspQryRCAMSInstrParameterAll")));
+	this->overrides[ONRSPQRYRCAMSINTRAPARAMETER] = bool(get_overload(this, "onRspQryRCAMSIntraParameter"));
+	this->query_rows.enable(ONRSPQRYRCAMSINTRAPARAMETER, bool(get_overload(this, "onRspQryRCAMSIntraParameterAll")));
+	this->overrides[ONRSPQRYRCAMSINTERPARAMETER] = bool(get_overload(this, "onRspQryRCAMSInterParameter"));
+	this->query_rows.enable(ONRSPQRYRCAMSINTERPARAMETER, bool(get_overload(this, "onRspQryRCAMSInterParameterAll")));
+	this->overrides[ONRSPQRYRCAMSSHORTOPTADJUSTPARAM] = bool(get_overload(this, "onRspQryRCAMSShortOptAdjustParam"));
+	this->query_rows.enable(ONRSPQRYRCAMSSHORTOPTADJUSTPARAM, bool(get_overload(this, "onRspQryRCAMSShortOptAdjustParamAll")));
+	this->overrides[ONRSPQRYRCAMSINVESTORCOMBPOSITION] = bool(get_overload(this, "onRspQryRCAMSInvestorCombPosition"));
+	this->query_rows.enable(ONRSPQRYRCAMSINVESTORCOMBPOSITION, bool(get_overload(this, "onRspQryRCAMSInvestorCombPositionAll")));
+	this->overrides[ONRSPQRYINVESTORPRODRCAMSMARGIN] = bool(get_overload(this, "onRspQryInvestorProdRCAMSMargin"));
+	this->query_rows.enable(ONRSPQRYINVESTORPRODRCAMSMARGIN, bool(get_overload(this, "onRspQryInvestorProdRCAMSMarginAll")));
+	this->overrides[ONRSPQRYRULEINSTRPARAMETER] = bool(get_overload(this, "onRspQryRULEInstrParameter"));
+	this->query_rows.enable(ONRSPQRYRULEINSTRPARAMETER, bool(get_overload(this, "onRspQryRULEInstrParameterAll")));
+	this->overrides[ONRSPQRYRULEINTRAPARAMETER] = bool(get_overload(this, "onRspQryRULEIntraParameter"));
+	this->query_rows.enable(ONRSPQRYRULEINTRAPARAMETER, bool(get_overload(this, "onRspQryRULEIntraParameterAll")));
+	this->overrides[ONRSPQRYRULEINTERPARAMETER] = bool(get_overload(this, "onRspQryRULEInterParameter"));
+	this->query_rows.enable(ONRSPQRYRULEINTERPARAMETER, bool(get_overload(this, "onRspQryRULEInterParameterAll")));
+	this->overrides[ONRSPQRYINVESTORPRODRULEMARGIN] = bool(get_overload(this, "onRspQryInvestorProdRULEMargin"));
+	this->query_rows.enable(ONRSPQRYINVESTORPRODRULEMARGIN, bool(get_overload(this, "onRspQryInvestorProdRULEMarginAll")));
+	this->overrides[ONRSPQRYINVESTORPORTFSETTING] = bool(get_overload(this, "onRspQryInvestorPortfSetting"));
+	this->query_rows.enable(ONRSPQRYINVESTORPORTFSETTING, bool(get_overload(this, "onRspQryInvestorPortfSettingAll")));
+};
+
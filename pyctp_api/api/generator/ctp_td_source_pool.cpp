@@ -0,0 +1,128 @@
+dict TdApi::getPoolStats()
+{
+	dict d;
+	this->pool_RspAuthenticate.report(d, "RspAuthenticate");
+	this->pool_RspInfo.report(d, "RspInfo");
+	this->pool_RspUserLogin.report(d, "RspUserLogin");
+	this->pool_UserLogout.report(d, "UserLogout");
+	this->pool_UserPasswordUpdate.report(d, "UserPasswordUpdate");
+	this->pool_TradingAccountPasswordUpdate.report(d, "TradingAccountPasswordUpdate");
+	this->pool_RspUserAuthMethod.report(d, "RspUserAuthMethod");
+	this->pool_RspGenUserCaptcha.report(d, "RspGenUserCaptcha");
+	this->pool_RspGenUserText.report(d, "RspGenUserText");
+	this->pool_InputOrder.report(d, "InputOrder");
+	this->pool_ParkedOrder.report(d, "ParkedOrder");
+	this->pool_ParkedOrderAction.report(d, "ParkedOrderAction");
+	this->pool_InputOrderAction.report(d, "InputOrderAction");
+	this->pool_QryMaxOrderVolume.report(d, "QryMaxOrderVolume");
+	this->pool_SettlementInfoConfirm.report(d, "SettlementInfoConfirm");
+	this->pool_RemoveParkedOrder.report(d, "RemoveParkedOrder");
+	this->pool_RemoveParkedOrderAction.report(d, "RemoveParkedOrderAction");
+	this->pool_InputExecOrder.report(d, "InputExecOrder");
+	this->pool_InputExecOrderAction.report(d, "InputExecOrderAction");
+	this->pool_InputForQuote.report(d, "InputForQuote");
+	this->pool_InputQuote.report(d, "InputQuote");
+	this->pool_InputQuoteAction.report(d, "InputQuoteAction");
+	this->pool_InputBatchOrderAction.report(d, "InputBatchOrderAction");
+	this->pool_InputOptionSelfClose.report(d, "InputOptionSelfClose");
+	this->pool_InputOptionSelfCloseAction.report(d, "InputOptionSelfCloseAction");
+	this->pool_InputCombAction.report(d, "InputCombAction");
+	this->pool_Order.report(d, "Order");
+	this->pool_Trade.report(d, "Trade");
+	this->pool_InvestorPosition.report(d, "InvestorPosition");
+	this->pool_TradingAccount.report(d, "TradingAccount");
+	this->pool_Investor.report(d, "Investor");
+	this->pool_TradingCode.report(d, "TradingCode");
+	this->pool_InstrumentMarginRate.report(d, "InstrumentMarginRate");
+	this->pool_InstrumentCommissionRate.report(d, "InstrumentCommissionRate");
+	this->pool_Exchange.report(d, "Exchange");
+	this->pool_Product.report(d, "Product");
+	this->pool_Instrument.report(d, "Instrument");
+	this->pool_DepthMarketData.report(d, "DepthMarketData");
+	this->pool_TraderOffer.report(d, "TraderOffer");
+	this->pool_SettlementInfo.report(d, "SettlementInfo");
+	this->pool_TransferBank.report(d, "TransferBank");
+	this->pool_InvestorPositionDetail.report(d, "InvestorPositionDetail");
+	this->pool_Notice.report(d, "Notice");
+	this->pool_InvestorPositionCombineDetail.report(d, "InvestorPositionCombineDetail");
+	this->pool_CFMMCTradingAccountKey.report(d, "CFMMCTradingAccountKey");
+	this->pool_EWarrantOffset.report(d, "EWarrantOffset");
+	this->pool_InvestorProductGroupMargin.report(d, "InvestorProductGroupMargin");
+	this->pool_ExchangeMarginRate.report(d, "ExchangeMarginRate");
+	this->pool_ExchangeMarginRateAdjust.report(d, "ExchangeMarginRateAdjust");
+	this->pool_ExchangeRate.report(d, "ExchangeRate");
+	this->pool_SecAgentACIDMap.report(d, "SecAgentACIDMap");
+	this->pool_ProductExchRate.report(d, "ProductExchRate");
+	this->pool_ProductGroup.report(d, "ProductGroup");
+	this->pool_MMInstrumentCommissionRate.report(d, "MMInstrumentCommissionRate");
+	this->pool_MMOptionInstrCommRate.report(d, "MMOptionInstrCommRate");
+	this->pool_InstrumentOrderCommRate.report(d, "InstrumentOrderCommRate");
+	this->pool_SecAgentCheckMode.report(d, "SecAgentCheckMode");
+	this->pool_SecAgentTradeInfo.report(d, "SecAgentTradeInfo");
+	this->pool_OptionInstrTradeCost.report(d, "OptionInstrTradeCost");
+	this->pool_OptionInstrCommRate.report(d, "OptionInstrCommRate");
+	this->pool_ExecOrder.report(d, "ExecOrder");
+	this->pool_ForQuote.report(d, "ForQuote");
+	this->pool_Quote.report(d, "Quote");
+	this->pool_OptionSelfClose.report(d, "OptionSelfClose");
+	this->pool_InvestUnit.report(d, "InvestUnit");
+	this->pool_CombInstrumentGuard.report(d, "CombInstrumentGuard");
+	this->pool_CombAction.report(d, "CombAction");
+	this->pool_TransferSerial.report(d, "TransferSerial");
+	this->pool_Accountregister.report(d, "Accountregister");
+	this->pool_OrderAction.report(d, "OrderAction");
+	this->pool_InstrumentStatus.report(d, "InstrumentStatus");
+	this->pool_Bulletin.report(d, "Bulletin");
+	this->pool_TradingNoticeInfo.report(d, "TradingNoticeInfo");
+	this->pool_ErrorConditionalOrder.report(d, "ErrorConditionalOrder");
+	this->pool_ExecOrderAction.report(d, "ExecOrderAction");
+	this->pool_QuoteAction.report(d, "QuoteAction");
+	this->pool_ForQuoteRsp.report(d, "ForQuoteRsp");
+	this->pool_CFMMCTradingAccountToken.report(d, "CFMMCTradingAccountToken");
+	this->pool_BatchOrderAction.report(d, "BatchOrderAction");
+	this->pool_OptionSelfCloseAction.report(d, "OptionSelfCloseAction");
+	this->pool_ContractBank.report(d, "ContractBank");
+	this->pool_TradingNotice.report(d, "TradingNotice");
+	this->pool_BrokerTradingParams.report(d, "BrokerTradingParams");
+	this->pool_BrokerTradingAlgos.report(d, "BrokerTradingAlgos");
+	this->pool_QueryCFMMCTradingAccountToken.report(d, "QueryCFMMCTradingAccountToken");
+	this->pool_RspTransfer.report(d, "RspTransfer");
+	this->pool_RspRepeal.report(d, "RspRepeal");
+	this->pool_NotifyQueryAccount.report(d, "NotifyQueryAccount");
+	this->pool_ReqTransfer.report(d, "ReqTransfer");
+	this->pool_ReqRepeal.report(d, "ReqRepeal");
+	this->pool_ReqQueryAccount.report(d, "ReqQueryAccount");
+	this->pool_OpenAccount.report(d, "OpenAccount");
+	this->pool_CancelAccount.report(d, "CancelAccount");
+	this->pool_ChangeAccount.report(d, "ChangeAccount");
+	this->pool_CombPromotionParam.report(d, "CombPromotionParam");
+	this->pool_RiskSettleInvstPosition.report(d, "RiskSettleInvstPosition");
+	this->pool_RiskSettleProductStatus.report(d, "RiskSettleProductStatus");
+	this->pool_SPBMFutureParameter.report(d, "SPBMFutureParameter");
+	this->pool_SPBMOptionParameter.report(d, "SPBMOptionParameter");
+	this->pool_SPBMIntraParameter.report(d, "SPBMIntraParameter");
+	this->pool_SPBMInterParameter.report(d, "SPBMInterParameter");
+	this->pool_SPBMPortfDefinition.report(d, "SPBMPortfDefinition");
+	this->pool_SPBMInvestorPortfDef.report(d, "SPBMInvestorPortfDef");
+	this->pool_InvestorPortfMarginRatio.report(d, "InvestorPortfMarginRatio");
+	this->pool_InvestorProdSPBMDetail.report(d, "InvestorProdSPBMDetail");
+	this->pool_InvestorCommoditySPMMMargin.report(d, "InvestorCommoditySPMMMargin");
+	this->pool_InvestorCommodityGroupSPMMMargin.report(d, "InvestorCommodityGroupSPMMMargin");
+	this->pool_SPMMInstParam.report(d, "SPMMInstParam");
+	this->pool_SPMMProductParam.report(d, "SPMMProductParam");
+	this->pool_SPBMAddOnInterParameter.report(d, "SPBMAddOnInterParameter");
+	this->pool_RCAMSCombProductInfo.report(d, "RCAMSCombProductInfo");
+	this->pool_RCAMSInstrParameter.report(d, "RCAMSInstrParameter");
+	this->pool_RCAMSIntraParameter.report(d, "RCAMSIntraParameter");
+	this->pool_RCAMSInterParameter.report(d, "RCAMSInterParameter");
+	this->pool_RCAMSShortOptAdjustParam.report(d, "RCAMSShortOptAdjustParam");
+	this->pool_RCAMSInvestorCombPosition.report(d, "RCAMSInvestorCombPosition");
+	this->pool_InvestorProdRCAMSMargin.report(d, "InvestorProdRCAMSMargin");
+	this->pool_RULEInstrParameter.report(d, "RULEInstrParameter");
+	this->pool_RULEIntraParameter.report(d, "RULEIntraParameter");
+	this->pool_RULEInterParameter.report(d, "RULEInterParameter");
+	this->pool_InvestorProdRULEMargin.report(d, "InvestorProdRULEMargin");
+	this->pool_InvestorPortfSetting.report(d, "InvestorPortfSetting");
+	return d;
+};
+
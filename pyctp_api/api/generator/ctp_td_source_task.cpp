@@ -1,2969 +1,777 @@
 void TdApi::OnFrontConnected()
 {
-	Task task = Task();
-	task.task_name = ONFRONTCONNECTED;
-	this->task_queue.push(task);
+	this->pushTask(ONFRONTCONNECTED, nullptr, nullptr, 0, false);
 };
 
 void TdApi::OnFrontDisconnected(int nReason)
 {
-	Task task = Task();
-	task.task_name = ONFRONTDISCONNECTED;
-	task.task_id = nReason;
-	this->task_queue.push(task);
+	this->query_rows.clear();
+
+	this->pushTask(ONFRONTDISCONNECTED, nullptr, nullptr, nReason, false);
 };
 
 void TdApi::OnHeartBeatWarning(int nTimeLapse)
 {
-	Task task = Task();
-	task.task_name = ONHEARTBEATWARNING;
-	task.task_id = nTimeLapse;
-	this->task_queue.push(task);
+	this->pushTask(ONHEARTBEATWARNING, nullptr, nullptr, nTimeLapse, false);
 };
 
 void TdApi::OnRspAuthenticate(CThostFtdcRspAuthenticateField *pRspAuthenticateField, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPAUTHENTICATE;
-	if (pRspAuthenticateField)
-	{
-		CThostFtdcRspAuthenticateField *task_data = new CThostFtdcRspAuthenticateField();
-		*task_data = *pRspAuthenticateField;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPAUTHENTICATE, pRspAuthenticateField, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERLOGIN;
-	if (pRspUserLogin)
-	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
-		*task_data = *pRspUserLogin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERLOGIN, pRspUserLogin, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERLOGOUT;
-	if (pUserLogout)
-	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
-		*task_data = *pUserLogout;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERLOGOUT, pUserLogout, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspUserPasswordUpdate(CThostFtdcUserPasswordUpdateField *pUserPasswordUpdate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERPASSWORDUPDATE;
-	if (pUserPasswordUpdate)
-	{
-		CThostFtdcUserPasswordUpdateField *task_data = new CThostFtdcUserPasswordUpdateField();
-		*task_data = *pUserPasswordUpdate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERPASSWORDUPDATE, pUserPasswordUpdate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspTradingAccountPasswordUpdate(CThostFtdcTradingAccountPasswordUpdateField *pTradingAccountPasswordUpdate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPTRADINGACCOUNTPASSWORDUPDATE;
-	if (pTradingAccountPasswordUpdate)
-	{
-		CThostFtdcTradingAccountPasswordUpdateField *task_data = new CThostFtdcTradingAccountPasswordUpdateField();
-		*task_data = *pTradingAccountPasswordUpdate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPTRADINGACCOUNTPASSWORDUPDATE, pTradingAccountPasswordUpdate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspUserAuthMethod(CThostFtdcRspUserAuthMethodField *pRspUserAuthMethod, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERAUTHMETHOD;
-	if (pRspUserAuthMethod)
-	{
-		CThostFtdcRspUserAuthMethodField *task_data = new CThostFtdcRspUserAuthMethodField();
-		*task_data = *pRspUserAuthMethod;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERAUTHMETHOD, pRspUserAuthMethod, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspGenUserCaptcha(CThostFtdcRspGenUserCaptchaField *pRspGenUserCaptcha, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPGENUSERCAPTCHA;
-	if (pRspGenUserCaptcha)
-	{
-		CThostFtdcRspGenUserCaptchaField *task_data = new CThostFtdcRspGenUserCaptchaField();
-		*task_data = *pRspGenUserCaptcha;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPGENUSERCAPTCHA, pRspGenUserCaptcha, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspGenUserText(CThostFtdcRspGenUserTextField *pRspGenUserText, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPGENUSERTEXT;
-	if (pRspGenUserText)
-	{
-		CThostFtdcRspGenUserTextField *task_data = new CThostFtdcRspGenUserTextField();
-		*task_data = *pRspGenUserText;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPGENUSERTEXT, pRspGenUserText, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPORDERINSERT;
-	if (pInputOrder)
-	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
-		*task_data = *pInputOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPORDERINSERT, pInputOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspParkedOrderInsert(CThostFtdcParkedOrderField *pParkedOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPPARKEDORDERINSERT;
-	if (pParkedOrder)
-	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
-		*task_data = *pParkedOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPPARKEDORDERINSERT, pParkedOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspParkedOrderAction(CThostFtdcParkedOrderActionField *pParkedOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPPARKEDORDERACTION;
-	if (pParkedOrderAction)
-	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
-		*task_data = *pParkedOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPPARKEDORDERACTION, pParkedOrderAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspOrderAction(CThostFtdcInputOrderActionField *pInputOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPORDERACTION;
-	if (pInputOrderAction)
-	{
-		CThostFtdcInputOrderActionField *task_data = new CThostFtdcInputOrderActionField();
-		*task_data = *pInputOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPORDERACTION, pInputOrderAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryMaxOrderVolume(CThostFtdcQryMaxOrderVolumeField *pQryMaxOrderVolume, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYMAXORDERVOLUME;
-	if (pQryMaxOrderVolume)
-	{
-		CThostFtdcQryMaxOrderVolumeField *task_data = new CThostFtdcQryMaxOrderVolumeField();
-		*task_data = *pQryMaxOrderVolume;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYMAXORDERVOLUME, pQryMaxOrderVolume, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspSettlementInfoConfirm(CThostFtdcSettlementInfoConfirmField *pSettlementInfoConfirm, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPSETTLEMENTINFOCONFIRM;
-	if (pSettlementInfoConfirm)
-	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
-		*task_data = *pSettlementInfoConfirm;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPSETTLEMENTINFOCONFIRM, pSettlementInfoConfirm, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspRemoveParkedOrder(CThostFtdcRemoveParkedOrderField *pRemoveParkedOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPREMOVEPARKEDORDER;
-	if (pRemoveParkedOrder)
-	{
-		CThostFtdcRemoveParkedOrderField *task_data = new CThostFtdcRemoveParkedOrderField();
-		*task_data = *pRemoveParkedOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPREMOVEPARKEDORDER, pRemoveParkedOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspRemoveParkedOrderAction(CThostFtdcRemoveParkedOrderActionField *pRemoveParkedOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPREMOVEPARKEDORDERACTION;
-	if (pRemoveParkedOrderAction)
-	{
-		CThostFtdcRemoveParkedOrderActionField *task_data = new CThostFtdcRemoveParkedOrderActionField();
-		*task_data = *pRemoveParkedOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPREMOVEPARKEDORDERACTION, pRemoveParkedOrderAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspExecOrderInsert(CThostFtdcInputExecOrderField *pInputExecOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPEXECORDERINSERT;
-	if (pInputExecOrder)
-	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
-		*task_data = *pInputExecOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPEXECORDERINSERT, pInputExecOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspExecOrderAction(CThostFtdcInputExecOrderActionField *pInputExecOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPEXECORDERACTION;
-	if (pInputExecOrderAction)
-	{
-		CThostFtdcInputExecOrderActionField *task_data = new CThostFtdcInputExecOrderActionField();
-		*task_data = *pInputExecOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPEXECORDERACTION, pInputExecOrderAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPFORQUOTEINSERT;
-	if (pInputForQuote)
-	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
-		*task_data = *pInputForQuote;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPFORQUOTEINSERT, pInputForQuote, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQUOTEINSERT;
-	if (pInputQuote)
-	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
-		*task_data = *pInputQuote;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQUOTEINSERT, pInputQuote, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQuoteAction(CThostFtdcInputQuoteActionField *pInputQuoteAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQUOTEACTION;
-	if (pInputQuoteAction)
-	{
-		CThostFtdcInputQuoteActionField *task_data = new CThostFtdcInputQuoteActionField();
-		*task_data = *pInputQuoteAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQUOTEACTION, pInputQuoteAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspBatchOrderAction(CThostFtdcInputBatchOrderActionField *pInputBatchOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPBATCHORDERACTION;
-	if (pInputBatchOrderAction)
-	{
-		CThostFtdcInputBatchOrderActionField *task_data = new CThostFtdcInputBatchOrderActionField();
-		*task_data = *pInputBatchOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPBATCHORDERACTION, pInputBatchOrderAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseField *pInputOptionSelfClose, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPOPTIONSELFCLOSEINSERT;
-	if (pInputOptionSelfClose)
-	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
-		*task_data = *pInputOptionSelfClose;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPOPTIONSELFCLOSEINSERT, pInputOptionSelfClose, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspOptionSelfCloseAction(CThostFtdcInputOptionSelfCloseActionField *pInputOptionSelfCloseAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPOPTIONSELFCLOSEACTION;
-	if (pInputOptionSelfCloseAction)
-	{
-		CThostFtdcInputOptionSelfCloseActionField *task_data = new CThostFtdcInputOptionSelfCloseActionField();
-		*task_data = *pInputOptionSelfCloseAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPOPTIONSELFCLOSEACTION, pInputOptionSelfCloseAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspCombActionInsert(CThostFtdcInputCombActionField *pInputCombAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPCOMBACTIONINSERT;
-	if (pInputCombAction)
-	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
-		*task_data = *pInputCombAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPCOMBACTIONINSERT, pInputCombAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryOrder(CThostFtdcOrderField *pOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYORDER;
-	if (pOrder)
-	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
-		*task_data = *pOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYORDER, pOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTrade(CThostFtdcTradeField *pTrade, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRADE;
-	if (pTrade)
-	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
-		*task_data = *pTrade;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRADE, pTrade, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorPosition(CThostFtdcInvestorPositionField *pInvestorPosition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPOSITION;
-	if (pInvestorPosition)
-	{
-		CThostFtdcInvestorPositionField *task_data = new CThostFtdcInvestorPositionField();
-		*task_data = *pInvestorPosition;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPOSITION, pInvestorPosition, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTradingAccount(CThostFtdcTradingAccountField *pTradingAccount, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRADINGACCOUNT;
-	if (pTradingAccount)
-	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
-		*task_data = *pTradingAccount;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRADINGACCOUNT, pTradingAccount, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestor(CThostFtdcInvestorField *pInvestor, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTOR;
-	if (pInvestor)
-	{
-		CThostFtdcInvestorField *task_data = new CThostFtdcInvestorField();
-		*task_data = *pInvestor;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTOR, pInvestor, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTradingCode(CThostFtdcTradingCodeField *pTradingCode, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRADINGCODE;
-	if (pTradingCode)
-	{
-		CThostFtdcTradingCodeField *task_data = new CThostFtdcTradingCodeField();
-		*task_data = *pTradingCode;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRADINGCODE, pTradingCode, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInstrumentMarginRate(CThostFtdcInstrumentMarginRateField *pInstrumentMarginRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINSTRUMENTMARGINRATE;
-	if (pInstrumentMarginRate)
-	{
-		CThostFtdcInstrumentMarginRateField *task_data = new CThostFtdcInstrumentMarginRateField();
-		*task_data = *pInstrumentMarginRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINSTRUMENTMARGINRATE, pInstrumentMarginRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInstrumentCommissionRate(CThostFtdcInstrumentCommissionRateField *pInstrumentCommissionRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINSTRUMENTCOMMISSIONRATE;
-	if (pInstrumentCommissionRate)
-	{
-		CThostFtdcInstrumentCommissionRateField *task_data = new CThostFtdcInstrumentCommissionRateField();
-		*task_data = *pInstrumentCommissionRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINSTRUMENTCOMMISSIONRATE, pInstrumentCommissionRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryExchange(CThostFtdcExchangeField *pExchange, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYEXCHANGE;
-	if (pExchange)
-	{
-		CThostFtdcExchangeField *task_data = new CThostFtdcExchangeField();
-		*task_data = *pExchange;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYEXCHANGE, pExchange, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryProduct(CThostFtdcProductField *pProduct, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYPRODUCT;
-	if (pProduct)
-	{
-		CThostFtdcProductField *task_data = new CThostFtdcProductField();
-		*task_data = *pProduct;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYPRODUCT, pProduct, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInstrument(CThostFtdcInstrumentField *pInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINSTRUMENT;
-	if (pInstrument)
-	{
-		CThostFtdcInstrumentField *task_data = new CThostFtdcInstrumentField();
-		*task_data = *pInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINSTRUMENT, pInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYDEPTHMARKETDATA;
-	if (pDepthMarketData)
-	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
-		*task_data = *pDepthMarketData;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYDEPTHMARKETDATA, pDepthMarketData, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTraderOffer(CThostFtdcTraderOfferField *pTraderOffer, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRADEROFFER;
-	if (pTraderOffer)
-	{
-		CThostFtdcTraderOfferField *task_data = new CThostFtdcTraderOfferField();
-		*task_data = *pTraderOffer;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRADEROFFER, pTraderOffer, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySettlementInfo(CThostFtdcSettlementInfoField *pSettlementInfo, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSETTLEMENTINFO;
-	if (pSettlementInfo)
-	{
-		CThostFtdcSettlementInfoField *task_data = new CThostFtdcSettlementInfoField();
-		*task_data = *pSettlementInfo;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSETTLEMENTINFO, pSettlementInfo, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTransferBank(CThostFtdcTransferBankField *pTransferBank, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRANSFERBANK;
-	if (pTransferBank)
-	{
-		CThostFtdcTransferBankField *task_data = new CThostFtdcTransferBankField();
-		*task_data = *pTransferBank;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRANSFERBANK, pTransferBank, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorPositionDetail(CThostFtdcInvestorPositionDetailField *pInvestorPositionDetail, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPOSITIONDETAIL;
-	if (pInvestorPositionDetail)
-	{
-		CThostFtdcInvestorPositionDetailField *task_data = new CThostFtdcInvestorPositionDetailField();
-		*task_data = *pInvestorPositionDetail;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPOSITIONDETAIL, pInvestorPositionDetail, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryNotice(CThostFtdcNoticeField *pNotice, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYNOTICE;
-	if (pNotice)
-	{
-		CThostFtdcNoticeField *task_data = new CThostFtdcNoticeField();
-		*task_data = *pNotice;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYNOTICE, pNotice, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySettlementInfoConfirm(CThostFtdcSettlementInfoConfirmField *pSettlementInfoConfirm, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSETTLEMENTINFOCONFIRM;
-	if (pSettlementInfoConfirm)
-	{
-		CThostFtdcSettlementInfoConfirmField *task_data = new CThostFtdcSettlementInfoConfirmField();
-		*task_data = *pSettlementInfoConfirm;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSETTLEMENTINFOCONFIRM, pSettlementInfoConfirm, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorPositionCombineDetail(CThostFtdcInvestorPositionCombineDetailField *pInvestorPositionCombineDetail, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL;
-	if (pInvestorPositionCombineDetail)
-	{
-		CThostFtdcInvestorPositionCombineDetailField *task_data = new CThostFtdcInvestorPositionCombineDetailField();
-		*task_data = *pInvestorPositionCombineDetail;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPOSITIONCOMBINEDETAIL, pInvestorPositionCombineDetail, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryCFMMCTradingAccountKey(CThostFtdcCFMMCTradingAccountKeyField *pCFMMCTradingAccountKey, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYCFMMCTRADINGACCOUNTKEY;
-	if (pCFMMCTradingAccountKey)
-	{
-		CThostFtdcCFMMCTradingAccountKeyField *task_data = new CThostFtdcCFMMCTradingAccountKeyField();
-		*task_data = *pCFMMCTradingAccountKey;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYCFMMCTRADINGACCOUNTKEY, pCFMMCTradingAccountKey, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryEWarrantOffset(CThostFtdcEWarrantOffsetField *pEWarrantOffset, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYEWARRANTOFFSET;
-	if (pEWarrantOffset)
-	{
-		CThostFtdcEWarrantOffsetField *task_data = new CThostFtdcEWarrantOffsetField();
-		*task_data = *pEWarrantOffset;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYEWARRANTOFFSET, pEWarrantOffset, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorProductGroupMargin(CThostFtdcInvestorProductGroupMarginField *pInvestorProductGroupMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPRODUCTGROUPMARGIN;
-	if (pInvestorProductGroupMargin)
-	{
-		CThostFtdcInvestorProductGroupMarginField *task_data = new CThostFtdcInvestorProductGroupMarginField();
-		*task_data = *pInvestorProductGroupMargin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPRODUCTGROUPMARGIN, pInvestorProductGroupMargin, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryExchangeMarginRate(CThostFtdcExchangeMarginRateField *pExchangeMarginRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYEXCHANGEMARGINRATE;
-	if (pExchangeMarginRate)
-	{
-		CThostFtdcExchangeMarginRateField *task_data = new CThostFtdcExchangeMarginRateField();
-		*task_data = *pExchangeMarginRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYEXCHANGEMARGINRATE, pExchangeMarginRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryExchangeMarginRateAdjust(CThostFtdcExchangeMarginRateAdjustField *pExchangeMarginRateAdjust, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYEXCHANGEMARGINRATEADJUST;
-	if (pExchangeMarginRateAdjust)
-	{
-		CThostFtdcExchangeMarginRateAdjustField *task_data = new CThostFtdcExchangeMarginRateAdjustField();
-		*task_data = *pExchangeMarginRateAdjust;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYEXCHANGEMARGINRATEADJUST, pExchangeMarginRateAdjust, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryExchangeRate(CThostFtdcExchangeRateField *pExchangeRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYEXCHANGERATE;
-	if (pExchangeRate)
-	{
-		CThostFtdcExchangeRateField *task_data = new CThostFtdcExchangeRateField();
-		*task_data = *pExchangeRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYEXCHANGERATE, pExchangeRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySecAgentACIDMap(CThostFtdcSecAgentACIDMapField *pSecAgentACIDMap, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSECAGENTACIDMAP;
-	if (pSecAgentACIDMap)
-	{
-		CThostFtdcSecAgentACIDMapField *task_data = new CThostFtdcSecAgentACIDMapField();
-		*task_data = *pSecAgentACIDMap;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSECAGENTACIDMAP, pSecAgentACIDMap, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryProductExchRate(CThostFtdcProductExchRateField *pProductExchRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYPRODUCTEXCHRATE;
-	if (pProductExchRate)
-	{
-		CThostFtdcProductExchRateField *task_data = new CThostFtdcProductExchRateField();
-		*task_data = *pProductExchRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYPRODUCTEXCHRATE, pProductExchRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryProductGroup(CThostFtdcProductGroupField *pProductGroup, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYPRODUCTGROUP;
-	if (pProductGroup)
-	{
-		CThostFtdcProductGroupField *task_data = new CThostFtdcProductGroupField();
-		*task_data = *pProductGroup;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYPRODUCTGROUP, pProductGroup, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryMMInstrumentCommissionRate(CThostFtdcMMInstrumentCommissionRateField *pMMInstrumentCommissionRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYMMINSTRUMENTCOMMISSIONRATE;
-	if (pMMInstrumentCommissionRate)
-	{
-		CThostFtdcMMInstrumentCommissionRateField *task_data = new CThostFtdcMMInstrumentCommissionRateField();
-		*task_data = *pMMInstrumentCommissionRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYMMINSTRUMENTCOMMISSIONRATE, pMMInstrumentCommissionRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryMMOptionInstrCommRate(CThostFtdcMMOptionInstrCommRateField *pMMOptionInstrCommRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYMMOPTIONINSTRCOMMRATE;
-	if (pMMOptionInstrCommRate)
-	{
-		CThostFtdcMMOptionInstrCommRateField *task_data = new CThostFtdcMMOptionInstrCommRateField();
-		*task_data = *pMMOptionInstrCommRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYMMOPTIONINSTRCOMMRATE, pMMOptionInstrCommRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInstrumentOrderCommRate(CThostFtdcInstrumentOrderCommRateField *pInstrumentOrderCommRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINSTRUMENTORDERCOMMRATE;
-	if (pInstrumentOrderCommRate)
-	{
-		CThostFtdcInstrumentOrderCommRateField *task_data = new CThostFtdcInstrumentOrderCommRateField();
-		*task_data = *pInstrumentOrderCommRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINSTRUMENTORDERCOMMRATE, pInstrumentOrderCommRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySecAgentTradingAccount(CThostFtdcTradingAccountField *pTradingAccount, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSECAGENTTRADINGACCOUNT;
-	if (pTradingAccount)
-	{
-		CThostFtdcTradingAccountField *task_data = new CThostFtdcTradingAccountField();
-		*task_data = *pTradingAccount;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSECAGENTTRADINGACCOUNT, pTradingAccount, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySecAgentCheckMode(CThostFtdcSecAgentCheckModeField *pSecAgentCheckMode, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSECAGENTCHECKMODE;
-	if (pSecAgentCheckMode)
-	{
-		CThostFtdcSecAgentCheckModeField *task_data = new CThostFtdcSecAgentCheckModeField();
-		*task_data = *pSecAgentCheckMode;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSECAGENTCHECKMODE, pSecAgentCheckMode, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySecAgentTradeInfo(CThostFtdcSecAgentTradeInfoField *pSecAgentTradeInfo, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSECAGENTTRADEINFO;
-	if (pSecAgentTradeInfo)
-	{
-		CThostFtdcSecAgentTradeInfoField *task_data = new CThostFtdcSecAgentTradeInfoField();
-		*task_data = *pSecAgentTradeInfo;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSECAGENTTRADEINFO, pSecAgentTradeInfo, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryOptionInstrTradeCost(CThostFtdcOptionInstrTradeCostField *pOptionInstrTradeCost, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYOPTIONINSTRTRADECOST;
-	if (pOptionInstrTradeCost)
-	{
-		CThostFtdcOptionInstrTradeCostField *task_data = new CThostFtdcOptionInstrTradeCostField();
-		*task_data = *pOptionInstrTradeCost;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYOPTIONINSTRTRADECOST, pOptionInstrTradeCost, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryOptionInstrCommRate(CThostFtdcOptionInstrCommRateField *pOptionInstrCommRate, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYOPTIONINSTRCOMMRATE;
-	if (pOptionInstrCommRate)
-	{
-		CThostFtdcOptionInstrCommRateField *task_data = new CThostFtdcOptionInstrCommRateField();
-		*task_data = *pOptionInstrCommRate;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYOPTIONINSTRCOMMRATE, pOptionInstrCommRate, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryExecOrder(CThostFtdcExecOrderField *pExecOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYEXECORDER;
-	if (pExecOrder)
-	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
-		*task_data = *pExecOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYEXECORDER, pExecOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryForQuote(CThostFtdcForQuoteField *pForQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYFORQUOTE;
-	if (pForQuote)
-	{
-		CThostFtdcForQuoteField *task_data = new CThostFtdcForQuoteField();
-		*task_data = *pForQuote;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYFORQUOTE, pForQuote, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryQuote(CThostFtdcQuoteField *pQuote, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYQUOTE;
-	if (pQuote)
-	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
-		*task_data = *pQuote;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYQUOTE, pQuote, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionSelfClose, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYOPTIONSELFCLOSE;
-	if (pOptionSelfClose)
-	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
-		*task_data = *pOptionSelfClose;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYOPTIONSELFCLOSE, pOptionSelfClose, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestUnit(CThostFtdcInvestUnitField *pInvestUnit, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTUNIT;
-	if (pInvestUnit)
-	{
-		CThostFtdcInvestUnitField *task_data = new CThostFtdcInvestUnitField();
-		*task_data = *pInvestUnit;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTUNIT, pInvestUnit, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryCombInstrumentGuard(CThostFtdcCombInstrumentGuardField *pCombInstrumentGuard, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYCOMBINSTRUMENTGUARD;
-	if (pCombInstrumentGuard)
-	{
-		CThostFtdcCombInstrumentGuardField *task_data = new CThostFtdcCombInstrumentGuardField();
-		*task_data = *pCombInstrumentGuard;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYCOMBINSTRUMENTGUARD, pCombInstrumentGuard, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryCombAction(CThostFtdcCombActionField *pCombAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYCOMBACTION;
-	if (pCombAction)
-	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
-		*task_data = *pCombAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYCOMBACTION, pCombAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTransferSerial(CThostFtdcTransferSerialField *pTransferSerial, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRANSFERSERIAL;
-	if (pTransferSerial)
-	{
-		CThostFtdcTransferSerialField *task_data = new CThostFtdcTransferSerialField();
-		*task_data = *pTransferSerial;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRANSFERSERIAL, pTransferSerial, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryAccountregister(CThostFtdcAccountregisterField *pAccountregister, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYACCOUNTREGISTER;
-	if (pAccountregister)
-	{
-		CThostFtdcAccountregisterField *task_data = new CThostFtdcAccountregisterField();
-		*task_data = *pAccountregister;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYACCOUNTREGISTER, pAccountregister, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPERROR;
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPERROR, nullptr, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRtnOrder(CThostFtdcOrderField *pOrder) 
 {
-	Task task = Task();
-	task.task_name = ONRTNORDER;
-	if (pOrder)
-	{
-		CThostFtdcOrderField *task_data = new CThostFtdcOrderField();
-		*task_data = *pOrder;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNORDER, pOrder, nullptr, 0, false);
 };
 
 void TdApi::OnRtnTrade(CThostFtdcTradeField *pTrade) 
 {
-	Task task = Task();
-	task.task_name = ONRTNTRADE;
-	if (pTrade)
-	{
-		CThostFtdcTradeField *task_data = new CThostFtdcTradeField();
-		*task_data = *pTrade;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNTRADE, pTrade, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnOrderInsert(CThostFtdcInputOrderField *pInputOrder, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNORDERINSERT;
-	if (pInputOrder)
-	{
-		CThostFtdcInputOrderField *task_data = new CThostFtdcInputOrderField();
-		*task_data = *pInputOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNORDERINSERT, pInputOrder, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnOrderAction(CThostFtdcOrderActionField *pOrderAction, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNORDERACTION;
-	if (pOrderAction)
-	{
-		CThostFtdcOrderActionField *task_data = new CThostFtdcOrderActionField();
-		*task_data = *pOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNORDERACTION, pOrderAction, pRspInfo, 0, false);
 };
 
 void TdApi::OnRtnInstrumentStatus(CThostFtdcInstrumentStatusField *pInstrumentStatus) 
 {
-	Task task = Task();
-	task.task_name = ONRTNINSTRUMENTSTATUS;
-	if (pInstrumentStatus)
-	{
-		CThostFtdcInstrumentStatusField *task_data = new CThostFtdcInstrumentStatusField();
-		*task_data = *pInstrumentStatus;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNINSTRUMENTSTATUS, pInstrumentStatus, nullptr, 0, false);
 };
 
 void TdApi::OnRtnBulletin(CThostFtdcBulletinField *pBulletin) 
 {
-	Task task = Task();
-	task.task_name = ONRTNBULLETIN;
-	if (pBulletin)
-	{
-		CThostFtdcBulletinField *task_data = new CThostFtdcBulletinField();
-		*task_data = *pBulletin;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNBULLETIN, pBulletin, nullptr, 0, false);
 };
 
 void TdApi::OnRtnTradingNotice(CThostFtdcTradingNoticeInfoField *pTradingNoticeInfo) 
 {
-	Task task = Task();
-	task.task_name = ONRTNTRADINGNOTICE;
-	if (pTradingNoticeInfo)
-	{
-		CThostFtdcTradingNoticeInfoField *task_data = new CThostFtdcTradingNoticeInfoField();
-		*task_data = *pTradingNoticeInfo;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNTRADINGNOTICE, pTradingNoticeInfo, nullptr, 0, false);
 };
 
 void TdApi::OnRtnErrorConditionalOrder(CThostFtdcErrorConditionalOrderField *pErrorConditionalOrder) 
 {
-	Task task = Task();
-	task.task_name = ONRTNERRORCONDITIONALORDER;
-	if (pErrorConditionalOrder)
-	{
-		CThostFtdcErrorConditionalOrderField *task_data = new CThostFtdcErrorConditionalOrderField();
-		*task_data = *pErrorConditionalOrder;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNERRORCONDITIONALORDER, pErrorConditionalOrder, nullptr, 0, false);
 };
 
 void TdApi::OnRtnExecOrder(CThostFtdcExecOrderField *pExecOrder) 
 {
-	Task task = Task();
-	task.task_name = ONRTNEXECORDER;
-	if (pExecOrder)
-	{
-		CThostFtdcExecOrderField *task_data = new CThostFtdcExecOrderField();
-		*task_data = *pExecOrder;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNEXECORDER, pExecOrder, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnExecOrderInsert(CThostFtdcInputExecOrderField *pInputExecOrder, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNEXECORDERINSERT;
-	if (pInputExecOrder)
-	{
-		CThostFtdcInputExecOrderField *task_data = new CThostFtdcInputExecOrderField();
-		*task_data = *pInputExecOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNEXECORDERINSERT, pInputExecOrder, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnExecOrderAction(CThostFtdcExecOrderActionField *pExecOrderAction, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNEXECORDERACTION;
-	if (pExecOrderAction)
-	{
-		CThostFtdcExecOrderActionField *task_data = new CThostFtdcExecOrderActionField();
-		*task_data = *pExecOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNEXECORDERACTION, pExecOrderAction, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnForQuoteInsert(CThostFtdcInputForQuoteField *pInputForQuote, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNFORQUOTEINSERT;
-	if (pInputForQuote)
-	{
-		CThostFtdcInputForQuoteField *task_data = new CThostFtdcInputForQuoteField();
-		*task_data = *pInputForQuote;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNFORQUOTEINSERT, pInputForQuote, pRspInfo, 0, false);
 };
 
 void TdApi::OnRtnQuote(CThostFtdcQuoteField *pQuote) 
 {
-	Task task = Task();
-	task.task_name = ONRTNQUOTE;
-	if (pQuote)
-	{
-		CThostFtdcQuoteField *task_data = new CThostFtdcQuoteField();
-		*task_data = *pQuote;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNQUOTE, pQuote, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnQuoteInsert(CThostFtdcInputQuoteField *pInputQuote, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNQUOTEINSERT;
-	if (pInputQuote)
-	{
-		CThostFtdcInputQuoteField *task_data = new CThostFtdcInputQuoteField();
-		*task_data = *pInputQuote;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNQUOTEINSERT, pInputQuote, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnQuoteAction(CThostFtdcQuoteActionField *pQuoteAction, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNQUOTEACTION;
-	if (pQuoteAction)
-	{
-		CThostFtdcQuoteActionField *task_data = new CThostFtdcQuoteActionField();
-		*task_data = *pQuoteAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNQUOTEACTION, pQuoteAction, pRspInfo, 0, false);
 };
 
 void TdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp) 
 {
-	Task task = Task();
-	task.task_name = ONRTNFORQUOTERSP;
-	if (pForQuoteRsp)
-	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
-		*task_data = *pForQuoteRsp;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFORQUOTERSP, pForQuoteRsp, nullptr, 0, false);
 };
 
 void TdApi::OnRtnCFMMCTradingAccountToken(CThostFtdcCFMMCTradingAccountTokenField *pCFMMCTradingAccountToken) 
 {
-	Task task = Task();
-	task.task_name = ONRTNCFMMCTRADINGACCOUNTTOKEN;
-	if (pCFMMCTradingAccountToken)
-	{
-		CThostFtdcCFMMCTradingAccountTokenField *task_data = new CThostFtdcCFMMCTradingAccountTokenField();
-		*task_data = *pCFMMCTradingAccountToken;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNCFMMCTRADINGACCOUNTTOKEN, pCFMMCTradingAccountToken, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnBatchOrderAction(CThostFtdcBatchOrderActionField *pBatchOrderAction, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNBATCHORDERACTION;
-	if (pBatchOrderAction)
-	{
-		CThostFtdcBatchOrderActionField *task_data = new CThostFtdcBatchOrderActionField();
-		*task_data = *pBatchOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNBATCHORDERACTION, pBatchOrderAction, pRspInfo, 0, false);
 };
 
 void TdApi::OnRtnOptionSelfClose(CThostFtdcOptionSelfCloseField *pOptionSelfClose) 
 {
-	Task task = Task();
-	task.task_name = ONRTNOPTIONSELFCLOSE;
-	if (pOptionSelfClose)
-	{
-		CThostFtdcOptionSelfCloseField *task_data = new CThostFtdcOptionSelfCloseField();
-		*task_data = *pOptionSelfClose;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNOPTIONSELFCLOSE, pOptionSelfClose, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnOptionSelfCloseInsert(CThostFtdcInputOptionSelfCloseField *pInputOptionSelfClose, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNOPTIONSELFCLOSEINSERT;
-	if (pInputOptionSelfClose)
-	{
-		CThostFtdcInputOptionSelfCloseField *task_data = new CThostFtdcInputOptionSelfCloseField();
-		*task_data = *pInputOptionSelfClose;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNOPTIONSELFCLOSEINSERT, pInputOptionSelfClose, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnOptionSelfCloseAction(CThostFtdcOptionSelfCloseActionField *pOptionSelfCloseAction, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNOPTIONSELFCLOSEACTION;
-	if (pOptionSelfCloseAction)
-	{
-		CThostFtdcOptionSelfCloseActionField *task_data = new CThostFtdcOptionSelfCloseActionField();
-		*task_data = *pOptionSelfCloseAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNOPTIONSELFCLOSEACTION, pOptionSelfCloseAction, pRspInfo, 0, false);
 };
 
 void TdApi::OnRtnCombAction(CThostFtdcCombActionField *pCombAction) 
 {
-	Task task = Task();
-	task.task_name = ONRTNCOMBACTION;
-	if (pCombAction)
-	{
-		CThostFtdcCombActionField *task_data = new CThostFtdcCombActionField();
-		*task_data = *pCombAction;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNCOMBACTION, pCombAction, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnCombActionInsert(CThostFtdcInputCombActionField *pInputCombAction, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNCOMBACTIONINSERT;
-	if (pInputCombAction)
-	{
-		CThostFtdcInputCombActionField *task_data = new CThostFtdcInputCombActionField();
-		*task_data = *pInputCombAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNCOMBACTIONINSERT, pInputCombAction, pRspInfo, 0, false);
 };
 
 void TdApi::OnRspQryContractBank(CThostFtdcContractBankField *pContractBank, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYCONTRACTBANK;
-	if (pContractBank)
-	{
-		CThostFtdcContractBankField *task_data = new CThostFtdcContractBankField();
-		*task_data = *pContractBank;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYCONTRACTBANK, pContractBank, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryParkedOrder(CThostFtdcParkedOrderField *pParkedOrder, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYPARKEDORDER;
-	if (pParkedOrder)
-	{
-		CThostFtdcParkedOrderField *task_data = new CThostFtdcParkedOrderField();
-		*task_data = *pParkedOrder;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYPARKEDORDER, pParkedOrder, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryParkedOrderAction(CThostFtdcParkedOrderActionField *pParkedOrderAction, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYPARKEDORDERACTION;
-	if (pParkedOrderAction)
-	{
-		CThostFtdcParkedOrderActionField *task_data = new CThostFtdcParkedOrderActionField();
-		*task_data = *pParkedOrderAction;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYPARKEDORDERACTION, pParkedOrderAction, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryTradingNotice(CThostFtdcTradingNoticeField *pTradingNotice, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYTRADINGNOTICE;
-	if (pTradingNotice)
-	{
-		CThostFtdcTradingNoticeField *task_data = new CThostFtdcTradingNoticeField();
-		*task_data = *pTradingNotice;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYTRADINGNOTICE, pTradingNotice, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryBrokerTradingParams(CThostFtdcBrokerTradingParamsField *pBrokerTradingParams, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYBROKERTRADINGPARAMS;
-	if (pBrokerTradingParams)
-	{
-		CThostFtdcBrokerTradingParamsField *task_data = new CThostFtdcBrokerTradingParamsField();
-		*task_data = *pBrokerTradingParams;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYBROKERTRADINGPARAMS, pBrokerTradingParams, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryBrokerTradingAlgos(CThostFtdcBrokerTradingAlgosField *pBrokerTradingAlgos, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYBROKERTRADINGALGOS;
-	if (pBrokerTradingAlgos)
-	{
-		CThostFtdcBrokerTradingAlgosField *task_data = new CThostFtdcBrokerTradingAlgosField();
-		*task_data = *pBrokerTradingAlgos;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYBROKERTRADINGALGOS, pBrokerTradingAlgos, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQueryCFMMCTradingAccountToken(CThostFtdcQueryCFMMCTradingAccountTokenField *pQueryCFMMCTradingAccountToken, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQUERYCFMMCTRADINGACCOUNTTOKEN;
-	if (pQueryCFMMCTradingAccountToken)
-	{
-		CThostFtdcQueryCFMMCTradingAccountTokenField *task_data = new CThostFtdcQueryCFMMCTradingAccountTokenField();
-		*task_data = *pQueryCFMMCTradingAccountToken;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQUERYCFMMCTRADINGACCOUNTTOKEN, pQueryCFMMCTradingAccountToken, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRtnFromBankToFutureByBank(CThostFtdcRspTransferField *pRspTransfer) 
 {
-	Task task = Task();
-	task.task_name = ONRTNFROMBANKTOFUTUREBYBANK;
-	if (pRspTransfer)
-	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
-		*task_data = *pRspTransfer;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFROMBANKTOFUTUREBYBANK, pRspTransfer, nullptr, 0, false);
 };
 
 void TdApi::OnRtnFromFutureToBankByBank(CThostFtdcRspTransferField *pRspTransfer) 
 {
-	Task task = Task();
-	task.task_name = ONRTNFROMFUTURETOBANKBYBANK;
-	if (pRspTransfer)
-	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
-		*task_data = *pRspTransfer;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFROMFUTURETOBANKBYBANK, pRspTransfer, nullptr, 0, false);
 };
 
 void TdApi::OnRtnRepealFromBankToFutureByBank(CThostFtdcRspRepealField *pRspRepeal) 
 {
-	Task task = Task();
-	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYBANK;
-	if (pRspRepeal)
-	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
-		*task_data = *pRspRepeal;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNREPEALFROMBANKTOFUTUREBYBANK, pRspRepeal, nullptr, 0, false);
 };
 
 void TdApi::OnRtnRepealFromFutureToBankByBank(CThostFtdcRspRepealField *pRspRepeal) 
 {
-	Task task = Task();
-	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYBANK;
-	if (pRspRepeal)
-	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
-		*task_data = *pRspRepeal;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNREPEALFROMFUTURETOBANKBYBANK, pRspRepeal, nullptr, 0, false);
 };
 
 void TdApi::OnRtnFromBankToFutureByFuture(CThostFtdcRspTransferField *pRspTransfer) 
 {
-	Task task = Task();
-	task.task_name = ONRTNFROMBANKTOFUTUREBYFUTURE;
-	if (pRspTransfer)
-	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
-		*task_data = *pRspTransfer;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFROMBANKTOFUTUREBYFUTURE, pRspTransfer, nullptr, 0, false);
 };
 
 void TdApi::OnRtnFromFutureToBankByFuture(CThostFtdcRspTransferField *pRspTransfer) 
 {
-	Task task = Task();
-	task.task_name = ONRTNFROMFUTURETOBANKBYFUTURE;
-	if (pRspTransfer)
-	{
-		CThostFtdcRspTransferField *task_data = new CThostFtdcRspTransferField();
-		*task_data = *pRspTransfer;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFROMFUTURETOBANKBYFUTURE, pRspTransfer, nullptr, 0, false);
 };
 
 void TdApi::OnRtnRepealFromBankToFutureByFutureManual(CThostFtdcRspRepealField *pRspRepeal) 
 {
-	Task task = Task();
-	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTUREMANUAL;
-	if (pRspRepeal)
-	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
-		*task_data = *pRspRepeal;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNREPEALFROMBANKTOFUTUREBYFUTUREMANUAL, pRspRepeal, nullptr, 0, false);
 };
 
 void TdApi::OnRtnRepealFromFutureToBankByFutureManual(CThostFtdcRspRepealField *pRspRepeal) 
 {
-	Task task = Task();
-	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTUREMANUAL;
-	if (pRspRepeal)
-	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
-		*task_data = *pRspRepeal;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNREPEALFROMFUTURETOBANKBYFUTUREMANUAL, pRspRepeal, nullptr, 0, false);
 };
 
 void TdApi::OnRtnQueryBankBalanceByFuture(CThostFtdcNotifyQueryAccountField *pNotifyQueryAccount) 
 {
-	Task task = Task();
-	task.task_name = ONRTNQUERYBANKBALANCEBYFUTURE;
-	if (pNotifyQueryAccount)
-	{
-		CThostFtdcNotifyQueryAccountField *task_data = new CThostFtdcNotifyQueryAccountField();
-		*task_data = *pNotifyQueryAccount;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNQUERYBANKBALANCEBYFUTURE, pNotifyQueryAccount, nullptr, 0, false);
 };
 
 void TdApi::OnErrRtnBankToFutureByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNBANKTOFUTUREBYFUTURE;
-	if (pReqTransfer)
-	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
-		*task_data = *pReqTransfer;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNBANKTOFUTUREBYFUTURE, pReqTransfer, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnFutureToBankByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNFUTURETOBANKBYFUTURE;
-	if (pReqTransfer)
-	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
-		*task_data = *pReqTransfer;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNFUTURETOBANKBYFUTURE, pReqTransfer, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnRepealBankToFutureByFutureManual(CThostFtdcReqRepealField *pReqRepeal, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNREPEALBANKTOFUTUREBYFUTUREMANUAL;
-	if (pReqRepeal)
-	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
-		*task_data = *pReqRepeal;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNREPEALBANKTOFUTUREBYFUTUREMANUAL, pReqRepeal, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnRepealFutureToBankByFutureManual(CThostFtdcReqRepealField *pReqRepeal, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNREPEALFUTURETOBANKBYFUTUREMANUAL;
-	if (pReqRepeal)
-	{
-		CThostFtdcReqRepealField *task_data = new CThostFtdcReqRepealField();
-		*task_data = *pReqRepeal;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNREPEALFUTURETOBANKBYFUTUREMANUAL, pReqRepeal, pRspInfo, 0, false);
 };
 
 void TdApi::OnErrRtnQueryBankBalanceByFuture(CThostFtdcReqQueryAccountField *pReqQueryAccount, CThostFtdcRspInfoField *pRspInfo) 
 {
-	Task task = Task();
-	task.task_name = ONERRRTNQUERYBANKBALANCEBYFUTURE;
-	if (pReqQueryAccount)
-	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
-		*task_data = *pReqQueryAccount;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONERRRTNQUERYBANKBALANCEBYFUTURE, pReqQueryAccount, pRspInfo, 0, false);
 };
 
 void TdApi::OnRtnRepealFromBankToFutureByFuture(CThostFtdcRspRepealField *pRspRepeal) 
 {
-	Task task = Task();
-	task.task_name = ONRTNREPEALFROMBANKTOFUTUREBYFUTURE;
-	if (pRspRepeal)
-	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
-		*task_data = *pRspRepeal;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNREPEALFROMBANKTOFUTUREBYFUTURE, pRspRepeal, nullptr, 0, false);
 };
 
 void TdApi::OnRtnRepealFromFutureToBankByFuture(CThostFtdcRspRepealField *pRspRepeal) 
 {
-	Task task = Task();
-	task.task_name = ONRTNREPEALFROMFUTURETOBANKBYFUTURE;
-	if (pRspRepeal)
-	{
-		CThostFtdcRspRepealField *task_data = new CThostFtdcRspRepealField();
-		*task_data = *pRspRepeal;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNREPEALFROMFUTURETOBANKBYFUTURE, pRspRepeal, nullptr, 0, false);
 };
 
 void TdApi::OnRspFromBankToFutureByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPFROMBANKTOFUTUREBYFUTURE;
-	if (pReqTransfer)
-	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
-		*task_data = *pReqTransfer;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPFROMBANKTOFUTUREBYFUTURE, pReqTransfer, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspFromFutureToBankByFuture(CThostFtdcReqTransferField *pReqTransfer, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPFROMFUTURETOBANKBYFUTURE;
-	if (pReqTransfer)
-	{
-		CThostFtdcReqTransferField *task_data = new CThostFtdcReqTransferField();
-		*task_data = *pReqTransfer;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPFROMFUTURETOBANKBYFUTURE, pReqTransfer, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQueryBankAccountMoneyByFuture(CThostFtdcReqQueryAccountField *pReqQueryAccount, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQUERYBANKACCOUNTMONEYBYFUTURE;
-	if (pReqQueryAccount)
-	{
-		CThostFtdcReqQueryAccountField *task_data = new CThostFtdcReqQueryAccountField();
-		*task_data = *pReqQueryAccount;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQUERYBANKACCOUNTMONEYBYFUTURE, pReqQueryAccount, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRtnOpenAccountByBank(CThostFtdcOpenAccountField *pOpenAccount) 
 {
-	Task task = Task();
-	task.task_name = ONRTNOPENACCOUNTBYBANK;
-	if (pOpenAccount)
-	{
-		CThostFtdcOpenAccountField *task_data = new CThostFtdcOpenAccountField();
-		*task_data = *pOpenAccount;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNOPENACCOUNTBYBANK, pOpenAccount, nullptr, 0, false);
 };
 
 void TdApi::OnRtnCancelAccountByBank(CThostFtdcCancelAccountField *pCancelAccount) 
 {
-	Task task = Task();
-	task.task_name = ONRTNCANCELACCOUNTBYBANK;
-	if (pCancelAccount)
-	{
-		CThostFtdcCancelAccountField *task_data = new CThostFtdcCancelAccountField();
-		*task_data = *pCancelAccount;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNCANCELACCOUNTBYBANK, pCancelAccount, nullptr, 0, false);
 };
 
 void TdApi::OnRtnChangeAccountByBank(CThostFtdcChangeAccountField *pChangeAccount) 
 {
-	Task task = Task();
-	task.task_name = ONRTNCHANGEACCOUNTBYBANK;
-	if (pChangeAccount)
-	{
-		CThostFtdcChangeAccountField *task_data = new CThostFtdcChangeAccountField();
-		*task_data = *pChangeAccount;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNCHANGEACCOUNTBYBANK, pChangeAccount, nullptr, 0, false);
 };
 
 void TdApi::OnRspQryClassifiedInstrument(CThostFtdcInstrumentField *pInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYCLASSIFIEDINSTRUMENT;
-	if (pInstrument)
-	{
-		CThostFtdcInstrumentField *task_data = new CThostFtdcInstrumentField();
-		*task_data = *pInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYCLASSIFIEDINSTRUMENT, pInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryCombPromotionParam(CThostFtdcCombPromotionParamField *pCombPromotionParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYCOMBPROMOTIONPARAM;
-	if (pCombPromotionParam)
-	{
-		CThostFtdcCombPromotionParamField *task_data = new CThostFtdcCombPromotionParamField();
-		*task_data = *pCombPromotionParam;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYCOMBPROMOTIONPARAM, pCombPromotionParam, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRiskSettleInvstPosition(CThostFtdcRiskSettleInvstPositionField *pRiskSettleInvstPosition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRISKSETTLEINVSTPOSITION;
-	if (pRiskSettleInvstPosition)
-	{
-		CThostFtdcRiskSettleInvstPositionField *task_data = new CThostFtdcRiskSettleInvstPositionField();
-		*task_data = *pRiskSettleInvstPosition;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRISKSETTLEINVSTPOSITION, pRiskSettleInvstPosition, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRiskSettleProductStatus(CThostFtdcRiskSettleProductStatusField *pRiskSettleProductStatus, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRISKSETTLEPRODUCTSTATUS;
-	if (pRiskSettleProductStatus)
-	{
-		CThostFtdcRiskSettleProductStatusField *task_data = new CThostFtdcRiskSettleProductStatusField();
-		*task_data = *pRiskSettleProductStatus;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRISKSETTLEPRODUCTSTATUS, pRiskSettleProductStatus, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMFutureParameter(CThostFtdcSPBMFutureParameterField *pSPBMFutureParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMFUTUREPARAMETER;
-	if (pSPBMFutureParameter)
-	{
-		CThostFtdcSPBMFutureParameterField *task_data = new CThostFtdcSPBMFutureParameterField();
-		*task_data = *pSPBMFutureParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMFUTUREPARAMETER, pSPBMFutureParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMOptionParameter(CThostFtdcSPBMOptionParameterField *pSPBMOptionParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMOPTIONPARAMETER;
-	if (pSPBMOptionParameter)
-	{
-		CThostFtdcSPBMOptionParameterField *task_data = new CThostFtdcSPBMOptionParameterField();
-		*task_data = *pSPBMOptionParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMOPTIONPARAMETER, pSPBMOptionParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMIntraParameter(CThostFtdcSPBMIntraParameterField *pSPBMIntraParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMINTRAPARAMETER;
-	if (pSPBMIntraParameter)
-	{
-		CThostFtdcSPBMIntraParameterField *task_data = new CThostFtdcSPBMIntraParameterField();
-		*task_data = *pSPBMIntraParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMINTRAPARAMETER, pSPBMIntraParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMInterParameter(CThostFtdcSPBMInterParameterField *pSPBMInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMINTERPARAMETER;
-	if (pSPBMInterParameter)
-	{
-		CThostFtdcSPBMInterParameterField *task_data = new CThostFtdcSPBMInterParameterField();
-		*task_data = *pSPBMInterParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMINTERPARAMETER, pSPBMInterParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMPortfDefinition(CThostFtdcSPBMPortfDefinitionField *pSPBMPortfDefinition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMPORTFDEFINITION;
-	if (pSPBMPortfDefinition)
-	{
-		CThostFtdcSPBMPortfDefinitionField *task_data = new CThostFtdcSPBMPortfDefinitionField();
-		*task_data = *pSPBMPortfDefinition;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMPORTFDEFINITION, pSPBMPortfDefinition, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMInvestorPortfDef(CThostFtdcSPBMInvestorPortfDefField *pSPBMInvestorPortfDef, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMINVESTORPORTFDEF;
-	if (pSPBMInvestorPortfDef)
-	{
-		CThostFtdcSPBMInvestorPortfDefField *task_data = new CThostFtdcSPBMInvestorPortfDefField();
-		*task_data = *pSPBMInvestorPortfDef;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMINVESTORPORTFDEF, pSPBMInvestorPortfDef, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorPortfMarginRatio(CThostFtdcInvestorPortfMarginRatioField *pInvestorPortfMarginRatio, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPORTFMARGINRATIO;
-	if (pInvestorPortfMarginRatio)
-	{
-		CThostFtdcInvestorPortfMarginRatioField *task_data = new CThostFtdcInvestorPortfMarginRatioField();
-		*task_data = *pInvestorPortfMarginRatio;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPORTFMARGINRATIO, pInvestorPortfMarginRatio, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorProdSPBMDetail(CThostFtdcInvestorProdSPBMDetailField *pInvestorProdSPBMDetail, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPRODSPBMDETAIL;
-	if (pInvestorProdSPBMDetail)
-	{
-		CThostFtdcInvestorProdSPBMDetailField *task_data = new CThostFtdcInvestorProdSPBMDetailField();
-		*task_data = *pInvestorProdSPBMDetail;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPRODSPBMDETAIL, pInvestorProdSPBMDetail, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorCommoditySPMMMargin(CThostFtdcInvestorCommoditySPMMMarginField *pInvestorCommoditySPMMMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORCOMMODITYSPMMMARGIN;
-	if (pInvestorCommoditySPMMMargin)
-	{
-		CThostFtdcInvestorCommoditySPMMMarginField *task_data = new CThostFtdcInvestorCommoditySPMMMarginField();
-		*task_data = *pInvestorCommoditySPMMMargin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORCOMMODITYSPMMMARGIN, pInvestorCommoditySPMMMargin, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorCommodityGroupSPMMMargin(CThostFtdcInvestorCommodityGroupSPMMMarginField *pInvestorCommodityGroupSPMMMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORCOMMODITYGROUPSPMMMARGIN;
-	if (pInvestorCommodityGroupSPMMMargin)
-	{
-		CThostFtdcInvestorCommodityGroupSPMMMarginField *task_data = new CThostFtdcInvestorCommodityGroupSPMMMarginField();
-		*task_data = *pInvestorCommodityGroupSPMMMargin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORCOMMODITYGROUPSPMMMARGIN, pInvestorCommodityGroupSPMMMargin, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPMMInstParam(CThostFtdcSPMMInstParamField *pSPMMInstParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPMMINSTPARAM;
-	if (pSPMMInstParam)
-	{
-		CThostFtdcSPMMInstParamField *task_data = new CThostFtdcSPMMInstParamField();
-		*task_data = *pSPMMInstParam;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPMMINSTPARAM, pSPMMInstParam, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPMMProductParam(CThostFtdcSPMMProductParamField *pSPMMProductParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPMMPRODUCTPARAM;
-	if (pSPMMProductParam)
-	{
-		CThostFtdcSPMMProductParamField *task_data = new CThostFtdcSPMMProductParamField();
-		*task_data = *pSPMMProductParam;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPMMPRODUCTPARAM, pSPMMProductParam, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQrySPBMAddOnInterParameter(CThostFtdcSPBMAddOnInterParameterField *pSPBMAddOnInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYSPBMADDONINTERPARAMETER;
-	if (pSPBMAddOnInterParameter)
-	{
-		CThostFtdcSPBMAddOnInterParameterField *task_data = new CThostFtdcSPBMAddOnInterParameterField();
-		*task_data = *pSPBMAddOnInterParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYSPBMADDONINTERPARAMETER, pSPBMAddOnInterParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRCAMSCombProductInfo(CThostFtdcRCAMSCombProductInfoField *pRCAMSCombProductInfo, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRCAMSCOMBPRODUCTINFO;
-	if (pRCAMSCombProductInfo)
-	{
-		CThostFtdcRCAMSCombProductInfoField *task_data = new CThostFtdcRCAMSCombProductInfoField();
-		*task_data = *pRCAMSCombProductInfo;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRCAMSCOMBPRODUCTINFO, pRCAMSCombProductInfo, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRCAMSInstrParameter(CThostFtdcRCAMSInstrParameterField *pRCAMSInstrParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRCAMSINSTRPARAMETER;
-	if (pRCAMSInstrParameter)
-	{
-		CThostFtdcRCAMSInstrParameterField *task_data = new CThostFtdcRCAMSInstrParameterField();
-		*task_data = *pRCAMSInstrParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRCAMSINSTRPARAMETER, pRCAMSInstrParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRCAMSIntraParameter(CThostFtdcRCAMSIntraParameterField *pRCAMSIntraParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRCAMSINTRAPARAMETER;
-	if (pRCAMSIntraParameter)
-	{
-		CThostFtdcRCAMSIntraParameterField *task_data = new CThostFtdcRCAMSIntraParameterField();
-		*task_data = *pRCAMSIntraParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRCAMSINTRAPARAMETER, pRCAMSIntraParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRCAMSInterParameter(CThostFtdcRCAMSInterParameterField *pRCAMSInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRCAMSINTERPARAMETER;
-	if (pRCAMSInterParameter)
-	{
-		CThostFtdcRCAMSInterParameterField *task_data = new CThostFtdcRCAMSInterParameterField();
-		*task_data = *pRCAMSInterParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRCAMSINTERPARAMETER, pRCAMSInterParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRCAMSShortOptAdjustParam(CThostFtdcRCAMSShortOptAdjustParamField *pRCAMSShortOptAdjustParam, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRCAMSSHORTOPTADJUSTPARAM;
-	if (pRCAMSShortOptAdjustParam)
-	{
-		CThostFtdcRCAMSShortOptAdjustParamField *task_data = new CThostFtdcRCAMSShortOptAdjustParamField();
-		*task_data = *pRCAMSShortOptAdjustParam;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRCAMSSHORTOPTADJUSTPARAM, pRCAMSShortOptAdjustParam, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRCAMSInvestorCombPosition(CThostFtdcRCAMSInvestorCombPositionField *pRCAMSInvestorCombPosition, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRCAMSINVESTORCOMBPOSITION;
-	if (pRCAMSInvestorCombPosition)
-	{
-		CThostFtdcRCAMSInvestorCombPositionField *task_data = new CThostFtdcRCAMSInvestorCombPositionField();
-		*task_data = *pRCAMSInvestorCombPosition;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRCAMSINVESTORCOMBPOSITION, pRCAMSInvestorCombPosition, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorProdRCAMSMargin(CThostFtdcInvestorProdRCAMSMarginField *pInvestorProdRCAMSMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPRODRCAMSMARGIN;
-	if (pInvestorProdRCAMSMargin)
-	{
-		CThostFtdcInvestorProdRCAMSMarginField *task_data = new CThostFtdcInvestorProdRCAMSMarginField();
-		*task_data = *pInvestorProdRCAMSMargin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPRODRCAMSMARGIN, pInvestorProdRCAMSMargin, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRULEInstrParameter(CThostFtdcRULEInstrParameterField *pRULEInstrParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRULEINSTRPARAMETER;
-	if (pRULEInstrParameter)
-	{
-		CThostFtdcRULEInstrParameterField *task_data = new CThostFtdcRULEInstrParameterField();
-		*task_data = *pRULEInstrParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRULEINSTRPARAMETER, pRULEInstrParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRULEIntraParameter(CThostFtdcRULEIntraParameterField *pRULEIntraParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRULEINTRAPARAMETER;
-	if (pRULEIntraParameter)
-	{
-		CThostFtdcRULEIntraParameterField *task_data = new CThostFtdcRULEIntraParameterField();
-		*task_data = *pRULEIntraParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRULEINTRAPARAMETER, pRULEIntraParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryRULEInterParameter(CThostFtdcRULEInterParameterField *pRULEInterParameter, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYRULEINTERPARAMETER;
-	if (pRULEInterParameter)
-	{
-		CThostFtdcRULEInterParameterField *task_data = new CThostFtdcRULEInterParameterField();
-		*task_data = *pRULEInterParameter;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYRULEINTERPARAMETER, pRULEInterParameter, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorProdRULEMargin(CThostFtdcInvestorProdRULEMarginField *pInvestorProdRULEMargin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPRODRULEMARGIN;
-	if (pInvestorProdRULEMargin)
-	{
-		CThostFtdcInvestorProdRULEMarginField *task_data = new CThostFtdcInvestorProdRULEMarginField();
-		*task_data = *pInvestorProdRULEMargin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPRODRULEMARGIN, pInvestorProdRULEMargin, pRspInfo, nRequestID, bIsLast);
 };
 
 void TdApi::OnRspQryInvestorPortfSetting(CThostFtdcInvestorPortfSettingField *pInvestorPortfSetting, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast) 
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYINVESTORPORTFSETTING;
-	if (pInvestorPortfSetting)
-	{
-		CThostFtdcInvestorPortfSettingField *task_data = new CThostFtdcInvestorPortfSettingField();
-		*task_data = *pInvestorPortfSetting;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYINVESTORPORTFSETTING, pInvestorPortfSetting, pRspInfo, nRequestID, bIsLast);
 };
 
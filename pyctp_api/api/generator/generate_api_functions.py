@@ -1,17 +1,64 @@
 """"""
 import importlib
+from typing import TextIO
+
+
+# 结构体字段描述表中的字段类型
+FIELD_TYPES: dict[str, str] = {
+    "int": "FIELD_INT",
+    "double": "FIELD_DOUBLE",
+    "char": "FIELD_CHAR",
+    "ascii": "FIELD_ASCII",
+    "string": "FIELD_GBK",
+}
+
+# 字符串字段转换为Python字符串的函数：ASCII字段直接创建，其余字段需先检查是否为GBK编码
+STRING_CONVERTERS: dict[str, str] = {
+    "ascii": "fromAscii",
+    "string": "fromGbk",
+}
 
 
 class ApiGenerator:
     """API生成器"""""
 
-    def __init__(self, filename: str, prefix: str, name: str, class_name: str) -> None:
+    def __init__(
+        self,
+        filename: str,
+        prefix: str,
+        name: str,
+        class_name: str,
+        typed_structs: dict[str, str] | None = None,
+        projections: dict[str, str] | None = None,
+        conflations: dict[str, str] | None = None,
+        templates: dict[str, str] | None = None,
+        publishers: dict[str, list[str]] | None = None,
+        aggregations: dict[str, str] | None = None
+    ) -> None:
         """Constructor"""
         self.filename = filename
         self.prefix = prefix
         self.name = name
         self.class_name = class_name
 
+        # 需要生成原生对象绑定的结构体（结构体名 -> Python类名）
+        self.typed_structs: dict[str, str] = typed_structs or {}
+
+        # 支持字段投影的结构体（结构体名 -> 保存投影字段列表的成员名）
+        self.projections: dict[str, str] = projections or {}
+
+        # 支持按合约合并的回调（回调名 -> 合并使用的合约代码字段）
+        self.conflations: dict[str, str] = conflations or {}
+
+        # 需要生成请求模板填充函数的结构体（结构体名 -> 模板类名）
+        self.templates: dict[str, str] = templates or {}
+
+        # 在CTP回调线程中直接发布原始数据的回调（回调名 -> 发布对象的成员名列表，按顺序发布）
+        self.publishers: dict[str, list[str]] = publishers or {}
+
+        # 支持按请求汇总推送的回调（回调名前缀 -> 汇总对象的成员名）
+        self.aggregations: dict[str, str] = aggregations or {}
+
         self.callbacks: dict[str, dict[str, str]] = {}
         self.functions: dict[str, dict[str, str]] = {}
         self.lines: dict[str, str] = {}
@@ -30,7 +77,7 @@ class ApiGenerator:
 
     def run(self) -> None:
         """运行生成"""
-        self.f_cpp = open(self.filename)
+        self.f_cpp = open(self.filename, encoding="gbk")
 
         for line in self.f_cpp:
             self.process_line(line)
@@ -41,13 +88,17 @@ class ApiGenerator:
         self.generate_header_process()
         self.generate_header_on()
         self.generate_header_function()
+        self.generate_header_pool()
 
         self.generate_source_task()
-        self.generate_source_switch()
         self.generate_source_process()
         self.generate_source_function()
         self.generate_source_on()
         self.generate_source_module()
+        self.generate_source_struct()
+        self.generate_source_key()
+        self.generate_source_pool()
+        self.generate_source_override()
 
         print("API生成成功")
 
@@ -100,20 +151,32 @@ class ApiGenerator:
                 line = f"#define {name.upper()} {n}\n"
                 f.write(line)
 
+            f.write(f"#define CALLBACK_COUNT {len(self.callbacks)}\n")
+
     def generate_header_process(self) -> None:
-        """"""
+        """生成原生对象回调的推送函数声明（其余回调按回调描述表统一推送）"""
+        if not self.typed_structs:
+            return
+
         filename = f"{self.prefix}_{self.name}_header_process.h"
         with open(filename, "w") as f:
-            for name in self.callbacks.keys():
-                name = name.replace("On", "process")
-                line = f"void {name}(Task *task);\n\n"
-                f.write(line)
+            for name, d in self.callbacks.items():
+                if not self.get_typed_struct(d):
+                    continue
+
+                process_name = name.replace("On", "process")
+                convert_name = name.replace("On", "convert")
+                f.write(f"void {process_name}(Task *task);\n\n")
+                f.write(f"object {convert_name}(Task *task);\n\n")
 
     def generate_header_on(self) -> None:
-        """"""
+        """生成C++中直接调用的回调虚函数（其余回调在Python中只绑定空函数）"""
         filename = f"{self.prefix}_{self.name}_header_on.h"
         with open(filename, "w") as f:
             for name, d in self.callbacks.items():
+                if not self.get_typed_struct(d):
+                    continue
+
                 name = name.replace("On", "on")
 
                 args_list = []
@@ -126,6 +189,8 @@ class ApiGenerator:
                         args_list.append("string data")
                     elif type_ == "CThostFtdcRspInfoField":
                         args_list.append("const dict &error")
+                    elif type_ in self.typed_structs:
+                        args_list.append("const object &data")
                     else:
                         args_list.append("const dict &data")
 
@@ -134,6 +199,42 @@ class ApiGenerator:
 
                 f.write(line)
 
+                if self.is_batch_callback(d):
+                    f.write(f"virtual void {name}Batch(const list &data) {{}};\n\n")
+
+            f.write("virtual void onQueueWatermark(int size) {};\n\n")
+
+    def get_pool_types(self) -> list[str]:
+        """获取回调中需要内存池的结构体"""
+        types = []
+        for d in self.callbacks.values():
+            for type_ in d.values():
+                if type_.startswith("CThostFtdc") and type_ not in types:
+                    types.append(type_)
+        return types
+
+    def get_pool_name(self, type_: str) -> str:
+        """获取结构体对应的内存池成员名"""
+        return "pool_" + type_.replace("CThostFtdc", "").removesuffix("Field")
+
+    def generate_header_pool(self) -> None:
+        """"""
+        filename = f"{self.prefix}_{self.name}_header_pool.h"
+        with open(filename, "w") as f:
+            for type_ in self.get_pool_types():
+                f.write(f"TaskPool<{type_}> {self.get_pool_name(type_)};\n")
+
+            f.write("\n")
+            f.write("//各回调数据结构体对应的内存池（没有数据参数的回调为空）\n")
+            f.write("TaskPoolBase *data_pools[CALLBACK_COUNT] = {\n")
+            for d in self.callbacks.values():
+                type_ = self.get_data_type(d)
+                if type_:
+                    f.write(f"\t&{self.get_pool_name(type_)},\n")
+                else:
+                    f.write("\tnullptr,\n")
+            f.write("};\n")
+
     def generate_header_function(self) -> None:
         """"""
         filename = f"{self.prefix}_{self.name}_header_function.h"
@@ -153,109 +254,232 @@ class ApiGenerator:
                 f.write(line.replace("virtual void ",
                                      f"void {self.class_name}::") + "\n")
                 f.write("{\n")
-                f.write("\tTask task = Task();\n")
-                f.write(f"\ttask.task_name = {name.upper()};\n")
 
-                for field, type_ in d.items():
-                    if type_ == "int":
-                        f.write(f"\ttask.task_id = {field};\n")
-                    elif type_ == "bool":
-                        f.write(f"\ttask.task_last = {field};\n")
-                    elif type_ == "CThostFtdcRspInfoField":
-                        f.write(f"\tif ({field})\n")
-                        f.write("\t{\n")
-                        f.write(f"\t\t{type_} *task_error = new {type_}();\n")
-                        f.write(f"\t\t*task_error = *{field};\n")
-                        f.write("\t\ttask.task_error = task_error;\n")
-                        f.write("\t}\n")
-                    else:
-                        f.write(f"\tif ({field})\n")
-                        f.write("\t{\n")
-                        f.write(f"\t\t{type_} *task_data = new {type_}();\n")
-                        f.write(f"\t\t*task_data = *{field};\n")
-                        f.write("\t\ttask.task_data = task_data;\n")
-                        f.write("\t}\n")
-
-                f.write("\tthis->task_queue.push(task);\n")
+                if name in self.publishers:
+                    field = list(d)[0]
+                    for member in self.publishers[name]:
+                        f.write(f"\tif (this->{member}.active() && {field})\n")
+                        f.write(f"\t\tthis->{member}.publish(*{field});\n")
+                        f.write("\n")
+
+                # 连接断开后未收到bIsLast的查询不会再有后续数据
+                if name == "OnFrontDisconnected":
+                    for member in sorted(set(self.aggregations.values())):
+                        f.write(f"\tthis->{member}.clear();\n")
+                        f.write("\n")
+
+                # 合并模式的回调需要在创建任务之前写入合并表，其余回调统一通过pushTask写入队列
+                if name not in self.conflations:
+                    f.write(f"\tthis->pushTask({name.upper()}, {self.get_native_args(d)});\n")
+                    f.write("};\n\n")
+                    continue
+
+                f.write(f"\tthis->native_hook.callSpi({name.upper()}, {self.get_native_args(d)});\n")
+                f.write("\n")
+
+                f.write(f"\tif (!this->overrides[{name.upper()}] && !this->native_hook.dispatches({name.upper()}))\n")
+                f.write("\t\treturn;\n")
+                f.write("\n")
+
+                self.write_conflate(f, name, d)
+
+                for line in self.get_task_lines(name, d):
+                    f.write(line)
                 f.write("};\n\n")
 
-    def generate_source_switch(self) -> None:
-        """"""
-        filename = f"{self.prefix}_{self.name}_source_switch.cpp"
-        with open(filename, "w") as f:
-            for name in self.callbacks.keys():
-                process_name = name.replace("On", "process")
-                f.write(f"case {name.upper()}:\n")
-                f.write("{\n")
-                f.write(f"\tthis->{process_name}(&task);\n")
-                f.write("\tbreak;\n")
-                f.write("}\n\n")
+    def get_task_lines(self, name: str, d: dict[str, str]) -> list[str]:
+        """生成创建任务并写入队列的代码行"""
+        lines: list[str] = []
+        lines.append("\tTask task = Task();\n")
+        lines.append(f"\ttask.task_name = {name.upper()};\n")
+
+        for field, type_ in d.items():
+            if type_ == "int":
+                lines.append(f"\ttask.task_id = {field};\n")
+            elif type_ == "bool":
+                lines.append(f"\ttask.task_last = {field};\n")
+            elif type_ == "CThostFtdcRspInfoField":
+                lines.append(f"\tif ({field})\n")
+                lines.append("\t{\n")
+                lines.append(f"\t\ttask.task_error = this->{self.get_pool_name(type_)}.alloc(*{field});\n")
+                lines.append("\t}\n")
+            else:
+                lines.append(f"\tif ({field})\n")
+                lines.append("\t{\n")
+                lines.append(f"\t\ttask.task_data = this->{self.get_pool_name(type_)}.alloc(*{field});\n")
+                lines.append("\t}\n")
+
+        lines.append("\tthis->task_queue.push(task);\n")
+        return lines
+
+    def get_native_args(self, d: dict[str, str]) -> str:
+        """生成调用原生回调的参数（数据、错误、请求编号、是否最后返回）"""
+        data = error = "nullptr"
+        reqid = "0"
+        last = "false"
+
+        for field, type_ in d.items():
+            if type_ == "int":
+                reqid = field
+            elif type_ == "bool":
+                last = field
+            elif type_ == "CThostFtdcRspInfoField":
+                error = field
+            else:
+                data = field
+
+        return f"{data}, {error}, {reqid}, {last}"
+
+    def get_aggregation(self, name: str) -> str:
+        """获取回调对应的汇总对象成员名，不汇总时返回空字符串"""
+        for prefix, member in self.aggregations.items():
+            if name.startswith(prefix):
+                return member
+        return ""
+
+    def get_data_type(self, d: dict[str, str]) -> str:
+        """获取回调中数据参数的结构体，没有数据参数时返回空字符串"""
+        for type_ in d.values():
+            if type_.startswith("CThostFtdc") and type_ != "CThostFtdcRspInfoField":
+                return type_
+        return ""
+
+    def get_callback_args(self, d: dict[str, str]) -> str:
+        """生成回调描述表中的参数组合"""
+        flags = []
+        for type_ in d.values():
+            if type_ == "int":
+                flags.append("CALLBACK_ARG_ID")
+            elif type_ == "bool":
+                flags.append("CALLBACK_ARG_LAST")
+            elif type_ == "CThostFtdcRspInfoField":
+                flags.append("CALLBACK_ARG_ERROR")
+            else:
+                flags.append("CALLBACK_ARG_DATA")
+
+        # 通用推送按数据、错误、请求编号、是否最后返回的顺序组装参数，CTP回调的参数顺序与之一致
+        order = ["CALLBACK_ARG_DATA", "CALLBACK_ARG_ERROR", "CALLBACK_ARG_ID", "CALLBACK_ARG_LAST"]
+        assert flags == sorted(flags, key=order.index), flags
+
+        return " | ".join(flags) or "0"
+
+    def write_conflate(self, f: TextIO, name: str, d: dict[str, str]) -> None:
+        """生成合并模式下写入合并表的代码"""
+        field, type_ = list(d.items())[0]
+        key = self.conflations[name]
+
+        f.write(f"\tif ((this->conflate || this->task_queue.overloaded()) && {field})\n")
+        f.write("\t{\n")
+        f.write(f"\t\tif (this->conflate_table.update({field}->{key}, *{field}, this->{self.get_pool_name(type_)}))\n")
+        f.write("\t\t{\n")
+        f.write("\t\t\tTask task = Task();\n")
+        f.write("\t\t\ttask.task_name = TASK_CONFLATED;\n")
+        f.write("\t\t\tthis->task_queue.push(task);\n")
+        f.write("\t\t}\n")
+        f.write("\t\treturn;\n")
+        f.write("\t}\n")
+        f.write("\n")
+
+    def get_typed_struct(self, d: dict[str, str]) -> str:
+        """获取回调中需要生成原生对象的结构体"""
+        for type_ in d.values():
+            if type_ in self.typed_structs:
+                return type_
+        return ""
+
+    def is_batch_callback(self, d: dict[str, str]) -> bool:
+        """只推送原生对象结构体的回调，额外生成批量推送回调"""
+        return len(d) == 1 and bool(self.get_typed_struct(d))
 
     def generate_source_process(self) -> None:
-        """"""
+        """生成原生对象回调的推送函数（支持多种推送模式，其余回调按回调描述表统一推送）"""
+        if not self.typed_structs:
+            return
+
         filename = f"{self.prefix}_{self.name}_source_process.cpp"
         with open(filename, "w") as f:
             for name, d in self.callbacks.items():
+                typed_struct = self.get_typed_struct(d)
+                if not typed_struct:
+                    continue
+
                 process_name = name.replace("On", "process")
                 on_name = name.replace("On", "on")
+                convert_name = name.replace("On", "convert")
 
-                f.write(
-                    f"void {self.class_name}::{process_name}(Task *task)\n")
-                f.write("{\n")
-                f.write("\tgil_scoped_acquire acquire;\n")
-
-                args = []
-
-                for _, type_ in d.items():
-                    if type_ == "int":
-                        args.append("task->task_id")
-                    elif type_ == "bool":
-                        args.append("task->task_last")
-                    elif type_ == "CThostFtdcRspInfoField":
-                        args.append("error")
-
-                        f.write("\tdict error;\n")
-                        f.write("\tif (task->task_error)\n")
-                        f.write("\t{\n")
-                        f.write(
-                            f"\t\t{type_} *task_error = ({type_}*)task->task_error;\n")
-
-                        struct_fields = self.structs[type_]
-                        for struct_field, struct_type in struct_fields.items():
-                            if struct_type == "string":
-                                f.write(
-                                    f"\t\terror[\"{struct_field}\"] = toUtf(task_error->{struct_field});\n")
-                            else:
-                                f.write(
-                                    f"\t\terror[\"{struct_field}\"] = task_error->{struct_field};\n")
-
-                        f.write("\t\tdelete task_error;\n")
-                        f.write("\t}\n")
-                    else:
-                        args.append("data")
-
-                        f.write("\tdict data;\n")
-                        f.write("\tif (task->task_data)\n")
-                        f.write("\t{\n")
-                        f.write(
-                            f"\t\t{type_} *task_data = ({type_}*)task->task_data;\n")
-
-                        struct_fields = self.structs[type_]
-                        for struct_field, struct_type in struct_fields.items():
-                            if struct_type == "string":
-                                f.write(
-                                    f"\t\tdata[\"{struct_field}\"] = toUtf(task_data->{struct_field});\n")
-                            else:
-                                f.write(
-                                    f"\t\tdata[\"{struct_field}\"] = task_data->{struct_field};\n")
-
-                        f.write("\t\tdelete task_data;\n")
-                        f.write("\t}\n")
+                self.write_typed_convert(f, typed_struct, convert_name)
 
-                args_str = ", ".join(args)
-                f.write(f"\tthis->{on_name}({args_str});\n")
+                f.write(f"void {self.class_name}::{process_name}(Task *task)\n")
+                f.write("{\n")
+                f.write(f"\tobject data = this->{convert_name}(task);\n")
+                f.write(f"\tthis->{on_name}(data);\n")
                 f.write("};\n\n")
 
+    def write_struct_items(
+        self,
+        f: TextIO,
+        dict_name: str,
+        data_name: str,
+        type_: str,
+        indent: str = "\t\t"
+    ) -> None:
+        """生成结构体转换为字典的代码（按字段描述表转换）"""
+        table_name = self.get_field_table_name(type_)
+        f.write(f"{indent}{dict_name} = structToDict({table_name}, {data_name});\n")
+
+    def write_typed_convert(self, f: TextIO, type_: str, convert_name: str) -> None:
+        """生成数据转换函数（支持字典、原生对象和原始字节三种推送模式）"""
+        f.write(f"object {self.class_name}::{convert_name}(Task *task)\n")
+        f.write("{\n")
+        f.write("\tif (this->data_mode == DATA_MODE_RAW)\n")
+        f.write("\t{\n")
+        f.write("\t\tobject data = none();\n")
+        f.write("\t\tif (task->task_data)\n")
+        f.write("\t\t{\n")
+        f.write(f"\t\t\t{type_} *task_data = ({type_}*)task->task_data;\n")
+        f.write(f"\t\t\tdata = bytes((const char*)task_data, sizeof({type_}));\n")
+        f.write(f"\t\t\tthis->{self.get_pool_name(type_)}.free(task_data);\n")
+        f.write("\t\t}\n")
+        f.write("\t\treturn data;\n")
+        f.write("\t}\n")
+        f.write("\n")
+        f.write("\tif (this->data_mode == DATA_MODE_OBJECT)\n")
+        f.write("\t{\n")
+        f.write("\t\tobject data = none();\n")
+        f.write("\t\tif (task->task_data)\n")
+        f.write("\t\t{\n")
+        f.write(f"\t\t\t{type_} *task_data = ({type_}*)task->task_data;\n")
+        f.write("\t\t\tdata = cast(*task_data);\n")
+        f.write(f"\t\t\tthis->{self.get_pool_name(type_)}.free(task_data);\n")
+        f.write("\t\t}\n")
+        f.write("\t\treturn data;\n")
+        f.write("\t}\n")
+        f.write("\n")
+        f.write("\tdict data;\n")
+        f.write("\tif (task->task_data)\n")
+        f.write("\t{\n")
+        f.write(f"\t\t{type_} *task_data = ({type_}*)task->task_data;\n")
+
+        if type_ in self.projections:
+            member = self.projections[type_]
+            f.write(f"\t\tif (!this->{member}.empty())\n")
+            f.write("\t\t{\n")
+            f.write(f"\t\t\tdata = newDict(this->{member}.size());\n")
+            f.write(f"\t\t\tfor (const FieldDesc *field : this->{member})\n")
+            f.write("\t\t\t\tsetField(data, *field, task_data);\n")
+            f.write("\t\t}\n")
+            f.write("\t\telse\n")
+            f.write("\t\t{\n")
+            self.write_struct_items(f, "data", "task_data", type_, "\t\t\t")
+            f.write("\t\t}\n")
+        else:
+            self.write_struct_items(f, "data", "task_data", type_)
+
+        f.write(f"\t\tthis->{self.get_pool_name(type_)}.free(task_data);\n")
+        f.write("\t}\n")
+        f.write("\treturn data;\n")
+        f.write("};\n\n")
+
     def generate_source_function(self) -> None:
         """"""
         filename = f"{self.prefix}_{self.name}_source_function.cpp"
@@ -269,24 +493,51 @@ class ApiGenerator:
                 f.write("{\n")
                 f.write(f"\t{type_} myreq = {type_}();\n")
                 f.write("\tmemset(&myreq, 0, sizeof(myreq));\n")
-
-                struct_fields = self.structs[type_]
-                for struct_field, struct_type in struct_fields.items():
-                    if struct_type == "string":
-                        line = f"\tgetString(req, \"{struct_field}\", myreq.{struct_field});\n"
-                    else:
-                        line = f"\tget{struct_type.capitalize()}(req, \"{struct_field}\", &myreq.{struct_field});\n"
-                    f.write(line)
-
+                f.write("\tif (this->request_mode == REQUEST_MODE_ITEMS)\n")
+                f.write(f"\t\tfillFields(req, {self.get_field_table_name(type_)}, &myreq);\n")
+                f.write("\telse\n")
+                f.write(f"\t\tdictToStruct(req, {self.get_field_table_name(type_)}, &myreq);\n")
+                f.write("\tgil_scoped_release release;\n")
                 f.write(f"\tint i = this->api->{name}(&myreq, reqid);\n")
                 f.write("\treturn i;\n")
                 f.write("};\n\n")
 
+            for type_, template_name in self.templates.items():
+                f.write(f"static void fill{template_name}({template_name} &tmpl, const dict &req)\n")
+                f.write("{\n")
+                f.write(f"\tdictToStruct(req, {self.get_field_table_name(type_)}, &tmpl.req);\n")
+                f.write("};\n\n")
+
+            # 请求函数的参数类型相同，在模块初始化时按表循环绑定
+            f.write(f"static const pair<const char*, int ({self.class_name}::*)(const dict&, int)> REQUEST_FUNCTIONS[] = {{\n")
+            for name in self.functions.keys():
+                req_name = name.replace("Req", "req")
+                f.write(f"\t{{\"{req_name}\", &{self.class_name}::{req_name}}},\n")
+            f.write("};\n\n")
+
+    def get_request_types(self) -> list[str]:
+        """获取全部请求函数和请求模板使用的结构体"""
+        types = []
+        for d in self.functions.values():
+            type_ = list(d.values())[0]
+            if type_ not in types:
+                types.append(type_)
+
+        for type_ in self.templates:
+            if type_ not in types:
+                types.append(type_)
+
+        return types
+
     def generate_source_on(self) -> None:
         """"""
         filename = f"{self.prefix}_{self.name}_source_on.cpp"
         with open(filename, "w") as f:
             for name, d in self.callbacks.items():
+                # 其余回调由processCallback按名称查找Python中的重载函数调用
+                if not self.get_typed_struct(d):
+                    continue
+
                 on_name = name.replace("On", "on")
 
                 args = []
@@ -301,6 +552,9 @@ class ApiGenerator:
                     elif type_ == "CThostFtdcRspInfoField":
                         args.append("const dict &error")
                         bind_args.append("error")
+                    elif type_ in self.typed_structs:
+                        args.append("const object &data")
+                        bind_args.append("data")
                     else:
                         args.append("const dict &data")
                         bind_args.append("data")
@@ -320,26 +574,177 @@ class ApiGenerator:
                 f.write("\t}\n")
                 f.write("};\n\n")
 
+                if self.is_batch_callback(d):
+                    f.write(f"void {on_name}Batch(const list &data) override\n")
+                    f.write("{\n")
+                    f.write("\ttry\n")
+                    f.write("\t{\n")
+                    f.write(f"\t\tPYBIND11_OVERLOAD(void, {self.class_name}, {on_name}Batch, data);\n")
+                    f.write("\t}\n")
+                    f.write("\tcatch (const error_already_set &e)\n")
+                    f.write("\t{\n")
+                    f.write("\t\tcout << e.what() << endl;\n")
+                    f.write("\t}\n")
+                    f.write("};\n\n")
+
+            f.write("void onQueueWatermark(int size) override\n")
+            f.write("{\n")
+            f.write("\ttry\n")
+            f.write("\t{\n")
+            f.write(f"\t\tPYBIND11_OVERLOAD(void, {self.class_name}, onQueueWatermark, size);\n")
+            f.write("\t}\n")
+            f.write("\tcatch (const error_already_set &e)\n")
+            f.write("\t{\n")
+            f.write("\t\tcout << e.what() << endl;\n")
+            f.write("\t}\n")
+            f.write("};\n\n")
+
     def generate_source_module(self) -> None:
-        """"""
+        """生成C++中直接调用的回调函数绑定（请求函数和其余回调在模块初始化时按表循环绑定）"""
         filename = f"{self.prefix}_{self.name}_source_module.cpp"
         with open(filename, "w") as f:
-            for name in self.functions.keys():
-                name = name.replace("Req", "req")
-                f.write(f".def(\"{name}\", &{self.class_name}::{name})\n")
-
-            f.write("\n")
+            for name, d in self.callbacks.items():
+                if not self.get_typed_struct(d):
+                    continue
 
-            for name in self.callbacks.keys():
                 name = name.replace("On", "on")
                 f.write(f".def(\"{name}\", &{self.class_name}::{name})\n")
 
+                if self.is_batch_callback(d):
+                    f.write(f".def(\"{name}Batch\", &{self.class_name}::{name}Batch)\n")
+
+            f.write(f".def(\"onQueueWatermark\", &{self.class_name}::onQueueWatermark)\n")
             f.write(";\n")
 
+    def generate_source_key(self) -> None:
+        """生成预先驻留的字典键"""
+        keys = []
+        for type_ in self.get_pool_types() + self.get_request_types():
+            for struct_field in self.structs[type_]:
+                if struct_field not in keys:
+                    keys.append(struct_field)
+
+        # 回调数据、请求和字段投影的结构体都通过字段描述表转换
+        table_types = []
+        for type_ in self.get_pool_types() + self.get_request_types() + list(self.projections):
+            if type_ not in table_types:
+                table_types.append(type_)
+
+        filename = f"{self.prefix}_{self.name}_source_key.cpp"
+        with open(filename, "w") as f:
+            for key in keys:
+                f.write(f"static PyObject *KEY_{key};\n")
+
+            f.write("\n")
+            f.write("static void initKeys()\n")
+            f.write("{\n")
+            for key in keys:
+                f.write(f"\tKEY_{key} = PyUnicode_InternFromString(\"{key}\");\n")
+            f.write("};\n\n")
+
+            for type_ in table_types:
+                table_name = self.get_field_table_name(type_)
+                f.write(f"static const FieldDesc {table_name}[] = {{\n")
+
+                for struct_field, struct_type in self.structs[type_].items():
+                    f.write(
+                        f"\t{{\"{struct_field}\", &KEY_{struct_field}, offsetof({type_}, {struct_field}), "
+                        f"sizeof({type_}::{struct_field}), {FIELD_TYPES[struct_type]}}},\n"
+                    )
+
+                f.write("};\n\n")
+
+            f.write("static const char *CALLBACK_NAMES[CALLBACK_COUNT] = {\n")
+            for name in self.callbacks:
+                f.write(f"\t\"{name.replace('On', 'on')}\",\n")
+            f.write("};\n\n")
+
+            f.write("static const CallbackDesc CALLBACKS[CALLBACK_COUNT] = {\n")
+            for d in self.callbacks.values():
+                args = self.get_callback_args(d)
+                type_ = self.get_data_type(d)
+                if type_:
+                    table_name = self.get_field_table_name(type_)
+                    f.write(f"\t{{{args}, {table_name}, std::size({table_name}), sizeof({type_})}},\n")
+                else:
+                    f.write(f"\t{{{args}, nullptr, 0, 0}},\n")
+            f.write("};\n\n")
+
+    def get_field_table_name(self, type_: str) -> str:
+        """获取结构体对应的字段描述表名"""
+        return type_.replace("CThostFtdc", "").removesuffix("Field") + "Fields"
+
+    def generate_source_override(self) -> None:
+        """生成检查Python中重载了哪些回调函数的代码"""
+        filename = f"{self.prefix}_{self.name}_source_override.cpp"
+        with open(filename, "w") as f:
+            f.write(f"void {self.class_name}::checkOverrides()\n")
+            f.write("{\n")
+
+            for name, d in self.callbacks.items():
+                on_name = name.replace("On", "on")
+                check = f"bool(get_overload(this, \"{on_name}\"))"
+                if self.is_batch_callback(d):
+                    check += f" || bool(get_overload(this, \"{on_name}Batch\"))"
+                f.write(f"\tthis->overrides[{name.upper()}] = {check};\n")
+
+                member = self.get_aggregation(name)
+                if member:
+                    f.write(f"\tthis->{member}.enable({name.upper()}, bool(get_overload(this, \"{on_name}All\")));\n")
+
+            f.write("};\n\n")
+
+    def generate_source_pool(self) -> None:
+        """"""
+        filename = f"{self.prefix}_{self.name}_source_pool.cpp"
+        with open(filename, "w") as f:
+            f.write(f"dict {self.class_name}::getPoolStats()\n")
+            f.write("{\n")
+            f.write("\tdict d;\n")
+
+            for type_ in self.get_pool_types():
+                pool_name = self.get_pool_name(type_)
+                f.write(f"\tthis->{pool_name}.report(d, \"{pool_name[5:]}\");\n")
+
+            f.write("\treturn d;\n")
+            f.write("};\n\n")
+
+    def generate_source_struct(self) -> None:
+        """生成原生结构体对象的只读绑定"""
+        if not self.typed_structs:
+            return
+
+        filename = f"{self.prefix}_{self.name}_source_struct.cpp"
+        with open(filename, "w") as f:
+            for type_, class_name in self.typed_structs.items():
+                f.write(f"class_<{type_}>(m, \"{class_name}\", module_local())\n")
+
+                struct_fields = self.structs[type_]
+                for struct_field, struct_type in struct_fields.items():
+                    if struct_type in STRING_CONVERTERS:
+                        converter = STRING_CONVERTERS[struct_type]
+                        f.write(
+                            f"\t.def_property_readonly(\"{struct_field}\", [](const {type_} &d) {{ return {converter}(d.{struct_field}); }})\n")
+                    else:
+                        f.write(
+                            f"\t.def_readonly(\"{struct_field}\", &{type_}::{struct_field})\n")
+
+                f.write("\t;\n\n")
+
 
 if __name__ == "__main__":
-    md_generator = ApiGenerator("../include/ctp/ThostFtdcMdApi.h", "ctp", "md", "MdApi")
+    md_generator = ApiGenerator(
+        "../include/ctp/ThostFtdcMdApi.h", "ctp", "md", "MdApi",
+        typed_structs={"CThostFtdcDepthMarketDataField": "DepthMarketData"},
+        projections={"CThostFtdcDepthMarketDataField": "tick_fields"},
+        conflations={"OnRtnDepthMarketData": "InstrumentID"},
+        publishers={"OnRtnDepthMarketData": ["tick_bus", "tick_recorder"]}
+    )
     md_generator.run()
 
-    td_generator = ApiGenerator("../include/ctp/ThostFtdcTraderApi.h", "ctp", "td", "TdApi")
+    td_generator = ApiGenerator(
+        "../include/ctp/ThostFtdcTraderApi.h", "ctp", "td", "TdApi",
+        templates={"CThostFtdcInputOrderField": "OrderTemplate"},
+        aggregations={"OnRspQry": "query_rows"}
+    )
     td_generator.run()
@@ -0,0 +1,110 @@
+""""""
+import importlib
+
+
+# C类型对应的NumPy类型代码
+TYPE_C2NUMPY: dict[str, str] = {
+    "int": "i4",
+    "short": "i2",
+    "double": "f8",
+    "char": "S1",
+}
+
+
+class DtypeGenerator:
+    """NumPy结构化dtype生成器"""
+
+    def __init__(self, typedef_filename: str, struct_filename: str, prefix: str) -> None:
+        """Constructor"""
+        self.typedef_filename: str = typedef_filename
+        self.struct_filename: str = struct_filename
+        self.prefix: str = prefix
+
+        self.typedefs: dict[str, str] = {}
+        self.structs: dict[str, list[tuple[str, str]]] = {}
+        self.current: list[tuple[str, str]] = []
+
+        self.load_struct()
+
+    def load_struct(self) -> None:
+        """加载生成的结构体字段定义，用于校验头文件的解析结果"""
+        module_name = f"{self.prefix}_struct"
+        self.module = importlib.import_module(module_name)
+
+    def run(self) -> None:
+        """运行生成"""
+        with open(self.typedef_filename, encoding="gbk") as f:
+            for line in f:
+                self.process_typedef(line)
+
+        with open(self.struct_filename, encoding="gbk") as f:
+            for line in f:
+                self.process_line(line)
+
+        with open("../dtypes.py", "w") as f:
+            f.write('"""\n')
+            f.write("CTP结构体对应的NumPy结构化dtype（由generator/generate_dtype.py生成）\n\n")
+            f.write("字段顺序、类型和对齐方式与C++头文件中的结构体一致，\n")
+            f.write("可以直接通过np.frombuffer读取原始结构体数据。\n")
+            f.write('"""\n')
+            f.write("import numpy as np\n\n\n")
+
+            blocks = []
+            for name, fields in self.structs.items():
+                lines = [f"{name} = np.dtype(["]
+                for field_name, dtype in fields:
+                    lines.append(f"    (\"{field_name}\", \"{dtype}\"),")
+                lines.append("], align=True)\n")
+                blocks.append("\n".join(lines))
+
+            f.write("\n".join(blocks))
+
+        print("Dtype生成成功")
+
+    def process_typedef(self, line: str) -> None:
+        """处理类型定义，字符数组转换为定长字节串"""
+        line = line.replace(";", "").strip()
+        if not line.startswith("typedef"):
+            return
+
+        words = [word for word in line.split(" ") if word]
+        c_type = words[1]
+        name = words[2]
+
+        if "[" in name:
+            size = name[name.index("[") + 1:name.index("]")]
+            name = name[:name.index("[")]
+            self.typedefs[name] = f"S{size}"
+        else:
+            self.typedefs[name] = TYPE_C2NUMPY[c_type]
+
+    def process_line(self, line: str) -> None:
+        """处理结构体头文件的每行"""
+        line = line.replace(";", "")
+        line = line.replace("\n", "")
+
+        if line.startswith("struct"):
+            self.name = line.split(" ")[1]
+            self.current = []
+        elif line.startswith("}"):
+            self.process_end()
+        elif "\t" in line and "///" not in line:
+            words = [word for word in line.split("\t") if word]
+            self.current.append((words[1], self.typedefs[words[0]]))
+
+    def process_end(self) -> None:
+        """结构体结束时校验字段列表"""
+        fields = [field_name for field_name, _ in self.current]
+        if fields != list(getattr(self.module, self.name)):
+            raise ValueError(f"{self.name}字段与{self.prefix}_struct.py不一致")
+
+        self.structs[self.name] = self.current
+
+
+if __name__ == "__main__":
+    generator = DtypeGenerator(
+        "../include/ctp/ThostFtdcUserApiDataType.h",
+        "../include/ctp/ThostFtdcUserApiStruct.h",
+        "ctp"
+    )
+    generator.run()
@@ -2,6 +2,43 @@
 import importlib
 
 
+# 只会包含ASCII字符的字符串类型（代码、编号、日期时间等），其余字符串类型可能包含中文
+ASCII_TYPES: set[str] = {
+    "TThostFtdcBrokerIDType",
+    "TThostFtdcExchangeIDType",
+    "TThostFtdcInstrumentIDType",
+    "TThostFtdcOldInstrumentIDType",
+    "TThostFtdcExchangeInstIDType",
+    "TThostFtdcOldExchangeInstIDType",
+    "TThostFtdcProductIDType",
+    "TThostFtdcInvestorIDType",
+    "TThostFtdcInvestUnitIDType",
+    "TThostFtdcUserIDType",
+    "TThostFtdcAccountIDType",
+    "TThostFtdcCurrencyIDType",
+    "TThostFtdcParticipantIDType",
+    "TThostFtdcTraderIDType",
+    "TThostFtdcClientIDType",
+    "TThostFtdcOrderRefType",
+    "TThostFtdcOrderLocalIDType",
+    "TThostFtdcOrderSysIDType",
+    "TThostFtdcExecOrderSysIDType",
+    "TThostFtdcTradeIDType",
+    "TThostFtdcParkedOrderIDType",
+    "TThostFtdcParkedOrderActionIDType",
+    "TThostFtdcCombOffsetFlagType",
+    "TThostFtdcCombHedgeFlagType",
+    "TThostFtdcDateType",
+    "TThostFtdcTimeType",
+    "TThostFtdcTradeDateType",
+    "TThostFtdcTradeTimeType",
+    "TThostFtdcDateTimeType",
+    "TThostFtdcIPAddressType",
+    "TThostFtdcOldIPAddressType",
+    "TThostFtdcMacAddressType",
+}
+
+
 class StructGenerator:
     """Struct生成器"""
 
@@ -24,7 +61,7 @@ class StructGenerator:
 
     def run(self) -> None:
         """运行生成"""
-        self.f_cpp = open(self.filename)
+        self.f_cpp = open(self.filename, encoding="gbk")
         self.f_struct = open(f"{self.prefix}_struct.py", "w")
 
         for line in self.f_cpp:
@@ -75,6 +112,9 @@ class StructGenerator:
         py_type = self.typedefs[words[0]]
         name = words[1]
 
+        if py_type == "string" and words[0] in ASCII_TYPES:
+            py_type = "ascii"
+
         new_line = f"    \"{name}\": \"{py_type}\",\n"
         self.f_struct.write(new_line)
 
@@ -1,17 +1,50 @@
 #include <string>
-#include <queue>
+#include <deque>
+#include <functional>
 #include <thread>
 #include <mutex>
 #include <iostream>
 #include <codecvt>
 #include <condition_variable>
 #include <locale>
+#include <stdexcept>
+#include <atomic>
+#include <vector>
+#include <algorithm>
+#include <memory>
+#include <cstring>
+#include <cstdio>
+#include <bitset>
+#include <string_view>
+#include <chrono>
+#include <cmath>
+#include <climits>
+#include <map>
 
 #ifdef __APPLE__
 #include <iconv.h>
 #endif
 
+#ifdef _WIN32
+#include <windows.h>
+#include <io.h>
+#else
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <fcntl.h>
+#include <unistd.h>
+#endif
+
+#ifdef __linux__
+#include <sys/eventfd.h>
+#endif
+
+#ifdef _MSC_VER
+#include <intrin.h>
+#endif
+
 #include "pybind11/pybind11.h"
+#include "vnctp_native.h"
 
 
 using namespace std;
@@ -26,83 +59,2174 @@ struct Task
     void *task_error;	//ָ
     int task_id;		//id
     bool task_last;		//ǷΪ󷵻
+    uint64_t task_time;	//еʱ䣨룬ڿӳͳʱ¼
+};
+
+class TerminatedError : std::exception
+{};
+
+//ϲ֪ͨ߳ȡϲд͵ݣ
+#define TASK_CONFLATED -1
+
+//ܲѯtask_dataΪյbIsLastʱɵQueryRows
+#define TASK_AGGREGATED -2
+
+//ܲѯ͸ʽ
+#define QUERY_FORMAT_DICT 0			//ֵбĬϣ
+#define QUERY_FORMAT_COLUMNS 1		//ֶеݣQueryColumns
+
+//ܲѯʽתΪӦĳ
+inline int getQueryFormat(const string &format)
+{
+    if (format == "dict")
+        return QUERY_FORMAT_DICT;
+    else if (format == "columns")
+        return QUERY_FORMAT_COLUMNS;
+
+    throw invalid_argument("unknown query format: " + format);
+};
+
+
+//ģʽ
+#define DATA_MODE_DICT 0			//ֵ䣨Ĭϣ
+#define DATA_MODE_OBJECT 1			//ԭṹֻԷʣ
+#define DATA_MODE_RAW 2				//ԭʼṹֽڣpyctp_api.api.dtypesʹã
+
+//ģʽתΪӦĳ
+inline int getDataMode(const string &mode)
+{
+    if (mode == "dict")
+        return DATA_MODE_DICT;
+    else if (mode == "object")
+        return DATA_MODE_OBJECT;
+    else if (mode == "raw")
+        return DATA_MODE_RAW;
+
+    throw invalid_argument("unknown data mode: " + mode);
+};
+
+//
+#define QUEUE_MUTEX 0				//УĬϣ
+#define QUEUE_SPSC 1				//ߵζ
+
+//תΪӦĳ
+inline int getQueueType(const string &type)
+{
+    if (type == "mutex")
+        return QUEUE_MUTEX;
+    else if (type == "spsc")
+        return QUEUE_SPSC;
+
+    throw invalid_argument("unknown queue type: " + type);
+};
+
+//ͷʽ
+#define DISPATCH_THREAD 0			//ڲ̣߳Ĭϣ
+#define DISPATCH_POLL 1				//Ӧópoll
+
+//ͷʽתΪӦĳ
+inline int getDispatchMode(const string &mode)
+{
+    if (mode == "thread")
+        return DISPATCH_THREAD;
+    else if (mode == "poll")
+        return DISPATCH_POLL;
+
+    throw invalid_argument("unknown dispatch mode: " + mode);
+};
+
+//ʱӵĵǰʱ䣨룩
+inline uint64_t nowNs()
+{
+    return (uint64_t)chrono::duration_cast<chrono::nanoseconds>(chrono::steady_clock::now().time_since_epoch()).count();
+};
+
+//0Ķλ
+inline int bitLength(uint64_t value)
+{
+#if defined(_MSC_VER)
+    unsigned long index;
+    _BitScanReverse64(&index, value);
+    return (int)index + 1;
+#else
+    return 64 - __builtin_clzll(value);
+#endif
+};
+
+//дﵽʱĴ
+#define POLICY_BLOCK 0				//CTPصֱ̣߳пλ
+#define POLICY_DROP_OLDEST 1		//һ
+#define POLICY_DROP_NEWEST 2		//µ
+#define POLICY_CONFLATE 3			//Լϲ
+
+//תΪӦĳ
+inline int getQueuePolicy(const string &policy)
+{
+    if (policy == "block")
+        return POLICY_BLOCK;
+    else if (policy == "drop_oldest")
+        return POLICY_DROP_OLDEST;
+    else if (policy == "drop_newest")
+        return POLICY_DROP_NEWEST;
+    else if (policy == "conflate")
+        return POLICY_CONFLATE;
+
+    throw invalid_argument("unknown queue policy: " + policy);
+};
+
+//ȴʱóCPUˮ
+inline void cpuRelax()
+{
+#if defined(_MSC_VER)
+    _mm_pause();
+#elif defined(__x86_64__) || defined(__i386__)
+    __builtin_ia32_pause();
+#else
+    this_thread::yield();
+#endif
+};
+
+//дʱΪɶļڽselect/epoll¼ѭ
+//LinuxʹeventfdPOSIXϵͳʹ÷ܵ
+class EventNotifier
+{
+private:
+    atomic<int> read_fd_{ -1 };			//ɶʱʾд
+    int write_fd_ = -1;					//eventfdʱread_fd_ͬ
+    atomic<bool> signaled_{ false };	//ǷѾд֪ͨÿ񶼵write
+    mutex mutex_;
+
+public:
+    ~EventNotifier()
+    {
+        this->close();
+    }
+
+    //ȡļ״εʱ
+    int open()
+    {
+        lock_guard<mutex> mlock(mutex_);
+
+        int fd = read_fd_.load(memory_order_acquire);
+        if (fd >= 0)
+            return fd;
+
+#if defined(__linux__)
+        fd = ::eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+        if (fd < 0)
+            throw runtime_error("failed to create eventfd");
+        write_fd_ = fd;
+#elif defined(_WIN32)
+        throw runtime_error("event file descriptor is not supported on Windows");
+#else
+        int fds[2];
+        if (::pipe(fds) != 0)
+            throw runtime_error("failed to create event pipe");
+
+        for (int i = 0; i < 2; i++)
+        {
+            ::fcntl(fds[i], F_SETFL, ::fcntl(fds[i], F_GETFL) | O_NONBLOCK);
+            ::fcntl(fds[i], F_SETFD, FD_CLOEXEC);
+        }
+        fd = fds[0];
+        write_fd_ = fds[1];
+#endif
+
+        signaled_.store(false, memory_order_relaxed);
+        read_fd_.store(fd, memory_order_release);
+        return fd;
+    }
+
+    void close()
+    {
+#ifndef _WIN32
+        lock_guard<mutex> mlock(mutex_);
+
+        int fd = read_fd_.exchange(-1);
+        if (fd < 0)
+            return;
+
+        if (write_fd_ != fd)
+            ::close(write_fd_);
+        ::close(fd);
+        write_fd_ = -1;
+#endif
+    }
+
+    bool opened()
+    {
+        return read_fd_.load(memory_order_relaxed) >= 0;
+    }
+
+    //֪ͨѾڿɶ״̬ʱд
+    void notify()
+    {
+#ifndef _WIN32
+        if (!this->opened() || signaled_.exchange(true))
+            return;
+
+        uint64_t value = 1;
+        ssize_t n = ::write(write_fd_, &value, write_fd_ == read_fd_.load(memory_order_relaxed) ? sizeof(value) : 1);
+        (void)n;
+#endif
+    }
+
+    //ȫָ֪ͨΪɶ״̬
+    void clear()
+    {
+#ifndef _WIN32
+        int fd = read_fd_.load(memory_order_relaxed);
+        if (fd < 0)
+            return;
+
+        char buffer[64];
+        while (::read(fd, buffer, sizeof(buffer)) > 0)
+        {
+        }
+        signaled_.store(false, memory_order_seq_cst);
+#endif
+    }
+};
+
+class TaskQueue
+{
+private:
+    deque<Task> queue_;						//׼УģʽԼζʱУ
+    mutex mutex_;							//
+    condition_variable cond_;				//
+
+    atomic<bool> _terminate{ false };
+
+    //ζУCTPص߳д롢̶߳ȡ
+    int type_ = QUEUE_MUTEX;
+    vector<Task> ring_;						//λ
+    size_t mask_ = 0;						//루Ϊ2ݣ
+    alignas(64) atomic<size_t> head_{ 0 };	//ȡλã޸
+    alignas(64) atomic<size_t> tail_{ 0 };	//дλã޸
+    atomic<size_t> overflow_size_{ 0 };		//е
+    atomic<bool> sleeping_{ false };		//Ƿѹȴ
+    int spin_ = 0;							//ǰ
+    int spin_limit_ = 0;					//ǰӦ
+
+    atomic<uint64_t> full_count_{ 0 };		//дʱζĴ
+    atomic<uint64_t> overflow_count_{ 0 };	//де
+
+    atomic<bool> timing_{ false };			//Ƿ¼еʱ
+
+    //ޣԻζж԰е
+    atomic<size_t> limit_{ 0 };				//ޣ0Ϊ
+    atomic<int> policy_{ POLICY_BLOCK };	//ﵽʱĴ
+    int droppable_ = 0;						//Զϲͣ񲻻ᱻ
+    std::function<void(const Task&)> release_;	//ͷű
+    condition_variable not_full_;			//µȴгֿλ
+    atomic<bool> blocking_{ false };		//Ƿڵȴλζе߾ݴ˾Ƿ֪ͨ
+    bool overloaded_ = false;				//ϲǷڹ״̬߷ʣ
+
+    atomic<size_t> watermark_{ 0 };			//ѹˮλ0Ϊ
+    bool alerted_ = false;					//ǷѾ֪ͨѹ߷ʣ
+
+    EventNotifier notifier_;				//дʱɶļpollģʽʹã
+
+    atomic<uint64_t> blocked_count_{ 0 };		//߱Ĵ
+    atomic<uint64_t> drop_oldest_count_{ 0 };	//
+    atomic<uint64_t> drop_newest_count_{ 0 };	//
+    atomic<uint64_t> overload_count_{ 0 };		//ϲ״̬Ĵ
+    atomic<uint64_t> watermark_count_{ 0 };		//ѹﵽˮλĴ
+
+    //еģʽҪڳʱã
+    size_t sizeLocked()
+    {
+        if (type_ == QUEUE_SPSC)
+        {
+            return tail_.load(memory_order_acquire) - head_.load(memory_order_acquire)
+                + overflow_size_.load(memory_order_acquire);
+        }
+        return queue_.size();
+    }
+
+    size_t size()
+    {
+        if (type_ == QUEUE_SPSC)
+            return this->sizeLocked();
+
+        lock_guard<mutex> mlock(mutex_);
+        return this->sizeLocked();
+    }
+
+    //һ飬ǷҵֻڻУζвָ֧òԣsetLimit
+    bool dropOldest()
+    {
+        if (!release_)
+            return false;
+
+        lock_guard<mutex> mlock(mutex_);
+        for (auto it = queue_.begin(); it != queue_.end(); ++it)
+        {
+            if (it->task_name != droppable_)
+                continue;
+
+            release_(*it);
+            queue_.erase(it);
+
+            drop_oldest_count_.fetch_add(1, memory_order_relaxed);
+            return true;
+        }
+        return false;
+    }
+
+    //дﵽʱԴ񣬷ǷҪд
+    bool admit(const Task &task, size_t limit)
+    {
+        if (this->size() < limit)
+            return true;
+
+        int policy = policy_.load(memory_order_relaxed);
+        if (policy == POLICY_BLOCK)
+        {
+            blocked_count_.fetch_add(1, memory_order_relaxed);
+
+            //ȴȡ֪ͨ޻Ա޸Լֹʱͬᱻ
+            unique_lock<mutex> mlock(mutex_);
+            blocking_.store(true, memory_order_relaxed);
+            atomic_thread_fence(memory_order_seq_cst);
+            not_full_.wait(mlock, [&]() {
+                size_t current = limit_.load(memory_order_relaxed);
+                return _terminate || !current || policy_.load(memory_order_relaxed) != POLICY_BLOCK
+                    || this->sizeLocked() < current;
+            });
+            blocking_.store(false, memory_order_relaxed);
+            return true;
+        }
+
+        //񣨰ίкͳɽرҲдУδÿɶʱκ
+        if (!release_ || task.task_name != droppable_)
+            return true;
+
+        if (policy == POLICY_DROP_OLDEST && this->dropOldest())
+            return true;
+
+        if (policy == POLICY_DROP_OLDEST || policy == POLICY_DROP_NEWEST)
+        {
+            release_(task);
+            drop_newest_count_.fetch_add(1, memory_order_relaxed);
+            return false;
+        }
+
+        //ϲдǰѾתϲoverloaded
+        return true;
+    }
+
+    //֪ͨȴ
+    //ڳʱãζȡʱڵȴʱҪ֪ͨⶪʧ֪ͨ
+    void notifyNotFull()
+    {
+        if (!limit_.load(memory_order_relaxed) || policy_.load(memory_order_relaxed) != POLICY_BLOCK)
+            return;
+
+        if (type_ != QUEUE_SPSC)
+        {
+            not_full_.notify_one();
+            return;
+        }
+
+        atomic_thread_fence(memory_order_seq_cst);
+        if (blocking_.load(memory_order_relaxed))
+        {
+            lock_guard<mutex> mlock(mutex_);
+            not_full_.notify_one();
+        }
+    }
+
+    //ζǷпɶȡ
+    bool ready()
+    {
+        return head_.load(memory_order_relaxed) != tail_.load(memory_order_acquire)
+            || overflow_size_.load(memory_order_acquire) > 0;
+    }
+
+    void pushRing(const Task &task)
+    {
+        size_t tail = tail_.load(memory_order_relaxed);
+        bool full = (tail - head_.load(memory_order_acquire)) > mask_;
+
+        //зǿʱдУ֤˳
+        if (!full && overflow_size_.load(memory_order_acquire) == 0)
+        {
+            ring_[tail & mask_] = task;
+            tail_.store(tail + 1, memory_order_release);
+        }
+        else
+        {
+            if (full)
+                full_count_.fetch_add(1, memory_order_relaxed);
+            overflow_count_.fetch_add(1, memory_order_relaxed);
+
+            lock_guard<mutex> mlock(mutex_);
+            queue_.push_back(task);
+            overflow_size_.fetch_add(1, memory_order_release);
+        }
+
+        //ѹʱҪ֪ͨ
+        atomic_thread_fence(memory_order_seq_cst);
+        if (sleeping_.load(memory_order_relaxed))
+        {
+            lock_guard<mutex> mlock(mutex_);
+            cond_.notify_one();
+        }
+
+        notifier_.notify();
+    }
+
+    bool tryPopRing(Task &task)
+    {
+        size_t head = head_.load(memory_order_relaxed);
+        if (head != tail_.load(memory_order_acquire))
+        {
+            task = ring_[head & mask_];
+            head_.store(head + 1, memory_order_release);
+            return true;
+        }
+
+        if (overflow_size_.load(memory_order_acquire) > 0)
+        {
+            //еѱ߶Ҫڳʱٴμ
+            lock_guard<mutex> mlock(mutex_);
+            if (!queue_.empty())
+            {
+                task = queue_.front();
+                queue_.pop_front();
+                overflow_size_.fetch_sub(1, memory_order_release);
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    Task popRing()
+    {
+        Task task;
+        int spins = 0;
+
+        while (true)
+        {
+            if (this->tryPopRing(task))
+            {
+                //ڼȵ𲽻ָ
+                if (spins > 0 && spin_limit_ < spin_)
+                    spin_limit_ = min(spin_, spin_limit_ * 2 + 1);
+                return task;
+            }
+
+            if (_terminate)
+                throw TerminatedError();
+
+            if (spins < spin_limit_)
+            {
+                spins++;
+                cpuRelax();
+                continue;
+            }
+
+            //δȵ񣬼´ε
+            spin_limit_ /= 2;
+            spins = 0;
+
+            unique_lock<mutex> mlock(mutex_);
+            sleeping_.store(true, memory_order_relaxed);
+            atomic_thread_fence(memory_order_seq_cst);
+            cond_.wait(mlock, [&]() {
+                return this->ready() || _terminate;
+            });
+            sleeping_.store(false, memory_order_relaxed);
+        }
+    }
+
+public:
+
+    //ö͡ζԼ߳ǰ
+    void setup(int type, int capacity, int spin)
+    {
+        if (capacity <= 0 || spin < 0)
+            throw invalid_argument("queue capacity must be positive and spin must not be negative");
+
+        type_ = type;
+        spin_ = spin;
+        spin_limit_ = spin;
+
+        if (type_ == QUEUE_SPSC)
+        {
+            size_t size = 1;
+            while (size < (size_t)capacity)
+                size <<= 1;
+
+            ring_.resize(size);
+            mask_ = size - 1;
+        }
+    }
+
+    //رʱļ¼
+    void setTiming(bool enabled)
+    {
+        timing_.store(enabled, memory_order_release);
+    }
+
+    //ÿԶϲԼͷűݵĺ
+    void setDroppable(int task_name, std::function<void(const Task&)> release)
+    {
+        droppable_ = task_name;
+        release_ = release;
+    }
+
+    //ޡﵽʱĴԼѹˮλ
+    void setLimit(int limit, int policy, int watermark)
+    {
+        if (limit < 0 || watermark < 0)
+            throw invalid_argument("queue limit and watermark must not be negative");
+
+        //ζ߳ȡ޷Ƴ
+        if (type_ == QUEUE_SPSC && policy == POLICY_DROP_OLDEST)
+            throw invalid_argument("drop_oldest policy is not supported by the spsc queue, use drop_newest or conflate");
+
+        lock_guard<mutex> mlock(mutex_);
+        policy_.store(policy, memory_order_relaxed);
+        watermark_.store(watermark, memory_order_relaxed);
+        limit_.store(limit, memory_order_relaxed);
+        not_full_.notify_all();
+    }
+
+    //ϲ¶Ƿڹ״̬ﵽ޺ʼϲ޵һʱָߵã
+    bool overloaded()
+    {
+        size_t limit = limit_.load(memory_order_relaxed);
+        if (!limit || policy_.load(memory_order_relaxed) != POLICY_CONFLATE)
+        {
+            overloaded_ = false;
+            return false;
+        }
+
+        size_t size = this->size();
+        if (!overloaded_ && size >= limit)
+        {
+            overloaded_ = true;
+            overload_count_.fetch_add(1, memory_order_relaxed);
+        }
+        else if (overloaded_ && size < limit / 2)
+        {
+            overloaded_ = false;
+        }
+        return overloaded_;
+    }
+
+    //ѹǷﵽˮλﵽʱֻһtrueˮλһº¼飨ߵã
+    bool checkWatermark(size_t &size)
+    {
+        size_t watermark = watermark_.load(memory_order_relaxed);
+        if (!watermark)
+            return false;
+
+        size = this->size();
+        if (!alerted_ && size >= watermark)
+        {
+            alerted_ = true;
+            watermark_count_.fetch_add(1, memory_order_relaxed);
+            return true;
+        }
+        if (alerted_ && size < watermark / 2)
+            alerted_ = false;
+        return false;
+    }
+
+    //µ
+    void push(Task task)
+    {
+        if (timing_.load(memory_order_acquire))
+            task.task_time = nowNs();
+
+        size_t limit = limit_.load(memory_order_relaxed);
+        if (limit && !this->admit(task, limit))
+            return;
+
+        if (type_ == QUEUE_SPSC)
+        {
+            this->pushRing(task);
+            return;
+        }
+
+        unique_lock<mutex > mlock(mutex_);
+        queue_.push_back(task);				//д
+        mlock.unlock();						//ͷ
+        cond_.notify_one();					//֪ͨȴ߳
+        notifier_.notify();
+    }
+
+    //ȡϵ
+    Task pop()
+    {
+        if (type_ == QUEUE_SPSC)
+            return this->popRing();
+
+        unique_lock<mutex> mlock(mutex_);
+        cond_.wait(mlock, [&]() {
+            return !queue_.empty() || _terminate;
+        });				//ȴ֪ͨ
+        if (_terminate)
+            throw TerminatedError();
+        Task task = queue_.front();			//ȡеһ
+        queue_.pop_front();					//ɾ
+        this->notifyNotFull();
+        return task;						//ظ
+    }
+
+    //ȡȴһ֮ȡѾmax-1
+    size_t popBatch(vector<Task> &tasks, size_t max)
+    {
+        tasks.clear();
+
+        if (type_ == QUEUE_SPSC)
+        {
+            tasks.push_back(this->popRing());
+
+            Task task;
+            while (tasks.size() < max && this->tryPopRing(task))
+                tasks.push_back(task);
+
+            this->notifyNotFull();
+            return tasks.size();
+        }
+
+        unique_lock<mutex> mlock(mutex_);
+        cond_.wait(mlock, [&]() {
+            return !queue_.empty() || _terminate;
+        });
+        if (_terminate)
+            throw TerminatedError();
+
+        while (!queue_.empty() && tasks.size() < max)
+        {
+            tasks.push_back(queue_.front());
+            queue_.pop_front();
+        }
+
+        this->notifyNotFull();
+        return tasks.size();
+    }
+
+    //ȡȴtimeout_us΢루С0ʱһֱȴʱֹʱ0pollģʽʹã
+    size_t pollBatch(vector<Task> &tasks, size_t max, int64_t timeout_us)
+    {
+        tasks.clear();
+
+        auto ready = [&]() {
+            return (type_ == QUEUE_SPSC ? this->ready() : !queue_.empty()) || _terminate;
+        };
+
+        if (timeout_us != 0 && !_terminate)
+        {
+            unique_lock<mutex> mlock(mutex_);
+            sleeping_.store(true, memory_order_relaxed);
+            atomic_thread_fence(memory_order_seq_cst);
+
+            if (timeout_us < 0)
+                cond_.wait(mlock, ready);
+            else
+                cond_.wait_for(mlock, chrono::microseconds(timeout_us), ready);
+
+            sleeping_.store(false, memory_order_relaxed);
+        }
+
+        if (_terminate)
+            return 0;
+
+        if (type_ == QUEUE_SPSC)
+        {
+            Task task;
+            while (tasks.size() < max && this->tryPopRing(task))
+                tasks.push_back(task);
+        }
+        else
+        {
+            lock_guard<mutex> mlock(mutex_);
+            while (!queue_.empty() && tasks.size() < max)
+            {
+                tasks.push_back(queue_.front());
+                queue_.pop_front();
+            }
+        }
+
+        if (!tasks.empty())
+            this->notifyNotFull();
+        return tasks.size();
+    }
+
+    //ȡдʱɶļ
+    int fileno()
+    {
+        int fd = notifier_.open();
+
+        //֮ǰѾе
+        if (this->size())
+            notifier_.notify();
+        return fd;
+    }
+
+    //ȡʱļָΪɶڼд֪ͨߵã
+    void rearm()
+    {
+        if (!notifier_.opened() || this->size())
+            return;
+
+        notifier_.clear();
+        atomic_thread_fence(memory_order_seq_cst);
+        if (this->size())
+            notifier_.notify();
+    }
+
+    void terminate()
+    {
+        unique_lock<mutex> mlock(mutex_);
+        _terminate = true;
+        mlock.unlock();
+        cond_.notify_all();					//֪ͨȴ߳
+        not_full_.notify_all();
+    }
+
+    //ȡͳϢ
+    dict stats()
+    {
+        dict d;
+        d["type"] = type_ == QUEUE_SPSC ? "spsc" : "mutex";
+        d["capacity"] = type_ == QUEUE_SPSC ? mask_ + 1 : 0;
+
+        size_t size = overflow_size_.load();
+        if (type_ == QUEUE_SPSC)
+        {
+            size += tail_.load() - head_.load();
+        }
+        else
+        {
+            lock_guard<mutex> mlock(mutex_);
+            size = queue_.size();
+        }
+        d["size"] = size;
+
+        d["full"] = full_count_.load();
+        d["overflow"] = overflow_count_.load();
+
+        static const char *policies[] = { "block", "drop_oldest", "drop_newest", "conflate" };
+        d["limit"] = limit_.load();
+        d["policy"] = policies[policy_.load()];
+        d["watermark"] = watermark_.load();
+        d["blocked"] = blocked_count_.load();
+        d["dropped_oldest"] = drop_oldest_count_.load();
+        d["dropped_newest"] = drop_newest_count_.load();
+        d["overloaded"] = overload_count_.load();
+        d["watermark_alerts"] = watermark_count_.load();
+        return d;
+    }
+};
+
+
+//ڴصͽӿڣ̰߳صŲ黹ʱʹ
+class TaskPoolBase
+{
+public:
+    virtual ~TaskPoolBase() = default;
+
+    virtual void *acquire(const void *value) = 0;
+
+    virtual void release(void *data) = 0;
+};
+
+
+//صڴأÿAPIÿֽṹһ
+//CTPص̷߳䣬߳ͷź黹߳ڱʱһȡ
+template <typename T>
+class TaskPool : public TaskPoolBase
+{
+private:
+    struct Node
+    {
+        T data;								//ΪһԱڴָ뻹ԭڵ
+        Node *next;
+    };
+
+    Node *local_ = nullptr;					//̶߳ռĿ
+    atomic<Node*> returned_{ nullptr };		//ѹ黹Ŀ
+    vector<unique_ptr<Node[]>> blocks_;		//ڴ
+
+    atomic<size_t> capacity_{ 0 };			//ڴؽڵ
+    atomic<uint64_t> alloc_count_{ 0 };		//ۼƷ
+    atomic<uint64_t> free_count_{ 0 };		//ۼƹ黹
+
+    //µڴ飬С
+    Node *grow()
+    {
+        size_t size = min<size_t>(max<size_t>(capacity_.load(memory_order_relaxed), 16), 4096);
+
+        Node *block = new Node[size];
+        for (size_t i = 0; i + 1 < size; i++)
+            block[i].next = &block[i + 1];
+        block[size - 1].next = nullptr;
+
+        blocks_.emplace_back(block);
+        capacity_.fetch_add(size, memory_order_relaxed);
+        return block;
+    }
+
+public:
+    TaskPool() = default;
+    TaskPool(const TaskPool &) = delete;
+    TaskPool &operator=(const TaskPool &) = delete;
+
+    //ڵ㲢ƻص
+    T *alloc(const T &value)
+    {
+        Node *node = local_;
+        if (!node)
+        {
+            node = returned_.exchange(nullptr, memory_order_acquire);
+            if (!node)
+                node = this->grow();
+        }
+        local_ = node->next;
+
+        node->data = value;
+        alloc_count_.store(alloc_count_.load(memory_order_relaxed) + 1, memory_order_relaxed);
+        return &node->data;
+    }
+
+    //黹ڵ
+    void free(T *data)
+    {
+        Node *node = reinterpret_cast<Node*>(data);
+        Node *head = returned_.load(memory_order_relaxed);
+        do
+        {
+            node->next = head;
+        } while (!returned_.compare_exchange_weak(head, node, memory_order_release, memory_order_relaxed));
+
+        free_count_.fetch_add(1, memory_order_relaxed);
+    }
+
+    void *acquire(const void *value) override
+    {
+        return this->alloc(*(const T*)value);
+    }
+
+    void release(void *data) override
+    {
+        this->free((T*)data);
+    }
+
+    //ڴѱʹʱͳϢдֵ
+    void report(dict &d, const char *name)
+    {
+        size_t capacity = capacity_.load();
+        if (!capacity)
+            return;
+
+        uint64_t frees = free_count_.load();
+        uint64_t allocs = alloc_count_.load();
+
+        dict stats;
+        stats["capacity"] = capacity;
+        stats["in_use"] = allocs - frees;
+        stats["allocs"] = allocs;
+        stats["frees"] = frees;
+        d[name] = stats;
+    }
+};
+
+
+//HDRӳֱͼ룩2ݷֶΣÿϸΪ16Ͱ1/16
+//ֻ߳д룬Python߳̿ʱȡ
+class LatencyHistogram
+{
+private:
+    static const int SUB_BITS = 4;
+    static const int SUB_COUNT = 1 << SUB_BITS;
+    static const int MAX_BITS = 40;			//2^40루Լ18ӣֵһͰ
+    static const int BUCKET_COUNT = (MAX_BITS - SUB_BITS + 1) * SUB_COUNT;
+
+    atomic<uint64_t> counts_[BUCKET_COUNT] = {};
+    atomic<uint64_t> total_{ 0 };
+    atomic<uint64_t> sum_{ 0 };
+    atomic<uint64_t> min_{ UINT64_MAX };
+    atomic<uint64_t> max_{ 0 };
+
+    //ֵӦͰ
+    static int index(uint64_t value)
+    {
+        value = min<uint64_t>(value, (1ULL << MAX_BITS) - 1);
+        if (value < SUB_COUNT)
+            return (int)value;
+
+        int shift = bitLength(value) - SUB_BITS - 1;
+        return (shift << SUB_BITS) + (int)(value >> shift);
+    }
+
+    //Ͱڵֵ
+    static uint64_t value(int index)
+    {
+        if (index < 2 * SUB_COUNT)
+            return index;
+
+        int shift = (index >> SUB_BITS) - 1;
+        uint64_t low = (uint64_t)((index & (SUB_COUNT - 1)) + SUB_COUNT) << shift;
+        return low + (1ULL << shift) - 1;
+    }
+
+public:
+    void record(uint64_t value)
+    {
+        counts_[index(value)].fetch_add(1, memory_order_relaxed);
+        total_.fetch_add(1, memory_order_relaxed);
+        sum_.fetch_add(value, memory_order_relaxed);
+
+        if (value < min_.load(memory_order_relaxed))
+            min_.store(value, memory_order_relaxed);
+        if (value > max_.load(memory_order_relaxed))
+            max_.store(value, memory_order_relaxed);
+    }
+
+    uint64_t count()
+    {
+        return total_.load(memory_order_relaxed);
+    }
+
+    void reset()
+    {
+        for (atomic<uint64_t> &count : counts_)
+            count.store(0, memory_order_relaxed);
+        total_.store(0, memory_order_relaxed);
+        sum_.store(0, memory_order_relaxed);
+        min_.store(UINT64_MAX, memory_order_relaxed);
+        max_.store(0, memory_order_relaxed);
+    }
+
+    //ȡСֵֵƽֵԼλ
+    dict report()
+    {
+        dict d;
+        uint64_t total = total_.load(memory_order_relaxed);
+        d["count"] = total;
+        if (!total)
+            return d;
+
+        uint64_t max_value = max_.load(memory_order_relaxed);
+        d["min"] = min_.load(memory_order_relaxed);
+        d["max"] = max_value;
+        d["mean"] = (double)sum_.load(memory_order_relaxed) / total;
+
+        static const char *names[] = { "p50", "p90", "p99", "p999" };
+        static const double quantiles[] = { 0.5, 0.9, 0.99, 0.999 };
+
+        uint64_t seen = 0;
+        int n = 0;
+        for (int i = 0; i < BUCKET_COUNT && n < 4; i++)
+        {
+            seen += counts_[i].load(memory_order_relaxed);
+            while (n < 4 && seen >= max<uint64_t>(1, (uint64_t)ceil(quantiles[n] * total)))
+            {
+                d[names[n]] = min(value(i), max_value);
+                n++;
+            }
+        }
+        return d;
+    }
+};
+
+
+//ÿֻصŶӺʱеʼͣͻصʱPythonصִʱ䣩ֱͼ
+class LatencyStats
+{
+private:
+    unique_ptr<LatencyHistogram[]> wait_;
+    unique_ptr<LatencyHistogram[]> call_;
+    size_t count_ = 0;
+
+public:
+    //ֱͼֻڵһοͳʱִ
+    void setup(size_t count)
+    {
+        if (wait_)
+            return;
+
+        wait_.reset(new LatencyHistogram[count]);
+        call_.reset(new LatencyHistogram[count]);
+        count_ = count;
+    }
+
+    void recordWait(int name, uint64_t value)
+    {
+        wait_[name].record(value);
+    }
+
+    void recordCall(int name, uint64_t value)
+    {
+        call_[name].record(value);
+    }
+
+    void reset()
+    {
+        for (size_t i = 0; i < count_; i++)
+        {
+            wait_[i].reset();
+            call_[i].reset();
+        }
+    }
+
+    //ȡм¼ĻصͳϢnamesΪص
+    dict stats(const char *const names[], bool reset)
+    {
+        dict d;
+        for (size_t i = 0; i < count_; i++)
+        {
+            if (!wait_[i].count() && !call_[i].count())
+                continue;
+
+            dict stats;
+            stats["wait"] = wait_[i].report();
+            stats["call"] = call_[i].report();
+            d[names[i]] = stats;
+        }
+
+        if (reset)
+            this->reset();
+        return d;
+    }
+};
+
+
+//¼һ͵ŶӺʱ뿪ʱ¼صʱûнʱʱκβ
+class LatencyTimer
+{
+private:
+    LatencyStats &stats_;
+    const Task &task_;
+    int name_;
+    uint64_t start_;
+
+public:
+    LatencyTimer(LatencyStats &stats, const Task &task, int name) : stats_(stats), task_(task), name_(name)
+    {
+        start_ = task.task_time ? nowNs() : 0;
+        if (start_)
+            stats_.recordWait(name_, start_ - task.task_time);
+    }
+
+    //¼ϲͬһеŶӺʱ
+    void merge(const Task &task)
+    {
+        if (start_ && &task != &task_ && task.task_time)
+            stats_.recordWait(name_, start_ - task.task_time);
+    }
+
+    ~LatencyTimer()
+    {
+        if (start_)
+            stats_.recordCall(name_, nowNs() - start_);
+    }
+};
+
+
+//ԭصĵ߳
+#define NATIVE_THREAD_DISPATCH 0	//̣߳ĬϣڻȡGIL֮ǰã
+#define NATIVE_THREAD_SPI 1			//CTPص̣߳ݽ֮ǰã
+
+//ԭص߳תΪӦĳ
+inline int getNativeThread(const string &thread)
+{
+    if (thread == "dispatch")
+        return NATIVE_THREAD_DISPATCH;
+    else if (thread == "spi")
+        return NATIVE_THREAD_SPI;
+
+    throw invalid_argument("unknown native callback thread: " + thread);
+};
+
+
+//ͨPyCapsuleעԭصʱGIL
+//עϢһ޸ģ滻ʱµעϢɵıAPI߳ʹ
+class NativeHook
+{
+private:
+    struct Entry
+    {
+        PyctpNativeCallback func = nullptr;
+        void *user = nullptr;
+        int thread = NATIVE_THREAD_DISPATCH;
+        vector<char> enabled;				//صűǷԭص
+        PyObject *capsule = nullptr;		//PyCapsuleչģ飩
+
+        Entry() = default;
+        Entry(const Entry &) = delete;
+        Entry &operator=(const Entry &) = delete;
+
+        //MdApi/TdApiͷţʱGIL
+        ~Entry()
+        {
+            Py_XDECREF(capsule);
+        }
+    };
+
+    atomic<const Entry*> entry_{ nullptr };
+    vector<unique_ptr<Entry>> entries_;
+
+public:
+    //עԭصcallbacksΪʱȫصЧcapsuleΪNoneʱȡע
+    void set(const object &capsule, const list &callbacks, const char *const *names, size_t count, int thread)
+    {
+        if (capsule.is_none())
+        {
+            entry_.store(nullptr, memory_order_release);
+            return;
+        }
+
+        if (!PyCapsule_IsValid(capsule.ptr(), PYCTP_NATIVE_CAPSULE))
+            throw invalid_argument("native callback must be a PyCapsule named " PYCTP_NATIVE_CAPSULE);
+
+        unique_ptr<Entry> entry(new Entry());
+        entry->func = (PyctpNativeCallback)PyCapsule_GetPointer(capsule.ptr(), PYCTP_NATIVE_CAPSULE);
+        entry->user = PyCapsule_GetContext(capsule.ptr());
+        entry->thread = thread;
+        entry->enabled.assign(count, callbacks.empty());
+        entry->capsule = capsule.ptr();
+        Py_INCREF(entry->capsule);
+
+        for (handle o : callbacks)
+        {
+            string name = o.cast<string>();
+            size_t i = find_if(names, names + count, [&](const char *n) { return name == n; }) - names;
+            if (i == count)
+                throw invalid_argument("unknown callback: " + name);
+            entry->enabled[i] = 1;
+        }
+
+        entry_.store(entry.get(), memory_order_release);
+        entries_.push_back(move(entry));
+    }
+
+    //صǷҪ߳еԭص
+    bool dispatches(int callback) const
+    {
+        const Entry *entry = entry_.load(memory_order_acquire);
+        return entry && entry->thread == NATIVE_THREAD_DISPATCH && entry->enabled[callback];
+    }
+
+    //CTPص߳е
+    void callSpi(int callback, const void *data, const void *error, int reqid, bool last) const
+    {
+        const Entry *entry = entry_.load(memory_order_acquire);
+        if (entry && entry->thread == NATIVE_THREAD_SPI && entry->enabled[callback])
+            entry->func(entry->user, callback, data, error, reqid, last);
+    }
+
+    //߳жȡһã÷GIL
+    void dispatch(const vector<Task> &tasks) const
+    {
+        const Entry *entry = entry_.load(memory_order_acquire);
+        if (!entry || entry->thread != NATIVE_THREAD_DISPATCH)
+            return;
+
+        for (const Task &task : tasks)
+        {
+            if (task.task_name >= 0 && entry->enabled[task.task_name])
+                entry->func(entry->user, task.task_name, task.task_data, task.task_error, task.task_id, task.task_last);
+        }
+    }
+
+    //߳жԺϲݵã÷GIL
+    template <typename T>
+    void dispatch(int callback, const vector<T*> &data) const
+    {
+        const Entry *entry = entry_.load(memory_order_acquire);
+        if (!entry || entry->thread != NATIVE_THREAD_DISPATCH || !entry->enabled[callback])
+            return;
+
+        for (const T *task_data : data)
+            entry->func(entry->user, callback, task_data, nullptr, 0, false);
+    }
+};
+
+
+//ԼϲĲλÿԼֻһδ͵
+//CTPص߳д루ݴڴط䣩߳ȡ˫ֻڶݼڼ
+template <typename T>
+class ConflateTable
+{
+private:
+    struct Slot
+    {
+        string key;							//Լ
+        T *pending = nullptr;				//δ͵
+        uint64_t updates = 0;				//յ
+        uint64_t conflated = 0;				//ݸǵ
+    };
+
+    vector<Slot> slots_;					//λֻ±걣ֲ䣩
+    vector<int> index_;						//Ѱַϣλ±꣬-1Ϊ
+    vector<size_t> dirty_;					//дݵĲλΪ͵˳
+    mutex mutex_;
+
+    //ϣһʱݲ²
+    void rehash()
+    {
+        size_t size = max<size_t>(index_.size() * 2, 256);
+        index_.assign(size, -1);
+
+        for (size_t i = 0; i < slots_.size(); i++)
+        {
+            size_t pos = std::hash<string_view>()(slots_[i].key) & (size - 1);
+            while (index_[pos] != -1)
+                pos = (pos + 1) & (size - 1);
+            index_[pos] = (int)i;
+        }
+    }
+
+    //ҺԼӦĲλʱ
+    Slot &find(string_view key)
+    {
+        if ((slots_.size() + 1) * 2 > index_.size())
+            this->rehash();
+
+        size_t mask = index_.size() - 1;
+        size_t pos = std::hash<string_view>()(key) & mask;
+        while (index_[pos] != -1)
+        {
+            Slot &slot = slots_[index_[pos]];
+            if (slot.key == key)
+                return slot;
+            pos = (pos + 1) & mask;
+        }
+
+        index_[pos] = (int)slots_.size();
+        slots_.emplace_back();
+        slots_.back().key = string(key);
+        return slots_.back();
+    }
+
+public:
+    //дݣشбǷɿձΪǿգʱҪ֪̣ͨ߳
+    template <size_t size>
+    bool update(const char (&key)[size], const T &value, TaskPool<T> &pool)
+    {
+        lock_guard<mutex> mlock(mutex_);
+
+        Slot &slot = this->find(string_view(key, strnlen(key, size)));
+        slot.updates++;
+
+        if (slot.pending)
+        {
+            *slot.pending = value;
+            slot.conflated++;
+            return false;
+        }
+
+        slot.pending = pool.alloc(value);
+        dirty_.push_back(&slot - slots_.data());
+        return dirty_.size() == 1;
+    }
+
+    //ȡȫ͵
+    void take(vector<T*> &data)
+    {
+        data.clear();
+
+        lock_guard<mutex> mlock(mutex_);
+        for (size_t i : dirty_)
+        {
+            data.push_back(slots_[i].pending);
+            slots_[i].pending = nullptr;
+        }
+        dirty_.clear();
+    }
+
+    //ȡÿԼĺϲͳϢ
+    dict stats()
+    {
+        dict d;
+
+        lock_guard<mutex> mlock(mutex_);
+        for (const Slot &slot : slots_)
+        {
+            dict stats;
+            stats["updates"] = slot.updates;
+            stats["conflated"] = slot.conflated;
+            stats["pending"] = slot.pending != nullptr;
+            d[slot.key.c_str()] = stats;
+        }
+        return d;
+    }
+};
+
+
+//̹ڴӳļÿδʱ´Windowsӳļʱ޷ɾضϣΪԭļ³ʼ
+class SharedFile
+{
+private:
+    char *data_ = nullptr;
+    size_t size_ = 0;
+
+#ifdef _WIN32
+    HANDLE file_ = INVALID_HANDLE_VALUE;
+    HANDLE mapping_ = NULL;
+#endif
+
+public:
+    SharedFile() = default;
+    SharedFile(const SharedFile &) = delete;
+    SharedFile &operator=(const SharedFile &) = delete;
+
+    ~SharedFile()
+    {
+        this->close();
+    }
+
+    char *data() const
+    {
+        return data_;
+    }
+
+    char *open(const string &path, size_t size)
+    {
+        this->close();
+
+#ifdef _WIN32
+        file_ = CreateFileA(path.c_str(), GENERIC_READ | GENERIC_WRITE,
+            FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE, NULL, OPEN_ALWAYS, FILE_ATTRIBUTE_NORMAL, NULL);
+        if (file_ == INVALID_HANDLE_VALUE)
+            throw runtime_error("failed to create shared file: " + path);
+
+        mapping_ = CreateFileMappingA(file_, NULL, PAGE_READWRITE, (DWORD)(size >> 32), (DWORD)size, NULL);
+        if (mapping_)
+            data_ = (char*)MapViewOfFile(mapping_, FILE_MAP_ALL_ACCESS, 0, 0, size);
+#else
+        //ɾļڶȡļĽ̲Ӱ
+        ::unlink(path.c_str());
+
+        int fd = ::open(path.c_str(), O_RDWR | O_CREAT | O_TRUNC, 0644);
+        if (fd < 0)
+            throw runtime_error("failed to create shared file: " + path);
+
+        if (::ftruncate(fd, (off_t)size) == 0)
+        {
+            void *data = ::mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+            if (data != MAP_FAILED)
+                data_ = (char*)data;
+        }
+        ::close(fd);
+#endif
+
+        if (!data_)
+        {
+            this->close();
+            throw runtime_error("failed to map shared file: " + path);
+        }
+
+        size_ = size;
+        memset(data_, 0, size);		//Ԥдȫҳ棬ⷢʱȱҳж
+        return data_;
+    }
+
+    //ӳѴļǰsizeֽڲfuncļڻСsizeʱκβ
+    static void update(const string &path, size_t size, const std::function<void(char*)> &func)
+    {
+#ifdef _WIN32
+        HANDLE file = CreateFileA(path.c_str(), GENERIC_READ | GENERIC_WRITE,
+            FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE, NULL, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, NULL);
+        if (file == INVALID_HANDLE_VALUE)
+            return;
+
+        LARGE_INTEGER file_size;
+        if (GetFileSizeEx(file, &file_size) && (uint64_t)file_size.QuadPart >= size)
+        {
+            HANDLE mapping = CreateFileMappingA(file, NULL, PAGE_READWRITE, 0, 0, NULL);
+            if (mapping)
+            {
+                char *data = (char*)MapViewOfFile(mapping, FILE_MAP_ALL_ACCESS, 0, 0, size);
+                if (data)
+                {
+                    func(data);
+                    UnmapViewOfFile(data);
+                }
+                CloseHandle(mapping);
+            }
+        }
+        CloseHandle(file);
+#else
+        int fd = ::open(path.c_str(), O_RDWR);
+        if (fd < 0)
+            return;
+
+        struct stat st;
+        if (::fstat(fd, &st) == 0 && (uint64_t)st.st_size >= size)
+        {
+            void *data = ::mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+            if (data != MAP_FAILED)
+            {
+                func((char*)data);
+                ::munmap(data, size);
+            }
+        }
+        ::close(fd);
+#endif
+    }
+
+    void close()
+    {
+#ifdef _WIN32
+        if (data_)
+            UnmapViewOfFile(data_);
+        if (mapping_)
+            CloseHandle(mapping_);
+        if (file_ != INVALID_HANDLE_VALUE)
+            CloseHandle(file_);
+        mapping_ = NULL;
+        file_ = INVALID_HANDLE_VALUE;
+#else
+        if (data_)
+            ::munmap(data_, size_);
+#endif
+        data_ = nullptr;
+        size_ = 0;
+    }
+};
+
+
+//ļͷ̶ֹСˣpyctp_api/shm.pyƫƶȡ
+struct TickBusHeader
+{
+    char magic[8];							//"PYCTPBUS"
+    uint32_t version;						//ʽ汾
+    uint32_t header_size;					//ļͷС
+    uint64_t capacity;						//¼λ2ݣ
+    uint32_t record_size;					//ÿ¼С
+    uint32_t data_size;						//¼нṹĴС
+    uint32_t key_offset;					//Լڽṹеƫ
+    uint32_t key_size;						//ԼֶδС
+    atomic<uint64_t> write_seq;				//ѷļ¼
+    uint64_t session;						//ʱ䣨Unix룩ȡݴ˷߱´
+    atomic<uint64_t> closed;				//ֹͣ¼¼
+    char reserved[64];
+};
+
+static_assert(sizeof(TickBusHeader) == 128, "unexpected tick bus header size");
+
+#define TICK_BUS_MAGIC "PYCTPBUS"
+#define TICK_BUS_VERSION 1
+#define TICK_BUS_RECORD_HEADER 24			//¼ͷȫšԼšʱ䣨8ֽڣ
+
+//ڴߣCTPص߳̽ԭʼṹдڴӳļеĻλͬʱȡ
+//ÿ¼ȫţдڼΪ0ȡݴ˼ⱻǵļ¼ͺԼڵ
+template <typename T>
+class TickBus
+{
+private:
+    SharedFile file_;
+    TickBusHeader *header_ = nullptr;
+    char *records_ = nullptr;
+    uint64_t mask_ = 0;
+    uint32_t record_size_ = 0;
+    uint64_t write_seq_ = 0;
+    map<string, uint64_t, less<>> instrument_seq_;	//ÿԼѷļ¼
+    string path_;
+
+    atomic<bool> active_{ false };
+    mutex mutex_;							//ӳĴ򿪺͹ر
+
+public:
+    bool active() const
+    {
+        return active_.load(memory_order_relaxed);
+    }
+
+    //ļcapacityΪ¼λ2ݣ
+    void open(const string &path, uint64_t capacity)
+    {
+        if (!capacity || (capacity & (capacity - 1)))
+            throw invalid_argument("tick bus capacity must be a power of two");
+
+        lock_guard<mutex> mlock(mutex_);
+        this->closeLocked();
+
+        //֪ͨڶȡļĽѾرգ֮ǰķ쳣˳ûдرձʶ
+        SharedFile::update(path, sizeof(TickBusHeader), [](char *data) {
+            TickBusHeader *header = (TickBusHeader*)data;
+            if (!memcmp(header->magic, TICK_BUS_MAGIC, sizeof(header->magic)))
+                header->closed.store(1, memory_order_release);
+        });
+
+        uint32_t record_size = (TICK_BUS_RECORD_HEADER + sizeof(T) + 7) & ~7;
+        char *data = file_.open(path, sizeof(TickBusHeader) + capacity * record_size);
+
+        header_ = (TickBusHeader*)data;
+        records_ = data + sizeof(TickBusHeader);
+        mask_ = capacity - 1;
+        record_size_ = record_size;
+        write_seq_ = 0;
+        instrument_seq_.clear();
+        path_ = path;
+
+        header_->version = TICK_BUS_VERSION;
+        header_->header_size = sizeof(TickBusHeader);
+        header_->capacity = capacity;
+        header_->record_size = record_size;
+        header_->data_size = sizeof(T);
+        header_->key_offset = offsetof(T, InstrumentID);
+        header_->key_size = sizeof(T::InstrumentID);
+        new (&header_->write_seq) atomic<uint64_t>(0);
+        new (&header_->closed) atomic<uint64_t>(0);
+        header_->session = (uint64_t)chrono::duration_cast<chrono::nanoseconds>(
+            chrono::system_clock::now().time_since_epoch()).count();
+
+        //дʶȡʶʱļͷѾ
+        atomic_thread_fence(memory_order_release);
+        memcpy(header_->magic, TICK_BUS_MAGIC, sizeof(header_->magic));
+
+        active_.store(true);
+    }
+
+    void close()
+    {
+        lock_guard<mutex> mlock(mutex_);
+        this->closeLocked();
+    }
+
+    void closeLocked()
+    {
+        active_.store(false);
+        if (header_)
+            header_->closed.store(1, memory_order_release);
+        file_.close();
+        header_ = nullptr;
+        records_ = nullptr;
+    }
+
+    //һݣֻCTPص߳еã
+    void publish(const T &value)
+    {
+        lock_guard<mutex> mlock(mutex_);
+        if (!header_)
+            return;
+
+        uint64_t n = write_seq_++;
+        char *record = records_ + (n & mask_) * record_size_;
+        atomic<uint64_t> *seq = reinterpret_cast<atomic<uint64_t>*>(record);
+
+        seq->store(0, memory_order_relaxed);
+        atomic_thread_fence(memory_order_release);
+
+        string_view key(value.InstrumentID, strnlen(value.InstrumentID, sizeof(value.InstrumentID)));
+        auto it = instrument_seq_.find(key);
+        if (it == instrument_seq_.end())
+            it = instrument_seq_.emplace(string(key), 0).first;
+        uint64_t instrument_seq = ++it->second;
+
+        uint64_t time = (uint64_t)chrono::duration_cast<chrono::nanoseconds>(
+            chrono::system_clock::now().time_since_epoch()).count();
+
+        memcpy(record + 8, &instrument_seq, sizeof(instrument_seq));
+        memcpy(record + 16, &time, sizeof(time));
+        memcpy(record + TICK_BUS_RECORD_HEADER, &value, sizeof(T));
+
+        seq->store(n + 1, memory_order_release);
+        header_->write_seq.store(n + 1, memory_order_release);
+    }
+
+    //ȡ״̬
+    dict stats()
+    {
+        dict d;
+
+        lock_guard<mutex> mlock(mutex_);
+        d["active"] = header_ != nullptr;
+        d["path"] = path_;
+        d["capacity"] = header_ ? mask_ + 1 : 0;
+        d["published"] = write_seq_;
+        d["instruments"] = instrument_seq_.size();
+        return d;
+    }
+};
+
+
+//¼ļͷ̶ֹСˣpyctp_api/recorder.pyƫƶȡ
+struct TickRecordHeader
+{
+    char magic[8];							//"PYCTPREC"
+    uint32_t version;						//ʽ汾
+    uint32_t header_size;					//ļͷС
+    uint32_t record_size;					//ÿ¼С
+    uint32_t data_size;						//¼нṹĴС
+    uint32_t key_offset;					//Լڽṹеƫ
+    uint32_t key_size;						//ԼֶδС
+    uint64_t segment;						//ֶα
+    uint64_t create_time;					//ʱ䣨Unix룩
+    char reserved[80];
+};
+
+static_assert(sizeof(TickRecordHeader) == 128, "unexpected tick record header size");
+
+//ֶνʱдļĩβλϢ
+struct TickIndexTrailer
+{
+    char magic[8];							//"PYCTPIDX"
+    uint64_t index_offset;					//ļеƫ
+    uint64_t record_count;					//ֶеļ¼
+    uint64_t instrument_count;				//еĺԼ
+};
+
+static_assert(sizeof(TickIndexTrailer) == 32, "unexpected tick index trailer size");
+
+#define TICK_RECORD_MAGIC "PYCTPREC"
+#define TICK_INDEX_MAGIC "PYCTPIDX"
+#define TICK_RECORD_VERSION 1
+#define TICK_RECORD_TIME 8					//¼ͷؽʱ䣨8ֽڣ
+#define TICK_RECORD_MAX_PENDING 16			//ȴдΪflush_bytesıµļ¼
+
+//¼ļˢ̷ʽ
+#define FSYNC_NONE 0				//ֻдϵͳ棨Ĭɲϵͳʱ䣩
+#define FSYNC_SEGMENT 1				//ÿֶνʱ
+#define FSYNC_FLUSH 2				//ÿд
+
+//ˢ̷ʽתΪӦĳ
+inline int getFsyncMode(const string &mode)
+{
+    if (mode == "none")
+        return FSYNC_NONE;
+    else if (mode == "segment")
+        return FSYNC_SEGMENT;
+    else if (mode == "flush")
+        return FSYNC_FLUSH;
+
+    throw invalid_argument("unknown fsync mode: " + mode);
+};
+
+//¼ƣCTPصֻ߳Ѵؽʱԭʼṹ׷ӵڴУ
+//¼̰߳дֶļÿֶνʱļĩβд밴Լļ¼ƫ
+//ֶļΪ·.000000¿ʼ¼ʱһδʹõıż
+template <typename T>
+class TickRecorder
+{
+private:
+    //¼Ʋopen֮޸ģ
+    string path_;
+    uint64_t segment_size_ = 0;				//ÿֶεֽ
+    size_t flush_bytes_ = 0;				//δﵽôСʱд
+    chrono::milliseconds flush_interval_{ 0 };	//ȴʱ
+    int fsync_ = FSYNC_NONE;
+    uint32_t record_size_ = 0;
+    size_t max_pending_ = 0;				//pending_ֽ
+
+    //CTPص߳д롢¼߳ȡ
+    vector<char> pending_;
+    mutex mutex_;
+    condition_variable cond_;
+    bool stopping_ = false;
+    thread thread_;
+    atomic<bool> active_{ false };
+
+    //³Աֻ¼߳зʣopen/closeʱ¼߳δУ
+    FILE *file_ = nullptr;
+    uint64_t segment_ = 0;
+    uint64_t file_size_ = 0;
+    uint64_t segment_records_ = 0;
+    map<string, vector<uint64_t>> index_;	//Լ -> ¼ڷֶļеƫ
+
+    //ͳ
+    atomic<uint64_t> recorded_{ 0 };		//CTPص߳յļ¼
+    atomic<uint64_t> written_{ 0 };			//дļļ¼
+    atomic<uint64_t> segments_{ 0 };		//Ѵķֶ
+    atomic<uint64_t> flushes_{ 0 };			//д
+    atomic<uint64_t> fsyncs_{ 0 };			//̴
+    atomic<uint64_t> errors_{ 0 };			//дʧܴ
+    atomic<uint64_t> dropped_{ 0 };			//ȴдݳ޻дʧܶļ¼
+    string error_;							//һдʧܵϢmutex_
+
+    static uint64_t now()
+    {
+        return (uint64_t)chrono::duration_cast<chrono::nanoseconds>(
+            chrono::system_clock::now().time_since_epoch()).count();
+    }
+
+    static string segmentPath(const string &path, uint64_t segment)
+    {
+        char suffix[32];
+        snprintf(suffix, sizeof(suffix), ".%06llu", (unsigned long long)segment);
+        return path + suffix;
+    }
+
+    static bool exists(const string &path)
+    {
+        FILE *f = fopen(path.c_str(), "rb");
+        if (!f)
+            return false;
+        fclose(f);
+        return true;
+    }
+
+    void fail(const string &message)
+    {
+        errors_.fetch_add(1, memory_order_relaxed);
+        lock_guard<mutex> mlock(mutex_);
+        error_ = message;
+    }
+
+    //ļضϵָȣдλƶļĩβ
+    static bool truncateFile(FILE *file, uint64_t size)
+    {
+        clearerr(file);
+#ifdef _WIN32
+        return _chsize_s(_fileno(file), (__int64)size) == 0 && _fseeki64(file, (__int64)size, SEEK_SET) == 0;
+#else
+        return ftruncate(fileno(file), (off_t)size) == 0 && fseeko(file, (off_t)size, SEEK_SET) == 0;
+#endif
+    }
+
+    //ͳдʧʱļ¼bytesΪδдֽ
+    void drop(size_t bytes)
+    {
+        dropped_.fetch_add(bytes / record_size_, memory_order_relaxed);
+    }
+
+    void sync()
+    {
+        fflush(file_);
+#ifdef _WIN32
+        _commit(_fileno(file_));
+#else
+        ::fsync(fileno(file_));
+#endif
+        fsyncs_.fetch_add(1, memory_order_relaxed);
+    }
+
+    //µķֶβдļͷ
+    bool openSegment()
+    {
+        string path = segmentPath(path_, segment_);
+        file_ = fopen(path.c_str(), "wb");
+        if (!file_)
+        {
+            this->fail("failed to create segment: " + path);
+            return false;
+        }
+
+        //stdioֱд룬дʧʱļǰδдݣ԰file_size_ض
+        setvbuf(file_, nullptr, _IONBF, 0);
+
+        TickRecordHeader header = {};
+        memcpy(header.magic, TICK_RECORD_MAGIC, sizeof(header.magic));
+        header.version = TICK_RECORD_VERSION;
+        header.header_size = sizeof(TickRecordHeader);
+        header.record_size = record_size_;
+        header.data_size = sizeof(T);
+        header.key_offset = offsetof(T, InstrumentID);
+        header.key_size = sizeof(T::InstrumentID);
+        header.segment = segment_;
+        header.create_time = now();
+        if (fwrite(&header, sizeof(header), 1, file_) != 1)
+        {
+            //ɾûļͷķֶΣһʹͬı´
+            fclose(file_);
+            file_ = nullptr;
+            remove(path.c_str());
+            this->fail("failed to write segment header: " + path);
+            return false;
+        }
+
+        file_size_ = sizeof(header);
+        segment_records_ = 0;
+        index_.clear();
+        segments_.fetch_add(1, memory_order_relaxed);
+        return true;
+    }
+
+    //дرյǰֶ
+    //ԼÿԼΪ볤ȣ4ֽڣ¼4ֽڣ루뵽8ֽڣ¼ƫƣÿ8ֽڣ
+    void closeSegment()
+    {
+        if (!file_)
+            return;
+
+        vector<char> index;
+        for (const auto &item : index_)
+        {
+            uint32_t length = (uint32_t)item.first.size();
+            uint32_t count = (uint32_t)item.second.size();
+            size_t start = index.size();
+
+            index.resize(start + 8 + ((length + 7) & ~7) + count * sizeof(uint64_t), 0);
+            memcpy(&index[start], &length, 4);
+            memcpy(&index[start + 4], &count, 4);
+            memcpy(&index[start + 8], item.first.data(), length);
+            memcpy(&index[start + 8 + ((length + 7) & ~7)], item.second.data(), count * sizeof(uint64_t));
+        }
+
+        TickIndexTrailer trailer = {};
+        memcpy(trailer.magic, TICK_INDEX_MAGIC, sizeof(trailer.magic));
+        trailer.index_offset = file_size_;
+        trailer.record_count = segment_records_;
+        trailer.instrument_count = index_.size();
+
+        if (fwrite(index.data(), 1, index.size(), file_) != index.size()
+            || fwrite(&trailer, sizeof(trailer), 1, file_) != 1)
+        {
+            //ȥȡʱ˳ɨ¼
+            this->fail("failed to write segment index: " + segmentPath(path_, segment_));
+            truncateFile(file_, file_size_);
+        }
+
+        if (fsync_ != FSYNC_NONE)
+            this->sync();
+
+        fclose(file_);
+        file_ = nullptr;
+        segment_++;
+    }
+
+    //һдֶļֶδСʱлһֶ
+    void writeBatch(const vector<char> &batch)
+    {
+        size_t start = 0;
+        size_t total = batch.size();
+
+        while (start < total)
+        {
+            if (!file_ && !this->openSegment())
+            {
+                this->drop(total - start);
+                return;
+            }
+
+            //ǰֶɵļ¼ÿֶдһ¼
+            uint64_t space = segment_size_ > file_size_ ? (segment_size_ - file_size_) / record_size_ : 0;
+            if (!space && segment_records_)
+            {
+                this->closeSegment();
+                continue;
+            }
+
+            size_t count = (size_t)min<uint64_t>(max<uint64_t>(space, 1), (total - start) / record_size_);
+            size_t size = count * record_size_;
+
+            if (fwrite(batch.data() + start, 1, size, file_) != size)
+            {
+                this->fail("failed to write segment: " + segmentPath(path_, segment_));
+                this->drop(total - start);
+
+                //ɾδдĲ֣֤¼ƫһ£޷ضʱ÷ֶΣд֮дһֶ
+                if (!truncateFile(file_, file_size_))
+                {
+                    fclose(file_);
+                    file_ = nullptr;
+                    segment_++;
+                }
+                return;
+            }
+
+            //¼߳нCTPص̲߳
+            for (size_t i = 0; i < count; i++)
+            {
+                const char *key = batch.data() + start + i * record_size_ + TICK_RECORD_TIME + offsetof(T, InstrumentID);
+                index_[string(key, strnlen(key, sizeof(T::InstrumentID)))].push_back(file_size_ + i * record_size_);
+            }
+
+            file_size_ += size;
+            segment_records_ += count;
+            written_.fetch_add(count, memory_order_relaxed);
+            start += size;
+        }
+
+        if (!file_)
+            return;
+
+        flushes_.fetch_add(1, memory_order_relaxed);
+
+        if (fsync_ == FSYNC_FLUSH)
+            this->sync();
+    }
+
+    //¼̣߳δﵽflush_bytesȴflush_intervalʱд
+    void run()
+    {
+        vector<char> batch;
+        batch.reserve(flush_bytes_ * 2);
+
+        while (true)
+        {
+            bool stopping;
+            {
+                unique_lock<mutex> mlock(mutex_);
+                cond_.wait_for(mlock, flush_interval_, [this] { return stopping_ || pending_.size() >= flush_bytes_; });
+                pending_.swap(batch);
+                stopping = stopping_;
+            }
+
+            if (!batch.empty())
+                this->writeBatch(batch);
+            batch.clear();
+
+            if (stopping)
+                break;
+        }
+
+        this->closeSegment();
+    }
+
+public:
+    ~TickRecorder()
+    {
+        this->close();
+    }
+
+    bool active() const
+    {
+        return active_.load(memory_order_relaxed);
+    }
+
+    //ʼ¼ƣpathΪֶļ·ǰ׺
+    void open(const string &path, int64_t segment_size, int64_t flush_bytes, int flush_interval_ms, const string &fsync)
+    {
+        int fsync_mode = getFsyncMode(fsync);
+        if (segment_size <= 0 || flush_bytes <= 0 || flush_interval_ms <= 0)
+            throw invalid_argument("segment_size, flush_bytes and flush_interval_ms must be positive");
+
+        this->close();
+
+        path_ = path;
+        segment_size_ = (uint64_t)segment_size;
+        flush_bytes_ = (size_t)flush_bytes;
+        flush_interval_ = chrono::milliseconds(flush_interval_ms);
+        fsync_ = fsync_mode;
+        record_size_ = (TICK_RECORD_TIME + sizeof(T) + 7) & ~7;
+        max_pending_ = max<size_t>(flush_bytes_, record_size_) * TICK_RECORD_MAX_PENDING;
+
+        recorded_.store(0);
+        written_.store(0);
+        segments_.store(0);
+        flushes_.store(0);
+        fsyncs_.store(0);
+        errors_.store(0);
+        dropped_.store(0);
+
+        //һδʹõķֶαſʼ֮ǰ¼Ƶļ
+        segment_ = 0;
+        while (exists(segmentPath(path_, segment_)))
+            segment_++;
+
+        //ȴһֶΣ·Чʱֱӱ
+        if (!this->openSegment())
+            throw runtime_error("failed to create segment: " + segmentPath(path_, segment_));
+
+        {
+            lock_guard<mutex> mlock(mutex_);
+            pending_.clear();
+            pending_.reserve(flush_bytes_ * 2);
+            stopping_ = false;
+            error_.clear();
+        }
+
+        thread_ = thread(&TickRecorder::run, this);
+        active_.store(true);
+    }
+
+    //ֹͣ¼ƣдʣκһֶε󷵻
+    void close()
+    {
+        if (!thread_.joinable())
+            return;
+
+        {
+            lock_guard<mutex> mlock(mutex_);
+            active_.store(false);
+            stopping_ = true;
+        }
+        cond_.notify_one();
+        thread_.join();
+    }
+
+    //׷һݣֻCTPص߳еã
+    void publish(const T &value)
+    {
+        uint64_t time = now();
+        bool full;
+        bool dropped;
+        {
+            lock_guard<mutex> mlock(mutex_);
+            if (stopping_)
+                return;
+
+            //¼߳д루̻дʧܣʱµļ¼ڴ
+            dropped = pending_.size() + record_size_ > max_pending_;
+            if (!dropped)
+            {
+                size_t start = pending_.size();
+                pending_.resize(start + record_size_);
+                memcpy(&pending_[start], &time, sizeof(time));
+                memcpy(&pending_[start + TICK_RECORD_TIME], &value, sizeof(T));
+            }
+
+            full = pending_.size() >= flush_bytes_;
+        }
+        recorded_.fetch_add(1, memory_order_relaxed);
+        if (dropped)
+            dropped_.fetch_add(1, memory_order_relaxed);
+
+        if (full)
+            cond_.notify_one();
+    }
+
+    //ȡ¼״̬
+    dict stats()
+    {
+        dict d;
+        d["active"] = this->active();
+        d["path"] = path_;
+        d["recorded"] = recorded_.load();
+        d["written"] = written_.load();
+        d["segments"] = segments_.load();
+        d["flushes"] = flushes_.load();
+        d["fsyncs"] = fsyncs_.load();
+        d["errors"] = errors_.load();
+        d["dropped"] = dropped_.load();
+
+        lock_guard<mutex> mlock(mutex_);
+        d["pending"] = pending_.size() / (record_size_ ? record_size_ : 1);
+        d["error"] = error_;
+        return d;
+    }
+};
+
+
+//ֵȡģʽ
+#define REQUEST_MODE_LOOKUP 0		//ṹֵֶ䣨Ĭϣ
+#define REQUEST_MODE_ITEMS 1		//ֵеļֵṹ壬ʺֶֻε
+
+//ֵȡģʽתΪӦĳ
+inline int getRequestMode(const string &mode)
+{
+    if (mode == "lookup")
+        return REQUEST_MODE_LOOKUP;
+    else if (mode == "items")
+        return REQUEST_MODE_ITEMS;
+
+    throw invalid_argument("unknown request mode: " + mode);
 };
 
-class TerminatedError : std::exception
-{};
 
-class TaskQueue
+//PythonתΪintֱӶȡͰpybind11ת
+inline void loadInt(PyObject *o, int *value)
 {
-private:
-    queue<Task> queue_;						//׼
-    mutex mutex_;							//
-    condition_variable cond_;				//
+    if (PyLong_CheckExact(o))
+    {
+        int overflow = 0;
+        long v = PyLong_AsLongAndOverflow(o, &overflow);
+        if (!overflow && v >= INT_MIN && v <= INT_MAX)
+        {
+            *value = (int)v;
+            return;
+        }
+    }
+    *value = handle(o).cast<int>();
+};
 
-    bool _terminate = false;
+//PythonתΪ
+inline void loadDouble(PyObject *o, double *value)
+{
+    if (PyFloat_CheckExact(o))
+        *value = PyFloat_AS_DOUBLE(o);
+    else
+        *value = handle(o).cast<double>();
+};
 
-public:
+//PythonתΪַASCIIֱַַӶȡ
+inline void loadChar(PyObject *o, char *value)
+{
+    if (PyUnicode_Check(o) && PyUnicode_GET_LENGTH(o) == 1 && PyUnicode_IS_ASCII(o))
+        *value = (char)PyUnicode_READ_CHAR(o, 0);
+    else
+        *value = handle(o).cast<char>();
+};
 
-    //µ
-    void push(const Task &task)
+//PythonֱַӴUTF8ƵΪsizeַУֽضϲ֤0β
+inline void loadString(PyObject *o, char *value, size_t size)
+{
+    const char *buf = nullptr;
+    Py_ssize_t length = 0;
+
+    if (PyUnicode_Check(o))
     {
-        unique_lock<mutex > mlock(mutex_);
-        queue_.push(task);					//д
-        mlock.unlock();						//ͷ
-        cond_.notify_one();					//֪ͨȴ߳
+        buf = PyUnicode_AsUTF8AndSize(o, &length);
+        if (!buf)
+            throw error_already_set();
     }
-
-    //ȡϵ
-    Task pop()
+    else if (PyBytes_Check(o))
     {
-        unique_lock<mutex> mlock(mutex_);
-        cond_.wait(mlock, [&]() {
-            return !queue_.empty() || _terminate;
-        });				//ȴ֪ͨ
-        if (_terminate)
-            throw TerminatedError();
-        Task task = queue_.front();			//ȡеһ
-        queue_.pop();						//ɾ
-        return task;						//ظ
+        buf = PyBytes_AS_STRING(o);
+        length = PyBytes_GET_SIZE(o);
     }
 
-    void terminate()
+    if (buf)
     {
-        _terminate = true;
-        cond_.notify_all();					//֪ͨȴ߳
+        size_t n = min((size_t)length, size - 1);
+        memcpy(value, buf, n);
+        value[n] = 0;
+        return;
     }
+
+    string s = handle(o).cast<string>();
+    size_t n = min(s.size(), size - 1);
+    memcpy(value, s.data(), n);
+    value[n] = 0;
 };
 
 
-//ֵлȡĳֵӦֵṹֵ
-void getInt(const dict &d, const char *key, int *value)
+//ֵлȡĳֵӦֵṹֵϣkeyΪԤפֵֻһΣ
+inline void getInt(const dict &d, PyObject *key, int *value)
 {
-    if (d.contains(key))		//ֵǷڸüֵ
-    {
-        object o = d[key];		//ȡüֵ
-        *value = o.cast<int>();
-    }
+    PyObject *o = PyDict_GetItem(d.ptr(), key);		//ؽãʱΪ
+    if (o)
+        loadInt(o, value);
+};
+
+inline void getInt(const dict &d, const char *key, int *value)
+{
+    PyObject *o = PyDict_GetItemString(d.ptr(), key);
+    if (o)
+        loadInt(o, value);
 };
 
 
 //ֵлȡĳֵӦĸֵṹֵ
-void getDouble(const dict &d, const char *key, double *value)
+inline void getDouble(const dict &d, PyObject *key, double *value)
 {
-    if (d.contains(key))
-    {
-        object o = d[key];
-        *value = o.cast<double>();
-    }
+    PyObject *o = PyDict_GetItem(d.ptr(), key);
+    if (o)
+        loadDouble(o, value);
+};
+
+inline void getDouble(const dict &d, const char *key, double *value)
+{
+    PyObject *o = PyDict_GetItemString(d.ptr(), key);
+    if (o)
+        loadDouble(o, value);
 };
 
 
 //ֵлȡĳֵӦֵַṹֵ
-void getChar(const dict &d, const char *key, char *value)
+inline void getChar(const dict &d, PyObject *key, char *value)
 {
-    if (d.contains(key))
-    {
-        object o = d[key];
-        *value = o.cast<char>();
-    }
+    PyObject *o = PyDict_GetItem(d.ptr(), key);
+    if (o)
+        loadChar(o, value);
+};
+
+inline void getChar(const dict &d, const char *key, char *value)
+{
+    PyObject *o = PyDict_GetItemString(d.ptr(), key);
+    if (o)
+        loadChar(o, value);
 };
 
 
@@ -111,15 +2235,19 @@ using string_literal = char[size];
 
 //ֵлȡĳֵӦֵַṹֵ
 template <size_t size>
-void getString(const pybind11::dict &d, const char *key, string_literal<size> &value)
+inline void getString(const dict &d, PyObject *key, string_literal<size> &value)
 {
-    if (d.contains(key))
-    {
-        object o = d[key];
-        string s = o.cast<string>();
-        const char *buf = s.c_str();
-        strcpy(value, buf);
-    }
+    PyObject *o = PyDict_GetItem(d.ptr(), key);
+    if (o)
+        loadString(o, value, size);
+};
+
+template <size_t size>
+inline void getString(const dict &d, const char *key, string_literal<size> &value)
+{
+    PyObject *o = PyDict_GetItemString(d.ptr(), key);
+    if (o)
+        loadString(o, value, size);
 };
 
 
@@ -187,3 +2315,504 @@ inline string toUtf(const string &gb2312)
     }
 }
 #endif
+
+
+//ֻASCIIֶַΣ롢šʱȣֱתΪPythonַ
+inline str fromAscii(const char *value, size_t size)
+{
+    size_t length = strnlen(value, size);
+
+    PyObject *o = PyUnicode_FromStringAndSize(value, length);
+    if (!o)
+    {
+        //ֶַASCIIַʱGBKת
+        PyErr_Clear();
+        return str(toUtf(string(value, length)));
+    }
+    return reinterpret_steal<str>(o);
+}
+
+template <size_t size>
+inline str fromAscii(const string_literal<size> &value)
+{
+    return fromAscii(value, size);
+}
+
+
+//ܰĵֶתΪPythonַȫΪASCIIַʱGBKת
+inline str fromGbk(const char *value, size_t size)
+{
+    size_t length = 0;
+    unsigned char bits = 0;
+    while (length < size && value[length])
+    {
+        bits |= (unsigned char)value[length];
+        length++;
+    }
+
+    if (bits < 0x80)
+    {
+        PyObject *o = PyUnicode_FromStringAndSize(value, length);
+        if (!o)
+            throw error_already_set();
+        return reinterpret_steal<str>(o);
+    }
+
+    return str(toUtf(string(value, length)));
+}
+
+template <size_t size>
+inline str fromGbk(const string_literal<size> &value)
+{
+    return fromGbk(value, size);
+}
+
+
+//ԤСֵ䣬дʱ
+inline dict newDict(Py_ssize_t size)
+{
+#if PY_VERSION_HEX < 0x030D0000
+    PyObject *o = _PyDict_NewPresized(size);
+#else
+    PyObject *o = PyDict_New();
+#endif
+    if (!o)
+        throw error_already_set();
+    return reinterpret_steal<dict>(o);
+}
+
+
+//ʹԤפļдֵ䣬ʡȥÿδַͼϣĿ
+inline void setItem(dict &d, PyObject *key, const object &value)
+{
+    if (PyDict_SetItem(d.ptr(), key, value.ptr()) < 0)
+        throw error_already_set();
+}
+
+inline void setItem(dict &d, PyObject *key, int value)
+{
+    setItem(d, key, reinterpret_steal<object>(PyLong_FromLong(value)));
+}
+
+inline void setItem(dict &d, PyObject *key, double value)
+{
+    setItem(d, key, reinterpret_steal<object>(PyFloat_FromDouble(value)));
+}
+
+inline void setItem(dict &d, PyObject *key, char value)
+{
+    setItem(d, key, reinterpret_steal<object>(PyUnicode_DecodeLatin1(&value, 1, nullptr)));
+}
+
+
+//ṹֶ
+#define FIELD_INT 0					//intshort
+#define FIELD_DOUBLE 1				//
+#define FIELD_CHAR 2				//ַ
+#define FIELD_ASCII 3				//ֻASCIIַַ
+#define FIELD_GBK 4					//ܰĵַ
+
+//ṹֶڰֶбתṹ
+struct FieldDesc
+{
+    const char *name;				//ֶ
+    PyObject **key;					//Ԥפֵ
+    size_t offset;					//ֶڽṹеƫ
+    size_t size;					//ֶδС
+    int type;						//ֶ
+};
+
+//ֶвֶ
+template <size_t count>
+inline const FieldDesc *findField(const FieldDesc (&fields)[count], const string &name)
+{
+    for (const FieldDesc &field : fields)
+    {
+        if (name == field.name)
+            return &field;
+    }
+    return nullptr;
+}
+
+//ֵֶΣȱȽפָ룬δפļַٰݱȽ
+inline const FieldDesc *findField(const FieldDesc *fields, size_t count, PyObject *key)
+{
+    for (size_t i = 0; i < count; i++)
+    {
+        if (*fields[i].key == key)
+            return &fields[i];
+    }
+
+    if (!PyUnicode_Check(key))
+        return nullptr;
+
+    const char *name = PyUnicode_AsUTF8(key);
+    if (!name)
+        throw error_already_set();
+
+    for (size_t i = 0; i < count; i++)
+    {
+        if (strcmp(name, fields[i].name) == 0)
+            return &fields[i];
+    }
+    return nullptr;
+}
+
+template <size_t count>
+inline const FieldDesc *findField(const FieldDesc (&fields)[count], PyObject *key)
+{
+    return findField(fields, count, key);
+}
+
+//ֶPythonдṹеֶ
+inline void loadField(PyObject *o, const FieldDesc &field, void *data)
+{
+    char *value = (char*)data + field.offset;
+
+    switch (field.type)
+    {
+    case FIELD_INT:
+        if (field.size == sizeof(short))
+        {
+            int v = 0;
+            loadInt(o, &v);
+            *(short*)value = (short)v;
+        }
+        else
+            loadInt(o, (int*)value);
+        break;
+    case FIELD_DOUBLE:
+        loadDouble(o, (double*)value);
+        break;
+    case FIELD_CHAR:
+        loadChar(o, value);
+        break;
+    default:
+        loadString(o, value, field.size);
+        break;
+    }
+}
+
+//ֵֶеֶβṹ
+inline void dictToStruct(const dict &d, const FieldDesc *fields, size_t count, void *data)
+{
+    for (size_t i = 0; i < count; i++)
+    {
+        PyObject *o = PyDict_GetItem(d.ptr(), *fields[i].key);		//ؽãʱΪ
+        if (o)
+            loadField(o, fields[i], data);
+    }
+}
+
+template <size_t count>
+inline void dictToStruct(const dict &d, const FieldDesc (&fields)[count], void *data)
+{
+    dictToStruct(d, fields, count, data);
+}
+
+//ֵеļֵԣֶṹ壬вڵļ
+inline void fillFields(const dict &d, const FieldDesc *fields, size_t count, void *data)
+{
+    PyObject *key = nullptr;
+    PyObject *o = nullptr;
+    Py_ssize_t pos = 0;
+
+    while (PyDict_Next(d.ptr(), &pos, &key, &o))
+    {
+        const FieldDesc *field = findField(fields, count, key);
+        if (field)
+            loadField(o, *field, data);
+    }
+}
+
+template <size_t count>
+inline void fillFields(const dict &d, const FieldDesc (&fields)[count], void *data)
+{
+    fillFields(d, fields, count, data);
+}
+
+//ֶṹеֶдֵ䣬ֱֵͨPython C APIʡȥÿֶεʱװ
+inline void setField(dict &d, const FieldDesc &field, const void *data)
+{
+    const char *value = (const char*)data + field.offset;
+
+    PyObject *o;
+    switch (field.type)
+    {
+    case FIELD_INT:
+        o = PyLong_FromLong(field.size == sizeof(short) ? *(const short*)value : *(const int*)value);
+        break;
+    case FIELD_DOUBLE:
+        o = PyFloat_FromDouble(*(const double*)value);
+        break;
+    case FIELD_CHAR:
+        o = PyUnicode_DecodeLatin1(value, 1, nullptr);
+        break;
+    case FIELD_ASCII:
+        o = fromAscii(value, field.size).release().ptr();
+        break;
+    default:
+        o = fromGbk(value, field.size).release().ptr();
+        break;
+    }
+    if (!o)
+        throw error_already_set();
+
+    int result = PyDict_SetItem(d.ptr(), *field.key, o);
+    Py_DECREF(o);
+    if (result < 0)
+        throw error_already_set();
+}
+
+//ֶṹתΪֵ
+inline dict structToDict(const FieldDesc *fields, size_t count, const void *data)
+{
+    dict d = newDict(count);
+    for (size_t i = 0; i < count; i++)
+        setField(d, fields[i], data);
+    return d;
+}
+
+template <size_t count>
+inline dict structToDict(const FieldDesc (&fields)[count], const void *data)
+{
+    return structToDict(fields, count, data);
+}
+
+
+//صCTPصеĲ˳ݡšǷ󷵻أ
+#define CALLBACK_ARG_DATA 1
+#define CALLBACK_ARG_ERROR 2
+#define CALLBACK_ARG_ID 4					//ţԭʱ
+#define CALLBACK_ARG_LAST 8
+
+//ص̰߳صŲתݲPythonص
+struct CallbackDesc
+{
+    int args;						//ص
+    const FieldDesc *fields;		//ݽṹֶûݲʱΪ
+    size_t count;					//ֶ
+    size_t size;					//ݽṹĴС
+};
+
+//صƱPythonеĻصC++вֱӵõĻصֻ󶨿պPythonеsuper()Ѱ󶨵Ļص
+template <typename C, size_t count>
+inline void defCallbacks(C &cls, const char *(&names)[count])
+{
+    for (const char *name : names)
+    {
+        if (!hasattr(cls, name))
+            cls.def(name, [](typename C::type &, const args &) {});
+    }
+}
+
+
+//ܵĲѯCTPص̰߳ռԭʼṹ壬߳תͷ
+struct QueryRows
+{
+    int callback = 0;						//ѯصӦĳ
+    int reqid = 0;							//
+    const FieldDesc *fields = nullptr;		//ݽṹֶ
+    size_t count = 0;						//ֶ
+    size_t size = 0;						//ÿݽṹĴС
+    vector<char> data;						//˳еԭʼݽṹ
+    vector<char> error;						//յĴϢṹ壨ΪʱûдϢ
+
+    size_t rows() const
+    {
+        return size ? data.size() / size : 0;
+    }
+
+    const char *row(size_t i) const
+    {
+        return data.data() + i * size;
+    }
+};
+
+//ѯܣPythonon*AllĲѯصͣյbIsLastʱһȫ
+class QueryAggregator
+{
+private:
+    vector<char> enabled_;					//صǷܣֻinitʱ޸ģ
+    map<uint64_t, unique_ptr<QueryRows>> pending_;		//δյbIsLastĲѯCTPص̷߳ʣ
+    std::function<void(QueryRows*)> deliver_;			//ɺд
+
+    atomic<uint64_t> queries_{ 0 };			//ɵĲѯ
+    atomic<uint64_t> rows_{ 0 };			//ܵ
+
+public:
+    //ûصԼɺĴ
+    void setup(size_t callback_count, std::function<void(QueryRows*)> deliver)
+    {
+        enabled_.assign(callback_count, 0);
+        deliver_ = deliver;
+    }
+
+    void enable(int callback, bool enabled)
+    {
+        enabled_[callback] = enabled;
+    }
+
+    bool active(int callback) const
+    {
+        return enabled_[callback];
+    }
+
+    //ռһѯյbIsLastʱCTPص̵߳ã
+    void add(int callback, const CallbackDesc &desc, const void *data, const void *error, size_t error_size, int reqid, bool last)
+    {
+        uint64_t key = ((uint64_t)(uint32_t)callback << 32) | (uint32_t)reqid;
+
+        unique_ptr<QueryRows> &rows = pending_[key];
+        if (!rows)
+        {
+            rows.reset(new QueryRows());
+            rows->callback = callback;
+            rows->reqid = reqid;
+            rows->fields = desc.fields;
+            rows->count = desc.count;
+            rows->size = desc.size;
+        }
+
+        if (data)
+            rows->data.insert(rows->data.end(), (const char*)data, (const char*)data + desc.size);
+
+        if (error)
+            rows->error.assign((const char*)error, (const char*)error + error_size);
+
+        if (!last)
+            return;
+
+        QueryRows *done = rows.release();
+        pending_.erase(key);
+
+        queries_.fetch_add(1, memory_order_relaxed);
+        rows_.fetch_add(done->rows(), memory_order_relaxed);
+        deliver_(done);
+    }
+
+    //δյbIsLastĲѯӶϿCTPӿͷźã
+    void clear()
+    {
+        pending_.clear();
+    }
+
+    dict stats()
+    {
+        dict d;
+        d["queries"] = queries_.load();
+        d["rows"] = rows_.load();
+        return d;
+    }
+};
+
+
+//ܲѯеһУͬһֶεȫţͨЭֻ
+struct QueryColumn
+{
+    string format;							//ʽihdcNs
+    size_t itemsize = 0;					//ÿԪصĴС
+    size_t rows = 0;						//Ԫ
+    vector<char> data;						//ŵ
+};
+
+//ܲѯݣֶ˳ṹһ
+struct QueryColumns
+{
+    size_t rows = 0;						//
+    vector<string> names;					//ֶ
+    vector<shared_ptr<QueryColumn>> columns;	//ֶһһӦ
+
+    shared_ptr<QueryColumn> get(const string &name) const
+    {
+        for (size_t i = 0; i < names.size(); i++)
+        {
+            if (names[i] == name)
+                return columns[i];
+        }
+        throw key_error(name);
+    }
+
+    bool contains(const string &name) const
+    {
+        return find(names.begin(), names.end(), name) != names.end();
+    }
+};
+
+//ֶܵԭʼṹתΪ
+//ֵֶαC++еֶַͣΰȫе󳤶ȴΪֽڴGBK룬ת
+//㰴ѭÿṹֻڴжȡ
+inline QueryColumns buildColumns(const QueryRows &rows)
+{
+    QueryColumns result;
+    result.rows = rows.rows();
+    result.names.reserve(rows.count);
+    result.columns.reserve(rows.count);
+
+    //ֶַεĿΪȫַٱһֽ
+    vector<size_t> widths(rows.count, 1);
+    for (size_t r = 0; r < result.rows; r++)
+    {
+        const char *row = rows.row(r);
+        for (size_t i = 0; i < rows.count; i++)
+        {
+            const FieldDesc &field = rows.fields[i];
+            if (field.type == FIELD_ASCII || field.type == FIELD_GBK)
+                widths[i] = max(widths[i], strnlen(row + field.offset, field.size));
+        }
+    }
+
+    vector<char*> outs(rows.count);
+    for (size_t i = 0; i < rows.count; i++)
+    {
+        const FieldDesc &field = rows.fields[i];
+        shared_ptr<QueryColumn> column = make_shared<QueryColumn>();
+        column->rows = result.rows;
+
+        switch (field.type)
+        {
+        case FIELD_INT:
+            column->format = field.size == sizeof(short) ? "h" : "i";
+            column->itemsize = field.size;
+            break;
+        case FIELD_DOUBLE:
+            column->format = "d";
+            column->itemsize = sizeof(double);
+            break;
+        case FIELD_CHAR:
+            column->format = "c";
+            column->itemsize = 1;
+            break;
+        default:
+            column->format = to_string(widths[i]) + "s";
+            column->itemsize = widths[i];
+            break;
+        }
+
+        //ֶַν϶ʱʣಿֲ
+        column->data.assign(column->itemsize * result.rows, 0);
+        outs[i] = column->data.data();
+
+        result.names.push_back(field.name);
+        result.columns.push_back(column);
+    }
+
+    for (size_t r = 0; r < result.rows; r++)
+    {
+        const char *row = rows.row(r);
+        for (size_t i = 0; i < rows.count; i++)
+        {
+            const FieldDesc &field = rows.fields[i];
+            const char *value = row + field.offset;
+            size_t itemsize = result.columns[i]->itemsize;
+
+            if (field.type == FIELD_ASCII || field.type == FIELD_GBK)
+                memcpy(outs[i], value, strnlen(value, itemsize));
+            else
+                memcpy(outs[i], value, itemsize);
+            outs[i] += itemsize;
+        }
+    }
+
+    return result;
+}
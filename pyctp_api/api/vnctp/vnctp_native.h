@@ -0,0 +1,15 @@
+//pyctp_apiԭصӿڣC/C++չ԰ͷļͨPyCapsuleMdApi/TdApiעص
+#pragma once
+
+//PyCapsule
+#define PYCTP_NATIVE_CAPSULE "pyctp_api.native_callback"
+
+//ԭص
+//userPyCapsuleָ루PyCapsule_SetContextעʱԭ
+//callbackصţvnctpmd.h/vnctptd.hеĳһ£ONRTNDEPTHMARKETDATA
+//dataصݽṹָ루CThostFtdcDepthMarketDataField*ûʱΪ
+//errorϢṹָ루CThostFtdcRspInfoField*ûдϢʱΪ
+//reqidRspصţصonFrontDisconnectedĶϿԭ
+//lastǷΪ󷵻أֻRspصЧ
+//ʱGILdataerrorֻڱεڼЧҪʱӦ
+typedef void (*PyctpNativeCallback)(void *user, int callback, const void *data, const void *error, int reqid, int last);
@@ -4,219 +4,448 @@
 #include "vnctpmd.h"
 
 
+///-------------------------------------------------------------------------------------
+///Ԥפֵģ鵼ʱ
+///-------------------------------------------------------------------------------------
+
+static PyObject *KEY_TradingDay;
+static PyObject *KEY_LoginTime;
+static PyObject *KEY_BrokerID;
+static PyObject *KEY_UserID;
+static PyObject *KEY_SystemName;
+static PyObject *KEY_FrontID;
+static PyObject *KEY_SessionID;
+static PyObject *KEY_MaxOrderRef;
+static PyObject *KEY_SHFETime;
+static PyObject *KEY_DCETime;
+static PyObject *KEY_CZCETime;
+static PyObject *KEY_FFEXTime;
+static PyObject *KEY_INETime;
+static PyObject *KEY_SysVersion;
+static PyObject *KEY_GFEXTime;
+static PyObject *KEY_ErrorID;
+static PyObject *KEY_ErrorMsg;
+static PyObject *KEY_TopicID;
+static PyObject *KEY_reserve1;
+static PyObject *KEY_InstrumentNo;
+static PyObject *KEY_CodePrice;
+static PyObject *KEY_VolumeMultiple;
+static PyObject *KEY_PriceTick;
+static PyObject *KEY_InstrumentID;
+static PyObject *KEY_ExchangeID;
+static PyObject *KEY_reserve2;
+static PyObject *KEY_LastPrice;
+static PyObject *KEY_PreSettlementPrice;
+static PyObject *KEY_PreClosePrice;
+static PyObject *KEY_PreOpenInterest;
+static PyObject *KEY_OpenPrice;
+static PyObject *KEY_HighestPrice;
+static PyObject *KEY_LowestPrice;
+static PyObject *KEY_Volume;
+static PyObject *KEY_Turnover;
+static PyObject *KEY_OpenInterest;
+static PyObject *KEY_ClosePrice;
+static PyObject *KEY_SettlementPrice;
+static PyObject *KEY_UpperLimitPrice;
+static PyObject *KEY_LowerLimitPrice;
+static PyObject *KEY_PreDelta;
+static PyObject *KEY_CurrDelta;
+static PyObject *KEY_UpdateTime;
+static PyObject *KEY_UpdateMillisec;
+static PyObject *KEY_BidPrice1;
+static PyObject *KEY_BidVolume1;
+static PyObject *KEY_AskPrice1;
+static PyObject *KEY_AskVolume1;
+static PyObject *KEY_BidPrice2;
+static PyObject *KEY_BidVolume2;
+static PyObject *KEY_AskPrice2;
+static PyObject *KEY_AskVolume2;
+static PyObject *KEY_BidPrice3;
+static PyObject *KEY_BidVolume3;
+static PyObject *KEY_AskPrice3;
+static PyObject *KEY_AskVolume3;
+static PyObject *KEY_BidPrice4;
+static PyObject *KEY_BidVolume4;
+static PyObject *KEY_AskPrice4;
+static PyObject *KEY_AskVolume4;
+static PyObject *KEY_BidPrice5;
+static PyObject *KEY_BidVolume5;
+static PyObject *KEY_AskPrice5;
+static PyObject *KEY_AskVolume5;
+static PyObject *KEY_AveragePrice;
+static PyObject *KEY_ActionDay;
+static PyObject *KEY_ExchangeInstID;
+static PyObject *KEY_BandingUpperPrice;
+static PyObject *KEY_BandingLowerPrice;
+static PyObject *KEY_ForQuoteSysID;
+static PyObject *KEY_ForQuoteTime;
+static PyObject *KEY_Password;
+static PyObject *KEY_UserProductInfo;
+static PyObject *KEY_InterfaceProductInfo;
+static PyObject *KEY_ProtocolInfo;
+static PyObject *KEY_MacAddress;
+static PyObject *KEY_OneTimePassword;
+static PyObject *KEY_LoginRemark;
+static PyObject *KEY_ClientIPPort;
+static PyObject *KEY_ClientIPAddress;
+
+static void initKeys()
+{
+	KEY_TradingDay = PyUnicode_InternFromString("TradingDay");
+	KEY_LoginTime = PyUnicode_InternFromString("LoginTime");
+	KEY_BrokerID = PyUnicode_InternFromString("BrokerID");
+	KEY_UserID = PyUnicode_InternFromString("UserID");
+	KEY_SystemName = PyUnicode_InternFromString("SystemName");
+	KEY_FrontID = PyUnicode_InternFromString("FrontID");
+	KEY_SessionID = PyUnicode_InternFromString("SessionID");
+	KEY_MaxOrderRef = PyUnicode_InternFromString("MaxOrderRef");
+	KEY_SHFETime = PyUnicode_InternFromString("SHFETime");
+	KEY_DCETime = PyUnicode_InternFromString("DCETime");
+	KEY_CZCETime = PyUnicode_InternFromString("CZCETime");
+	KEY_FFEXTime = PyUnicode_InternFromString("FFEXTime");
+	KEY_INETime = PyUnicode_InternFromString("INETime");
+	KEY_SysVersion = PyUnicode_InternFromString("SysVersion");
+	KEY_GFEXTime = PyUnicode_InternFromString("GFEXTime");
+	KEY_ErrorID = PyUnicode_InternFromString("ErrorID");
+	KEY_ErrorMsg = PyUnicode_InternFromString("ErrorMsg");
+	KEY_TopicID = PyUnicode_InternFromString("TopicID");
+	KEY_reserve1 = PyUnicode_InternFromString("reserve1");
+	KEY_InstrumentNo = PyUnicode_InternFromString("InstrumentNo");
+	KEY_CodePrice = PyUnicode_InternFromString("CodePrice");
+	KEY_VolumeMultiple = PyUnicode_InternFromString("VolumeMultiple");
+	KEY_PriceTick = PyUnicode_InternFromString("PriceTick");
+	KEY_InstrumentID = PyUnicode_InternFromString("InstrumentID");
+	KEY_ExchangeID = PyUnicode_InternFromString("ExchangeID");
+	KEY_reserve2 = PyUnicode_InternFromString("reserve2");
+	KEY_LastPrice = PyUnicode_InternFromString("LastPrice");
+	KEY_PreSettlementPrice = PyUnicode_InternFromString("PreSettlementPrice");
+	KEY_PreClosePrice = PyUnicode_InternFromString("PreClosePrice");
+	KEY_PreOpenInterest = PyUnicode_InternFromString("PreOpenInterest");
+	KEY_OpenPrice = PyUnicode_InternFromString("OpenPrice");
+	KEY_HighestPrice = PyUnicode_InternFromString("HighestPrice");
+	KEY_LowestPrice = PyUnicode_InternFromString("LowestPrice");
+	KEY_Volume = PyUnicode_InternFromString("Volume");
+	KEY_Turnover = PyUnicode_InternFromString("Turnover");
+	KEY_OpenInterest = PyUnicode_InternFromString("OpenInterest");
+	KEY_ClosePrice = PyUnicode_InternFromString("ClosePrice");
+	KEY_SettlementPrice = PyUnicode_InternFromString("SettlementPrice");
+	KEY_UpperLimitPrice = PyUnicode_InternFromString("UpperLimitPrice");
+	KEY_LowerLimitPrice = PyUnicode_InternFromString("LowerLimitPrice");
+	KEY_PreDelta = PyUnicode_InternFromString("PreDelta");
+	KEY_CurrDelta = PyUnicode_InternFromString("CurrDelta");
+	KEY_UpdateTime = PyUnicode_InternFromString("UpdateTime");
+	KEY_UpdateMillisec = PyUnicode_InternFromString("UpdateMillisec");
+	KEY_BidPrice1 = PyUnicode_InternFromString("BidPrice1");
+	KEY_BidVolume1 = PyUnicode_InternFromString("BidVolume1");
+	KEY_AskPrice1 = PyUnicode_InternFromString("AskPrice1");
+	KEY_AskVolume1 = PyUnicode_InternFromString("AskVolume1");
+	KEY_BidPrice2 = PyUnicode_InternFromString("BidPrice2");
+	KEY_BidVolume2 = PyUnicode_InternFromString("BidVolume2");
+	KEY_AskPrice2 = PyUnicode_InternFromString("AskPrice2");
+	KEY_AskVolume2 = PyUnicode_InternFromString("AskVolume2");
+	KEY_BidPrice3 = PyUnicode_InternFromString("BidPrice3");
+	KEY_BidVolume3 = PyUnicode_InternFromString("BidVolume3");
+	KEY_AskPrice3 = PyUnicode_InternFromString("AskPrice3");
+	KEY_AskVolume3 = PyUnicode_InternFromString("AskVolume3");
+	KEY_BidPrice4 = PyUnicode_InternFromString("BidPrice4");
+	KEY_BidVolume4 = PyUnicode_InternFromString("BidVolume4");
+	KEY_AskPrice4 = PyUnicode_InternFromString("AskPrice4");
+	KEY_AskVolume4 = PyUnicode_InternFromString("AskVolume4");
+	KEY_BidPrice5 = PyUnicode_InternFromString("BidPrice5");
+	KEY_BidVolume5 = PyUnicode_InternFromString("BidVolume5");
+	KEY_AskPrice5 = PyUnicode_InternFromString("AskPrice5");
+	KEY_AskVolume5 = PyUnicode_InternFromString("AskVolume5");
+	KEY_AveragePrice = PyUnicode_InternFromString("AveragePrice");
+	KEY_ActionDay = PyUnicode_InternFromString("ActionDay");
+	KEY_ExchangeInstID = PyUnicode_InternFromString("ExchangeInstID");
+	KEY_BandingUpperPrice = PyUnicode_InternFromString("BandingUpperPrice");
+	KEY_BandingLowerPrice = PyUnicode_InternFromString("BandingLowerPrice");
+	KEY_ForQuoteSysID = PyUnicode_InternFromString("ForQuoteSysID");
+	KEY_ForQuoteTime = PyUnicode_InternFromString("ForQuoteTime");
+	KEY_Password = PyUnicode_InternFromString("Password");
+	KEY_UserProductInfo = PyUnicode_InternFromString("UserProductInfo");
+	KEY_InterfaceProductInfo = PyUnicode_InternFromString("InterfaceProductInfo");
+	KEY_ProtocolInfo = PyUnicode_InternFromString("ProtocolInfo");
+	KEY_MacAddress = PyUnicode_InternFromString("MacAddress");
+	KEY_OneTimePassword = PyUnicode_InternFromString("OneTimePassword");
+	KEY_LoginRemark = PyUnicode_InternFromString("LoginRemark");
+	KEY_ClientIPPort = PyUnicode_InternFromString("ClientIPPort");
+	KEY_ClientIPAddress = PyUnicode_InternFromString("ClientIPAddress");
+};
+
+static const FieldDesc RspUserLoginFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcRspUserLoginField, TradingDay), sizeof(CThostFtdcRspUserLoginField::TradingDay), FIELD_ASCII},
+	{"LoginTime", &KEY_LoginTime, offsetof(CThostFtdcRspUserLoginField, LoginTime), sizeof(CThostFtdcRspUserLoginField::LoginTime), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcRspUserLoginField, BrokerID), sizeof(CThostFtdcRspUserLoginField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcRspUserLoginField, UserID), sizeof(CThostFtdcRspUserLoginField::UserID), FIELD_ASCII},
+	{"SystemName", &KEY_SystemName, offsetof(CThostFtdcRspUserLoginField, SystemName), sizeof(CThostFtdcRspUserLoginField::SystemName), FIELD_GBK},
+	{"FrontID", &KEY_FrontID, offsetof(CThostFtdcRspUserLoginField, FrontID), sizeof(CThostFtdcRspUserLoginField::FrontID), FIELD_INT},
+	{"SessionID", &KEY_SessionID, offsetof(CThostFtdcRspUserLoginField, SessionID), sizeof(CThostFtdcRspUserLoginField::SessionID), FIELD_INT},
+	{"MaxOrderRef", &KEY_MaxOrderRef, offsetof(CThostFtdcRspUserLoginField, MaxOrderRef), sizeof(CThostFtdcRspUserLoginField::MaxOrderRef), FIELD_ASCII},
+	{"SHFETime", &KEY_SHFETime, offsetof(CThostFtdcRspUserLoginField, SHFETime), sizeof(CThostFtdcRspUserLoginField::SHFETime), FIELD_ASCII},
+	{"DCETime", &KEY_DCETime, offsetof(CThostFtdcRspUserLoginField, DCETime), sizeof(CThostFtdcRspUserLoginField::DCETime), FIELD_ASCII},
+	{"CZCETime", &KEY_CZCETime, offsetof(CThostFtdcRspUserLoginField, CZCETime), sizeof(CThostFtdcRspUserLoginField::CZCETime), FIELD_ASCII},
+	{"FFEXTime", &KEY_FFEXTime, offsetof(CThostFtdcRspUserLoginField, FFEXTime), sizeof(CThostFtdcRspUserLoginField::FFEXTime), FIELD_ASCII},
+	{"INETime", &KEY_INETime, offsetof(CThostFtdcRspUserLoginField, INETime), sizeof(CThostFtdcRspUserLoginField::INETime), FIELD_ASCII},
+	{"SysVersion", &KEY_SysVersion, offsetof(CThostFtdcRspUserLoginField, SysVersion), sizeof(CThostFtdcRspUserLoginField::SysVersion), FIELD_GBK},
+	{"GFEXTime", &KEY_GFEXTime, offsetof(CThostFtdcRspUserLoginField, GFEXTime), sizeof(CThostFtdcRspUserLoginField::GFEXTime), FIELD_ASCII},
+};
+
+static const FieldDesc RspInfoFields[] = {
+	{"ErrorID", &KEY_ErrorID, offsetof(CThostFtdcRspInfoField, ErrorID), sizeof(CThostFtdcRspInfoField::ErrorID), FIELD_INT},
+	{"ErrorMsg", &KEY_ErrorMsg, offsetof(CThostFtdcRspInfoField, ErrorMsg), sizeof(CThostFtdcRspInfoField::ErrorMsg), FIELD_GBK},
+};
+
+static const FieldDesc UserLogoutFields[] = {
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcUserLogoutField, BrokerID), sizeof(CThostFtdcUserLogoutField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcUserLogoutField, UserID), sizeof(CThostFtdcUserLogoutField::UserID), FIELD_ASCII},
+};
+
+static const FieldDesc MulticastInstrumentFields[] = {
+	{"TopicID", &KEY_TopicID, offsetof(CThostFtdcMulticastInstrumentField, TopicID), sizeof(CThostFtdcMulticastInstrumentField::TopicID), FIELD_INT},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcMulticastInstrumentField, reserve1), sizeof(CThostFtdcMulticastInstrumentField::reserve1), FIELD_ASCII},
+	{"InstrumentNo", &KEY_InstrumentNo, offsetof(CThostFtdcMulticastInstrumentField, InstrumentNo), sizeof(CThostFtdcMulticastInstrumentField::InstrumentNo), FIELD_INT},
+	{"CodePrice", &KEY_CodePrice, offsetof(CThostFtdcMulticastInstrumentField, CodePrice), sizeof(CThostFtdcMulticastInstrumentField::CodePrice), FIELD_DOUBLE},
+	{"VolumeMultiple", &KEY_VolumeMultiple, offsetof(CThostFtdcMulticastInstrumentField, VolumeMultiple), sizeof(CThostFtdcMulticastInstrumentField::VolumeMultiple), FIELD_INT},
+	{"PriceTick", &KEY_PriceTick, offsetof(CThostFtdcMulticastInstrumentField, PriceTick), sizeof(CThostFtdcMulticastInstrumentField::PriceTick), FIELD_DOUBLE},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcMulticastInstrumentField, InstrumentID), sizeof(CThostFtdcMulticastInstrumentField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc SpecificInstrumentFields[] = {
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcSpecificInstrumentField, reserve1), sizeof(CThostFtdcSpecificInstrumentField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcSpecificInstrumentField, InstrumentID), sizeof(CThostFtdcSpecificInstrumentField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc DepthMarketDataFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcDepthMarketDataField, TradingDay), sizeof(CThostFtdcDepthMarketDataField::TradingDay), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcDepthMarketDataField, reserve1), sizeof(CThostFtdcDepthMarketDataField::reserve1), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcDepthMarketDataField, ExchangeID), sizeof(CThostFtdcDepthMarketDataField::ExchangeID), FIELD_ASCII},
+	{"reserve2", &KEY_reserve2, offsetof(CThostFtdcDepthMarketDataField, reserve2), sizeof(CThostFtdcDepthMarketDataField::reserve2), FIELD_ASCII},
+	{"LastPrice", &KEY_LastPrice, offsetof(CThostFtdcDepthMarketDataField, LastPrice), sizeof(CThostFtdcDepthMarketDataField::LastPrice), FIELD_DOUBLE},
+	{"PreSettlementPrice", &KEY_PreSettlementPrice, offsetof(CThostFtdcDepthMarketDataField, PreSettlementPrice), sizeof(CThostFtdcDepthMarketDataField::PreSettlementPrice), FIELD_DOUBLE},
+	{"PreClosePrice", &KEY_PreClosePrice, offsetof(CThostFtdcDepthMarketDataField, PreClosePrice), sizeof(CThostFtdcDepthMarketDataField::PreClosePrice), FIELD_DOUBLE},
+	{"PreOpenInterest", &KEY_PreOpenInterest, offsetof(CThostFtdcDepthMarketDataField, PreOpenInterest), sizeof(CThostFtdcDepthMarketDataField::PreOpenInterest), FIELD_DOUBLE},
+	{"OpenPrice", &KEY_OpenPrice, offsetof(CThostFtdcDepthMarketDataField, OpenPrice), sizeof(CThostFtdcDepthMarketDataField::OpenPrice), FIELD_DOUBLE},
+	{"HighestPrice", &KEY_HighestPrice, offsetof(CThostFtdcDepthMarketDataField, HighestPrice), sizeof(CThostFtdcDepthMarketDataField::HighestPrice), FIELD_DOUBLE},
+	{"LowestPrice", &KEY_LowestPrice, offsetof(CThostFtdcDepthMarketDataField, LowestPrice), sizeof(CThostFtdcDepthMarketDataField::LowestPrice), FIELD_DOUBLE},
+	{"Volume", &KEY_Volume, offsetof(CThostFtdcDepthMarketDataField, Volume), sizeof(CThostFtdcDepthMarketDataField::Volume), FIELD_INT},
+	{"Turnover", &KEY_Turnover, offsetof(CThostFtdcDepthMarketDataField, Turnover), sizeof(CThostFtdcDepthMarketDataField::Turnover), FIELD_DOUBLE},
+	{"OpenInterest", &KEY_OpenInterest, offsetof(CThostFtdcDepthMarketDataField, OpenInterest), sizeof(CThostFtdcDepthMarketDataField::OpenInterest), FIELD_DOUBLE},
+	{"ClosePrice", &KEY_ClosePrice, offsetof(CThostFtdcDepthMarketDataField, ClosePrice), sizeof(CThostFtdcDepthMarketDataField::ClosePrice), FIELD_DOUBLE},
+	{"SettlementPrice", &KEY_SettlementPrice, offsetof(CThostFtdcDepthMarketDataField, SettlementPrice), sizeof(CThostFtdcDepthMarketDataField::SettlementPrice), FIELD_DOUBLE},
+	{"UpperLimitPrice", &KEY_UpperLimitPrice, offsetof(CThostFtdcDepthMarketDataField, UpperLimitPrice), sizeof(CThostFtdcDepthMarketDataField::UpperLimitPrice), FIELD_DOUBLE},
+	{"LowerLimitPrice", &KEY_LowerLimitPrice, offsetof(CThostFtdcDepthMarketDataField, LowerLimitPrice), sizeof(CThostFtdcDepthMarketDataField::LowerLimitPrice), FIELD_DOUBLE},
+	{"PreDelta", &KEY_PreDelta, offsetof(CThostFtdcDepthMarketDataField, PreDelta), sizeof(CThostFtdcDepthMarketDataField::PreDelta), FIELD_DOUBLE},
+	{"CurrDelta", &KEY_CurrDelta, offsetof(CThostFtdcDepthMarketDataField, CurrDelta), sizeof(CThostFtdcDepthMarketDataField::CurrDelta), FIELD_DOUBLE},
+	{"UpdateTime", &KEY_UpdateTime, offsetof(CThostFtdcDepthMarketDataField, UpdateTime), sizeof(CThostFtdcDepthMarketDataField::UpdateTime), FIELD_ASCII},
+	{"UpdateMillisec", &KEY_UpdateMillisec, offsetof(CThostFtdcDepthMarketDataField, UpdateMillisec), sizeof(CThostFtdcDepthMarketDataField::UpdateMillisec), FIELD_INT},
+	{"BidPrice1", &KEY_BidPrice1, offsetof(CThostFtdcDepthMarketDataField, BidPrice1), sizeof(CThostFtdcDepthMarketDataField::BidPrice1), FIELD_DOUBLE},
+	{"BidVolume1", &KEY_BidVolume1, offsetof(CThostFtdcDepthMarketDataField, BidVolume1), sizeof(CThostFtdcDepthMarketDataField::BidVolume1), FIELD_INT},
+	{"AskPrice1", &KEY_AskPrice1, offsetof(CThostFtdcDepthMarketDataField, AskPrice1), sizeof(CThostFtdcDepthMarketDataField::AskPrice1), FIELD_DOUBLE},
+	{"AskVolume1", &KEY_AskVolume1, offsetof(CThostFtdcDepthMarketDataField, AskVolume1), sizeof(CThostFtdcDepthMarketDataField::AskVolume1), FIELD_INT},
+	{"BidPrice2", &KEY_BidPrice2, offsetof(CThostFtdcDepthMarketDataField, BidPrice2), sizeof(CThostFtdcDepthMarketDataField::BidPrice2), FIELD_DOUBLE},
+	{"BidVolume2", &KEY_BidVolume2, offsetof(CThostFtdcDepthMarketDataField, BidVolume2), sizeof(CThostFtdcDepthMarketDataField::BidVolume2), FIELD_INT},
+	{"AskPrice2", &KEY_AskPrice2, offsetof(CThostFtdcDepthMarketDataField, AskPrice2), sizeof(CThostFtdcDepthMarketDataField::AskPrice2), FIELD_DOUBLE},
+	{"AskVolume2", &KEY_AskVolume2, offsetof(CThostFtdcDepthMarketDataField, AskVolume2), sizeof(CThostFtdcDepthMarketDataField::AskVolume2), FIELD_INT},
+	{"BidPrice3", &KEY_BidPrice3, offsetof(CThostFtdcDepthMarketDataField, BidPrice3), sizeof(CThostFtdcDepthMarketDataField::BidPrice3), FIELD_DOUBLE},
+	{"BidVolume3", &KEY_BidVolume3, offsetof(CThostFtdcDepthMarketDataField, BidVolume3), sizeof(CThostFtdcDepthMarketDataField::BidVolume3), FIELD_INT},
+	{"AskPrice3", &KEY_AskPrice3, offsetof(CThostFtdcDepthMarketDataField, AskPrice3), sizeof(CThostFtdcDepthMarketDataField::AskPrice3), FIELD_DOUBLE},
+	{"AskVolume3", &KEY_AskVolume3, offsetof(CThostFtdcDepthMarketDataField, AskVolume3), sizeof(CThostFtdcDepthMarketDataField::AskVolume3), FIELD_INT},
+	{"BidPrice4", &KEY_BidPrice4, offsetof(CThostFtdcDepthMarketDataField, BidPrice4), sizeof(CThostFtdcDepthMarketDataField::BidPrice4), FIELD_DOUBLE},
+	{"BidVolume4", &KEY_BidVolume4, offsetof(CThostFtdcDepthMarketDataField, BidVolume4), sizeof(CThostFtdcDepthMarketDataField::BidVolume4), FIELD_INT},
+	{"AskPrice4", &KEY_AskPrice4, offsetof(CThostFtdcDepthMarketDataField, AskPrice4), sizeof(CThostFtdcDepthMarketDataField::AskPrice4), FIELD_DOUBLE},
+	{"AskVolume4", &KEY_AskVolume4, offsetof(CThostFtdcDepthMarketDataField, AskVolume4), sizeof(CThostFtdcDepthMarketDataField::AskVolume4), FIELD_INT},
+	{"BidPrice5", &KEY_BidPrice5, offsetof(CThostFtdcDepthMarketDataField, BidPrice5), sizeof(CThostFtdcDepthMarketDataField::BidPrice5), FIELD_DOUBLE},
+	{"BidVolume5", &KEY_BidVolume5, offsetof(CThostFtdcDepthMarketDataField, BidVolume5), sizeof(CThostFtdcDepthMarketDataField::BidVolume5), FIELD_INT},
+	{"AskPrice5", &KEY_AskPrice5, offsetof(CThostFtdcDepthMarketDataField, AskPrice5), sizeof(CThostFtdcDepthMarketDataField::AskPrice5), FIELD_DOUBLE},
+	{"AskVolume5", &KEY_AskVolume5, offsetof(CThostFtdcDepthMarketDataField, AskVolume5), sizeof(CThostFtdcDepthMarketDataField::AskVolume5), FIELD_INT},
+	{"AveragePrice", &KEY_AveragePrice, offsetof(CThostFtdcDepthMarketDataField, AveragePrice), sizeof(CThostFtdcDepthMarketDataField::AveragePrice), FIELD_DOUBLE},
+	{"ActionDay", &KEY_ActionDay, offsetof(CThostFtdcDepthMarketDataField, ActionDay), sizeof(CThostFtdcDepthMarketDataField::ActionDay), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcDepthMarketDataField, InstrumentID), sizeof(CThostFtdcDepthMarketDataField::InstrumentID), FIELD_ASCII},
+	{"ExchangeInstID", &KEY_ExchangeInstID, offsetof(CThostFtdcDepthMarketDataField, ExchangeInstID), sizeof(CThostFtdcDepthMarketDataField::ExchangeInstID), FIELD_ASCII},
+	{"BandingUpperPrice", &KEY_BandingUpperPrice, offsetof(CThostFtdcDepthMarketDataField, BandingUpperPrice), sizeof(CThostFtdcDepthMarketDataField::BandingUpperPrice), FIELD_DOUBLE},
+	{"BandingLowerPrice", &KEY_BandingLowerPrice, offsetof(CThostFtdcDepthMarketDataField, BandingLowerPrice), sizeof(CThostFtdcDepthMarketDataField::BandingLowerPrice), FIELD_DOUBLE},
+};
+
+static const FieldDesc ForQuoteRspFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcForQuoteRspField, TradingDay), sizeof(CThostFtdcForQuoteRspField::TradingDay), FIELD_ASCII},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcForQuoteRspField, reserve1), sizeof(CThostFtdcForQuoteRspField::reserve1), FIELD_ASCII},
+	{"ForQuoteSysID", &KEY_ForQuoteSysID, offsetof(CThostFtdcForQuoteRspField, ForQuoteSysID), sizeof(CThostFtdcForQuoteRspField::ForQuoteSysID), FIELD_ASCII},
+	{"ForQuoteTime", &KEY_ForQuoteTime, offsetof(CThostFtdcForQuoteRspField, ForQuoteTime), sizeof(CThostFtdcForQuoteRspField::ForQuoteTime), FIELD_ASCII},
+	{"ActionDay", &KEY_ActionDay, offsetof(CThostFtdcForQuoteRspField, ActionDay), sizeof(CThostFtdcForQuoteRspField::ActionDay), FIELD_ASCII},
+	{"ExchangeID", &KEY_ExchangeID, offsetof(CThostFtdcForQuoteRspField, ExchangeID), sizeof(CThostFtdcForQuoteRspField::ExchangeID), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcForQuoteRspField, InstrumentID), sizeof(CThostFtdcForQuoteRspField::InstrumentID), FIELD_ASCII},
+};
+
+static const FieldDesc ReqUserLoginFields[] = {
+	{"TradingDay", &KEY_TradingDay, offsetof(CThostFtdcReqUserLoginField, TradingDay), sizeof(CThostFtdcReqUserLoginField::TradingDay), FIELD_ASCII},
+	{"BrokerID", &KEY_BrokerID, offsetof(CThostFtdcReqUserLoginField, BrokerID), sizeof(CThostFtdcReqUserLoginField::BrokerID), FIELD_ASCII},
+	{"UserID", &KEY_UserID, offsetof(CThostFtdcReqUserLoginField, UserID), sizeof(CThostFtdcReqUserLoginField::UserID), FIELD_ASCII},
+	{"Password", &KEY_Password, offsetof(CThostFtdcReqUserLoginField, Password), sizeof(CThostFtdcReqUserLoginField::Password), FIELD_GBK},
+	{"UserProductInfo", &KEY_UserProductInfo, offsetof(CThostFtdcReqUserLoginField, UserProductInfo), sizeof(CThostFtdcReqUserLoginField::UserProductInfo), FIELD_GBK},
+	{"InterfaceProductInfo", &KEY_InterfaceProductInfo, offsetof(CThostFtdcReqUserLoginField, InterfaceProductInfo), sizeof(CThostFtdcReqUserLoginField::InterfaceProductInfo), FIELD_GBK},
+	{"ProtocolInfo", &KEY_ProtocolInfo, offsetof(CThostFtdcReqUserLoginField, ProtocolInfo), sizeof(CThostFtdcReqUserLoginField::ProtocolInfo), FIELD_GBK},
+	{"MacAddress", &KEY_MacAddress, offsetof(CThostFtdcReqUserLoginField, MacAddress), sizeof(CThostFtdcReqUserLoginField::MacAddress), FIELD_ASCII},
+	{"OneTimePassword", &KEY_OneTimePassword, offsetof(CThostFtdcReqUserLoginField, OneTimePassword), sizeof(CThostFtdcReqUserLoginField::OneTimePassword), FIELD_GBK},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcReqUserLoginField, reserve1), sizeof(CThostFtdcReqUserLoginField::reserve1), FIELD_ASCII},
+	{"LoginRemark", &KEY_LoginRemark, offsetof(CThostFtdcReqUserLoginField, LoginRemark), sizeof(CThostFtdcReqUserLoginField::LoginRemark), FIELD_GBK},
+	{"ClientIPPort", &KEY_ClientIPPort, offsetof(CThostFtdcReqUserLoginField, ClientIPPort), sizeof(CThostFtdcReqUserLoginField::ClientIPPort), FIELD_INT},
+	{"ClientIPAddress", &KEY_ClientIPAddress, offsetof(CThostFtdcReqUserLoginField, ClientIPAddress), sizeof(CThostFtdcReqUserLoginField::ClientIPAddress), FIELD_ASCII},
+};
+
+static const FieldDesc QryMulticastInstrumentFields[] = {
+	{"TopicID", &KEY_TopicID, offsetof(CThostFtdcQryMulticastInstrumentField, TopicID), sizeof(CThostFtdcQryMulticastInstrumentField::TopicID), FIELD_INT},
+	{"reserve1", &KEY_reserve1, offsetof(CThostFtdcQryMulticastInstrumentField, reserve1), sizeof(CThostFtdcQryMulticastInstrumentField::reserve1), FIELD_ASCII},
+	{"InstrumentID", &KEY_InstrumentID, offsetof(CThostFtdcQryMulticastInstrumentField, InstrumentID), sizeof(CThostFtdcQryMulticastInstrumentField::InstrumentID), FIELD_ASCII},
+};
+
+static const char *CALLBACK_NAMES[CALLBACK_COUNT] = {
+	"onFrontConnected",
+	"onFrontDisconnected",
+	"onHeartBeatWarning",
+	"onRspUserLogin",
+	"onRspUserLogout",
+	"onRspQryMulticastInstrument",
+	"onRspError",
+	"onRspSubMarketData",
+	"onRspUnSubMarketData",
+	"onRspSubForQuoteRsp",
+	"onRspUnSubForQuoteRsp",
+	"onRtnDepthMarketData",
+	"onRtnForQuoteRsp",
+};
+
+static const CallbackDesc CALLBACKS[CALLBACK_COUNT] = {
+	{0, nullptr, 0, 0},
+	{CALLBACK_ARG_ID, nullptr, 0, 0},
+	{CALLBACK_ARG_ID, nullptr, 0, 0},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, RspUserLoginFields, std::size(RspUserLoginFields), sizeof(CThostFtdcRspUserLoginField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, UserLogoutFields, std::size(UserLogoutFields), sizeof(CThostFtdcUserLogoutField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, MulticastInstrumentFields, std::size(MulticastInstrumentFields), sizeof(CThostFtdcMulticastInstrumentField)},
+	{CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, nullptr, 0, 0},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA | CALLBACK_ARG_ERROR | CALLBACK_ARG_ID | CALLBACK_ARG_LAST, SpecificInstrumentFields, std::size(SpecificInstrumentFields), sizeof(CThostFtdcSpecificInstrumentField)},
+	{CALLBACK_ARG_DATA, DepthMarketDataFields, std::size(DepthMarketDataFields), sizeof(CThostFtdcDepthMarketDataField)},
+	{CALLBACK_ARG_DATA, ForQuoteRspFields, std::size(ForQuoteRspFields), sizeof(CThostFtdcForQuoteRspField)},
+};
+
+
 ///-------------------------------------------------------------------------------------
 ///C++Ļصݱ浽
 ///-------------------------------------------------------------------------------------
 
-void MdApi::OnFrontConnected()
+void MdApi::pushTask(int task_name, const void *data, const CThostFtdcRspInfoField *error, int reqid, bool last)
 {
+	this->native_hook.callSpi(task_name, data, error, reqid, last);
+
+	//ֻPython˻صע߳еԭصʱд
+	if (!this->overrides[task_name] && !this->native_hook.dispatches(task_name))
+		return;
+
 	Task task = Task();
-	task.task_name = ONFRONTCONNECTED;
+	task.task_name = task_name;
+	if (data)
+		task.task_data = this->data_pools[task_name]->acquire(data);
+	if (error)
+		task.task_error = this->pool_RspInfo.alloc(*error);
+	task.task_id = reqid;
+	task.task_last = last;
 	this->task_queue.push(task);
 };
 
+void MdApi::OnFrontConnected()
+{
+	this->pushTask(ONFRONTCONNECTED, nullptr, nullptr, 0, false);
+};
+
 void MdApi::OnFrontDisconnected(int nReason)
 {
-	Task task = Task();
-	task.task_name = ONFRONTDISCONNECTED;
-	task.task_id = nReason;
-	this->task_queue.push(task);
+	this->pushTask(ONFRONTDISCONNECTED, nullptr, nullptr, nReason, false);
 };
 
 void MdApi::OnHeartBeatWarning(int nTimeLapse)
 {
-	Task task = Task();
-	task.task_name = ONHEARTBEATWARNING;
-	task.task_id = nTimeLapse;
-	this->task_queue.push(task);
+	this->pushTask(ONHEARTBEATWARNING, nullptr, nullptr, nTimeLapse, false);
 };
 
 void MdApi::OnRspUserLogin(CThostFtdcRspUserLoginField *pRspUserLogin, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERLOGIN;
-	if (pRspUserLogin)
-	{
-		CThostFtdcRspUserLoginField *task_data = new CThostFtdcRspUserLoginField();
-		*task_data = *pRspUserLogin;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERLOGIN, pRspUserLogin, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspUserLogout(CThostFtdcUserLogoutField *pUserLogout, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPUSERLOGOUT;
-	if (pUserLogout)
-	{
-		CThostFtdcUserLogoutField *task_data = new CThostFtdcUserLogoutField();
-		*task_data = *pUserLogout;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUSERLOGOUT, pUserLogout, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspQryMulticastInstrument(CThostFtdcMulticastInstrumentField *pMulticastInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPQRYMULTICASTINSTRUMENT;
-	if (pMulticastInstrument)
-	{
-		CThostFtdcMulticastInstrumentField *task_data = new CThostFtdcMulticastInstrumentField();
-		*task_data = *pMulticastInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPQRYMULTICASTINSTRUMENT, pMulticastInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspError(CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPERROR;
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPERROR, nullptr, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPSUBMARKETDATA;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPSUBMARKETDATA, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspUnSubMarketData(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPUNSUBMARKETDATA;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUNSUBMARKETDATA, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPSUBFORQUOTERSP;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPSUBFORQUOTERSP, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRspUnSubForQuoteRsp(CThostFtdcSpecificInstrumentField *pSpecificInstrument, CThostFtdcRspInfoField *pRspInfo, int nRequestID, bool bIsLast)
 {
-	Task task = Task();
-	task.task_name = ONRSPUNSUBFORQUOTERSP;
-	if (pSpecificInstrument)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = new CThostFtdcSpecificInstrumentField();
-		*task_data = *pSpecificInstrument;
-		task.task_data = task_data;
-	}
-	if (pRspInfo)
-	{
-		CThostFtdcRspInfoField *task_error = new CThostFtdcRspInfoField();
-		*task_error = *pRspInfo;
-		task.task_error = task_error;
-	}
-	task.task_id = nRequestID;
-	task.task_last = bIsLast;
-	this->task_queue.push(task);
+	this->pushTask(ONRSPUNSUBFORQUOTERSP, pSpecificInstrument, pRspInfo, nRequestID, bIsLast);
 };
 
 void MdApi::OnRtnDepthMarketData(CThostFtdcDepthMarketDataField *pDepthMarketData)
 {
+	if (this->tick_bus.active() && pDepthMarketData)
+		this->tick_bus.publish(*pDepthMarketData);
+
+	if (this->tick_recorder.active() && pDepthMarketData)
+		this->tick_recorder.publish(*pDepthMarketData);
+
+	this->native_hook.callSpi(ONRTNDEPTHMARKETDATA, pDepthMarketData, nullptr, 0, false);
+
+	if (!this->overrides[ONRTNDEPTHMARKETDATA] && !this->native_hook.dispatches(ONRTNDEPTHMARKETDATA))
+		return;
+
+	if ((this->conflate || this->task_queue.overloaded()) && pDepthMarketData)
+	{
+		if (this->conflate_table.update(pDepthMarketData->InstrumentID, *pDepthMarketData, this->pool_DepthMarketData))
+		{
+			Task task = Task();
+			task.task_name = TASK_CONFLATED;
+			this->task_queue.push(task);
+		}
+		return;
+	}
+
 	Task task = Task();
 	task.task_name = ONRTNDEPTHMARKETDATA;
 	if (pDepthMarketData)
 	{
-		CThostFtdcDepthMarketDataField *task_data = new CThostFtdcDepthMarketDataField();
-		*task_data = *pDepthMarketData;
-		task.task_data = task_data;
+		task.task_data = this->pool_DepthMarketData.alloc(*pDepthMarketData);
 	}
 	this->task_queue.push(task);
 };
 
 void MdApi::OnRtnForQuoteRsp(CThostFtdcForQuoteRspField *pForQuoteRsp)
 {
-	Task task = Task();
-	task.task_name = ONRTNFORQUOTERSP;
-	if (pForQuoteRsp)
-	{
-		CThostFtdcForQuoteRspField *task_data = new CThostFtdcForQuoteRspField();
-		*task_data = *pForQuoteRsp;
-		task.task_data = task_data;
-	}
-	this->task_queue.push(task);
+	this->pushTask(ONRTNFORQUOTERSP, pForQuoteRsp, nullptr, 0, false);
 };
 
 ///-------------------------------------------------------------------------------------
@@ -227,90 +456,18 @@ void MdApi::processTask()
 {
     try
     {
+        vector<Task> tasks;
+
         while (this->active)
         {
-            Task task = this->task_queue.pop();
-            
-            switch (task.task_name)
-            {
-			case ONFRONTCONNECTED:
-			{
-				this->processFrontConnected(&task);
-				break;
-			}
-
-			case ONFRONTDISCONNECTED:
-			{
-				this->processFrontDisconnected(&task);
-				break;
-			}
-
-			case ONHEARTBEATWARNING:
-			{
-				this->processHeartBeatWarning(&task);
-				break;
-			}
-
-			case ONRSPUSERLOGIN:
-			{
-				this->processRspUserLogin(&task);
-				break;
-			}
-
-			case ONRSPUSERLOGOUT:
-			{
-				this->processRspUserLogout(&task);
-				break;
-			}
-
-			case ONRSPQRYMULTICASTINSTRUMENT:
-			{
-				this->processRspQryMulticastInstrument(&task);
-				break;
-			}
-
-			case ONRSPERROR:
-			{
-				this->processRspError(&task);
-				break;
-			}
-
-			case ONRSPSUBMARKETDATA:
-			{
-				this->processRspSubMarketData(&task);
-				break;
-			}
-
-			case ONRSPUNSUBMARKETDATA:
-			{
-				this->processRspUnSubMarketData(&task);
-				break;
-			}
-
-			case ONRSPSUBFORQUOTERSP:
-			{
-				this->processRspSubForQuoteRsp(&task);
-				break;
-			}
-
-			case ONRSPUNSUBFORQUOTERSP:
-			{
-				this->processRspUnSubForQuoteRsp(&task);
-				break;
-			}
-
-			case ONRTNDEPTHMARKETDATA:
-			{
-				this->processRtnDepthMarketData(&task);
-				break;
-			}
-
-			case ONRTNFORQUOTERSP:
-			{
-				this->processRtnForQuoteRsp(&task);
-				break;
-			}
-            };
+            this->task_queue.popBatch(tasks, this->batch_size);
+
+            //ԭصڻȡGIL֮ǰ
+            this->native_hook.dispatch(tasks);
+
+            //ÿֻȡһGIL
+            gil_scoped_acquire acquire;
+            this->processTasks(tasks);
         }
     }
     catch (const TerminatedError&)
@@ -318,287 +475,187 @@ void MdApi::processTask()
     }
 };
 
-void MdApi::processFrontConnected(Task *task)
+void MdApi::processTasks(vector<Task> &tasks)
 {
-	gil_scoped_acquire acquire;
-	this->onFrontConnected();
-};
+    //лѹﵽˮλʱ֪ͨPython
+    size_t backlog = 0;
+    if (this->task_queue.checkWatermark(backlog))
+        this->onQueueWatermark((int)backlog);
 
-void MdApi::processFrontDisconnected(Task *task)
-{
-	gil_scoped_acquire acquire;
-	this->onFrontDisconnected(task->task_id);
-};
+    for (size_t i = 0; i < tasks.size(); i++)
+    {
+        Task &task = tasks[i];
 
-void MdApi::processHeartBeatWarning(Task *task)
-{
-	gil_scoped_acquire acquire;
-	this->onHeartBeatWarning(task->task_id);
-};
+        //ϲģʽ´ӺϲȡÿԼµ
+        if (task.task_name == TASK_CONFLATED)
+        {
+            LatencyTimer timer(this->latency_stats, task, ONRTNDEPTHMARKETDATA);
+            this->processConflated();
+            continue;
+        }
 
-void MdApi::processRspUserLogin(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcRspUserLoginField *task_data = (CThostFtdcRspUserLoginField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["LoginTime"] = toUtf(task_data->LoginTime);
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		data["SystemName"] = toUtf(task_data->SystemName);
-		data["FrontID"] = task_data->FrontID;
-		data["SessionID"] = task_data->SessionID;
-		data["MaxOrderRef"] = toUtf(task_data->MaxOrderRef);
-		data["SHFETime"] = toUtf(task_data->SHFETime);
-		data["DCETime"] = toUtf(task_data->DCETime);
-		data["CZCETime"] = toUtf(task_data->CZCETime);
-		data["FFEXTime"] = toUtf(task_data->FFEXTime);
-		data["INETime"] = toUtf(task_data->INETime);
-		data["SysVersion"] = toUtf(task_data->SysVersion);
-		data["GFEXTime"] = toUtf(task_data->GFEXTime);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspUserLogin(data, error, task->task_id, task->task_last);
-};
+        //ֻעԭص͵Python
+        if (!this->overrides[task.task_name])
+        {
+            this->releaseTask(&task);
+            continue;
+        }
 
-void MdApi::processRspUserLogout(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcUserLogoutField *task_data = (CThostFtdcUserLogoutField*)task->task_data;
-		data["BrokerID"] = toUtf(task_data->BrokerID);
-		data["UserID"] = toUtf(task_data->UserID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspUserLogout(data, error, task->task_id, task->task_last);
+        //ͺϲΪбͨص
+        if (task.task_name == ONRTNDEPTHMARKETDATA && this->batch_override)
+        {
+            LatencyTimer timer(this->latency_stats, task, ONRTNDEPTHMARKETDATA);
+
+            list data;
+            while (i < tasks.size() && tasks[i].task_name == ONRTNDEPTHMARKETDATA)
+            {
+                timer.merge(tasks[i]);
+                data.append(this->convertRtnDepthMarketData(&tasks[i]));
+                i++;
+            }
+            i--;
+
+            this->onRtnDepthMarketDataBatch(data);
+            continue;
+        }
+
+        LatencyTimer timer(this->latency_stats, task, task.task_name);
+
+        if (task.task_name == ONRTNDEPTHMARKETDATA)
+            this->processRtnDepthMarketData(&task);
+        else
+            this->processCallback(&task);
+    }
 };
 
-void MdApi::processRspQryMulticastInstrument(Task *task)
+void MdApi::processConflated()
 {
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcMulticastInstrumentField *task_data = (CThostFtdcMulticastInstrumentField*)task->task_data;
-		data["TopicID"] = task_data->TopicID;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentNo"] = task_data->InstrumentNo;
-		data["CodePrice"] = task_data->CodePrice;
-		data["VolumeMultiple"] = task_data->VolumeMultiple;
-		data["PriceTick"] = task_data->PriceTick;
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
-	if (task->task_error)
+	this->conflate_table.take(this->conflate_data);
+
+	if (this->native_hook.dispatches(ONRTNDEPTHMARKETDATA))
 	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		gil_scoped_release release;
+		this->native_hook.dispatch(ONRTNDEPTHMARKETDATA, this->conflate_data);
 	}
-	this->onRspQryMulticastInstrument(data, error, task->task_id, task->task_last);
-};
 
-void MdApi::processRspError(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict error;
-	if (task->task_error)
+	if (!this->overrides[ONRTNDEPTHMARKETDATA])
 	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		for (CThostFtdcDepthMarketDataField *task_data : this->conflate_data)
+			this->pool_DepthMarketData.free(task_data);
+		return;
 	}
-	this->onRspError(error, task->task_id, task->task_last);
-};
 
-void MdApi::processRspSubMarketData(Task *task)
-{
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
+	Task task = Task();
+	task.task_name = ONRTNDEPTHMARKETDATA;
+
+	if (this->batch_override)
 	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		if (this->conflate_data.empty())
+			return;
+
+		list data;
+		for (CThostFtdcDepthMarketDataField *task_data : this->conflate_data)
+		{
+			task.task_data = task_data;
+			data.append(this->convertRtnDepthMarketData(&task));
+		}
+		this->onRtnDepthMarketDataBatch(data);
+		return;
 	}
-	dict error;
-	if (task->task_error)
+
+	for (CThostFtdcDepthMarketDataField *task_data : this->conflate_data)
 	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		task.task_data = task_data;
+		this->processRtnDepthMarketData(&task);
 	}
-	this->onRspSubMarketData(data, error, task->task_id, task->task_last);
 };
 
-void MdApi::processRspUnSubMarketData(Task *task)
+void MdApi::processCallback(Task *task)
 {
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
+	const CallbackDesc &desc = CALLBACKS[task->task_name];
+
+	//CTPصеĲ˳װPythonصĲ
+	list args;
+	if (desc.args & CALLBACK_ARG_DATA)
+		args.append(task->task_data ? structToDict(desc.fields, desc.count, task->task_data) : dict());
+	if (desc.args & CALLBACK_ARG_ERROR)
+		args.append(task->task_error ? structToDict(RspInfoFields, task->task_error) : dict());
+	if (desc.args & CALLBACK_ARG_ID)
+		args.append(task->task_id);
+	if (desc.args & CALLBACK_ARG_LAST)
+		args.append(task->task_last);
+
+	this->releaseTask(task);
+
+	try
 	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		pybind11::function callback = get_overload(this, CALLBACK_NAMES[task->task_name]);
+		if (callback)
+			callback(*args);
 	}
-	dict error;
-	if (task->task_error)
+	catch (const error_already_set &e)
 	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		cout << e.what() << endl;
 	}
-	this->onRspUnSubMarketData(data, error, task->task_id, task->task_last);
 };
 
-void MdApi::processRspSubForQuoteRsp(Task *task)
+void MdApi::releaseTask(Task *task)
 {
-	gil_scoped_acquire acquire;
-	dict data;
 	if (task->task_data)
-	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	dict error;
+		this->data_pools[task->task_name]->release(task->task_data);
 	if (task->task_error)
-	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
-	}
-	this->onRspSubForQuoteRsp(data, error, task->task_id, task->task_last);
+		this->pool_RspInfo.free((CThostFtdcRspInfoField*)task->task_error);
 };
 
-void MdApi::processRspUnSubForQuoteRsp(Task *task)
+object MdApi::convertRtnDepthMarketData(Task *task)
 {
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
+	if (this->data_mode == DATA_MODE_RAW)
 	{
-		CThostFtdcSpecificInstrumentField *task_data = (CThostFtdcSpecificInstrumentField*)task->task_data;
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
+		object data = none();
+		if (task->task_data)
+		{
+			CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
+			data = bytes((const char*)task_data, sizeof(CThostFtdcDepthMarketDataField));
+			this->pool_DepthMarketData.free(task_data);
+		}
+		return data;
 	}
-	dict error;
-	if (task->task_error)
+
+	if (this->data_mode == DATA_MODE_OBJECT)
 	{
-		CThostFtdcRspInfoField *task_error = (CThostFtdcRspInfoField*)task->task_error;
-		error["ErrorID"] = task_error->ErrorID;
-		error["ErrorMsg"] = toUtf(task_error->ErrorMsg);
-		delete task_error;
+		object data = none();
+		if (task->task_data)
+		{
+			CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
+			data = cast(*task_data);
+			this->pool_DepthMarketData.free(task_data);
+		}
+		return data;
 	}
-	this->onRspUnSubForQuoteRsp(data, error, task->task_id, task->task_last);
-};
 
-void MdApi::processRtnDepthMarketData(Task *task)
-{
-	gil_scoped_acquire acquire;
 	dict data;
 	if (task->task_data)
 	{
 		CThostFtdcDepthMarketDataField *task_data = (CThostFtdcDepthMarketDataField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["reserve2"] = toUtf(task_data->reserve2);
-		data["LastPrice"] = task_data->LastPrice;
-		data["PreSettlementPrice"] = task_data->PreSettlementPrice;
-		data["PreClosePrice"] = task_data->PreClosePrice;
-		data["PreOpenInterest"] = task_data->PreOpenInterest;
-		data["OpenPrice"] = task_data->OpenPrice;
-		data["HighestPrice"] = task_data->HighestPrice;
-		data["LowestPrice"] = task_data->LowestPrice;
-		data["Volume"] = task_data->Volume;
-		data["Turnover"] = task_data->Turnover;
-		data["OpenInterest"] = task_data->OpenInterest;
-		data["ClosePrice"] = task_data->ClosePrice;
-		data["SettlementPrice"] = task_data->SettlementPrice;
-		data["UpperLimitPrice"] = task_data->UpperLimitPrice;
-		data["LowerLimitPrice"] = task_data->LowerLimitPrice;
-		data["PreDelta"] = task_data->PreDelta;
-		data["CurrDelta"] = task_data->CurrDelta;
-		data["UpdateTime"] = toUtf(task_data->UpdateTime);
-		data["UpdateMillisec"] = task_data->UpdateMillisec;
-		data["BidPrice1"] = task_data->BidPrice1;
-		data["BidVolume1"] = task_data->BidVolume1;
-		data["AskPrice1"] = task_data->AskPrice1;
-		data["AskVolume1"] = task_data->AskVolume1;
-		data["BidPrice2"] = task_data->BidPrice2;
-		data["BidVolume2"] = task_data->BidVolume2;
-		data["AskPrice2"] = task_data->AskPrice2;
-		data["AskVolume2"] = task_data->AskVolume2;
-		data["BidPrice3"] = task_data->BidPrice3;
-		data["BidVolume3"] = task_data->BidVolume3;
-		data["AskPrice3"] = task_data->AskPrice3;
-		data["AskVolume3"] = task_data->AskVolume3;
-		data["BidPrice4"] = task_data->BidPrice4;
-		data["BidVolume4"] = task_data->BidVolume4;
-		data["AskPrice4"] = task_data->AskPrice4;
-		data["AskVolume4"] = task_data->AskVolume4;
-		data["BidPrice5"] = task_data->BidPrice5;
-		data["BidVolume5"] = task_data->BidVolume5;
-		data["AskPrice5"] = task_data->AskPrice5;
-		data["AskVolume5"] = task_data->AskVolume5;
-		data["AveragePrice"] = task_data->AveragePrice;
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		data["ExchangeInstID"] = toUtf(task_data->ExchangeInstID);
-		data["BandingUpperPrice"] = task_data->BandingUpperPrice;
-		data["BandingLowerPrice"] = task_data->BandingLowerPrice;
-		delete task_data;
+		if (!this->tick_fields.empty())
+		{
+			data = newDict(this->tick_fields.size());
+			for (const FieldDesc *field : this->tick_fields)
+				setField(data, *field, task_data);
+		}
+		else
+		{
+			data = structToDict(DepthMarketDataFields, task_data);
+		}
+		this->pool_DepthMarketData.free(task_data);
 	}
-	this->onRtnDepthMarketData(data);
+	return data;
 };
 
-void MdApi::processRtnForQuoteRsp(Task *task)
+void MdApi::processRtnDepthMarketData(Task *task)
 {
-	gil_scoped_acquire acquire;
-	dict data;
-	if (task->task_data)
-	{
-		CThostFtdcForQuoteRspField *task_data = (CThostFtdcForQuoteRspField*)task->task_data;
-		data["TradingDay"] = toUtf(task_data->TradingDay);
-		data["reserve1"] = toUtf(task_data->reserve1);
-		data["ForQuoteSysID"] = toUtf(task_data->ForQuoteSysID);
-		data["ForQuoteTime"] = toUtf(task_data->ForQuoteTime);
-		data["ActionDay"] = toUtf(task_data->ActionDay);
-		data["ExchangeID"] = toUtf(task_data->ExchangeID);
-		data["InstrumentID"] = toUtf(task_data->InstrumentID);
-		delete task_data;
-	}
-	this->onRtnForQuoteRsp(data);
+	object data = this->convertRtnDepthMarketData(task);
+	this->onRtnDepthMarketData(data);
 };
 
 ///-------------------------------------------------------------------------------------
@@ -616,16 +673,50 @@ void MdApi::release()
 	this->api->Release();
 };
 
-void MdApi::init()
+void MdApi::init(string dispatch)
 {
+	this->dispatch_mode = getDispatchMode(dispatch);
 	this->active = true;
-	this->task_thread = thread(&MdApi::processTask, this);
+	this->checkOverrides();
+	this->batch_override = bool(get_overload(this, "onRtnDepthMarketDataBatch"));
 
+	//pollģʽ²̣߳Ӧópoll
+	if (this->dispatch_mode == DISPATCH_THREAD)
+		this->task_thread = thread(&MdApi::processTask, this);
+
+	gil_scoped_release release;
 	this->api->Init();
 };
 
+int MdApi::poll(int max_events, int64_t timeout_us)
+{
+	if (this->dispatch_mode != DISPATCH_POLL)
+		throw runtime_error("poll is only available after init(dispatch=\"poll\")");
+
+	if (max_events <= 0)
+		throw invalid_argument("max_events must be positive");
+
+	vector<Task> tasks;
+	{
+		//ȴ͵ԭصڼͷGIL
+		gil_scoped_release release;
+		this->task_queue.pollBatch(tasks, max_events, timeout_us);
+		this->native_hook.dispatch(tasks);
+	}
+
+	this->processTasks(tasks);
+	this->task_queue.rearm();
+	return (int)tasks.size();
+};
+
+int MdApi::fileno()
+{
+	return this->task_queue.fileno();
+};
+
 int MdApi::join()
 {
+	gil_scoped_release release;
 	int i = this->api->Join();
 	return i;
 };
@@ -633,12 +724,19 @@ int MdApi::join()
 int MdApi::exit()
 {
 	this->active = false;
-    this->task_queue.terminate();
-    this->task_thread.join();
+	//߳̿ڵȴGILͷGILٵȴ߳˳
+	gil_scoped_release release;
+
+	this->task_queue.terminate();
+	if (this->task_thread.joinable())
+		this->task_thread.join();
 
 	this->api->RegisterSpi(NULL);
 	this->api->Release();
 	this->api = NULL;
+
+	//CTPص߳Ѿֹͣд¼еݺ
+	this->tick_recorder.close();
 	return 1;
 };
 
@@ -656,14 +754,156 @@ string MdApi::getApiVersion()
 
 void MdApi::registerFront(string pszFrontAddress)
 {
+	gil_scoped_release release;
 	this->api->RegisterFront((char*)pszFrontAddress.c_str());
 };
 
 void MdApi::registerNameServer(string pszNsAddress)
 {
+	gil_scoped_release release;
 	this->api->RegisterNameServer((char*)pszNsAddress.c_str());
 };
 
+void MdApi::setDataMode(string mode)
+{
+	this->data_mode = getDataMode(mode);
+};
+
+void MdApi::setRequestMode(string mode)
+{
+	this->request_mode = getRequestMode(mode);
+};
+
+void MdApi::setNativeCallback(const object &capsule, const list &callbacks, string thread)
+{
+	this->native_hook.set(capsule, callbacks, CALLBACK_NAMES, CALLBACK_COUNT, getNativeThread(thread));
+};
+
+void MdApi::setTickBus(string path, int capacity)
+{
+	if (path.empty())
+		this->tick_bus.close();
+	else
+		this->tick_bus.open(path, capacity);
+};
+
+dict MdApi::getTickBusStats()
+{
+	return this->tick_bus.stats();
+};
+
+void MdApi::setTickRecorder(string path, int64_t segment_size, int64_t flush_bytes, int flush_interval_ms, string fsync)
+{
+	if (path.empty())
+	{
+		//ȴ¼߳дʣݺҪ̣ڼͷGIL
+		gil_scoped_release release;
+		this->tick_recorder.close();
+	}
+	else
+		this->tick_recorder.open(path, segment_size, flush_bytes, flush_interval_ms, fsync);
+};
+
+dict MdApi::getTickRecorderStats()
+{
+	return this->tick_recorder.stats();
+};
+
+void MdApi::setTickFields(const list &fields)
+{
+	vector<const FieldDesc*> tick_fields;
+
+	for (handle item : fields)
+	{
+		string name = item.cast<string>();
+
+		const FieldDesc *field = findField(DepthMarketDataFields, name);
+		if (!field)
+			throw invalid_argument("unknown tick field: " + name);
+
+		if (find(tick_fields.begin(), tick_fields.end(), field) == tick_fields.end())
+			tick_fields.push_back(field);
+	}
+
+	this->tick_fields = tick_fields;
+};
+
+void MdApi::setConflate(bool enabled)
+{
+	this->conflate = enabled;
+};
+
+dict MdApi::getConflateStats()
+{
+	return this->conflate_table.stats();
+};
+
+void MdApi::setLatencyStats(bool enabled)
+{
+	if (enabled)
+		this->latency_stats.setup(CALLBACK_COUNT);
+
+	this->task_queue.setTiming(enabled);
+};
+
+dict MdApi::getLatencyStats(bool reset)
+{
+	return this->latency_stats.stats(CALLBACK_NAMES, reset);
+};
+
+void MdApi::resetLatencyStats()
+{
+	this->latency_stats.reset();
+};
+
+void MdApi::setQueueLimit(int limit, string policy, int watermark)
+{
+	this->task_queue.setLimit(limit, getQueuePolicy(policy), watermark);
+};
+
+dict MdApi::getQueueStats()
+{
+	return this->task_queue.stats();
+};
+
+void MdApi::setBatchSize(int size)
+{
+	if (size <= 0)
+		throw invalid_argument("batch size must be positive");
+
+	this->batch_size = size;
+};
+
+void MdApi::checkOverrides()
+{
+	this->overrides[ONFRONTCONNECTED] = bool(get_overload(this, "onFrontConnected"));
+	this->overrides[ONFRONTDISCONNECTED] = bool(get_overload(this, "onFrontDisconnected"));
+	this->overrides[ONHEARTBEATWARNING] = bool(get_overload(this, "onHeartBeatWarning"));
+	this->overrides[ONRSPUSERLOGIN] = bool(get_overload(this, "onRspUserLogin"));
+	this->overrides[ONRSPUSERLOGOUT] = bool(get_overload(this, "onRspUserLogout"));
+	this->overrides[ONRSPQRYMULTICASTINSTRUMENT] = bool(get_overload(this, "onRspQryMulticastInstrument"));
+	this->overrides[ONRSPERROR] = bool(get_overload(this, "onRspError"));
+	this->overrides[ONRSPSUBMARKETDATA] = bool(get_overload(this, "onRspSubMarketData"));
+	this->overrides[ONRSPUNSUBMARKETDATA] = bool(get_overload(this, "onRspUnSubMarketData"));
+	this->overrides[ONRSPSUBFORQUOTERSP] = bool(get_overload(this, "onRspSubForQuoteRsp"));
+	this->overrides[ONRSPUNSUBFORQUOTERSP] = bool(get_overload(this, "onRspUnSubForQuoteRsp"));
+	this->overrides[ONRTNDEPTHMARKETDATA] = bool(get_overload(this, "onRtnDepthMarketData")) || bool(get_overload(this, "onRtnDepthMarketDataBatch"));
+	this->overrides[ONRTNFORQUOTERSP] = bool(get_overload(this, "onRtnForQuoteRsp"));
+};
+
+dict MdApi::getPoolStats()
+{
+	dict d;
+	this->pool_RspUserLogin.report(d, "RspUserLogin");
+	this->pool_RspInfo.report(d, "RspInfo");
+	this->pool_UserLogout.report(d, "UserLogout");
+	this->pool_MulticastInstrument.report(d, "MulticastInstrument");
+	this->pool_SpecificInstrument.report(d, "SpecificInstrument");
+	this->pool_DepthMarketData.report(d, "DepthMarketData");
+	this->pool_ForQuoteRsp.report(d, "ForQuoteRsp");
+	return d;
+};
+
 void MdApi::registerFensUserInfo(const dict &req)
 {
 	CThostFtdcFensUserInfoField myreq = CThostFtdcFensUserInfoField();
@@ -671,6 +911,7 @@ void MdApi::registerFensUserInfo(const dict &req)
 	getString(req, "BrokerID", myreq.BrokerID);
 	getString(req, "UserID", myreq.UserID);
 	getChar(req, "LoginMode", &myreq.LoginMode);
+	gil_scoped_release release;
 	this->api->RegisterFensUserInfo(&myreq);
 };
 
@@ -678,6 +919,7 @@ int MdApi::subscribeMarketData(string instrumentID)
 {
 	char* buffer = (char*) instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->SubscribeMarketData(myreq, 1);
 	return i;
 };
@@ -686,6 +928,7 @@ int MdApi::unSubscribeMarketData(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->UnSubscribeMarketData(myreq, 1);
 	return i;
 };
@@ -694,6 +937,7 @@ int MdApi::subscribeForQuoteRsp(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->SubscribeForQuoteRsp(myreq, 1);
 	return i;
 };
@@ -702,27 +946,65 @@ int MdApi::unSubscribeForQuoteRsp(string instrumentID)
 {
 	char* buffer = (char*)instrumentID.c_str();
 	char* myreq[1] = { buffer };
+	gil_scoped_release release;
 	int i = this->api->UnSubscribeForQuoteRsp(myreq, 1);
 	return i;
 };
 
+//ԼбתΪchar*飬SUBSCRIBE_CHUNK_SIZEֿCTPصһ0Ľ
+static int callInstruments(CThostFtdcMdApi *api, int (CThostFtdcMdApi::*func)(char *[], int), const iterable &instrumentIDs)
+{
+	vector<string> ids;
+	for (handle item : instrumentIDs)
+		ids.push_back(item.cast<string>());
+
+	vector<char*> myreq;
+	myreq.reserve(ids.size());
+	for (string &id : ids)
+		myreq.push_back((char*)id.c_str());
+
+	gil_scoped_release release;
+
+	int result = 0;
+	for (size_t start = 0; start < myreq.size(); start += SUBSCRIBE_CHUNK_SIZE)
+	{
+		int count = (int)min(myreq.size() - start, (size_t)SUBSCRIBE_CHUNK_SIZE);
+		int i = (api->*func)(&myreq[start], count);
+		if (i != 0 && result == 0)
+			result = i;
+	}
+	return result;
+}
+
+int MdApi::subscribeMarketData(const iterable &instrumentIDs)
+{
+	return callInstruments(this->api, &CThostFtdcMdApi::SubscribeMarketData, instrumentIDs);
+};
+
+int MdApi::unSubscribeMarketData(const iterable &instrumentIDs)
+{
+	return callInstruments(this->api, &CThostFtdcMdApi::UnSubscribeMarketData, instrumentIDs);
+};
+
+int MdApi::subscribeForQuoteRsp(const iterable &instrumentIDs)
+{
+	return callInstruments(this->api, &CThostFtdcMdApi::SubscribeForQuoteRsp, instrumentIDs);
+};
+
+int MdApi::unSubscribeForQuoteRsp(const iterable &instrumentIDs)
+{
+	return callInstruments(this->api, &CThostFtdcMdApi::UnSubscribeForQuoteRsp, instrumentIDs);
+};
+
 int MdApi::reqUserLogin(const dict &req, int reqid)
 {
 	CThostFtdcReqUserLoginField myreq = CThostFtdcReqUserLoginField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "TradingDay", myreq.TradingDay);
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
-	getString(req, "Password", myreq.Password);
-	getString(req, "UserProductInfo", myreq.UserProductInfo);
-	getString(req, "InterfaceProductInfo", myreq.InterfaceProductInfo);
-	getString(req, "ProtocolInfo", myreq.ProtocolInfo);
-	getString(req, "MacAddress", myreq.MacAddress);
-	getString(req, "OneTimePassword", myreq.OneTimePassword);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "LoginRemark", myreq.LoginRemark);
-	getInt(req, "ClientIPPort", &myreq.ClientIPPort);
-	getString(req, "ClientIPAddress", myreq.ClientIPAddress);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, ReqUserLoginFields, &myreq);
+	else
+		dictToStruct(req, ReqUserLoginFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogin(&myreq, reqid);
 	return i;
 };
@@ -731,8 +1013,11 @@ int MdApi::reqUserLogout(const dict &req, int reqid)
 {
 	CThostFtdcUserLogoutField myreq = CThostFtdcUserLogoutField();
 	memset(&myreq, 0, sizeof(myreq));
-	getString(req, "BrokerID", myreq.BrokerID);
-	getString(req, "UserID", myreq.UserID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, UserLogoutFields, &myreq);
+	else
+		dictToStruct(req, UserLogoutFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqUserLogout(&myreq, reqid);
 	return i;
 };
@@ -741,13 +1026,21 @@ int MdApi::reqQryMulticastInstrument(const dict &req, int reqid)
 {
 	CThostFtdcQryMulticastInstrumentField myreq = CThostFtdcQryMulticastInstrumentField();
 	memset(&myreq, 0, sizeof(myreq));
-	getInt(req, "TopicID", &myreq.TopicID);
-	getString(req, "reserve1", myreq.reserve1);
-	getString(req, "InstrumentID", myreq.InstrumentID);
+	if (this->request_mode == REQUEST_MODE_ITEMS)
+		fillFields(req, QryMulticastInstrumentFields, &myreq);
+	else
+		dictToStruct(req, QryMulticastInstrumentFields, &myreq);
+	gil_scoped_release release;
 	int i = this->api->ReqQryMulticastInstrument(&myreq, reqid);
 	return i;
 };
 
+static const pair<const char*, int (MdApi::*)(const dict&, int)> REQUEST_FUNCTIONS[] = {
+	{"reqUserLogin", &MdApi::reqUserLogin},
+	{"reqUserLogout", &MdApi::reqUserLogout},
+	{"reqQryMulticastInstrument", &MdApi::reqQryMulticastInstrument},
+};
+
 ///-------------------------------------------------------------------------------------
 ///pybind11װ
 ///-------------------------------------------------------------------------------------
@@ -757,131 +1050,11 @@ class PyMdApi: public MdApi
 public:
 	using MdApi::MdApi;
 
-	void onFrontConnected() override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onFrontConnected);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onFrontDisconnected(int reqid) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onFrontDisconnected, reqid);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onHeartBeatWarning(int reqid) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onHeartBeatWarning, reqid);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspUserLogin(const dict &data, const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspUserLogin, data, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspUserLogout(const dict &data, const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspUserLogout, data, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspQryMulticastInstrument(const dict &data, const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspQryMulticastInstrument, data, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspError(const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspError, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspSubMarketData(const dict &data, const dict &error, int reqid, bool last) override
+	void onRtnDepthMarketData(const object &data) override
 	{
 		try
 		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspSubMarketData, data, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspUnSubMarketData(const dict &data, const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspUnSubMarketData, data, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspSubForQuoteRsp, data, error, reqid, last);
-		}
-		catch (const error_already_set &e)
-		{
-			cout << e.what() << endl;
-		}
-	};
-
-	void onRspUnSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) override
-	{
-		try
-		{
-			PYBIND11_OVERLOAD(void, MdApi, onRspUnSubForQuoteRsp, data, error, reqid, last);
+			PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketData, data);
 		}
 		catch (const error_already_set &e)
 		{
@@ -889,11 +1062,11 @@ public:
 		}
 	};
 
-	void onRtnDepthMarketData(const dict &data) override
+	void onRtnDepthMarketDataBatch(const list &data) override
 	{
 		try
 		{
-			PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketData, data);
+			PYBIND11_OVERLOAD(void, MdApi, onRtnDepthMarketDataBatch, data);
 		}
 		catch (const error_already_set &e)
 		{
@@ -901,11 +1074,11 @@ public:
 		}
 	};
 
-	void onRtnForQuoteRsp(const dict &data) override
+	void onQueueWatermark(int size) override
 	{
 		try
 		{
-			PYBIND11_OVERLOAD(void, MdApi, onRtnForQuoteRsp, data);
+			PYBIND11_OVERLOAD(void, MdApi, onQueueWatermark, size);
 		}
 		catch (const error_already_set &e)
 		{
@@ -917,38 +1090,107 @@ public:
 
 PYBIND11_MODULE(vnctpmd, m)
 {
+	initKeys();
+
+	class_<CThostFtdcDepthMarketDataField>(m, "DepthMarketData", module_local())
+		.def_property_readonly("TradingDay", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.TradingDay); })
+		.def_property_readonly("reserve1", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.reserve1); })
+		.def_property_readonly("ExchangeID", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.ExchangeID); })
+		.def_property_readonly("reserve2", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.reserve2); })
+		.def_readonly("LastPrice", &CThostFtdcDepthMarketDataField::LastPrice)
+		.def_readonly("PreSettlementPrice", &CThostFtdcDepthMarketDataField::PreSettlementPrice)
+		.def_readonly("PreClosePrice", &CThostFtdcDepthMarketDataField::PreClosePrice)
+		.def_readonly("PreOpenInterest", &CThostFtdcDepthMarketDataField::PreOpenInterest)
+		.def_readonly("OpenPrice", &CThostFtdcDepthMarketDataField::OpenPrice)
+		.def_readonly("HighestPrice", &CThostFtdcDepthMarketDataField::HighestPrice)
+		.def_readonly("LowestPrice", &CThostFtdcDepthMarketDataField::LowestPrice)
+		.def_readonly("Volume", &CThostFtdcDepthMarketDataField::Volume)
+		.def_readonly("Turnover", &CThostFtdcDepthMarketDataField::Turnover)
+		.def_readonly("OpenInterest", &CThostFtdcDepthMarketDataField::OpenInterest)
+		.def_readonly("ClosePrice", &CThostFtdcDepthMarketDataField::ClosePrice)
+		.def_readonly("SettlementPrice", &CThostFtdcDepthMarketDataField::SettlementPrice)
+		.def_readonly("UpperLimitPrice", &CThostFtdcDepthMarketDataField::UpperLimitPrice)
+		.def_readonly("LowerLimitPrice", &CThostFtdcDepthMarketDataField::LowerLimitPrice)
+		.def_readonly("PreDelta", &CThostFtdcDepthMarketDataField::PreDelta)
+		.def_readonly("CurrDelta", &CThostFtdcDepthMarketDataField::CurrDelta)
+		.def_property_readonly("UpdateTime", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.UpdateTime); })
+		.def_readonly("UpdateMillisec", &CThostFtdcDepthMarketDataField::UpdateMillisec)
+		.def_readonly("BidPrice1", &CThostFtdcDepthMarketDataField::BidPrice1)
+		.def_readonly("BidVolume1", &CThostFtdcDepthMarketDataField::BidVolume1)
+		.def_readonly("AskPrice1", &CThostFtdcDepthMarketDataField::AskPrice1)
+		.def_readonly("AskVolume1", &CThostFtdcDepthMarketDataField::AskVolume1)
+		.def_readonly("BidPrice2", &CThostFtdcDepthMarketDataField::BidPrice2)
+		.def_readonly("BidVolume2", &CThostFtdcDepthMarketDataField::BidVolume2)
+		.def_readonly("AskPrice2", &CThostFtdcDepthMarketDataField::AskPrice2)
+		.def_readonly("AskVolume2", &CThostFtdcDepthMarketDataField::AskVolume2)
+		.def_readonly("BidPrice3", &CThostFtdcDepthMarketDataField::BidPrice3)
+		.def_readonly("BidVolume3", &CThostFtdcDepthMarketDataField::BidVolume3)
+		.def_readonly("AskPrice3", &CThostFtdcDepthMarketDataField::AskPrice3)
+		.def_readonly("AskVolume3", &CThostFtdcDepthMarketDataField::AskVolume3)
+		.def_readonly("BidPrice4", &CThostFtdcDepthMarketDataField::BidPrice4)
+		.def_readonly("BidVolume4", &CThostFtdcDepthMarketDataField::BidVolume4)
+		.def_readonly("AskPrice4", &CThostFtdcDepthMarketDataField::AskPrice4)
+		.def_readonly("AskVolume4", &CThostFtdcDepthMarketDataField::AskVolume4)
+		.def_readonly("BidPrice5", &CThostFtdcDepthMarketDataField::BidPrice5)
+		.def_readonly("BidVolume5", &CThostFtdcDepthMarketDataField::BidVolume5)
+		.def_readonly("AskPrice5", &CThostFtdcDepthMarketDataField::AskPrice5)
+		.def_readonly("AskVolume5", &CThostFtdcDepthMarketDataField::AskVolume5)
+		.def_readonly("AveragePrice", &CThostFtdcDepthMarketDataField::AveragePrice)
+		.def_property_readonly("ActionDay", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.ActionDay); })
+		.def_property_readonly("InstrumentID", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.InstrumentID); })
+		.def_property_readonly("ExchangeInstID", [](const CThostFtdcDepthMarketDataField &d) { return fromAscii(d.ExchangeInstID); })
+		.def_readonly("BandingUpperPrice", &CThostFtdcDepthMarketDataField::BandingUpperPrice)
+		.def_readonly("BandingLowerPrice", &CThostFtdcDepthMarketDataField::BandingLowerPrice)
+		;
+
 	class_<MdApi, PyMdApi> mdapi(m, "MdApi", module_local());
 	mdapi
-		.def(init<>())
+		.def(init<string, int, int>(), arg("queue") = "mutex", arg("capacity") = 65536, arg("spin") = 0)
 		.def("createFtdcMdApi", &MdApi::createFtdcMdApi)
 		.def("release", &MdApi::release)
-		.def("init", &MdApi::init)
+		.def("init", &MdApi::init, arg("dispatch") = "thread")
+		.def("poll", &MdApi::poll, arg("max_events") = 1024, arg("timeout_us") = 0)
+		.def("fileno", &MdApi::fileno)
 		.def("join", &MdApi::join)
 		.def("exit", &MdApi::exit)
 		.def("getTradingDay", &MdApi::getTradingDay)
 		.def("registerFront", &MdApi::registerFront)
 		.def("registerNameServer", &MdApi::registerNameServer)
 		.def("registerFensUserInfo", &MdApi::registerFensUserInfo)
-		.def("subscribeMarketData", &MdApi::subscribeMarketData)
-		.def("unSubscribeMarketData", &MdApi::unSubscribeMarketData)
-		.def("subscribeForQuoteRsp", &MdApi::subscribeForQuoteRsp)
-		.def("unSubscribeForQuoteRsp", &MdApi::unSubscribeForQuoteRsp)
-		.def("reqUserLogin", &MdApi::reqUserLogin)
-		.def("reqUserLogout", &MdApi::reqUserLogout)
-		.def("reqQryMulticastInstrument", &MdApi::reqQryMulticastInstrument)
-
-		.def("onFrontConnected", &MdApi::onFrontConnected)
-		.def("onFrontDisconnected", &MdApi::onFrontDisconnected)
-		.def("onHeartBeatWarning", &MdApi::onHeartBeatWarning)
-		.def("onRspUserLogin", &MdApi::onRspUserLogin)
-		.def("onRspUserLogout", &MdApi::onRspUserLogout)
-		.def("onRspQryMulticastInstrument", &MdApi::onRspQryMulticastInstrument)
-		.def("onRspError", &MdApi::onRspError)
-		.def("onRspSubMarketData", &MdApi::onRspSubMarketData)
-		.def("onRspUnSubMarketData", &MdApi::onRspUnSubMarketData)
-		.def("onRspSubForQuoteRsp", &MdApi::onRspSubForQuoteRsp)
-		.def("onRspUnSubForQuoteRsp", &MdApi::onRspUnSubForQuoteRsp)
+		.def("setDataMode", &MdApi::setDataMode)
+		.def("setRequestMode", &MdApi::setRequestMode)
+		.def("setNativeCallback", &MdApi::setNativeCallback,
+			arg("capsule"), arg("callbacks") = list(), arg("thread") = "dispatch")
+		.def("setTickBus", &MdApi::setTickBus, arg("path"), arg("capacity") = 65536)
+		.def("getTickBusStats", &MdApi::getTickBusStats)
+		.def("setTickRecorder", &MdApi::setTickRecorder, arg("path"), arg("segment_size") = 256 << 20,
+			arg("flush_bytes") = 1 << 20, arg("flush_interval_ms") = 100, arg("fsync") = "segment")
+		.def("getTickRecorderStats", &MdApi::getTickRecorderStats)
+		.def("setTickFields", &MdApi::setTickFields)
+		.def("setConflate", &MdApi::setConflate)
+		.def("getConflateStats", &MdApi::getConflateStats)
+		.def("getQueueStats", &MdApi::getQueueStats)
+		.def("setQueueLimit", &MdApi::setQueueLimit, arg("limit"), arg("policy") = "block", arg("watermark") = 0)
+		.def("setLatencyStats", &MdApi::setLatencyStats)
+		.def("getLatencyStats", &MdApi::getLatencyStats, arg("reset") = false)
+		.def("resetLatencyStats", &MdApi::resetLatencyStats)
+		.def("setBatchSize", &MdApi::setBatchSize)
+		.def("getPoolStats", &MdApi::getPoolStats)
+		.def("subscribeMarketData", static_cast<int (MdApi::*)(string)>(&MdApi::subscribeMarketData))
+		.def("subscribeMarketData", static_cast<int (MdApi::*)(const iterable &)>(&MdApi::subscribeMarketData))
+		.def("unSubscribeMarketData", static_cast<int (MdApi::*)(string)>(&MdApi::unSubscribeMarketData))
+		.def("unSubscribeMarketData", static_cast<int (MdApi::*)(const iterable &)>(&MdApi::unSubscribeMarketData))
+		.def("subscribeForQuoteRsp", static_cast<int (MdApi::*)(string)>(&MdApi::subscribeForQuoteRsp))
+		.def("subscribeForQuoteRsp", static_cast<int (MdApi::*)(const iterable &)>(&MdApi::subscribeForQuoteRsp))
+		.def("unSubscribeForQuoteRsp", static_cast<int (MdApi::*)(string)>(&MdApi::unSubscribeForQuoteRsp))
+		.def("unSubscribeForQuoteRsp", static_cast<int (MdApi::*)(const iterable &)>(&MdApi::unSubscribeForQuoteRsp))
 		.def("onRtnDepthMarketData", &MdApi::onRtnDepthMarketData)
-		.def("onRtnForQuoteRsp", &MdApi::onRtnForQuoteRsp)
+		.def("onRtnDepthMarketDataBatch", &MdApi::onRtnDepthMarketDataBatch)
+		.def("onQueueWatermark", &MdApi::onQueueWatermark)
 		;
+
+	for (const auto &function : REQUEST_FUNCTIONS)
+		mdapi.def(function.first, function.second);
+
+	defCallbacks(mdapi, CALLBACK_NAMES);
 }
@@ -24,6 +24,10 @@ using namespace pybind11;
 #define ONRSPUNSUBFORQUOTERSP 10
 #define ONRTNDEPTHMARKETDATA 11
 #define ONRTNFORQUOTERSP 12
+#define CALLBACK_COUNT 13
+
+//ÿεCTPĺʱԼ
+#define SUBSCRIBE_CHUNK_SIZE 500
 
 
 ///-------------------------------------------------------------------------------------
@@ -38,10 +42,57 @@ private:
 	thread task_thread;					//ָ߳루pythonݣ
 	TaskQueue task_queue;			    //
 	bool active = false;				//״̬
+	int dispatch_mode = DISPATCH_THREAD;	//ͷʽڲ̻߳Ӧópoll
+	int data_mode = DATA_MODE_DICT;		//ģʽ
+	int request_mode = REQUEST_MODE_LOOKUP;	//ֵȡģʽ
+	int batch_size = 1;					//ÿλȡGIL
+	bool batch_override = false;		//PythonǷص
+	bitset<CALLBACK_COUNT> overrides;	//Python˵ĻصδصĻصУ
+	vector<const FieldDesc*> tick_fields;	//ֵҪתֶΣΪʱתȫֶΣ
+	atomic<bool> conflate{ false };		//Ƿ񰴺Լϲδ͵
+	ConflateTable<CThostFtdcDepthMarketDataField> conflate_table;	//ϲ
+	vector<CThostFtdcDepthMarketDataField*> conflate_data;			//̴߳Ӻϲȡ
+	LatencyStats latency_stats;			//ŶӺͻصʱͳ
+	NativeHook native_hook;				//ͨPyCapsuleעԭص
+	TickBus<CThostFtdcDepthMarketDataField> tick_bus;	//ڴ
+	TickRecorder<CThostFtdcDepthMarketDataField> tick_recorder;	//¼
+
+	//صڴ
+	TaskPool<CThostFtdcRspUserLoginField> pool_RspUserLogin;
+	TaskPool<CThostFtdcRspInfoField> pool_RspInfo;
+	TaskPool<CThostFtdcUserLogoutField> pool_UserLogout;
+	TaskPool<CThostFtdcMulticastInstrumentField> pool_MulticastInstrument;
+	TaskPool<CThostFtdcSpecificInstrumentField> pool_SpecificInstrument;
+	TaskPool<CThostFtdcDepthMarketDataField> pool_DepthMarketData;
+	TaskPool<CThostFtdcForQuoteRspField> pool_ForQuoteRsp;
+
+	//صݽṹӦڴأûݲĻصΪգ
+	TaskPoolBase *data_pools[CALLBACK_COUNT] = {
+		nullptr,
+		nullptr,
+		nullptr,
+		&pool_RspUserLogin,
+		&pool_UserLogout,
+		&pool_MulticastInstrument,
+		nullptr,
+		&pool_SpecificInstrument,
+		&pool_SpecificInstrument,
+		&pool_SpecificInstrument,
+		&pool_SpecificInstrument,
+		&pool_DepthMarketData,
+		&pool_ForQuoteRsp,
+	};
 
 public:
-	MdApi()
+	MdApi(string queue = "mutex", int capacity = 65536, int spin = 0)
 	{
+		this->task_queue.setup(getQueueType(queue), capacity, spin);
+
+		//ֻԱϲ
+		this->task_queue.setDroppable(ONRTNDEPTHMARKETDATA, [this](const Task &task) {
+			if (task.task_data)
+				this->pool_DepthMarketData.free((CThostFtdcDepthMarketDataField*)task.task_data);
+		});
 	};
 
 	virtual ~MdApi()
@@ -109,31 +160,21 @@ public:
 
 	void processTask();
 
-	void processFrontConnected(Task *task);
-
-	void processFrontDisconnected(Task *task);
-
-	void processHeartBeatWarning(Task *task);
-
-	void processRspUserLogin(Task *task);
+	void processTasks(vector<Task> &tasks);
 
-	void processRspUserLogout(Task *task);
+	void checkOverrides();
 
-	void processRspQryMulticastInstrument(Task *task);
+	void processConflated();
 
-	void processRspError(Task *task);
+	void pushTask(int task_name, const void *data, const CThostFtdcRspInfoField *error, int reqid, bool last);
 
-	void processRspSubMarketData(Task *task);
+	void processCallback(Task *task);
 
-	void processRspUnSubMarketData(Task *task);
-
-	void processRspSubForQuoteRsp(Task *task);
-
-	void processRspUnSubForQuoteRsp(Task *task);
+	void releaseTask(Task *task);
 
 	void processRtnDepthMarketData(Task *task);
 
-	void processRtnForQuoteRsp(Task *task);
+	object convertRtnDepthMarketData(Task *task);
 
 	//-------------------------------------------------------------------------------------
 	//dataصֵ
@@ -143,31 +184,11 @@ public:
 	//i
 	//-------------------------------------------------------------------------------------
 
-	virtual void onFrontConnected() {};
-
-	virtual void onFrontDisconnected(int reqid) {};
-
-	virtual void onHeartBeatWarning(int reqid) {};
-
-	virtual void onRspUserLogin(const dict &data, const dict &error, int reqid, bool last) {};
+	virtual void onRtnDepthMarketData(const object &data) {};
 
-	virtual void onRspUserLogout(const dict &data, const dict &error, int reqid, bool last) {};
+	virtual void onRtnDepthMarketDataBatch(const list &data) {};
 
-	virtual void onRspQryMulticastInstrument(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspError(const dict &error, int reqid, bool last) {};
-
-	virtual void onRspSubMarketData(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspUnSubMarketData(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspUnSubForQuoteRsp(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRtnDepthMarketData(const dict &data) {};
-
-	virtual void onRtnForQuoteRsp(const dict &data) {};
+	virtual void onQueueWatermark(int size) {};
 
 	//-------------------------------------------------------------------------------------
 	//req:ֵ
@@ -177,7 +198,11 @@ public:
 
 	void release();
 
-	void init();
+	void init(string dispatch = "thread");
+
+	int poll(int max_events, int64_t timeout_us);
+
+	int fileno();
 
 	int join();
 
@@ -193,6 +218,40 @@ public:
 
 	void registerFensUserInfo(const dict &req);
 
+	void setDataMode(string mode);
+
+	void setRequestMode(string mode);
+
+	void setNativeCallback(const object &capsule, const list &callbacks, string thread);
+
+	void setTickBus(string path, int capacity);
+
+	dict getTickBusStats();
+
+	void setTickRecorder(string path, int64_t segment_size, int64_t flush_bytes, int flush_interval_ms, string fsync);
+
+	dict getTickRecorderStats();
+
+	void setTickFields(const list &fields);
+
+	void setConflate(bool enabled);
+
+	dict getConflateStats();
+
+	dict getQueueStats();
+
+	void setQueueLimit(int limit, string policy, int watermark);
+
+	void setLatencyStats(bool enabled);
+
+	dict getLatencyStats(bool reset);
+
+	void resetLatencyStats();
+
+	void setBatchSize(int size);
+
+	dict getPoolStats();
+
 	int subscribeMarketData(string instrumentID);
 
 	int unSubscribeMarketData(string instrumentID);
@@ -201,6 +260,14 @@ public:
 
 	int unSubscribeForQuoteRsp(string instrumentID);
 
+	int subscribeMarketData(const iterable &instrumentIDs);
+
+	int unSubscribeMarketData(const iterable &instrumentIDs);
+
+	int subscribeForQuoteRsp(const iterable &instrumentIDs);
+
+	int unSubscribeForQuoteRsp(const iterable &instrumentIDs);
+
 	int reqUserLogin(const dict &req, int reqid);
 
 	int reqUserLogout(const dict &req, int reqid);
@@ -166,6 +166,14 @@ using namespace pybind11;
 #define ONRSPQRYRULEINTERPARAMETER 152
 #define ONRSPQRYINVESTORPRODRULEMARGIN 153
 #define ONRSPQRYINVESTORPORTFSETTING 154
+#define CALLBACK_COUNT 155
+
+
+//Ԥù̶ֶεıģ壬ͨTdApi::sendOrderFastʱֻ޸ļ۸ȿɱֶ
+struct OrderTemplate
+{
+	CThostFtdcInputOrderField req = {};
+};
 
 ///-------------------------------------------------------------------------------------
 ///C++ SPIĻصʵ
@@ -179,10 +187,312 @@ private:
     thread task_thread;                    //ָ߳루pythonݣ
     TaskQueue task_queue;                //
     bool active = false;                //״̬
+    int dispatch_mode = DISPATCH_THREAD;    //ͷʽڲ̻߳Ӧópoll
+    int batch_size = 1;                 //ÿλȡGIL
+    int request_mode = REQUEST_MODE_LOOKUP; //ֵȡģʽ
+    bitset<CALLBACK_COUNT> overrides;   //Python˵ĻصδصĻصУ
+    LatencyStats latency_stats;         //ŶӺͻصʱͳ
+    NativeHook native_hook;             //ͨPyCapsuleעԭص
+    QueryAggregator query_rows;         //ܵĲѯ
+    int query_format = QUERY_FORMAT_DICT;   //ܲѯ͸ʽ
+
+    //صڴ
+	TaskPool<CThostFtdcRspAuthenticateField> pool_RspAuthenticate;
+	TaskPool<CThostFtdcRspInfoField> pool_RspInfo;
+	TaskPool<CThostFtdcRspUserLoginField> pool_RspUserLogin;
+	TaskPool<CThostFtdcUserLogoutField> pool_UserLogout;
+	TaskPool<CThostFtdcUserPasswordUpdateField> pool_UserPasswordUpdate;
+	TaskPool<CThostFtdcTradingAccountPasswordUpdateField> pool_TradingAccountPasswordUpdate;
+	TaskPool<CThostFtdcRspUserAuthMethodField> pool_RspUserAuthMethod;
+	TaskPool<CThostFtdcRspGenUserCaptchaField> pool_RspGenUserCaptcha;
+	TaskPool<CThostFtdcRspGenUserTextField> pool_RspGenUserText;
+	TaskPool<CThostFtdcInputOrderField> pool_InputOrder;
+	TaskPool<CThostFtdcParkedOrderField> pool_ParkedOrder;
+	TaskPool<CThostFtdcParkedOrderActionField> pool_ParkedOrderAction;
+	TaskPool<CThostFtdcInputOrderActionField> pool_InputOrderAction;
+	TaskPool<CThostFtdcQryMaxOrderVolumeField> pool_QryMaxOrderVolume;
+	TaskPool<CThostFtdcSettlementInfoConfirmField> pool_SettlementInfoConfirm;
+	TaskPool<CThostFtdcRemoveParkedOrderField> pool_RemoveParkedOrder;
+	TaskPool<CThostFtdcRemoveParkedOrderActionField> pool_RemoveParkedOrderAction;
+	TaskPool<CThostFtdcInputExecOrderField> pool_InputExecOrder;
+	TaskPool<CThostFtdcInputExecOrderActionField> pool_InputExecOrderAction;
+	TaskPool<CThostFtdcInputForQuoteField> pool_InputForQuote;
+	TaskPool<CThostFtdcInputQuoteField> pool_InputQuote;
+	TaskPool<CThostFtdcInputQuoteActionField> pool_InputQuoteAction;
+	TaskPool<CThostFtdcInputBatchOrderActionField> pool_InputBatchOrderAction;
+	TaskPool<CThostFtdcInputOptionSelfCloseField> pool_InputOptionSelfClose;
+	TaskPool<CThostFtdcInputOptionSelfCloseActionField> pool_InputOptionSelfCloseAction;
+	TaskPool<CThostFtdcInputCombActionField> pool_InputCombAction;
+	TaskPool<CThostFtdcOrderField> pool_Order;
+	TaskPool<CThostFtdcTradeField> pool_Trade;
+	TaskPool<CThostFtdcInvestorPositionField> pool_InvestorPosition;
+	TaskPool<CThostFtdcTradingAccountField> pool_TradingAccount;
+	TaskPool<CThostFtdcInvestorField> pool_Investor;
+	TaskPool<CThostFtdcTradingCodeField> pool_TradingCode;
+	TaskPool<CThostFtdcInstrumentMarginRateField> pool_InstrumentMarginRate;
+	TaskPool<CThostFtdcInstrumentCommissionRateField> pool_InstrumentCommissionRate;
+	TaskPool<CThostFtdcExchangeField> pool_Exchange;
+	TaskPool<CThostFtdcProductField> pool_Product;
+	TaskPool<CThostFtdcInstrumentField> pool_Instrument;
+	TaskPool<CThostFtdcDepthMarketDataField> pool_DepthMarketData;
+	TaskPool<CThostFtdcTraderOfferField> pool_TraderOffer;
+	TaskPool<CThostFtdcSettlementInfoField> pool_SettlementInfo;
+	TaskPool<CThostFtdcTransferBankField> pool_TransferBank;
+	TaskPool<CThostFtdcInvestorPositionDetailField> pool_InvestorPositionDetail;
+	TaskPool<CThostFtdcNoticeField> pool_Notice;
+	TaskPool<CThostFtdcInvestorPositionCombineDetailField> pool_InvestorPositionCombineDetail;
+	TaskPool<CThostFtdcCFMMCTradingAccountKeyField> pool_CFMMCTradingAccountKey;
+	TaskPool<CThostFtdcEWarrantOffsetField> pool_EWarrantOffset;
+	TaskPool<CThostFtdcInvestorProductGroupMarginField> pool_InvestorProductGroupMargin;
+	TaskPool<CThostFtdcExchangeMarginRateField> pool_ExchangeMarginRate;
+	TaskPool<CThostFtdcExchangeMarginRateAdjustField> pool_ExchangeMarginRateAdjust;
+	TaskPool<CThostFtdcExchangeRateField> pool_ExchangeRate;
+	TaskPool<CThostFtdcSecAgentACIDMapField> pool_SecAgentACIDMap;
+	TaskPool<CThostFtdcProductExchRateField> pool_ProductExchRate;
+	TaskPool<CThostFtdcProductGroupField> pool_ProductGroup;
+	TaskPool<CThostFtdcMMInstrumentCommissionRateField> pool_MMInstrumentCommissionRate;
+	TaskPool<CThostFtdcMMOptionInstrCommRateField> pool_MMOptionInstrCommRate;
+	TaskPool<CThostFtdcInstrumentOrderCommRateField> pool_InstrumentOrderCommRate;
+	TaskPool<CThostFtdcSecAgentCheckModeField> pool_SecAgentCheckMode;
+	TaskPool<CThostFtdcSecAgentTradeInfoField> pool_SecAgentTradeInfo;
+	TaskPool<CThostFtdcOptionInstrTradeCostField> pool_OptionInstrTradeCost;
+	TaskPool<CThostFtdcOptionInstrCommRateField> pool_OptionInstrCommRate;
+	TaskPool<CThostFtdcExecOrderField> pool_ExecOrder;
+	TaskPool<CThostFtdcForQuoteField> pool_ForQuote;
+	TaskPool<CThostFtdcQuoteField> pool_Quote;
+	TaskPool<CThostFtdcOptionSelfCloseField> pool_OptionSelfClose;
+	TaskPool<CThostFtdcInvestUnitField> pool_InvestUnit;
+	TaskPool<CThostFtdcCombInstrumentGuardField> pool_CombInstrumentGuard;
+	TaskPool<CThostFtdcCombActionField> pool_CombAction;
+	TaskPool<CThostFtdcTransferSerialField> pool_TransferSerial;
+	TaskPool<CThostFtdcAccountregisterField> pool_Accountregister;
+	TaskPool<CThostFtdcOrderActionField> pool_OrderAction;
+	TaskPool<CThostFtdcInstrumentStatusField> pool_InstrumentStatus;
+	TaskPool<CThostFtdcBulletinField> pool_Bulletin;
+	TaskPool<CThostFtdcTradingNoticeInfoField> pool_TradingNoticeInfo;
+	TaskPool<CThostFtdcErrorConditionalOrderField> pool_ErrorConditionalOrder;
+	TaskPool<CThostFtdcExecOrderActionField> pool_ExecOrderAction;
+	TaskPool<CThostFtdcQuoteActionField> pool_QuoteAction;
+	TaskPool<CThostFtdcForQuoteRspField> pool_ForQuoteRsp;
+	TaskPool<CThostFtdcCFMMCTradingAccountTokenField> pool_CFMMCTradingAccountToken;
+	TaskPool<CThostFtdcBatchOrderActionField> pool_BatchOrderAction;
+	TaskPool<CThostFtdcOptionSelfCloseActionField> pool_OptionSelfCloseAction;
+	TaskPool<CThostFtdcContractBankField> pool_ContractBank;
+	TaskPool<CThostFtdcTradingNoticeField> pool_TradingNotice;
+	TaskPool<CThostFtdcBrokerTradingParamsField> pool_BrokerTradingParams;
+	TaskPool<CThostFtdcBrokerTradingAlgosField> pool_BrokerTradingAlgos;
+	TaskPool<CThostFtdcQueryCFMMCTradingAccountTokenField> pool_QueryCFMMCTradingAccountToken;
+	TaskPool<CThostFtdcRspTransferField> pool_RspTransfer;
+	TaskPool<CThostFtdcRspRepealField> pool_RspRepeal;
+	TaskPool<CThostFtdcNotifyQueryAccountField> pool_NotifyQueryAccount;
+	TaskPool<CThostFtdcReqTransferField> pool_ReqTransfer;
+	TaskPool<CThostFtdcReqRepealField> pool_ReqRepeal;
+	TaskPool<CThostFtdcReqQueryAccountField> pool_ReqQueryAccount;
+	TaskPool<CThostFtdcOpenAccountField> pool_OpenAccount;
+	TaskPool<CThostFtdcCancelAccountField> pool_CancelAccount;
+	TaskPool<CThostFtdcChangeAccountField> pool_ChangeAccount;
+	TaskPool<CThostFtdcCombPromotionParamField> pool_CombPromotionParam;
+	TaskPool<CThostFtdcRiskSettleInvstPositionField> pool_RiskSettleInvstPosition;
+	TaskPool<CThostFtdcRiskSettleProductStatusField> pool_RiskSettleProductStatus;
+	TaskPool<CThostFtdcSPBMFutureParameterField> pool_SPBMFutureParameter;
+	TaskPool<CThostFtdcSPBMOptionParameterField> pool_SPBMOptionParameter;
+	TaskPool<CThostFtdcSPBMIntraParameterField> pool_SPBMIntraParameter;
+	TaskPool<CThostFtdcSPBMInterParameterField> pool_SPBMInterParameter;
+	TaskPool<CThostFtdcSPBMPortfDefinitionField> pool_SPBMPortfDefinition;
+	TaskPool<CThostFtdcSPBMInvestorPortfDefField> pool_SPBMInvestorPortfDef;
+	TaskPool<CThostFtdcInvestorPortfMarginRatioField> pool_InvestorPortfMarginRatio;
+	TaskPool<CThostFtdcInvestorProdSPBMDetailField> pool_InvestorProdSPBMDetail;
+	TaskPool<CThostFtdcInvestorCommoditySPMMMarginField> pool_InvestorCommoditySPMMMargin;
+	TaskPool<CThostFtdcInvestorCommodityGroupSPMMMarginField> pool_InvestorCommodityGroupSPMMMargin;
+	TaskPool<CThostFtdcSPMMInstParamField> pool_SPMMInstParam;
+	TaskPool<CThostFtdcSPMMProductParamField> pool_SPMMProductParam;
+	TaskPool<CThostFtdcSPBMAddOnInterParameterField> pool_SPBMAddOnInterParameter;
+	TaskPool<CThostFtdcRCAMSCombProductInfoField> pool_RCAMSCombProductInfo;
+	TaskPool<CThostFtdcRCAMSInstrParameterField> pool_RCAMSInstrParameter;
+	TaskPool<CThostFtdcRCAMSIntraParameterField> pool_RCAMSIntraParameter;
+	TaskPool<CThostFtdcRCAMSInterParameterField> pool_RCAMSInterParameter;
+	TaskPool<CThostFtdcRCAMSShortOptAdjustParamField> pool_RCAMSShortOptAdjustParam;
+	TaskPool<CThostFtdcRCAMSInvestorCombPositionField> pool_RCAMSInvestorCombPosition;
+	TaskPool<CThostFtdcInvestorProdRCAMSMarginField> pool_InvestorProdRCAMSMargin;
+	TaskPool<CThostFtdcRULEInstrParameterField> pool_RULEInstrParameter;
+	TaskPool<CThostFtdcRULEIntraParameterField> pool_RULEIntraParameter;
+	TaskPool<CThostFtdcRULEInterParameterField> pool_RULEInterParameter;
+	TaskPool<CThostFtdcInvestorProdRULEMarginField> pool_InvestorProdRULEMargin;
+	TaskPool<CThostFtdcInvestorPortfSettingField> pool_InvestorPortfSetting;
+
+	//صݽṹӦڴأûݲĻصΪգ
+	TaskPoolBase *data_pools[CALLBACK_COUNT] = {
+		nullptr,
+		nullptr,
+		nullptr,
+		&pool_RspAuthenticate,
+		&pool_RspUserLogin,
+		&pool_UserLogout,
+		&pool_UserPasswordUpdate,
+		&pool_TradingAccountPasswordUpdate,
+		&pool_RspUserAuthMethod,
+		&pool_RspGenUserCaptcha,
+		&pool_RspGenUserText,
+		&pool_InputOrder,
+		&pool_ParkedOrder,
+		&pool_ParkedOrderAction,
+		&pool_InputOrderAction,
+		&pool_QryMaxOrderVolume,
+		&pool_SettlementInfoConfirm,
+		&pool_RemoveParkedOrder,
+		&pool_RemoveParkedOrderAction,
+		&pool_InputExecOrder,
+		&pool_InputExecOrderAction,
+		&pool_InputForQuote,
+		&pool_InputQuote,
+		&pool_InputQuoteAction,
+		&pool_InputBatchOrderAction,
+		&pool_InputOptionSelfClose,
+		&pool_InputOptionSelfCloseAction,
+		&pool_InputCombAction,
+		&pool_Order,
+		&pool_Trade,
+		&pool_InvestorPosition,
+		&pool_TradingAccount,
+		&pool_Investor,
+		&pool_TradingCode,
+		&pool_InstrumentMarginRate,
+		&pool_InstrumentCommissionRate,
+		&pool_Exchange,
+		&pool_Product,
+		&pool_Instrument,
+		&pool_DepthMarketData,
+		&pool_TraderOffer,
+		&pool_SettlementInfo,
+		&pool_TransferBank,
+		&pool_InvestorPositionDetail,
+		&pool_Notice,
+		&pool_SettlementInfoConfirm,
+		&pool_InvestorPositionCombineDetail,
+		&pool_CFMMCTradingAccountKey,
+		&pool_EWarrantOffset,
+		&pool_InvestorProductGroupMargin,
+		&pool_ExchangeMarginRate,
+		&pool_ExchangeMarginRateAdjust,
+		&pool_ExchangeRate,
+		&pool_SecAgentACIDMap,
+		&pool_ProductExchRate,
+		&pool_ProductGroup,
+		&pool_MMInstrumentCommissionRate,
+		&pool_MMOptionInstrCommRate,
+		&pool_InstrumentOrderCommRate,
+		&pool_TradingAccount,
+		&pool_SecAgentCheckMode,
+		&pool_SecAgentTradeInfo,
+		&pool_OptionInstrTradeCost,
+		&pool_OptionInstrCommRate,
+		&pool_ExecOrder,
+		&pool_ForQuote,
+		&pool_Quote,
+		&pool_OptionSelfClose,
+		&pool_InvestUnit,
+		&pool_CombInstrumentGuard,
+		&pool_CombAction,
+		&pool_TransferSerial,
+		&pool_Accountregister,
+		nullptr,
+		&pool_Order,
+		&pool_Trade,
+		&pool_InputOrder,
+		&pool_OrderAction,
+		&pool_InstrumentStatus,
+		&pool_Bulletin,
+		&pool_TradingNoticeInfo,
+		&pool_ErrorConditionalOrder,
+		&pool_ExecOrder,
+		&pool_InputExecOrder,
+		&pool_ExecOrderAction,
+		&pool_InputForQuote,
+		&pool_Quote,
+		&pool_InputQuote,
+		&pool_QuoteAction,
+		&pool_ForQuoteRsp,
+		&pool_CFMMCTradingAccountToken,
+		&pool_BatchOrderAction,
+		&pool_OptionSelfClose,
+		&pool_InputOptionSelfClose,
+		&pool_OptionSelfCloseAction,
+		&pool_CombAction,
+		&pool_InputCombAction,
+		&pool_ContractBank,
+		&pool_ParkedOrder,
+		&pool_ParkedOrderAction,
+		&pool_TradingNotice,
+		&pool_BrokerTradingParams,
+		&pool_BrokerTradingAlgos,
+		&pool_QueryCFMMCTradingAccountToken,
+		&pool_RspTransfer,
+		&pool_RspTransfer,
+		&pool_RspRepeal,
+		&pool_RspRepeal,
+		&pool_RspTransfer,
+		&pool_RspTransfer,
+		&pool_RspRepeal,
+		&pool_RspRepeal,
+		&pool_NotifyQueryAccount,
+		&pool_ReqTransfer,
+		&pool_ReqTransfer,
+		&pool_ReqRepeal,
+		&pool_ReqRepeal,
+		&pool_ReqQueryAccount,
+		&pool_RspRepeal,
+		&pool_RspRepeal,
+		&pool_ReqTransfer,
+		&pool_ReqTransfer,
+		&pool_ReqQueryAccount,
+		&pool_OpenAccount,
+		&pool_CancelAccount,
+		&pool_ChangeAccount,
+		&pool_Instrument,
+		&pool_CombPromotionParam,
+		&pool_RiskSettleInvstPosition,
+		&pool_RiskSettleProductStatus,
+		&pool_SPBMFutureParameter,
+		&pool_SPBMOptionParameter,
+		&pool_SPBMIntraParameter,
+		&pool_SPBMInterParameter,
+		&pool_SPBMPortfDefinition,
+		&pool_SPBMInvestorPortfDef,
+		&pool_InvestorPortfMarginRatio,
+		&pool_InvestorProdSPBMDetail,
+		&pool_InvestorCommoditySPMMMargin,
+		&pool_InvestorCommodityGroupSPMMMargin,
+		&pool_SPMMInstParam,
+		&pool_SPMMProductParam,
+		&pool_SPBMAddOnInterParameter,
+		&pool_RCAMSCombProductInfo,
+		&pool_RCAMSInstrParameter,
+		&pool_RCAMSIntraParameter,
+		&pool_RCAMSInterParameter,
+		&pool_RCAMSShortOptAdjustParam,
+		&pool_RCAMSInvestorCombPosition,
+		&pool_InvestorProdRCAMSMargin,
+		&pool_RULEInstrParameter,
+		&pool_RULEIntraParameter,
+		&pool_RULEInterParameter,
+		&pool_InvestorProdRULEMargin,
+		&pool_InvestorPortfSetting,
+	};
 
 public:
-    TdApi()
+    TdApi(string queue = "mutex", int capacity = 65536, int spin = 0)
     {
+        this->task_queue.setup(getQueueType(queue), capacity, spin);
+
+        //ѯɺΪһ
+        this->query_rows.setup(CALLBACK_COUNT, [this](QueryRows *rows) {
+            Task task = Task();
+            task.task_name = TASK_AGGREGATED;
+            task.task_data = rows;
+            task.task_id = rows->reqid;
+            task.task_last = true;
+            this->task_queue.push(task);
+        });
     };
 
     virtual ~TdApi()
@@ -675,315 +985,17 @@ public:
     //-------------------------------------------------------------------------------------
     void processTask();
 
-	void processFrontConnected(Task *task);
-
-	void processFrontDisconnected(Task *task);
-
-	void processHeartBeatWarning(Task *task);
-
-	void processRspAuthenticate(Task *task);
-
-	void processRspUserLogin(Task *task);
-
-	void processRspUserLogout(Task *task);
-
-	void processRspUserPasswordUpdate(Task *task);
-
-	void processRspTradingAccountPasswordUpdate(Task *task);
-
-	void processRspUserAuthMethod(Task *task);
-
-	void processRspGenUserCaptcha(Task *task);
-
-	void processRspGenUserText(Task *task);
-
-	void processRspOrderInsert(Task *task);
-
-	void processRspParkedOrderInsert(Task *task);
-
-	void processRspParkedOrderAction(Task *task);
-
-	void processRspOrderAction(Task *task);
-
-	void processRspQryMaxOrderVolume(Task *task);
-
-	void processRspSettlementInfoConfirm(Task *task);
-
-	void processRspRemoveParkedOrder(Task *task);
-
-	void processRspRemoveParkedOrderAction(Task *task);
-
-	void processRspExecOrderInsert(Task *task);
-
-	void processRspExecOrderAction(Task *task);
-
-	void processRspForQuoteInsert(Task *task);
-
-	void processRspQuoteInsert(Task *task);
-
-	void processRspQuoteAction(Task *task);
-
-	void processRspBatchOrderAction(Task *task);
-
-	void processRspOptionSelfCloseInsert(Task *task);
-
-	void processRspOptionSelfCloseAction(Task *task);
-
-	void processRspCombActionInsert(Task *task);
-
-	void processRspQryOrder(Task *task);
-
-	void processRspQryTrade(Task *task);
-
-	void processRspQryInvestorPosition(Task *task);
-
-	void processRspQryTradingAccount(Task *task);
-
-	void processRspQryInvestor(Task *task);
-
-	void processRspQryTradingCode(Task *task);
-
-	void processRspQryInstrumentMarginRate(Task *task);
-
-	void processRspQryInstrumentCommissionRate(Task *task);
-
-	void processRspQryExchange(Task *task);
-
-	void processRspQryProduct(Task *task);
-
-	void processRspQryInstrument(Task *task);
-
-	void processRspQryDepthMarketData(Task *task);
-
-	void processRspQryTraderOffer(Task *task);
-
-	void processRspQrySettlementInfo(Task *task);
-
-	void processRspQryTransferBank(Task *task);
-
-	void processRspQryInvestorPositionDetail(Task *task);
-
-	void processRspQryNotice(Task *task);
-
-	void processRspQrySettlementInfoConfirm(Task *task);
-
-	void processRspQryInvestorPositionCombineDetail(Task *task);
-
-	void processRspQryCFMMCTradingAccountKey(Task *task);
-
-	void processRspQryEWarrantOffset(Task *task);
-
-	void processRspQryInvestorProductGroupMargin(Task *task);
-
-	void processRspQryExchangeMarginRate(Task *task);
-
-	void processRspQryExchangeMarginRateAdjust(Task *task);
-
-	void processRspQryExchangeRate(Task *task);
-
-	void processRspQrySecAgentACIDMap(Task *task);
-
-	void processRspQryProductExchRate(Task *task);
-
-	void processRspQryProductGroup(Task *task);
-
-	void processRspQryMMInstrumentCommissionRate(Task *task);
-
-	void processRspQryMMOptionInstrCommRate(Task *task);
-
-	void processRspQryInstrumentOrderCommRate(Task *task);
-
-	void processRspQrySecAgentTradingAccount(Task *task);
-
-	void processRspQrySecAgentCheckMode(Task *task);
-
-	void processRspQrySecAgentTradeInfo(Task *task);
-
-	void processRspQryOptionInstrTradeCost(Task *task);
-
-	void processRspQryOptionInstrCommRate(Task *task);
-
-	void processRspQryExecOrder(Task *task);
-
-	void processRspQryForQuote(Task *task);
-
-	void processRspQryQuote(Task *task);
-
-	void processRspQryOptionSelfClose(Task *task);
-
-	void processRspQryInvestUnit(Task *task);
-
-	void processRspQryCombInstrumentGuard(Task *task);
-
-	void processRspQryCombAction(Task *task);
-
-	void processRspQryTransferSerial(Task *task);
-
-	void processRspQryAccountregister(Task *task);
-
-	void processRspError(Task *task);
-
-	void processRtnOrder(Task *task);
-
-	void processRtnTrade(Task *task);
-
-	void processErrRtnOrderInsert(Task *task);
-
-	void processErrRtnOrderAction(Task *task);
+    void processTasks(vector<Task> &tasks);
 
-	void processRtnInstrumentStatus(Task *task);
+    void processAggregated(Task *task);
 
-	void processRtnBulletin(Task *task);
+    void checkOverrides();
 
-	void processRtnTradingNotice(Task *task);
+    void pushTask(int task_name, const void *data, const CThostFtdcRspInfoField *error, int reqid, bool last);
 
-	void processRtnErrorConditionalOrder(Task *task);
+    void processCallback(Task *task);
 
-	void processRtnExecOrder(Task *task);
-
-	void processErrRtnExecOrderInsert(Task *task);
-
-	void processErrRtnExecOrderAction(Task *task);
-
-	void processErrRtnForQuoteInsert(Task *task);
-
-	void processRtnQuote(Task *task);
-
-	void processErrRtnQuoteInsert(Task *task);
-
-	void processErrRtnQuoteAction(Task *task);
-
-	void processRtnForQuoteRsp(Task *task);
-
-	void processRtnCFMMCTradingAccountToken(Task *task);
-
-	void processErrRtnBatchOrderAction(Task *task);
-
-	void processRtnOptionSelfClose(Task *task);
-
-	void processErrRtnOptionSelfCloseInsert(Task *task);
-
-	void processErrRtnOptionSelfCloseAction(Task *task);
-
-	void processRtnCombAction(Task *task);
-
-	void processErrRtnCombActionInsert(Task *task);
-
-	void processRspQryContractBank(Task *task);
-
-	void processRspQryParkedOrder(Task *task);
-
-	void processRspQryParkedOrderAction(Task *task);
-
-	void processRspQryTradingNotice(Task *task);
-
-	void processRspQryBrokerTradingParams(Task *task);
-
-	void processRspQryBrokerTradingAlgos(Task *task);
-
-	void processRspQueryCFMMCTradingAccountToken(Task *task);
-
-	void processRtnFromBankToFutureByBank(Task *task);
-
-	void processRtnFromFutureToBankByBank(Task *task);
-
-	void processRtnRepealFromBankToFutureByBank(Task *task);
-
-	void processRtnRepealFromFutureToBankByBank(Task *task);
-
-	void processRtnFromBankToFutureByFuture(Task *task);
-
-	void processRtnFromFutureToBankByFuture(Task *task);
-
-	void processRtnRepealFromBankToFutureByFutureManual(Task *task);
-
-	void processRtnRepealFromFutureToBankByFutureManual(Task *task);
-
-	void processRtnQueryBankBalanceByFuture(Task *task);
-
-	void processErrRtnBankToFutureByFuture(Task *task);
-
-	void processErrRtnFutureToBankByFuture(Task *task);
-
-	void processErrRtnRepealBankToFutureByFutureManual(Task *task);
-
-	void processErrRtnRepealFutureToBankByFutureManual(Task *task);
-
-	void processErrRtnQueryBankBalanceByFuture(Task *task);
-
-	void processRtnRepealFromBankToFutureByFuture(Task *task);
-
-	void processRtnRepealFromFutureToBankByFuture(Task *task);
-
-	void processRspFromBankToFutureByFuture(Task *task);
-
-	void processRspFromFutureToBankByFuture(Task *task);
-
-	void processRspQueryBankAccountMoneyByFuture(Task *task);
-
-	void processRtnOpenAccountByBank(Task *task);
-
-	void processRtnCancelAccountByBank(Task *task);
-
-	void processRtnChangeAccountByBank(Task *task);
-
-	void processRspQryClassifiedInstrument(Task *task);
-
-	void processRspQryCombPromotionParam(Task *task);
-
-	void processRspQryRiskSettleInvstPosition(Task *task);
-
-	void processRspQryRiskSettleProductStatus(Task *task);
-
-	void processRspQrySPBMFutureParameter(Task *task);
-
-	void processRspQrySPBMOptionParameter(Task *task);
-
-	void processRspQrySPBMIntraParameter(Task *task);
-
-	void processRspQrySPBMInterParameter(Task *task);
-
-	void processRspQrySPBMPortfDefinition(Task *task);
-
-	void processRspQrySPBMInvestorPortfDef(Task *task);
-
-	void processRspQryInvestorPortfMarginRatio(Task *task);
-
-	void processRspQryInvestorProdSPBMDetail(Task *task);
-
-	void processRspQryInvestorCommoditySPMMMargin(Task *task);
-
-	void processRspQryInvestorCommodityGroupSPMMMargin(Task *task);
-
-	void processRspQrySPMMInstParam(Task *task);
-
-	void processRspQrySPMMProductParam(Task *task);
-
-	void processRspQrySPBMAddprocessInterParameter(Task *task);
-
-	void processRspQryRCAMSCombProductInfo(Task *task);
-
-	void processRspQryRCAMSInstrParameter(Task *task);
-
-	void processRspQryRCAMSIntraParameter(Task *task);
-
-	void processRspQryRCAMSInterParameter(Task *task);
-
-	void processRspQryRCAMSShortOptAdjustParam(Task *task);
-
-	void processRspQryRCAMSInvestorCombPosition(Task *task);
-
-	void processRspQryInvestorProdRCAMSMargin(Task *task);
-
-	void processRspQryRULEInstrParameter(Task *task);
-
-	void processRspQryRULEIntraParameter(Task *task);
-
-	void processRspQryRULEInterParameter(Task *task);
-
-	void processRspQryInvestorProdRULEMargin(Task *task);
-
-	void processRspQryInvestorPortfSetting(Task *task);
+    void releaseTask(Task *task);
 
     //-------------------------------------------------------------------------------------
     //dataصֵ
@@ -993,315 +1005,7 @@ public:
     //i
     //-------------------------------------------------------------------------------------
     
-	virtual void onFrontConnected() {};
-
-	virtual void onFrontDisconnected(int reqid) {};
-
-	virtual void onHeartBeatWarning(int reqid) {};
-
-	virtual void onRspAuthenticate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspUserLogin(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspUserLogout(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspUserPasswordUpdate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspTradingAccountPasswordUpdate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspUserAuthMethod(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspGenUserCaptcha(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspGenUserText(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspOrderInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspParkedOrderInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspParkedOrderAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspOrderAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryMaxOrderVolume(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspSettlementInfoConfirm(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspRemoveParkedOrder(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspRemoveParkedOrderAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspExecOrderInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspExecOrderAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspForQuoteInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQuoteInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQuoteAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspBatchOrderAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspOptionSelfCloseInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspOptionSelfCloseAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspCombActionInsert(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryOrder(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTrade(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorPosition(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTradingAccount(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestor(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTradingCode(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInstrumentMarginRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInstrumentCommissionRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryExchange(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryProduct(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInstrument(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryDepthMarketData(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTraderOffer(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySettlementInfo(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTransferBank(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorPositionDetail(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryNotice(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySettlementInfoConfirm(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorPositionCombineDetail(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryCFMMCTradingAccountKey(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryEWarrantOffset(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorProductGroupMargin(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryExchangeMarginRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryExchangeMarginRateAdjust(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryExchangeRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySecAgentACIDMap(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryProductExchRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryProductGroup(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryMMInstrumentCommissionRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryMMOptionInstrCommRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInstrumentOrderCommRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySecAgentTradingAccount(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySecAgentCheckMode(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySecAgentTradeInfo(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryOptionInstrTradeCost(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryOptionInstrCommRate(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryExecOrder(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryForQuote(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryQuote(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryOptionSelfClose(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestUnit(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryCombInstrumentGuard(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryCombAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTransferSerial(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryAccountregister(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspError(const dict &error, int reqid, bool last) {};
-
-	virtual void onRtnOrder(const dict &data) {};
-
-	virtual void onRtnTrade(const dict &data) {};
-
-	virtual void onErrRtnOrderInsert(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnOrderAction(const dict &data, const dict &error) {};
-
-	virtual void onRtnInstrumentStatus(const dict &data) {};
-
-	virtual void onRtnBulletin(const dict &data) {};
-
-	virtual void onRtnTradingNotice(const dict &data) {};
-
-	virtual void onRtnErrorConditionalOrder(const dict &data) {};
-
-	virtual void onRtnExecOrder(const dict &data) {};
-
-	virtual void onErrRtnExecOrderInsert(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnExecOrderAction(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnForQuoteInsert(const dict &data, const dict &error) {};
-
-	virtual void onRtnQuote(const dict &data) {};
-
-	virtual void onErrRtnQuoteInsert(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnQuoteAction(const dict &data, const dict &error) {};
-
-	virtual void onRtnForQuoteRsp(const dict &data) {};
-
-	virtual void onRtnCFMMCTradingAccountToken(const dict &data) {};
-
-	virtual void onErrRtnBatchOrderAction(const dict &data, const dict &error) {};
-
-	virtual void onRtnOptionSelfClose(const dict &data) {};
-
-	virtual void onErrRtnOptionSelfCloseInsert(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnOptionSelfCloseAction(const dict &data, const dict &error) {};
-
-	virtual void onRtnCombAction(const dict &data) {};
-
-	virtual void onErrRtnCombActionInsert(const dict &data, const dict &error) {};
-
-	virtual void onRspQryContractBank(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryParkedOrder(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryParkedOrderAction(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryTradingNotice(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryBrokerTradingParams(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryBrokerTradingAlgos(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQueryCFMMCTradingAccountToken(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRtnFromBankToFutureByBank(const dict &data) {};
-
-	virtual void onRtnFromFutureToBankByBank(const dict &data) {};
-
-	virtual void onRtnRepealFromBankToFutureByBank(const dict &data) {};
-
-	virtual void onRtnRepealFromFutureToBankByBank(const dict &data) {};
-
-	virtual void onRtnFromBankToFutureByFuture(const dict &data) {};
-
-	virtual void onRtnFromFutureToBankByFuture(const dict &data) {};
-
-	virtual void onRtnRepealFromBankToFutureByFutureManual(const dict &data) {};
-
-	virtual void onRtnRepealFromFutureToBankByFutureManual(const dict &data) {};
-
-	virtual void onRtnQueryBankBalanceByFuture(const dict &data) {};
-
-	virtual void onErrRtnBankToFutureByFuture(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnFutureToBankByFuture(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnRepealBankToFutureByFutureManual(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnRepealFutureToBankByFutureManual(const dict &data, const dict &error) {};
-
-	virtual void onErrRtnQueryBankBalanceByFuture(const dict &data, const dict &error) {};
-
-	virtual void onRtnRepealFromBankToFutureByFuture(const dict &data) {};
-
-	virtual void onRtnRepealFromFutureToBankByFuture(const dict &data) {};
-
-	virtual void onRspFromBankToFutureByFuture(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspFromFutureToBankByFuture(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQueryBankAccountMoneyByFuture(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRtnOpenAccountByBank(const dict &data) {};
-
-	virtual void onRtnCancelAccountByBank(const dict &data) {};
-
-	virtual void onRtnChangeAccountByBank(const dict &data) {};
-
-	virtual void onRspQryClassifiedInstrument(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryCombPromotionParam(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRiskSettleInvstPosition(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRiskSettleProductStatus(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMFutureParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMOptionParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMIntraParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMInterParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMPortfDefinition(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMInvestorPortfDef(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorPortfMarginRatio(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorProdSPBMDetail(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorCommoditySPMMMargin(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorCommodityGroupSPMMMargin(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPMMInstParam(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPMMProductParam(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQrySPBMAddonInterParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRCAMSCombProductInfo(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRCAMSInstrParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRCAMSIntraParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRCAMSInterParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRCAMSShortOptAdjustParam(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRCAMSInvestorCombPosition(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorProdRCAMSMargin(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRULEInstrParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRULEIntraParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryRULEInterParameter(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorProdRULEMargin(const dict &data, const dict &error, int reqid, bool last) {};
-
-	virtual void onRspQryInvestorPortfSetting(const dict &data, const dict &error, int reqid, bool last) {};
+	virtual void onQueueWatermark(int size) {};
 
     //-------------------------------------------------------------------------------------
     //req:ֵ
@@ -1311,7 +1015,11 @@ public:
 
     void release();
 
-    void init();
+    void init(string dispatch = "thread");
+
+    int poll(int max_events, int64_t timeout_us);
+
+    int fileno();
 
     int join();
 
@@ -1331,6 +1039,30 @@ public:
 
     void subscribePublicTopic(int nType);
 
+    dict getQueueStats();
+
+    dict getQueryStats();
+
+    void setQueueLimit(int limit, string policy, int watermark);
+
+    void setRequestMode(string mode);
+
+    void setQueryFormat(string format);
+
+    void setNativeCallback(const object &capsule, const list &callbacks, string thread);
+
+    int sendOrderFast(const OrderTemplate &tmpl, double price, int volume, char direction, char offset, string order_ref, int reqid);
+
+    void setLatencyStats(bool enabled);
+
+    dict getLatencyStats(bool reset);
+
+    void resetLatencyStats();
+
+    void setBatchSize(int size);
+
+    dict getPoolStats();
+
 	int reqAuthenticate(const dict &req, int reqid);
 
 	int reqUserLogin(const dict &req, int reqid);
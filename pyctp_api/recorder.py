@@ -0,0 +1,175 @@
+"""
+行情录制文件读取
+
+MdApi.setTickRecorder(path)开启后，CTP回调线程将每笔原始行情结构体和本地接收时间追加到内存批次中，
+录制线程批量写入“路径.000000”格式的分段文件，每个分段结束时在文件末尾写入按合约的记录偏移索引。
+文件布局见vnctp.h中的TickRecordHeader和TickIndexTrailer。
+"""
+import glob
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from typing import NamedTuple
+
+
+MAGIC = b"PYCTPREC"
+INDEX_MAGIC = b"PYCTPIDX"
+VERSION = 1
+
+# 文件头：magic, version, header_size, record_size, data_size, key_offset, key_size, segment, create_time
+HEADER_FORMAT = "<8sIIIIIIQQ"
+
+# 文件末尾：magic, index_offset, record_count, instrument_count
+TRAILER_FORMAT = "<8sQQQ"
+TRAILER_SIZE = 32
+
+# 记录头：本地接收时间（纳秒）
+RECORD_TIME_SIZE = 8
+
+# 扫描时允许记录接收时间早于分段创建时间的范围（切换分段时批次中的行情先于分段创建），单位纳秒
+RECORD_TIME_SLACK = 24 * 3600 * 10**9
+
+_unpack_u64 = struct.Struct("<Q").unpack_from
+_unpack_entry = struct.Struct("<II").unpack_from
+
+
+class RecordedTick(NamedTuple):
+    """录制文件中的一条行情记录"""
+
+    time: int               # 本地接收时间（Unix纳秒）
+    data: bytes             # 原始CThostFtdcDepthMarketDataField结构体（可用dtypes模块解析）
+
+
+def segments(path: str) -> list[str]:
+    """按编号排序的全部分段文件路径"""
+    files = [name for name in glob.glob(glob.escape(path) + ".*") if name[len(path) + 1:].isdigit()]
+    return sorted(files, key=lambda name: int(name[len(path) + 1:]))
+
+
+class TickFile:
+    """
+    单个分段文件的读取器
+
+    已经结束的分段直接读取末尾的索引；正在录制或异常退出时没有索引的分段，
+    打开时扫描已经完整写入的记录重新建立索引。
+    """
+
+    def __init__(self, path: str) -> None:
+        """path：分段文件路径"""
+        self.path: str = path
+        self.file = open(path, "rb")
+        try:
+            self.buffer: mmap.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+
+        (
+            magic, version, self.header_size, self.record_size, self.data_size,
+            self.key_offset, self.key_size, self.segment, self.create_time
+        ) = struct.unpack_from(HEADER_FORMAT, self.buffer, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"not a tick record file: {path}")
+
+        # 合约代码 -> 记录在文件中的偏移
+        self.index: dict[str, list[int]] = {}
+        self.count: int = 0
+        self.complete: bool = self.load_index()
+
+        if not self.complete:
+            self.scan_index()
+
+    def load_index(self) -> bool:
+        """读取分段末尾的索引，没有索引时返回False"""
+        buffer = self.buffer
+        if len(buffer) < self.header_size + TRAILER_SIZE:
+            return False
+
+        magic, index_offset, record_count, instrument_count = struct.unpack_from(
+            TRAILER_FORMAT, buffer, len(buffer) - TRAILER_SIZE
+        )
+        if magic != INDEX_MAGIC:
+            return False
+
+        self.count = record_count
+        offset = index_offset
+        for _ in range(instrument_count):
+            length, count = _unpack_entry(buffer, offset)
+            offset += 8
+
+            instrument = buffer[offset:offset + length].decode()
+            offset += (length + 7) & ~7
+
+            self.index[instrument] = list(struct.unpack_from(f"<{count}Q", buffer, offset))
+            offset += count * 8
+
+        return True
+
+    def scan_index(self) -> None:
+        """
+        按顺序扫描全部完整的记录建立索引
+
+        最后一条未写完的记录被忽略；写入索引时异常退出的分段末尾是不完整的索引，
+        扫描在第一条接收时间或合约代码无效的记录处停止。
+        """
+        buffer = self.buffer
+        total = (len(buffer) - self.header_size) // self.record_size
+        min_time = self.create_time - RECORD_TIME_SLACK
+
+        key_start = RECORD_TIME_SIZE + self.key_offset
+        key_end = key_start + self.key_size
+
+        for n in range(total):
+            offset = self.header_size + n * self.record_size
+            time = _unpack_u64(buffer, offset)[0]
+            key = buffer[offset + key_start:offset + key_end].split(b"\0", 1)[0]
+            if time < min_time or not key or not key.isascii() or not key.decode().isprintable():
+                break
+
+            self.index.setdefault(key.decode(), []).append(offset)
+            self.count = n + 1
+
+    @property
+    def instruments(self) -> list[str]:
+        """分段中出现的全部合约代码"""
+        return sorted(self.index)
+
+    def record(self, offset: int) -> RecordedTick:
+        """读取指定偏移的记录"""
+        time = _unpack_u64(self.buffer, offset)[0]
+        start = offset + RECORD_TIME_SIZE
+        return RecordedTick(time, self.buffer[start:start + self.data_size])
+
+    def read(self, instrument: str | None = None) -> list[RecordedTick]:
+        """按写入顺序读取全部记录，instrument不为空时只通过索引读取该合约的记录"""
+        if instrument is not None:
+            return [self.record(offset) for offset in self.index.get(instrument, [])]
+
+        return [self.record(self.header_size + n * self.record_size) for n in range(self.count)]
+
+    def close(self) -> None:
+        """关闭文件映射"""
+        self.buffer.close()
+        self.file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "TickFile":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def read_ticks(path: str, instrument: str | None = None) -> Iterator[RecordedTick]:
+    """按分段顺序读取路径下的全部录制记录，instrument不为空时只读取该合约"""
+    for name in segments(path):
+        if not os.path.getsize(name):
+            continue
+
+        with TickFile(name) as f:
+            yield from f.read(instrument)
@@ -0,0 +1,196 @@
+"""
+共享内存行情总线读取
+
+MdApi.setTickBus(path)开启后，CTP回调线程会将每笔原始行情结构体写入内存映射文件中的环形缓冲区，
+其他进程通过TickReader读取，不需要各自登录行情服务器。文件布局见vnctp.h中的TickBusHeader。
+
+发布方停止发布或以同一路径重新创建总线后，TickReader读完旧文件中剩余的记录时抛出TickBusClosed，
+需要重新创建TickReader读取新的总线。
+"""
+import mmap
+import struct
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+
+MAGIC = b"PYCTPBUS"
+VERSION = 1
+
+# 文件头：magic, version, header_size, capacity, record_size, data_size, key_offset, key_size
+HEADER_FORMAT = "<8sIIQIIII"
+WRITE_SEQ_OFFSET = 40
+SESSION_OFFSET = 48
+CLOSED_OFFSET = 56
+
+# 记录头：全局序号（写入期间为0）、合约内序号、发布时间（纳秒）
+RECORD_FORMAT = "<QQQ"
+RECORD_HEADER_SIZE = 24
+
+_unpack_u64 = struct.Struct("<Q").unpack_from
+_unpack_record = struct.Struct(RECORD_FORMAT).unpack_from
+
+
+class TickBusClosed(Exception):
+    """发布方已停止发布，或以同一路径重新创建了总线文件"""
+
+
+class Tick(NamedTuple):
+    """总线中的一条行情记录"""
+
+    seq: int                # 合约内的连续序号（从1开始），不连续说明有记录未读到
+    time: int               # 发布时间（Unix纳秒）
+    data: bytes             # 原始CThostFtdcDepthMarketDataField结构体（可用dtypes模块解析）
+
+
+class TickReader:
+    """
+    共享内存行情总线读取器
+
+    每个读取器独立维护读取位置，发布方只写不等待，读取过慢时被覆盖的记录计入lost。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        instruments: Iterable[str] | None = None,
+        start: str = "latest"
+    ) -> None:
+        """
+        path：MdApi.setTickBus使用的文件路径
+        instruments：只读取这些合约的行情，为空时读取全部
+        start："latest"从当前位置开始读取，"oldest"从缓冲区中最早的记录开始读取
+        """
+        self.file = open(path, "rb")
+        try:
+            self.buffer: mmap.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+
+        (
+            magic, version, self.header_size, self.capacity,
+            self.record_size, self.data_size, self.key_offset, self.key_size
+        ) = struct.unpack_from(HEADER_FORMAT, self.buffer, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"not a tick bus file: {path}")
+
+        self.path: str = path
+        self.session: int = int(_unpack_u64(self.buffer, SESSION_OFFSET)[0])
+        if self.expired:
+            self.close()
+            raise TickBusClosed(path)
+
+        self.instruments: set[bytes] | None = None
+        if instruments is not None:
+            self.instruments = {instrument.encode() for instrument in instruments}
+
+        if start == "latest":
+            self.next_seq: int = self.write_seq
+        elif start == "oldest":
+            self.next_seq = max(self.write_seq - self.capacity, 0)
+        else:
+            self.close()
+            raise ValueError(f"unknown start position: {start}")
+
+        self.lost: int = 0
+
+    @property
+    def write_seq(self) -> int:
+        """发布方已写入的记录总数"""
+        return int(_unpack_u64(self.buffer, WRITE_SEQ_OFFSET)[0])
+
+    @property
+    def expired(self) -> bool:
+        """发布方已停止发布或重新创建了总线（Windows下在原文件上重新初始化）"""
+        buffer = self.buffer
+        return bool(_unpack_u64(buffer, CLOSED_OFFSET)[0]) or _unpack_u64(buffer, SESSION_OFFSET)[0] != self.session
+
+    def poll(self, max_count: int = 0) -> list[Tick]:
+        """
+        读取所有新记录（不阻塞），max_count大于0时最多读取该数量的记录
+
+        发布方已停止发布且没有未读的记录时抛出TickBusClosed
+        """
+        buffer = self.buffer
+        capacity = self.capacity
+
+        # 先检查关闭标识再读取写入位置，关闭前发布的记录仍然可以读到；重新创建后旧记录已被清除，直接抛出
+        closed = _unpack_u64(buffer, CLOSED_OFFSET)[0]
+        session = _unpack_u64(buffer, SESSION_OFFSET)[0]
+        write_seq = self.write_seq
+        if session != self.session or (closed and self.next_seq >= write_seq):
+            raise TickBusClosed(self.path)
+
+        # 落后超过一圈时，跳过已经被覆盖的记录
+        if write_seq - self.next_seq > capacity:
+            self.lost += write_seq - capacity - self.next_seq
+            self.next_seq = write_seq - capacity
+
+        end = write_seq
+        if max_count > 0:
+            end = min(end, self.next_seq + max_count)
+
+        ticks: list[Tick] = []
+        key_start = RECORD_HEADER_SIZE + self.key_offset
+        key_end = key_start + self.key_size
+        data_end = RECORD_HEADER_SIZE + self.data_size
+
+        for n in range(self.next_seq, end):
+            offset = self.header_size + (n % capacity) * self.record_size
+
+            seq, instrument_seq, publish_time = _unpack_record(buffer, offset)
+            if seq != n + 1:
+                self.lost += 1
+                continue
+
+            if self.instruments is not None:
+                key = buffer[offset + key_start:offset + key_end].split(b"\0", 1)[0]
+                if key not in self.instruments:
+                    continue
+
+            data = buffer[offset + RECORD_HEADER_SIZE:offset + data_end]
+
+            # 复制期间记录被覆盖时丢弃
+            if _unpack_u64(buffer, offset)[0] != seq:
+                self.lost += 1
+                continue
+
+            ticks.append(Tick(instrument_seq, publish_time, data))
+
+        # 读取期间总线被重新创建时，读到的可能是新总线的记录
+        if _unpack_u64(buffer, SESSION_OFFSET)[0] != self.session:
+            raise TickBusClosed(self.path)
+
+        self.next_seq = end
+        return ticks
+
+    def read(self, timeout: float | None = None, max_count: int = 0) -> list[Tick]:
+        """阻塞读取，直到有新记录或超时（返回空列表），timeout为None时一直等待，总线关闭时抛出TickBusClosed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        spins = 0
+
+        while True:
+            ticks = self.poll(max_count)
+            if ticks:
+                return ticks
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return ticks
+
+            # 先短暂让出CPU，持续没有数据时退避为短暂休眠
+            spins += 1
+            time.sleep(0 if spins < 100 else 0.0005)
+
+    def close(self) -> None:
+        """关闭文件映射"""
+        self.buffer.close()
+        self.file.close()
+
+    def __enter__(self) -> "TickReader":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
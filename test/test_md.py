@@ -1,3 +1,9 @@
+import asyncio
+import ctypes
+import select
+import subprocess
+import sys
+from itertools import pairwise
 from time import sleep
 from threading import Condition
 from collections.abc import Generator
@@ -5,6 +11,9 @@ from collections.abc import Generator
 import pytest
 
 from pyctp_api.api import MdApi
+from pyctp_api.aio import AsyncMdApi
+from pyctp_api.shm import TickBusClosed, TickReader
+from pyctp_api.recorder import TickFile, segments
 
 
 # 测试参数
@@ -73,9 +82,14 @@ class MyMdApi(MdApi):
 
     def onRtnDepthMarketData(self, data: dict) -> None:
         """行情数据推送"""
-        symbol = data.get("InstrumentID", "未知")
-        price = data.get("LastPrice", 0)
-        update_time = data.get("UpdateTime", "")
+        if isinstance(data, dict):
+            symbol = data.get("InstrumentID", "未知")
+            price = data.get("LastPrice", 0)
+            update_time = data.get("UpdateTime", "")
+        else:
+            symbol = data.InstrumentID
+            price = data.LastPrice
+            update_time = data.UpdateTime
         print(f"📊 收到行情推送: {symbol} 价格:{price} 时间:{update_time}")
         
         self.callback_result = [data]
@@ -181,6 +195,332 @@ def test_subscribe(login_api: MyMdApi) -> None:
         print("ℹ️  这可能是正常的，有些合约在非交易时间没有行情推送")
 
 
+def test_subscribe_list(login_api: MyMdApi) -> None:
+    """测试以列表批量订阅和取消订阅行情"""
+    print("\n🧪 开始测试: 批量订阅功能")
+    assert login_api.subscribeMarketData([SYMBOL]) == 0
+    assert login_api.unSubscribeMarketData([SYMBOL]) == 0
+    assert login_api.subscribeMarketData([]) == 0
+    print("✅ 批量订阅测试通过!")
+
+
+def test_subscribe_conflate(login_api: MyMdApi) -> None:
+    """测试按合约合并行情"""
+    print("\n🧪 开始测试: 行情合并功能")
+    login_api.callback_result = []
+    login_api.setConflate(True)
+
+    try:
+        login_api.subscribeMarketData(SYMBOL)
+
+        with login_api.callback_done:
+            login_api.callback_done.wait(WAIT_TIME)
+
+        stats = login_api.getConflateStats()
+        print(f"📊 合并统计: {stats}")
+        if login_api.callback_result:
+            assert stats[SYMBOL]["updates"] >= 1
+            print("✅ 行情合并测试通过!")
+        else:
+            print("⚠️  未收到行情数据推送")
+    finally:
+        login_api.setConflate(False)
+
+
+def test_latency_stats(login_api: MyMdApi) -> None:
+    """测试排队和回调耗时统计"""
+    print("\n🧪 开始测试: 延迟统计功能")
+    login_api.callback_result = []
+    login_api.setLatencyStats(True)
+
+    try:
+        login_api.subscribeMarketData(SYMBOL)
+
+        with login_api.callback_done:
+            login_api.callback_done.wait(WAIT_TIME)
+
+        # 先关闭计时，避免重置后新到的行情再次写入统计
+        login_api.setLatencyStats(False)
+
+        stats = login_api.getLatencyStats(reset=True)
+        print(f"📊 延迟统计: {stats}")
+        for value in stats.values():
+            assert value["wait"]["count"] > 0
+            assert value["wait"]["min"] <= value["wait"]["p50"] <= value["wait"]["max"]
+        assert login_api.getLatencyStats() == {}
+        print("✅ 延迟统计测试通过!")
+    finally:
+        login_api.setLatencyStats(False)
+
+
+def test_queue_limit(login_api: MyMdApi) -> None:
+    """测试队列容量上限设置"""
+    print("\n🧪 开始测试: 队列容量上限")
+    login_api.setQueueLimit(10000, "drop_oldest", watermark=5000)
+
+    try:
+        stats = login_api.getQueueStats()
+        assert stats["limit"] == 10000
+        assert stats["policy"] == "drop_oldest"
+        assert stats["watermark"] == 5000
+
+        with pytest.raises(ValueError):
+            login_api.setQueueLimit(100, "unknown")
+
+        # 无锁环形队列不能丢弃最早的行情
+        spsc_api = MdApi(queue="spsc")
+        with pytest.raises(ValueError):
+            spsc_api.setQueueLimit(100, "drop_oldest")
+        spsc_api.setQueueLimit(100, "drop_newest")
+        print("✅ 队列容量上限测试通过!")
+    finally:
+        login_api.setQueueLimit(0)
+
+
+def test_subscribe_object(login_api: MyMdApi) -> None:
+    """测试原生对象模式的行情推送"""
+    print("\n🧪 开始测试: 原生对象行情推送")
+    login_api.callback_result = []
+    login_api.setDataMode("object")
+
+    try:
+        login_api.subscribeMarketData(SYMBOL)
+
+        with login_api.callback_done:
+            login_api.callback_done.wait(WAIT_TIME)
+
+        if login_api.callback_result:
+            data = login_api.callback_result[0]
+            assert not isinstance(data, dict)
+            assert data.InstrumentID == SYMBOL
+            print("✅ 原生对象行情测试通过!")
+        else:
+            print("⚠️  未收到行情数据推送")
+    finally:
+        login_api.setDataMode("dict")
+
+
+def test_subscribe_raw(login_api: MyMdApi) -> None:
+    """测试原始字节模式的行情推送"""
+    np = pytest.importorskip("numpy")
+    from pyctp_api.api.dtypes import CThostFtdcDepthMarketDataField
+
+    print("\n🧪 开始测试: 原始字节行情推送")
+    login_api.callback_result = []
+    login_api.setDataMode("raw")
+
+    try:
+        login_api.subscribeMarketData(SYMBOL)
+
+        with login_api.callback_done:
+            login_api.callback_done.wait(WAIT_TIME)
+
+        if login_api.callback_result:
+            data = login_api.callback_result[0]
+            assert isinstance(data, bytes)
+            assert len(data) == CThostFtdcDepthMarketDataField.itemsize
+
+            tick = np.frombuffer(data, dtype=CThostFtdcDepthMarketDataField)[0]
+            assert tick["InstrumentID"].decode() == SYMBOL
+            print("✅ 原始字节行情测试通过!")
+        else:
+            print("⚠️  未收到行情数据推送")
+    finally:
+        login_api.setDataMode("dict")
+
+
+def test_native_callback(login_api: MyMdApi) -> None:
+    """测试通过PyCapsule注册原生回调"""
+    print("\n🧪 开始测试: 原生回调")
+    native_result: list = []
+
+    # 使用ctypes函数模拟C扩展中的回调函数
+    NativeCallback = ctypes.CFUNCTYPE(
+        None, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int, ctypes.c_int
+    )
+    callback = NativeCallback(lambda user, name, data, error, reqid, last: native_result.append(data))
+
+    capsule_new = ctypes.pythonapi.PyCapsule_New
+    capsule_new.restype = ctypes.py_object
+    capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+    capsule = capsule_new(ctypes.cast(callback, ctypes.c_void_p), b"pyctp_api.native_callback", None)
+
+    with pytest.raises(ValueError):
+        login_api.setNativeCallback(capsule, ["onUnknown"])
+
+    login_api.setNativeCallback(capsule, ["onRtnDepthMarketData"])
+    try:
+        login_api.callback_result = []
+        login_api.subscribeMarketData(SYMBOL)
+
+        with login_api.callback_done:
+            login_api.callback_done.wait(WAIT_TIME)
+
+        if login_api.callback_result:
+            sleep(1)
+            assert native_result
+            assert all(native_result)
+            print("✅ 原生回调测试通过!")
+        else:
+            print("⚠️  未收到行情数据推送")
+    finally:
+        login_api.setNativeCallback(None)
+
+
+def test_tick_bus(login_api: MyMdApi, tmp_path) -> None:
+    """测试共享内存行情总线"""
+    print("\n🧪 开始测试: 共享内存行情总线")
+    path = str(tmp_path / "tick_bus")
+    login_api.setTickBus(path, 1024)
+
+    try:
+        with pytest.raises(ValueError):
+            login_api.setTickBus(path, 1000)
+        login_api.setTickBus(path, 1024)
+
+        with TickReader(path, instruments=[SYMBOL]) as reader:
+            login_api.subscribeMarketData(SYMBOL)
+            ticks = reader.read(timeout=WAIT_TIME)
+
+            if ticks:
+                assert ticks[0].seq >= 1
+                assert SYMBOL.encode() in ticks[0].data
+                assert login_api.getTickBusStats()["published"] >= len(ticks)
+                print("✅ 共享内存行情总线测试通过!")
+            else:
+                print("⚠️  未收到行情数据推送")
+
+            # 发布方重新创建总线后，旧文件中的记录读完时抛出TickBusClosed
+            login_api.setTickBus(path, 1024)
+            with pytest.raises(TickBusClosed):
+                while True:
+                    reader.poll()
+
+        with TickReader(path) as reader:
+            assert reader.poll() == []
+    finally:
+        login_api.setTickBus("")
+
+
+def test_tick_recorder(login_api: MyMdApi, tmp_path) -> None:
+    """测试行情录制"""
+    print("\n🧪 开始测试: 行情录制")
+    path = str(tmp_path / "ticks")
+
+    with pytest.raises(ValueError):
+        login_api.setTickRecorder(path, fsync="unknown")
+
+    login_api.setTickRecorder(path, flush_interval_ms=10, fsync="flush")
+    try:
+        login_api.subscribeMarketData(SYMBOL)
+        sleep(WAIT_TIME)
+    finally:
+        login_api.setTickRecorder("")             # 写完剩余数据和索引后返回
+
+    stats: dict = login_api.getTickRecorderStats()
+    assert not stats["active"]
+    assert stats["written"] == stats["recorded"]
+    assert not stats["errors"]
+    assert not stats["dropped"]
+
+    files: list[str] = segments(path)
+    assert len(files) == stats["segments"]
+
+    with TickFile(files[0]) as f:
+        assert f.complete                         # 录制结束后分段末尾有索引
+        assert len(f) == stats["written"]
+
+        if len(f):
+            ticks = f.read(SYMBOL)
+            assert ticks
+            assert SYMBOL.encode() in ticks[0].data
+            assert all(a.time <= b.time for a, b in pairwise(ticks))
+            print("✅ 行情录制测试通过!")
+        else:
+            print("⚠️  未收到行情数据推送")
+
+
+def test_poll_dispatch() -> None:
+    """测试poll推送模式"""
+    print("\n🧪 开始测试: poll推送模式")
+    api: MyMdApi = MyMdApi()
+    api.createFtdcMdApi("")
+    api.registerFront(MD_ADDRESS)
+    api.init(dispatch="poll")
+
+    try:
+        with pytest.raises(ValueError):
+            api.poll(0)
+
+        # 通过select等待文件描述符可读后，在当前线程中推送回调
+        fd: int = api.fileno()
+        readable, _, _ = select.select([fd], [], [], WAIT_TIME)
+        assert readable
+
+        api.poll(timeout_us=WAIT_TIME * 1_000_000)
+        assert api.connect_status
+
+        api.reqUserLogin(MD_SETTING, 1)
+        assert api.poll(timeout_us=WAIT_TIME * 1_000_000) >= 1
+        assert api.callback_result[2] == 1
+        print("✅ poll推送模式测试通过!")
+    finally:
+        api.exit()
+
+
+def test_async_api() -> None:
+    """测试asyncio行情接口"""
+    print("\n🧪 开始测试: asyncio行情接口")
+
+    async def run() -> None:
+        api: AsyncMdApi = AsyncMdApi()
+        try:
+            await asyncio.wait_for(api.connect(MD_ADDRESS), WAIT_TIME)
+
+            rows: list = await asyncio.wait_for(api.request("reqUserLogin", MD_SETTING), WAIT_TIME)
+            assert rows[0]["TradingDay"]
+
+            ticks = api.ticks()
+            api.subscribeMarketData(SYMBOL)
+            try:
+                tick: dict = await asyncio.wait_for(ticks.__anext__(), WAIT_TIME)
+                assert tick["InstrumentID"] == SYMBOL
+                print("✅ asyncio行情接口测试通过!")
+            except asyncio.TimeoutError:
+                print("⚠️  未收到行情数据推送")
+            finally:
+                await ticks.aclose()
+        finally:
+            api.exit()
+
+    asyncio.run(run())
+
+
+def test_lazy_import() -> None:
+    """测试只使用行情接口时不加载交易扩展模块和常量模块"""
+    print("\n🧪 开始测试: 延迟导入")
+    script = (
+        "import sys\n"
+        "from pyctp_api import MdApi\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    modules = output.stdout.split()
+
+    assert "pyctp_api.api.vnctpmd" in modules
+    assert "pyctp_api.api.vnctptd" not in modules
+    assert "pyctp_api.api.ctp_constant" not in modules
+
+    # asyncio行情接口同样不加载交易扩展模块
+    script = script.replace("from pyctp_api import MdApi", "from pyctp_api.aio import AsyncMdApi")
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    modules = output.stdout.split()
+
+    assert "pyctp_api.api.vnctpmd" in modules
+    assert "pyctp_api.api.vnctptd" not in modules
+    print("✅ 延迟导入测试通过!")
+
+
 
 if __name__ == "__main__":
     print("🚀 直接运行行情API测试...")
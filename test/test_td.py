@@ -1,11 +1,13 @@
 from time import sleep
-from threading import Condition
+from threading import Condition, Event
 from collections.abc import Generator
 
 import pytest
 
 from pyctp_api.api import (
     TdApi,
+    OrderTemplate,
+    QueryColumns,
     THOST_FTDC_OPT_LimitPrice,
     THOST_FTDC_TC_GFD,
     THOST_FTDC_VC_AV,
@@ -57,6 +59,9 @@ class MyTdApi(TdApi):
 
         self.order_data: dict[str, dict] = {}
         self.trade_data: dict[str, dict] = {}
+        self.instrument_rows: list[dict] | QueryColumns = []
+        self.instrument_events: list[str] = []      # 合约查询最后一条逐条回调和汇总回调的顺序
+        self.instrument_done: Event = Event()
 
     def onFrontConnected(self) -> None:
         """服务器连接成功回报"""
@@ -142,10 +147,18 @@ class MyTdApi(TdApi):
         """合约查询回报"""
         if last:
             print("✅ 合约查询完成")
+            self.instrument_events.append("last")
             self.callback_result = [data, error, reqid, last]
             with self.callback_done:
                 self.callback_done.notify()
 
+    def onRspQryInstrumentAll(self, rows: list[dict] | QueryColumns, error: dict, reqid: int) -> None:
+        """合约查询汇总回报"""
+        print(f"📦 合约查询汇总: {len(rows)}条")
+        self.instrument_rows = rows
+        self.instrument_events.append("all")
+        self.instrument_done.set()
+
     def onRspSettlementInfoConfirm(self, data: dict, error: dict, reqid: int, last: bool) -> None:
         """结算单确认回报"""
         print(f"📥 收到结算确认响应, ReqID: {reqid}")
@@ -333,6 +346,64 @@ def test_query_instrument(login_api: MyTdApi) -> None:
     print("✅ 合约查询测试通过!")
 
 
+def test_query_instrument_all(login_api: MyTdApi) -> None:
+    """测试合约查询结果汇总（在test_query_instrument之后运行）"""
+    print("\n🧪 开始测试: 查询结果汇总")
+    assert login_api.instrument_done.wait(WAIT_TIME)
+
+    # 汇总回调在最后一条逐条回调之后推送
+    assert login_api.instrument_events[-2:] == ["last", "all"]
+
+    rows: list[dict] = login_api.instrument_rows
+    assert rows
+    assert all(row["InstrumentID"] for row in rows)
+
+    stats: dict = login_api.getQueryStats()
+    assert stats["queries"] >= 1
+    assert stats["rows"] >= len(rows)
+    print("✅ 查询结果汇总测试通过!")
+
+
+def test_query_instrument_columns(login_api: MyTdApi) -> None:
+    """测试按列推送的合约查询结果"""
+    print("\n🧪 开始测试: 按列推送查询结果")
+    login_api.setQueryFormat("columns")
+    login_api.instrument_done.clear()
+
+    try:
+        while True:
+            login_api.reqid += 1
+            n: int = login_api.reqQryInstrument({}, login_api.reqid)
+            if not n:
+                break
+            sleep(1)
+
+        print("⏳ 等待合约查询响应...")
+        assert login_api.instrument_done.wait(WAIT_TIME * 6)
+
+        columns = login_api.instrument_rows
+        assert len(columns) > 0
+        assert "InstrumentID" in columns
+
+        # 数值列和字符串列都通过缓冲区协议读取
+        ticks: memoryview = memoryview(columns["PriceTick"])
+        assert ticks.format == "d"
+        assert ticks.readonly
+        assert len(ticks) == len(columns)
+
+        symbols: memoryview = memoryview(columns["InstrumentID"])
+        assert symbols.format.endswith("s")
+        assert symbols.nbytes == symbols.itemsize * len(columns)
+
+        with pytest.raises(KeyError):
+            columns["unknown"]
+        with pytest.raises(ValueError):
+            login_api.setQueryFormat("unknown")
+        print("✅ 按列推送查询结果测试通过!")
+    finally:
+        login_api.setQueryFormat("dict")
+
+
 def test_query_account(login_api: MyTdApi) -> None:
     """测试资金查询"""
     print(f"\n🧪 开始测试: 资金查询")
@@ -371,6 +442,33 @@ def test_query_position(login_api: MyTdApi) -> None:
     print("✅ 持仓查询测试通过!")
 
 
+def test_query_position_items(login_api: MyTdApi) -> None:
+    """测试按键值对填充请求的持仓查询"""
+    print("\n🧪 开始测试: 按键值对填充请求")
+    login_api.setRequestMode("items")
+
+    try:
+        login_api.reqid += 1
+        position_req = {
+            "BrokerID": TD_SETTING["BrokerID"],
+            "InvestorID": TD_SETTING["UserID"]
+        }
+        login_api.reqQryInvestorPosition(position_req, login_api.reqid)
+
+        print("⏳ 等待持仓查询响应...")
+        with login_api.callback_done:
+            login_api.callback_done.wait(WAIT_TIME)
+
+        error: dict = login_api.callback_result[1]
+        assert not error                              # 检查error是否为空字典
+
+        with pytest.raises(ValueError):
+            login_api.setRequestMode("unknown")
+        print("✅ 按键值对填充请求测试通过!")
+    finally:
+        login_api.setRequestMode("lookup")
+
+
 def test_insert_order(login_api: MyTdApi) -> None:
     """测试委托下单"""
     print(f"\n🧪 开始测试: 委托下单")
@@ -431,6 +529,46 @@ def test_insert_order(login_api: MyTdApi) -> None:
     print("✅ 下单功能测试通过!")
 
 
+def test_send_order_fast(login_api: MyTdApi) -> None:
+    """测试通过报单模板快速下单"""
+    print("\n🧪 开始测试: 报单模板下单")
+    print("⚠️  注意：此为真实下单测试，使用极低价格确保安全！")
+
+    template = OrderTemplate({
+        "InstrumentID": SYMBOL,
+        "ExchangeID": EXCHANGE,
+        "OrderPriceType": THOST_FTDC_OPT_LimitPrice,
+        "InvestorID": TD_SETTING["UserID"],
+        "UserID": TD_SETTING["UserID"],
+        "BrokerID": TD_SETTING["BrokerID"],
+        "CombHedgeFlag": THOST_FTDC_HF_Speculation,
+        "ContingentCondition": THOST_FTDC_CC_Immediately,
+        "ForceCloseReason": THOST_FTDC_FCC_NotForceClose,
+        "IsAutoSuspend": 0,
+        "TimeCondition": THOST_FTDC_TC_GFD,
+        "VolumeCondition": THOST_FTDC_VC_AV,
+        "MinVolume": 1
+    })
+
+    login_api.order_ref += 1
+    order_id: str = str(login_api.order_ref)
+    login_api.reqid += 1
+    error_code: int = login_api.sendOrderFast(
+        template, NOT_TRADED_PRICE, VOLUME, THOST_FTDC_D_Buy, THOST_FTDC_OF_Open, order_id, login_api.reqid
+    )
+    if error_code:
+        pytest.fail(f"报单模板下单失败，错误代码：{error_code}")
+
+    print("⏳ 等待委托回报...")
+    sleep(WAIT_TIME)
+
+    assert order_id in login_api.order_data, "未收到委托回报"
+    data: dict = login_api.order_data[order_id]
+    assert data["InstrumentID"] == SYMBOL
+    assert data["VolumeTotalOriginal"] == VOLUME
+    print("✅ 报单模板下单测试通过!")
+
+
 def test_cancel_order(login_api: MyTdApi) -> None:
     """测试委托撤单"""
     print(f"\n🧪 开始测试: 委托撤单")